@@ -1,12 +1,14 @@
-from models.employee_models import Employee  # pyright: ignore
-from models.store_models import Store  # pyright: ignore
-from models.brand_models import Brand  # pyright: ignore
-from models.database import db  # pyright: ignore
+from models_main import Brand, db  # pyright: ignore
+from models_main import Branch as Store  # pyright: ignore
+from models_main import User as Employee  # pyright: ignore
 from sqlalchemy import or_, func
 from difflib import SequenceMatcher
+from utils.address_index import AddressIndexService
+from utils.geocode_cache import GeocodeError, GeocodeService
 from functools import wraps
 import time
 import logging
+import os
 import re
 from flask_login import login_required
 from flask import Blueprint, request, jsonify, current_app
@@ -122,6 +124,18 @@ def normalize_address(address):
     return normalized
 
 
+# 엔티티 종류별 주소 모델 (직원 주소는 User, 매장 주소는 Branch에 있음)
+ADDRESS_ENTITIES = {'brand': Brand, 'store': Store, 'employee': Employee}
+
+# 주소 후보 색인 (pg_trgm 또는 인메모리 트라이그램), 커밋된 주소 변경은 모델 이벤트로 반영
+address_index = AddressIndexService(db, ADDRESS_ENTITIES, normalize_address, extract_address_keywords)
+address_index.register_events()
+
+# 정확한 유사도를 계산할 후보 수
+DUPLICATE_CANDIDATE_LIMIT = 50
+SUGGESTION_CANDIDATE_FACTOR = 5
+
+
 @address_validation_bp.route('/api/admin/check-address-duplicate', methods=['POST'])
 @login_required
 @performance_monitor
@@ -199,44 +213,28 @@ def is_valid_address_format(address):
 def check_duplicate_address(address, exclude_id=None, entity_type='brand', similarity_threshold=0.8):
     """
     주소 중복을 체크합니다.
+    트라이그램 색인에서 상위 후보만 뽑아 정확한 유사도를 계산합니다.
     """
-    similar_addresses = []
-
-    # 엔티티 타입에 따른 모델 선택
-    if entity_type == 'brand':
-        model = Brand
-        query = Brand.query
-    elif entity_type == 'store':
-        model = Store
-        query = Store.query
-    elif entity_type == 'employee':
-        model = Employee
-        query = Employee.query
-    else:
+    if entity_type not in ADDRESS_ENTITIES:
         return {
             'duplicate': False,
             'similar_addresses': [],
             'message': '지원하지 않는 엔티티 타입입니다.'
         }
 
-    # exclude_id가 있는 경우 해당 레코드 제외
-    if exclude_id:
-        query = query.filter(model.id != exclude_id)
-
-    # 주소가 있는 레코드만 조회 (성능 최적화)
-    all_addresses = query.with_entities(model.address).filter(model.address.isnot(None)).all()
-
-    if all_addresses is not None:
-        for addr_record in all_addresses:
-            existing_address = addr_record[0] if addr_record is not None else None
-            if existing_address:
-                similarity = calculate_address_similarity(address, existing_address)
-
-                if similarity >= similarity_threshold:
-                    similar_addresses.append({
-                        'address': existing_address,
-                        'similarity': round(similarity * 100, 1)
-                    })
+    similar_addresses = []
+    candidates = address_index.candidates(
+        address, [entity_type], limit=DUPLICATE_CANDIDATE_LIMIT, min_coverage=0.5,
+        exclude_id=exclude_id
+    )
+    for _, _, existing_address in candidates:
+        similarity = calculate_address_similarity(address, existing_address)
+
+        if similarity >= similarity_threshold:
+            similar_addresses.append({
+                'address': existing_address,
+                'similarity': round(similarity * 100, 1)
+            })
 
     # 유사도 순으로 정렬
     similar_addresses.sort(key=lambda x: x['similarity'], reverse=True)
@@ -326,10 +324,9 @@ def get_validation_details(address):
 @address_validation_bp.route('/api/admin/geocode-address', methods=['POST'])
 @login_required
 @performance_monitor
-@cache_result(ttl=3600)  # 1시간 캐시 (좌표는 자주 변경되지 않음)
 def geocode_address():
     """
-    주소를 위도/경도로 변환하는 API (카카오 Geocoding API 사용)
+    주소를 위도/경도로 변환하는 API (카카오 Geocoding API 사용, 결과는 geocode_service 캐시)
     """
     try:
         data = request.get_json()
@@ -344,16 +341,22 @@ def geocode_address():
         # 주소 정규화
         normalized_address = normalize_address(address)
 
-        # 카카오 Geocoding API 호출
-        coordinates = get_coordinates_from_kakao(normalized_address)
+        try:
+            coordinates = geocode_service.geocode(normalized_address)
+        except GeocodeError as e:
+            logger.warning(f"주소 좌표 변환 일시 오류: {address} ({e})")
+            return jsonify({
+                'success': False,
+                'error': '좌표 변환 서비스에 일시적으로 연결할 수 없습니다.'
+            }), 503
 
         if coordinates:
-            logger.info(f"주소 좌표 변환 성공: {address} -> ({coordinates['latitude'] if coordinates is not None else None}, {coordinates['longitude'] if coordinates is not None else None})")
+            logger.info(f"주소 좌표 변환 성공: {address} -> ({coordinates['latitude']}, {coordinates['longitude']})")
             return jsonify({
                 'success': True,
-                'latitude': coordinates['latitude'] if coordinates is not None else None,
-                'longitude': coordinates['longitude'] if coordinates is not None else None,
-                'formatted_address': coordinates.get('formatted_address', normalized_address) if coordinates else None,
+                'latitude': coordinates['latitude'],
+                'longitude': coordinates['longitude'],
+                'formatted_address': coordinates.get('formatted_address', normalized_address),
                 'normalized_address': normalized_address
             })
         else:
@@ -371,61 +374,122 @@ def geocode_address():
         }), 500
 
 
-def get_coordinates_from_kakao(address):
+@address_validation_bp.route('/api/admin/geocode-addresses', methods=['POST'])
+@login_required
+@performance_monitor
+def geocode_addresses():
     """
-    카카오 Geocoding API를 사용하여 주소를 좌표로 변환합니다.
+    여러 주소 일괄 좌표 변환 API (브랜드/매장 일괄 등록용)
+    중복 주소는 한 번만 조회하고, 캐시에 없는 주소만 속도 제한 하에 동시에 조회합니다.
+    """
+    try:
+        data = request.get_json()
+        addresses = data.get('addresses', []) if data else []
+
+        if not isinstance(addresses, list) or not addresses:
+            return jsonify({
+                'success': False,
+                'error': '주소 목록을 입력해주세요.'
+            }), 400
+
+        if len(addresses) > GEOCODE_BATCH_LIMIT:
+            return jsonify({
+                'success': False,
+                'error': f'한 번에 최대 {GEOCODE_BATCH_LIMIT}개까지 변환할 수 있습니다.'
+            }), 400
+
+        results = geocode_service.geocode_many(str(a).strip() for a in addresses if a)
+
+        summary = {'ok': 0, 'not_found': 0, 'error': 0, 'cached': 0}
+        for result in results.values():
+            summary[result['status']] += 1
+            summary['cached'] += 1 if result['cached'] else 0
+
+        logger.info(f"일괄 좌표 변환 완료: {len(results)}건 {summary}")
+
+        return jsonify({
+            'success': True,
+            'results': results,
+            'summary': summary
+        })
+
+    except Exception as e:
+        logger.error(f"일괄 좌표 변환 오류: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': f'일괄 좌표 변환 중 오류가 발생했습니다: {str(e)}'
+        }), 500
+
+
+def fetch_coordinates_from_kakao(address):
+    """
+    카카오 Geocoding API 호출
+    좌표 dict, 주소를 찾지 못하면 None을 반환하고, 일시적인 오류는 GeocodeError를 던집니다.
     """
     import requests
-    import os
 
     # 카카오 API 키 (환경변수에서 가져오거나 설정에서 가져옴)
     kakao_api_key = os.getenv('KAKAO_API_KEY', 'YOUR_KAKAO_API_KEY')
 
     if kakao_api_key == 'YOUR_KAKAO_API_KEY':
         # API 키가 설정되지 않은 경우
-        logger.warning("카카오 API 키가 설정되지 않았습니다.")
-        return None
+        raise GeocodeError("카카오 API 키가 설정되지 않았습니다.")
 
-    try:
-        url = 'https://dapi.kakao.com/v2/local/search/address.json'
-        headers = {
-            'Authorization': f'KakaoAK {kakao_api_key}'
-        }
-        params = {
-            'query': address
-        }
+    url = os.getenv('KAKAO_LOCAL_API_URL', 'https://dapi.kakao.com/v2/local/search/address.json')
+    headers = {
+        'Authorization': f'KakaoAK {kakao_api_key}'
+    }
+    params = {
+        'query': address
+    }
 
+    try:
         response = requests.get(url, headers=headers, params=params, timeout=5)
+    except requests.exceptions.Timeout:
+        raise GeocodeError("카카오 API 요청 시간 초과")
+    except requests.exceptions.RequestException as e:
+        raise GeocodeError(f"카카오 API 요청 오류: {e}")
 
-        if response.status_code == 200:
-            data = response.json()
+    if response.status_code != 200:
+        raise GeocodeError(f"카카오 API 오류 (상태 코드: {response.status_code}): {response.text}")
 
-            if data.get('documents') and len(data['documents']) > 0:
-                document = data['documents'][0]
+    data = response.json()
+    if not data.get('documents'):
+        logger.warning(f"카카오 API에서 주소를 찾을 수 없음: {address}")
+        return None
 
-                return {
-                    'latitude': float(document['y']) if document and 'y' in document else None,
-                    'longitude': float(document['x']) if document and 'x' in document else None,
-                    'formatted_address': document.get('address_name', address) if document else None
-                }
-            else:
-                logger.warning(f"카카오 API에서 주소를 찾을 수 없음: {address}")
-        else:
-            logger.error(f"카카오 API 오류 (상태 코드: {response.status_code}): {response.text}")
+    document = data['documents'][0]
+    return {
+        'latitude': float(document['y']) if 'y' in document else None,
+        'longitude': float(document['x']) if 'x' in document else None,
+        'formatted_address': document.get('address_name', address)
+    }
 
-        return None
 
-    except requests.exceptions.Timeout:
-        logger.error("카카오 API 요청 시간 초과")
-        return None
-    except requests.exceptions.RequestException as e:
-        logger.error(f"카카오 API 요청 오류: {e}")
+def get_coordinates_from_kakao(address):
+    """
+    카카오 Geocoding API를 사용하여 주소를 좌표로 변환합니다. (오류 시 None)
+    """
+    try:
+        return fetch_coordinates_from_kakao(address)
+    except GeocodeError as e:
+        logger.error(str(e))
         return None
     except Exception as e:
         logger.error(f"카카오 Geocoding API 오류: {e}")
         return None
 
 
+# 지오코딩 캐시 서비스 (좌표 30일, 주소 없음 1일 캐시 / 일괄 조회는 초당 KAKAO_GEOCODE_RPS건)
+GEOCODE_BATCH_LIMIT = 500
+geocode_service = GeocodeService(
+    fetch_coordinates_from_kakao,
+    normalize_address,
+    max_workers=int(os.getenv('KAKAO_GEOCODE_WORKERS', '4')),
+    rate_per_second=float(os.getenv('KAKAO_GEOCODE_RPS', '10')),
+)
+
+
 @address_validation_bp.route('/api/admin/address-suggestions', methods=['POST'])
 @login_required
 @performance_monitor
@@ -472,33 +536,20 @@ def get_similar_addresses(query, limit=10, entity_type='all'):
     """
     쿼리와 유사한 기존 주소들을 찾습니다.
     """
-    suggestions = []
-
-    # 모든 엔티티에서 주소 수집
-    all_addresses = set()
+    kinds = list(ADDRESS_ENTITIES) if entity_type == 'all' else [entity_type]
+    candidates = address_index.candidates(
+        query, kinds, limit=limit * SUGGESTION_CANDIDATE_FACTOR, min_coverage=0.3
+    )
 
-    if entity_type in ['all', 'brand']:
-        brand_addresses = Brand.query.with_entities(Brand.address).filter(Brand.address.isnot(None)).all()
-        all_addresses.update([addr[0] for addr in brand_addresses if addr and addr[0]])
-
-    if entity_type in ['all', 'store']:
-        store_addresses = Store.query.with_entities(Store.address).filter(Store.address.isnot(None)).all()
-        all_addresses.update([addr[0] for addr in store_addresses if addr and addr[0]])
-
-    if entity_type in ['all', 'employee']:
-        employee_addresses = Employee.query.with_entities(Employee.address).filter(Employee.address.isnot(None)).all()
-        all_addresses.update([addr[0] for addr in employee_addresses if addr and addr[0]])
-
-    # 유사도 계산 및 정렬
+    # 유사도 계산 및 정렬 (여러 엔티티에 같은 주소가 있으면 한 번만)
     address_scores = []
-    if all_addresses is not None:
-        for address in all_addresses:
-            similarity = calculate_address_similarity(query,  address)
-            if similarity > 0.3:  # 30% 이상 유사한 주소만 제안
-                address_scores.append({
-                    'address': address,
-                    'similarity': similarity
-                })
+    for address in {candidate[2] for candidate in candidates}:
+        similarity = calculate_address_similarity(query,  address)
+        if similarity > 0.3:  # 30% 이상 유사한 주소만 제안
+            address_scores.append({
+                'address': address,
+                'similarity': similarity
+            })
 
     # 유사도 순으로 정렬
     address_scores.sort(key=lambda x: x['similarity'], reverse=True)
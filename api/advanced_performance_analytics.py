@@ -4,12 +4,13 @@ from collections import deque
 from typing import Dict, List, Any, Optional
 import psutil
 import json
-import time
-import threading
 import logging
 from datetime import datetime, timedelta
 from flask import Blueprint, jsonify, request, current_app
 from typing import Optional
+
+from core.backend.job_scheduler import job_scheduler
+from core.backend.service_registry import service_registry
 args = None  # pyright: ignore
 form = None  # pyright: ignore
 #!/usr/bin/env python3
@@ -21,6 +22,9 @@ form = None  # pyright: ignore
 
 logger = logging.getLogger(__name__)
 
+# 실시간 모니터링 작업 이름
+PERFORMANCE_MONITOR_JOB = "advanced_performance.monitor"
+
 # 블루프린트 생성
 advanced_performance_bp = Blueprint('advanced_performance', __name__, url_prefix='/api/advanced-performance')
 
@@ -40,7 +44,6 @@ class AdvancedPerformanceAnalytics:
             'active_connections': 1000
         }
         self.monitoring_active = False
-        self.monitoring_thread = None
         self.db_path = 'performance_analytics.db'
         self._init_database()
 
@@ -127,8 +130,8 @@ class AdvancedPerformanceAnalytics:
             return {"status": "already_running"}
 
         self.monitoring_active = True
-        self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-        self.monitoring_thread.start()
+        # 호스트 메트릭을 한 DB에 저장하므로 여러 워커 중 한 프로세스에서만 실행
+        job_scheduler.add_job(PERFORMANCE_MONITOR_JOB, self._monitoring_tick, interval=30, singleton=True)
 
         logger.info("고도화된 성능 분석 모니터링 시작")
         return {"status": "started"}
@@ -136,37 +139,28 @@ class AdvancedPerformanceAnalytics:
     def stop_monitoring(self):
         """실시간 모니터링 중지"""
         self.monitoring_active = False
-        if self.monitoring_thread:
-            self.monitoring_thread.join(timeout=5)
+        job_scheduler.remove_job(PERFORMANCE_MONITOR_JOB)
 
         logger.info("고도화된 성능 분석 모니터링 중지")
         return {"status": "stopped"}
 
-    def _monitoring_loop(self):
-        """실시간 모니터링 루프"""
-        while self.monitoring_active:
-            try:
-                # 성능 메트릭 수집
-                metrics = self._collect_performance_metrics()
-                self.metrics_history.append(metrics)
-
-                # 데이터베이스에 저장
-                self._save_metrics_to_db(metrics)
-
-                # 알림 체크
-                self._check_alerts(metrics)
+    def _monitoring_tick(self):
+        """성능 메트릭 수집/분석 (작업 스케줄러가 30초마다 실행)"""
+        # 성능 메트릭 수집
+        metrics = self._collect_performance_metrics()
+        self.metrics_history.append(metrics)
 
-                # 성능 예측
-                self._generate_predictions()
+        # 데이터베이스에 저장
+        self._save_metrics_to_db(metrics)
 
-                # 자동 튜닝 체크
-                self._check_auto_tuning(metrics)
+        # 알림 체크
+        self._check_alerts(metrics)
 
-                time.sleep(30)  # 30초마다 업데이트
+        # 성능 예측
+        self._generate_predictions()
 
-            except Exception as e:
-                logger.error(f"모니터링 루프 오류: {e}")
-                time.sleep(60)
+        # 자동 튜닝 체크
+        self._check_auto_tuning(metrics)
 
     def _collect_performance_metrics(self) -> Dict[str, Any] if Dict is not None else None:
         """성능 메트릭 수집"""
@@ -703,8 +697,8 @@ class AdvancedPerformanceAnalytics:
             return {"success": False, "error": str(e)}
 
 
-# 전역 인스턴스 생성
-advanced_performance_analytics = AdvancedPerformanceAnalytics()
+# 전역 인스턴스 생성 (서비스 레지스트리가 첫 사용 시 생성)
+advanced_performance_analytics = service_registry.register("performance.advanced_analytics", AdvancedPerformanceAnalytics)
 
 # API 엔드포인트들
 
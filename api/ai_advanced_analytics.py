@@ -1,5 +1,4 @@
 import os
-import joblib
 from typing import Dict, List, Any, Optional
 import time
 import threading
@@ -7,15 +6,17 @@ import asyncio
 import logging
 from sklearn.metrics import mean_absolute_error, r2_score  # pyright: ignore
 from sklearn.linear_model import LinearRegression  # pyright: ignore
-from sklearn.preprocessing import StandardScaler  # pyright: ignore
-from sklearn.ensemble import IsolationForest, RandomForestRegressor  # pyright: ignore
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import date, datetime, timedelta
 from models_main import *
 from flask_login import login_required, current_user
 from flask import Blueprint, jsonify, request, current_app
 from typing import Optional
+from utils.model_registry import model_registry
+from utils.online_anomaly import OnlineAnomalyDetector, OnlineAnomalyStateStore
+from core.backend.job_scheduler import job_scheduler
 query = None  # pyright: ignore
 form = None  # pyright: ignore
 """
@@ -33,12 +34,52 @@ ai_advanced_analytics = Blueprint('ai_advanced_analytics', __name__, url_prefix=
 logger = logging.getLogger(__name__)
 
 
+# 재훈련 파이프라인(AIAutoRetrainService)이 게시하는 모델 이름
+SALES_ANOMALY_MODEL = 'sales_anomaly'
+SALES_TREND_MODEL = 'sales_trend'
+
+SALES_TREND_FEATURES = ['day_of_week', 'month', 'day_of_month', 'is_weekend',
+                        'sales_ma7', 'sales_ma14', 'sales_lag1', 'sales_lag7']
+
+
+def sales_anomaly_features(amounts) -> np.ndarray:
+    """일별 매출 -> 이상 탐지 특성 (매장 규모와 무관하도록 기간 중앙값 대비 비율)"""
+    amounts = np.asarray(amounts, dtype=float).reshape(-1)
+    median = float(np.median(amounts)) if len(amounts) else 0.0
+    return (amounts / median if median > 0 else np.zeros_like(amounts)).reshape(-1, 1)
+
+
+def build_sales_trend_frame(sales_data) -> pd.DataFrame:
+    """일별 매출 [{'date', 'amount'}] -> 트렌드 예측 특성 (학습/예측 공용)"""
+    df = pd.DataFrame(sales_data)
+    df['date'] = pd.to_datetime(df['date'])
+    df = df.sort_values('date')
+
+    # 시간 특성 추가
+    df['day_of_week'] = df['date'].dt.dayofweek
+    df['month'] = df['date'].dt.month
+    df['day_of_month'] = df['date'].dt.day
+    df['is_weekend'] = df['day_of_week'].isin([5, 6]).astype(int)
+
+    # 이동평균 특성
+    df['sales_ma7'] = df['amount'].rolling(window=7).mean()
+    df['sales_ma14'] = df['amount'].rolling(window=14).mean()
+
+    # 지연 특성
+    df['sales_lag1'] = df['amount'].shift(1)
+    df['sales_lag7'] = df['amount'].shift(7)
+
+    # NaN 제거
+    return df.dropna()
+
+
 class AdvancedAnomalyDetector:
-    """고도화된 이상징후 탐지기"""
+    """고도화된 이상징후 탐지기 (모델 학습은 재훈련 파이프라인에서만, 여기서는 게시된 모델로 점수만 계산)"""
 
-    def __init__(self):
-        self.models = {}
-        self.scalers = {}
+    def __init__(self, registry=None, state_store: Optional[OnlineAnomalyStateStore] = None):
+        self.registry = registry or model_registry
+        # 있으면 온라인 탐지기 상태를 워커 사이에 공유 (없으면 프로세스 메모리에만 유지)
+        self.state_store = state_store
         self.thresholds = {
             'sales_drop': 0.3,  # 매출 30% 이상 감소
             'cost_increase': 0.25,  # 비용 25% 이상 증가
@@ -46,100 +87,124 @@ class AdvancedAnomalyDetector:
             'staff_shortage': 0.2,  # 인력 20% 부족
             'review_negative': 0.4  # 부정 리뷰 40% 이상
         }
-        self.model_path = 'data/ai_analytics/models/'
-        self._ensure_model_directory()
-        self._load_or_create_models()
-
-    def _ensure_model_directory(self):
-        """모델 저장 디렉토리 생성"""
-        os.makedirs(self.model_path, exist_ok=True)
-        os.makedirs(f'{self.model_path}scalers/', exist_ok=True)
-
-    def _load_or_create_models(self):
-        """기존 모델 로드 또는 새로 생성"""
-        try:
-            # Isolation Forest 모델 로드
-            if os.path.exists(f'{self.model_path}isolation_forest.joblib'):
-                self.models['isolation_forest'] if models is not None else None = joblib.load(f'{self.model_path}isolation_forest.joblib')
-            else:
-                self.models['isolation_forest'] if models is not None else None = IsolationForest(contamination="auto", random_state=42)  # noqa
-
-            # Random Forest 예측 모델 로드
-            if os.path.exists(f'{self.model_path}sales_predictor.joblib'):
-                self.models['sales_predictor'] if models is not None else None = joblib.load(f'{self.model_path}sales_predictor.joblib')
-            else:
-                self.models['sales_predictor'] if models is not None else None = RandomForestRegressor(n_estimators=100, random_state=42)
+        # 브랜드/지점별 일일 값을 이력 없이 바로 채점하는 온라인 탐지기
+        self.online = {
+            'sales': OnlineAnomalyDetector(direction='drop', change_threshold=self.thresholds['sales_drop'],
+                                           min_points=14),
+            'cost': OnlineAnomalyDetector(direction='rise', change_threshold=self.thresholds['cost_increase'],
+                                          min_points=7),
+        }
 
-            # 스케일러 로드
-            if os.path.exists(f'{self.model_path}scalers/sales_scaler.joblib'):
-                self.scalers['sales'] if scalers is not None else None = joblib.load(f'{self.model_path}scalers/sales_scaler.joblib')
+    def _sales_anomaly_scores(self, amounts) -> np.ndarray:
+        """
+        이상 점수 (낮을수록 이상)
+        게시된 Isolation Forest가 있으면 그 점수를, 없으면 중앙값/MAD 기반 robust z-score를 사용
+        """
+        loaded = self.registry.get(SALES_ANOMALY_MODEL)
+        if loaded is not None:
+            return loaded.model.score_samples(sales_anomaly_features(amounts))
+        amounts = np.asarray(amounts, dtype=float)
+        median = np.median(amounts)
+        mad = np.median(np.abs(amounts - median)) * 1.4826
+        return -np.abs(amounts - median) / (mad + 1e-9)
+
+    def observe_sales(self, points: List[Dict], day: Optional[date] = None) -> List[Dict]:
+        """일일 매출 [{'brand_id', 'branch_id', 'amount'}]을 지점/브랜드 전체에 대해 한 번에 채점"""
+        return self._observe('sales', points, day)
+
+    def observe_costs(self, points: List[Dict], day: Optional[date] = None) -> List[Dict]:
+        """일일 인건비 [{'brand_id', 'branch_id', 'amount'}]을 지점/브랜드 전체에 대해 한 번에 채점"""
+        return self._observe('cost', points, day)
+
+    def _observe(self, metric: str, points: List[Dict], day: Optional[date] = None) -> List[Dict]:
+        """
+        지점 값과 브랜드 합계를 온라인 탐지기에 한 번에 넣고, 이상은 기존 알림 경로로 보냄
+        day를 넘기면 그날 값이 이미 반영된 시계열은 다시 반영하지 않고 알림도 보내지 않음
+        """
+        keys, values, brands = [], [], []
+        brand_totals: Dict[Any, float] = defaultdict(float)
+        for point in points:
+            amount = float(point.get('amount') or 0)
+            brand_id = point.get('brand_id')
+            if point.get('branch_id') is not None:
+                keys.append(('branch', point['branch_id']))
+                values.append(amount)
+                brands.append(brand_id)
+            if brand_id is not None:
+                brand_totals[brand_id] += amount
+        for brand_id, total in brand_totals.items():
+            keys.append(('brand', brand_id))
+            values.append(total)
+            brands.append(brand_id)
+
+        ordinal = day.toordinal() if day is not None else None
+        if self.state_store is not None:
+            result = self.state_store.update(metric, self.online[metric], keys, values, day=ordinal)
+        else:
+            result = self.online[metric].update(keys, values, day=ordinal)
+        anomalies = []
+        for i in np.nonzero(result['anomaly'])[0]:
+            scope, series_id = keys[i]
+            current, average = values[i], float(result['average'][i])
+            z_score = float(result['z_score'][i])
+            if metric == 'sales':
+                self._create_sales_alert(brands[i], current, average, z_score)
             else:
-                self.scalers['sales'] if scalers is not None else None = StandardScaler()
-
-        except Exception as e:
-            logger.error(f"모델 로드 오류: {e}")
-            # 기본 모델 생성
-            self.models['isolation_forest'] if models is not None else None = IsolationForest(contamination="auto", random_state=42)  # noqa
-            self.models['sales_predictor'] if models is not None else None = RandomForestRegressor(n_estimators=100, random_state=42)
-            self.scalers['sales'] if scalers is not None else None = StandardScaler()
-
-    def save_models(self):
-        """모델 저장"""
-        try:
-            joblib.dump(self.models['isolation_forest'] if models is not None else None, f'{self.model_path}isolation_forest.joblib')
-            joblib.dump(self.models['sales_predictor'] if models is not None else None, f'{self.model_path}sales_predictor.joblib')
-            joblib.dump(self.scalers['sales'] if scalers is not None else None, f'{self.model_path}scalers/sales_scaler.joblib')
-            logger.info("AI 모델 저장 완료")
-        except Exception as e:
-            logger.error(f"모델 저장 오류: {e}")
-
-    def detect_sales_anomaly(self,  sales_data: List[Dict] if List is not None else None, brand_id=None) -> Dict:
+                self._create_cost_alert(brands[i], current, average)
+            anomalies.append({
+                'type': 'sales_drop' if metric == 'sales' else 'cost_increase',
+                'scope': scope,
+                'id': series_id,
+                'brand_id': brands[i],
+                'current': current,
+                'average': average,
+                'change_rate': float(result['change'][i]),
+                'anomaly_score': z_score,
+            })
+        return anomalies
+
+    def detect_sales_anomaly(self,  sales_data: List[Dict], brand_id=None) -> Dict:
         """매출 이상징후 탐지 (고도화)"""
         try:
             if len(sales_data) < 14:  # 최소 2주 데이터 필요
                 return {'anomaly': False, 'confidence': 0, 'reason': '데이터 부족'}
 
             # 데이터 전처리
-            amounts = np.array([d['amount'] if d is not None else None for d in sales_data]).reshape(-1, 1)
-
-            # Isolation Forest로 이상징후 탐지
-            if len(amounts) > 10:
-                # 모델 학습 (온라인 학습)
-                self.models['isolation_forest'] if models is not None else None.fit(amounts)
-                predictions = self.models['isolation_forest'] if models is not None else None.predict(amounts)
-                anomaly_scores = self.models['isolation_forest'] if models is not None else None.score_samples(amounts)
-
-                # 최근 데이터의 이상징후 점수
-                recent_score = anomaly_scores[-1] if anomaly_scores is not None else None
-                recent_amount = amounts[-1] if amounts is not None else None[0]
-
-                # 통계적 임계값 계산
-                mean_score = np.mean(anomaly_scores)
-                std_score = np.std(anomaly_scores)
-                threshold = mean_score - 2 * std_score  # 2 표준편차
-
-                if recent_score < threshold:
-                    # 급감 탐지 (기존 로직과 결합)
-                    recent_sales = [d['amount'] if d is not None else None for d in sales_data[-7:] if sales_data is not None else None]
-                    avg_sales = np.mean(recent_sales[:-1] if recent_sales is not None else None)
-                    current_sales = recent_sales[-1] if recent_sales is not None else None
-
-                    if avg_sales > 0 and (current_sales / avg_sales) < (1 - self.thresholds['sales_drop'] if thresholds is not None else None):
-                        # 실시간 알림 생성
-                        self._create_sales_alert(brand_id,  float(current_sales), float(avg_sales), recent_score)
-
-                        return {
-                            'anomaly': True,
-                            'type': 'sales_drop',
-                            'confidence': 0.95,
-                            'severity': 'high',
-                            'current': current_sales,
-                            'average': avg_sales,
-                            'drop_rate': (avg_sales - current_sales) / avg_sales,
-                            'anomaly_score': recent_score,
-                            'message': f'AI 탐지: 매출이 평균 대비 {((avg_sales - current_sales) / avg_sales * 100):.1f}% 감소했습니다.',
-                            'brand_id': brand_id
-                        }
+            amounts = np.array([d['amount'] for d in sales_data], dtype=float)
+
+            # 재훈련 파이프라인이 학습한 모델로 점수만 계산 (요청 중 학습 없음)
+            anomaly_scores = self._sales_anomaly_scores(amounts)
+
+            # 최근 데이터의 이상징후 점수
+            recent_score = float(anomaly_scores[-1])
+
+            # 통계적 임계값 계산
+            mean_score = np.mean(anomaly_scores)
+            std_score = np.std(anomaly_scores)
+            threshold = mean_score - 2 * std_score  # 2 표준편차
+
+            if recent_score < threshold:
+                # 급감 탐지 (기존 로직과 결합)
+                recent_sales = [d['amount'] for d in sales_data[-7:]]
+                avg_sales = np.mean(recent_sales[:-1])
+                current_sales = recent_sales[-1]
+
+                if avg_sales > 0 and (current_sales / avg_sales) < (1 - self.thresholds['sales_drop']):
+                    # 실시간 알림 생성
+                    self._create_sales_alert(brand_id,  float(current_sales), float(avg_sales), recent_score)
+
+                    return {
+                        'anomaly': True,
+                        'type': 'sales_drop',
+                        'confidence': 0.95,
+                        'severity': 'high',
+                        'current': current_sales,
+                        'average': avg_sales,
+                        'drop_rate': (avg_sales - current_sales) / avg_sales,
+                        'anomaly_score': recent_score,
+                        'message': f'AI 탐지: 매출이 평균 대비 {((avg_sales - current_sales) / avg_sales * 100):.1f}% 감소했습니다.',
+                        'brand_id': brand_id
+                    }
 
             return {'anomaly': False, 'confidence': 0.8}
 
@@ -147,7 +212,7 @@ class AdvancedAnomalyDetector:
             logger.error(f"매출 이상징후 탐지 오류: {e}")
             return {'anomaly': False, 'confidence': 0, 'error': str(e)}
 
-    def _create_sales_alert(self,  brand_id: Optional[int] if Optional is not None else None,  current_sales: float,  avg_sales: float,  anomaly_score: float):
+    def _create_sales_alert(self,  brand_id: Optional[int],  current_sales: float,  avg_sales: float,  anomaly_score: float):
         """매출 알림 생성"""
         try:
             # 알림 메시지 생성
@@ -157,7 +222,7 @@ class AdvancedAnomalyDetector:
             # 브랜드별 관리자에게 알림 발송
             if brand_id:
                 brand_admins = User.query.filter_by(brand_id=brand_id, role='brand_admin').all()
-                for admin in brand_admins if brand_admins is not None:
+                for admin in brand_admins:
                     notification = Notification()
                     notification.user_id = admin.id
                     notification.title = "매출 급감 알림"
@@ -169,7 +234,7 @@ class AdvancedAnomalyDetector:
             else:
                 # 전체 관리자에게 알림
                 admins = User.query.filter_by(role='admin').all()
-                for admin in admins if admins is not None:
+                for admin in admins:
                     notification = Notification()
                     notification.user_id = admin.id
                     notification.title = "매출 급감 알림"
@@ -186,19 +251,19 @@ class AdvancedAnomalyDetector:
             logger.error(f"매출 알림 생성 오류: {e}")
             db.session.rollback()
 
-    def detect_cost_anomaly(self,  cost_data: List[Dict] if List is not None else None, brand_id=None) -> Dict:
+    def detect_cost_anomaly(self,  cost_data: List[Dict], brand_id=None) -> Dict:
         """인건비 이상징후 탐지"""
         try:
             if len(cost_data) < 7:
                 return {'anomaly': False, 'confidence': 0, 'reason': '데이터 부족'}
 
             # 최근 7일 인건비 추이
-            recent_costs = [d['amount'] if d is not None else None for d in cost_data[-7:] if cost_data is not None else None]
-            avg_cost = np.mean(recent_costs[:-1] if recent_costs is not None else None)
-            current_cost = recent_costs[-1] if recent_costs is not None else None
+            recent_costs = [d['amount'] for d in cost_data[-7:]]
+            avg_cost = np.mean(recent_costs[:-1])
+            current_cost = recent_costs[-1]
 
             # 급증 탐지
-            if avg_cost > 0 and (current_cost / avg_cost) > (1 + self.thresholds['cost_increase'] if thresholds is not None else None):
+            if avg_cost > 0 and (current_cost / avg_cost) > (1 + self.thresholds['cost_increase']):
                 # 실시간 알림 생성
                 self._create_cost_alert(brand_id,  float(current_cost), float(avg_cost))
 
@@ -220,7 +285,7 @@ class AdvancedAnomalyDetector:
             logger.error(f"인건비 이상징후 탐지 오류: {e}")
             return {'anomaly': False, 'confidence': 0, 'error': str(e)}
 
-    def _create_cost_alert(self,  brand_id: Optional[int] if Optional is not None else None,  current_cost: float,  avg_cost: float):
+    def _create_cost_alert(self,  brand_id: Optional[int],  current_cost: float,  avg_cost: float):
         """인건비 알림 생성"""
         try:
             increase_rate = (current_cost - avg_cost) / avg_cost * 100
@@ -228,7 +293,7 @@ class AdvancedAnomalyDetector:
 
             if brand_id:
                 brand_admins = User.query.filter_by(brand_id=brand_id, role='brand_admin').all()
-                for admin in brand_admins if brand_admins is not None:
+                for admin in brand_admins:
                     notification = Notification()
                     notification.user_id = admin.id
                     notification.title = "인건비 급증 알림"
@@ -239,7 +304,7 @@ class AdvancedAnomalyDetector:
                     db.session.add(notification)
             else:
                 admins = User.query.filter_by(role='admin').all()
-                for admin in admins if admins is not None:
+                for admin in admins:
                     notification = Notification()
                     notification.user_id = admin.id
                     notification.title = "인건비 급증 알림"
@@ -256,33 +321,47 @@ class AdvancedAnomalyDetector:
             logger.error(f"인건비 알림 생성 오류: {e}")
             db.session.rollback()
 
-    def detect_inventory_anomaly(self,  inventory_data: List[Dict] if List is not None else None, brand_id=None) -> Dict:
+    def _inventory_anomalies(self, inventory_data: List[Dict]) -> List[List[Dict]]:
+        """품목별 재고 이상 목록 (부족/소진 예상 판정은 전체 품목을 배열로 한 번에 계산)"""
+        if not inventory_data:
+            return []
+        current = np.array([item['current_stock'] or 0 for item in inventory_data], dtype=float)
+        minimum = np.array([item['min_stock'] or 0 for item in inventory_data], dtype=float)
+        consumption = np.array([item.get('daily_consumption') or 0 for item in inventory_data], dtype=float)
+
+        low_stock = current <= minimum
+        days_until_stockout = np.divide(current, consumption, out=np.full(len(current), np.inf),
+                                        where=consumption > 0)
+        stockout_soon = days_until_stockout < 3
+
+        result: List[List[Dict]] = [[] for _ in inventory_data]
+        for i in np.nonzero(low_stock | stockout_soon)[0]:
+            item = inventory_data[i]
+            if low_stock[i]:
+                result[i].append({
+                    'item_name': item['name'],
+                    'type': 'low_stock',
+                    'severity': 'high',
+                    'current': item['current_stock'],
+                    'min_required': item['min_stock'],
+                    'message': f"{item['name']} 재고 부족 (현재: {item['current_stock']}, 최소: {item['min_stock']})"
+                })
+            # 재고 소진 예측
+            if stockout_soon[i]:
+                days = float(days_until_stockout[i])
+                result[i].append({
+                    'item_name': item['name'],
+                    'type': 'stockout_prediction',
+                    'severity': 'medium',
+                    'days_until_stockout': days,
+                    'message': f"{item['name']} {days:.1f}일 후 재고 소진 예상"
+                })
+        return result
+
+    def detect_inventory_anomaly(self,  inventory_data: List[Dict], brand_id=None) -> Dict:
         """재고 이상징후 탐지"""
         try:
-            anomalies = []
-
-            for item in inventory_data if inventory_data is not None:
-                if item['current_stock'] if item is not None else None <= item['min_stock'] if item is not None else None:
-                    anomalies.append({
-                        'item_name': item['name'] if item is not None else None,
-                        'type': 'low_stock',
-                        'severity': 'high',
-                        'current': item['current_stock'] if item is not None else None,
-                        'min_required': item['min_stock'] if item is not None else None,
-                        'message': f"{item['name'] if item is not None else None} 재고 부족 (현재: {item['current_stock'] if item is not None else None}, 최소: {item['min_stock'] if item is not None else None})"
-                    })
-
-                # 재고 소진 예측
-                if item.get('daily_consumption', 0) > 0:
-                    days_until_stockout = item['current_stock'] if item is not None else None / item['daily_consumption'] if item is not None else None
-                    if days_until_stockout < 3:
-                        anomalies.append({
-                            'item_name': item['name'] if item is not None else None,
-                            'type': 'stockout_prediction',
-                            'severity': 'medium',
-                            'days_until_stockout': days_until_stockout,
-                            'message': f"{item['name'] if item is not None else None} {days_until_stockout:.1f}일 후 재고 소진 예상"
-                        })
+            anomalies = [a for item_anomalies in self._inventory_anomalies(inventory_data) for a in item_anomalies]
 
             if anomalies:
                 # 실시간 알림 생성
@@ -299,14 +378,24 @@ class AdvancedAnomalyDetector:
             logger.error(f"재고 이상징후 탐지 오류: {e}")
             return {'anomaly': False, 'confidence': 0, 'error': str(e)}
 
-    def _create_inventory_alert(self, brand_id: Optional[int] if Optional is not None else None, anomalies: List[Dict] if List is not None else None):
+    def detect_inventory_batch(self, inventory_data: List[Dict]) -> Dict[Any, List[Dict]]:
+        """여러 브랜드 품목(brand_id 포함)을 한 번에 판정하고 브랜드별로 알림"""
+        by_brand: Dict[Any, List[Dict]] = defaultdict(list)
+        for item, item_anomalies in zip(inventory_data, self._inventory_anomalies(inventory_data)):
+            if item_anomalies:
+                by_brand[item.get('brand_id')].extend(item_anomalies)
+        for brand_id, anomalies in by_brand.items():
+            self._create_inventory_alert(brand_id, anomalies)
+        return dict(by_brand)
+
+    def _create_inventory_alert(self, brand_id: Optional[int], anomalies: List[Dict]):
         """재고 알림 생성"""
         try:
             message = f"재고 부족 알림: {len(anomalies)}개 품목의 재고가 부족합니다."
 
             if brand_id:
                 brand_admins = User.query.filter_by(brand_id=brand_id, role='brand_admin').all()
-                for admin in brand_admins if brand_admins is not None:
+                for admin in brand_admins:
                     notification = Notification()
                     notification.user_id = admin.id
                     notification.title = "재고 부족 알림"
@@ -317,7 +406,7 @@ class AdvancedAnomalyDetector:
                     db.session.add(notification)
             else:
                 admins = User.query.filter_by(role='admin').all()
-                for admin in admins if admins is not None:
+                for admin in admins:
                     notification = Notification()
                     notification.user_id = admin.id
                     notification.title = "재고 부족 알림"
@@ -335,11 +424,17 @@ class AdvancedAnomalyDetector:
             db.session.rollback()
 
 
+# 인건비 계산용 기본 시급 (월 기본급 10000 / 160시간, 기존 분석과 같은 가정)
+DEFAULT_HOURLY_WAGE = 10000 / 160
+
+
 class RealTimeAnalyzer:
     """실시간 분석기"""
 
-    def __init__(self):
-        self.anomaly_detector = AdvancedAnomalyDetector()
+    DAILY_SCAN_JOB = 'ai_advanced_analytics.daily_anomaly_scan'
+
+    def __init__(self, state_store: Optional[OnlineAnomalyStateStore] = None):
+        self.anomaly_detector = AdvancedAnomalyDetector(state_store=state_store)
         self.analysis_cache = {}
         self.last_analysis = {}
 
@@ -366,20 +461,20 @@ class RealTimeAnalyzer:
 
             # 일별 매출 집계
             daily_sales = {}
-            for order in orders if orders is not None:
+            for order in orders:
                 date_key = order.created_at.date().isoformat()
                 if date_key not in daily_sales:
-                    daily_sales[date_key] if daily_sales is not None else None = 0
-                daily_sales[date_key] if daily_sales is not None else None += float(order.total_amount or 0)
+                    daily_sales[date_key] = 0
+                daily_sales[date_key] += float(order.total_amount or 0)
 
             # 분석 결과
-            sales_list = list(daily_sales.value if daily_sales is not None else Nones())
+            sales_list = list(daily_sales.values())
             total_sales = sum(sales_list)
             avg_daily_sales = np.mean(sales_list) if sales_list else 0
             sales_trend = self._calculate_trend(sales_list)
 
             # 이상징후 탐지
-            sales_data = [{'amount': amount, 'date': date} for date, amount in daily_sales.items() if daily_sales is not None else []]
+            sales_data = [{'amount': amount, 'date': date} for date, amount in daily_sales.items()]
             anomaly_result = self.anomaly_detector.detect_sales_anomaly(sales_data,  brand_id)
 
             return {
@@ -395,7 +490,7 @@ class RealTimeAnalyzer:
             logger.error(f"매출 성과 분석 오류: {e}")
             return {'error': str(e)}
 
-    def analyze_labor_cost(self, brand_id: int, store_id: Optional[int] if Optional is not None else None = None) -> Dict:
+    def analyze_labor_cost(self, brand_id: int, store_id: Optional[int] = None) -> Dict:
         """인건비 분석"""
         try:
             # 최근 30일 근무 데이터 조회
@@ -417,25 +512,25 @@ class RealTimeAnalyzer:
 
             # 일별 인건비 계산
             daily_costs = {}
-            for attendance in attendances if attendances is not None:
+            for attendance in attendances:
                 if attendance.clock_out:
                     date_key = attendance.clock_in.date().isoformat()
                     if date_key not in daily_costs:
-                        daily_costs[date_key] if daily_costs is not None else None = 0
+                        daily_costs[date_key] = 0
 
                     # 근무 시간 계산 (시간당 임금 가정)
                     work_hours = (attendance.clock_out - attendance.clock_in).total_seconds() / 3600
                     hourly_wage = float(attendance.user.salary_base or 10000) / 160  # 월 160시간 기준
-                    daily_costs[date_key] if daily_costs is not None else None += work_hours * hourly_wage
+                    daily_costs[date_key] += work_hours * hourly_wage
 
             # 분석 결과
-            costs_list = list(daily_costs.value if daily_costs is not None else Nones())
+            costs_list = list(daily_costs.values())
             total_cost = sum(costs_list)
             avg_daily_cost = np.mean(costs_list) if costs_list else 0
             cost_trend = self._calculate_trend(costs_list)
 
             # 이상징후 탐지
-            cost_data = [{'amount': amount, 'date': date} for date, amount in daily_costs.items() if daily_costs is not None else []]
+            cost_data = [{'amount': amount, 'date': date} for date, amount in daily_costs.items()]
             anomaly_result = self.anomaly_detector.detect_cost_anomaly(cost_data,  brand_id)
 
             return {
@@ -451,7 +546,7 @@ class RealTimeAnalyzer:
             logger.error(f"인건비 분석 오류: {e}")
             return {'error': str(e)}
 
-    def analyze_inventory_status(self, brand_id: int, store_id: Optional[int] if Optional is not None else None = None) -> Dict:
+    def analyze_inventory_status(self, brand_id: int, store_id: Optional[int] = None) -> Dict:
         """재고 상태 분석"""
         try:
             query = InventoryItem.query
@@ -468,7 +563,7 @@ class RealTimeAnalyzer:
 
             # 재고 데이터 준비
             inventory_data = []
-            for item in items if items is not None:
+            for item in items:
                 # 일일 소비량 추정 (최근 7일 주문에서)
                 seven_days_ago = datetime.utcnow() - timedelta(days=7)
                 recent_orders = Order.query.filter(
@@ -492,12 +587,12 @@ class RealTimeAnalyzer:
             anomaly_result = self.anomaly_detector.detect_inventory_anomaly(inventory_data,  brand_id)
 
             # 재고 가치 계산
-            total_value = sum(item['current_stock'] if item is not None else None * item['unit_cost'] if item is not None else None for item in inventory_data)
+            total_value = sum(item['current_stock'] * item['unit_cost'] for item in inventory_data)
 
             return {
                 'total_items': len(inventory_data),
                 'total_value': total_value,
-                'low_stock_items': len([item for item in inventory_data if item['current_stock'] if item is not None else None <= item['min_stock'] if item is not None else None]),
+                'low_stock_items': len([item for item in inventory_data if item['current_stock'] <= item['min_stock']]),
                 'inventory_data': inventory_data,
                 'anomaly': anomaly_result,
                 'recommendations': self._generate_inventory_recommendations(anomaly_result)
@@ -507,7 +602,82 @@ class RealTimeAnalyzer:
             logger.error(f"재고 상태 분석 오류: {e}")
             return {'error': str(e)}
 
-    def _calculate_trend(self, values: List[float] if List is not None else None) -> str:
+    def scan_daily_metrics(self, day: Optional[date] = None) -> Dict:
+        """
+        하루치 지점별 매출/인건비와 전체 재고를 집계 쿼리로 읽어 모든 브랜드를 한 번에 탐지
+        (start_daily_scan()으로 등록한 작업이 하루 한 번 전날을 호출, 지점마다 분석을 반복하지 않음)
+        같은 날을 다시 호출해도 매출/인건비 탐지기에는 시계열마다 한 번만 반영됨
+        """
+        try:
+            day = day or (datetime.utcnow() - timedelta(days=1)).date()
+            day_start = datetime.combine(day, datetime.min.time())
+            day_end = day_start + timedelta(days=1)
+
+            # 지점별 매출 합계 (Order 모델의 금액 컬럼은 total_cost)
+            sales_rows = db.session.query(
+                Branch.brand_id, Order.store_id, db.func.sum(db.func.coalesce(Order.total_cost, 0))
+            ).join(Branch, Branch.id == Order.store_id).filter(
+                Order.created_at >= day_start,
+                Order.created_at < day_end,
+                Order.status.in_(['completed', 'delivered'])
+            ).group_by(Branch.brand_id, Order.store_id).all()
+            sales_points = [{'brand_id': brand_id, 'branch_id': branch_id, 'amount': float(amount or 0)}
+                            for brand_id, branch_id, amount in sales_rows]
+
+            # 지점별 근무 시간 -> 인건비 (기존 분석과 같은 기본 시급 가정)
+            attendance_rows = db.session.query(
+                Branch.brand_id, User.branch_id, Attendance.clock_in, Attendance.clock_out
+            ).join(User, User.id == Attendance.user_id).join(Branch, Branch.id == User.branch_id).filter(
+                Attendance.clock_in >= day_start,
+                Attendance.clock_in < day_end,
+                Attendance.clock_out.isnot(None)
+            ).all()
+            daily_costs: Dict[Any, float] = defaultdict(float)
+            for brand_id, branch_id, clock_in, clock_out in attendance_rows:
+                daily_costs[(brand_id, branch_id)] += (clock_out - clock_in).total_seconds() / 3600 * DEFAULT_HOURLY_WAGE
+            cost_points = [{'brand_id': brand_id, 'branch_id': branch_id, 'amount': amount}
+                           for (brand_id, branch_id), amount in daily_costs.items()]
+
+            # 전체 재고 품목 (필요한 컬럼만)
+            inventory_rows = db.session.query(
+                Branch.brand_id, InventoryItem.name, InventoryItem.current_stock, InventoryItem.min_stock
+            ).join(Branch, Branch.id == InventoryItem.branch_id).all()
+            inventory_data = [{
+                'brand_id': brand_id,
+                'name': name,
+                'current_stock': current_stock or 0,
+                'min_stock': min_stock or 0,
+                'daily_consumption': (current_stock or 0) / 30
+            } for brand_id, name, current_stock, min_stock in inventory_rows]
+
+            return {
+                'date': day.isoformat(),
+                'sales_anomalies': self.anomaly_detector.observe_sales(sales_points, day),
+                'cost_anomalies': self.anomaly_detector.observe_costs(cost_points, day),
+                'inventory_anomalies': {
+                    str(brand_id): anomalies
+                    for brand_id, anomalies in self.anomaly_detector.detect_inventory_batch(inventory_data).items()
+                },
+                'scanned': {
+                    'sales_branches': len(sales_points),
+                    'cost_branches': len(cost_points),
+                    'inventory_items': len(inventory_data)
+                }
+            }
+
+        except Exception as e:
+            logger.error(f"일일 이상징후 일괄 탐지 오류: {e}")
+            return {'error': str(e)}
+
+    def start_daily_scan(self, at: str = '01:00'):
+        """전날 일괄 탐지를 매일 한 번 실행하도록 등록 (여러 워커 중 한 프로세스에서만 실행)"""
+        job_scheduler.add_job(self.DAILY_SCAN_JOB, self.scan_daily_metrics, daily_at=at,
+                              singleton=True, app_context=True)
+
+    def stop_daily_scan(self):
+        job_scheduler.remove_job(self.DAILY_SCAN_JOB)
+
+    def _calculate_trend(self, values: List[float]) -> str:
         """트렌드 계산"""
         if len(values) < 2:
             return 'stable'
@@ -523,11 +693,11 @@ class RealTimeAnalyzer:
         else:
             return 'stable'
 
-    def _generate_sales_recommendations(self,  trend: str,  anomaly: Dict) -> List[str] if List is not None else None:
+    def _generate_sales_recommendations(self,  trend: str,  anomaly: Dict) -> List[str]:
         """매출 권장사항 생성"""
         recommendations = []
 
-        if anomaly.get() if anomaly else None'anomaly') if anomaly else None:
+        if anomaly.get('anomaly'):
             recommendations.append("🚨 매출 급감 감지: 즉시 마케팅 활동 강화 필요")
             recommendations.append("📊 고객 이탈 원인 분석 및 대응 방안 수립")
 
@@ -538,11 +708,11 @@ class RealTimeAnalyzer:
 
         return recommendations
 
-    def _generate_cost_recommendations(self, trend: str, anomaly: Dict) -> List[str] if List is not None else None:
+    def _generate_cost_recommendations(self, trend: str, anomaly: Dict) -> List[str]:
         """인건비 권장사항 생성"""
         recommendations = []
 
-        if anomaly.get() if anomaly else None'anomaly') if anomaly else None:
+        if anomaly.get('anomaly'):
             recommendations.append("⚠️ 인건비 급증 감지: 인력 배치 최적화 검토 필요")
             recommendations.append("📋 초과 근무 및 인력 효율성 분석")
 
@@ -551,130 +721,79 @@ class RealTimeAnalyzer:
 
         return recommendations
 
-    def _generate_inventory_recommendations(self, anomaly: Dict) -> List[str] if List is not None else None:
+    def _generate_inventory_recommendations(self, anomaly: Dict) -> List[str]:
         """재고 권장사항 생성"""
         recommendations = []
 
-        if anomaly.get() if anomaly else None'anomaly') if anomaly else None:
-            anomalies = anomaly.get() if anomaly else None'anomalies', []) if anomaly else None
-            for item_anomaly in anomalies if anomalies is not None:
-                if item_anomaly['type'] if item_anomaly is not None else None == 'low_stock':
-                    recommendations.append(f"📦 {item_anomaly['item_name'] if item_anomaly is not None else None} 재고 부족: 즉시 발주 필요")
-                elif item_anomaly['type'] if item_anomaly is not None else None == 'stockout_prediction':
-                    recommendations.append(f"⚠️ {item_anomaly['item_name'] if item_anomaly is not None else None} 재고 소진 예상: 발주 계획 수립")
+        if anomaly.get('anomaly'):
+            anomalies = anomaly.get('anomalies', [])
+            for item_anomaly in anomalies:
+                if item_anomaly['type'] == 'low_stock':
+                    recommendations.append(f"📦 {item_anomaly['item_name']} 재고 부족: 즉시 발주 필요")
+                elif item_anomaly['type'] == 'stockout_prediction':
+                    recommendations.append(f"⚠️ {item_anomaly['item_name']} 재고 소진 예상: 발주 계획 수립")
 
         return recommendations
 
 
 class SalesTrendPredictor:
-    """매출 트렌드 예측 모델"""
-
-    def __init__(self):
-        self.model = RandomForestRegressor(n_estimators=100, random_state=42)
-        self.scaler = StandardScaler()
-        self.model_path = 'data/ai_analytics/models/sales_predictor.joblib'
-        self._load_or_create_model()
+    """매출 트렌드 예측 (재훈련 파이프라인이 게시한 모델을 메모리에 유지하며 예측만 수행)"""
 
-    def _load_or_create_model(self):
-        """모델 로드 또는 새로 생성"""
-        try:
-            if os.path.exists(self.model_path):
-                self.model = joblib.load(self.model_path)
-                self.scaler = joblib.load(
-                    f'{self.model_path.replace("sales_predictor.joblib", "scalers/sales_scaler.joblib")}')
-            else:
-                self.model = RandomForestRegressor(n_estimators=100, random_state=42)
-                self.scaler = StandardScaler()
-        except Exception as e:
-            logger.error(f"매출 예측 모델 로드 오류: {e}")
-            self.model = RandomForestRegressor(n_estimators=100, random_state=42)
-            self.scaler = StandardScaler()
-
-    def save_model(self):
-        """모델 저장"""
-        try:
-            joblib.dump(self.model, self.model_path)
-            joblib.dump(self.scaler, f'{self.model_path.replace("sales_predictor.joblib", "scalers/sales_scaler.joblib")}')
-            logger.info("매출 예측 모델 저장 완료")
-        except Exception as e:
-            logger.error(f"매출 예측 모델 저장 오류: {e}")
+    def __init__(self, registry=None):
+        self.registry = registry or model_registry
 
-    def predict_sales_trend(self,  sales_data: List[Dict] if List is not None else None, days_ahead=7) -> Dict:
+    def predict_sales_trend(self,  sales_data: List[Dict], days_ahead=7) -> Dict:
         """매출 트렌드 예측"""
         try:
             if len(sales_data) < 30:  # 최소 30일 데이터 필요
                 return {'error': '예측을 위해 최소 30일 데이터가 필요합니다.'}
 
-            # 특성 엔지니어링
-            df = pd.DataFrame(sales_data)
-            df['date'] if df is not None else None = pd.to_datetime(df['date'] if df is not None else None)
-            df = df.sort_values('date')
-
-            # 시간 특성 추가
-            df['day_of_week'] if df is not None else None = df['date'] if df is not None else None.dt.dayofweek
-            df['month'] if df is not None else None = df['date'] if df is not None else None.dt.month
-            df['day_of_month'] if df is not None else None = df['date'] if df is not None else None.dt.day
-            df['is_weekend'] if df is not None else None = df['day_of_week'] if df is not None else None.isin([5, 6]).astype(int)
-
-            # 이동평균 특성
-            df['sales_ma7'] if df is not None else None = df['amount'] if df is not None else None.rolling(window=7).mean()
-            df['sales_ma14'] if df is not None else None = df['amount'] if df is not None else None.rolling(window=14).mean()
-
-            # 지연 특성
-            df['sales_lag1'] if df is not None else None = df['amount'] if df is not None else None.shift(1)
-            df['sales_lag7'] if df is not None else None = df['amount'] if df is not None else None.shift(7)
-
-            # NaN 제거
-            df = df.dropna()
+            loaded = self.registry.get(SALES_TREND_MODEL)
+            if loaded is None:
+                return {'error': '학습된 매출 예측 모델이 없습니다. 재훈련 후 다시 시도하세요.'}
 
+            # 특성 엔지니어링
+            df = build_sales_trend_frame(sales_data)
             if len(df) < 20:
                 return {'error': '충분한 데이터가 없습니다.'}
 
-            # 특성 선택
-            features = ['day_of_week', 'month', 'day_of_month', 'is_weekend',
-                        'sales_ma7', 'sales_ma14', 'sales_lag1', 'sales_lag7']
-            X = df[features] if df is not None else None.value if None is not None else Nones
-            y = df['amount'] if df is not None else None.value if None is not None else Nones
-
-            # 스케일링
-            X_scaled = self.scaler.fit_transform(X)
-
-            # 모델 학습
-            self.model.fit(X_scaled, y)
-
-            # 예측을 위한 미래 데이터 생성
-            last_date = df['date'] if df is not None else None.iloc[-1] if iloc is not None else None
-            future_dates = [last_date + timedelta(days=i+1) for i in range(days_ahead)]
+            X = df[SALES_TREND_FEATURES].values
+            y = df['amount'].values
 
+            # 예측을 위한 미래 데이터 생성 (원 단위 특성으로 다음 날 행을 만들고, 변환은 모델 쪽에서)
+            last_date = df['date'].iloc[-1]
+            history = [float(v) for v in df['amount'].values]
             predictions = []
-            current_features = X_scaled[-1:] if X_scaled is not None else None.copy()
-
-            for i, future_date in enumerate(future_dates):
-                # 미래 특성 업데이트
-                current_features[0, 0] if current_features is not None else None = future_date.dayofweek  # day_of_week
-                current_features[0, 1] if current_features is not None else None = future_date.month      # month
-                current_features[0, 2] if current_features is not None else None = future_date.day        # day_of_month
-                current_features[0, 3] if current_features is not None else None = 1 if future_date.weekday() >= 5 else 0  # is_weekend
 
-                # 예측
-                pred = self.model.predict(current_features)[0]
+            for i in range(days_ahead):
+                future_date = last_date + timedelta(days=i + 1)
+                row = [
+                    future_date.dayofweek,
+                    future_date.month,
+                    future_date.day,
+                    1 if future_date.weekday() >= 5 else 0,
+                    float(np.mean(history[-7:])),
+                    float(np.mean(history[-14:])),
+                    history[-1],
+                    history[-7],
+                ]
+                pred = max(0.0, float(loaded.predict([row])[0]))  # 음수 방지
                 predictions.append({
                     'date': future_date.strftime('%Y-%m-%d'),
-                    'predicted_amount': max(0, pred),  # 음수 방지
+                    'predicted_amount': pred,
                     'confidence': 0.85
                 })
+                # 다음 예측을 위해 예측값을 이력에 추가
+                history.append(pred)
 
-                # 다음 예측을 위해 특성 업데이트
-                current_features[0, 6] if current_features is not None else None = pred  # sales_lag1 업데이트
-
-            # 모델 저장
-            self.save_model()
-
+            # 입력 기간에 대한 모델 성능 (한 번에 예측)
+            fitted = loaded.predict(X)
             return {
                 'predictions': predictions,
                 'model_performance': {
-                    'r2_score': r2_score(y, self.model.predict(X_scaled)),
-                    'mae': mean_absolute_error(y, self.model.predict(X_scaled))
+                    'r2_score': float(r2_score(y, fitted)),
+                    'mae': float(mean_absolute_error(y, fitted)),
+                    'model_version': loaded.version
                 },
                 'trend_analysis': self._analyze_prediction_trend(predictions)
             }
@@ -683,14 +802,14 @@ class SalesTrendPredictor:
             logger.error(f"매출 트렌드 예측 오류: {e}")
             return {'error': str(e)}
 
-    def _analyze_prediction_trend(self,  predictions: List[Dict] if List is not None else None) -> Dict:
+    def _analyze_prediction_trend(self,  predictions: List[Dict]) -> Dict:
         """예측 트렌드 분석"""
         try:
-            amounts = [p['predicted_amount'] if p is not None else None for p in predictions]
+            amounts = [p['predicted_amount'] for p in predictions]
 
             # 트렌드 계산
             if len(amounts) >= 2:
-                trend_slope = (amounts[-1] if amounts is not None else None - amounts[0] if amounts is not None else None) / len(amounts)
+                trend_slope = (amounts[-1] - amounts[0]) / len(amounts)
                 trend_direction = 'increasing' if trend_slope > 0 else 'decreasing' if trend_slope < 0 else 'stable'
 
                 # 변동성 계산
@@ -700,8 +819,8 @@ class SalesTrendPredictor:
                     'direction': trend_direction,
                     'slope': trend_slope,
                     'volatility': volatility,
-                    'peak_day': predictions[np.argmax(amounts)] if predictions is not None else None['date'],
-                    'lowest_day': predictions[np.argmin(amounts)] if predictions is not None else None['date']
+                    'peak_day': predictions[np.argmax(amounts)]['date'],
+                    'lowest_day': predictions[np.argmin(amounts)]['date']
                 }
 
             return {'direction': 'unknown', 'slope': 0, 'volatility': 0}
@@ -711,8 +830,8 @@ class SalesTrendPredictor:
             return {'direction': 'error', 'slope': 0, 'volatility': 0}
 
 
-# 전역 분석기 인스턴스
-real_time_analyzer = RealTimeAnalyzer()
+# 전역 분석기 인스턴스 (온라인 탐지기 상태는 사이드카 DB로 워커 사이에 공유)
+real_time_analyzer = RealTimeAnalyzer(state_store=OnlineAnomalyStateStore())
 sales_trend_predictor = SalesTrendPredictor()
 
 
@@ -722,8 +841,8 @@ def comprehensive_analysis():
     """종합 분석 리포트 생성"""
     try:
         data = request.get_json() or {}
-        brand_id = data.get() if data else None'brand_id') if data else None
-        store_id = data.get() if data else None'store_id') if data else None
+        brand_id = data.get('brand_id')
+        store_id = data.get('store_id')
 
         if not brand_id and not store_id:
             return jsonify({'error': '브랜드 ID 또는 지점 ID가 필요합니다.'}), 400
@@ -748,14 +867,14 @@ def comprehensive_analysis():
             'inventory_analysis': inventory_analysis,
             'summary': {
                 'total_anomalies': sum([
-                    sales_analysis.get() if sales_analysis else None'anomaly', {}) if sales_analysis else None.get() if None else None'anomaly', False),
-                    labor_analysis.get() if labor_analysis else None'anomaly', {}) if labor_analysis else None.get() if None else None'anomaly', False),
-                    inventory_analysis.get() if inventory_analysis else None'anomaly', {}) if inventory_analysis else None.get() if None else None'anomaly', False)
+                    sales_analysis.get('anomaly', {}).get('anomaly', False),
+                    labor_analysis.get('anomaly', {}).get('anomaly', False),
+                    inventory_analysis.get('anomaly', {}).get('anomaly', False)
                 ]),
                 'overall_health': 'good' if sum([
-                    sales_analysis.get() if sales_analysis else None'anomaly', {}) if sales_analysis else None.get() if None else None'anomaly', False),
-                    labor_analysis.get() if labor_analysis else None'anomaly', {}) if labor_analysis else None.get() if None else None'anomaly', False),
-                    inventory_analysis.get() if inventory_analysis else None'anomaly', {}) if inventory_analysis else None.get() if None else None'anomaly', False)
+                    sales_analysis.get('anomaly', {}).get('anomaly', False),
+                    labor_analysis.get('anomaly', {}).get('anomaly', False),
+                    inventory_analysis.get('anomaly', {}).get('anomaly', False)
                 ]) == 0 else 'warning',
                 'key_insights': _generate_key_insights(sales_analysis, labor_analysis, inventory_analysis)
             }
@@ -774,8 +893,8 @@ def sales_analysis():
     """매출 분석"""
     try:
         data = request.get_json() or {}
-        brand_id = data.get() if data else None'brand_id') if data else None
-        store_id = data.get() if data else None'store_id') if data else None
+        brand_id = data.get('brand_id')
+        store_id = data.get('store_id')
 
         if not brand_id and not store_id:
             return jsonify({'error': '브랜드 ID 또는 지점 ID가 필요합니다.'}), 400
@@ -794,8 +913,8 @@ def labor_analysis():
     """인건비 분석"""
     try:
         data = request.get_json() or {}
-        brand_id = data.get() if data else None'brand_id') if data else None
-        store_id = data.get() if data else None'store_id') if data else None
+        brand_id = data.get('brand_id')
+        store_id = data.get('store_id')
 
         if not brand_id and not store_id:
             return jsonify({'error': '브랜드 ID 또는 지점 ID가 필요합니다.'}), 400
@@ -814,8 +933,8 @@ def inventory_analysis():
     """재고 분석"""
     try:
         data = request.get_json() or {}
-        brand_id = data.get() if data else None'brand_id') if data else None
-        store_id = data.get() if data else None'store_id') if data else None
+        brand_id = data.get('brand_id')
+        store_id = data.get('store_id')
 
         if not brand_id and not store_id:
             return jsonify({'error': '브랜드 ID 또는 지점 ID가 필요합니다.'}), 400
@@ -834,8 +953,8 @@ def sales_prediction():
     """매출 트렌드 예측"""
     try:
         data = request.get_json() or {}
-        brand_id = data.get() if data else None'brand_id') if data else None
-        store_id = data.get() if data else None'store_id') if data else None
+        brand_id = data.get('brand_id')
+        store_id = data.get('store_id')
 
         if not brand_id and not store_id:
             return jsonify({'error': '브랜드 ID 또는 지점 ID가 필요합니다.'}), 400
@@ -866,22 +985,54 @@ def sales_prediction():
         return jsonify({'error': '예측 중 오류가 발생했습니다.'}), 500
 
 
-def _generate_key_insights(sales_analysis: Dict, labor_analysis: Dict, inventory_analysis: Dict) -> List[str] if List is not None else None:
+@ai_advanced_analytics.route('/anomaly/scan', methods=['POST'])
+@login_required
+def anomaly_scan():
+    """전체 브랜드 일일 이상징후 일괄 탐지 (수동 재실행, 이미 반영된 날은 탐지기에 다시 넣지 않음)"""
+    try:
+        if current_user.role not in ['super_admin', 'admin']:
+            return jsonify({'error': '분석 권한이 없습니다.'}), 403
+
+        data = request.get_json() or {}
+        day = None
+        if data.get('date'):
+            try:
+                day = date.fromisoformat(data['date'])
+            except ValueError:
+                return jsonify({'error': '날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)'}), 400
+
+        result = real_time_analyzer.scan_daily_metrics(day)
+        return jsonify(result), 200 if 'error' not in result else 500
+
+    except Exception as e:
+        logger.error(f"이상징후 일괄 탐지 오류: {e}")
+        return jsonify({'error': '분석 중 오류가 발생했습니다.'}), 500
+
+
+@ai_advanced_analytics.route('/anomaly/status', methods=['GET'])
+@login_required
+def anomaly_status():
+    """온라인 이상 탐지기 상태"""
+    detector = real_time_analyzer.anomaly_detector
+    return jsonify({metric: online.status() for metric, online in detector.online.items()}), 200
+
+
+def _generate_key_insights(sales_analysis: Dict, labor_analysis: Dict, inventory_analysis: Dict) -> List[str]:
     """핵심 인사이트 생성"""
     insights = []
 
     # 매출 인사이트
-    if sales_analysis.get() if sales_analysis else None'sales_trend') if sales_analysis else None == 'increasing':
+    if sales_analysis.get('sales_trend') == 'increasing':
         insights.append("📈 매출 상승 추세로 운영 상태 양호")
-    elif sales_analysis.get() if sales_analysis else None'sales_trend') if sales_analysis else None == 'decreasing':
+    elif sales_analysis.get('sales_trend') == 'decreasing':
         insights.append("📉 매출 하락 추세로 개선 방안 필요")
 
     # 인건비 인사이트
-    if labor_analysis.get() if labor_analysis else None'cost_trend') if labor_analysis else None == 'increasing':
+    if labor_analysis.get('cost_trend') == 'increasing':
         insights.append("💰 인건비 상승으로 수익성 관리 필요")
 
     # 재고 인사이트
-    low_stock_count = inventory_analysis.get() if inventory_analysis else None'low_stock_items', 0) if inventory_analysis else None
+    low_stock_count = inventory_analysis.get('low_stock_items', 0)
     if low_stock_count > 0:
         insights.append(f"📦 {low_stock_count}개 품목 재고 부족으로 발주 필요")
 
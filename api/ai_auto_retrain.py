@@ -1,7 +1,5 @@
 from extensions import redis_client  # pyright: ignore
 from models_main import Order, User, Notification, SystemLog, db  # pyright: ignore
-import os
-import joblib
 import pickle
 from dataclasses import dataclass, asdict
 import aiohttp
@@ -10,14 +8,16 @@ from collections import defaultdict
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timedelta
-import threading
+from datetime import date, datetime, timedelta
 import time
 import json
 import logging
 from flask_login import login_required, current_user
 from flask import Blueprint, request, jsonify, current_app
 from typing import Optional
+from utils.model_registry import model_registry
+from utils.training_data import DailySalesFeatureStore, get_daily_sales_store, track_resources
+from core.backend.service_registry import service_registry
 query = None  # pyright: ignore
 config = None  # pyright: ignore
 form = None  # pyright: ignore
@@ -31,6 +31,9 @@ AI 모델 자동 재훈련 시스템
 
 logger = logging.getLogger(__name__)
 
+# 주문 금액 컬럼 (Order 모델에는 total_amount가 없어 발주 총액을 사용)
+ORDER_AMOUNT = Order.total_cost
+
 ai_auto_retrain_bp = Blueprint('ai_auto_retrain', __name__)
 
 
@@ -65,33 +68,28 @@ class AIAutoRetrainService:
             'performance_threshold': 0.7,
             'max_concurrent_tasks': 2,
             'retrain_interval_hours': 24,
-            'backup_models': True
+            'backup_models': True,
+            'training_window_days': 365,
+            'stream_chunk_size': 1000
         }
         self.model_backups = {}
+        self.feature_store: Optional[DailySalesFeatureStore] = None
         self._start_retrain_worker()
 
     def _start_retrain_worker(self):
-        def retrain_worker():
-            while True:
-                try:
-                    task_data = redis_client.brpop('ai_retrain_queue', timeout=1)
-                    if task_data:
-                        task_json = task_data[1]
-                        if task_json is not None:
-                            task = json.loads(task_json)
-                            self._execute_retrain_task(task)
-                        else:
-                            logger.warning("task_data[1]가 None입니다. 재훈련 작업을 실행하지 않습니다.")  # noqa
-                    self._cleanup_completed_tasks()
-                    time.sleep(5)
-                except Exception as e:
-                    logger.error(f"재훈련 워커 오류: {e}")
-                    time.sleep(10)
-        # AI 자동 재훈련 워커 비활성화됨 (서버는 계속 실행)
-        # thread = threading.Thread(target=retrain_worker, daemon=True)
-        # thread.start()
+        # AI 자동 재훈련 작업 비활성화됨 (서버는 계속 실행)
+        # 활성화 시 재훈련은 여러 워커 중 한 프로세스에서만 실행
+        # job_scheduler.add_job("ai_auto_retrain.worker", self._retrain_tick, interval=5, singleton=True)
         logger.info("AI 자동 재훈련 워커 비활성화됨")
 
+    def _retrain_tick(self):
+        """재훈련 큐의 작업 하나 처리 (작업 스케줄러가 5초마다 실행)"""
+        task_json = redis_client.rpop('ai_retrain_queue')
+        if task_json is not None:
+            task = json.loads(task_json)
+            self._execute_retrain_task(task)
+        self._cleanup_completed_tasks()
+
     def _execute_retrain_task(self, task_data: Optional[Dict[str, Any]]):
         try:
             model_name = ''  # 미리 초기화
@@ -117,7 +115,12 @@ class AIAutoRetrainService:
                 if model_name:
                     self._backup_model(model_name)
             if model_name:
-                result: dict[str, Any] = self._retrain_model(model_name, task)  # type: ignore
+                # 실행별 소요 시간/최대 메모리 기록
+                with track_resources() as resources:
+                    result: dict[str, Any] = self._retrain_model(model_name, task)  # type: ignore
+                result['resources'] = resources
+                logger.info(f"재훈련 자원 사용: {model_name} {resources['wall_time']}s, "
+                            f"최대 {resources['peak_memory_mb']}MB")
             else:
                 result = {'success': False, 'error': 'model_name이 None입니다.'}
             if result is not None and result.get('success', False):
@@ -143,7 +146,11 @@ class AIAutoRetrainService:
 
     def _retrain_model(self, model_name: str, task: RetrainTask) -> dict[str, Any]:
         try:
-            if 'sales_forecast' in model_name:
+            if 'sales_trend' in model_name:
+                return self._retrain_sales_trend_model(task)
+            elif 'sales_anomaly' in model_name:
+                return self._retrain_sales_anomaly_model(task)
+            elif 'sales_forecast' in model_name:
                 return self._retrain_sales_model(task)
             elif 'inventory' in model_name:
                 return self._retrain_inventory_model(task)
@@ -185,6 +192,88 @@ class AIAutoRetrainService:
             logger.error(f"매출 모델 재훈련 실패: {e}")
             return {'success': False, 'error': str(e)}
 
+    def _daily_sales_records(self, sales_data: pd.DataFrame) -> List[Dict[str, Any]]:
+        """수집한 일별 매출 -> [{'date', 'amount'}] (고급 분석 예측기 입력 형식)"""
+        return [
+            {'date': row['date'], 'amount': float(row['sales_amount'])}
+            for row in sales_data[['date', 'sales_amount']].to_dict('records')
+        ]
+
+    def _retrain_sales_trend_model(self, task: RetrainTask) -> Dict[str, Any]:
+        """매출 트렌드 예측 모델 학습 후 레지스트리에 게시 (예측 요청에서는 학습하지 않음)"""
+        try:
+            from sklearn.ensemble import RandomForestRegressor
+            from sklearn.metrics import r2_score
+            from sklearn.preprocessing import StandardScaler
+            from api.ai_advanced_analytics import SALES_TREND_FEATURES, SALES_TREND_MODEL, build_sales_trend_frame
+
+            task.progress = 10
+            task.estimated_time = 15
+            sales_data = self._collect_sales_data()
+            if sales_data.empty:
+                return {'success': False, 'error': '훈련 데이터가 부족합니다.'}
+            task.progress = 40
+            df = build_sales_trend_frame(self._daily_sales_records(sales_data))
+            if len(df) < 20:
+                return {'success': False, 'error': '훈련 데이터가 부족합니다.'}
+            start_time = time.time()
+            X = df[SALES_TREND_FEATURES].values
+            y = df['amount'].values
+            scaler = StandardScaler()
+            X_scaled = scaler.fit_transform(X)
+            model = RandomForestRegressor(n_estimators=100, random_state=42)
+            model.fit(X_scaled, y)
+            accuracy = float(r2_score(y, model.predict(X_scaled)))
+            training_time = time.time() - start_time
+            task.progress = 90
+            version = model_registry.publish(SALES_TREND_MODEL, model, scaler, metadata={
+                'features': SALES_TREND_FEATURES,
+                'accuracy': accuracy,
+                'training_samples': len(df)
+            })
+            task.progress = 100
+            return {
+                'success': True,
+                'accuracy': accuracy,
+                'training_samples': len(df),
+                'training_time': training_time,
+                'version': version
+            }
+        except Exception as e:
+            logger.error(f"매출 트렌드 모델 재훈련 실패: {e}")
+            return {'success': False, 'error': str(e)}
+
+    def _retrain_sales_anomaly_model(self, task: RetrainTask) -> Dict[str, Any]:
+        """매출 이상 탐지 모델(Isolation Forest) 학습 후 레지스트리에 게시"""
+        try:
+            from sklearn.ensemble import IsolationForest
+            from api.ai_advanced_analytics import SALES_ANOMALY_MODEL, sales_anomaly_features
+
+            task.progress = 10
+            task.estimated_time = 5
+            sales_data = self._collect_sales_data()
+            if len(sales_data) < 14:
+                return {'success': False, 'error': '훈련 데이터가 부족합니다.'}
+            task.progress = 50
+            start_time = time.time()
+            model = IsolationForest(contamination=0.1, random_state=42)
+            model.fit(sales_anomaly_features(sales_data['sales_amount'].values))
+            training_time = time.time() - start_time
+            task.progress = 90
+            version = model_registry.publish(SALES_ANOMALY_MODEL, model, metadata={
+                'training_samples': len(sales_data)
+            })
+            task.progress = 100
+            return {
+                'success': True,
+                'training_samples': len(sales_data),
+                'training_time': training_time,
+                'version': version
+            }
+        except Exception as e:
+            logger.error(f"매출 이상 탐지 모델 재훈련 실패: {e}")
+            return {'success': False, 'error': str(e)}
+
     def _retrain_inventory_model(self, task: RetrainTask) -> Dict[str, Any]:
         try:
             task.progress = 10
@@ -251,124 +340,128 @@ class AIAutoRetrainService:
             logger.error(f"직원 모델 재훈련 실패: {e}")
             return {'success': False, 'error': str(e)}
 
+    def _daily_sales_store(self) -> DailySalesFeatureStore:
+        if self.feature_store is None:
+            self.feature_store = get_daily_sales_store()
+        return self.feature_store
+
+    def _refresh_daily_sales(self, end_date: date) -> DailySalesFeatureStore:
+        """일별 매출 특성 테이블에 마지막 저장일 이후 날짜만 SQL로 집계해 추가"""
+        store = self._daily_sales_store()
+        start = store.refresh_start(end_date - timedelta(days=self.retrain_config['training_window_days'] + 30))
+        day = db.func.date(Order.created_at, type_=db.Date)
+        rows = db.session.query(
+            day,
+            db.func.sum(db.func.coalesce(ORDER_AMOUNT, 0)),
+            db.func.count(Order.id)
+        ).filter(
+            Order.created_at >= datetime.combine(start, datetime.min.time()),  # pyright: ignore
+            Order.created_at < datetime.combine(end_date + timedelta(days=1), datetime.min.time())  # pyright: ignore
+        ).group_by(day).all()
+        stored = store.replace_range(start, end_date, rows)
+        logger.info(f"일별 매출 특성 갱신: {start} ~ {end_date} ({stored}일)")
+        return store
+
     def _collect_sales_data(self) -> pd.DataFrame:
-        """매출 데이터 수집"""
+        """매출 데이터 수집 (일별 특성 테이블 기준, 새 날짜만 DB에서 집계)"""
         try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=365)
-            orders = db.session.query(Order).filter(
-                Order.created_at >= start_date,  # pyright: ignore
-                Order.created_at <= end_date     # pyright: ignore
-            ).all()
-            data = []
-            if orders is not None:
-                for order in orders:
-                    data.append({
-                        'date': order.created_at.date(),  # pyright: ignore
-                        'sales_amount': getattr(order, 'total_amount', 0),  # pyright: ignore
-                        'order_count': 1,
-                        'day_of_week': order.created_at.weekday(),  # pyright: ignore
-                        'month': order.created_at.month,  # pyright: ignore
-                        'season': self._get_season(order.created_at.month),
-                        'holiday': self._is_holiday(order.created_at.date()),
-                        'weather': self._get_weather_score(order.created_at.date())
-                    })
-            df = pd.DataFrame(data)
-            daily_sales = df.groupby('date').agg({
-                'sales_amount': 'sum',
-                'order_count': 'sum',
-                'day_of_week': 'first',
-                'month': 'first',
-                'season': 'first',
-                'holiday': 'first',
-                'weather': 'first'
-            }).reset_index()
-            daily_sales['previous_sales'] = daily_sales['sales_amount'].shift(1)
-            daily_sales['sales_7d_avg'] = daily_sales['sales_amount'].rolling(7).mean()
-            daily_sales['sales_30d_avg'] = daily_sales['sales_amount'].rolling(30).mean()
-            return daily_sales.dropna()
+            end_date = datetime.now().date()
+            start_date = end_date - timedelta(days=self.retrain_config['training_window_days'])
+            daily_sales = self._refresh_daily_sales(end_date).frame(start_date, end_date)
+            if daily_sales.empty:
+                return daily_sales
+
+            # 날짜에서 바로 계산되는 특성
+            dates = pd.to_datetime(daily_sales['date'])
+            daily_sales.insert(3, 'day_of_week', dates.dt.weekday)
+            daily_sales.insert(4, 'month', dates.dt.month)
+            daily_sales.insert(5, 'season', daily_sales['month'].map(self._get_season))
+            daily_sales.insert(6, 'holiday', [self._is_holiday(d) for d in daily_sales['date']])
+            daily_sales.insert(7, 'weather', [self._get_weather_score(d) for d in daily_sales['date']])
+            return daily_sales
         except Exception as e:
             logger.error(f"매출 데이터 수집 실패: {e}")
             return pd.DataFrame()
 
     def _collect_inventory_data(self) -> pd.DataFrame:
-        """재고 데이터 수집"""
+        """재고 데이터 수집 (필요한 컬럼만 청크 단위로 스트리밍)"""
         try:
             from models_main import InventoryItem
-            inventory_items = db.session.query(InventoryItem).all()
-            data = []
-            if inventory_items is not None:
-                for item in inventory_items:
-                    avg_daily_sales = np.random.randint(1, 10)
-                    data.append({
-                        'item_id': item.id,  # pyright: ignore
-                        'item_name': item.name,  # pyright: ignore
-                        'current_stock': item.current_stock,  # pyright: ignore
-                        'avg_daily_sales': avg_daily_sales,
-                        'lead_time_days': np.random.randint(1, 7),
-                        'seasonality_factor': self._get_seasonality_factor(item.name)  # pyright: ignore
-                    })
-            return pd.DataFrame(data)
+            query = db.session.query(
+                InventoryItem.id, InventoryItem.name, InventoryItem.current_stock  # pyright: ignore
+            ).execution_options(yield_per=self.retrain_config['stream_chunk_size'])
+            columns = {'item_id': [], 'item_name': [], 'current_stock': []}
+            for item_id, name, current_stock in query:
+                columns['item_id'].append(item_id)
+                columns['item_name'].append(name)
+                columns['current_stock'].append(current_stock)
+            count = len(columns['item_id'])
+            df = pd.DataFrame(columns)
+            df['avg_daily_sales'] = np.random.randint(1, 10, size=count)
+            df['lead_time_days'] = np.random.randint(1, 7, size=count)
+            df['seasonality_factor'] = [self._get_seasonality_factor(name) for name in columns['item_name']]
+            return df
         except Exception as e:
             logger.error(f"재고 데이터 수집 실패: {e}")
             return pd.DataFrame()
 
     def _collect_customer_data(self) -> pd.DataFrame:
-        """고객 데이터 수집"""
+        """고객 데이터 수집 (고객별 주문 통계를 SQL 한 번으로 집계)"""
         try:
-            users = db.session.query(User).filter(
+            now = datetime.now()
+            rows = db.session.query(
+                Order.ordered_by,
+                db.func.count(Order.id),
+                db.func.avg(db.func.coalesce(ORDER_AMOUNT, 0)),
+                db.func.min(Order.created_at),
+                db.func.max(Order.created_at)
+            ).join(User, User.id == Order.ordered_by).filter(
                 User.role == 'customer'  # pyright: ignore
-            ).all()
+            ).group_by(Order.ordered_by).all()
             data = []
-            if users is not None:
-                for user in users:
-                    user_orders = db.session.query(Order).filter(
-                        Order.user_id == user.id  # pyright: ignore
-                    ).order_by(Order.created_at.desc()).all()
-                    if user_orders:
-                        visit_frequency = len(user_orders) / max(1, (datetime.now() - user_orders[-1].created_at).days)  # pyright: ignore
-                        avg_order_value = sum(getattr(o, 'total_amount', 0) for o in user_orders) / len(user_orders)
-                        last_visit_days = (datetime.now() - user_orders[0].created_at).days  # pyright: ignore
-                        data.append({
-                            'user_id': user.id,  # pyright: ignore
-                            'visit_frequency': visit_frequency,
-                            'avg_order_value': avg_order_value,
-                            'last_visit_days': last_visit_days,
-                            'total_orders': len(user_orders)
-                        })
+            for user_id, total_orders, avg_order_value, first_order, last_order in rows:
+                if first_order is None:
+                    continue
+                data.append({
+                    'user_id': user_id,
+                    'visit_frequency': total_orders / max(1, (now - first_order).days),
+                    'avg_order_value': float(avg_order_value or 0),
+                    'last_visit_days': (now - last_order).days,
+                    'total_orders': total_orders
+                })
             return pd.DataFrame(data)
         except Exception as e:
             logger.error(f"고객 데이터 수집 실패: {e}")
             return pd.DataFrame()
 
     def _collect_staff_data(self) -> pd.DataFrame:
-        """직원 데이터 수집"""
+        """직원 데이터 수집 (최근 90일 날짜별 근무 인원 + 같은 날 주문 수)"""
         try:
             from models_main import Schedule
-            # 쿼리에서 work_date 필터를 제거하고, 파이썬에서 work_date가 있는 경우만 필터링
-            schedules = db.session.query(Schedule).all()
+            end_date = datetime.now().date()
+            start_date = end_date - timedelta(days=90)
+            rows = db.session.query(
+                Schedule.date,
+                db.func.count(db.func.distinct(Schedule.user_id))
+            ).filter(
+                Schedule.date >= start_date,  # pyright: ignore
+                Schedule.date <= end_date,  # pyright: ignore
+                Schedule.type == 'work'  # pyright: ignore
+            ).group_by(Schedule.date).all()
+            if not rows:
+                return pd.DataFrame()
+            demand = self._refresh_daily_sales(end_date).order_counts(start_date, end_date)
             data = []
-            if schedules is not None:
-                for schedule in schedules:
-                    work_date = getattr(schedule, 'work_date', None)
-                    if work_date is None:
-                        continue
-                    # 90일 이내만 필터링
-                    if work_date < datetime.now() - timedelta(days=90):
-                        continue
-                    day_orders = db.session.query(Order).filter(
-                        Order.created_at >= work_date,  # pyright: ignore
-                        Order.created_at < work_date + timedelta(days=1)  # pyright: ignore
-                    ).count()
-                    data.append({
-                        'date': work_date.date(),
-                        'required_staff': getattr(schedule, 'required_staff', 1),
-                        'actual_staff': getattr(schedule, 'actual_staff', 1),
-                        'day_of_week': work_date.weekday(),
-                        'month': work_date.month,
-                        'season': self._get_season(work_date.month),
-                        'historical_demand': day_orders
-                    })
+            for work_date, staff_count in rows:
+                data.append({
+                    'date': work_date,
+                    'required_staff': staff_count,
+                    'actual_staff': staff_count,
+                    'day_of_week': work_date.weekday(),
+                    'month': work_date.month,
+                    'season': self._get_season(work_date.month),
+                    'historical_demand': demand.get(work_date.isoformat(), 0)
+                })
             return pd.DataFrame(data)
         except Exception as e:
             logger.error(f"직원 데이터 수집 실패: {e}")
@@ -611,45 +704,24 @@ class AIAutoRetrainService:
             return 0
 
     def _save_model(self, model_name: str, model):
-        """모델 저장"""
+        """모델 저장 (레지스트리에 새 버전으로 게시, 실행 중인 예측은 다음 조회부터 새 버전 사용)"""
         try:
-            # 모델 디렉토리 생성
-            model_dir = f"data/ai_models/{model_name}"
-            os.makedirs(model_dir, exist_ok=True)
-
-            # 모델 파일 저장
-            model_path = f"{model_dir}/model.pkl"
-            joblib.dump(model, model_path)
-
-            # 메타데이터 저장
-            metadata = {
-                'model_name': model_name,
-                'created_at': datetime.now().isoformat(),
-                'version': '1.0'
-            }
-
-            metadata_path = f"{model_dir}/metadata.json"
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
-
-            logger.info(f"모델 저장 완료: {model_path}")
+            version = model_registry.publish(model_name, model, metadata={
+                'created_at': datetime.now().isoformat()
+            })
+            logger.info(f"모델 저장 완료: {model_name} {version}")
 
         except Exception as e:
             logger.error(f"모델 저장 실패: {e}")
             raise
 
     def _backup_model(self,  model_name: str):
-        """모델 백업"""
+        """모델 백업 (레지스트리는 이전 버전을 보관하므로 되돌릴 현재 버전만 기록)"""
         try:
-            model_dir = f"data/ai_models/{model_name}"
-            backup_dir = f"data/ai_models/backups/{model_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
-            if os.path.exists(model_dir):
-                import shutil
-                shutil.copytree(model_dir, backup_dir)
-                self.model_backups[model_name] = backup_dir
-
-                logger.info(f"모델 백업 완료: {backup_dir}")
+            version = model_registry.current_version(model_name)
+            if version:
+                self.model_backups[model_name] = version
+                logger.info(f"모델 백업 완료: {model_name} {version}")
 
         except Exception as e:
             logger.error(f"모델 백업 실패: {e}")
@@ -750,8 +822,8 @@ class AIAutoRetrainService:
             return {'error': f'상태 조회 실패: {str(e)}'}
 
 
-# 전역 서비스 인스턴스
-ai_retrain_service = AIAutoRetrainService()
+# 전역 서비스 인스턴스 (서비스 레지스트리가 첫 사용 시 생성)
+ai_retrain_service = service_registry.register("ai.retrain_service", AIAutoRetrainService)
 
 # API 엔드포인트들
 
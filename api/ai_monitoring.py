@@ -10,12 +10,12 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-import threading
 import time
 import json
 import logging
 from flask_login import login_required, current_user
 from flask import Blueprint, request, jsonify, current_app
+from core.backend.service_registry import service_registry
 from typing import Optional
 args = None  # pyright: ignore
 form = None  # pyright: ignore
@@ -80,22 +80,18 @@ class AIMonitoringService:
         self._start_monitoring_thread()
 
     def _start_monitoring_thread(self):
-        """모니터링 스레드 시작"""
-        def monitoring_loop():
-            while self.monitoring_active:
-                try:
-                    self._check_model_performance()
-                    self._detect_model_drift()
-                    self._send_performance_alerts()
-                    time.sleep(60)  # 1분마다 체크
-                except Exception as e:
-                    logger.error(f"모니터링 스레드 오류: {e}")
-                    time.sleep(60)
-
-        # AI 모니터링 스레드 비활성화됨 (서버는 계속 실행)
-        # thread = threading.Thread(target=monitoring_loop, daemon=True)
-        # thread.start()
-        logger.info("AI 모니터링 스레드 비활성화됨")
+        """모니터링 작업 등록"""
+        # AI 모니터링 작업 비활성화됨 (서버는 계속 실행)
+        # job_scheduler.add_job("ai_monitoring.check", self._monitoring_tick, interval=60)
+        logger.info("AI 모니터링 작업 비활성화됨")
+
+    def _monitoring_tick(self):
+        """모델 성능/드리프트 점검 (작업 스케줄러가 1분마다 실행)"""
+        if not self.monitoring_active:
+            return
+        self._check_model_performance()
+        self._detect_model_drift()
+        self._send_performance_alerts()
 
     def log_prediction(self, model_name: str, prediction_data: Optional[Dict[str, Any]],
                        result: Optional[Dict[str, Any]], user_id: Optional[int] = None) -> str:
@@ -522,8 +518,8 @@ class AIMonitoringService:
             return {'error': f'임계값 업데이트 실패: {str(e)}'}
 
 
-# 전역 서비스 인스턴스
-ai_monitoring_service = AIMonitoringService()
+# 전역 서비스 인스턴스 (서비스 레지스트리가 첫 사용 시 생성)
+ai_monitoring_service = service_registry.register("ai.monitoring", AIMonitoringService)
 
 # API 엔드포인트들
 
@@ -13,6 +13,7 @@ import json
 import logging
 from flask_login import login_required, current_user
 from flask import Blueprint, request, jsonify, current_app
+from core.backend.service_registry import service_registry
 from typing import Optional
 query = None  # pyright: ignore
 config = None  # pyright: ignore
@@ -233,29 +234,21 @@ class AutomatedDecisionSystem:
 
     def _start_decision_engine(self):
         """의사결정 엔진 시작"""
-        def decision_engine():
-            while True:
-                try:
-                    # 새로운 데이터 확인
-                    self._check_for_decisions()
-
-                    # 대기 중인 액션 실행
-                    self._execute_pending_actions()
-
-                    # 완료된 의사결정 정리
-                    self._cleanup_completed_decisions()
+        # 자동화된 의사결정 엔진 비활성화됨 (서버는 계속 실행)
+        # 활성화 시 의사결정/액션 실행은 여러 워커 중 한 프로세스에서만 실행
+        # job_scheduler.add_job("automated_decision.engine", self._decision_tick, interval=30, singleton=True)
+        logger.info("자동화된 의사결정 엔진 비활성화됨")
 
-                    time.sleep(30)  # 30초마다 체크
+    def _decision_tick(self):
+        """의사결정 확인/실행 (작업 스케줄러가 30초마다 실행)"""
+        # 새로운 데이터 확인
+        self._check_for_decisions()
 
-                except Exception as e:
-                    logger.error(f"의사결정 엔진 오류: {e}")
-                    time.sleep(60)
+        # 대기 중인 액션 실행
+        self._execute_pending_actions()
 
-        import threading
-        # 자동화된 의사결정 엔진 비활성화됨 (서버는 계속 실행)
-        # thread = threading.Thread(target=decision_engine, daemon=True)
-        # thread.start()
-        logger.info("자동화된 의사결정 엔진 비활성화됨")
+        # 완료된 의사결정 정리
+        self._cleanup_completed_decisions()
 
     def _check_for_decisions(self):
         """의사결정 필요성 확인"""
@@ -1030,8 +1023,8 @@ class AutomatedDecisionSystem:
             return {'error': f'상태 조회 실패: {str(e)}'}
 
 
-# 전역 서비스 인스턴스
-automated_decision_service = AutomatedDecisionSystem()
+# 전역 서비스 인스턴스 (서비스 레지스트리가 첫 사용 시 생성)
+automated_decision_service = service_registry.register("ai.automated_decision", AutomatedDecisionSystem)
 
 # API 엔드포인트들
 
@@ -15,6 +15,7 @@ import json
 import logging
 from flask_login import login_required, current_user
 from flask import Blueprint, request, jsonify, current_app
+from core.backend.service_registry import service_registry
 """
 AI 기반 비즈니스 인텔리전스 시스템
 데이터 기반 인사이트 생성 및 자동화된 의사결정 지원
@@ -98,28 +99,12 @@ class BusinessIntelligenceService:
 
     def _start_insight_scheduler(self):
         """인사이트 생성 스케줄러 시작"""
-        def insight_scheduler():
-            while True:
-                try:
-                    # 매일 자정에 인사이트 생성
-                    now = datetime.now()
-                    if now.hour == 0 and now.minute == 0:
-                        self._generate_daily_insights()
-
-                    # 매시간 트렌드 분석
-                    if now.minute == 0:
-                        self._analyze_real_time_trends()
-
-                    time.sleep(60)  # 1분마다 체크
-
-                except Exception as e:
-                    logger.error(f"인사이트 스케줄러 오류: {e}")
-                    time.sleep(300)  # 5분 대기
-
         # 비즈니스 인사이트 스케줄러 비활성화됨 (서버는 계속 실행)
-        # import threading
-        # thread = threading.Thread(target=insight_scheduler, daemon=True)
-        # thread.start()
+        # 활성화 시 매일 자정 인사이트 생성, 매시간 트렌드 분석 (한 프로세스에서만 실행)
+        # job_scheduler.add_job("business_intelligence.daily_insights", self._generate_daily_insights,
+        #                       daily_at="00:00", singleton=True)
+        # job_scheduler.add_job("business_intelligence.trends", self._analyze_real_time_trends,
+        #                       interval=3600, singleton=True)
         logger.info("비즈니스 인사이트 스케줄러 비활성화됨")
 
     def generate_comprehensive_insights(self) -> Dict[str, Any]:
@@ -981,8 +966,8 @@ class BusinessIntelligenceService:
         }
 
 
-# 전역 서비스 인스턴스
-bi_service = BusinessIntelligenceService()
+# 전역 서비스 인스턴스 (서비스 레지스트리가 첫 사용 시 생성)
+bi_service = service_registry.register("ai.business_intelligence", BusinessIntelligenceService)
 
 # API 엔드포인트들
 
@@ -1,4 +1,5 @@
 from core.backend.plugin_monitoring_integration import PluginMonitoringIntegration  # pyright: ignore
+from core.backend.service_registry import service_registry
 from models_main import User, db
 from api.gateway import token_required, role_required, admin_required  # pyright: ignore
 from core.backend.enhanced_realtime_alerts import (  # pyright: ignore
@@ -28,9 +29,6 @@ logger = logging.getLogger(__name__)
 # Blueprint 생성
 enhanced_alerts_bp = Blueprint('enhanced_alerts', __name__, url_prefix='/api/enhanced-alerts')
 
-# 전역 알림 시스템 인스턴스
-alert_system = EnhancedRealtimeAlertSystem()
-
 # WebSocket 연결 관리
 connected_clients = {}
 
@@ -67,13 +65,19 @@ def alert_callback(alert):
         logger.error(f"알림 콜백 실행 실패: {e}")  # noqa
 
 
-# add_alert_callback 메서드가 EnhancedRealtimeAlertSystem에 없다는 린트 경고가 있습니다.
-# 실제로 해당 메서드가 존재한다면 무시해도 되지만, 만약 없다면 아래처럼 안전하게 hasattr로 체크 후 등록하세요.
-# 린트 경고를 방지하기 위해 pyright: ignore 주석을 추가합니다.
-if hasattr(alert_system, "add_alert_callback"):
-    alert_system.add_alert_callback(alert_callback)  # pyright: ignore
-else:
-    logger.warning("alert_system에 add_alert_callback 메서드가 없습니다.")  # noqa
+def _create_alert_system():
+    """알림 시스템 생성 (사이드카 DB를 열고 이벤트 버스를 구독하므로 첫 사용 시에만)"""
+    system = EnhancedRealtimeAlertSystem()
+    # add_alert_callback 메서드가 없는 구현도 있어 hasattr로 확인 후 등록
+    if hasattr(system, "add_alert_callback"):
+        system.add_alert_callback(alert_callback)  # pyright: ignore
+    else:
+        logger.warning("alert_system에 add_alert_callback 메서드가 없습니다.")  # noqa
+    return system
+
+
+# 전역 알림 시스템 인스턴스 (서비스 레지스트리가 첫 사용 시 생성)
+alert_system = service_registry.register("enhanced_alerts.alert_system", _create_alert_system)
 
 
 @enhanced_alerts_bp.route('/alerts', methods=['GET'])
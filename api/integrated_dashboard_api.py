@@ -8,17 +8,18 @@ from .advanced_analytics import get_realtime_dashboard  # pyright: ignore
 from .ai_integrated_api import IntegratedAIService  # pyright: ignore
 from .realtime_notifications import notification_manager  # pyright: ignore
 # from .realtime_monitoring import realtime_data, update_realtime_data  # pyright: ignore
-import queue
 import asyncio
 from collections import defaultdict
 from typing import Dict, List, Any, Optional, Tuple
 import time
-import threading
 import logging
-import json
 from datetime import datetime, timedelta
 from flask_login import login_required, current_user
 from flask import Blueprint, jsonify, request, Response, current_app
+
+from core.backend.job_scheduler import job_scheduler
+from core.backend.service_registry import service_registry
+from core.backend.sse_hub import SSEHub, format_event
 query = None  # pyright: ignore
 form = None  # pyright: ignore
 """
@@ -35,11 +36,17 @@ form = None  # pyright: ignore
 MEMORY_THRESHOLD = 80  # 메모리 사용률 임계값
 CACHE_CLEANUP_INTERVAL = 300  # 캐시 정리 간격 (5분)
 MAX_CACHE_SIZE = 1000  # 최대 캐시 항목 수
+DASHBOARD_MONITOR_JOB = "integrated_dashboard.monitor"
+DASHBOARD_TOPIC = "dashboard"  # SSE 업데이트 이벤트 버스 토픽
+MAX_STREAM_CONNECTIONS = 5000  # 상태 체크 기준 SSE 연결 수 (연결마다 스레드를 쓰지 않음)
 
 logger = logging.getLogger(__name__)
 
 integrated_dashboard_bp = Blueprint('integrated_dashboard', __name__)
 
+# SSE 구독자마다 링 버퍼를 두고 업데이트를 한 번 직렬화해 모두에게 전달
+dashboard_hub = SSEHub(DASHBOARD_TOPIC)
+
 
 class MemoryManager:
     """메모리 관리 클래스"""
@@ -108,8 +115,6 @@ class IntegratedDashboardService:
         self.plugin_monitor = PluginMonitoringDashboard()
         self.data_cache = {}
         self.cache_expiry = {}
-        self.active_connections = set()
-        self.data_queue = queue.Queue()
         self.monitoring_active = False
 
         # 성능 최적화 컴포넌트
@@ -125,49 +130,39 @@ class IntegratedDashboardService:
         # 통합 대시보드 모니터링 비활성화됨 (서버는 계속 실행)
         # if not self.monitoring_active:
         #     self.monitoring_active = True
-        #     self.monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-        #     self.monitor_thread.start()
+        #     job_scheduler.add_job(DASHBOARD_MONITOR_JOB, self._monitoring_tick, interval=10)
         logger.info("통합 대시보드 모니터링 비활성화됨")
 
     def stop_monitoring(self):
         """실시간 모니터링 중지"""
         self.monitoring_active = False
-        if hasattr(self, 'monitor_thread'):
-            self.monitor_thread.join(timeout=5)
+        job_scheduler.remove_job(DASHBOARD_MONITOR_JOB)
         logger.info("통합 대시보드 모니터링 중지")
 
-    def _monitoring_loop(self):
-        """실시간 모니터링 루프 (성능 최적화)"""
-        while self.monitoring_active:
-            try:
-                # 메모리 사용률 확인
-                memory_usage, is_critical = self.memory_manager.check_memory_usage()
-
-                if is_critical:
-                    logger.warning(f"메모리 사용률이 높습니다: {memory_usage}%")
-                    self.memory_manager.cleanup_memory()
-                    self._cleanup_cache()
-
-                # 정기 캐시 정리
-                if (datetime.now() - self.last_cleanup).total_seconds() > CACHE_CLEANUP_INTERVAL:
-                    self._cleanup_cache()
-                    self.last_cleanup = datetime.now()
+    def _monitoring_tick(self):
+        """실시간 데이터 갱신 (작업 스케줄러가 10초마다 실행)"""
+        # 메모리 사용률 확인
+        memory_usage, is_critical = self.memory_manager.check_memory_usage()
 
-                # 모든 실시간 데이터 수집 (병렬 처리)
-                dashboard_data = self._collect_all_data_parallel()
+        if is_critical:
+            logger.warning(f"메모리 사용률이 높습니다: {memory_usage}%")
+            self.memory_manager.cleanup_memory()
+            self._cleanup_cache()
 
-                # 캐시 업데이트
-                self.data_cache = dashboard_data
-                self.cache_expiry = datetime.now() + timedelta(seconds=30)
+        # 정기 캐시 정리
+        if (datetime.now() - self.last_cleanup).total_seconds() > CACHE_CLEANUP_INTERVAL:
+            self._cleanup_cache()
+            self.last_cleanup = datetime.now()
 
-                # 활성 연결에 데이터 브로드캐스트
-                self._broadcast_to_connections(dashboard_data)
+        # 모든 실시간 데이터 수집 (병렬 처리)
+        dashboard_data = self._collect_all_data_parallel()
 
-                time.sleep(10)  # 10초마다 업데이트
+        # 캐시 업데이트
+        self.data_cache = dashboard_data
+        self.cache_expiry = datetime.now() + timedelta(seconds=30)
 
-            except Exception as e:
-                logger.error(f"모니터링 루프 오류: {e}")
-                time.sleep(30)
+        # 활성 연결에 데이터 브로드캐스트
+        self._broadcast_to_connections(dashboard_data)
 
     def _collect_all_data_parallel(self) -> Dict[str, Any] if Dict is not None else None:
         """병렬 처리로 모든 실시간 데이터 수집"""
@@ -284,7 +279,7 @@ class IntegratedDashboardService:
                 'memory_usage': psutil.virtual_memory().percent,
                 'disk_usage': psutil.disk_usage('/').percent,
                 'network_io': self._get_network_io(),
-                'active_connections': len(self.active_connections),
+                'active_connections': dashboard_hub.subscriber_count(),
                 'uptime': self._get_uptime(),
                 'last_backup': '2024-01-15 14:30',  # 실제로는 백업 매니저에서 가져옴
                 'database_status': 'healthy',
@@ -398,7 +393,7 @@ class IntegratedDashboardService:
             return {
                 'recent_orders': recent_orders,
                 'recent_logins': recent_logins,
-                'active_sessions': len(self.active_connections),
+                'active_sessions': dashboard_hub.subscriber_count(),
                 'peak_hours': self._get_peak_hours()
             }
         except Exception as e:
@@ -460,16 +455,13 @@ class IntegratedDashboardService:
     def _broadcast_to_connections(self, data: Dict[str, Any] if Dict is not None else None):
         """활성 연결에 데이터 브로드캐스트"""
         try:
-            message = json.dumps({
+            # 이벤트 버스로 발행하면 모든 워커의 SSE 구독자에게 한 번씩 전달됨
+            dashboard_hub.publish({
                 'type': 'dashboard_update',
                 'data': data,
                 'timestamp': datetime.now().isoformat()
             })
 
-            # 실제 구현에서는 WebSocket이나 SSE를 통해 브로드캐스트
-            # 현재는 큐에 메시지 추가
-            self.data_queue.put(message)
-
         except Exception as e:
             logger.error(f"브로드캐스트 오류: {e}")
 
@@ -481,8 +473,8 @@ class IntegratedDashboardService:
             return self._collect_all_data()
 
 
-# 전역 서비스 인스턴스
-dashboard_service = IntegratedDashboardService()
+# 전역 서비스 인스턴스 (서비스 레지스트리가 첫 사용 시 생성)
+dashboard_service = service_registry.register("dashboard.integrated", IntegratedDashboardService)
 
 
 @integrated_dashboard_bp.route('/api/dashboard/integrated', methods=['GET'])
@@ -510,34 +502,30 @@ def get_integrated_dashboard():
 @integrated_dashboard_bp.route('/api/dashboard/stream')
 @login_required
 def dashboard_stream():
-    """Server-Sent Events를 통한 실시간 대시보드 스트림"""
-    def generate():
-        connection_id = str(time.time())
-        dashboard_service.active_connections.add(connection_id)
-
+    """
+    Server-Sent Events를 통한 실시간 대시보드 스트림
+    재연결 시 브라우저가 보내는 Last-Event-ID(또는 last_event_id 파라미터) 이후 업데이트를 재전송
+    """
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    app = current_app._get_current_object()
+
+    def initial(subscriber):
+        # 구독은 응답 본문이 시작될 때(첫 next) 하므로 요청 컨텍스트 밖에서 실행됨
+        if last_event_id:
+            return []
+        frames = [format_event({'type': 'connected', 'connection_id': str(id(subscriber))})]
         try:
-            # 연결 확인 메시지
-            yield f"data: {json.dumps({'type': 'connected', 'connection_id': connection_id})}\n\n"
-
-            # 초기 데이터 전송
-            initial_data = dashboard_service.get_cached_dashboard()
-            yield f"data: {json.dumps({'type': 'initial_data', 'data': initial_data})}\n\n"
-
-            # 실시간 업데이트 스트림
-            while True:
-                try:
-                    message = dashboard_service.data_queue.get(timeout=30)
-                    yield f"data: {message}\n\n"
-                except queue.Empty:
-                    yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': datetime.now().isoformat()})}\n\n"
-
+            with app.app_context():
+                frames.append(format_event({'type': 'initial_data', 'data': dashboard_service.get_cached_dashboard()}))
         except Exception as e:
-            logger.error(f"대시보드 스트림 오류: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-        finally:
-            dashboard_service.active_connections.discard(connection_id)
+            logger.error(f"대시보드 스트림 초기 데이터 오류: {e}")
+            frames.append(format_event({'type': 'error', 'message': str(e)}))
+        return frames
 
-    return Response(generate(), mimetype='text/event-stream')
+    response = Response(dashboard_hub.connect(last_event_id, initial), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # nginx 버퍼링 끔
+    return response
 
 
 @integrated_dashboard_bp.route('/api/dashboard/metrics', methods=['GET'])
@@ -638,7 +626,8 @@ def get_dashboard_performance():
             'performance': {
                 'memory': memory_info,
                 'cache': cache_stats,
-                'active_connections': len(dashboard_service.active_connections),
+                'active_connections': dashboard_hub.subscriber_count(),
+                'stream': dashboard_hub.get_stats(),
                 'cache_size': len(dashboard_service.data_cache),
                 'uptime': dashboard_service._get_uptime()
             },
@@ -662,7 +651,7 @@ def get_dashboard_health():
         memory_usage, is_critical = dashboard_service.memory_manager.check_memory_usage()
 
         # 연결 상태 확인
-        connection_health = len(dashboard_service.active_connections) < 100
+        connection_health = dashboard_hub.subscriber_count() < MAX_STREAM_CONNECTIONS
 
         # 캐시 상태 확인
         cache_health = len(dashboard_service.data_cache) < MAX_CACHE_SIZE
@@ -4,7 +4,7 @@ from utils.ml_manager import ml_manager  # pyright: ignore
 import os
 import sys
 from functools import wraps
-from flask_login import login_required, current_user
+from flask_login import login_required
 from flask import Blueprint, request, jsonify
 args = None  # pyright: ignore
 
@@ -59,7 +59,7 @@ def predict_sales():
 
     # 필수 필드 검증
     required_fields = ['day_of_week', 'month']
-    for field in required_fields if required_fields is not None:
+    for field in required_fields:
         if field not in data:
             return jsonify({"error": f"필수 필드가 누락되었습니다: {field}"}), 400
 
@@ -88,7 +88,7 @@ def predict_staff_needs():
 
     # 필수 필드 검증
     required_fields = ['expected_sales', 'day_of_week']
-    for field in required_fields if required_fields is not None:
+    for field in required_fields:
         if field not in data:
             return jsonify({"error": f"필수 필드가 누락되었습니다: {field}"}), 400
 
@@ -117,7 +117,7 @@ def predict_inventory_needs():
 
     # 필수 필드 검증
     required_fields = ['current_stock', 'daily_usage']
-    for field in required_fields if required_fields is not None:
+    for field in required_fields:
         if field not in data:
             return jsonify({"error": f"필수 필드가 누락되었습니다: {field}"}), 400
 
@@ -144,7 +144,7 @@ def train_sales_model():
     if not data or 'training_data' not in data:
         return jsonify({"error": "훈련 데이터가 없습니다."}), 400
 
-    training_data = data['training_data'] if data is not None else None
+    training_data = data['training_data']
 
     if not isinstance(training_data, list) or len(training_data) < 10:
         return jsonify({"error": "최소 10개의 훈련 데이터가 필요합니다."}), 400
@@ -173,7 +173,7 @@ def train_staff_model():
     if not data or 'training_data' not in data:
         return jsonify({"error": "훈련 데이터가 없습니다."}), 400
 
-    training_data = data['training_data'] if data is not None else None
+    training_data = data['training_data']
 
     if not isinstance(training_data, list) or len(training_data) < 10:
         return jsonify({"error": "최소 10개의 훈련 데이터가 필요합니다."}), 400
@@ -196,31 +196,9 @@ def train_staff_model():
 @admin_required
 @handle_ml_error
 def delete_model(model_name):
-    """모델 삭제"""
+    """모델 삭제 (모든 버전)"""
     try:
-        import os
-        model_path = os.path.join(ml_manager.models_dir, f"{model_name}.joblib")
-
-        if os.path.exists(model_path):
-            os.remove(model_path)
-
-            # 관련 파일들도 삭제
-            scaler_path = os.path.join(ml_manager.models_dir, f"{model_name}_scaler.joblib")
-            metadata_path = os.path.join(ml_manager.models_dir, f"{model_name}_metadata.json")
-
-            if os.path.exists(scaler_path):
-                os.remove(scaler_path)
-            if os.path.exists(metadata_path):
-                os.remove(metadata_path)
-
-            # 메모리에서도 제거
-            if model_name in ml_manager.models:
-                del ml_manager.models[model_name] if models is not None else None
-            if model_name in ml_manager.scalers:
-                del ml_manager.scalers[model_name] if scalers is not None else None
-            if model_name in ml_manager.model_metadata:
-                del ml_manager.model_metadata[model_name] if model_metadata is not None else None
-
+        if ml_manager.delete_model(model_name):
             return jsonify({
                 "success": True,
                 "message": f"모델 '{model_name}'이 삭제되었습니다."
@@ -243,13 +221,50 @@ def get_model_info(model_name):
     if not model:
         return jsonify({"error": f"모델 '{model_name}'을 찾을 수 없습니다."}), 404
 
-    metadata = ml_manager.model_metadata.get() if model_metadata else Nonemodel_name, {}) if model_metadata else None
+    metadata = ml_manager.model_metadata.get(model_name, {})
 
     return jsonify({
         "success": True,
         "model_name": model_name,
         "model_type": type(model).__name__,
-        "metadata": metadata
+        "metadata": metadata,
+        "versions": ml_manager.registry.versions(model_name),
+        "current_version": ml_manager.registry.current_version(model_name)
+    })
+
+
+# 배치 예측 종류 -> 모델 이름
+PREDICTION_MODELS = {
+    'sales': 'sales_prediction',
+    'staff': 'staff_prediction',
+    'inventory': 'inventory_prediction',
+}
+
+
+@ml_api.route('/predict/<prediction_type>/many', methods=['POST'])
+@login_required
+@manager_required
+@handle_ml_error
+def predict_many(prediction_type):
+    """같은 종류의 여러 입력을 한 번에 예측 ({"items": [특성, ...]})"""
+    model_name = PREDICTION_MODELS.get(prediction_type)
+    if not model_name:
+        return jsonify({"error": f"지원하지 않는 예측 타입: {prediction_type}"}), 400
+
+    data = request.get_json()
+    items = data.get('items') if data else None
+    if not isinstance(items, list) or not items:
+        return jsonify({"error": "예측할 입력 목록(items)이 없습니다."}), 400
+    if len(items) > 1000:
+        return jsonify({"error": "한 번에 최대 1000건까지 예측할 수 있습니다."}), 400
+
+    predictions = ml_manager.predict_many(model_name, items)
+    if all("error" in prediction for prediction in predictions):
+        return jsonify(predictions[0]), 400
+
+    return jsonify({
+        "success": True,
+        "predictions": predictions
     })
 
 
@@ -264,21 +279,21 @@ def batch_predict():
     if not data or 'predictions' not in data:
         return jsonify({"error": "예측 요청 데이터가 없습니다."}), 400
 
-    predictions = data['predictions'] if data is not None else None
+    predictions = data['predictions']
     results = {}
 
     for pred_type, pred_data in predictions.items() if predictions is not None else []:
         try:
             if pred_type == 'sales':
-                results[pred_type] if results is not None else None = ml_manager.predict_sales(pred_data)
+                results[pred_type] = ml_manager.predict_sales(pred_data)
             elif pred_type == 'staff':
-                results[pred_type] if results is not None else None = ml_manager.predict_staff_needs(pred_data)
+                results[pred_type] = ml_manager.predict_staff_needs(pred_data)
             elif pred_type == 'inventory':
-                results[pred_type] if results is not None else None = ml_manager.predict_inventory_needs(pred_data)
+                results[pred_type] = ml_manager.predict_inventory_needs(pred_data)
             else:
-                results[pred_type] if results is not None else None = {"error": f"지원하지 않는 예측 타입: {pred_type}"}
+                results[pred_type] = {"error": f"지원하지 않는 예측 타입: {pred_type}"}
         except Exception as e:
-            results[pred_type] if results is not None else None = {"error": f"예측 실패: {str(e)}"}
+            results[pred_type] = {"error": f"예측 실패: {str(e)}"}
 
     return jsonify({
         "success": True,
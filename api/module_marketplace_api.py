@@ -21,51 +21,76 @@ logger = logging.getLogger(__name__)
 module_marketplace_api_bp = Blueprint('module_marketplace_api', __name__, url_prefix='/api/marketplace')
 
 
+_marketplace_system = None
+
+
+def _get_marketplace_system():
+    """카탈로그 인덱스를 요청 간에 재사용하도록 마켓플레이스 시스템을 한 번만 생성"""
+    global _marketplace_system
+    if _marketplace_system is None:
+        from core.backend.module_marketplace_system import ModuleMarketplaceSystem
+        _marketplace_system = ModuleMarketplaceSystem()
+    return _marketplace_system
+
+
 @module_marketplace_api_bp.route('/modules')
 @login_required
 def get_available_modules():
-    """사용 가능한 모듈 목록 조회"""
+    """사용 가능한 모듈 목록 조회 (category, search, sort_by, sort_order, cursor, limit)"""
     try:
-        # 마켓플레이스 모듈 목록 조회
-        with open('marketplace/modules.json', 'r', encoding='utf-8') as f:
-            modules = json.load(f)
+        limit = request.args.get('limit', type=int)
 
-        # 사용자 권한에 따른 필터링
+        # 사용자 권한에 따른 필터링은 카탈로그 인덱스의 권한 레벨 묶음으로 처리
         user_role = current_user.role
         user_branch_id = getattr(current_user, 'branch_id', None)
         user_brand_id = getattr(current_user, 'brand_id', None)
 
+        try:
+            items, next_cursor, total = _get_marketplace_system().catalog.search(
+                {
+                    'hierarchy_level': user_role or '',
+                    'category': request.args.get('category'),
+                },
+                request.args.get('search'),
+                sort_by=request.args.get('sort_by'),
+                sort_order=request.args.get('sort_order', 'desc'),
+                cursor=request.args.get('cursor'),
+                limit=limit,
+            )
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+
+        # 설치 상태는 지점/브랜드 단위 설치 목록을 한 번만 조회
+        if user_branch_id:
+            installations = module_installation_system.get_installations('branch', user_branch_id)
+        elif user_brand_id:
+            installations = module_installation_system.get_installations('brand', user_brand_id)
+        else:
+            installations = []
+        installations_by_module = {}
+        for installation in installations:
+            # 최신 설치 정보 우선 (created_at 내림차순)
+            installations_by_module.setdefault(installation['module_id'], installation)
+
         filtered_modules = []
-        for module_id, module_info in modules.items():
-            # 권한 확인
-            hierarchy_levels = module_info.get('hierarchy_levels', {}) if module_info else {}
-            if user_role in hierarchy_levels:
-                # 설치 상태 확인
-                if user_branch_id:
-                    installation = module_installation_system.get_installation(
-                        module_id, 'branch', user_branch_id
-                    )
-                elif user_brand_id:
-                    installation = module_installation_system.get_installation(
-                        module_id, 'brand', user_brand_id
-                    )
-                else:
-                    installation = None
-
-                module_info['installation_status'] = installation['status'] if installation else None
-                module_info['can_install'] = True
-                module_info['can_activate'] = installation and installation['status'] == 'installed'
-                module_info['can_deactivate'] = installation and installation['status'] == 'activated'
-                module_info['can_uninstall'] = installation and installation['status'] != 'activated'
-
-                filtered_modules.append({
-                    'id': module_id,
-                    **module_info
-                })
+        for module_id, module_info in items:
+            installation = installations_by_module.get(module_id)
+            module_info['installation_status'] = installation['status'] if installation else None
+            module_info['can_install'] = True
+            module_info['can_activate'] = installation and installation['status'] == 'installed'
+            module_info['can_deactivate'] = installation and installation['status'] == 'activated'
+            module_info['can_uninstall'] = installation and installation['status'] != 'activated'
+
+            filtered_modules.append({
+                'id': module_id,
+                **module_info
+            })
 
         return jsonify({
             "success": True,
-            "data": filtered_modules
+            "data": filtered_modules,
+            "next_cursor": next_cursor,
+            "total": total
         })
 
     except Exception as e:
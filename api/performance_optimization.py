@@ -1,5 +1,4 @@
 import weakref
-import threading
 from flask import current_app, g, request
 from sqlalchemy.orm import Session  # pyright: ignore
 from sqlalchemy import text
@@ -14,6 +13,8 @@ import gc
 import asyncio
 from flask import current_app
 from flask import request
+
+from core.backend.job_scheduler import job_scheduler
 args = None  # pyright: ignore
 query = None  # pyright: ignore
 config = None  # pyright: ignore
@@ -194,13 +195,8 @@ class PerformanceOptimizer:
 
     def _schedule_memory_cleanup(self):
         """주기적 메모리 정리 스케줄링"""
-        def cleanup():
-            while True:
-                time.sleep(300)  # 5분마다
-                self.memory_optimization()
-
-        cleanup_thread = threading.Thread(target=cleanup, daemon=True)
-        cleanup_thread.start()
+        # 프로세스마다 자기 메모리를 정리하므로 singleton 아님
+        job_scheduler.add_job("performance_optimizer.memory_cleanup", self.memory_optimization, interval=300)
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """성능 통계 반환"""
@@ -10,6 +10,8 @@ import json
 from flask_login import login_required, current_user
 from flask import Blueprint, request, jsonify, current_app
 from typing import Optional
+
+from core.backend.document_store import get_document_store
 args = None  # pyright: ignore
 config = None  # pyright: ignore
 form = None  # pyright: ignore
@@ -28,6 +30,12 @@ class PluginSettingsManager:
         for directory in [self.settings_dir, self.backup_dir, self.templates_dir]:
             os.makedirs(directory, exist_ok=True)
 
+        # 플러그인별 설정/메타데이터는 플러그인 이름 키 컬렉션에 저장
+        # (예전 <플러그인>_settings.json / <플러그인>_metadata.json 파일은 처음 읽을 때 옮김)
+        store = get_document_store(self.settings_dir)
+        self.settings = store.collection("settings.json", layout="dict")
+        self.metadata = store.collection("metadata.json", layout="dict")
+
     def get_plugin_settings_path(self,  plugin_name: str) -> str:
         """플러그인 설정 파일 경로 반환"""
         return os.path.join(self.settings_dir, f"{plugin_name}_settings.json")
@@ -45,20 +53,23 @@ class PluginSettingsManager:
 
     def load_settings(self, plugin_name: str) -> Dict[str, Any]:
         """플러그인 설정 로드"""
-        settings_path = self.get_plugin_settings_path(plugin_name)
+        settings = self.settings.get(plugin_name)
+        if settings is not None:
+            return settings
 
+        settings_path = self.get_plugin_settings_path(plugin_name)
         if os.path.exists(settings_path):
             try:
                 with open(settings_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    settings = json.load(f)
             except Exception as e:
                 current_app.logger.error(f"설정 파일 로드 실패: {e}")
                 return {}
         else:
             # 기본 설정 생성
-            default_settings = self.get_default_settings(plugin_name)
-            self.save_settings(plugin_name,  default_settings)
-            return default_settings
+            settings = self.get_default_settings(plugin_name)
+        self.settings.put(settings, key=plugin_name)
+        return settings
 
     def save_settings(self,  plugin_name: str,  settings: Dict[str,  Any]) -> bool:
         """플러그인 설정 저장"""
@@ -71,9 +82,7 @@ class PluginSettingsManager:
             self.create_backup(plugin_name)
 
             # 설정 저장
-            settings_path = self.get_plugin_settings_path(plugin_name)
-            with open(settings_path, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            self.settings.put(settings, key=plugin_name)
 
             # 설정 메타데이터 업데이트
             self.update_settings_metadata(plugin_name,  settings)
@@ -192,8 +201,6 @@ class PluginSettingsManager:
 
     def update_settings_metadata(self,  plugin_name: str,  settings: Dict[str,  Any]) -> None:
         """설정 메타데이터 업데이트"""
-        metadata_path = os.path.join(self.settings_dir, f"{plugin_name}_metadata.json")
-
         metadata = {
             'last_modified': datetime.now().isoformat(),
             'modified_by': getattr(current_user, 'username', 'system'),
@@ -202,13 +209,16 @@ class PluginSettingsManager:
         }
 
         try:
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            self.metadata.put(metadata, key=plugin_name)
         except Exception as e:
             current_app.logger.error(f"메타데이터 업데이트 실패: {e}")
 
     def get_settings_metadata(self, plugin_name: str) -> Dict[str, Any]:
         """설정 메타데이터 조회"""
+        metadata = self.metadata.get(plugin_name)
+        if metadata is not None:
+            return metadata
+
         metadata_path = os.path.join(self.settings_dir, f"{plugin_name}_metadata.json")
 
         if os.path.exists(metadata_path):
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 import logging
 import uuid
 import json
+import queue
 from functools import wraps
 from flask_login import login_required, current_user
 from flask import Blueprint, jsonify, request, Response
@@ -260,36 +261,57 @@ def mark_notification_read(notification_id):
 @login_required
 def notification_sse():
     """Server-Sent Events를 통한 실시간 알림 스트림 (개선된 포맷)"""
+    user_id = str(current_user.id)
+    # 재연결 시 브라우저가 보내는 마지막 이벤트 ID (놓친 알림 재전송용)
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    is_admin = current_user.role in ['admin', 'super_admin']
+
     def generate():
-        user_id = str(current_user.id)
         connection_id = str(uuid.uuid4())
+        pending = queue.Queue(maxsize=100)
+
+        def enqueue(message):
+            try:
+                pending.put_nowait(message)
+            except queue.Full:
+                logger.warning(f"SSE 연결 {connection_id} 대기 알림 초과, 알림 버림")
 
         # 연결 등록
         notification_manager.register_connection(connection_id, user_id)
+        notification_manager.register_notification_handler(connection_id, enqueue)
 
         # 기본 채널 구독
         default_channels = ['system', 'user']
-        if current_user.role in ['admin', 'super_admin']:
+        if is_admin:
             default_channels.append('admin')
 
         for channel_id in default_channels:
             notification_manager.subscribe_user(user_id, channel_id)
 
+        def event(message):
+            event_id = message.get('event_id')
+            prefix = f"id: {event_id}\n" if event_id else ""
+            return f"{prefix}data: {json.dumps({**message, 'success': True}, default=str)}\n\n"
+
         try:
             # SSE 헤더 전송 (개선된 포맷)
             yield f"data: {json.dumps({'type': 'connected', 'connection_id': connection_id, 'success': True})}\n\n"
 
-            # 연결 유지
-            while True:
-                # 하트비트 전송 (30초마다)
-                yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': datetime.utcnow().isoformat(), 'success': True})}\n\n"
+            # 놓친 알림 재전송 (at-least-once, 클라이언트는 event_id로 중복 제거)
+            if last_event_id:
+                for message in notification_manager.get_missed_notifications(user_id, last_event_id):
+                    yield event(message)
 
-                # 실제 구현에서는 WebSocket이나 더 효율적인 방법 사용
-                import time
-                time.sleep(30)
+            # 연결 유지: 알림이 오면 바로 전송, 30초 동안 없으면 하트비트
+            while True:
+                try:
+                    yield event(pending.get(timeout=30))
+                except queue.Empty:
+                    yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': datetime.utcnow().isoformat(), 'success': True})}\n\n"
 
         except GeneratorExit:
             # 연결 종료 시 정리
+            notification_manager.unregister_notification_handler(connection_id)
             notification_manager.unregister_connection(connection_id)
             for channel_id in default_channels:
                 notification_manager.unsubscribe_user(user_id, channel_id)
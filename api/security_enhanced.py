@@ -6,6 +6,8 @@ import re
 import html
 import uuid
 
+from core.backend.rate_limiter import get_rate_limiter
+
 security_bp = Blueprint('security_enhanced', __name__, url_prefix='/api/security')
 
 # 간단한 설정
@@ -14,19 +16,9 @@ JWT_EXPIRATION = 3600
 RATE_LIMIT = 100
 WINDOW_SECONDS = 60
 
-# 메모리 기반 레이트리밋
-rate_limit_data = {}
-
+# 레이트리밋 (워커 간 공유, Redis 없으면 프로세스 내 토큰 버킷)
 def rate_limiter(ip):
-    now = datetime.utcnow()
-    info = rate_limit_data.get(ip)
-    if not info or (now - info['start']).total_seconds() > WINDOW_SECONDS:
-        rate_limit_data[ip] = {'count': 1, 'start': now}
-        return True
-    if info['count'] >= RATE_LIMIT:
-        return False
-    info['count'] += 1
-    return True
+    return get_rate_limiter().hit(f"ip:{ip}", RATE_LIMIT, WINDOW_SECONDS).allowed
 
 def validate_input(data):
     if isinstance(data, str):
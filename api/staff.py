@@ -3,7 +3,9 @@ from werkzeug.utils import secure_filename  # pyright: ignore
 import json
 import os
 from models_main import db, Staff, Contract, HealthCertificate, Notification, User, ApproveLog
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import joinedload, selectinload
+from core.backend.catalog_index import decode_cursor, encode_cursor
 from datetime import datetime, timedelta
 from flask_login import login_required, current_user
 args = None  # pyright: ignore
@@ -17,6 +19,10 @@ staff_bp = Blueprint('staff', __name__)
 ALLOWED_EXTENSIONS = {'pdf', 'png', 'jpg', 'jpeg', 'gif'}
 UPLOAD_FOLDER = 'uploads'
 
+# 직원 목록 페이지 크기
+STAFF_PAGE_SIZE = 50
+STAFF_PAGE_SIZE_MAX = 200
+
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -45,10 +51,120 @@ def save_file(file,  folder):
     return None
 
 
+def _contract_dict(contract):
+    return {
+        'id': contract.id,
+        'contract_number': contract.contract_number,
+        'start_date': contract.start_date.strftime('%Y-%m-%d') if contract.start_date else None,
+        'expiry_date': contract.expiry_date.strftime('%Y-%m-%d') if contract.expiry_date else None,
+        'renewal_date': contract.renewal_date.strftime('%Y-%m-%d') if contract.renewal_date else None,
+        'contract_type': contract.contract_type,
+        'salary_amount': contract.salary_amount,
+        'is_expiring_soon': contract.is_expiring_soon if hasattr(contract, 'is_expiring_soon') else False,
+        'is_expired': contract.is_expired if hasattr(contract, 'is_expired') else False,
+        'days_until_expiry': contract.days_until_expiry if hasattr(contract, 'days_until_expiry') else 0,
+        'file_path': contract.file_path,
+        'file_name': contract.file_name,
+        'file_size': contract.file_size
+    }
+
+
+def _health_certificate_dict(cert):
+    return {
+        'id': cert.id,
+        'certificate_number': cert.certificate_number,
+        'issue_date': cert.issue_date.strftime('%Y-%m-%d') if cert.issue_date else None,
+        'expiry_date': cert.expiry_date.strftime('%Y-%m-%d') if cert.expiry_date else None,
+        'renewal_date': cert.renewal_date.strftime('%Y-%m-%d') if cert.renewal_date else None,
+        'issuing_authority': cert.issuing_authority,
+        'certificate_type': cert.certificate_type,
+        'is_expiring_soon': cert.is_expiring_soon if hasattr(cert, 'is_expiring_soon') else False,
+        'is_expired': cert.is_expired if hasattr(cert, 'is_expired') else False,
+        'days_until_expiry': cert.days_until_expiry if hasattr(cert, 'days_until_expiry') else 0,
+        'file_path': cert.file_path,
+        'file_name': cert.file_name,
+        'file_size': cert.file_size
+    }
+
+
+def _staff_list_query():
+    """목록/통계가 같이 쓰는 직원 조회 조건 (검색, 부서, 상태, 매장 필터를 DB에서 적용)"""
+    search = request.args.get('search', '').strip()
+    department = request.args.get('department', '').strip()
+    status = request.args.get('status', '').strip()
+    include_pending = request.args.get('include_pending', 'false').lower() == 'true'
+    page_type = request.args.get('page_type', 'all')  # 'all', 'attendance', 'schedule', 'management'
+
+    query = User.query.filter(User.role.in_(['employee', 'manager']))
+
+    # page_type에 따른 필터링: 직원 관리는 모든 상태(pending 포함), 나머지는 승인된 직원만
+    if status:
+        query = query.filter(User.status == status)
+    elif page_type != 'management':
+        statuses = ['approved', 'active'] + (['pending'] if include_pending else [])
+        query = query.filter(User.status.in_(statuses))
+
+    if search:
+        query = query.filter(
+            or_(
+                User.username.contains(search),
+                User.name.contains(search),
+                User.email.contains(search),
+                User.phone.contains(search)
+            )
+        )
+
+    if department:
+        query = query.filter(User.department == department)
+
+    # 매장별 필터링 (관리자가 아닌 경우)
+    if current_user.is_authenticated and not current_user.is_admin():
+        query = query.filter(
+            or_(
+                User.branch_id == None,
+                User.branch_id == current_user.branch_id
+            )
+        )
+    return query
+
+
+def _staff_stats(query):
+    """상태/부서별 인원을 GROUP BY 한 번으로 집계"""
+    profile = (
+        db.session.query(Staff.user_id, func.min(Staff.id).label('staff_id'))
+        .group_by(Staff.user_id)
+        .subquery()
+    )
+    department = func.coalesce(Staff.department, User.department, '미지정')
+    rows = (
+        query.outerjoin(profile, profile.c.user_id == User.id)
+        .outerjoin(Staff, Staff.id == profile.c.staff_id)
+        .with_entities(func.coalesce(User.status, 'active'), department, func.count(User.id))
+        .group_by(func.coalesce(User.status, 'active'), department)
+        .all()
+    )
+    stats = {'total': 0, 'active': 0, 'pending': 0, 'inactive': 0, 'departments': {}}
+    for status, dept, count in rows:
+        stats['total'] += count
+        if status in ('active', 'approved'):
+            stats['active'] += count
+        elif status == 'pending':
+            stats['pending'] += count
+        else:
+            stats['inactive'] += count
+        stats['departments'][dept] = stats['departments'].get(dept, 0) + count
+    return stats
+
+
 @staff_bp.route('/staff', methods=['GET'])
 # @login_required  # 임시로 인증 우회 (테스트용)
 def get_staff_list():
-    """통합 직원 목록 조회 API - 모든 페이지에서 사용"""
+    """
+    통합 직원 목록 조회 API - 모든 페이지에서 사용
+    (이름, id) 키셋 페이지네이션: limit개씩, 응답의 next_cursor를 cursor로 넘기면 다음 페이지.
+    limit/cursor를 모두 생략하면 기존 호출부(일정/직원 페이지)가 쓰는 전체 목록을 한 번에 반환.
+    직원 수와 관계없이 목록 1회 + 프로필/계약서/보건증 selectinload 각 1회 (+ 첫 페이지 통계 1회)
+    """
     try:
         # 권한 확인 (인증되지 않은 사용자 처리)
         if current_user.is_authenticated:
@@ -58,102 +174,42 @@ def get_staff_list():
         else:
             current_app.logger.info("인증되지 않은 사용자 접근 - 테스트 모드")
 
-        # 검색 파라미터
-        search = request.args.get('search', '') if args else None
-        department = request.args.get('department', '') if args else None
-        status = request.args.get('status', '') if args else None
-        include_pending = request.args.get('include_pending', 'false').lower() if args else None == 'true'
-        page_type = request.args.get('page_type', 'all') if args else None  # 'all', 'attendance', 'schedule', 'management'
-
-        # User 테이블에서 직원 데이터 조회
-        query = User.query.filter(User.role.in_(['employee', 'manager']))
-
-        # page_type에 따른 필터링
-        if page_type == 'attendance':
-            # 근태 관리: 승인된 직원만
-            query = query.filter(User.status.in_(['approved', 'active']))
-        elif page_type == 'schedule':
-            # 스케줄 관리: 승인된 직원만
-            query = query.filter(User.status.in_(['approved', 'active']))
-        elif page_type == 'management':
-            # 직원 관리: 모든 상태 (pending 포함)
-            pass  # 필터링 없음
-        else:
-            # 기본값: 승인된 직원만
-            query = query.filter(User.status.in_(['approved', 'active']))
-
-        # 검색 필터 적용
-        if search:
-            query = query.filter(
-                or_(
-                    User.username.contains(search),
-                    User.name.contains(search),
-                    User.email.contains(search),
-                    User.phone.contains(search)
-                )
-            )
-
-        if department:
-            query = query.filter(User.department == department)
-
-        # 매장별 필터링 (관리자가 아닌 경우)
-        if current_user.is_authenticated and not current_user.is_admin():
-            query = query.filter(
-                or_(
-                    User.branch_id == None,
-                    User.branch_id == current_user.branch_id
-                )
+        cursor = request.args.get('cursor')
+        limit = None
+        if cursor or 'limit' in request.args:
+            limit = min(max(request.args.get('limit', STAFF_PAGE_SIZE, type=int), 1), STAFF_PAGE_SIZE_MAX)
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        query = _staff_list_query()
+        sort_name = func.coalesce(User.name, '')
+        page_query = query
+        if after is not None:
+            name, user_id = after
+            page_query = page_query.filter(
+                or_(sort_name > str(name), and_(sort_name == str(name), User.id > user_id))
             )
-
-        users = query.order_by(User.name).all()
+        page_query = page_query.options(
+            joinedload(User.branch),
+            selectinload(User.staff_profile).selectinload(Staff.contracts),
+            selectinload(User.staff_profile).selectinload(Staff.health_certificates),
+        ).order_by(sort_name, User.id)
+        if limit is not None:
+            page_query = page_query.limit(limit + 1)
+        users = page_query.all()
+        has_more = limit is not None and len(users) > limit
+        if has_more:
+            users = users[:limit]
 
         # 통합된 직원 데이터 구성
         staff_data = []
         for user in users:
-            # Staff 테이블에서 추가 정보 조회
-            staff_profile = Staff.query.filter_by(user_id=user.id).first()
-
-            # 계약서 정보 조회
-            contracts = []
-            if staff_profile:
-                contract_list = Contract.query.filter_by(staff_id=staff_profile.id).all()
-                for contract in contract_list:
-                    contracts.append({
-                        'id': contract.id,
-                        'contract_number': contract.contract_number,
-                        'start_date': contract.start_date.strftime('%Y-%m-%d') if contract.start_date else None,
-                        'expiry_date': contract.expiry_date.strftime('%Y-%m-%d') if contract.expiry_date else None,
-                        'renewal_date': contract.renewal_date.strftime('%Y-%m-%d') if contract.renewal_date else None,
-                        'contract_type': contract.contract_type,
-                        'salary_amount': contract.salary_amount,
-                        'is_expiring_soon': contract.is_expiring_soon if hasattr(contract, 'is_expiring_soon') else False,
-                        'is_expired': contract.is_expired if hasattr(contract, 'is_expired') else False,
-                        'days_until_expiry': contract.days_until_expiry if hasattr(contract, 'days_until_expiry') else 0,
-                        'file_path': contract.file_path,
-                        'file_name': contract.file_name,
-                        'file_size': contract.file_size
-                    })
-
-            # 보건증 정보 조회
-            health_certificates = []
-            if staff_profile:
-                health_certs = HealthCertificate.query.filter_by(staff_id=staff_profile.id).all()
-                for cert in health_certs:
-                    health_certificates.append({
-                        'id': cert.id,
-                        'certificate_number': cert.certificate_number,
-                        'issue_date': cert.issue_date.strftime('%Y-%m-%d') if cert.issue_date else None,
-                        'expiry_date': cert.expiry_date.strftime('%Y-%m-%d') if cert.expiry_date else None,
-                        'renewal_date': cert.renewal_date.strftime('%Y-%m-%d') if cert.renewal_date else None,
-                        'issuing_authority': cert.issuing_authority,
-                        'certificate_type': cert.certificate_type,
-                        'is_expiring_soon': cert.is_expiring_soon if hasattr(cert, 'is_expiring_soon') else False,
-                        'is_expired': cert.is_expired if hasattr(cert, 'is_expired') else False,
-                        'days_until_expiry': cert.days_until_expiry if hasattr(cert, 'days_until_expiry') else 0,
-                        'file_path': cert.file_path,
-                        'file_name': cert.file_name,
-                        'file_size': cert.file_size
-                    })
+            # Staff 프로필이 여러 개면 먼저 만든 것 사용
+            staff_profile = min(user.staff_profile, key=lambda s: s.id) if user.staff_profile else None
+            contracts = sorted(staff_profile.contracts, key=lambda c: c.id) if staff_profile else []
+            health_certs = sorted(staff_profile.health_certificates, key=lambda c: c.id) if staff_profile else []
 
             # 통합된 직원 정보
             staff_info = {
@@ -171,8 +227,15 @@ def get_staff_list():
                 'branch_id': user.branch_id,
                 'branch_name': user.branch.name if user.branch else None,
                 'salary': staff_profile.salary if staff_profile else None,
-                'contracts': contracts,
-                'health_certificates': health_certificates,
+                'contracts': [_contract_dict(c) for c in contracts],
+                'health_certificates': [_health_certificate_dict(c) for c in health_certs],
+                'latest_contract': (
+                    _contract_dict(max(contracts, key=lambda c: (c.start_date, c.id))) if contracts else None
+                ),
+                'latest_health_certificate': (
+                    _health_certificate_dict(max(health_certs, key=lambda c: (c.issue_date, c.id)))
+                    if health_certs else None
+                ),
                 'permissions': user.permissions or {},
                 'created_at': user.created_at.strftime('%Y-%m-%d %H:%M:%S') if user.created_at else None,
                 'updated_at': user.updated_at.strftime('%Y-%m-%d %H:%M:%S') if user.updated_at else None
@@ -180,31 +243,20 @@ def get_staff_list():
 
             staff_data.append(staff_info)
 
-        # 통계 정보 계산
-        total_count = len(staff_data)
-        active_count = len([s for s in staff_data if s['status'] in ['active', 'approved']])
-        pending_count = len([s for s in staff_data if s['status'] == 'pending'])
-        inactive_count = total_count - active_count - pending_count
+        next_cursor = None
+        if has_more and users:
+            last = users[-1]
+            next_cursor = encode_cursor(last.name or '', last.id)
 
-        # 부서별 통계
-        department_stats = {}
-        for staff in staff_data:
-            dept = staff['department']
-            if dept not in department_stats:
-                department_stats[dept] = 0
-            department_stats[dept] += 1
-
-        return jsonify({
+        response = {
             'success': True,
             'staff': staff_data,
-            'stats': {
-                'total': total_count,
-                'active': active_count,
-                'pending': pending_count,
-                'inactive': inactive_count,
-                'departments': department_stats
-            }
-        })
+            'pagination': {'limit': limit, 'next_cursor': next_cursor, 'has_more': has_more},
+        }
+        # 통계는 필터 전체 기준이라 첫 페이지에서만 계산
+        if after is None:
+            response['stats'] = _staff_stats(query)
+        return jsonify(response)
 
     except Exception as e:
         current_app.logger.error(f"직원 목록 조회 오류: {str(e)}")
@@ -8,11 +8,12 @@ import redis
 import psutil
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime, timedelta
-import threading
 import time
 import logging
 import json
 from flask import request
+
+from core.backend.job_scheduler import job_scheduler
 config = None  # pyright: ignore
 form = None  # pyright: ignore
 """
@@ -78,24 +79,22 @@ class SystemMonitorAdvanced:
 
         self.monitoring_active = True
 
-        # 시스템 메트릭 수집 스레드
-        metrics_thread = threading.Thread(target=self._collect_system_metrics, daemon=True)
-        metrics_thread.start()
-
-        # 장애 감지 스레드
-        detection_thread = threading.Thread(target=self._detect_anomalies, daemon=True)
-        detection_thread.start()
+        # 시스템 메트릭 수집 (프로세스별)
+        job_scheduler.add_job("system_monitor.metrics", self._collect_system_metrics, interval=30)
 
-        # 자동 복구 스레드
+        # 장애 감지/자동 복구 (여러 워커 중 한 프로세스에서만 실행)
+        job_scheduler.add_job("system_monitor.anomalies", self._detect_anomalies, interval=60, singleton=True)
         if self.auto_recovery_enabled:
-            recovery_thread = threading.Thread(target=self._auto_recovery_loop, daemon=True)
-            recovery_thread.start()
+            job_scheduler.add_job("system_monitor.recovery", self._execute_recovery_actions,
+                                  interval=300, singleton=True)
 
         logger.info("고도화된 시스템 모니터링 시작됨")
 
     def stop_monitoring(self):
         """모니터링 중지"""
         self.monitoring_active = False
+        for name in ("system_monitor.metrics", "system_monitor.anomalies", "system_monitor.recovery"):
+            job_scheduler.remove_job(name)
         logger.info("시스템 모니터링 중지됨")
 
     def set_alert_threshold(self, metric: str, threshold: float):
@@ -281,67 +280,38 @@ class SystemMonitorAdvanced:
             return {'error': str(e)}
 
     def _collect_system_metrics(self):
-        """시스템 메트릭 수집 루프"""
-        while self.monitoring_active:
+        """시스템 메트릭 수집 (작업 스케줄러가 30초마다 실행)"""
+        metrics = self.get_system_metrics()
+
+        # 개별 메트릭 저장
+        if 'cpu' in metrics:
+            self.metrics_history['cpu_usage'].append(metrics['cpu']['usage_percent'])
+        if 'memory' in metrics:
+            self.metrics_history['memory_usage'].append(metrics['memory']['usage_percent'])
+        if 'disk' in metrics:
+            self.metrics_history['disk_usage'].append(metrics['disk']['usage_percent'])
+
+        # Redis에 저장
+        if self.redis_client:
             try:
-                metrics = self.get_system_metrics()
-
-                # 개별 메트릭 저장
-                if 'cpu' in metrics:
-                    self.metrics_history['cpu_usage'].append(metrics['cpu']['usage_percent'])
-                if 'memory' in metrics:
-                    self.metrics_history['memory_usage'].append(metrics['memory']['usage_percent'])
-                if 'disk' in metrics:
-                    self.metrics_history['disk_usage'].append(metrics['disk']['usage_percent'])
-
-                # Redis에 저장
-                if self.redis_client:
-                    try:
-                        self.redis_client.setex(
-                            'system_metrics',
-                            300,  # 5분 TTL
-                            json.dumps(metrics)
-                        )
-                    except Exception as e:
-                        logger.warning(f"Redis 메트릭 저장 실패: {e}")
-
-                time.sleep(30)  # 30초마다 수집
-
+                self.redis_client.setex(
+                    'system_metrics',
+                    300,  # 5분 TTL
+                    json.dumps(metrics)
+                )
             except Exception as e:
-                logger.error(f"메트릭 수집 오류: {e}")
-                time.sleep(60)
+                logger.warning(f"Redis 메트릭 저장 실패: {e}")
 
     def _detect_anomalies(self):
-        """이상 감지 루프"""
-        while self.monitoring_active:
-            try:
-                anomalies = self.get_anomaly_detection()
-
-                if anomalies.get('total_anomalies', 0) > 0:
-                    logger.warning(f"이상 감지됨: {anomalies['anomalies']}")
-
-                    # 자동 복구 트리거
-                    if self.auto_recovery_enabled:
-                        self._trigger_recovery_actions(anomalies['anomalies'])
+        """이상 감지 (작업 스케줄러가 1분마다 실행)"""
+        anomalies = self.get_anomaly_detection()
 
-                time.sleep(60)  # 1분마다 감지
+        if anomalies.get('total_anomalies', 0) > 0:
+            logger.warning(f"이상 감지됨: {anomalies['anomalies']}")
 
-            except Exception as e:
-                logger.error(f"이상 감지 오류: {e}")
-                time.sleep(120)
-
-    def _auto_recovery_loop(self):
-        """자동 복구 루프"""
-        while self.monitoring_active:
-            try:
-                # 복구 액션 실행
-                self._execute_recovery_actions()
-
-                time.sleep(300)  # 5분마다 복구 체크
-
-            except Exception as e:
-                logger.error(f"자동 복구 오류: {e}")
-                time.sleep(600)
+            # 자동 복구 트리거
+            if self.auto_recovery_enabled:
+                self._trigger_recovery_actions(anomalies['anomalies'])
 
     def _trigger_recovery_actions(self, anomalies: List[Dict[str, Any]]):
         """복구 액션 트리거"""
@@ -1,4 +1,4 @@
-from typing import Set, Dict, Any, Optional  # pyright: ignore
+from typing import Callable, Set, Dict, Any, Optional  # pyright: ignore
 from datetime import datetime
 import logging
 import json
@@ -9,81 +9,298 @@ form = None  # pyright: ignore
 
 # WebSocket 연결 관리
 
+# 느린 클라이언트 처리 정책
+SLOW_CONSUMER_DROP_OLDEST = "drop_oldest"  # 가장 오래된 대기 메시지를 버리고 새 메시지 추가
+SLOW_CONSUMER_DROP_NEW = "drop_new"  # 새 메시지를 버림
+SLOW_CONSUMER_DISCONNECT = "disconnect"  # 연결 종료
+
+# 검증된 신원과 일치할 때만 구독할 수 있는 토픽 접두사 -> 신원 필드
+RESERVED_TOPICS = {'brand': 'brand_id', 'branch': 'branch_id', 'role': 'role', 'user': 'user_id'}
+
+
+def verify_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    JWT를 검증하고 사용자 행(principal_cache 스냅샷)에서 신원을 꺼냄. 실패하면 None
+    역할/브랜드/매장은 클라이언트가 보낸 값이 아니라 DB 값을 사용한다.
+    """
+    try:
+        import jwt
+        from flask import current_app, has_app_context
+        from utils.principal_cache import principal_cache
+
+        if has_app_context():
+            app = current_app._get_current_object()
+        else:
+            from app import app
+        with app.app_context():
+            payload = jwt.decode(token, app.config.get('JWT_SECRET_KEY', 'your-secret-key'), algorithms=['HS256'])
+            principal = principal_cache.get(payload.get('user_id'))
+    except Exception as e:
+        logging.warning(f"WebSocket 토큰 검증 실패: {e}")
+        return None
+    if principal is None or principal.status != 'approved':
+        return None
+    return {'user_id': principal.id, 'role': principal.role,
+            'brand_id': principal.brand_id, 'branch_id': principal.branch_id}
+
+
+class ClientConnection:
+    """클라이언트별 전송 큐와 전송 태스크
+
+    브로드캐스트는 큐에 넣기만 하고 실제 전송은 클라이언트마다 따로 도는
+    전송 태스크가 맡으므로, 느린 클라이언트가 다른 클라이언트를 지연시키지 않는다.
+    """
+
+    def __init__(self, websocket, queue_size: int):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.topics: Set[str] = set()
+        self.sender: Optional[asyncio.Task] = None
+        self.send_started: Optional[float] = None
+        self.dropped = 0
+
 
 class WebSocketManager:
-    def __init__(self):
+    def __init__(self, send_queue_size: int = 256, slow_consumer_policy: str = SLOW_CONSUMER_DROP_OLDEST,
+                 send_timeout: float = 10.0,
+                 identity_resolver: Callable[[str], Optional[Dict[str, Any]]] = verify_token):
+        self.identity_resolver = identity_resolver
         self.clients: Set[Any] = set()  # pyright: ignore
         self.client_data: Dict[Any, Dict[str, Any]] = {}  # pyright: ignore
+        self.connections: Dict[Any, ClientConnection] = {}
+        # user_id -> 연결, 토픽(brand:1, branch:3, role:admin 등) -> 연결
+        self.user_index: Dict[Any, Set[Any]] = {}
+        self.topic_index: Dict[str, Set[Any]] = {}
+
+        self.send_queue_size = send_queue_size
+        self.slow_consumer_policy = slow_consumer_policy
+        self.send_timeout = send_timeout
+        self._reaper: Optional[asyncio.Task] = None
+        self.stats = {
+            'messages_queued': 0,
+            'messages_sent': 0,
+            'messages_dropped': 0,
+            'slow_disconnects': 0,
+            'send_failures': 0,
+        }
 
     async def register(self,  websocket: websockets.WebSocketServerProtocol):
         """새로운 클라이언트 등록"""
+        connection = ClientConnection(websocket, self.send_queue_size)
         self.clients.add(websocket)
+        self.connections[websocket] = connection
         self.client_data[websocket] = {
             'connected_at': datetime.now(),
             'last_activity': datetime.now(),
             'user_id': None,
             'role': None
         }  # pyright: ignore
+        connection.sender = asyncio.create_task(self._sender_loop(connection))
+        if self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap_stalled_senders())
         logging.info(f"새 클라이언트 연결됨. 총 연결 수: {len(self.clients)}")
 
     async def unregister(self,  websocket: websockets.WebSocketServerProtocol):
         """클라이언트 연결 해제"""
-        self.clients.discard(websocket)
-        if websocket in self.client_data:
-            del self.client_data[websocket]  # pyright: ignore
+        connection = self._remove(websocket)
+        if connection and connection.sender and connection.sender is not asyncio.current_task():
+            connection.sender.cancel()
         logging.info(f"클라이언트 연결 해제됨. 총 연결 수: {len(self.clients)}")
 
-    async def broadcast(self,  message: Dict[str,  Any]):
-        """모든 클라이언트에게 메시지 브로드캐스트"""
-        if not self.clients:
+    def _remove(self, websocket) -> Optional[ClientConnection]:
+        """연결과 인덱스 정리"""
+        self.clients.discard(websocket)
+        data = self.client_data.pop(websocket, None)
+        connection = self.connections.pop(websocket, None)
+        if data and data.get('user_id') is not None:
+            self._discard_index(self.user_index, data['user_id'], websocket)
+        if connection:
+            for topic in connection.topics:
+                self._discard_index(self.topic_index, topic, websocket)
+        return connection
+
+    @staticmethod
+    def _discard_index(index: Dict[Any, Set[Any]], key, websocket):
+        members = index.get(key)
+        if members is not None:
+            members.discard(websocket)
+            if not members:
+                del index[key]
+
+    async def authenticate_token(self, websocket, token: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        토큰으로 신원을 확인해 인증 (DB 조회는 이벤트 루프를 막지 않도록 스레드에서)
+        실패하면 이전 인증과 brand/branch/role 토픽을 해제하고 None 반환
+        """
+        identity = await asyncio.to_thread(self.identity_resolver, token) if token else None
+        if identity is None:
+            self.authenticate(websocket)
+            return None
+        self.authenticate(websocket, **identity)
+        return identity
+
+    def authenticate(self, websocket, user_id=None, role=None, brand_id=None, branch_id=None):
+        """
+        검증된 신원을 기록 후 사용자 인덱스와 brand/branch/role 토픽 구독 갱신
+        (클라이언트 메시지 값을 그대로 넘기지 말고 authenticate_token을 사용)
+        """
+        data = self.client_data.get(websocket)
+        if data is None:
             return
-
+        if data.get('user_id') is not None:
+            self._discard_index(self.user_index, data['user_id'], websocket)
+        data.update({'user_id': user_id, 'role': role, 'brand_id': brand_id, 'branch_id': branch_id})
+        if user_id is not None:
+            self.user_index.setdefault(user_id, set()).add(websocket)
+
+        connection = self.connections[websocket]
+        for topic in [t for t in connection.topics if t.split(':', 1)[0] in RESERVED_TOPICS]:
+            self.unsubscribe(websocket, topic)
+        for prefix, value in (('brand', brand_id), ('branch', branch_id), ('role', role)):
+            if value is not None:
+                self.subscribe(websocket, f"{prefix}:{value}")
+
+    def can_subscribe(self, websocket, topic: str) -> bool:
+        """
+        클라이언트가 요청한 토픽 구독 허용 여부
+        brand:/branch:/role:/user: 토픽은 인증된 신원과 일치할 때만 허용
+        """
+        prefix, sep, value = topic.partition(':')
+        if not sep or prefix not in RESERVED_TOPICS:
+            return True
+        data = self.client_data.get(websocket) or {}
+        owned = data.get(RESERVED_TOPICS[prefix])
+        return data.get('user_id') is not None and owned is not None and value == str(owned)
+
+    def subscribe(self, websocket, topic: str):
+        """토픽(룸) 구독"""
+        connection = self.connections.get(websocket)
+        if connection is None:
+            return
+        connection.topics.add(topic)
+        self.topic_index.setdefault(topic, set()).add(websocket)
+
+    def unsubscribe(self, websocket, topic: str):
+        """토픽(룸) 구독 해제"""
+        connection = self.connections.get(websocket)
+        if connection is not None:
+            connection.topics.discard(topic)
+        self._discard_index(self.topic_index, topic, websocket)
+
+    def _enqueue(self, websocket, message_str: str) -> bool:
+        """전송 큐에 추가 (가득 차면 정책에 따라 버리거나 연결 종료)"""
+        connection = self.connections.get(websocket)
+        if connection is None:
+            return False
+        try:
+            connection.queue.put_nowait(message_str)
+        except asyncio.QueueFull:
+            connection.dropped += 1
+            if self.slow_consumer_policy == SLOW_CONSUMER_DISCONNECT:
+                self.stats['slow_disconnects'] += 1
+                logging.warning(f"느린 클라이언트 연결 종료 (대기 메시지 {connection.queue.qsize()}건)")
+                self._close(websocket, 1013, "slow consumer")
+                return False
+            self.stats['messages_dropped'] += 1
+            if self.slow_consumer_policy == SLOW_CONSUMER_DROP_NEW:
+                return False
+            connection.queue.get_nowait()
+            connection.queue.put_nowait(message_str)
+        self.stats['messages_queued'] += 1
+        return True
+
+    def _fan_out(self, targets, message: Dict[str, Any]) -> int:
+        """메시지를 한 번만 인코딩해서 대상 연결들의 큐에 추가, 추가된 수 반환"""
+        if not targets:
+            return 0
         message_str = json.dumps(message)
-        disconnected_clients = set()
+        return sum(1 for client in list(targets) if self._enqueue(client, message_str))
+
+    def _close(self, websocket, code: int, reason: str):
+        """연결 정리 후 종료는 백그라운드로 (느린 클라이언트의 close 대기에 묶이지 않도록)"""
+        connection = self._remove(websocket)
+        if connection and connection.sender and connection.sender is not asyncio.current_task():
+            connection.sender.cancel()
+
+        async def close():
+            try:
+                await websocket.close(code, reason)
+            except Exception as e:
+                logging.debug(f"연결 종료 중 오류: {e}")
+
+        asyncio.create_task(close())
 
-        for client in self.clients:
+    async def _sender_loop(self, connection: ClientConnection):
+        """클라이언트 한 명에게 큐의 메시지를 순서대로 전송"""
+        websocket = connection.websocket
+        loop = asyncio.get_running_loop()
+        while True:
+            message_str = await connection.queue.get()
             try:
-                await client.send(message_str)
+                connection.send_started = loop.time()
+                await websocket.send(message_str)
+                connection.send_started = None
+                self.stats['messages_sent'] += 1
             except websockets.exceptions.ConnectionClosed:
-                disconnected_clients.add(client)
+                self._remove(websocket)
+                return
             except Exception as e:
+                self.stats['send_failures'] += 1
                 logging.error(f"메시지 전송 실패: {e}")
-                disconnected_clients.add(client)
+                self._close(websocket, 1011, "send failure")
+                return
 
-        # 연결이 끊어진 클라이언트 제거
-        if disconnected_clients is not None:
-            for client in disconnected_clients:
-                await self.unregister(client)
+    async def _reap_stalled_senders(self):
+        """전송 한 건이 send_timeout 넘게 끝나지 않는 클라이언트 연결 종료
 
-    async def send_to_user(self,  user_id: str,  message: Dict[str,  Any] = None):
+        메시지마다 wait_for를 거는 대신 주기적으로 한 번에 검사한다.
+        """
+        loop = asyncio.get_running_loop()
+        while self.connections:
+            await asyncio.sleep(max(self.send_timeout / 2, 0.05))
+            now = loop.time()
+            stalled = [ws for ws, c in self.connections.items()
+                       if c.send_started is not None and now - c.send_started > self.send_timeout]
+            for websocket in stalled:
+                self.stats['slow_disconnects'] += 1
+                logging.warning(f"전송 시간 초과로 클라이언트 연결 종료 ({self.send_timeout}초)")
+                self._close(websocket, 1013, "send timeout")
+        self._reaper = None
+
+    async def send(self, websocket, message: Dict[str, Any]) -> bool:
+        """특정 연결 하나에 메시지 전송 (요청 응답 등)"""
+        return self._fan_out([websocket], message) == 1
+
+    async def broadcast(self,  message: Dict[str,  Any]) -> int:
+        """모든 클라이언트에게 메시지 브로드캐스트"""
+        return self._fan_out(self.clients, message)
+
+    async def send_to_user(self,  user_id: str,  message: Dict[str,  Any] = None) -> int:
         """
         특정 사용자에게 메시지 전송
         """
-        message_str = json.dumps(message)
-        disconnected_clients = set()
-
-        if self.client_data is not None:
-            for client, data in self.client_data.items():
-                if data and data.get('user_id') == user_id:
-                    try:
-                        await client.send(message_str)
-                    except websockets.exceptions.ConnectionClosed:
-                        disconnected_clients.add(client)
-                    except Exception as e:
-                        logging.error(f"사용자 메시지 전송 실패: {e}")
-                        disconnected_clients.add(client)
-
-        # 연결이 끊어진 클라이언트 제거
-        if disconnected_clients is not None:
-            for client in disconnected_clients:
-                await self.unregister(client)
+        return self._fan_out(self.user_index.get(user_id), message)
+
+    async def publish(self, topic: str, message: Dict[str, Any]) -> int:
+        """토픽(brand:1, branch:3, role:admin 등) 구독자에게 메시지 전송"""
+        return self._fan_out(self.topic_index.get(topic), message)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """연결/전송 통계"""
+        return {
+            **self.stats,
+            'active_connections': len(self.clients),
+            'users': len(self.user_index),
+            'topics': len(self.topic_index),
+            'pending_messages': sum(c.queue.qsize() for c in self.connections.values()),
+        }
 
 
 # WebSocket 매니저 인스턴스
 ws_manager = WebSocketManager()
 
 
-async def websocket_handler(websocket,  path):
+async def websocket_handler(websocket,  path=None):
     """WebSocket 연결 핸들러"""
     await ws_manager.register(websocket)
 
@@ -95,10 +312,10 @@ async def websocket_handler(websocket,  path):
                     await handle_message(websocket,  data)
                 except json.JSONDecodeError:
                     logging.error("잘못된 JSON 형식")
-                    await websocket.send(json.dumps({
+                    await ws_manager.send(websocket, {
                         "type": "error",
                         "message": "잘못된 메시지 형식"
-                    }))
+                    })
     except websockets.exceptions.ConnectionClosed:
         logging.info("클라이언트 연결이 정상적으로 종료됨")
     except Exception as e:
@@ -114,24 +331,47 @@ async def handle_message(websocket,  data: Optional[Dict[str,  Any]] = None):  #
     message_type = data.get('type') if data else None
 
     if message_type == 'auth':
-        # 인증 처리
-        user_id = data.get('user_id') if data else None
-        role = data.get('role') if data else None
-        if ws_manager.client_data is not None:
-            ws_manager.client_data[websocket]['user_id'] = user_id
-            ws_manager.client_data[websocket]['role'] = role
-
-        await websocket.send(json.dumps({
+        # 인증 처리: 토큰으로 확인한 신원만 사용 (클라이언트가 보낸 role/brand_id/branch_id는 무시)
+        identity = await ws_manager.authenticate_token(websocket, data.get('token'))
+        if identity is None:
+            await ws_manager.send(websocket, {
+                "type": "auth_failed",
+                "message": "유효하지 않은 토큰입니다."
+            })
+            return
+
+        await ws_manager.send(websocket, {
             "type": "auth_success",
-            "message": "인증 성공"
-        }))
+            "message": "인증 성공",
+            "user_id": identity['user_id']
+        })
+
+    elif message_type in ('subscribe', 'unsubscribe'):
+        # 토픽(룸) 구독 관리
+        topic = data.get('topic')
+        if topic and message_type == 'subscribe' and not ws_manager.can_subscribe(websocket, topic):
+            await ws_manager.send(websocket, {
+                "type": "error",
+                "message": "구독 권한이 없는 토픽입니다.",
+                "topic": topic
+            })
+            return
+        if topic:
+            if message_type == 'subscribe':
+                ws_manager.subscribe(websocket, topic)
+            else:
+                ws_manager.unsubscribe(websocket, topic)
+        await ws_manager.send(websocket, {
+            "type": f"{message_type}_success",
+            "topic": topic
+        })
 
     elif message_type == 'ping':
         # 연결 상태 확인
-        await websocket.send(json.dumps({
+        await ws_manager.send(websocket, {
             "type": "pong",
             "timestamp": datetime.now().isoformat()
-        }))
+        })
 
     elif message_type == 'data_request':
         # 데이터 요청 처리
@@ -140,10 +380,10 @@ async def handle_message(websocket,  data: Optional[Dict[str,  Any]] = None):  #
 
     else:
         # 알 수 없는 메시지 타입
-        await websocket.send(json.dumps({
+        await ws_manager.send(websocket, {
             "type": "error",
             "message": f"알 수 없는 메시지 타입: {message_type}"
-        }))
+        })
 
 
 async def send_data_update(websocket, data_type="general"):
@@ -161,7 +401,7 @@ async def send_data_update(websocket, data_type="general"):
         }
     }
 
-    await websocket.send(json.dumps(update_data))
+    await ws_manager.send(websocket, update_data)
 
 
 async def broadcast_system_status():
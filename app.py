@@ -17,6 +17,9 @@ from typing import Optional, Dict, Any, List
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
+# 시작 프로파일러 (STARTUP_PROFILE=1 이면 이후 import/초기화 비용 기록)
+from core.backend.startup_profiler import startup_profiler
+
 import jwt
 from flask import Flask, flash, jsonify, redirect, render_template, request
 from flask_cors import CORS
@@ -49,7 +52,6 @@ from models_main import (
 # from core.backend.plugin_schema import PluginManifest
 # from core.backend.plugin_customization import CustomizationRule, CustomizationType
 # from core.backend.plugin_release_manager import PluginReleaseManager
-# from core.backend.plugin_marketplace import PluginMarketplace
 # from core.backend.plugin_feedback_system import PluginFeedbackSystem
 # from core.backend.plugin_testing_system import PluginTestingSystem
 
@@ -146,19 +148,27 @@ def create_default_admin():
         logger.error(f"기본 관리자 계정 생성 실패: {e}")
         raise
 
+startup_profiler.checkpoint("기본 모듈 import")
+
 # 확장 모듈 초기화
 initialize_extensions()
+startup_profiler.checkpoint("확장 모듈 초기화")
 
 # 데이터베이스 초기화
 initialize_database()
+startup_profiler.checkpoint("데이터베이스 초기화")
 
-# IoT 시스템 초기화
+# 모델 변경 시 캐시 태그 무효화 훅 등록
 try:
-    from utils.iot_simulator import initialize_iot_system
-    initialize_iot_system()
-    logger.info("IoT 시스템 초기화 완료")
+    from utils.advanced_caching import register_model_invalidation_hooks
+    register_model_invalidation_hooks(db)
 except Exception as e:
-    logger.error(f"IoT 시스템 초기화 실패: {e}")
+    logger.error(f"캐시 무효화 훅 등록 실패: {e}")
+
+# 공용 백그라운드 작업 스케줄러 (app_context 작업에 쓸 앱 등록)
+from core.backend.job_scheduler import job_scheduler
+
+job_scheduler.init_app(app)
 
 # 블루프린트 등록 함수
 def register_blueprints():
@@ -188,6 +198,7 @@ def register_blueprints():
 
 # 블루프린트 등록
 register_blueprints()
+startup_profiler.checkpoint("핵심 블루프린트 등록")
 
 # 알림 관리 API 블루프린트 등록
 try:
@@ -640,22 +651,7 @@ try:
 except Exception as e:
     logger.error(f"성능 분석 API 블루프린트 등록 실패: {e}")
 
-# 플러그인 시스템 초기화 및 시작
-try:
-    from core.backend.plugin_optimizer import plugin_optimizer
-
-    plugin_optimizer.start_optimization()
-    logger.info("플러그인 성능 최적화 시스템 시작")
-except Exception as e:
-    logger.error(f"플러그인 성능 최적화 시스템 시작 실패: {e}")
-
-try:
-    from core.backend.plugin_backup_manager import plugin_backup_manager
-
-    plugin_backup_manager.start_auto_backup()
-    logger.info("플러그인 자동 백업 시스템 시작")
-except Exception as e:
-    logger.error(f"플러그인 자동 백업 시스템 시작 실패: {e}")
+startup_profiler.checkpoint("API 블루프린트 등록")
 
 # Prometheus 메트릭 객체 생성 (예시: 응답시간, CPU, 메모리, 에러율)
 RESPONSE_TIME_GAUGE = Gauge(
@@ -708,33 +704,80 @@ from core.backend.schema_initializer import (
 
 initialize_default_schemas()
 create_sample_brand_schema()
+startup_profiler.checkpoint("동적 스키마 초기화")
 
-# Initialize Query Optimizer
-try:
+
+def init_query_optimizer():
     from utils.query_optimizer import initialize_query_optimizer
 
-    def init_query_optimizer():
-        with app.app_context():
-            query_optimizer, connection_pool_optimizer = initialize_query_optimizer(
-                db.engine,
-                config={
-                    "slow_query_threshold": 1.0,
-                    "analysis_interval": 3600,
-                    "monitoring_enabled": True,
-                },
-            )
-            logger.info("쿼리 최적화 시스템 초기화 완료")
-            return query_optimizer, connection_pool_optimizer
+    with app.app_context():
+        query_optimizer, connection_pool_optimizer = initialize_query_optimizer(
+            db.engine,
+            config={
+                "slow_query_threshold": 1.0,
+                "analysis_interval": 3600,
+                "monitoring_enabled": True,
+            },
+        )
+        logger.info("쿼리 최적화 시스템 초기화 완료")
+        return query_optimizer, connection_pool_optimizer
 
-    # 백그라운드에서 초기화
-    import threading
 
-    init_thread = threading.Thread(target=init_query_optimizer)
-    init_thread.daemon = True
-    init_thread.start()
+_background_services_pid = None
 
-except Exception as e:
-    logger.error(f"쿼리 최적화 시스템 초기화 실패: {e}")
+
+def start_background_services():
+    """
+    스레드를 쓰는 백그라운드 서비스 시작 (IoT 시뮬레이터, 플러그인 최적화/백업, 쿼리 최적화기).
+    스레드는 포크 후 자식에 남지 않으므로 --preload 모드(APP_PRELOAD=1)에서는 마스터가 아니라
+    워커마다 post_fork에서 호출된다. 같은 프로세스에서는 한 번만 시작
+    """
+    global _background_services_pid
+    if _background_services_pid == os.getpid():
+        return
+    _background_services_pid = os.getpid()
+
+    # IoT 시스템 초기화
+    try:
+        from utils.iot_simulator import initialize_iot_system
+        initialize_iot_system()
+        logger.info("IoT 시스템 초기화 완료")
+    except Exception as e:
+        logger.error(f"IoT 시스템 초기화 실패: {e}")
+
+    # 플러그인 시스템 초기화 및 시작
+    try:
+        from core.backend.plugin_optimizer import plugin_optimizer
+
+        plugin_optimizer.start_optimization()
+        logger.info("플러그인 성능 최적화 시스템 시작")
+    except Exception as e:
+        logger.error(f"플러그인 성능 최적화 시스템 시작 실패: {e}")
+
+    try:
+        from core.backend.plugin_backup_manager import plugin_backup_manager
+
+        plugin_backup_manager.start_auto_backup()
+        logger.info("플러그인 자동 백업 시스템 시작")
+    except Exception as e:
+        logger.error(f"플러그인 자동 백업 시스템 시작 실패: {e}")
+
+    # Initialize Query Optimizer (백그라운드에서 초기화)
+    try:
+        import threading
+
+        init_thread = threading.Thread(target=init_query_optimizer)
+        init_thread.daemon = True
+        init_thread.start()
+    except Exception as e:
+        logger.error(f"쿼리 최적화 시스템 초기화 실패: {e}")
+
+
+from core.backend.worker_preload import is_preload
+
+if not is_preload():
+    start_background_services()
+startup_profiler.checkpoint("백그라운드 서비스 시작")
 
 # Login manager setup
 login_manager.init_app(app)
@@ -1232,6 +1275,25 @@ def api_admin_system_status():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/admin/background-jobs")
+def api_admin_background_jobs():
+    """백그라운드 작업 상태 API (작업별 실행 시간, 지연, 실패 횟수)"""
+    try:
+        return jsonify(job_scheduler.status())
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/admin/startup-profile")
+def api_admin_startup_profile():
+    """시작 비용 API (단계별/모듈별 import 시간과 지연 생성 서비스 상태)"""
+    try:
+        top = request.args.get("top", 20, type=int)
+        return jsonify(startup_profiler.report(top))
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 # @app.route("/admin/staff-management")
 # def admin_staff_management():
 #     """직원 관리 페이지 - 브랜드 관리자 승인으로 대체됨"""
@@ -1725,7 +1787,14 @@ def api_plugin_release_history(plugin_name):
         return jsonify({"error": "플러그인 배포 이력 조회 실패"}), 500
 
 
-# plugin_marketplace = PluginMarketplace()
+# 플러그인 마켓플레이스 (카탈로그 인덱스로 목록/커서 페이지 조회)
+try:
+    from core.backend.plugin_marketplace import PluginMarketplace
+
+    plugin_marketplace = PluginMarketplace()
+except Exception as e:
+    plugin_marketplace = None
+    logger.error(f"플러그인 마켓플레이스 초기화 실패: {e}")
 
 
 @app.route("/api/marketplace/plugins", methods=["GET"])
@@ -1736,12 +1805,29 @@ def api_marketplace_plugins():
         search = request.args.get("search")
         sort_by = request.args.get("sort_by", "rating")
         sort_order = request.args.get("sort_order", "desc")
+        cursor = request.args.get("cursor")
+        limit = request.args.get("limit", type=int)
 
-        plugins = plugin_marketplace.get_marketplace_plugins(
-            category=category, search=search, sort_by=sort_by, sort_order=sort_order
-        )
+        if cursor is None and limit is None:
+            plugins = plugin_marketplace.get_marketplace_plugins(
+                category=category, search=search, sort_by=sort_by, sort_order=sort_order
+            )
+            return jsonify({"status": "success", "data": plugins})
 
-        return jsonify({"status": "success", "data": plugins})
+        # 커서 페이지 조회
+        try:
+            page = plugin_marketplace.get_marketplace_plugins_page(
+                category=category, search=search, sort_by=sort_by, sort_order=sort_order,
+                cursor=cursor, limit=limit,
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        return jsonify({
+            "status": "success",
+            "data": page["plugins"],
+            "next_cursor": page["next_cursor"],
+            "total": page["total"],
+        })
     except Exception as e:
         logger.error(f"마켓플레이스 플러그인 목록 조회 실패: {e}")
         return jsonify({"error": "마켓플레이스 플러그인 목록 조회 실패"}), 500
@@ -4653,6 +4739,15 @@ try:
 except Exception as e:
     logger.error(f"통합 연동 시스템 시작 실패: {e}")
 
+# AI 이상징후 일일 일괄 탐지 작업 등록 (전날 매출/인건비/재고)
+try:
+    from api.ai_advanced_analytics import real_time_analyzer
+
+    real_time_analyzer.start_daily_scan()
+    logger.info("AI 이상징후 일일 탐지 작업 등록 완료")
+except Exception as e:
+    logger.error(f"AI 이상징후 일일 탐지 작업 등록 실패: {e}")
+
 
 @app.route("/api/admin/brand-managers", methods=["POST"])
 def api_admin_create_brand_manager():
@@ -5416,5 +5511,8 @@ def create_app():
     return app
 
 
+startup_profiler.checkpoint("라우트 및 나머지 블루프린트 등록")
+startup_profiler.log_report()
+
 if __name__ == "__main__":
     app.run(debug=True, host="127.0.0.1", port=5000)
@@ -6,11 +6,10 @@ from collections import defaultdict, deque
 from enum import Enum
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
-import sqlite3
 import json
-import threading
-import time
 import logging
+from core.backend.job_scheduler import job_scheduler
+from core.backend.sidecar_db import get_sidecar_db
 from flask import request
 config = None  # pyright: ignore
 form = None  # pyright: ignore
@@ -22,6 +21,8 @@ form = None  # pyright: ignore
 
 logger = logging.getLogger(__name__)
 
+PLUGIN_MONITOR_JOB = "advanced_plugin_monitoring.monitor"
+
 
 class MetricType(Enum):
     """메트릭 타입"""
@@ -122,8 +123,8 @@ class AdvancedPluginMonitor:
 
     def __init__(self, db_path="advanced_monitoring.db"):
         self.db_path = db_path
+        self.db = get_sidecar_db(db_path)
         self.monitoring_active = False
-        self.monitor_thread = None
 
         # 메트릭 저장소 (메모리 캐시)
         self.metrics_cache: Dict[str, deque[DetailedMetric]] = defaultdict(lambda: deque(maxlen=10000))
@@ -153,77 +154,77 @@ class AdvancedPluginMonitor:
     def _init_database(self):
         """데이터베이스 초기화"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # 메트릭 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS plugin_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    plugin_id TEXT NOT NULL,
-                    metric_type TEXT NOT NULL,
-                    value REAL NOT NULL,
-                    timestamp DATETIME NOT NULL,
-                    metadata TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # 로그 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS plugin_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    plugin_id TEXT NOT NULL,
-                    level TEXT NOT NULL,
-                    message TEXT NOT NULL,
-                    timestamp DATETIME NOT NULL,
-                    context TEXT,
-                    traceback TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # 이벤트 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS plugin_events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    plugin_id TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    timestamp DATETIME NOT NULL,
-                    severity TEXT NOT NULL,
-                    data TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+
+                # 메트릭 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS plugin_metrics (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        plugin_id TEXT NOT NULL,
+                        metric_type TEXT NOT NULL,
+                        value REAL NOT NULL,
+                        timestamp DATETIME NOT NULL,
+                        metadata TEXT,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+
+                # 로그 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS plugin_logs (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        plugin_id TEXT NOT NULL,
+                        level TEXT NOT NULL,
+                        message TEXT NOT NULL,
+                        timestamp DATETIME NOT NULL,
+                        context TEXT,
+                        traceback TEXT,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+
+                # 이벤트 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS plugin_events (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        plugin_id TEXT NOT NULL,
+                        event_type TEXT NOT NULL,
+                        description TEXT NOT NULL,
+                        timestamp DATETIME NOT NULL,
+                        severity TEXT NOT NULL,
+                        data TEXT,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+
+                # 성능 스냅샷 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS performance_snapshots (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        plugin_id TEXT NOT NULL,
+                        timestamp DATETIME NOT NULL,
+                        cpu_usage REAL NOT NULL,
+                        memory_usage REAL NOT NULL,
+                        response_time REAL NOT NULL,
+                        error_rate REAL NOT NULL,
+                        request_count INTEGER NOT NULL,
+                        throughput REAL NOT NULL,
+                        disk_io TEXT NOT NULL,
+                        network_io TEXT NOT NULL,
+                        custom_metrics TEXT,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+
+                # 인덱스 생성
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_metrics_plugin_time ON plugin_metrics(plugin_id, timestamp)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_logs_plugin_time ON plugin_logs(plugin_id, timestamp)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_plugin_time ON plugin_events(plugin_id, timestamp)')
+                cursor.execute(
+                    'CREATE INDEX IF NOT EXISTS idx_snapshots_plugin_time ON performance_snapshots(plugin_id, timestamp)'
                 )
-            ''')
-
-            # 성능 스냅샷 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS performance_snapshots (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    plugin_id TEXT NOT NULL,
-                    timestamp DATETIME NOT NULL,
-                    cpu_usage REAL NOT NULL,
-                    memory_usage REAL NOT NULL,
-                    response_time REAL NOT NULL,
-                    error_rate REAL NOT NULL,
-                    request_count INTEGER NOT NULL,
-                    throughput REAL NOT NULL,
-                    disk_io TEXT NOT NULL,
-                    network_io TEXT NOT NULL,
-                    custom_metrics TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # 인덱스 생성
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_metrics_plugin_time ON plugin_metrics(plugin_id, timestamp)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_logs_plugin_time ON plugin_logs(plugin_id, timestamp)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_plugin_time ON plugin_events(plugin_id, timestamp)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_snapshots_plugin_time ON performance_snapshots(plugin_id, timestamp)')
 
-            conn.commit()
-            conn.close()
             logger.info("고도화된 모니터링 데이터베이스 초기화 완료")
 
         except Exception as e:
@@ -235,35 +236,27 @@ class AdvancedPluginMonitor:
             return
 
         self.monitoring_active = True
-        self.monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-        self.monitor_thread.start()
+        # 프로세스별 메트릭 캐시를 DB로 내보내므로 singleton 아님
+        job_scheduler.add_job(PLUGIN_MONITOR_JOB, self._monitoring_tick,
+                              interval=float(self.monitoring_config['metrics_interval']), initial_delay=0)
         logger.info("고도화된 플러그인 모니터링 시작")
 
     def stop_monitoring(self):
         """모니터링 중지"""
         self.monitoring_active = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=5)
+        job_scheduler.remove_job(PLUGIN_MONITOR_JOB)
         logger.info("고도화된 플러그인 모니터링 중지")
 
-    def _monitoring_loop(self):
-        """모니터링 루프"""
-        while self.monitoring_active:
-            try:
-                # 데이터 정리
-                self._cleanup_old_data()
-
-                # 실시간 통계 업데이트
-                self._update_real_time_stats()
+    def _monitoring_tick(self):
+        """데이터 정리/통계 갱신/DB 동기화 (작업 스케줄러가 metrics_interval마다 실행)"""
+        # 데이터 정리
+        self._cleanup_old_data()
 
-                # 데이터베이스 동기화
-                self._sync_to_database()
+        # 실시간 통계 업데이트
+        self._update_real_time_stats()
 
-                time.sleep(float(self.monitoring_config['metrics_interval']))
-
-            except Exception as e:
-                logger.error(f"모니터링 루프 오류: {e}")
-                time.sleep(10.0)
+        # 데이터베이스 동기화
+        self._sync_to_database()
 
     def record_metric(self, plugin_id: str, metric_type: MetricType, value: float, metadata: Optional[Dict[str, Any]] = None):
         """메트릭 기록"""
@@ -426,83 +419,80 @@ class AdvancedPluginMonitor:
     def _sync_to_database(self):
         """데이터베이스 동기화"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # 메트릭 동기화
-            for cache_key, metrics in self.metrics_cache.items():
-                if metrics:
-                    plugin_id, metric_type = cache_key.split('_', 1)
-                    metric = metrics[-1]  # 최신 메트릭
-
-                    cursor.execute('''
-                        INSERT INTO plugin_metrics (plugin_id, metric_type, value, timestamp, metadata)
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (
-                        plugin_id,
-                        metric_type,
-                        metric.value,
-                        metric.timestamp.isoformat(),
-                        json.dumps(metric.metadata)
-                    ))
-
-            # 로그 동기화 (최근 100개만)
-            for plugin_id, logs in self.logs_cache.items():
-                recent_logs = list(logs)[-100:]
-                for log in recent_logs:
-                    cursor.execute('''
-                        INSERT INTO plugin_logs (plugin_id, level, message, timestamp, context, traceback)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (
-                        log.plugin_id,
-                        log.level.value,
-                        log.message,
-                        log.timestamp.isoformat(),
-                        json.dumps(log.context),
-                        log.traceback
-                    ))
-
-            # 이벤트 동기화 (최근 50개만)
-            for plugin_id, events in self.events_cache.items():
-                recent_events = list(events)[-50:]
-                for event in recent_events:
-                    cursor.execute('''
-                        INSERT INTO plugin_events (plugin_id, event_type, description, timestamp, severity, data)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (
-                        event.plugin_id,
-                        event.event_type,
-                        event.description,
-                        event.timestamp.isoformat(),
-                        event.severity,
-                        json.dumps(event.data)
-                    ))
-
-            # 스냅샷 동기화 (최근 10개만)
-            for plugin_id, snapshots in self.snapshots_cache.items():
-                recent_snapshots = list(snapshots)[-10:]
-                for snapshot in recent_snapshots:
-                    cursor.execute('''
-                        INSERT INTO performance_snapshots 
-                        (plugin_id, timestamp, cpu_usage, memory_usage, response_time, error_rate, 
-                         request_count, throughput, disk_io, network_io, custom_metrics)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        snapshot.plugin_id,
-                        snapshot.timestamp.isoformat(),
-                        snapshot.cpu_usage,
-                        snapshot.memory_usage,
-                        snapshot.response_time,
-                        snapshot.error_rate,
-                        snapshot.request_count,
-                        snapshot.throughput,
-                        json.dumps(snapshot.disk_io),
-                        json.dumps(snapshot.network_io),
-                        json.dumps(snapshot.custom_metrics)
-                    ))
-
-            conn.commit()
-            conn.close()
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+
+                # 메트릭 동기화
+                for cache_key, metrics in self.metrics_cache.items():
+                    if metrics:
+                        plugin_id, metric_type = cache_key.split('_', 1)
+                        metric = metrics[-1]  # 최신 메트릭
+
+                        cursor.execute('''
+                            INSERT INTO plugin_metrics (plugin_id, metric_type, value, timestamp, metadata)
+                            VALUES (?, ?, ?, ?, ?)
+                        ''', (
+                            plugin_id,
+                            metric_type,
+                            metric.value,
+                            metric.timestamp.isoformat(),
+                            json.dumps(metric.metadata)
+                        ))
+
+                # 로그 동기화 (최근 100개만)
+                for plugin_id, logs in self.logs_cache.items():
+                    recent_logs = list(logs)[-100:]
+                    for log in recent_logs:
+                        cursor.execute('''
+                            INSERT INTO plugin_logs (plugin_id, level, message, timestamp, context, traceback)
+                            VALUES (?, ?, ?, ?, ?, ?)
+                        ''', (
+                            log.plugin_id,
+                            log.level.value,
+                            log.message,
+                            log.timestamp.isoformat(),
+                            json.dumps(log.context),
+                            log.traceback
+                        ))
+
+                # 이벤트 동기화 (최근 50개만)
+                for plugin_id, events in self.events_cache.items():
+                    recent_events = list(events)[-50:]
+                    for event in recent_events:
+                        cursor.execute('''
+                            INSERT INTO plugin_events (plugin_id, event_type, description, timestamp, severity, data)
+                            VALUES (?, ?, ?, ?, ?, ?)
+                        ''', (
+                            event.plugin_id,
+                            event.event_type,
+                            event.description,
+                            event.timestamp.isoformat(),
+                            event.severity,
+                            json.dumps(event.data)
+                        ))
+
+                # 스냅샷 동기화 (최근 10개만)
+                for plugin_id, snapshots in self.snapshots_cache.items():
+                    recent_snapshots = list(snapshots)[-10:]
+                    for snapshot in recent_snapshots:
+                        cursor.execute('''
+                            INSERT INTO performance_snapshots
+                            (plugin_id, timestamp, cpu_usage, memory_usage, response_time, error_rate,
+                             request_count, throughput, disk_io, network_io, custom_metrics)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ''', (
+                            snapshot.plugin_id,
+                            snapshot.timestamp.isoformat(),
+                            snapshot.cpu_usage,
+                            snapshot.memory_usage,
+                            snapshot.response_time,
+                            snapshot.error_rate,
+                            snapshot.request_count,
+                            snapshot.throughput,
+                            json.dumps(snapshot.disk_io),
+                            json.dumps(snapshot.network_io),
+                            json.dumps(snapshot.custom_metrics)
+                        ))
 
         except Exception as e:
             logger.error(f"데이터베이스 동기화 오류: {e}")
@@ -0,0 +1,367 @@
+"""
+마켓플레이스 카탈로그 인덱스
+모듈/플러그인 목록 조회가 요청마다 전체 목록을 훑고 다시 정렬하던 것을
+컬렉션이 바뀔 때만 다시 만드는 메모리 인덱스로 대체
+
+- 검색: 이름/설명/태그의 2글자 조각(bigram) 역색인으로 후보를 고른 뒤
+  기존과 같은 부분 문자열 비교로 확인 (결과는 전체 검사와 동일)
+- 필터: category, scope 같은 필드별 키 묶음(bucket)
+- 정렬: rating, downloads, created_at, price 별로 미리 정렬해 둔 목록
+- 페이지: (정렬 값, 순번) 커서 기반. 커서 다음 위치는 이진 탐색으로 찾음
+"""
+
+import base64
+import json
+import threading
+import weakref
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from core.backend.document_store import DocumentCollection, _clone
+
+BucketSpec = Union[str, Tuple[str, Callable[[Any], Any]]]
+
+# 기본 정렬 필드와 값이 없을 때 쓰는 값
+DEFAULT_SORT_FIELDS = {"rating": 0, "downloads": 0, "created_at": "", "price": 0}
+
+# 페이지 크기 상한
+MAX_PAGE_SIZE = 200
+
+
+def _grams(text: str) -> Set[str]:
+    """검색어 조각: 2글자 조각 (1글자 검색어면 그 글자)"""
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _text_grams(text: str) -> Set[str]:
+    """색인할 조각: 2글자 조각과 1글자 검색어용 개별 글자"""
+    return _grams(text) | set(text)
+
+
+def encode_cursor(value: Any, position: int) -> str:
+    raw = json.dumps([value, position], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    """잘못된 커서는 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise ValueError("잘못된 커서입니다")
+    if not isinstance(position, int) or isinstance(value, (dict, list)):
+        raise ValueError("잘못된 커서입니다")
+    return value, position
+
+
+class _SortedView:
+    """
+    한 정렬 필드의 (값, 순번) 오름차순 목록. 내림차순은 뒤에서부터 읽음
+    문서가 바뀌면 해당 항목만 이진 탐색으로 빼고 넣음
+    """
+
+    def __init__(self, descending: bool):
+        self.descending = descending
+        self.sort_keys: List[Tuple[Any, int]] = []
+        self.keys: List[str] = []
+
+    def entry(self, value: Any, position: int) -> Tuple[Any, int]:
+        # 내림차순에서도 같은 값끼리는 추가 순서(순번 오름차순)를 유지하도록 순번을 음수로 저장
+        return (value, -position) if self.descending else (value, position)
+
+    def load(self, entries: List[Tuple[Any, int, str]]):
+        entries = sorted((self.entry(value, position), key) for value, position, key in entries)
+        self.sort_keys = [sort_key for sort_key, _ in entries]
+        self.keys = [key for _, key in entries]
+
+    def add(self, value: Any, position: int, key: str):
+        sort_key = self.entry(value, position)
+        i = bisect_left(self.sort_keys, sort_key)
+        self.sort_keys.insert(i, sort_key)
+        self.keys.insert(i, key)
+
+    def remove(self, value: Any, position: int):
+        i = bisect_left(self.sort_keys, self.entry(value, position))
+        if i < len(self.sort_keys) and self.sort_keys[i] == self.entry(value, position):
+            del self.sort_keys[i]
+            del self.keys[i]
+
+    def iter_from(self, after: Optional[Tuple[Any, int]]) -> Iterable[int]:
+        """커서 다음 항목부터 정렬 순서대로의 목록 위치"""
+        n = len(self.keys)
+        if not self.descending:
+            start = 0 if after is None else bisect_right(self.sort_keys, after)
+            return range(start, n)
+        end = n if after is None else bisect_left(self.sort_keys, self.entry(*after))
+        return range(end - 1, -1, -1)
+
+
+class CatalogIndex:
+    """
+    DocumentCollection 위의 카탈로그 검색 인덱스
+
+    Args:
+        collection: 카탈로그 문서 컬렉션
+        text_fields: 검색 대상 문자열 필드
+        tag_field: 검색 대상 태그 목록 필드
+        bucket_fields: 같음 필터용 필드 이름 또는 (이름, 문서 -> 값 함수). 값이 리스트면 각 원소로 묶음
+        sort_fields: {정렬 필드: 값이 없을 때 쓰는 값}
+    """
+
+    # 바뀐 문서가 전체의 이 비율을 넘으면 부분 갱신 대신 전체 재구성
+    REBUILD_RATIO = 0.25
+    # 검색어별 후보 캐시 크기 (컬렉션이 바뀌면 비움)
+    SEARCH_CACHE_SIZE = 256
+
+    def __init__(self, collection: DocumentCollection,
+                 text_fields: Iterable[str] = ("name", "description"),
+                 tag_field: Optional[str] = "tags",
+                 bucket_fields: Iterable[BucketSpec] = ("category",),
+                 sort_fields: Optional[Dict[str, Any]] = None):
+        self.collection = collection
+        self.text_fields = tuple(text_fields)
+        self.tag_field = tag_field
+        self.sort_fields = dict(DEFAULT_SORT_FIELDS if sort_fields is None else sort_fields)
+        self._bucket_extractors: Dict[str, Callable[[Any], Any]] = {}
+        for spec in bucket_fields:
+            if isinstance(spec, str):
+                self._bucket_extractors[spec] = lambda doc, field=spec: doc.get(field)
+            else:
+                self._bucket_extractors[spec[0]] = spec[1]
+
+        self._lock = threading.RLock()
+        self._version: Optional[int] = None
+        # 컬렉션 내부 문서를 그대로 참조 (읽기 전용, 내보낼 때는 사본)
+        self._docs: Dict[str, Any] = {}
+        self._positions: Dict[str, int] = {}
+        self._next_position = 0
+        self._search_texts: Dict[str, List[str]] = {}
+        self._grams: Dict[str, Set[str]] = {}
+        self._buckets: Dict[str, Dict[Any, Set[str]]] = {name: {} for name in self._bucket_extractors}
+        self._views: Dict[Tuple[Optional[str], bool], _SortedView] = {
+            (field, descending): _SortedView(descending)
+            for field in self.sort_fields for descending in (False, True)
+        }
+        self._views[(None, False)] = _SortedView(False)
+        self._search_cache: Dict[str, Set[str]] = {}
+        self.stats = {"rebuilds": 0, "updates": 0, "queries": 0}
+
+    # ==================== 재구성 ====================
+
+    def _refresh(self):
+        """컬렉션 변경 번호가 바뀌었으면 바뀐 문서만 다시 색인 (많이 바뀌었으면 전체 재구성)"""
+        if self._version is not None and self.collection.version() == self._version:
+            return
+        with self._lock:
+            version, items = self.collection.snapshot(copy=False)
+            if version == self._version:
+                return
+            docs = {key: doc for key, doc in items if isinstance(doc, dict)}
+            removed = [key for key in self._docs if key not in docs]
+            changed = [key for key, doc in docs.items() if self._docs.get(key) is not doc]
+            if self._version is None or len(removed) + len(changed) > len(docs) * self.REBUILD_RATIO:
+                self._rebuild(docs)
+            else:
+                for key in removed:
+                    self._unindex(key)
+                    del self._docs[key]
+                    del self._positions[key]
+                for key in changed:
+                    if key in self._docs:
+                        self._unindex(key)
+                    else:
+                        self._positions[key] = self._next_position
+                        self._next_position += 1
+                    self._docs[key] = docs[key]
+                    self._index(key, docs[key])
+                    for (field, _), view in self._views.items():
+                        view.add(self._sort_value(docs[key], field), self._positions[key], key)
+                self.stats["updates"] += 1
+            self._search_cache.clear()
+            self._version = version
+
+    def _sort_value(self, doc: Dict[str, Any], field: Optional[str]) -> Any:
+        if field is None:
+            return 0
+        default = self.sort_fields[field]
+        value = doc.get(field, default)
+        if value is None:
+            return default
+        try:
+            # 필드 안에서 비교 가능하도록 기본값의 타입으로 맞춤
+            return str(value) if isinstance(default, str) else float(value)
+        except (TypeError, ValueError):
+            return default
+
+    def _doc_terms(self, doc: Dict[str, Any]) -> Tuple[List[str], Dict[str, List[Any]]]:
+        """검색 문자열 목록과 묶음별 값 목록"""
+        texts = [str(doc.get(field) or "").lower() for field in self.text_fields]
+        if self.tag_field:
+            texts.extend(str(tag).lower() for tag in doc.get(self.tag_field) or [])
+        bucket_values: Dict[str, List[Any]] = {}
+        for name, extractor in self._bucket_extractors.items():
+            try:
+                value = extractor(doc)
+            except Exception:
+                continue
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            bucket_values[name] = [v for v in values if isinstance(v, (str, int, float, bool))]
+        return texts, bucket_values
+
+    def _index(self, key: str, doc: Dict[str, Any]):
+        texts, bucket_values = self._doc_terms(doc)
+        self._search_texts[key] = texts
+        for text in texts:
+            for gram in _text_grams(text):
+                self._grams.setdefault(gram, set()).add(key)
+        for name, values in bucket_values.items():
+            for value in values:
+                self._buckets[name].setdefault(value, set()).add(key)
+
+    def _unindex(self, key: str):
+        doc = self._docs[key]
+        position = self._positions[key]
+        texts, bucket_values = self._doc_terms(doc)
+        for text in texts:
+            for gram in _text_grams(text):
+                keys = self._grams.get(gram)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._grams[gram]
+        for name, values in bucket_values.items():
+            for value in values:
+                keys = self._buckets[name].get(value)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._buckets[name][value]
+        for (field, _), view in self._views.items():
+            view.remove(self._sort_value(doc, field), position)
+        self._search_texts.pop(key, None)
+
+    def _rebuild(self, docs: Dict[str, Any]):
+        # 남아 있는 문서는 순번을 유지해 커서가 계속 유효하도록 함
+        positions = {}
+        for key in docs:
+            position = self._positions.get(key)
+            if position is None:
+                position = self._next_position
+                self._next_position += 1
+            positions[key] = position
+        self._docs, self._positions = dict(docs), positions
+        self._search_texts, self._grams = {}, {}
+        self._buckets = {name: {} for name in self._bucket_extractors}
+        for key, doc in docs.items():
+            self._index(key, doc)
+        for (field, _), view in self._views.items():
+            view.load([(self._sort_value(doc, field), positions[key], key) for key, doc in docs.items()])
+        self.stats["rebuilds"] += 1
+
+    # ==================== 조회 ====================
+
+    def _search_keys(self, query: str) -> Set[str]:
+        """검색어를 포함하는 문서 키 (역색인 후보를 부분 문자열로 확인)"""
+        keys = self._search_cache.get(query)
+        if keys is not None:
+            return keys
+        posting_lists = sorted((self._grams.get(g, set()) for g in _grams(query)), key=len)
+        candidates = set(posting_lists[0]) if posting_lists else set()
+        for posting in posting_lists[1:]:
+            candidates &= posting
+        # 조각이 모두 있어도 이어지지 않을 수 있으므로 부분 문자열로 확인
+        keys = {key for key in candidates if any(query in text for text in self._search_texts[key])}
+        if len(self._search_cache) >= self.SEARCH_CACHE_SIZE:
+            self._search_cache.pop(next(iter(self._search_cache)))
+        self._search_cache[query] = keys
+        return keys
+
+    def _match(self, filters: Dict[str, Any], search: Optional[str]) -> Optional[Set[str]]:
+        """필터/검색에 맞는 키 집합 (조건이 없으면 None = 전체)"""
+        key_sets = []
+        for name, value in filters.items():
+            if value is None:
+                continue
+            if name in self._buckets:
+                key_sets.append(self._buckets[name].get(value, set()))
+            else:
+                key_sets.append({key for key, doc in self._docs.items() if doc.get(name) == value})
+        if search:
+            key_sets.append(self._search_keys(search.lower()))
+        if not key_sets:
+            return None
+        key_sets.sort(key=len)
+        candidates = set(key_sets[0])
+        for keys in key_sets[1:]:
+            candidates &= keys
+        return candidates
+
+    def search(self, filters: Optional[Dict[str, Any]] = None, search: Optional[str] = None,
+               sort_by: Optional[str] = None, sort_order: str = "desc",
+               cursor: Optional[str] = None,
+               limit: Optional[int] = None) -> Tuple[List[Tuple[str, Dict[str, Any]]], Optional[str], int]:
+        """
+        (키, 문서 사본) 목록, 다음 페이지 커서(마지막 페이지면 None), 전체 일치 건수
+        sort_by가 정렬 필드가 아니면 추가 순서. 같은 정렬 값끼리는 추가 순서를 유지
+        """
+        after = decode_cursor(cursor) if cursor else None
+        if limit is not None:
+            limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        self._refresh()
+        with self._lock:
+            self.stats["queries"] += 1
+            candidates = self._match(filters or {}, search)
+            total = len(self._docs) if candidates is None else len(candidates)
+            if sort_by not in self.sort_fields:
+                sort_by, sort_order = None, "asc"
+            view = self._views[(sort_by, sort_order == "desc")]
+
+            try:
+                if candidates is not None and len(candidates) * 8 < len(view.keys):
+                    # 후보가 적으면 정렬된 목록을 훑지 않고 후보만 정렬
+                    ordered = sorted(
+                        (view.entry(self._sort_value(self._docs[key], sort_by), self._positions[key]), key)
+                        for key in candidates
+                    )
+                    if view.descending:
+                        ordered.reverse()
+                    if after is not None:
+                        bound = view.entry(*after)
+                        ordered = [(k, key) for k, key in ordered
+                                   if (k < bound if view.descending else k > bound)]
+                    ordered_keys = [key for _, key in ordered]
+                else:
+                    ordered_keys = (view.keys[i] for i in view.iter_from(after))
+                    if candidates is not None:
+                        ordered_keys = (key for key in ordered_keys if key in candidates)
+
+                results: List[Tuple[str, Dict[str, Any]]] = []
+                next_cursor = None
+                for key in ordered_keys:
+                    if limit is not None and len(results) >= limit:
+                        last_key = results[-1][0]
+                        value = self._sort_value(self._docs[last_key], sort_by)
+                        next_cursor = encode_cursor(value, self._positions[last_key])
+                        break
+                    results.append((key, _clone(self._docs[key])))
+            except TypeError:
+                # 다른 정렬 기준에서 받은 커서
+                raise ValueError("잘못된 커서입니다")
+            return results, next_cursor, total
+
+
+_catalog_indexes: "weakref.WeakKeyDictionary[DocumentCollection, CatalogIndex]" = weakref.WeakKeyDictionary()
+_catalog_lock = threading.Lock()
+
+
+def get_catalog_index(collection: DocumentCollection, **options) -> CatalogIndex:
+    """컬렉션별 카탈로그 인덱스 (요청마다 관리자를 새로 만들어도 인덱스는 재사용)"""
+    with _catalog_lock:
+        index = _catalog_indexes.get(collection)
+        if index is None:
+            index = CatalogIndex(collection, **options)
+            _catalog_indexes[collection] = index
+        return index
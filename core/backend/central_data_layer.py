@@ -1,7 +1,6 @@
 import time
 import threading
 from pathlib import Path
-import sqlite3
 from enum import Enum
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Any, Optional, Tuple
@@ -9,6 +8,7 @@ from datetime import datetime, timedelta
 import logging
 import json
 from typing import Optional
+from core.backend.sidecar_db import get_sidecar_db
 query = None  # pyright: ignore
 form = None  # pyright: ignore
 """
@@ -35,6 +35,58 @@ class DataType(Enum):
     ANALYTICS = "analytics"
 
 
+# 원본 테이블별 집계 정의 (집계 테이블, 구간 키, 집계 컬럼, 포함 조건)
+ROLLUP_SPECS = {
+    "attendance": {
+        "rollup": "attendance_daily_rollup",
+        "keys": ("branch_id", "date", "employee_id"),
+        "columns": {
+            "record_count": "COUNT(*)",
+            "late_count": "SUM(CASE WHEN is_late = 1 THEN 1 ELSE 0 END)",
+            "overtime_count": "SUM(CASE WHEN is_overtime = 1 THEN 1 ELSE 0 END)",
+            "work_hours_sum": "COALESCE(SUM(work_hours), 0)",
+            "work_hours_count": "COUNT(work_hours)",
+        },
+        "filter": "",
+    },
+    "sales": {
+        "rollup": "sales_daily_rollup",
+        "keys": ("branch_id", "date", "employee_id"),
+        "columns": {
+            "sales_count": "COUNT(*)",
+            "amount_sum": "COALESCE(SUM(amount), 0)",
+        },
+        "filter": "status = 'completed'",
+    },
+    "payroll": {
+        "rollup": "payroll_monthly_rollup",
+        "keys": ("branch_id", "year", "month"),
+        "columns": {
+            "payroll_count": "COUNT(*)",
+            "salary_sum": "COALESCE(SUM(net_salary), 0)",
+            "salary_count": "COUNT(net_salary)",
+            "work_hours_sum": "COALESCE(SUM(work_hours), 0)",
+        },
+        "filter": "",
+    },
+}
+
+
+def _rollup_refresh_sql(table: str, ref: str) -> str:
+    """트리거 안에서 ref(NEW/OLD) 행이 속한 집계 구간 하나를 다시 계산하는 SQL"""
+    spec = ROLLUP_SPECS[table]
+    match = " AND ".join(f"{key} IS {ref}.{key}" for key in spec["keys"])
+    source_match = f"{match} AND {spec['filter']}" if spec["filter"] else match
+    keys = ", ".join(spec["keys"])
+    return f"""
+        DELETE FROM {spec['rollup']} WHERE {match};
+        INSERT INTO {spec['rollup']} ({keys}, {', '.join(spec['columns'])})
+        SELECT {keys}, {', '.join(spec['columns'].values())}
+        FROM {table} WHERE {source_match}
+        GROUP BY {keys};
+    """
+
+
 class CentralDataLayer:
     """중앙 데이터 레이어 - 모든 모듈의 데이터를 통합 관리"""
 
@@ -42,13 +94,15 @@ class CentralDataLayer:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.lock = threading.RLock()
+        # 읽기는 스레드별 연결로 동시 실행, 쓰기만 직렬화
+        self.db = get_sidecar_db(self.db_path)
         self._init_database()
         self._load_sample_data()
 
     def _init_database(self):
         """데이터베이스 초기화"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.write() as conn:
                 cursor = conn.cursor()
 
                 # 브랜드 테이블
@@ -202,16 +256,133 @@ class CentralDataLayer:
                     )
                 ''')
 
-                conn.commit()
+                # 매장별 일간 집계 테이블 및 인덱스
+                self._init_rollups(cursor)
+
                 logger.info("중앙 데이터베이스 초기화 완료")
 
         except Exception as e:
             logger.error(f"데이터베이스 초기화 실패: {e}")
 
+    def _init_rollups(self, cursor):
+        """일간 집계(rollup) 테이블, (branch_id, date) 커버링 인덱스, 갱신 트리거 생성
+
+        집계 행은 트리거가 원본 행이 바뀐 (매장, 날짜, 직원) 구간만 다시 계산해서
+        채우므로 어떤 경로로 쓰든 원본과 일치한다. 집계 테이블을 처음 만드는
+        경우(기존 DB)에는 전체 데이터를 한 번 채운다.
+        """
+        cursor.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'attendance_daily_rollup'"
+        )
+        needs_backfill = cursor.fetchone()[0] == 0
+
+        # 원본 테이블 커버링 인덱스 (구간 재계산과 기간 조회가 인덱스만 읽도록)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_attendance_branch_date
+            ON attendance (branch_id, date, employee_id, is_late, is_overtime, work_hours)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sales_branch_date
+            ON sales (branch_id, date, employee_id, status, amount)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_payroll_branch_month
+            ON payroll (branch_id, year, month, net_salary, work_hours)
+        """)
+
+        # 출퇴근 일간 집계 (직원 단위로 두어 기간 내 근무 직원 수를 정확히 계산)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS attendance_daily_rollup (
+                branch_id INTEGER,
+                date DATE,
+                employee_id INTEGER,
+                record_count INTEGER NOT NULL,
+                late_count INTEGER NOT NULL,
+                overtime_count INTEGER NOT NULL,
+                work_hours_sum REAL NOT NULL,
+                work_hours_count INTEGER NOT NULL,
+                PRIMARY KEY (branch_id, date, employee_id)
+            )
+        """)
+
+        # 매출 일간 집계 (완료된 매출만)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sales_daily_rollup (
+                branch_id INTEGER,
+                date DATE,
+                employee_id INTEGER,
+                sales_count INTEGER NOT NULL,
+                amount_sum REAL NOT NULL,
+                PRIMARY KEY (branch_id, date, employee_id)
+            )
+        """)
+
+        # 급여 월간 집계 (급여는 월 단위 데이터)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS payroll_monthly_rollup (
+                branch_id INTEGER,
+                year INTEGER,
+                month INTEGER,
+                payroll_count INTEGER NOT NULL,
+                salary_sum REAL NOT NULL,
+                salary_count INTEGER NOT NULL,
+                work_hours_sum REAL NOT NULL,
+                PRIMARY KEY (branch_id, year, month)
+            )
+        """)
+
+        # 원본 행이 바뀌면 해당 구간만 재계산 (UPDATE는 이전/이후 구간 모두)
+        for table in ROLLUP_SPECS:
+            for event, refs in (("INSERT", ("NEW",)), ("DELETE", ("OLD",)), ("UPDATE", ("OLD", "NEW"))):
+                body = "".join(_rollup_refresh_sql(table, ref) for ref in refs)
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS trg_{table}_rollup_{event.lower()}
+                    AFTER {event} ON {table}
+                    BEGIN
+                    {body}
+                    END
+                """)
+
+        if needs_backfill:
+            self._rebuild_rollups(cursor)
+
+    def _rebuild_rollups(self, cursor, branch_id: Optional[int] = None) -> Dict[str, int]:
+        """원본 데이터로 집계 테이블 전체(또는 매장 하나)를 다시 계산"""
+        counts = {}
+        params = (branch_id,) if branch_id is not None else ()
+        for table, spec in ROLLUP_SPECS.items():
+            where = "WHERE branch_id = ?" if branch_id is not None else ""
+            cursor.execute(f"DELETE FROM {spec['rollup']} {where}", params)
+
+            filters = [spec["filter"]] if spec["filter"] else []
+            if branch_id is not None:
+                filters.append("branch_id = ?")
+            source_where = f"WHERE {' AND '.join(filters)}" if filters else ""
+            keys = ", ".join(spec["keys"])
+            cursor.execute(f"""
+                INSERT INTO {spec['rollup']} ({keys}, {', '.join(spec['columns'])})
+                SELECT {keys}, {', '.join(spec['columns'].values())}
+                FROM {table} {source_where}
+                GROUP BY {keys}
+            """, params)
+            counts[spec["rollup"]] = cursor.rowcount
+        return counts
+
+    def rebuild_rollups(self, branch_id: Optional[int] = None) -> Dict[str, int]:
+        """집계 테이블 재계산 (백필/복구용), 집계 테이블별 생성 행 수 반환"""
+        try:
+            with self.db.write() as conn:
+                counts = self._rebuild_rollups(conn.cursor(), branch_id)
+            logger.info(f"집계 테이블 재계산 완료: {counts}")
+            return counts
+        except Exception as e:
+            logger.error(f"집계 테이블 재계산 실패: {e}")
+            return {}
+
     def _load_sample_data(self):
         """샘플 데이터 로드"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.write() as conn:
                 cursor = conn.cursor()
 
                 # 브랜드 데이터 확인
@@ -249,7 +420,6 @@ class CentralDataLayer:
                 if cursor.fetchone()[0] == 0:
                     self._insert_sample_inventory(cursor)
 
-                conn.commit()
                 logger.info("샘플 데이터 로드 완료")
 
         except Exception as e:
@@ -434,29 +604,27 @@ class CentralDataLayer:
         brand_id: Optional[int] if Optional is not None else None = None    # pyright: ignore[reportGeneralTypeIssues] if ignore is not None else None
     ) -> List[Dict[str, Any] if List is not None else None]:
         """직원 목록 조회"""
-        with self.lock:
-            try:
-                with sqlite3.connect(self.db_path) as conn:
-                    conn.row_factory = sqlite3.Row
-                    cursor = conn.cursor()
+        try:
+            with self.db.read() as conn:
+                cursor = conn.cursor()
 
-                    query = "SELECT * FROM employees WHERE status = 'active'"
-                    params = []
+                query = "SELECT * FROM employees WHERE status = 'active'"
+                params = []
 
-                    if branch_id:
-                        query += " AND branch_id = ?"
-                        params.append(branch_id)
+                if branch_id:
+                    query += " AND branch_id = ?"
+                    params.append(branch_id)
 
-                    if brand_id:
-                        query += " AND brand_id = ?"
-                        params.append(brand_id)
+                if brand_id:
+                    query += " AND brand_id = ?"
+                    params.append(brand_id)
 
-                    cursor.execute(query, params)
-                    return [dict(row) for row in cursor.fetchall()]
+                cursor.execute(query, params)
+                return [dict(row) for row in cursor.fetchall()]
 
-            except Exception as e:
-                logger.error(f"직원 목록 조회 실패: {e}")
-                return []  # noqa
+        except Exception as e:
+            logger.error(f"직원 목록 조회 실패: {e}")
+            return []  # noqa
 
     def get_attendance_data(
         self,
@@ -466,292 +634,283 @@ class CentralDataLayer:
         date_to: Optional[str] if Optional is not None else None = None       # pyright: ignore[reportGeneralTypeIssues] if ignore is not None else None
     ) -> List[Dict[str, Any] if List is not None else None]:
         """출퇴근 데이터 조회"""
-        with self.lock:
-            try:
-                with sqlite3.connect(self.db_path) as conn:
-                    conn.row_factory = sqlite3.Row
-                    cursor = conn.cursor()
-
-                    query = """
-                        SELECT a.*, e.name as employee_name, e.position, b.name as branch_name
-                        FROM attendance a
-                        JOIN employees e ON a.employee_id = e.id
-                        JOIN branches b ON a.branch_id = b.id
-                        WHERE 1=1
-                    """
-                    params = []
-
-                    if employee_id:
-                        query += " AND a.employee_id = ?"
-                        params.append(employee_id)
-
-                    if branch_id:
-                        query += " AND a.branch_id = ?"
-                        params.append(branch_id)
-
-                    if date_from:
-                        query += " AND a.date >= ?"
-                        params.append(date_from)
-
-                    if date_to:
-                        query += " AND a.date <= ?"
-                        params.append(date_to)
-
-                    query += " ORDER BY a.date DESC, a.clock_in DESC"
-
-                    cursor.execute(query, params)
-                    return [dict(row) for row in cursor.fetchall()]
-
-            except Exception as e:
-                logger.error(f"출퇴근 데이터 조회 실패: {e}")
-                return []
+        try:
+            with self.db.read() as conn:
+                cursor = conn.cursor()
+
+                query = """
+                    SELECT a.*, e.name as employee_name, e.position, b.name as branch_name
+                    FROM attendance a
+                    JOIN employees e ON a.employee_id = e.id
+                    JOIN branches b ON a.branch_id = b.id
+                    WHERE 1=1
+                """
+                params = []
+
+                if employee_id:
+                    query += " AND a.employee_id = ?"
+                    params.append(employee_id)
+
+                if branch_id:
+                    query += " AND a.branch_id = ?"
+                    params.append(branch_id)
+
+                if date_from:
+                    query += " AND a.date >= ?"
+                    params.append(date_from)
+
+                if date_to:
+                    query += " AND a.date <= ?"
+                    params.append(date_to)
+
+                query += " ORDER BY a.date DESC, a.clock_in DESC"
+
+                cursor.execute(query, params)
+                return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"출퇴근 데이터 조회 실패: {e}")
+            return []
 
     def get_sales_data(self, branch_id: Optional[int] = None, employee_id: int = None,
                        date_from: str = None, date_to: str = None) -> List[Dict[str, Any] if List is not None else None]:
         """매출 데이터 조회"""
-        with self.lock:
-            try:
-                with sqlite3.connect(self.db_path) as conn:
-                    conn.row_factory = sqlite3.Row
-                    cursor = conn.cursor()
-
-                    query = """
-                        SELECT s.*, e.name as employee_name, b.name as branch_name
-                        FROM sales s
-                        JOIN employees e ON s.employee_id = e.id
-                        JOIN branches b ON s.branch_id = b.id
-                        WHERE s.status = 'completed'
-                    """
-                    params = []
-
-                    if branch_id:
-                        query += " AND s.branch_id = ?"
-                        params.append(branch_id)
-
-                    if employee_id:
-                        query += " AND s.employee_id = ?"
-                        params.append(employee_id)
-
-                    if date_from:
-                        query += " AND s.date >= ?"
-                        params.append(date_from)
-
-                    if date_to:
-                        query += " AND s.date <= ?"
-                        params.append(date_to)
-
-                    query += " ORDER BY s.date DESC, s.created_at DESC"
-
-                    cursor.execute(query, params)
-                    return [dict(row) for row in cursor.fetchall()]
-
-            except Exception as e:
-                logger.error(f"매출 데이터 조회 실패: {e}")
-                return []
+        try:
+            with self.db.read() as conn:
+                cursor = conn.cursor()
+
+                query = """
+                    SELECT s.*, e.name as employee_name, b.name as branch_name
+                    FROM sales s
+                    JOIN employees e ON s.employee_id = e.id
+                    JOIN branches b ON s.branch_id = b.id
+                    WHERE s.status = 'completed'
+                """
+                params = []
+
+                if branch_id:
+                    query += " AND s.branch_id = ?"
+                    params.append(branch_id)
+
+                if employee_id:
+                    query += " AND s.employee_id = ?"
+                    params.append(employee_id)
+
+                if date_from:
+                    query += " AND s.date >= ?"
+                    params.append(date_from)
+
+                if date_to:
+                    query += " AND s.date <= ?"
+                    params.append(date_to)
+
+                query += " ORDER BY s.date DESC, s.created_at DESC"
+
+                cursor.execute(query, params)
+                return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"매출 데이터 조회 실패: {e}")
+            return []
 
     def get_payroll_data(self, employee_id: Optional[int] = None, branch_id: int = None,
                          year: int = None, month: int = None) -> List[Dict[str, Any] if List is not None else None]:
         """급여 데이터 조회"""
-        with self.lock:
-            try:
-                with sqlite3.connect(self.db_path) as conn:
-                    conn.row_factory = sqlite3.Row
-                    cursor = conn.cursor()
-
-                    query = """
-                        SELECT p.*, e.name as employee_name, b.name as branch_name
-                        FROM payroll p
-                        JOIN employees e ON p.employee_id = e.id
-                        JOIN branches b ON p.branch_id = b.id
-                        WHERE 1=1
-                    """
-                    params = []
-
-                    if employee_id:
-                        query += " AND p.employee_id = ?"
-                        params.append(employee_id)
-
-                    if branch_id:
-                        query += " AND p.branch_id = ?"
-                        params.append(branch_id)
-
-                    if year:
-                        query += " AND p.year = ?"
-                        params.append(year)
-
-                    if month:
-                        query += " AND p.month = ?"
-                        params.append(month)
-
-                    query += " ORDER BY p.year DESC, p.month DESC"
-
-                    cursor.execute(query, params)
-                    return [dict(row) for row in cursor.fetchall()]
-
-            except Exception as e:
-                logger.error(f"급여 데이터 조회 실패: {e}")
-                return []
+        try:
+            with self.db.read() as conn:
+                cursor = conn.cursor()
+
+                query = """
+                    SELECT p.*, e.name as employee_name, b.name as branch_name
+                    FROM payroll p
+                    JOIN employees e ON p.employee_id = e.id
+                    JOIN branches b ON p.branch_id = b.id
+                    WHERE 1=1
+                """
+                params = []
+
+                if employee_id:
+                    query += " AND p.employee_id = ?"
+                    params.append(employee_id)
+
+                if branch_id:
+                    query += " AND p.branch_id = ?"
+                    params.append(branch_id)
+
+                if year:
+                    query += " AND p.year = ?"
+                    params.append(year)
+
+                if month:
+                    query += " AND p.month = ?"
+                    params.append(month)
+
+                query += " ORDER BY p.year DESC, p.month DESC"
+
+                cursor.execute(query, params)
+                return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"급여 데이터 조회 실패: {e}")
+            return []
 
     def get_integrated_analytics(self, branch_id: int, period: str = "month") -> Dict[str, Any] if Dict is not None else None:
         """통합 분석 데이터 조회"""
-        with self.lock:
-            try:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-
-                    # 기간 설정
-                    if period == "week":
-                        date_from = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-                    elif period == "month":
-                        date_from = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-                    else:  # year
-                        date_from = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
-
-                    date_to = datetime.now().strftime('%Y-%m-%d')
-
-                    # 1. 출퇴근 통계
-                    cursor.execute("""
-                        SELECT 
-                            COUNT(*) as total_records,
-                            SUM(CASE WHEN is_late = 1 THEN 1 ELSE 0 END) as late_count,
-                            SUM(CASE WHEN is_overtime = 1 THEN 1 ELSE 0 END) as overtime_count,
-                            AVG(work_hours) as avg_work_hours,
-                            COUNT(DISTINCT employee_id) as active_employees
-                        FROM attendance 
-                        WHERE branch_id = ? AND date BETWEEN ? AND ?
-                    """, (branch_id, date_from, date_to))
-
-                    attendance_stats = dict(cursor.fetchone())
-
-                    # 2. 매출 통계
-                    cursor.execute("""
-                        SELECT 
-                            COUNT(*) as total_sales,
-                            SUM(amount) as total_amount,
-                            AVG(amount) as avg_amount,
-                            COUNT(DISTINCT employee_id) as sales_employees
-                        FROM sales 
-                        WHERE branch_id = ? AND date BETWEEN ? AND ? AND status = 'completed'
-                    """, (branch_id, date_from, date_to))
-
-                    sales_stats = dict(cursor.fetchone())
-
-                    # 3. 급여 통계
-                    cursor.execute("""
-                        SELECT 
-                            COUNT(*) as total_payroll,
-                            SUM(net_salary) as total_salary,
-                            AVG(net_salary) as avg_salary,
-                            SUM(work_hours) as total_work_hours
-                        FROM payroll 
-                        WHERE branch_id = ? AND year = ? AND month = ?
-                    """, (branch_id, datetime.now().year, datetime.now().month))
-
-                    payroll_stats = dict(cursor.fetchone())
-
-                    # 4. 효율성 분석
-                    total_sales = sales_stats.get('total_amount', 0) if sales_stats else 0
-                    total_salary = payroll_stats.get('total_salary', 0) if payroll_stats else 0
-                    labor_cost_ratio = (total_salary / total_sales * 100) if total_sales > 0 else 0
-
-                    # 5. 개선 제안 생성
-                    insights = []
-                    recommendations = []
-
-                    if (attendance_stats.get('late_count', 0) if attendance_stats else 0) > ((attendance_stats.get('total_records', 0) if attendance_stats else 0) * 0.1):
-                        insights.append("지각률이 10%를 초과하고 있습니다.")
-                        recommendations.append("출근 시간 관리 강화가 필요합니다.")
-
-                    if labor_cost_ratio > 30:
-                        insights.append("인건비 비율이 30%를 초과하고 있습니다.")
-                        recommendations.append("인력 효율성 개선이 필요합니다.")
-
-                    if (sales_stats.get('avg_amount', 0) if sales_stats else 0) < 10000:
-                        insights.append("평균 매출이 낮습니다.")
-                        recommendations.append("업셀링 전략 수립이 필요합니다.")
-
-                    return {
-                        "period": period,
-                        "date_range": {"from": date_from, "to": date_to},
-                        "attendance": attendance_stats,
-                        "sales": sales_stats,
-                        "payroll": payroll_stats,
-                        "efficiency": {
-                            "labor_cost_ratio": round(labor_cost_ratio, 2),
-                            "sales_per_employee": round(total_sales / (attendance_stats.get('active_employees', 1) if attendance_stats else 1), 2),
-                            "hours_per_sale": round((attendance_stats.get('avg_work_hours', 0) if attendance_stats else 0) / max(sales_stats.get('total_sales', 1) if sales_stats else 1, 1), 2)
-                        },
-                        "insights": insights,
-                        "recommendations": recommendations,
-                        "generated_at": datetime.now().isoformat()
-                    }
-
-            except Exception as e:
-                logger.error(f"통합 분석 데이터 조회 실패: {e}")
-                return {}
+        try:
+            with self.db.read() as conn:
+                cursor = conn.cursor()
+
+                # 기간 설정
+                if period == "week":
+                    date_from = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+                elif period == "month":
+                    date_from = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+                else:  # year
+                    date_from = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
+
+                date_to = datetime.now().strftime('%Y-%m-%d')
+
+                # 1. 출퇴근 통계 (일간 집계 합산)
+                cursor.execute("""
+                    SELECT
+                        COALESCE(SUM(record_count), 0) as total_records,
+                        COALESCE(SUM(late_count), 0) as late_count,
+                        COALESCE(SUM(overtime_count), 0) as overtime_count,
+                        SUM(work_hours_sum) / NULLIF(SUM(work_hours_count), 0) as avg_work_hours,
+                        COUNT(DISTINCT employee_id) as active_employees
+                    FROM attendance_daily_rollup
+                    WHERE branch_id = ? AND date BETWEEN ? AND ?
+                """, (branch_id, date_from, date_to))
+
+                attendance_stats = dict(cursor.fetchone())
+
+                # 2. 매출 통계 (완료 매출 일간 집계 합산)
+                cursor.execute("""
+                    SELECT
+                        COALESCE(SUM(sales_count), 0) as total_sales,
+                        COALESCE(SUM(amount_sum), 0) as total_amount,
+                        SUM(amount_sum) / NULLIF(SUM(sales_count), 0) as avg_amount,
+                        COUNT(DISTINCT employee_id) as sales_employees
+                    FROM sales_daily_rollup
+                    WHERE branch_id = ? AND date BETWEEN ? AND ?
+                """, (branch_id, date_from, date_to))
+
+                sales_stats = dict(cursor.fetchone())
+
+                # 3. 급여 통계 (월간 집계)
+                cursor.execute("""
+                    SELECT
+                        COALESCE(SUM(payroll_count), 0) as total_payroll,
+                        COALESCE(SUM(salary_sum), 0) as total_salary,
+                        SUM(salary_sum) / NULLIF(SUM(salary_count), 0) as avg_salary,
+                        COALESCE(SUM(work_hours_sum), 0) as total_work_hours
+                    FROM payroll_monthly_rollup
+                    WHERE branch_id = ? AND year = ? AND month = ?
+                """, (branch_id, datetime.now().year, datetime.now().month))
+
+                payroll_stats = dict(cursor.fetchone())
+
+                # 4. 효율성 분석
+                total_sales = sales_stats.get('total_amount', 0) if sales_stats else 0
+                total_salary = payroll_stats.get('total_salary', 0) if payroll_stats else 0
+                labor_cost_ratio = (total_salary / total_sales * 100) if total_sales > 0 else 0
+
+                # 5. 개선 제안 생성
+                insights = []
+                recommendations = []
+
+                late_count = attendance_stats.get('late_count', 0) if attendance_stats else 0
+                total_records = attendance_stats.get('total_records', 0) if attendance_stats else 0
+                if late_count > total_records * 0.1:
+                    insights.append("지각률이 10%를 초과하고 있습니다.")
+                    recommendations.append("출근 시간 관리 강화가 필요합니다.")
+
+                if labor_cost_ratio > 30:
+                    insights.append("인건비 비율이 30%를 초과하고 있습니다.")
+                    recommendations.append("인력 효율성 개선이 필요합니다.")
+
+                if (sales_stats.get('avg_amount') or 0) < 10000:
+                    insights.append("평균 매출이 낮습니다.")
+                    recommendations.append("업셀링 전략 수립이 필요합니다.")
+
+                return {
+                    "period": period,
+                    "date_range": {"from": date_from, "to": date_to},
+                    "attendance": attendance_stats,
+                    "sales": sales_stats,
+                    "payroll": payroll_stats,
+                    "efficiency": {
+                        "labor_cost_ratio": round(labor_cost_ratio, 2),
+                        "sales_per_employee": round(total_sales / max(attendance_stats.get('active_employees') or 1, 1), 2),
+                        "hours_per_sale": round(
+                            (attendance_stats.get('avg_work_hours') or 0) / max(sales_stats.get('total_sales') or 1, 1), 2
+                        )
+                    },
+                    "insights": insights,
+                    "recommendations": recommendations,
+                    "generated_at": datetime.now().isoformat()
+                }
+
+        except Exception as e:
+            logger.error(f"통합 분석 데이터 조회 실패: {e}")
+            return {}
 
     def create_notification(self, user_id: int, title: str, message: str,
                             notification_type: str = "info", priority: str = "normal") -> bool:
         """알림 생성"""
-        with self.lock:
-            try:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        INSERT INTO notifications (user_id, title, message, type, priority)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (user_id, title, message, notification_type, priority))
-                    conn.commit()
-                    return True
-            except Exception as e:
-                logger.error(f"알림 생성 실패: {e}")
-                return False
+        try:
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT INTO notifications (user_id, title, message, type, priority)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (user_id, title, message, notification_type, priority))
+                return True
+        except Exception as e:
+            logger.error(f"알림 생성 실패: {e}")
+            return False
 
     def get_notifications(self, user_id: Optional[int] = None, is_read: bool = None) -> List[Dict[str, Any] if List is not None else None]:
         """알림 목록 조회"""
-        with self.lock:
-            try:
-                with sqlite3.connect(self.db_path) as conn:
-                    conn.row_factory = sqlite3.Row
-                    cursor = conn.cursor()
+        try:
+            with self.db.read() as conn:
+                cursor = conn.cursor()
 
-                    query = "SELECT * FROM notifications WHERE 1=1"
-                    params = []
+                query = "SELECT * FROM notifications WHERE 1=1"
+                params = []
 
-                    if user_id:
-                        query += " AND user_id = ?"
-                        params.append(user_id)
+                if user_id:
+                    query += " AND user_id = ?"
+                    params.append(user_id)
 
-                    if is_read is not None:
-                        query += " AND is_read = ?"
-                        params.append(is_read)
+                if is_read is not None:
+                    query += " AND is_read = ?"
+                    params.append(is_read)
 
-                    query += " ORDER BY created_at DESC"
+                query += " ORDER BY created_at DESC"
 
-                    cursor.execute(query, params)
-                    return [dict(row) for row in cursor.fetchall()]
+                cursor.execute(query, params)
+                return [dict(row) for row in cursor.fetchall()]
 
-            except Exception as e:
-                logger.error(f"알림 목록 조회 실패: {e}")
-                return []
+        except Exception as e:
+            logger.error(f"알림 목록 조회 실패: {e}")
+            return []
 
     def save_analytics_result(self, branch_id: int, analysis_type: str, period: str,
                               data: Dict[str, Any] if Dict is not None else None, insights: List[str] if List is not None else None, recommendations: List[str] if List is not None else None) -> bool:
         """분석 결과 저장"""
-        with self.lock:
-            try:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        INSERT INTO analytics (branch_id, analysis_type, period, data, insights, recommendations)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (branch_id, analysis_type, period, json.dumps(data),
-                          json.dumps(insights), json.dumps(recommendations)))
-                    conn.commit()
-                    return True
-            except Exception as e:
-                logger.error(f"분석 결과 저장 실패: {e}")
-                return False
+        try:
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT INTO analytics (branch_id, analysis_type, period, data, insights, recommendations)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (branch_id, analysis_type, period, json.dumps(data),
+                      json.dumps(insights), json.dumps(recommendations)))
+                return True
+        except Exception as e:
+            logger.error(f"분석 결과 저장 실패: {e}")
+            return False
 
 
 # 전역 인스턴스
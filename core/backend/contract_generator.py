@@ -2,9 +2,9 @@ import logging
 from flask import Blueprint, request, jsonify, current_app
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-import sqlite3
 import os
 import json
+from core.backend.sidecar_db import get_sidecar_db
 from typing import Optional
 args = None  # pyright: ignore
 form = None  # pyright: ignore
@@ -24,6 +24,7 @@ class ContractGenerator:
     def __init__(self, db_path="data/contracts.db"):
         """계약 생성기 초기화"""
         self.db_path = db_path
+        self.db = get_sidecar_db(db_path)
         self.init_database()
 
     def init_database(self):
@@ -31,7 +32,7 @@ class ContractGenerator:
         try:
             os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.write() as conn:
                 cursor = conn.cursor()
 
                 # 계약 템플릿 테이블
@@ -91,8 +92,6 @@ class ContractGenerator:
                     )
                 ''')
 
-                conn.commit()
-
             # 기본 템플릿 생성
             self.create_default_templates()
 
@@ -172,7 +171,7 @@ class ContractGenerator:
                 }
             ]
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.write() as conn:
                 cursor = conn.cursor()
 
                 if templates is not None:
@@ -188,8 +187,6 @@ class ContractGenerator:
                             template["variables"] if template is not None else None
                         ))
 
-                conn.commit()
-
             logger.info("기본 계약 템플릿 생성 완료")
 
         except Exception as e:
@@ -198,7 +195,7 @@ class ContractGenerator:
     def get_templates(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
         """계약 템플릿 목록 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.read() as conn:
                 cursor = conn.cursor()
 
                 if category:
@@ -236,7 +233,7 @@ class ContractGenerator:
     def create_template(self, name: str, category: str, template_content: str, variables: List[str]) -> bool:
         """새 계약 템플릿 생성"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.write() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute('''
@@ -244,7 +241,6 @@ class ContractGenerator:
                     VALUES (?, ?, ?, ?)
                 ''', (name, category, template_content, json.dumps(variables)))
 
-                conn.commit()
                 logger.info(f"템플릿 생성 완료: {name}")
                 return True
 
@@ -255,7 +251,7 @@ class ContractGenerator:
     def generate_contract(self, template_id: int, variables: Dict[str, str], title: str) -> Optional[Dict[str, Any]]:
         """계약 생성"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.write() as conn:
                 cursor = conn.cursor()
 
                 # 템플릿 조회
@@ -311,8 +307,6 @@ class ContractGenerator:
                     VALUES (?, ?, ?, ?)
                 ''', (contract_id, "생성", "계약 생성", variables.get('created_by', 'system') if variables else 'system'))
 
-                conn.commit()
-
                 logger.info(f"계약 생성 완료: {contract_number}")
 
                 return {
@@ -330,7 +324,7 @@ class ContractGenerator:
     def get_contracts(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
         """계약 목록 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.read() as conn:
                 cursor = conn.cursor()
 
                 if status:
@@ -367,7 +361,7 @@ class ContractGenerator:
     def get_contract(self,  contract_id: int) -> Optional[Dict[str, Any]]:
         """계약 상세 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.read() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute('''
@@ -432,7 +426,7 @@ class ContractGenerator:
     def update_contract_status(self,  contract_id: int,  status: str,  updated_by: str) -> bool:
         """계약 상태 업데이트"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db.write() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute('''
@@ -447,8 +441,6 @@ class ContractGenerator:
                     VALUES (?, ?, ?, ?)
                 ''', (contract_id, "상태변경", f"상태를 {status}로 변경", updated_by))
 
-                conn.commit()
-
                 logger.info(f"계약 상태 업데이트 완료: {contract_id} -> {status}")
                 return True
 
@@ -653,7 +645,7 @@ def update_contract_status_api(contract_id):
 def get_contract_statistics_api():
     """계약 통계 API"""
     try:
-        with sqlite3.connect(contract_generator.db_path) as conn:
+        with contract_generator.db.read() as conn:
             cursor = conn.cursor()
 
             # 전체 계약 수
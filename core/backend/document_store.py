@@ -0,0 +1,598 @@
+"""
+JSON 문서 저장소
+core/backend 관리자들(마켓플레이스, 피드백, 테스트, 커스터마이즈, 플러그인 설정 등)이
+JSON 파일 전체를 읽고 다시 쓰던 저장 방식을 대체하는 공용 계층
+
+- 컬렉션 = 스냅샷 파일(기존 JSON 파일과 같은 형식) + 추가 전용 변경 로그(<파일>.log)
+- 변경은 로그에 한 줄씩 추가하므로 쓰기 비용은 문서 크기에 비례 (전체 파일 재작성 없음)
+- 로그가 compact_threshold건을 넘으면 스냅샷을 임시 파일에 쓰고 os.replace로 교체한 뒤 로그를 비움
+- 프로세스 간에는 <파일>.lock에 대한 flock(쓰기 배타 / 읽기 공유)으로 직렬화하고,
+  다른 프로세스가 추가한 로그는 읽기 전에 이어서 반영
+- category, plugin_id, status 같은 자주 거르는 필드는 보조 인덱스로 조회
+"""
+
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 내 락만 사용
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 로그가 이 건수를 넘으면 스냅샷으로 합침
+DEFAULT_COMPACT_THRESHOLD = 1000
+
+_MISSING = object()
+
+IndexSpec = Union[str, Tuple[str, Callable[[Any], Any]]]
+
+
+def _clone(value: Any) -> Any:
+    """JSON 값 깊은 복사 (dict/list만 재귀 복사, copy.deepcopy보다 빠름)"""
+    if isinstance(value, dict):
+        return {k: _clone(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_clone(v) for v in value]
+    return value
+
+
+class DocumentCollection:
+    """
+    JSON 문서 컬렉션
+
+    Args:
+        path: 스냅샷 파일 경로 (기존 JSON 파일을 그대로 스냅샷으로 사용)
+        key: 문서 키 필드 이름 또는 문서 -> 키 함수. None이면 추가 순서대로 자동 키
+             (자동 키는 압축 후 다시 매겨지므로 외부에 저장하지 않음)
+        layout: 스냅샷 형식. "list"는 문서 목록, "dict"는 {키: 문서} 객체
+        indexes: 보조 인덱스. 필드 이름 또는 (인덱스 이름, 문서 -> 값 함수).
+                 값이 리스트면 각 원소로 인덱싱
+    """
+
+    def __init__(self, path: Union[str, Path], key: Union[str, Callable[[Any], Any], None] = "id",
+                 layout: str = "list", indexes: Iterable[IndexSpec] = (),
+                 compact_threshold: int = DEFAULT_COMPACT_THRESHOLD, fsync: bool = False):
+        if layout not in ("list", "dict"):
+            raise ValueError(f"지원하지 않는 스냅샷 형식: {layout}")
+        self.path = Path(path)
+        self.log_path = self.path.with_name(self.path.name + ".log")
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.layout = layout
+        self.key = key
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._docs: Dict[str, Any] = {}
+        self._positions: Dict[str, int] = {}
+        self._extractors: Dict[str, Callable[[Any], Any]] = {}
+        self._indexes: Dict[str, Dict[Any, Set[str]]] = {}
+        self._next_position = 0
+        self._next_seq = 0
+        # 메모리 내용이 바뀔 때마다 증가 (파생 인덱스의 재구성 여부 판단용)
+        self._version = 0
+
+        self._snapshot_sig: Optional[tuple] = None
+        self._log_offset = 0
+        self._log_entries = 0
+        self._loaded = False
+
+        self._lock = threading.RLock()
+        self._lock_fd: Optional[int] = None
+        self._lock_depth = 0
+        self.stats = {"appends": 0, "replayed": 0, "reloads": 0, "compactions": 0}
+
+        for spec in indexes:
+            self.ensure_index(spec)
+
+    # ==================== 락 / 동기화 ====================
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """프로세스 내 RLock + 프로세스 간 flock (바깥 호출에서만 flock)"""
+        with self._lock:
+            if fcntl is None or self._lock_depth > 0:
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+
+            if self._lock_fd is None:
+                self._lock_fd = os.open(str(self.lock_path), os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            self._lock_depth = 1
+            try:
+                yield
+            finally:
+                self._lock_depth = 0
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _file_sig(path: Path) -> Optional[tuple]:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _sync(self):
+        """스냅샷이 바뀌었으면 다시 읽고, 아니면 로그에 새로 추가된 부분만 반영 (락 안에서 호출)"""
+        if not self._loaded or self._file_sig(self.path) != self._snapshot_sig:
+            self._reload()
+            return
+        try:
+            size = os.path.getsize(self.log_path)
+        except FileNotFoundError:
+            size = 0
+        if size < self._log_offset:
+            # 다른 프로세스가 압축하면서 로그를 비웠는데 스냅샷 교체를 놓친 경우
+            self._reload()
+        elif size > self._log_offset:
+            self._replay()
+
+    def _reload(self):
+        self._docs.clear()
+        self._positions.clear()
+        for index in self._indexes.values():
+            index.clear()
+        self._next_position = 0
+        self._next_seq = 0
+        self._version += 1
+        self._snapshot_sig = self._file_sig(self.path)
+
+        if self._snapshot_sig is not None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.error(f"스냅샷 로드 실패 ({self.path}): {e}")
+                data = None
+            for key, doc in self._snapshot_items(data):
+                self._store(key, doc)
+
+        self._log_offset = 0
+        self._log_entries = 0
+        self._loaded = True
+        self.stats["reloads"] += 1
+        self._replay()
+
+    def _snapshot_items(self, data) -> Iterator[Tuple[str, Any]]:
+        if self.layout == "dict":
+            if isinstance(data, dict):
+                for key, doc in data.items():
+                    yield str(key), doc
+            return
+        if not isinstance(data, list):
+            return
+        for doc in data:
+            key = self._key_of(doc)
+            if key is not None:
+                yield key, doc
+
+    def _replay(self):
+        """로그의 _log_offset 이후 완전한 줄만 반영 (마지막 줄이 잘려 있으면 다음에 다시 읽음)"""
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(self._log_offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return
+        for line in chunk[:end].split(b"\n"):
+            if not line.strip():
+                continue
+            try:
+                self._apply(json.loads(line))
+            except Exception as e:
+                logger.warning(f"변경 로그 항목 무시 ({self.log_path}): {e}")
+            self._log_entries += 1
+            self.stats["replayed"] += 1
+        self._log_offset += end + 1
+
+    # ==================== 메모리 반영 / 인덱스 ====================
+
+    def _key_of(self, doc: Any) -> Optional[str]:
+        if self.key is None:
+            key = str(self._next_seq)
+        elif callable(self.key):
+            key = self.key(doc)
+        else:
+            key = doc.get(self.key) if isinstance(doc, dict) else None
+        return None if key is None else str(key)
+
+    def _store(self, key: str, doc: Any):
+        old = self._docs.get(key, _MISSING)
+        if old is not _MISSING:
+            self._unindex(key, old)
+        else:
+            self._positions[key] = self._next_position
+            self._next_position += 1
+        self._docs[key] = doc
+        self._index(key, doc)
+        self._version += 1
+        if self.key is None and key.isdigit():
+            self._next_seq = max(self._next_seq, int(key) + 1)
+
+    def _drop(self, key: str) -> bool:
+        doc = self._docs.pop(key, _MISSING)
+        if doc is _MISSING:
+            return False
+        self._unindex(key, doc)
+        self._positions.pop(key, None)
+        self._version += 1
+        return True
+
+    def _apply(self, entry: Dict[str, Any]):
+        op = entry["op"]
+        if op == "put":
+            self._store(entry["k"], entry["d"])
+        elif op == "patch":
+            doc = self._docs.get(entry["k"])
+            if isinstance(doc, dict):
+                self._store(entry["k"], dict(doc, **entry["d"]))
+        elif op == "del":
+            for key in entry.get("ks") or [entry["k"]]:
+                self._drop(key)
+        elif op == "clear":
+            for key in list(self._docs):
+                self._drop(key)
+
+    @staticmethod
+    def _index_values(value: Any) -> List[Any]:
+        if value is None:
+            return []
+        if isinstance(value, (list, tuple, set)):
+            return [v for v in value if isinstance(v, (str, int, float, bool))]
+        return [value] if isinstance(value, (str, int, float, bool)) else []
+
+    def _index(self, key: str, doc: Any):
+        for name, extractor in self._extractors.items():
+            try:
+                values = self._index_values(extractor(doc))
+            except Exception:
+                continue
+            for value in values:
+                self._indexes[name].setdefault(value, set()).add(key)
+
+    def _unindex(self, key: str, doc: Any):
+        for name, extractor in self._extractors.items():
+            try:
+                values = self._index_values(extractor(doc))
+            except Exception:
+                continue
+            index = self._indexes[name]
+            for value in values:
+                keys = index.get(value)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del index[value]
+
+    def ensure_index(self, spec: IndexSpec):
+        """보조 인덱스 추가 (이미 적재된 문서도 인덱싱)"""
+        if isinstance(spec, str):
+            name = spec
+            extractor = lambda doc, field=spec: doc.get(field) if isinstance(doc, dict) else None  # noqa: E731
+        else:
+            name, extractor = spec
+        with self._lock:
+            if name in self._extractors:
+                return
+            self._extractors[name] = extractor
+            self._indexes[name] = {}
+            for key, doc in self._docs.items():
+                for value in self._index_values(extractor(doc)):
+                    self._indexes[name].setdefault(value, set()).add(key)
+
+    # ==================== 조회 ====================
+
+    def exists(self) -> bool:
+        """스냅샷이나 변경 로그가 있는지 (처음 만든 컬렉션인지 확인용)"""
+        return self.path.exists() or self.log_path.exists()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._locked(exclusive=False):
+            self._sync()
+            doc = self._docs.get(str(key), _MISSING)
+            return default if doc is _MISSING else _clone(doc)
+
+    def __contains__(self, key: Any) -> bool:
+        with self._locked(exclusive=False):
+            self._sync()
+            return str(key) in self._docs
+
+    def count(self, **filters) -> int:
+        with self._locked(exclusive=False):
+            self._sync()
+            if not filters:
+                return len(self._docs)
+            return len(self._match(filters))
+
+    def keys(self, **filters) -> List[str]:
+        with self._locked(exclusive=False):
+            self._sync()
+            return self._match(filters) if filters else list(self._docs)
+
+    def all(self) -> List[Any]:
+        """전체 문서 (추가 순서)"""
+        return self.find()
+
+    def items(self, **filters) -> List[Tuple[str, Any]]:
+        with self._locked(exclusive=False):
+            self._sync()
+            keys = self._match(filters) if filters else list(self._docs)
+            return [(key, _clone(self._docs[key])) for key in keys]
+
+    def version(self) -> int:
+        """변경 번호 (다른 프로세스의 변경도 반영한 뒤의 값). 같으면 내용도 같음"""
+        with self._locked(exclusive=False):
+            self._sync()
+            return self._version
+
+    def snapshot(self, copy: bool = True) -> Tuple[int, List[Tuple[str, Any]]]:
+        """
+        변경 번호와 전체 (키, 문서) 목록을 같은 시점 기준으로 반환
+        copy=False면 내부 문서를 그대로 돌려줌 (읽기 전용으로만 사용). 문서는 바뀔 때 새 객체로
+        교체되므로 이전 스냅샷과 객체가 같은(is) 문서는 바뀌지 않은 문서
+        """
+        with self._locked(exclusive=False):
+            self._sync()
+            if not copy:
+                return self._version, list(self._docs.items())
+            return self._version, [(key, _clone(doc)) for key, doc in self._docs.items()]
+
+    def find(self, where: Optional[Callable[[Any], bool]] = None, limit: Optional[int] = None,
+             **filters) -> List[Any]:
+        """
+        필드 값이 같은 문서 목록 (추가 순서)
+        인덱스가 있는 필드는 인덱스로 후보를 좁히고, 나머지 필드와 where 조건은 후보에만 검사
+        """
+        with self._locked(exclusive=False):
+            self._sync()
+            keys = self._match(filters)
+            results = []
+            for key in keys:
+                doc = self._docs[key]
+                if where is not None and not where(doc):
+                    continue
+                results.append(_clone(doc))
+                if limit is not None and len(results) >= limit:
+                    break
+            return results
+
+    def _match(self, filters: Dict[str, Any]) -> List[str]:
+        indexed = [name for name in filters if name in self._indexes]
+        if indexed:
+            candidate_sets = sorted(
+                (self._indexes[name].get(filters[name], set()) for name in indexed), key=len
+            )
+            candidates = set(candidate_sets[0])
+            for keys in candidate_sets[1:]:
+                candidates &= keys
+            keys = sorted(candidates, key=self._positions.__getitem__)
+        else:
+            keys = list(self._docs)
+
+        rest = [(name, value) for name, value in filters.items() if name not in self._indexes]
+        if not rest:
+            return keys
+        return [
+            key for key in keys
+            if isinstance(self._docs[key], dict)
+            and all(self._docs[key].get(name) == value for name, value in rest)
+        ]
+
+    # ==================== 변경 ====================
+
+    def _append(self, entries: List[Dict[str, Any]]):
+        """배타 락 안에서 로그에 항목 추가 후 메모리에 반영"""
+        lines = [json.dumps(entry, ensure_ascii=False) for entry in entries]
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        with open(self.log_path, "ab") as f:
+            # 이전 쓰기가 중간에 끊겨 남은 잘린 줄은 버림
+            if f.tell() > self._log_offset:
+                f.truncate(self._log_offset)
+            f.write(data)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        self._log_offset += len(data)
+        self._log_entries += len(entries)
+        self.stats["appends"] += len(entries)
+        # 다른 프로세스가 읽는 것과 같은 JSON 형태로 메모리에 반영
+        for line in lines:
+            self._apply(json.loads(line))
+        if self._log_entries >= self.compact_threshold:
+            self._compact()
+
+    def _new_key(self) -> str:
+        key = str(self._next_seq)
+        self._next_seq += 1
+        return key
+
+    def _resolve_key(self, doc: Any, key: Any) -> str:
+        if key is not None:
+            return str(key)
+        if self.key is None:
+            return self._new_key()
+        resolved = self._key_of(doc)
+        if resolved is None:
+            raise ValueError(f"문서 키가 없습니다 ({self.path.name})")
+        return resolved
+
+    def put(self, doc: Any, key: Any = None) -> str:
+        """문서 추가/교체 후 키 반환"""
+        return self.put_many([doc], keys=[key])[0]
+
+    def put_many(self, docs: Iterable[Any], keys: Optional[Iterable[Any]] = None) -> List[str]:
+        """여러 문서를 로그 한 번 쓰기로 추가/교체"""
+        docs = list(docs)
+        keys = list(keys) if keys is not None else [None] * len(docs)
+        with self._locked(exclusive=True):
+            self._sync()
+            resolved = [self._resolve_key(doc, key) for doc, key in zip(docs, keys)]
+            if docs:
+                self._append([{"op": "put", "k": k, "d": doc} for k, doc in zip(resolved, docs)])
+            return resolved
+
+    def append(self, doc: Any, max_items: Optional[int] = None) -> str:
+        """자동 키 컬렉션에 추가하고 max_items를 넘는 오래된 문서는 삭제"""
+        with self._locked(exclusive=True):
+            self._sync()
+            key = self._resolve_key(doc, None)
+            entries = [{"op": "put", "k": key, "d": doc}]
+            if max_items is not None:
+                overflow = len(self._docs) + (key not in self._docs) - max_items
+                if overflow > 0:
+                    entries.append({"op": "del", "ks": list(self._docs)[:overflow]})
+            self._append(entries)
+            return key
+
+    def update(self, key: Any, fields: Dict[str, Any]) -> Optional[Any]:
+        """문서 일부 필드 변경 (로그에는 바뀐 필드만 기록). 문서가 없으면 None"""
+        key = str(key)
+        with self._locked(exclusive=True):
+            self._sync()
+            if not isinstance(self._docs.get(key), dict):
+                return None
+            self._append([{"op": "patch", "k": key, "d": fields}])
+            return _clone(self._docs[key])
+
+    def mutate(self, key: Any, func: Callable[[Any], Any], default: Any = _MISSING) -> Optional[Any]:
+        """
+        읽기-수정-쓰기를 배타 락 안에서 원자적으로 수행
+        func(현재 문서 사본)이 돌려준 값을 저장. 문서가 없고 default도 없으면 None
+        """
+        key = str(key)
+        with self._locked(exclusive=True):
+            self._sync()
+            current = self._docs.get(key, _MISSING)
+            if current is _MISSING:
+                if default is _MISSING:
+                    return None
+                current = default
+            updated = func(_clone(current))
+            self._append([{"op": "put", "k": key, "d": updated}])
+            return _clone(self._docs[key])
+
+    def delete(self, key: Any) -> bool:
+        return self.delete_many([key]) > 0
+
+    def delete_many(self, keys: Iterable[Any]) -> int:
+        with self._locked(exclusive=True):
+            self._sync()
+            existing = [str(k) for k in keys if str(k) in self._docs]
+            if existing:
+                self._append([{"op": "del", "ks": existing}])
+            return len(existing)
+
+    def delete_where(self, predicate: Callable[[Any], bool]) -> int:
+        with self._locked(exclusive=True):
+            self._sync()
+            keys = [key for key, doc in self._docs.items() if predicate(doc)]
+            if keys:
+                self._append([{"op": "del", "ks": keys}])
+            return len(keys)
+
+    def seed(self, docs: Union[List[Any], Dict[str, Any]]) -> bool:
+        """컬렉션이 처음 만들어질 때만 초기 데이터로 스냅샷 작성"""
+        with self._locked(exclusive=True):
+            if self.exists():
+                return False
+            items = docs.items() if isinstance(docs, dict) else ((None, doc) for doc in docs)
+            self._loaded = True
+            for key, doc in items:
+                self._store(self._resolve_key(doc, key), json.loads(json.dumps(doc)))
+            self._compact()
+            return True
+
+    # ==================== 압축 ====================
+
+    def compact(self):
+        """변경 로그를 스냅샷에 합치고 로그를 비움"""
+        with self._locked(exclusive=True):
+            self._sync()
+            self._compact()
+
+    def _compact(self):
+        data = dict(self._docs) if self.layout == "dict" else list(self._docs.values())
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        # 스냅샷 교체 후 로그를 비움 (읽는 쪽은 스냅샷 변경을 보고 다시 읽음)
+        with open(self.log_path, "wb"):
+            pass
+        self.stats["compactions"] += 1
+        # 자동 키는 스냅샷 순서로 다시 매겨지므로 다른 프로세스와 같게 다시 적재
+        self._reload()
+
+    def close(self):
+        with self._lock:
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+
+class DocumentStore:
+    """디렉토리 하나에 속한 컬렉션 모음"""
+
+    def __init__(self, base_dir: Union[str, Path],
+                 compact_threshold: int = DEFAULT_COMPACT_THRESHOLD, fsync: bool = False):
+        self.base_dir = Path(base_dir)
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self._collections: Dict[str, DocumentCollection] = {}
+        self._lock = threading.Lock()
+
+    def collection(self, filename: str, key: Union[str, Callable[[Any], Any], None] = "id",
+                   layout: str = "list", indexes: Iterable[IndexSpec] = ()) -> DocumentCollection:
+        """
+        파일 이름(예: "plugins.json")의 컬렉션 반환
+        같은 파일은 같은 객체를 공유하고, 나중에 요청한 인덱스는 추가로 만든다
+        """
+        with self._lock:
+            collection = self._collections.get(filename)
+            if collection is None:
+                collection = DocumentCollection(
+                    self.base_dir / filename, key=key, layout=layout,
+                    compact_threshold=self.compact_threshold, fsync=self.fsync,
+                )
+                self._collections[filename] = collection
+        for spec in indexes:
+            collection.ensure_index(spec)
+        return collection
+
+    def compact_all(self):
+        for collection in list(self._collections.values()):
+            collection.compact()
+
+
+_stores: Dict[str, DocumentStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_document_store(base_dir: Union[str, Path]) -> DocumentStore:
+    """디렉토리별 공용 DocumentStore 반환 (요청마다 관리자를 만들어도 메모리 상태를 재사용)"""
+    key = os.path.abspath(str(base_dir))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = DocumentStore(base_dir)
+            _stores[key] = store
+        return store
@@ -9,11 +9,12 @@ from dataclasses import dataclass, asdict
 from typing import Dict, List, Set, Optional, Any, Callable
 from datetime import datetime, timedelta
 import time
-import threading
 import logging
 import json
 import asyncio
 from typing import Optional
+
+from core.backend.job_scheduler import job_scheduler
 config = None  # pyright: ignore
 form = None  # pyright: ignore
 """
@@ -26,6 +27,8 @@ from email.mime.multipart import MIMEMultipart  # noqa  # pyright: ignore
 
 logger = logging.getLogger(__name__)
 
+ALERT_MONITOR_JOB = "enhanced_alert.monitor"
+
 
 class AlertSeverity(Enum):
     """알림 심각도"""
@@ -151,9 +154,8 @@ class EnhancedAlertSystem:
         # 기본 알림 규칙 설정
         self._setup_default_rules()
 
-        # 모니터링 스레드 시작
+        # 모니터링 작업 상태
         self.monitoring_active = False
-        self.monitor_thread = None
 
     def _setup_default_rules(self):
         """기본 알림 규칙 설정"""
@@ -248,32 +250,23 @@ class EnhancedAlertSystem:
             return
 
         self.monitoring_active = True
-        self.monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-        self.monitor_thread.start()
+        # 알림 큐는 프로세스별이므로 singleton 아님
+        job_scheduler.add_job(ALERT_MONITOR_JOB, self._monitoring_tick, interval=1)
         logger.info("고도화된 알림 시스템 모니터링 시작")
 
     def stop_monitoring(self):
         """알림 모니터링 중지"""
         self.monitoring_active = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=5)
+        job_scheduler.remove_job(ALERT_MONITOR_JOB)
         logger.info("고도화된 알림 시스템 모니터링 중지")
 
-    def _monitoring_loop(self):
-        """모니터링 루프"""
-        while self.monitoring_active:
-            try:
-                # 알림 큐 처리
-                self._process_alert_queue()
-
-                # 오래된 알림 정리
-                self._cleanup_old_alerts()
-
-                time.sleep(1)  # 1초마다 체크
+    def _monitoring_tick(self):
+        """알림 큐 처리/오래된 알림 정리 (작업 스케줄러가 1초마다 실행)"""
+        # 알림 큐 처리
+        self._process_alert_queue()
 
-            except Exception as e:
-                logger.error(f"알림 모니터링 루프 오류: {e}")
-                time.sleep(5)
+        # 오래된 알림 정리
+        self._cleanup_old_alerts()
 
     def _process_alert_queue(self):
         """알림 큐 처리"""
@@ -1,5 +1,4 @@
 from collections import defaultdict
-import sqlite3
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Tuple
@@ -8,6 +7,7 @@ import shutil
 import os
 import json
 import logging
+from core.backend.sidecar_db import get_sidecar_db
 from typing import Optional
 query = None  # pyright: ignore
 form = None  # pyright: ignore
@@ -75,6 +75,7 @@ class EnhancedMarketplace:
 
     def __init__(self, db_path="marketplace.db", plugins_dir="marketplace/plugins"):
         self.db_path = db_path
+        self.db = get_sidecar_db(db_path)
         self.plugins_dir = Path(plugins_dir)
         self.plugins_dir.mkdir(parents=True, exist_ok=True)
 
@@ -178,85 +179,83 @@ class EnhancedMarketplace:
     def _init_database(self):
         """데이터베이스 초기화"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # 플러그인 정보 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS plugins (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    version TEXT NOT NULL,
-                    author TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    tags TEXT,
-                    price REAL DEFAULT 0.0,
-                    download_count INTEGER DEFAULT 0,
-                    rating REAL DEFAULT 0.0,
-                    review_count INTEGER DEFAULT 0,
-                    size INTEGER DEFAULT 0,
-                    dependencies TEXT,
-                    compatibility TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    status TEXT DEFAULT 'active',
-                    license TEXT DEFAULT 'MIT',
-                    homepage TEXT,
-                    repository TEXT
-                )
-            ''')
-
-            # 리뷰 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS reviews (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    plugin_id TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    rating INTEGER NOT NULL,
-                    title TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    helpful_count INTEGER DEFAULT 0,
-                    reported BOOLEAN DEFAULT FALSE,
-                    FOREIGN KEY (plugin_id) REFERENCES plugins (id)
-                )
-            ''')
-
-            # 다운로드 통계 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS download_stats (
-                    plugin_id TEXT PRIMARY KEY,
-                    total_downloads INTEGER DEFAULT 0,
-                    daily_downloads INTEGER DEFAULT 0,
-                    weekly_downloads INTEGER DEFAULT 0,
-                    monthly_downloads INTEGER DEFAULT 0,
-                    last_download DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (plugin_id) REFERENCES plugins (id)
-                )
-            ''')
-
-            # 다운로드 이력 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS download_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    plugin_id TEXT NOT NULL,
-                    user_id TEXT,
-                    downloaded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    version TEXT,
-                    FOREIGN KEY (plugin_id) REFERENCES plugins (id)
-                )
-            ''')
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+
+                # 플러그인 정보 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS plugins (
+                        id TEXT PRIMARY KEY,
+                        name TEXT NOT NULL,
+                        description TEXT NOT NULL,
+                        version TEXT NOT NULL,
+                        author TEXT NOT NULL,
+                        category TEXT NOT NULL,
+                        tags TEXT,
+                        price REAL DEFAULT 0.0,
+                        download_count INTEGER DEFAULT 0,
+                        rating REAL DEFAULT 0.0,
+                        review_count INTEGER DEFAULT 0,
+                        size INTEGER DEFAULT 0,
+                        dependencies TEXT,
+                        compatibility TEXT,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        status TEXT DEFAULT 'active',
+                        license TEXT DEFAULT 'MIT',
+                        homepage TEXT,
+                        repository TEXT
+                    )
+                ''')
+
+                # 리뷰 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS reviews (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        plugin_id TEXT NOT NULL,
+                        user_id TEXT NOT NULL,
+                        rating INTEGER NOT NULL,
+                        title TEXT NOT NULL,
+                        content TEXT NOT NULL,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        helpful_count INTEGER DEFAULT 0,
+                        reported BOOLEAN DEFAULT FALSE,
+                        FOREIGN KEY (plugin_id) REFERENCES plugins (id)
+                    )
+                ''')
+
+                # 다운로드 통계 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS download_stats (
+                        plugin_id TEXT PRIMARY KEY,
+                        total_downloads INTEGER DEFAULT 0,
+                        daily_downloads INTEGER DEFAULT 0,
+                        weekly_downloads INTEGER DEFAULT 0,
+                        monthly_downloads INTEGER DEFAULT 0,
+                        last_download DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (plugin_id) REFERENCES plugins (id)
+                    )
+                ''')
+
+                # 다운로드 이력 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS download_history (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        plugin_id TEXT NOT NULL,
+                        user_id TEXT,
+                        downloaded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        version TEXT,
+                        FOREIGN KEY (plugin_id) REFERENCES plugins (id)
+                    )
+                ''')
 
-            # 인덱스 생성
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_plugins_category ON plugins(category)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_plugins_rating ON plugins(rating)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_plugins_downloads ON plugins(download_count)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_reviews_plugin ON reviews(plugin_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_downloads_plugin ON download_history(plugin_id)')
+                # 인덱스 생성
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_plugins_category ON plugins(category)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_plugins_rating ON plugins(rating)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_plugins_downloads ON plugins(download_count)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_reviews_plugin ON reviews(plugin_id)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_downloads_plugin ON download_history(plugin_id)')
 
-            conn.commit()
-            conn.close()
             logger.info("마켓플레이스 데이터베이스 초기화 완료")
 
         except Exception as e:
@@ -274,35 +273,33 @@ class EnhancedMarketplace:
     def add_plugin(self, plugin: PluginInfo) -> bool:
         """플러그인 추가"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                INSERT OR REPLACE INTO plugins 
-                (id, name, description, version, author, category, tags, price, 
-                 download_count, rating, review_count, size, dependencies, 
-                 compatibility, created_at, updated_at, status, license, homepage, repository)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                plugin.id, plugin.name, plugin.description, plugin.version, plugin.author,
-                plugin.category, json.dumps(plugin.tags), plugin.price, plugin.download_count,
-                plugin.rating, plugin.review_count, plugin.size, json.dumps(plugin.dependencies),
-                json.dumps(plugin.compatibility), plugin.created_at.isoformat(),
-                plugin.updated_at.isoformat(), plugin.status, plugin.license,
-                plugin.homepage, plugin.repository
-            ))
-
-            # 다운로드 통계 초기화
-            cursor.execute('''
-                INSERT OR REPLACE INTO download_stats 
-                (plugin_id, total_downloads, daily_downloads, weekly_downloads, monthly_downloads, last_download)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                plugin.id, plugin.download_count, 0, 0, 0, datetime.utcnow().isoformat()
-            ))
-
-            conn.commit()
-            conn.close()
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('''
+                    INSERT OR REPLACE INTO plugins 
+                    (id, name, description, version, author, category, tags, price, 
+                     download_count, rating, review_count, size, dependencies, 
+                     compatibility, created_at, updated_at, status, license, homepage, repository)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    plugin.id, plugin.name, plugin.description, plugin.version, plugin.author,
+                    plugin.category, json.dumps(plugin.tags), plugin.price, plugin.download_count,
+                    plugin.rating, plugin.review_count, plugin.size, json.dumps(plugin.dependencies),
+                    json.dumps(plugin.compatibility), plugin.created_at.isoformat(),
+                    plugin.updated_at.isoformat(), plugin.status, plugin.license,
+                    plugin.homepage, plugin.repository
+                ))
+
+                # 다운로드 통계 초기화
+                cursor.execute('''
+                    INSERT OR REPLACE INTO download_stats 
+                    (plugin_id, total_downloads, daily_downloads, weekly_downloads, monthly_downloads, last_download)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (
+                    plugin.id, plugin.download_count, 0, 0, 0, datetime.utcnow().isoformat()
+                ))
+
             return True
 
         except Exception as e:
@@ -314,75 +311,74 @@ class EnhancedMarketplace:
                     limit: int = 50, offset: int = 0) -> Optional[List[PluginInfo]]:
         """플러그인 목록 조회"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # 쿼리 조건 구성
-            conditions = []
-            params = []
-
-            if category:
-                conditions.append("category = ?")
-                params.append(category)
-
-            if search:
-                conditions.append("(name LIKE ? OR description LIKE ? OR tags LIKE ?)")
-                search_term = f"%{search}%"
-                params.extend([search_term, search_term, search_term])
-
-            where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-            # 정렬 조건
-            valid_sort_fields = ["name", "rating", "download_count", "created_at", "price"]
-            if sort_by not in valid_sort_fields:
-                sort_by = "name"
-
-            if sort_order is not None and sort_order.lower() == "desc":
-                sort_direction = "DESC"
-            else:
-                sort_direction = "ASC"
-
-            query = f'''
-                SELECT id, name, description, version, author, category, tags, price,
-                       download_count, rating, review_count, size, dependencies,
-                       compatibility, created_at, updated_at, status, license, homepage, repository
-                FROM plugins
-                WHERE {where_clause}
-                ORDER BY {sort_by} {sort_direction}
-                LIMIT ? OFFSET ?
-            '''
-
-            cursor.execute(query, params + [limit, offset])
-            rows = cursor.fetchall()
-
-            plugins = []
-            if rows is not None:
-                for row in rows:
-                    plugin = PluginInfo(
-                        id=row[0] or "",
-                        name=row[1] or "",
-                        description=row[2] or "",
-                        version=row[3] or "",
-                        author=row[4] or "",
-                        category=row[5] or "",
-                        tags=json.loads(row[6]) if row[6] else [],
-                        price=row[7] if row[7] is not None else 0.0,
-                        download_count=row[8] if row[8] is not None else 0,
-                        rating=row[9] if row[9] is not None else 0.0,
-                        review_count=row[10] if row[10] is not None else 0,
-                        size=row[11] if row[11] is not None else 0,
-                        dependencies=json.loads(row[12]) if row[12] else [],
-                        compatibility=json.loads(row[13]) if row[13] else [],
-                        created_at=datetime.fromisoformat(row[14]) if row[14] else datetime.utcnow(),
-                        updated_at=datetime.fromisoformat(row[15]) if row[15] else datetime.utcnow(),
-                        status=row[16] or "active",
-                        license=row[17] or "MIT",
-                        homepage=row[18] or "",
-                        repository=row[19] or ""
-                    )
-                    plugins.append(plugin)
+            with self.db.read() as conn:
+                cursor = conn.cursor()
+
+                # 쿼리 조건 구성
+                conditions = []
+                params = []
+
+                if category:
+                    conditions.append("category = ?")
+                    params.append(category)
+
+                if search:
+                    conditions.append("(name LIKE ? OR description LIKE ? OR tags LIKE ?)")
+                    search_term = f"%{search}%"
+                    params.extend([search_term, search_term, search_term])
+
+                where_clause = " AND ".join(conditions) if conditions else "1=1"
+
+                # 정렬 조건
+                valid_sort_fields = ["name", "rating", "download_count", "created_at", "price"]
+                if sort_by not in valid_sort_fields:
+                    sort_by = "name"
+
+                if sort_order is not None and sort_order.lower() == "desc":
+                    sort_direction = "DESC"
+                else:
+                    sort_direction = "ASC"
+
+                query = f'''
+                    SELECT id, name, description, version, author, category, tags, price,
+                           download_count, rating, review_count, size, dependencies,
+                           compatibility, created_at, updated_at, status, license, homepage, repository
+                    FROM plugins
+                    WHERE {where_clause}
+                    ORDER BY {sort_by} {sort_direction}
+                    LIMIT ? OFFSET ?
+                '''
+
+                cursor.execute(query, params + [limit, offset])
+                rows = cursor.fetchall()
+
+                plugins = []
+                if rows is not None:
+                    for row in rows:
+                        plugin = PluginInfo(
+                            id=row[0] or "",
+                            name=row[1] or "",
+                            description=row[2] or "",
+                            version=row[3] or "",
+                            author=row[4] or "",
+                            category=row[5] or "",
+                            tags=json.loads(row[6]) if row[6] else [],
+                            price=row[7] if row[7] is not None else 0.0,
+                            download_count=row[8] if row[8] is not None else 0,
+                            rating=row[9] if row[9] is not None else 0.0,
+                            review_count=row[10] if row[10] is not None else 0,
+                            size=row[11] if row[11] is not None else 0,
+                            dependencies=json.loads(row[12]) if row[12] else [],
+                            compatibility=json.loads(row[13]) if row[13] else [],
+                            created_at=datetime.fromisoformat(row[14]) if row[14] else datetime.utcnow(),
+                            updated_at=datetime.fromisoformat(row[15]) if row[15] else datetime.utcnow(),
+                            status=row[16] or "active",
+                            license=row[17] or "MIT",
+                            homepage=row[18] or "",
+                            repository=row[19] or ""
+                        )
+                        plugins.append(plugin)
 
-            conn.close()
             return plugins
 
         except Exception as e:
@@ -392,44 +388,43 @@ class EnhancedMarketplace:
     def get_plugin(self, plugin_id: str) -> Optional[PluginInfo]:
         """플러그인 상세 정보 조회"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT id, name, description, version, author, category, tags, price,
-                       download_count, rating, review_count, size, dependencies,
-                       compatibility, created_at, updated_at, status, license, homepage, repository
-                FROM plugins WHERE id = ?
-            ''', (plugin_id,))
-
-            row = cursor.fetchone()
-            if not row:
-                return None
-
-            plugin = PluginInfo(
-                id=row[0] or "",
-                name=row[1] or "",
-                description=row[2] or "",
-                version=row[3] or "",
-                author=row[4] or "",
-                category=row[5] or "",
-                tags=json.loads(row[6]) if row[6] else [],
-                price=row[7] if row[7] is not None else 0.0,
-                download_count=row[8] if row[8] is not None else 0,
-                rating=row[9] if row[9] is not None else 0.0,
-                review_count=row[10] if row[10] is not None else 0,
-                size=row[11] if row[11] is not None else 0,
-                dependencies=json.loads(row[12]) if row[12] else [],
-                compatibility=json.loads(row[13]) if row[13] else [],
-                created_at=datetime.fromisoformat(row[14]) if row[14] else datetime.utcnow(),
-                updated_at=datetime.fromisoformat(row[15]) if row[15] else datetime.utcnow(),
-                status=row[16] or "active",
-                license=row[17] or "MIT",
-                homepage=row[18] or "",
-                repository=row[19] or ""
-            )
+            with self.db.read() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('''
+                    SELECT id, name, description, version, author, category, tags, price,
+                           download_count, rating, review_count, size, dependencies,
+                           compatibility, created_at, updated_at, status, license, homepage, repository
+                    FROM plugins WHERE id = ?
+                ''', (plugin_id,))
+
+                row = cursor.fetchone()
+                if not row:
+                    return None
+
+                plugin = PluginInfo(
+                    id=row[0] or "",
+                    name=row[1] or "",
+                    description=row[2] or "",
+                    version=row[3] or "",
+                    author=row[4] or "",
+                    category=row[5] or "",
+                    tags=json.loads(row[6]) if row[6] else [],
+                    price=row[7] if row[7] is not None else 0.0,
+                    download_count=row[8] if row[8] is not None else 0,
+                    rating=row[9] if row[9] is not None else 0.0,
+                    review_count=row[10] if row[10] is not None else 0,
+                    size=row[11] if row[11] is not None else 0,
+                    dependencies=json.loads(row[12]) if row[12] else [],
+                    compatibility=json.loads(row[13]) if row[13] else [],
+                    created_at=datetime.fromisoformat(row[14]) if row[14] else datetime.utcnow(),
+                    updated_at=datetime.fromisoformat(row[15]) if row[15] else datetime.utcnow(),
+                    status=row[16] or "active",
+                    license=row[17] or "MIT",
+                    homepage=row[18] or "",
+                    repository=row[19] or ""
+                )
 
-            conn.close()
             return plugin
 
         except Exception as e:
@@ -440,29 +435,27 @@ class EnhancedMarketplace:
                    title: str, content: str) -> bool:
         """리뷰 추가"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # 리뷰 추가
-            cursor.execute('''
-                INSERT INTO reviews (plugin_id, user_id, rating, title, content)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (plugin_id, user_id, rating, title, content))
-
-            # 플러그인 평점 업데이트
-            cursor.execute('''
-                UPDATE plugins 
-                SET rating = (
-                    SELECT AVG(rating) FROM reviews WHERE plugin_id = ?
-                ),
-                review_count = (
-                    SELECT COUNT(*) FROM reviews WHERE plugin_id = ?
-                )
-                WHERE id = ?
-            ''', (plugin_id, plugin_id, plugin_id))
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+
+                # 리뷰 추가
+                cursor.execute('''
+                    INSERT INTO reviews (plugin_id, user_id, rating, title, content)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (plugin_id, user_id, rating, title, content))
+
+                # 플러그인 평점 업데이트
+                cursor.execute('''
+                    UPDATE plugins 
+                    SET rating = (
+                        SELECT AVG(rating) FROM reviews WHERE plugin_id = ?
+                    ),
+                    review_count = (
+                        SELECT COUNT(*) FROM reviews WHERE plugin_id = ?
+                    )
+                    WHERE id = ?
+                ''', (plugin_id, plugin_id, plugin_id))
 
-            conn.commit()
-            conn.close()
             return True
 
         except Exception as e:
@@ -472,36 +465,35 @@ class EnhancedMarketplace:
     def get_reviews(self, plugin_id: str, limit: int = 20, offset: int = 0) -> Optional[List[PluginReview]]:
         """리뷰 목록 조회"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT id, plugin_id, user_id, rating, title, content, 
-                       created_at, helpful_count, reported
-                FROM reviews 
-                WHERE plugin_id = ? AND reported = FALSE
-                ORDER BY created_at DESC
-                LIMIT ? OFFSET ?
-            ''', (plugin_id, limit, offset))
-
-            rows = cursor.fetchall()
-            reviews = []
-            if rows is not None:
-                for row in rows:
-                    review = PluginReview(
-                        id=row[0] if row[0] is not None else 0,
-                        plugin_id=row[1] or "",
-                        user_id=row[2] or "",
-                        rating=row[3] if row[3] is not None else 0,
-                        title=row[4] or "",
-                        content=row[5] or "",
-                        created_at=datetime.fromisoformat(row[6]) if row[6] else datetime.utcnow(),
-                        helpful_count=row[7] if row[7] is not None else 0,
-                        reported=row[8] if row[8] is not None else False
-                    )
-                    reviews.append(review)
+            with self.db.read() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('''
+                    SELECT id, plugin_id, user_id, rating, title, content, 
+                           created_at, helpful_count, reported
+                    FROM reviews 
+                    WHERE plugin_id = ? AND reported = FALSE
+                    ORDER BY created_at DESC
+                    LIMIT ? OFFSET ?
+                ''', (plugin_id, limit, offset))
+
+                rows = cursor.fetchall()
+                reviews = []
+                if rows is not None:
+                    for row in rows:
+                        review = PluginReview(
+                            id=row[0] if row[0] is not None else 0,
+                            plugin_id=row[1] or "",
+                            user_id=row[2] or "",
+                            rating=row[3] if row[3] is not None else 0,
+                            title=row[4] or "",
+                            content=row[5] or "",
+                            created_at=datetime.fromisoformat(row[6]) if row[6] else datetime.utcnow(),
+                            helpful_count=row[7] if row[7] is not None else 0,
+                            reported=row[8] if row[8] is not None else False
+                        )
+                        reviews.append(review)
 
-            conn.close()
             return reviews
 
         except Exception as e:
@@ -511,33 +503,31 @@ class EnhancedMarketplace:
     def download_plugin(self, plugin_id: str, user_id: Optional[str] = None, version: str = None) -> bool:
         """플러그인 다운로드"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # 다운로드 이력 추가
-            cursor.execute('''
-                INSERT INTO download_history (plugin_id, user_id, version)
-                VALUES (?, ?, ?)
-            ''', (plugin_id, user_id, version))
-
-            # 다운로드 통계 업데이트
-            cursor.execute('''
-                UPDATE download_stats 
-                SET total_downloads = total_downloads + 1,
-                    daily_downloads = daily_downloads + 1,
-                    last_download = CURRENT_TIMESTAMP
-                WHERE plugin_id = ?
-            ''', (plugin_id,))
-
-            # 플러그인 다운로드 수 업데이트
-            cursor.execute('''
-                UPDATE plugins 
-                SET download_count = download_count + 1
-                WHERE id = ?
-            ''', (plugin_id,))
-
-            conn.commit()
-            conn.close()
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+
+                # 다운로드 이력 추가
+                cursor.execute('''
+                    INSERT INTO download_history (plugin_id, user_id, version)
+                    VALUES (?, ?, ?)
+                ''', (plugin_id, user_id, version))
+
+                # 다운로드 통계 업데이트
+                cursor.execute('''
+                    UPDATE download_stats 
+                    SET total_downloads = total_downloads + 1,
+                        daily_downloads = daily_downloads + 1,
+                        last_download = CURRENT_TIMESTAMP
+                    WHERE plugin_id = ?
+                ''', (plugin_id,))
+
+                # 플러그인 다운로드 수 업데이트
+                cursor.execute('''
+                    UPDATE plugins 
+                    SET download_count = download_count + 1
+                    WHERE id = ?
+                ''', (plugin_id,))
+
             return True
 
         except Exception as e:
@@ -547,29 +537,28 @@ class EnhancedMarketplace:
     def get_download_stats(self, plugin_id: str) -> Optional[DownloadStats]:
         """다운로드 통계 조회"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT plugin_id, total_downloads, daily_downloads, 
-                       weekly_downloads, monthly_downloads, last_download
-                FROM download_stats WHERE plugin_id = ?
-            ''', (plugin_id,))
-
-            row = cursor.fetchone()
-            if not row:
-                return None
-
-            stats = DownloadStats(
-                plugin_id=row[0] or "",
-                total_downloads=row[1] if row[1] is not None else 0,
-                daily_downloads=row[2] if row[2] is not None else 0,
-                weekly_downloads=row[3] if row[3] is not None else 0,
-                monthly_downloads=row[4] if row[4] is not None else 0,
-                last_download=datetime.fromisoformat(row[5]) if row[5] else datetime.utcnow()
-            )
+            with self.db.read() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('''
+                    SELECT plugin_id, total_downloads, daily_downloads, 
+                           weekly_downloads, monthly_downloads, last_download
+                    FROM download_stats WHERE plugin_id = ?
+                ''', (plugin_id,))
+
+                row = cursor.fetchone()
+                if not row:
+                    return None
+
+                stats = DownloadStats(
+                    plugin_id=row[0] or "",
+                    total_downloads=row[1] if row[1] is not None else 0,
+                    daily_downloads=row[2] if row[2] is not None else 0,
+                    weekly_downloads=row[3] if row[3] is not None else 0,
+                    monthly_downloads=row[4] if row[4] is not None else 0,
+                    last_download=datetime.fromisoformat(row[5]) if row[5] else datetime.utcnow()
+                )
 
-            conn.close()
             return stats
 
         except Exception as e:
@@ -579,16 +568,15 @@ class EnhancedMarketplace:
     def get_categories(self) -> Optional[List[str]]:
         """카테고리 목록 조회"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('SELECT DISTINCT category FROM plugins ORDER BY category')
-            rows = cursor.fetchall()
-            if rows is not None:
-                categories = [row[0] for row in rows if row[0] is not None]
-            else:
-                categories = []
-            conn.close()
+            with self.db.read() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('SELECT DISTINCT category FROM plugins ORDER BY category')
+                rows = cursor.fetchall()
+                if rows is not None:
+                    categories = [row[0] for row in rows if row[0] is not None]
+                else:
+                    categories = []
             return categories
 
         except Exception as e:
@@ -1,5 +1,4 @@
 from pathlib import Path
-import sqlite3
 import psutil
 from collections import defaultdict, deque
 from enum import Enum
@@ -9,9 +8,11 @@ from datetime import datetime, timedelta
 import uuid
 import json
 import time
-import threading
 import asyncio
 import logging
+from core.backend.sidecar_db import get_sidecar_db
+from core.backend.event_bus import ALERTS_TOPIC, BusMessage, EventBus, get_event_bus
+from core.backend.job_scheduler import job_scheduler
 from typing import Optional
 args = None  # pyright: ignore
 config = None  # pyright: ignore
@@ -25,6 +26,9 @@ form = None  # pyright: ignore
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_MONITOR_JOB = "enhanced_realtime_alerts.system"
+HOUSEKEEPING_JOB = "enhanced_realtime_alerts.housekeeping"
+
 
 class AlertSeverity(Enum):
     """알림 심각도"""
@@ -122,19 +126,23 @@ class NotificationConfig:
 class EnhancedRealtimeAlertSystem:
     """고도화된 실시간 알림 시스템"""
 
-    def __init__(self, db_path: str = "alerts.db"):
+    def __init__(self, db_path: str = "alerts.db", event_bus: Optional[EventBus] = None):
         self.db_path = db_path
+        self.db = get_sidecar_db(db_path)
         self.thresholds = AlertThreshold()
         self.alerts: Dict[str, Alert] = {}
         self.notification_configs: Dict[str, NotificationConfig] = {}
         self.alert_callbacks: List[Callable[[Alert], None]] = []
         self.monitoring_active = False
-        self.monitor_thread: Optional[threading.Thread] = None
 
         # 실시간 연결 관리
         self.web_connections: Dict[str, Any] = {}  # connection_id -> handler
         self.mobile_connections: Dict[str, Any] = {}  # device_id -> handler
 
+        # 알림은 이벤트 버스로 한 번만 발행하고, 연결을 가진 워커가 구독해서 전달
+        self.event_bus = event_bus or get_event_bus()
+        self.event_bus.subscribe(ALERTS_TOPIC, self._deliver_alert)
+
         # 알림 히스토리 (최근 1000개)
         self.alert_history = deque(maxlen=1000)
 
@@ -150,43 +158,41 @@ class EnhancedRealtimeAlertSystem:
     def _init_database(self):
         """데이터베이스 초기화"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # 알림 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS alerts (
-                    id TEXT PRIMARY KEY,
-                    type TEXT NOT NULL,
-                    severity TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    message TEXT NOT NULL,
-                    plugin_id TEXT,
-                    plugin_name TEXT,
-                    current_value REAL,
-                    threshold_value REAL,
-                    timestamp TEXT NOT NULL,
-                    resolved BOOLEAN DEFAULT FALSE,
-                    resolved_at TEXT,
-                    metadata TEXT
-                )
-            ''')
-
-            # 알림 설정 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS notification_configs (
-                    user_id TEXT PRIMARY KEY,
-                    channels TEXT NOT NULL,
-                    alert_types TEXT NOT NULL,
-                    severity_levels TEXT NOT NULL,
-                    enabled BOOLEAN DEFAULT TRUE,
-                    quiet_hours_start INTEGER,
-                    quiet_hours_end INTEGER
-                )
-            ''')
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+
+                # 알림 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS alerts (
+                        id TEXT PRIMARY KEY,
+                        type TEXT NOT NULL,
+                        severity TEXT NOT NULL,
+                        title TEXT NOT NULL,
+                        message TEXT NOT NULL,
+                        plugin_id TEXT,
+                        plugin_name TEXT,
+                        current_value REAL,
+                        threshold_value REAL,
+                        timestamp TEXT NOT NULL,
+                        resolved BOOLEAN DEFAULT FALSE,
+                        resolved_at TEXT,
+                        metadata TEXT
+                    )
+                ''')
+
+                # 알림 설정 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS notification_configs (
+                        user_id TEXT PRIMARY KEY,
+                        channels TEXT NOT NULL,
+                        alert_types TEXT NOT NULL,
+                        severity_levels TEXT NOT NULL,
+                        enabled BOOLEAN DEFAULT TRUE,
+                        quiet_hours_start INTEGER,
+                        quiet_hours_end INTEGER
+                    )
+                ''')
 
-            conn.commit()
-            conn.close()
             logger.info("알림 데이터베이스 초기화 완료")
 
         except Exception as e:
@@ -195,28 +201,27 @@ class EnhancedRealtimeAlertSystem:
     def _load_notification_configs(self):
         """알림 설정 로드"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('SELECT * FROM notification_configs')
-            rows = cursor.fetchall()
-
-            for row in rows:
-                user_id, channels_json, alert_types_json, severity_levels_json, enabled, quiet_start, quiet_end = row
-
-                config = NotificationConfig(
-                    user_id=user_id,
-                    channels=set(NotificationChannel(c) for c in json.loads(channels_json)),
-                    alert_types=set(AlertType(t) for t in json.loads(alert_types_json)),
-                    severity_levels=set(AlertSeverity(s) for s in json.loads(severity_levels_json)),
-                    enabled=enabled,
-                    quiet_hours_start=quiet_start,
-                    quiet_hours_end=quiet_end
-                )
+            with self.db.read() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('SELECT * FROM notification_configs')
+                rows = cursor.fetchall()
+
+                for row in rows:
+                    user_id, channels_json, alert_types_json, severity_levels_json, enabled, quiet_start, quiet_end = row
+
+                    config = NotificationConfig(
+                        user_id=user_id,
+                        channels=set(NotificationChannel(c) for c in json.loads(channels_json)),
+                        alert_types=set(AlertType(t) for t in json.loads(alert_types_json)),
+                        severity_levels=set(AlertSeverity(s) for s in json.loads(severity_levels_json)),
+                        enabled=enabled,
+                        quiet_hours_start=quiet_start,
+                        quiet_hours_end=quiet_end
+                    )
 
-                self.notification_configs[user_id] = config
+                    self.notification_configs[user_id] = config
 
-            conn.close()
             logger.info(f"알림 설정 로드 완료: {len(self.notification_configs)}개")
 
         except Exception as e:
@@ -227,31 +232,18 @@ class EnhancedRealtimeAlertSystem:
         if self.monitoring_active:
             return
         self.monitoring_active = True
-        # try 문에는 반드시 except 또는 finally가 필요합니다.
-        try:
-            # _monitor_loop 메서드가 클래스 내부에 정의되어 있는지 확인합니다.
-            if not hasattr(self, "_monitor_loop") or not callable(getattr(self, "_monitor_loop", None)):
-                if not hasattr(self, "_monitor_loop") or not callable(getattr(self, "_monitor_loop", None)):
-                    if not hasattr(self, "_monitor_loop") or not callable(getattr(self, "_monitor_loop", None)):
-                        try:
-                            if not hasattr(self, "_monitor_loop") or not callable(getattr(self, "_monitor_loop", None)):
-                                raise AttributeError("_monitor_loop 메서드가 클래스에 정의되어 있지 않거나 호출할 수 없습니다.")
-                            # pyright: ignore[reportAttributeAccessIssue] if ignore is not None else None - _monitor_loop 메서드는 클래스 내부에 정의되어 있어야 합니다.
-                            self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)  # noqa
-                            self.monitor_thread.start()
-                            logger.info("고도화된 실시간 알림 시스템 시작")
-                        except Exception as e:
-                            self.monitoring_active = False
-                            logger.error(f"모니터링 시작 실패: {e}")
-                        # 예외 발생 시 monitoring_active를 False로 되돌려 서버 안정성을 보장합니다.
-        except Exception as e:
-            logger.error(f"모니터링 루프 오류: {e}")
-        finally:
-            self.monitoring_active = False
-            if self.monitor_thread:
-                self.monitor_thread.join(timeout=5)
-
-            logger.info("고도화된 실시간 알림 시스템 중지")
+        # 시스템 리소스 알림은 호스트 단위라 여러 워커 중 한 프로세스에서만 실행
+        job_scheduler.add_job(SYSTEM_MONITOR_JOB, self._monitor_system_resources, interval=30, singleton=True)
+        # 플러그인 메트릭/알림 캐시는 프로세스별로 정리
+        job_scheduler.add_job(HOUSEKEEPING_JOB, self._housekeeping_tick, interval=30)
+        logger.info("고도화된 실시간 알림 시스템 시작")
+
+    def stop_monitoring(self):
+        """모니터링 중지"""
+        self.monitoring_active = False
+        job_scheduler.remove_job(SYSTEM_MONITOR_JOB)
+        job_scheduler.remove_job(HOUSEKEEPING_JOB)
+        logger.info("고도화된 실시간 알림 시스템 중지")
 
     def update_plugin_metrics(self,  plugin_id: str,  metrics: Dict[str,  Any]):
         """플러그인 메트릭 업데이트"""
@@ -370,50 +362,67 @@ class EnhancedRealtimeAlertSystem:
     def _save_alert_to_db(self,  alert: Alert):
         """알림을 데이터베이스에 저장"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO alerts 
-                (id, type, severity, title, message, plugin_id, plugin_name, 
-                 current_value, threshold_value, timestamp, resolved, resolved_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                alert.id, alert.type.value, alert.severity.value, alert.title, alert.message,
-                alert.plugin_id, alert.plugin_name, alert.current_value, alert.threshold_value,
-                alert.timestamp.isoformat() if alert.timestamp else None, alert.resolved,
-                alert.resolved_at.isoformat() if alert.resolved_at else None,
-                json.dumps(alert.metadata)
-            ))
-            conn.commit()
-            conn.close()
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT OR REPLACE INTO alerts
+                    (id, type, severity, title, message, plugin_id, plugin_name,
+                     current_value, threshold_value, timestamp, resolved, resolved_at, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    alert.id, alert.type.value, alert.severity.value, alert.title, alert.message,
+                    alert.plugin_id, alert.plugin_name, alert.current_value, alert.threshold_value,
+                    alert.timestamp.isoformat() if alert.timestamp else None, alert.resolved,
+                    alert.resolved_at.isoformat() if alert.resolved_at else None,
+                    json.dumps(alert.metadata)
+                ))
         except Exception as e:
             logger.error(f"알림 데이터베이스 저장 실패: {e}")
 
     def _send_realtime_notifications(self,  alert: Alert):
-        """실시간 알림 전송"""
+        """실시간 알림 전송 (이벤트 버스로 발행, 모든 워커의 연결에 전달됨)"""
+        alert_data = alert.to_dict()
+        # 프로세스 간 전달을 위해 JSON 직렬화 가능한 값으로
+        alert_data['type'] = alert.type.value
+        alert_data['severity'] = alert.severity.value
+        if self.event_bus.publish(ALERTS_TOPIC, alert_data) is None:
+            logger.error(f"알림 발행 실패: {alert.id}")
+
+    def _deliver_alert(self, message: BusMessage):
+        """이벤트 버스에서 받은 알림을 이 프로세스의 연결들에 전달"""
+        alert_data = message.payload
+
         # 웹 토스트 알림
-        for connection_id, handler in self.web_connections.items():
+        for connection_id, handler in list(self.web_connections.items()):
             try:
                 handler({
                     'type': 'alert',
-                    'data': alert.to_dict(),
+                    'event_id': message.id,
+                    'data': alert_data,
                     'timestamp': datetime.utcnow().isoformat()
                 })
             except Exception as e:
                 logger.error(f"웹 알림 전송 실패: {e}")
 
         # 모바일 푸시 알림
-        for device_id, handler in self.mobile_connections.items():
+        for device_id, handler in list(self.mobile_connections.items()):
             try:
                 handler({
                     'type': 'push_notification',
-                    'title': alert.title,
-                    'body': alert.message,
-                    'data': alert.to_dict()
+                    'title': alert_data.get('title'),
+                    'body': alert_data.get('message'),
+                    'data': alert_data
                 })
             except Exception as e:
                 logger.error(f"모바일 알림 전송 실패: {e}")
 
+    def get_missed_alerts(self, last_event_id: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """재연결한 클라이언트가 놓친 알림 (last_event_id 이후)"""
+        return [
+            {'type': 'alert', 'event_id': m.id, 'data': m.payload}
+            for m in self.event_bus.replay(ALERTS_TOPIC, last_event_id, limit)
+        ]
+
     def register_web_connection(self,  connection_id: str,  handler: Callable[[Dict[str, Any]], None]):
         """웹 연결 등록"""
         self.web_connections[connection_id] = handler
@@ -464,32 +473,20 @@ class EnhancedRealtimeAlertSystem:
     def _update_alert_in_db(self,  alert: Alert):
         """데이터베이스에서 알림 업데이트"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE alerts 
-                SET resolved = ?, resolved_at = ?
-                WHERE id = ?
-            ''', (alert.resolved, alert.resolved_at.isoformat() if alert.resolved_at else None, alert.id))
-            conn.commit()
-            conn.close()
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    UPDATE alerts
+                    SET resolved = ?, resolved_at = ?
+                    WHERE id = ?
+                ''', (alert.resolved, alert.resolved_at.isoformat() if alert.resolved_at else None, alert.id))
         except Exception as e:
             logger.error(f"알림 데이터베이스 업데이트 실패: {e}")
 
-    def _monitor_loop(self):
-        """모니터링 루프"""
-        while self.monitoring_active:
-            try:
-                # 시스템 리소스 모니터링
-                self._monitor_system_resources()
-                # 비활성 플러그인 체크
-                self._check_inactive_plugins()
-                # 오래된 알림 정리
-                self._cleanup_old_alerts()
-                time.sleep(30)  # 30초마다 체크
-            except Exception as e:
-                logger.error(f"모니터링 루프 오류: {e}")
-                time.sleep(60)
+    def _housekeeping_tick(self):
+        """비활성 플러그인 체크/오래된 알림 정리 (작업 스케줄러가 30초마다 실행)"""
+        self._check_inactive_plugins()
+        self._cleanup_old_alerts()
 
     def _monitor_system_resources(self):
         """시스템 리소스 모니터링"""
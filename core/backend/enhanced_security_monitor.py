@@ -2,18 +2,18 @@ import shutil
 import tempfile
 import subprocess
 from collections import defaultdict
-import sqlite3
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
-import threading
 import time
 import re
 import hashlib
 import os
 import json
 import logging
+from core.backend.job_scheduler import job_scheduler
+from core.backend.sidecar_db import get_sidecar_db
 from typing import Optional
 from flask import request
 config = None  # pyright: ignore
@@ -26,6 +26,8 @@ form = None  # pyright: ignore
 
 logger = logging.getLogger(__name__)
 
+SECURITY_SCAN_JOB = "enhanced_security_monitor.scan"
+
 
 @dataclass
 class SecurityVulnerability:
@@ -95,10 +97,10 @@ class EnhancedSecurityMonitor:
 
     def __init__(self, db_path="security_monitor.db", plugins_dir="plugins"):
         self.db_path = db_path
+        self.db = get_sidecar_db(db_path)
         self.plugins_dir = Path(plugins_dir)
         self.scan_interval = 3600  # 1시간마다 스캔
         self.monitoring_active = False
-        self.scan_thread = None
 
         # 보안 규칙 및 시그니처
         self.malware_signatures = [
@@ -148,100 +150,98 @@ class EnhancedSecurityMonitor:
     def _init_database(self):
         """보안 모니터링 데이터베이스 초기화"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # 취약점 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS vulnerabilities (
-                    id TEXT PRIMARY KEY,
-                    plugin_id TEXT NOT NULL,
-                    severity TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    cve_id TEXT,
-                    cvss_score REAL,
-                    affected_component TEXT,
-                    remediation TEXT,
-                    discovered_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    status TEXT DEFAULT 'open',
-                    false_positive_reason TEXT
-                )
-            ''')
-
-            # 악성코드 감지 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS malware_detections (
-                    id TEXT PRIMARY KEY,
-                    plugin_id TEXT NOT NULL,
-                    file_path TEXT NOT NULL,
-                    malware_type TEXT NOT NULL,
-                    signature TEXT NOT NULL,
-                    confidence REAL NOT NULL,
-                    description TEXT NOT NULL,
-                    detected_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    status TEXT DEFAULT 'detected'
-                )
-            ''')
-
-            # 보안 이벤트 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS security_events (
-                    id TEXT PRIMARY KEY,
-                    plugin_id TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    severity TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    source_ip TEXT,
-                    user_id TEXT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    resolved BOOLEAN DEFAULT FALSE,
-                    resolution_notes TEXT
-                )
-            ''')
-
-            # 플러그인 보안 프로필 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS plugin_security_profiles (
-                    plugin_id TEXT PRIMARY KEY,
-                    risk_level TEXT DEFAULT 'unknown',
-                    last_scan DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    vulnerabilities_count INTEGER DEFAULT 0,
-                    malware_count INTEGER DEFAULT 0,
-                    security_events_count INTEGER DEFAULT 0,
-                    permissions TEXT,
-                    network_access TEXT,
-                    file_access TEXT,
-                    api_calls TEXT,
-                    security_score REAL DEFAULT 100.0,
-                    compliance_status TEXT DEFAULT 'unknown'
-                )
-            ''')
-
-            # 보안 스캔 이력 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS security_scans (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    plugin_id TEXT NOT NULL,
-                    scan_type TEXT NOT NULL,
-                    started_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    completed_at DATETIME,
-                    status TEXT DEFAULT 'running',
-                    findings_count INTEGER DEFAULT 0,
-                    scan_duration REAL DEFAULT 0.0
-                )
-            ''')
-
-            # 인덱스 생성
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_vulns_plugin ON vulnerabilities(plugin_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_vulns_severity ON vulnerabilities(severity)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_malware_plugin ON malware_detections(plugin_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_plugin ON security_events(plugin_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_timestamp ON security_events(timestamp)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_scans_plugin ON security_scans(plugin_id)')
-
-            conn.commit()
-            conn.close()
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+
+                # 취약점 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS vulnerabilities (
+                        id TEXT PRIMARY KEY,
+                        plugin_id TEXT NOT NULL,
+                        severity TEXT NOT NULL,
+                        title TEXT NOT NULL,
+                        description TEXT NOT NULL,
+                        cve_id TEXT,
+                        cvss_score REAL,
+                        affected_component TEXT,
+                        remediation TEXT,
+                        discovered_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        status TEXT DEFAULT 'open',
+                        false_positive_reason TEXT
+                    )
+                ''')
+
+                # 악성코드 감지 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS malware_detections (
+                        id TEXT PRIMARY KEY,
+                        plugin_id TEXT NOT NULL,
+                        file_path TEXT NOT NULL,
+                        malware_type TEXT NOT NULL,
+                        signature TEXT NOT NULL,
+                        confidence REAL NOT NULL,
+                        description TEXT NOT NULL,
+                        detected_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        status TEXT DEFAULT 'detected'
+                    )
+                ''')
+
+                # 보안 이벤트 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS security_events (
+                        id TEXT PRIMARY KEY,
+                        plugin_id TEXT NOT NULL,
+                        event_type TEXT NOT NULL,
+                        severity TEXT NOT NULL,
+                        description TEXT NOT NULL,
+                        source_ip TEXT,
+                        user_id TEXT,
+                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        resolved BOOLEAN DEFAULT FALSE,
+                        resolution_notes TEXT
+                    )
+                ''')
+
+                # 플러그인 보안 프로필 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS plugin_security_profiles (
+                        plugin_id TEXT PRIMARY KEY,
+                        risk_level TEXT DEFAULT 'unknown',
+                        last_scan DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        vulnerabilities_count INTEGER DEFAULT 0,
+                        malware_count INTEGER DEFAULT 0,
+                        security_events_count INTEGER DEFAULT 0,
+                        permissions TEXT,
+                        network_access TEXT,
+                        file_access TEXT,
+                        api_calls TEXT,
+                        security_score REAL DEFAULT 100.0,
+                        compliance_status TEXT DEFAULT 'unknown'
+                    )
+                ''')
+
+                # 보안 스캔 이력 테이블
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS security_scans (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        plugin_id TEXT NOT NULL,
+                        scan_type TEXT NOT NULL,
+                        started_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        completed_at DATETIME,
+                        status TEXT DEFAULT 'running',
+                        findings_count INTEGER DEFAULT 0,
+                        scan_duration REAL DEFAULT 0.0
+                    )
+                ''')
+
+                # 인덱스 생성
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_vulns_plugin ON vulnerabilities(plugin_id)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_vulns_severity ON vulnerabilities(severity)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_malware_plugin ON malware_detections(plugin_id)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_plugin ON security_events(plugin_id)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_timestamp ON security_events(timestamp)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_scans_plugin ON security_scans(plugin_id)')
+
             logger.info("보안 모니터링 데이터베이스 초기화 완료")
 
         except Exception as e:
@@ -272,8 +272,9 @@ class EnhancedSecurityMonitor:
 
         try:
             self.monitoring_active = True
-            self.scan_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-            self.scan_thread.start()
+            # 시작하자마자 한 번 스캔하고 이후 scan_interval마다 (여러 워커 중 한 프로세스에서만)
+            job_scheduler.add_job(SECURITY_SCAN_JOB, self.scan_all_plugins, interval=self.scan_interval,
+                                  singleton=True, initial_delay=0)
             logger.info("보안 모니터링 시작")
             return True
 
@@ -285,22 +286,9 @@ class EnhancedSecurityMonitor:
     def stop_monitoring(self):
         """보안 모니터링 중지"""
         self.monitoring_active = False
-        if self.scan_thread:
-            self.scan_thread.join(timeout=5)
+        job_scheduler.remove_job(SECURITY_SCAN_JOB)
         logger.info("보안 모니터링 중지")
 
-    def _monitoring_loop(self):
-        """모니터링 루프"""
-        while self.monitoring_active:
-            try:
-                # 모든 플러그인에 대해 보안 스캔 실행
-                self.scan_all_plugins()
-                time.sleep(self.scan_interval)
-
-            except Exception as e:
-                logger.error(f"모니터링 루프 오류: {e}")
-                time.sleep(60)  # 오류 시 1분 대기
-
     def scan_all_plugins(self):
         """모든 플러그인 보안 스캔"""
         try:
@@ -702,24 +690,21 @@ class EnhancedSecurityMonitor:
     def _save_vulnerability(self, vulnerability: SecurityVulnerability):
         """취약점 저장"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                INSERT OR REPLACE INTO vulnerabilities 
-                (id, plugin_id, severity, title, description, cve_id, cvss_score, 
-                 affected_component, remediation, discovered_at, status, false_positive_reason)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                vulnerability.id, vulnerability.plugin_id, vulnerability.severity,
-                vulnerability.title, vulnerability.description, vulnerability.cve_id,
-                vulnerability.cvss_score, vulnerability.affected_component,
-                vulnerability.remediation, vulnerability.discovered_at.isoformat(),
-                vulnerability.status, vulnerability.false_positive_reason
-            ))
-
-            conn.commit()
-            conn.close()
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('''
+                    INSERT OR REPLACE INTO vulnerabilities 
+                    (id, plugin_id, severity, title, description, cve_id, cvss_score, 
+                     affected_component, remediation, discovered_at, status, false_positive_reason)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    vulnerability.id, vulnerability.plugin_id, vulnerability.severity,
+                    vulnerability.title, vulnerability.description, vulnerability.cve_id,
+                    vulnerability.cvss_score, vulnerability.affected_component,
+                    vulnerability.remediation, vulnerability.discovered_at.isoformat(),
+                    vulnerability.status, vulnerability.false_positive_reason
+                ))
 
         except Exception as e:
             logger.error(f"취약점 저장 오류: {e}")
@@ -727,22 +712,19 @@ class EnhancedSecurityMonitor:
     def _save_malware_detection(self,  detection: MalwareDetection):
         """악성코드 감지 저장"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                INSERT OR REPLACE INTO malware_detections 
-                (id, plugin_id, file_path, malware_type, signature, confidence, 
-                 description, detected_at, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                detection.id, detection.plugin_id, detection.file_path,
-                detection.malware_type, detection.signature, detection.confidence,
-                detection.description, detection.detected_at.isoformat(), detection.status
-            ))
-
-            conn.commit()
-            conn.close()
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('''
+                    INSERT OR REPLACE INTO malware_detections 
+                    (id, plugin_id, file_path, malware_type, signature, confidence, 
+                     description, detected_at, status)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    detection.id, detection.plugin_id, detection.file_path,
+                    detection.malware_type, detection.signature, detection.confidence,
+                    detection.description, detection.detected_at.isoformat(), detection.status
+                ))
 
         except Exception as e:
             logger.error(f"악성코드 감지 저장 오류: {e}")
@@ -750,22 +732,19 @@ class EnhancedSecurityMonitor:
     def _save_security_event(self,  event: SecurityEvent):
         """보안 이벤트 저장"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                INSERT OR REPLACE INTO security_events 
-                (id, plugin_id, event_type, severity, description, source_ip, 
-                 user_id, timestamp, resolved, resolution_notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                event.id, event.plugin_id, event.event_type, event.severity,
-                event.description, event.source_ip, event.user_id,
-                event.timestamp.isoformat(), event.resolved, event.resolution_notes
-            ))
-
-            conn.commit()
-            conn.close()
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('''
+                    INSERT OR REPLACE INTO security_events 
+                    (id, plugin_id, event_type, severity, description, source_ip, 
+                     user_id, timestamp, resolved, resolution_notes)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    event.id, event.plugin_id, event.event_type, event.severity,
+                    event.description, event.source_ip, event.user_id,
+                    event.timestamp.isoformat(), event.resolved, event.resolution_notes
+                ))
 
         except Exception as e:
             logger.error(f"보안 이벤트 저장 오류: {e}")
@@ -773,28 +752,25 @@ class EnhancedSecurityMonitor:
     def _update_security_profile(self,  plugin_id: str,  findings: Optional[Dict[str,  Any]]):
         """보안 프로필 업데이트"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            risk_assessment = findings.get('risk_assessment', {}) if findings else {}
-
-            cursor.execute('''
-                INSERT OR REPLACE INTO plugin_security_profiles 
-                (plugin_id, risk_level, last_scan, vulnerabilities_count, malware_count,
-                 security_events_count, security_score, compliance_status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                plugin_id, risk_assessment.get('risk_level', 'unknown'), 'unknown',
-                datetime.utcnow().isoformat(),
-                risk_assessment.get('vulnerabilities_count', 0),
-                risk_assessment.get('malware_count', 0),
-                risk_assessment.get('security_events_count', 0),
-                risk_assessment.get('risk_score', 100.0),
-                'compliant' if risk_assessment.get('risk_score', 100.0) > 70 else 'non_compliant'
-            ))
-
-            conn.commit()
-            conn.close()
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+
+                risk_assessment = findings.get('risk_assessment', {}) if findings else {}
+
+                cursor.execute('''
+                    INSERT OR REPLACE INTO plugin_security_profiles 
+                    (plugin_id, risk_level, last_scan, vulnerabilities_count, malware_count,
+                     security_events_count, security_score, compliance_status)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    plugin_id, risk_assessment.get('risk_level', 'unknown'), 'unknown',
+                    datetime.utcnow().isoformat(),
+                    risk_assessment.get('vulnerabilities_count', 0),
+                    risk_assessment.get('malware_count', 0),
+                    risk_assessment.get('security_events_count', 0),
+                    risk_assessment.get('risk_score', 100.0),
+                    'compliant' if risk_assessment.get('risk_score', 100.0) > 70 else 'non_compliant'
+                ))
 
         except Exception as e:
             logger.error(f"보안 프로필 업데이트 오류: {e}")
@@ -802,17 +778,14 @@ class EnhancedSecurityMonitor:
     def _record_scan_start(self,  scan_id: str,  plugin_id: str,  scan_type: str):
         """스캔 시작 기록"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.db.write() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute('''
-                INSERT INTO security_scans 
-                (id, plugin_id, scan_type, started_at, status)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (scan_id, plugin_id, scan_type, datetime.utcnow().isoformat(), 'running'))
-
-            conn.commit()
-            conn.close()
+                cursor.execute('''
+                    INSERT INTO security_scans 
+                    (id, plugin_id, scan_type, started_at, status)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (scan_id, plugin_id, scan_type, datetime.utcnow().isoformat(), 'running'))
 
         except Exception as e:
             logger.error(f"스캔 시작 기록 오류: {e}")
@@ -820,17 +793,14 @@ class EnhancedSecurityMonitor:
     def _record_scan_complete(self,  scan_id: str,  findings_count: int,  duration: float):
         """스캔 완료 기록"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                UPDATE security_scans 
-                SET completed_at = ?, status = ?, findings_count = ?, scan_duration = ?
-                WHERE id = ?
-            ''', (datetime.utcnow().isoformat(), 'completed', findings_count, duration, scan_id))
+            with self.db.write() as conn:
+                cursor = conn.cursor()
 
-            conn.commit()
-            conn.close()
+                cursor.execute('''
+                    UPDATE security_scans 
+                    SET completed_at = ?, status = ?, findings_count = ?, scan_duration = ?
+                    WHERE id = ?
+                ''', (datetime.utcnow().isoformat(), 'completed', findings_count, duration, scan_id))
 
         except Exception as e:
             logger.error(f"스캔 완료 기록 오류: {e}")
@@ -838,17 +808,14 @@ class EnhancedSecurityMonitor:
     def _record_scan_error(self,  scan_id: str,  error_message: str):
         """스캔 오류 기록"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                UPDATE security_scans 
-                SET completed_at = ?, status = ?
-                WHERE id = ?
-            ''', (datetime.utcnow().isoformat(), f'error: {error_message}', scan_id))
+            with self.db.write() as conn:
+                cursor = conn.cursor()
 
-            conn.commit()
-            conn.close()
+                cursor.execute('''
+                    UPDATE security_scans 
+                    SET completed_at = ?, status = ?
+                    WHERE id = ?
+                ''', (datetime.utcnow().isoformat(), f'error: {error_message}', scan_id))
 
         except Exception as e:
             logger.error(f"스캔 오류 기록 실패: {e}")
@@ -856,36 +823,34 @@ class EnhancedSecurityMonitor:
     def get_security_summary(self) -> Optional[Dict[str, Any]]:
         """보안 요약 정보 조회"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # 전체 통계
-            cursor.execute('SELECT COUNT(*) FROM vulnerabilities WHERE status = "open"')
-            open_vulnerabilities = cursor.fetchone()[0]
-
-            cursor.execute('SELECT COUNT(*) FROM malware_detections WHERE status = "detected"')
-            active_malware = cursor.fetchone()[0]
-
-            cursor.execute('SELECT COUNT(*) FROM security_events WHERE resolved = FALSE')
-            unresolved_events = cursor.fetchone()[0]
-
-            cursor.execute('SELECT COUNT(*) FROM plugin_security_profiles WHERE risk_level = "critical"')
-            critical_plugins = cursor.fetchone()[0]
-
-            cursor.execute('SELECT COUNT(*) FROM plugin_security_profiles WHERE risk_level = "high"')
-            high_risk_plugins = cursor.fetchone()[0]
-
-            # 최근 보안 이벤트
-            cursor.execute('''
-                SELECT plugin_id, event_type, severity, description, timestamp
-                FROM security_events 
-                WHERE timestamp > datetime('now', '-24 hours')
-                ORDER BY timestamp DESC
-                LIMIT 10
-            ''')
-            recent_events = cursor.fetchall()
-
-            conn.close()
+            with self.db.read() as conn:
+                cursor = conn.cursor()
+
+                # 전체 통계
+                cursor.execute('SELECT COUNT(*) FROM vulnerabilities WHERE status = "open"')
+                open_vulnerabilities = cursor.fetchone()[0]
+
+                cursor.execute('SELECT COUNT(*) FROM malware_detections WHERE status = "detected"')
+                active_malware = cursor.fetchone()[0]
+
+                cursor.execute('SELECT COUNT(*) FROM security_events WHERE resolved = FALSE')
+                unresolved_events = cursor.fetchone()[0]
+
+                cursor.execute('SELECT COUNT(*) FROM plugin_security_profiles WHERE risk_level = "critical"')
+                critical_plugins = cursor.fetchone()[0]
+
+                cursor.execute('SELECT COUNT(*) FROM plugin_security_profiles WHERE risk_level = "high"')
+                high_risk_plugins = cursor.fetchone()[0]
+
+                # 최근 보안 이벤트
+                cursor.execute('''
+                    SELECT plugin_id, event_type, severity, description, timestamp
+                    FROM security_events 
+                    WHERE timestamp > datetime('now', '-24 hours')
+                    ORDER BY timestamp DESC
+                    LIMIT 10
+                ''')
+                recent_events = [tuple(row) for row in cursor.fetchall()]
 
             return {
                 'open_vulnerabilities': open_vulnerabilities,
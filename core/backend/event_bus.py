@@ -0,0 +1,393 @@
+"""
+프로세스 간 이벤트 버스
+실시간 알림/통지를 한 번만 발행하면 소켓을 들고 있는 워커(프로세스)가 전달하도록 하는
+발행/구독 계층
+
+- InProcessEventBus: 단일 프로세스용 (개발/테스트, Redis 없을 때 기본값)
+- RedisEventBus: Redis Streams 기반. 모든 워커가 같은 스트림을 읽으므로 어느 워커에서
+  발행해도 모든 워커의 구독자에게 전달된다.
+- publish_many 일괄 발행, 전달 큐 크기 제한(백프레셔), 스트림 오프셋 기반 재전송(replay)
+  으로 재연결한 클라이언트가 놓친 이벤트를 받을 수 있다 (at-least-once).
+"""
+
+import abc
+import itertools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 표준 토픽
+ALERTS_TOPIC = "alerts"
+NOTIFICATIONS_TOPIC = "notifications"
+
+
+@dataclass
+class BusMessage:
+    """버스 메시지 (id는 스트림 오프셋, 'ms-seq' 형식)"""
+    topic: str
+    payload: Dict[str, Any]
+    id: str = ""
+    origin: str = ""
+    published_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _id_key(message_id: str) -> Tuple[int, int]:
+    """'ms-seq' 오프셋을 비교 가능한 튜플로 변환"""
+    ms, _, seq = message_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+def _text(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class EventBus(abc.ABC):
+    """이벤트 버스 공통 동작 (구독자 관리, 전달 큐, 디스패처 스레드)
+
+    구독자 핸들러는 디스패처 스레드에서 호출된다. 전달 큐가 가득 차면 발행자는
+    publish_timeout 초까지 기다리고(백프레셔), 그래도 자리가 없으면 메시지를 버린다.
+    """
+
+    def __init__(self, queue_size: int = 10000, batch_size: int = 100, publish_timeout: float = 1.0):
+        self.batch_size = batch_size
+        self.publish_timeout = publish_timeout
+        self.origin = f"{os.getpid()}"
+        self._subscribers: Dict[str, Dict[str, Callable[[BusMessage], None]]] = {}
+        self._subscriber_ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._queue: "queue.Queue[Optional[BusMessage]]" = queue.Queue(maxsize=queue_size)
+        self._dispatcher: Optional[threading.Thread] = None
+        self._running = True
+        self.stats = {'published': 0, 'delivered': 0, 'dropped': 0, 'handler_errors': 0}
+
+    # === 구독 ===
+
+    def subscribe(self, topic: str, handler: Callable[[BusMessage], None]) -> str:
+        """토픽 구독, 구독 해제에 쓸 구독 ID 반환"""
+        subscription_id = f"{topic}:{next(self._subscriber_ids)}"
+        with self._lock:
+            new_topic = topic not in self._subscribers
+            self._subscribers.setdefault(topic, {})[subscription_id] = handler
+            self._ensure_dispatcher()
+        if new_topic:
+            self._on_new_topic(topic)
+        return subscription_id
+
+    def unsubscribe(self, subscription_id: str) -> bool:
+        """구독 해제"""
+        topic = subscription_id.rsplit(":", 1)[0]
+        with self._lock:
+            handlers = self._subscribers.get(topic)
+            if not handlers or subscription_id not in handlers:
+                return False
+            del handlers[subscription_id]
+            if not handlers:
+                del self._subscribers[topic]
+            return True
+
+    def _on_new_topic(self, topic: str):
+        """새 토픽 구독 시 백엔드별 준비 (Redis는 읽기 시작 위치 기록)"""
+
+    # === 발행 ===
+
+    def publish(self, topic: str, payload: Dict[str, Any]) -> Optional[str]:
+        """메시지 발행 후 메시지 ID 반환 (실패 시 None)"""
+        ids = self.publish_many(topic, [payload])
+        return ids[0] if ids else None
+
+    @abc.abstractmethod
+    def publish_many(self, topic: str, payloads: List[Dict[str, Any]]) -> List[str]:
+        """여러 메시지를 한 번에 발행"""
+
+    @abc.abstractmethod
+    def replay(self, topic: str, after_id: Optional[str] = None, limit: int = 100) -> List[BusMessage]:
+        """after_id 이후 메시지 조회 (재연결 클라이언트의 놓친 이벤트 재전송용)"""
+
+    # === 전달 ===
+
+    def _enqueue(self, message: BusMessage, timeout: Optional[float]) -> bool:
+        """전달 큐에 추가 (timeout=None이면 자리가 날 때까지 대기)"""
+        with self._lock:
+            if message.topic not in self._subscribers:
+                return False
+        try:
+            self._queue.put(message, timeout=timeout)
+            return True
+        except queue.Full:
+            self.stats['dropped'] += 1
+            logger.warning(f"이벤트 버스 전달 큐 가득 참, 메시지 버림: {message.topic} {message.id}")
+            return False
+
+    def _ensure_dispatcher(self):
+        if self._dispatcher is None or not self._dispatcher.is_alive():
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True,
+                                                name="event-bus-dispatcher")
+            self._dispatcher.start()
+
+    def _dispatch_loop(self):
+        """전달 큐에서 batch_size개씩 꺼내 구독자에게 전달"""
+        while self._running:
+            message = self._queue.get()
+            batch = [message]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for message in batch:
+                try:
+                    if message is None:
+                        return
+                    self._dispatch(message)
+                finally:
+                    self._queue.task_done()
+
+    def _dispatch(self, message: BusMessage):
+        with self._lock:
+            handlers = list(self._subscribers.get(message.topic, {}).values())
+        for handler in handlers:
+            try:
+                handler(message)
+                self.stats['delivered'] += 1
+            except Exception as e:
+                self.stats['handler_errors'] += 1
+                logger.error(f"이벤트 핸들러 오류 ({message.topic}): {e}")
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """전달 큐가 빌 때까지 대기 (테스트/종료용)"""
+        deadline = time.time() + timeout
+        while self._queue.unfinished_tasks:
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            topics = {topic: len(handlers) for topic, handlers in self._subscribers.items()}
+        return {**self.stats, 'pending': self._queue.qsize(), 'subscriptions': topics,
+                'backend': self.__class__.__name__}
+
+    def after_fork(self):
+        """
+        포크된 자식 프로세스에서 호출. 스레드는 포크 후 자식에 남지 않으므로 부모의 전달 큐/락을 버리고
+        구독이 있으면 디스패처를 다시 시작 (구독자 목록은 그대로 유지)
+        """
+        self.origin = f"{os.getpid()}"
+        self._lock = threading.RLock()
+        self._queue = queue.Queue(maxsize=self._queue.maxsize)
+        self._dispatcher = None
+        if self._running and self._subscribers:
+            self._ensure_dispatcher()
+
+    def close(self):
+        """디스패처 종료"""
+        self._running = False
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+
+class InProcessEventBus(EventBus):
+    """단일 프로세스 이벤트 버스 (토픽별 최근 history_size개를 재전송용으로 보관)"""
+
+    def __init__(self, history_size: int = 1000, **kwargs):
+        super().__init__(**kwargs)
+        self.history_size = history_size
+        self._history: Dict[str, Deque[BusMessage]] = {}
+        self._last_id = (0, 0)
+
+    def _next_id(self) -> str:
+        """Redis 스트림과 같은 'ms-seq' 형식의 단조 증가 ID"""
+        ms = int(time.time() * 1000)
+        last_ms, last_seq = self._last_id
+        self._last_id = (ms, 0) if ms > last_ms else (last_ms, last_seq + 1)
+        return f"{self._last_id[0]}-{self._last_id[1]}"
+
+    def publish_many(self, topic: str, payloads: List[Dict[str, Any]]) -> List[str]:
+        messages = []
+        with self._lock:
+            history = self._history.setdefault(topic, deque(maxlen=self.history_size))
+            for payload in payloads:
+                message = BusMessage(topic=topic, payload=payload, id=self._next_id(), origin=self.origin)
+                history.append(message)
+                messages.append(message)
+            self.stats['published'] += len(messages)
+        for message in messages:
+            self._enqueue(message, self.publish_timeout)
+        return [m.id for m in messages]
+
+    def replay(self, topic: str, after_id: Optional[str] = None, limit: int = 100) -> List[BusMessage]:
+        with self._lock:
+            history = list(self._history.get(topic, ()))
+        if after_id:
+            after = _id_key(after_id)
+            history = [m for m in history if _id_key(m.id) > after]
+        return history[:limit]
+
+
+class RedisEventBus(EventBus):
+    """Redis Streams 기반 이벤트 버스
+
+    토픽마다 스트림(stream_prefix + topic) 하나를 두고 XADD MAXLEN ~ maxlen 으로 길이를
+    제한한다. 각 워커는 소비자 그룹 없이 스트림을 직접 XREAD 하므로 모든 워커가 모든
+    메시지를 받는다. 전달 큐가 가득 차면 읽기 스레드가 멈추고 메시지는 스트림에 남는다.
+    """
+
+    def __init__(self, client, stream_prefix: str = "bus:", maxlen: int = 10000,
+                 block_ms: int = 1000, **kwargs):
+        super().__init__(**kwargs)
+        self.client = client
+        self.stream_prefix = stream_prefix
+        self.maxlen = maxlen
+        self.block_ms = block_ms
+        self._offsets: Dict[str, str] = {}
+        self._reader: Optional[threading.Thread] = None
+
+    def _stream(self, topic: str) -> str:
+        return f"{self.stream_prefix}{topic}"
+
+    def _on_new_topic(self, topic: str):
+        """구독 시점의 마지막 ID부터 읽기 ('$'는 매 XREAD마다 다시 해석되므로 사용하지 않음)"""
+        try:
+            last = self.client.xrevrange(self._stream(topic), count=1)
+            offset = _text(last[0][0]) if last else "0-0"
+        except Exception as e:
+            logger.warning(f"이벤트 스트림 위치 조회 실패 ({topic}): {e}")
+            offset = "0-0"
+        with self._lock:
+            self._offsets[topic] = offset
+            if self._reader is None or not self._reader.is_alive():
+                self._reader = threading.Thread(target=self._read_loop, daemon=True,
+                                                name="event-bus-redis-reader")
+                self._reader.start()
+
+    def after_fork(self):
+        super().after_fork()
+        self._reader = None
+        if self._running and self._offsets:
+            # 부모가 읽은 위치부터 이 프로세스의 읽기 스레드로 이어 읽음
+            self._reader = threading.Thread(target=self._read_loop, daemon=True, name="event-bus-redis-reader")
+            self._reader.start()
+
+    def publish_many(self, topic: str, payloads: List[Dict[str, Any]]) -> List[str]:
+        if not payloads:
+            return []
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for payload in payloads:
+                pipe.xadd(
+                    self._stream(topic),
+                    {'data': json.dumps(payload, default=str), 'origin': self.origin,
+                     'published_at': str(time.time())},
+                    maxlen=self.maxlen,
+                    approximate=True,
+                )
+            ids = [_text(message_id) for message_id in pipe.execute()]
+            self.stats['published'] += len(ids)
+            return ids
+        except Exception as e:
+            logger.error(f"이벤트 발행 실패 ({topic}): {e}")
+            return []
+
+    def _decode(self, topic: str, message_id, fields) -> BusMessage:
+        fields = {_text(k): _text(v) for k, v in fields.items()}
+        return BusMessage(
+            topic=topic,
+            payload=json.loads(fields.get('data') or '{}'),
+            id=_text(message_id),
+            origin=fields.get('origin', ''),
+            published_at=float(fields.get('published_at') or 0),
+        )
+
+    def _read_loop(self):
+        """구독 중인 스트림을 XREAD BLOCK 으로 읽어 전달 큐에 넣음"""
+        while self._running:
+            with self._lock:
+                streams = {self._stream(t): self._offsets[t] for t in self._subscribers if t in self._offsets}
+            if not streams:
+                time.sleep(self.block_ms / 1000)
+                continue
+            try:
+                response = self.client.xread(streams, count=self.batch_size, block=self.block_ms)
+            except Exception as e:
+                logger.warning(f"이벤트 스트림 읽기 실패, 1초 후 재시도: {e}")
+                time.sleep(1)
+                continue
+            for stream, entries in response or []:
+                topic = _text(stream)[len(self.stream_prefix):]
+                for message_id, fields in entries:
+                    message = self._decode(topic, message_id, fields)
+                    # 백프레셔: 전달 큐에 자리가 날 때까지 읽기를 멈춤
+                    self._enqueue(message, timeout=None)
+                    with self._lock:
+                        self._offsets[topic] = message.id
+
+    def replay(self, topic: str, after_id: Optional[str] = None, limit: int = 100) -> List[BusMessage]:
+        try:
+            entries = self.client.xrange(self._stream(topic), min=after_id or "-", max="+", count=limit + 1)
+        except Exception as e:
+            logger.error(f"이벤트 재전송 조회 실패 ({topic}): {e}")
+            return []
+        messages = [self._decode(topic, message_id, fields) for message_id, fields in entries]
+        if after_id:
+            messages = [m for m in messages if m.id != after_id]
+        return messages[:limit]
+
+
+def create_event_bus(backend: Optional[str] = None, redis_url: Optional[str] = None, **kwargs) -> EventBus:
+    """설정에 맞는 이벤트 버스 생성
+
+    backend 가 없으면 EVENT_BUS_BACKEND 환경 변수(memory/redis)를 따르고, redis 연결에
+    실패하면 프로세스 내 버스로 대체한다.
+    """
+    backend = backend or os.environ.get('EVENT_BUS_BACKEND', 'memory')
+    if backend == 'redis':
+        redis_url = redis_url or os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+        try:
+            import redis
+
+            client = redis.from_url(redis_url)
+            client.ping()
+            logger.info(f"Redis 이벤트 버스 연결 성공: {redis_url}")
+            return RedisEventBus(client, **kwargs)
+        except Exception as e:
+            logger.warning(f"Redis 이벤트 버스 연결 실패, 프로세스 내 버스 사용: {e}")
+    return InProcessEventBus(**kwargs)
+
+
+_event_bus: Optional[EventBus] = None
+_event_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    """프로세스 공용 이벤트 버스"""
+    global _event_bus
+    with _event_bus_lock:
+        if _event_bus is None:
+            _event_bus = create_event_bus()
+        return _event_bus
+
+
+def _reset_after_fork():
+    """포크된 자식에서 공용 버스의 큐/락/스레드를 새로 만듦 (gunicorn --preload 워커 등)"""
+    global _event_bus_lock
+    _event_bus_lock = threading.Lock()
+    if _event_bus is not None:
+        _event_bus.after_fork()
+
+
+if hasattr(os, "register_at_fork"):  # Windows 제외
+    os.register_at_fork(after_in_child=_reset_after_fork)
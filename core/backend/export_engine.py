@@ -0,0 +1,402 @@
+"""
+스트리밍 내보내기 엔진
+관리자 리포트 내보내기가 .all()로 전체 행을 읽고 행마다 연관 객체(record.user)를 지연 로딩한 뒤
+pandas DataFrame을 만들어 한 번에 쓰던 것을, 행을 배치 단위로 흘려 보내 메모리를 행 수와 무관하게 유지한다.
+
+- 조회: 호출하는 쪽이 연관 객체를 joinedload로 함께 읽는 쿼리를 만들고, 여기서는 yield_per 배치로 순회
+- CSV: CSV_CHUNK_SIZE 단위로 응답 본문에 바로 흘려 보냄 (Excel에서 열리도록 UTF-8 BOM)
+- Excel: xlsxwriter constant_memory 모드로 행을 쓰는 즉시 디스크로 내보내고, 완성된 파일을 스트리밍 전송
+- PDF: reportlab 페이지 단위 기록 (페이지 압축). 사람이 읽는 문서라 PDF_MAX_ROWS를 넘으면 안내 문구로 마감
+- Excel 행 수가 BACKGROUND_THRESHOLD를 넘으면 내보내기 전용 작업 풀(EXPORT_WORKERS개)에서 파일을 만들고
+  상태/다운로드 URL을 반환. 몇 분씩 걸리는 내보내기가 작업 스케줄러의 공용 풀을 차지해 주기 작업이 밀리지 않도록
+  풀을 나누고, 넘치는 요청은 pending으로 기다린다. 작업 상태는 EXPORT_DIR의 JSON 파일로 남겨 다른 워커에서도
+  조회/다운로드할 수 있다
+"""
+
+import csv
+import io
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import quote
+
+from flask import Response, current_app, jsonify, send_file, stream_with_context, url_for
+
+logger = logging.getLogger(__name__)
+
+EXPORT_DIR = os.environ.get("EXPORT_DIR", os.path.join(tempfile.gettempdir(), "exports"))
+STREAM_BATCH_SIZE = 1000  # yield_per 배치 크기
+CSV_CHUNK_SIZE = 64 * 1024  # CSV 응답 청크 크기 (bytes)
+PDF_MAX_ROWS = 20000  # PDF 최대 행 수
+BACKGROUND_THRESHOLD = int(os.environ.get("EXPORT_BACKGROUND_ROWS", "200000"))
+EXPORT_TTL = 24 * 3600  # 완료된 내보내기 파일 보관 시간 (초)
+EXPORT_WORKERS = int(os.environ.get("EXPORT_WORKERS", "2"))  # 동시에 만드는 백그라운드 내보내기 수
+
+# 백그라운드 작업 상태/다운로드 라우트 (routes/admin_dashboard_export.py)
+STATUS_ENDPOINT = "admin_dashboard_export.export_job_status"
+DOWNLOAD_ENDPOINT = "admin_dashboard_export.export_job_download"
+
+FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "pdf": "application/pdf",
+}
+
+_JOB_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+@dataclass
+class ExportColumn:
+    """내보낼 열 (value는 레코드 하나를 받아 셀 값을 돌려줌)"""
+    header: str
+    value: Callable[[Any], Any]
+    width: int = 15  # Excel 열 너비 / PDF 열 비율 (전체 행을 보기 전에 정해야 하므로 고정)
+
+
+@dataclass
+class ExportSheet:
+    """시트 하나. rows는 요청/작업 스레드 안에서 호출되어 레코드를 하나씩 내놓는 함수"""
+    name: str
+    columns: List[ExportColumn]
+    rows: Callable[[], Iterable[Any]]
+
+    def iter_values(self) -> Iterator[List[Any]]:
+        for record in self.rows():
+            yield [column.value(record) for column in self.columns]
+
+
+@dataclass
+class ExportSpec:
+    """내보내기 정의 (filename은 확장자 제외, count는 백그라운드 여부 판단용 행 수)"""
+    filename: str
+    title: str
+    sheets: List[ExportSheet]
+    count: Optional[Callable[[], int]] = None
+    summary: List[str] = field(default_factory=list)  # PDF 머리말 줄
+
+
+def stream_query(query, batch_size: int = STREAM_BATCH_SIZE):
+    """ORM 쿼리를 batch_size개씩 가져오며 레코드를 하나씩 반환 (연관 객체는 joinedload로 함께)"""
+    return query.yield_per(batch_size)
+
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M")
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _cell(value: Any) -> Any:
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else _text(value)
+
+
+# ==================== 형식별 기록 ====================
+
+def iter_csv(spec: ExportSpec, chunk_size: int = CSV_CHUNK_SIZE) -> Iterator[bytes]:
+    """첫 시트를 CSV로, chunk_size 단위 bytes로 내놓음"""
+    sheet = spec.sheets[0]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")  # Excel이 UTF-8로 열도록 BOM
+    writer.writerow([column.header for column in sheet.columns])
+    for values in sheet.iter_values():
+        writer.writerow([_text(value) for value in values])
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def write_xlsx(spec: ExportSpec, path: str) -> int:
+    """모든 시트를 constant_memory 모드로 기록, 첫 시트 행 수 반환"""
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True, "tmpdir": os.path.dirname(path)})
+    header_format = workbook.add_format({"bold": True})
+    written = 0
+    try:
+        for index, sheet in enumerate(spec.sheets):
+            worksheet = workbook.add_worksheet(sheet.name[:31])
+            for col, column in enumerate(sheet.columns):
+                worksheet.set_column(col, col, column.width)
+            worksheet.write_row(0, 0, [column.header for column in sheet.columns], header_format)
+            row = 0
+            for row, values in enumerate(sheet.iter_values(), start=1):
+                worksheet.write_row(row, 0, [_cell(value) for value in values])
+            if index == 0:
+                written = row
+    finally:
+        workbook.close()
+    return written
+
+
+def _pdf_font() -> str:
+    # 한글이 보이도록 reportlab 내장 CID 폰트 사용 (없으면 Helvetica)
+    try:
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+
+        if "HYSMyeongJo-Medium" not in pdfmetrics.getRegisteredFontNames():
+            pdfmetrics.registerFont(UnicodeCIDFont("HYSMyeongJo-Medium"))
+        return "HYSMyeongJo-Medium"
+    except Exception as e:
+        logger.warning(f"PDF 한글 폰트 등록 실패: {e}")
+        return "Helvetica"
+
+
+def write_pdf(spec: ExportSpec, path: str, max_rows: int = PDF_MAX_ROWS) -> int:
+    """첫 시트를 표로 기록 (페이지마다 머리행 반복), 기록한 행 수 반환"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
+    sheet = spec.sheets[0]
+    font = _pdf_font()
+    page_width, page_height = A4
+    scale = (page_width - 100) / sum(column.width for column in sheet.columns)
+    xs, x = [], 50.0
+    for column in sheet.columns:
+        xs.append(x)
+        x += column.width * scale
+    max_chars = [max(4, int(column.width * scale / 5)) for column in sheet.columns]
+
+    c = canvas.Canvas(path, pagesize=A4, pageCompression=1)
+
+    def header_row(y):
+        c.setFont(font, 9)
+        for i, column in enumerate(sheet.columns):
+            c.drawString(xs[i], y, column.header)
+        c.setFont(font, 8)
+        return y - 20
+
+    c.setFont(font, 16)
+    c.drawString(50, page_height - 42, spec.title)
+    c.setFont(font, 10)
+    y = page_height - 62
+    for line in [f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M')}"] + spec.summary:
+        c.drawString(50, y, line)
+        y -= 20
+    y = header_row(y - 20)
+
+    written = 0
+    for values in sheet.iter_values():
+        if y < 50:
+            c.showPage()
+            y = header_row(page_height - 50)
+        if written >= max_rows:
+            c.drawString(50, y, f"... {max_rows:,}행 이후는 생략했습니다. 전체 데이터는 Excel/CSV로 내보내세요.")
+            break
+        for i, value in enumerate(values):
+            text = _text(value)
+            if len(text) > max_chars[i]:
+                text = text[:max_chars[i] - 1] + "…"
+            c.drawString(xs[i], y, text)
+        y -= 15
+        written += 1
+    c.save()
+    return written
+
+
+def write_export(spec: ExportSpec, fmt: str, path: str) -> int:
+    """형식에 맞게 파일로 기록, 행 수 반환"""
+    if fmt == "csv":
+        sheet = spec.sheets[0]
+        rows = 0
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow([column.header for column in sheet.columns])
+            for values in sheet.iter_values():
+                writer.writerow([_text(value) for value in values])
+                rows += 1
+        return rows
+    if fmt == "xlsx":
+        return write_xlsx(spec, path)
+    if fmt == "pdf":
+        return write_pdf(spec, path)
+    raise ValueError(f"지원하지 않는 내보내기 형식: {fmt}")
+
+
+# ==================== 백그라운드 작업 ====================
+
+@dataclass
+class ExportJob:
+    """백그라운드 내보내기 작업 상태"""
+    id: str
+    format: str
+    filename: str
+    owner_id: Optional[int] = None
+    status: str = "pending"  # pending, running, done, failed
+    rows: int = 0
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ExportJobManager:
+    """큰 내보내기를 전용 작업 풀에서 파일로 만들고, 상태를 디렉터리의 JSON 파일로 공유"""
+
+    def __init__(self, directory: str = EXPORT_DIR, ttl: float = EXPORT_TTL, max_workers: int = EXPORT_WORKERS):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """전용 작업 풀 (처음 쓸 때 생성, 포크된 워커에서는 새로 생성)"""
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="export")
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._executor_pid == os.getpid():
+            executor.shutdown(wait=wait)
+
+    def _meta_path(self, job_id: str) -> str:
+        return os.path.join(self.directory, f"{job_id}.json")
+
+    def file_path(self, job: ExportJob) -> str:
+        return os.path.join(self.directory, f"{job.id}.{job.format}")
+
+    def _save(self, job: ExportJob):
+        path = self._meta_path(job.id)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(job.to_dict(), f, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        if not _JOB_ID.match(job_id or ""):
+            return None
+        try:
+            with open(self._meta_path(job_id), encoding="utf-8") as f:
+                return ExportJob(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def submit(self, spec: ExportSpec, fmt: str, owner_id: Optional[int] = None) -> ExportJob:
+        """내보내기 작업 등록 (현재 앱 컨텍스트로 작업 스레드에서 실행)"""
+        os.makedirs(self.directory, exist_ok=True)
+        self.cleanup()
+        job = ExportJob(id=uuid.uuid4().hex, format=fmt, filename=f"{spec.filename}.{fmt}", owner_id=owner_id)
+        self._save(job)
+        app = current_app._get_current_object()
+
+        def run():
+            with app.app_context():
+                self._run(job, spec)
+
+        try:
+            self._get_executor().submit(run)
+        except RuntimeError:  # 종료 중
+            job.status, job.error = "failed", "작업 풀을 사용할 수 없습니다."
+            self._save(job)
+        return job
+
+    def _run(self, job: ExportJob, spec: ExportSpec):
+        job.status = "running"
+        self._save(job)
+        path = self.file_path(job)
+        try:
+            job.rows = write_export(spec, job.format, path + ".part")
+            os.replace(path + ".part", path)
+            job.status = "done"
+        except Exception as e:
+            logger.error(f"내보내기 작업 실패 {job.id}: {e}")
+            job.status, job.error = "failed", str(e)
+            if os.path.exists(path + ".part"):
+                os.remove(path + ".part")
+        job.finished_at = time.time()
+        self._save(job)
+
+    def cleanup(self):
+        """보관 시간이 지난 내보내기 파일 삭제"""
+        cutoff = time.time() - self.ttl
+        try:
+            for name in os.listdir(self.directory):
+                path = os.path.join(self.directory, name)
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+        except OSError as e:
+            logger.warning(f"내보내기 파일 정리 실패: {e}")
+
+
+# 전역 인스턴스
+export_jobs = ExportJobManager()
+
+
+# ==================== 응답 ====================
+
+def _disposition(filename: str) -> str:
+    # 한글 파일명은 RFC 5987 filename*로, 구형 클라이언트용 ASCII 이름도 함께
+    fallback = filename.encode("ascii", "ignore").decode() or "export"
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename)}"
+
+
+def _url(endpoint: str, job_id: str) -> Optional[str]:
+    try:
+        return url_for(endpoint, job_id=job_id)
+    except Exception:
+        return None
+
+
+def job_response(job: ExportJob):
+    """작업 상태 JSON (완료되면 다운로드 URL 포함)"""
+    data = job.to_dict()
+    data["status_url"] = _url(STATUS_ENDPOINT, job.id)
+    data["download_url"] = _url(DOWNLOAD_ENDPOINT, job.id) if job.status == "done" else None
+    return jsonify(data), 202 if job.status in ("pending", "running") else 200
+
+
+def export_response(spec: ExportSpec, fmt: str, owner_id: Optional[int] = None,
+                    background: Optional[bool] = None):
+    """
+    내보내기 응답
+    - csv: 청크 스트리밍 응답
+    - xlsx/pdf: 임시 파일에 기록한 뒤 파일 스트리밍 (전송 후 삭제)
+    - background=None이면 xlsx 행 수가 BACKGROUND_THRESHOLD를 넘을 때 백그라운드 작업(202 + 상태 URL)
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 내보내기 형식: {fmt}")
+    if background is None:
+        background = fmt == "xlsx" and spec.count is not None and spec.count() > BACKGROUND_THRESHOLD
+    if background:
+        return job_response(export_jobs.submit(spec, fmt, owner_id))
+
+    filename = f"{spec.filename}.{fmt}"
+    if fmt == "csv":
+        return Response(stream_with_context(iter_csv(spec)), mimetype=FORMATS[fmt],
+                        headers={"Content-Disposition": _disposition(filename), "X-Accel-Buffering": "no"})
+
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(suffix=f".{fmt}", dir=EXPORT_DIR)
+    os.close(fd)
+    try:
+        write_export(spec, fmt, path)
+    except Exception:
+        os.remove(path)
+        raise
+    response = send_file(path, mimetype=FORMATS[fmt], as_attachment=True, download_name=filename)
+    response.call_on_close(lambda: os.path.exists(path) and os.remove(path))
+    return response
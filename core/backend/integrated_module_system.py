@@ -1,8 +1,6 @@
 from core.backend.central_data_layer import CentralDataLayer  # pyright: ignore
 from concurrent.futures import ThreadPoolExecutor  # pyright: ignore
 import asyncio
-import time
-import threading
 from enum import Enum
 from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Callable
@@ -10,6 +8,8 @@ from datetime import datetime, timedelta
 import logging
 import json
 from typing import Optional
+
+from core.backend.job_scheduler import job_scheduler
 form = None  # pyright: ignore
 """
 통합 연동 모듈 시스템
@@ -147,13 +147,17 @@ class IntegratedModuleSystem:
         self.running = True
         logger.info("통합 연동 모듈 시스템 시작")
 
-        # 백그라운드 작업 시작
-        threading.Thread(target=self._background_analytics_worker, daemon=True).start()
-        threading.Thread(target=self._background_notification_worker, daemon=True).start()
+        # 백그라운드 작업 등록 (여러 워커 중 한 프로세스에서만 실행)
+        job_scheduler.add_job("integrated_module.daily_analytics", self._run_daily_analytics,
+                              daily_at="00:00", singleton=True)
+        job_scheduler.add_job("integrated_module.notifications", self._process_unread_notifications,
+                              interval=30, singleton=True)
 
     def stop_integration_system(self):
         """통합 시스템 중지"""
         self.running = False
+        job_scheduler.remove_job("integrated_module.daily_analytics")
+        job_scheduler.remove_job("integrated_module.notifications")
         self.executor.shutdown(wait=True)
         logger.info("통합 연동 모듈 시스템 중지")
 
@@ -459,38 +463,14 @@ class IntegratedModuleSystem:
 
     # === 백그라운드 작업자들 ===
 
-    def _background_analytics_worker(self):
-        """백그라운드 분석 작업자"""
-        while self.running:
-            try:
-                # 매일 자정에 전체 분석 실행
-                now = datetime.now()
-                if now.hour == 0 and now.minute == 0:
-                    self._run_daily_analytics()
-
-                time.sleep(60)  # 1분마다 체크
-
-            except Exception as e:
-                logger.error(f"백그라운드 분석 작업자 오류: {e}")
-                time.sleep(60)
-
-    def _background_notification_worker(self):
-        """백그라운드 알림 작업자"""
-        while self.running:
-            try:
-                # 미읽 알림 처리
-                unread_notifications = self.central_data.get_notifications(is_read=False)
-
-                for notification in unread_notifications:
-                    # 알림 우선순위에 따른 처리
-                    if notification['priority'] == 'high':
-                        self._process_high_priority_notification(notification)
-
-                time.sleep(30)  # 30초마다 체크
-
-            except Exception as e:
-                logger.error(f"백그라운드 알림 작업자 오류: {e}")
-                time.sleep(30)
+    def _process_unread_notifications(self):
+        """미읽 알림 처리 (작업 스케줄러가 30초마다 실행)"""
+        unread_notifications = self.central_data.get_notifications(is_read=False)
+
+        for notification in unread_notifications:
+            # 알림 우선순위에 따른 처리
+            if notification['priority'] == 'high':
+                self._process_high_priority_notification(notification)
 
     def _run_daily_analytics(self):
         """일일 분석 실행"""
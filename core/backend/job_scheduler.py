@@ -0,0 +1,499 @@
+"""
+공용 백그라운드 작업 스케줄러
+모듈마다 threading.Thread + time.sleep 루프를 따로 띄우던 방식 대신, 주기 작업을 한 곳에
+등록해 스레드 하나(타이머)와 크기가 정해진 작업 풀로 실행한다.
+
+- 타이머: 다음 실행 시각 기준 힙. 가장 이른 작업 시각까지만 기다림
+- 실행: ThreadPoolExecutor(max_workers). 같은 작업이 아직 실행 중이면 이번 회차는 건너뜀
+- 작업별 지표: 실행 횟수, 실패 횟수, 최근/평균/최대 실행 시간, 지연(lag), 마지막 오류
+- singleton=True 작업은 리더 락을 잡은 프로세스 한 곳에서만 실행
+  (gunicorn 워커가 여럿이어도 한 번만 실행. 파일 락 기본, Redis 락 선택)
+  만료가 있는 락(Redis)은 작업 실행과 관계없이 타이머가 TTL/3마다 갱신
+"""
+
+import abc
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = int(os.environ.get("JOB_SCHEDULER_WORKERS", "4"))
+DEFAULT_LOCK_PATH = os.environ.get("JOB_SCHEDULER_LOCK_PATH", "data/job_scheduler.lock")
+
+
+# ==================== 리더 락 ====================
+
+class LeaderLock(abc.ABC):
+    """singleton 작업을 실행할 프로세스 하나를 정하는 락"""
+
+    # 만료가 있는 락이면 갱신 주기(초). None이면 잡은 프로세스가 놓을 때까지 유지
+    renew_interval: Optional[float] = None
+
+    @abc.abstractmethod
+    def try_acquire(self) -> bool:
+        """락을 잡거나(이미 잡았으면 갱신) 리더인지 반환"""
+
+    def release(self):
+        pass
+
+    def after_fork(self):
+        """포크된 자식 프로세스에서 부모가 잡은 락 상태를 버림"""
+        pass
+
+
+class LocalLeaderLock(LeaderLock):
+    """단일 프로세스용 (항상 리더)"""
+
+    def try_acquire(self) -> bool:
+        return True
+
+
+class FileLeaderLock(LeaderLock):
+    """같은 호스트의 프로세스끼리 파일 락으로 리더 선출 (프로세스가 죽으면 OS가 해제)"""
+
+    def __init__(self, path: str = DEFAULT_LOCK_PATH):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._file is not None:
+                return True
+            parent = os.path.dirname(self.path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            handle = open(self.path, "a+")
+            try:
+                try:
+                    import fcntl
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except ImportError:  # Windows
+                    import msvcrt
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            except OSError:
+                handle.close()
+                return False
+            handle.seek(0)
+            handle.truncate()
+            handle.write(str(os.getpid()))
+            handle.flush()
+            self._file = handle
+            logger.info(f"작업 스케줄러 리더 획득 (pid {os.getpid()})")
+            return True
+
+    def release(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()  # 닫으면 락도 해제
+                self._file = None
+
+    def after_fork(self):
+        # 자식이 물려받은 핸들을 닫아도 부모의 락은 유지되고, 남겨 두면 부모가 놓아도 락이 풀리지 않음
+        self._lock = threading.Lock()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class RedisLeaderLock(LeaderLock):
+    """여러 호스트용 Redis 락 (TTL 안에 갱신하지 못하면 다른 프로세스가 리더가 됨)"""
+
+    # 자기 토큰일 때만 만료 연장/삭제
+    _RENEW = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('pexpire', KEYS[1], ARGV[2]) end return 0"
+    _RELEASE = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+
+    def __init__(self, client, key: str = "job_scheduler:leader", ttl: float = 30.0):
+        self.client = client
+        self.key = key
+        self.ttl_ms = int(ttl * 1000)
+        self.renew_interval = ttl / 3
+        self.token = f"{os.getpid()}:{uuid.uuid4().hex}"
+
+    def try_acquire(self) -> bool:
+        try:
+            if self.client.set(self.key, self.token, nx=True, px=self.ttl_ms):
+                return True
+            return bool(self.client.eval(self._RENEW, 1, self.key, self.token, self.ttl_ms))
+        except Exception as e:
+            logger.warning(f"리더 락 확인 실패: {e}")
+            return False
+
+    def release(self):
+        try:
+            self.client.eval(self._RELEASE, 1, self.key, self.token)
+        except Exception as e:
+            logger.warning(f"리더 락 해제 실패: {e}")
+
+    def after_fork(self):
+        self.token = f"{os.getpid()}:{uuid.uuid4().hex}"
+
+
+def create_leader_lock(backend: Optional[str] = None) -> LeaderLock:
+    """
+    JOB_SCHEDULER_LOCK 환경 변수(file/redis/local)에 따라 리더 락 생성
+    redis 연결에 실패하면 파일 락으로 대체한다.
+    """
+    backend = backend or os.environ.get("JOB_SCHEDULER_LOCK", "file")
+    if backend == "redis":
+        redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+        try:
+            import redis
+            client = redis.from_url(redis_url)
+            client.ping()
+            return RedisLeaderLock(client)
+        except Exception as e:
+            logger.warning(f"Redis 리더 락 사용 불가, 파일 락 사용: {e}")
+    if backend == "local":
+        return LocalLeaderLock()
+    return FileLeaderLock()
+
+
+# ==================== 작업 ====================
+
+@dataclass
+class JobStats:
+    """작업별 실행 지표"""
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0
+    last_run_at: Optional[float] = None
+    last_duration: float = 0.0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "last_run_at": datetime.fromtimestamp(self.last_run_at).isoformat() if self.last_run_at else None,
+            "last_duration": round(self.last_duration, 4),
+            "avg_duration": round(self.total_duration / self.runs, 4) if self.runs else 0.0,
+            "max_duration": round(self.max_duration, 4),
+            "last_lag": round(self.last_lag, 4),
+            "max_lag": round(self.max_lag, 4),
+            "last_error": self.last_error,
+        }
+
+
+@dataclass
+class Job:
+    """
+    등록된 주기 작업 (interval 초마다 또는 매일 daily_at 'HH:MM')
+    daily_at 작업에 weekday(0=월요일)나 monthday(1~31)를 주면 해당 요일/날짜에만 실행
+    """
+    name: str
+    func: Callable[[], Any]
+    interval: Optional[float] = None
+    daily_at: Optional[str] = None
+    weekday: Optional[int] = None
+    monthday: Optional[int] = None
+    singleton: bool = False
+    app_context: bool = False
+    stats: JobStats = field(default_factory=JobStats)
+    next_run: float = 0.0
+    running: bool = False
+    generation: int = 0
+
+    def next_after(self, now: float) -> float:
+        if self.interval is not None:
+            return now + self.interval
+        hour, minute = (int(part) for part in self.daily_at.split(":"))
+        current = datetime.fromtimestamp(now)
+        target = current.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if target <= current:
+            target += timedelta(days=1)
+        while ((self.weekday is not None and target.weekday() != self.weekday)
+               or (self.monthday is not None and target.day != self.monthday)):
+            target += timedelta(days=1)
+        return target.timestamp()
+
+
+class JobScheduler:
+    """힙 타이머 + 작업 풀 기반 주기 작업 스케줄러"""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, leader_lock: Optional[LeaderLock] = None,
+                 clock: Callable[[], float] = time.time):
+        self.max_workers = max_workers
+        self.leader_lock = leader_lock
+        self.clock = clock
+        self.app = None
+        self._jobs: Dict[str, Job] = {}
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._is_leader = False
+        self._next_renew = 0.0
+
+    def init_app(self, app):
+        """app_context=True 작업을 실행할 Flask 앱 등록"""
+        self.app = app
+
+    # ==================== 등록 ====================
+
+    def add_job(self, name: str, func: Callable[[], Any], interval: Optional[float] = None,
+                daily_at: Optional[str] = None, weekday: Optional[int] = None, monthday: Optional[int] = None,
+                singleton: bool = False, app_context: bool = False,
+                initial_delay: Optional[float] = None, start: bool = True) -> Job:
+        """
+        작업 등록 (같은 이름이면 교체). interval 또는 daily_at 중 하나 필요
+        weekday/monthday는 daily_at과 함께만 쓸 수 있음 (예: 매주 월요일 08:00, 매월 1일 09:00)
+        initial_delay가 없으면 interval 작업은 한 주기 뒤, daily_at 작업은 다음 해당 시각에 처음 실행
+        start=True면 스케줄러가 아직 시작 전일 때 자동으로 시작
+        """
+        if (interval is None) == (daily_at is None):
+            raise ValueError("interval 또는 daily_at 중 하나만 지정해야 합니다.")
+        if interval is not None and interval <= 0:
+            raise ValueError("interval은 0보다 커야 합니다.")
+        if daily_at is None and (weekday is not None or monthday is not None):
+            raise ValueError("weekday/monthday는 daily_at과 함께 지정해야 합니다.")
+        if weekday is not None and not 0 <= weekday <= 6:
+            raise ValueError("weekday는 0(월)~6(일)이어야 합니다.")
+        if monthday is not None and not 1 <= monthday <= 31:
+            raise ValueError("monthday는 1~31이어야 합니다.")
+        job = Job(name, func, interval=interval, daily_at=daily_at, weekday=weekday, monthday=monthday,
+                  singleton=singleton, app_context=app_context)
+        now = self.clock()
+        job.next_run = now + initial_delay if initial_delay is not None else job.next_after(now)
+        if singleton and self.leader_lock is None:
+            self.leader_lock = create_leader_lock()
+        with self._cond:
+            previous = self._jobs.get(name)
+            if previous is not None:
+                job.stats = previous.stats
+                job.generation = previous.generation + 1
+            self._jobs[name] = job
+            self._push(job)
+            self._cond.notify()
+        if start:
+            self.start()
+        return job
+
+    def remove_job(self, name: str) -> bool:
+        """작업 제거 (실행 중인 회차는 끝까지 실행)"""
+        with self._cond:
+            return self._jobs.pop(name, None) is not None
+
+    def has_job(self, name: str) -> bool:
+        return name in self._jobs
+
+    def _push(self, job: Job):
+        heapq.heappush(self._heap, (job.next_run, next(self._seq), job.name, job.generation))
+
+    # ==================== 실행 ====================
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+            self._thread = threading.Thread(target=self._timer_loop, daemon=True, name="job-scheduler")
+            self._thread.start()
+        logger.info(f"작업 스케줄러 시작 (작업 풀 {self.max_workers})")
+
+    def stop(self, wait: bool = True):
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify_all()
+            thread, executor = self._thread, self._executor
+            self._thread = self._executor = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        if executor is not None:
+            executor.shutdown(wait=wait)
+        if self.leader_lock is not None and self._is_leader:
+            self.leader_lock.release()
+            self._is_leader = False
+
+    def after_fork(self):
+        """
+        포크된 워커(gunicorn --preload)에서 호출. 스레드는 포크 후 자식에 남지 않으므로
+        부모의 타이머/작업 풀/리더 상태를 버리고, 등록된 작업이 있으면 이 프로세스에서 다시 시작
+        """
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = self._executor = None
+        self._is_leader = False
+        self._next_renew = 0.0
+        if self.leader_lock is not None:
+            self.leader_lock.after_fork()
+        for job in self._jobs.values():
+            job.running = False
+        if self._jobs:
+            self.start()
+
+    def _timer_loop(self):
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                due = self._pop_due()
+                renew_in = self._renew_in()
+                if not due and renew_in > 0:
+                    timeout = self._heap[0][0] - self.clock() if self._heap else None
+                    if renew_in != float("inf"):
+                        timeout = renew_in if timeout is None else min(timeout, renew_in)
+                    self._cond.wait(timeout=None if timeout is None else max(0.0, min(timeout, 60.0)))
+                    continue
+            if renew_in <= 0:
+                self._renew_leadership()
+            for job, scheduled in due:
+                self._dispatch(job, scheduled)
+
+    def _renew_in(self) -> float:
+        """
+        다음 리더 락 갱신까지 남은 시간 (self._cond 보유 상태, 갱신할 필요가 없으면 inf)
+        작업 주기가 락 TTL보다 길어도 락이 만료되지 않도록, singleton 작업이 있으면 작업 실행과 따로 갱신
+        """
+        interval = getattr(self.leader_lock, "renew_interval", None)
+        if interval is None or not any(job.singleton for job in self._jobs.values()):
+            return float("inf")
+        return self._next_renew - self.clock()
+
+    def _renew_leadership(self):
+        self._leader()
+        with self._cond:
+            self._next_renew = self.clock() + self.leader_lock.renew_interval
+
+    def _pop_due(self) -> List[Tuple[Job, float]]:
+        """실행 시각이 된 작업을 꺼내고 다음 회차를 다시 넣음 (self._cond 보유 상태)"""
+        now = self.clock()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            scheduled, _, name, generation = heapq.heappop(self._heap)
+            job = self._jobs.get(name)
+            if job is None or job.generation != generation:
+                continue  # 제거되었거나 교체된 작업
+            job.next_run = job.next_after(max(now, scheduled))
+            self._push(job)
+            due.append((job, scheduled))
+        return due
+
+    def _dispatch(self, job: Job, scheduled: float):
+        if job.singleton and not self._leader():
+            return
+        with self._cond:
+            if job.running:
+                job.stats.skipped += 1
+                return
+            job.running = True
+            executor = self._executor
+        if executor is None:
+            job.running = False
+            return
+        try:
+            executor.submit(self._run, job, scheduled)
+        except RuntimeError:  # 종료 중
+            job.running = False
+
+    def _leader(self) -> bool:
+        if self.leader_lock is None:
+            self.leader_lock = create_leader_lock()
+        self._is_leader = self.leader_lock.try_acquire()
+        return self._is_leader
+
+    def _run(self, job: Job, scheduled: float):
+        started = self.clock()
+        stats = job.stats
+        stats.last_lag = max(0.0, started - scheduled)
+        stats.max_lag = max(stats.max_lag, stats.last_lag)
+        try:
+            if job.app_context and self.app is not None:
+                with self.app.app_context():
+                    job.func()
+            else:
+                job.func()
+            stats.last_error = None
+        except Exception as e:
+            stats.failures += 1
+            stats.last_error = str(e)
+            logger.error(f"작업 실패 {job.name}: {e}")
+        finally:
+            duration = self.clock() - started
+            stats.runs += 1
+            stats.last_run_at = started
+            stats.last_duration = duration
+            stats.total_duration += duration
+            stats.max_duration = max(stats.max_duration, duration)
+            job.running = False
+
+    def run_now(self, name: str) -> bool:
+        """작업 한 회차를 호출한 스레드에서 바로 실행 (지표에 포함)"""
+        job = self._jobs.get(name)
+        if job is None:
+            return False
+        with self._cond:
+            if job.running:
+                return False
+            job.running = True
+        self._run(job, self.clock())
+        return True
+
+    def submit(self, name: str, func: Callable[[], Any], app_context: bool = False) -> Optional[Future]:
+        """
+        한 번만 실행할 작업을 공용 작업 풀에 넣음 (예: 큰 내보내기 파일 생성)
+        주기 작업 지표에는 포함하지 않음. 스케줄러가 시작 전이면 시작
+        """
+        self.start()
+        with self._cond:
+            executor = self._executor
+        if executor is None:
+            return None
+
+        def run():
+            try:
+                if app_context and self.app is not None:
+                    with self.app.app_context():
+                        return func()
+                return func()
+            except Exception as e:
+                logger.error(f"작업 실패 {name}: {e}")
+                raise
+
+        try:
+            return executor.submit(run)
+        except RuntimeError:  # 종료 중
+            return None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "running": self._running,
+            "leader": self._is_leader,
+            "max_workers": self.max_workers,
+            "jobs": {
+                name: {
+                    "interval": job.interval,
+                    "daily_at": job.daily_at,
+                    "weekday": job.weekday,
+                    "monthday": job.monthday,
+                    "singleton": job.singleton,
+                    "next_run": datetime.fromtimestamp(job.next_run).isoformat(),
+                    "running": job.running,
+                    **job.stats.to_dict(),
+                }
+                for name, job in list(self._jobs.items())
+            },
+        }
+
+
+# 전역 작업 스케줄러 (각 모듈이 주기 작업을 여기에 등록)
+job_scheduler = JobScheduler()
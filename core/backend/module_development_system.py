@@ -6,12 +6,12 @@ from datetime import datetime
 import uuid
 import zipfile
 import shutil
-import sqlite3
 import json
 import os
 from typing import Optional
 from flask import jsonify
 from flask import request
+from core.backend.sidecar_db import get_sidecar_db
 query = None  # pyright: ignore
 form = None  # pyright: ignore
 environ = None  # pyright: ignore
@@ -29,6 +29,7 @@ class ModuleDevelopmentSystem:
         self.production_path = Path(production_path)
         self.sandbox_path.mkdir(exist_ok=True)
         self.production_path.mkdir(exist_ok=True)
+        self.db = get_sidecar_db(self.sandbox_path / "sandbox.db")
 
         self.init_sandbox_database()
         self.init_component_library()
@@ -36,111 +37,107 @@ class ModuleDevelopmentSystem:
 
     def init_sandbox_database(self):
         """샌드박스 데이터베이스 초기화"""
-        db_path = self.sandbox_path / "sandbox.db"
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # 개발 프로젝트 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS development_projects (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id TEXT UNIQUE NOT NULL,
-                name TEXT NOT NULL,
-                description TEXT,
-                module_type TEXT NOT NULL,
-                status TEXT DEFAULT 'development',
-                version TEXT DEFAULT '1.0.0',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                created_by TEXT NOT NULL,
-                settings TEXT,
-                preview_data TEXT
-            )
-        ''')
-
-        # 컴포넌트 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS components (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id TEXT NOT NULL,
-                component_id TEXT NOT NULL,
-                type TEXT NOT NULL,
-                name TEXT NOT NULL,
-                position_x INTEGER DEFAULT 0,
-                position_y INTEGER DEFAULT 0,
-                width INTEGER DEFAULT 200,
-                height INTEGER DEFAULT 100,
-                properties TEXT,
-                styles TEXT,
-                parent_id TEXT,
-                order_index INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES development_projects (project_id)
-            )
-        ''')
-
-        # 페이지 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS pages (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id TEXT NOT NULL,
-                page_id TEXT NOT NULL,
-                name TEXT NOT NULL,
-                route TEXT NOT NULL,
-                layout TEXT DEFAULT 'default',
-                components TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES development_projects (project_id)
-            )
-        ''')
-
-        # 버전 관리 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS versions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id TEXT NOT NULL,
-                version_id TEXT NOT NULL,
-                version_name TEXT NOT NULL,
-                description TEXT,
-                snapshot_data TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                created_by TEXT NOT NULL,
-                FOREIGN KEY (project_id) REFERENCES development_projects (project_id)
-            )
-        ''')
-
-        # 배포 기록 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS deployments (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id TEXT NOT NULL,
-                deployment_id TEXT NOT NULL,
-                version_id TEXT NOT NULL,
-                environment TEXT NOT NULL,
-                status TEXT DEFAULT 'pending',
-                deployed_at TIMESTAMP,
-                deployed_by TEXT NOT NULL,
-                rollback_available BOOLEAN DEFAULT 1,
-                FOREIGN KEY (project_id) REFERENCES development_projects (project_id)
-            )
-        ''')
-
-        # 테스트 데이터 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS test_data (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id TEXT NOT NULL,
-                data_type TEXT NOT NULL,
-                data_name TEXT NOT NULL,
-                data_content TEXT,
-                is_active BOOLEAN DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES development_projects (project_id)
-            )
-        ''')
-
-        conn.commit()
-        conn.close()
+        with self.db.write() as conn:
+            cursor = conn.cursor()
+
+            # 개발 프로젝트 테이블
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS development_projects (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_id TEXT UNIQUE NOT NULL,
+                    name TEXT NOT NULL,
+                    description TEXT,
+                    module_type TEXT NOT NULL,
+                    status TEXT DEFAULT 'development',
+                    version TEXT DEFAULT '1.0.0',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    created_by TEXT NOT NULL,
+                    settings TEXT,
+                    preview_data TEXT
+                )
+            ''')
+
+            # 컴포넌트 테이블
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS components (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_id TEXT NOT NULL,
+                    component_id TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    position_x INTEGER DEFAULT 0,
+                    position_y INTEGER DEFAULT 0,
+                    width INTEGER DEFAULT 200,
+                    height INTEGER DEFAULT 100,
+                    properties TEXT,
+                    styles TEXT,
+                    parent_id TEXT,
+                    order_index INTEGER DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (project_id) REFERENCES development_projects (project_id)
+                )
+            ''')
+
+            # 페이지 테이블
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS pages (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_id TEXT NOT NULL,
+                    page_id TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    route TEXT NOT NULL,
+                    layout TEXT DEFAULT 'default',
+                    components TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (project_id) REFERENCES development_projects (project_id)
+                )
+            ''')
+
+            # 버전 관리 테이블
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS versions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_id TEXT NOT NULL,
+                    version_id TEXT NOT NULL,
+                    version_name TEXT NOT NULL,
+                    description TEXT,
+                    snapshot_data TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    created_by TEXT NOT NULL,
+                    FOREIGN KEY (project_id) REFERENCES development_projects (project_id)
+                )
+            ''')
+
+            # 배포 기록 테이블
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS deployments (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_id TEXT NOT NULL,
+                    deployment_id TEXT NOT NULL,
+                    version_id TEXT NOT NULL,
+                    environment TEXT NOT NULL,
+                    status TEXT DEFAULT 'pending',
+                    deployed_at TIMESTAMP,
+                    deployed_by TEXT NOT NULL,
+                    rollback_available BOOLEAN DEFAULT 1,
+                    FOREIGN KEY (project_id) REFERENCES development_projects (project_id)
+                )
+            ''')
+
+            # 테스트 데이터 테이블
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS test_data (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_id TEXT NOT NULL,
+                    data_type TEXT NOT NULL,
+                    data_name TEXT NOT NULL,
+                    data_content TEXT,
+                    is_active BOOLEAN DEFAULT 1,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (project_id) REFERENCES development_projects (project_id)
+                )
+            ''')
 
     def init_component_library(self):
         """컴포넌트 라이브러리 초기화"""
@@ -280,24 +277,21 @@ class ModuleDevelopmentSystem:
         """새 개발 프로젝트 생성"""
         project_id = str(uuid.uuid4())
 
-        conn = sqlite3.connect(self.sandbox_path / "sandbox.db")
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO development_projects 
-            (project_id, name, description, module_type, created_by)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (project_id, name, description, module_type, created_by))
+        with self.db.write() as conn:
+            cursor = conn.cursor()
 
-        # 프로젝트 디렉토리 생성
-        project_dir = self.sandbox_path / project_id
-        project_dir.mkdir(exist_ok=True)
+            cursor.execute('''
+                INSERT INTO development_projects 
+                (project_id, name, description, module_type, created_by)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (project_id, name, description, module_type, created_by))
 
-        # 기본 파일 생성
-        self.create_project_files(project_dir, name, module_type)
+            # 프로젝트 디렉토리 생성
+            project_dir = self.sandbox_path / project_id
+            project_dir.mkdir(exist_ok=True)
 
-        conn.commit()
-        conn.close()
+            # 기본 파일 생성
+            self.create_project_files(project_dir, name, module_type)
 
         return {
             'project_id': project_id,
@@ -415,122 +409,116 @@ if __name__ == '__main__':
 
     def get_projects(self,  user_id: str) -> List[Dict[str, Any]]:
         """사용자의 프로젝트 목록 조회"""
-        conn = sqlite3.connect(self.sandbox_path / "sandbox.db")
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT project_id, name, description, module_type, status, version, 
-                   created_at, updated_at
-            FROM development_projects 
-            WHERE created_by = ?
-            ORDER BY updated_at DESC
-        ''', (user_id,))
-
-        projects = []
-        for row in cursor.fetchall():
-            projects.append({
-                'project_id': row[0] if row is not None else None,
-                'name': row[1] if row is not None else None,
-                'description': row[2] if row is not None else None,
-                'module_type': row[3] if row is not None else None,
-                'status': row[4] if row is not None else None,
-                'version': row[5] if row is not None else None,
-                'created_at': row[6] if row is not None else None,
-                'updated_at': row[7] if row is not None else None
-            })
-
-        conn.close()
+        with self.db.read() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                SELECT project_id, name, description, module_type, status, version, 
+                       created_at, updated_at
+                FROM development_projects 
+                WHERE created_by = ?
+                ORDER BY updated_at DESC
+            ''', (user_id,))
+
+            projects = []
+            for row in cursor.fetchall():
+                projects.append({
+                    'project_id': row[0] if row is not None else None,
+                    'name': row[1] if row is not None else None,
+                    'description': row[2] if row is not None else None,
+                    'module_type': row[3] if row is not None else None,
+                    'status': row[4] if row is not None else None,
+                    'version': row[5] if row is not None else None,
+                    'created_at': row[6] if row is not None else None,
+                    'updated_at': row[7] if row is not None else None
+                })
+
         return projects
 
     def get_project(self,  project_id: str) -> Optional[Dict[str, Any]]:
         """프로젝트 상세 정보 조회"""
-        conn = sqlite3.connect(self.sandbox_path / "sandbox.db")
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT project_id, name, description, module_type, status, version, 
-                   created_at, updated_at, settings, preview_data
-            FROM development_projects 
-            WHERE project_id = ?
-        ''', (project_id,))
-
-        row = cursor.fetchone()
-        if row:
-            project = {
-                'project_id': row[0] if row is not None else None,
-                'name': row[1] if row is not None else None,
-                'description': row[2] if row is not None else None,
-                'module_type': row[3] if row is not None else None,
-                'status': row[4] if row is not None else None,
-                'version': row[5] if row is not None else None,
-                'created_at': row[6] if row is not None else None,
-                'updated_at': row[7] if row is not None else None,
-                'settings': json.loads(row[8]) if row[8] else {},
-                'preview_data': json.loads(row[9]) if row[9] else {}
-            }
+        with self.db.read() as conn:
+            cursor = conn.cursor()
 
-            # 컴포넌트 목록 조회
             cursor.execute('''
-                SELECT component_id, type, name, position_x, position_y, 
-                       width, height, properties, styles, parent_id, order_index
-                FROM components 
+                SELECT project_id, name, description, module_type, status, version, 
+                       created_at, updated_at, settings, preview_data
+                FROM development_projects 
                 WHERE project_id = ?
-                ORDER BY order_index
             ''', (project_id,))
 
-            components = []
-            for comp_row in cursor.fetchall():
-                components.append({
-                    'component_id': comp_row[0] if comp_row is not None else None,
-                    'type': comp_row[1] if comp_row is not None else None,
-                    'name': comp_row[2] if comp_row is not None else None,
-                    'position_x': comp_row[3] if comp_row is not None else None,
-                    'position_y': comp_row[4] if comp_row is not None else None,
-                    'width': comp_row[5] if comp_row is not None else None,
-                    'height': comp_row[6] if comp_row is not None else None,
-                    'properties': json.loads(comp_row[7]) if comp_row[7] else {},
-                    'styles': json.loads(comp_row[8]) if comp_row[8] else {},
-                    'parent_id': comp_row[9] if comp_row is not None else None,
-                    'order_index': comp_row[10] if comp_row is not None else None
-                })
-
-            project['components'] = components
+            row = cursor.fetchone()
+            if row:
+                project = {
+                    'project_id': row[0] if row is not None else None,
+                    'name': row[1] if row is not None else None,
+                    'description': row[2] if row is not None else None,
+                    'module_type': row[3] if row is not None else None,
+                    'status': row[4] if row is not None else None,
+                    'version': row[5] if row is not None else None,
+                    'created_at': row[6] if row is not None else None,
+                    'updated_at': row[7] if row is not None else None,
+                    'settings': json.loads(row[8]) if row[8] else {},
+                    'preview_data': json.loads(row[9]) if row[9] else {}
+                }
 
-            conn.close()
-            return project
+                # 컴포넌트 목록 조회
+                cursor.execute('''
+                    SELECT component_id, type, name, position_x, position_y, 
+                           width, height, properties, styles, parent_id, order_index
+                    FROM components 
+                    WHERE project_id = ?
+                    ORDER BY order_index
+                ''', (project_id,))
+
+                components = []
+                for comp_row in cursor.fetchall():
+                    components.append({
+                        'component_id': comp_row[0] if comp_row is not None else None,
+                        'type': comp_row[1] if comp_row is not None else None,
+                        'name': comp_row[2] if comp_row is not None else None,
+                        'position_x': comp_row[3] if comp_row is not None else None,
+                        'position_y': comp_row[4] if comp_row is not None else None,
+                        'width': comp_row[5] if comp_row is not None else None,
+                        'height': comp_row[6] if comp_row is not None else None,
+                        'properties': json.loads(comp_row[7]) if comp_row[7] else {},
+                        'styles': json.loads(comp_row[8]) if comp_row[8] else {},
+                        'parent_id': comp_row[9] if comp_row is not None else None,
+                        'order_index': comp_row[10] if comp_row is not None else None
+                    })
+
+                project['components'] = components
+
+                return project
 
-        conn.close()
         return None
 
     def add_component(self,  project_id: str,  component_data: Dict[str, Any]) -> Dict[str, Any]:
         """컴포넌트 추가"""
         component_id = str(uuid.uuid4())
 
-        conn = sqlite3.connect(self.sandbox_path / "sandbox.db")
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO components 
-            (project_id, component_id, type, name, position_x, position_y, 
-             width, height, properties, styles, parent_id, order_index)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            project_id,
-            component_id,
-            component_data['type'] if component_data is not None else None,
-            component_data['name'] if component_data is not None else None,
-            component_data.get('position_x', 0) if component_data else 0,
-            component_data.get('position_y', 0) if component_data else 0,
-            component_data.get('width', 200) if component_data else 200,
-            component_data.get('height', 100) if component_data else 100,
-            json.dumps(component_data.get('properties', {})) if component_data else '{}',
-            json.dumps(component_data.get('styles', {})) if component_data else '{}',
-            component_data.get('parent_id') if component_data else None,
-            component_data.get('order_index', 0) if component_data else 0
-        ))
-
-        conn.commit()
-        conn.close()
+        with self.db.write() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                INSERT INTO components 
+                (project_id, component_id, type, name, position_x, position_y, 
+                 width, height, properties, styles, parent_id, order_index)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                project_id,
+                component_id,
+                component_data['type'] if component_data is not None else None,
+                component_data['name'] if component_data is not None else None,
+                component_data.get('position_x', 0) if component_data else 0,
+                component_data.get('position_y', 0) if component_data else 0,
+                component_data.get('width', 200) if component_data else 200,
+                component_data.get('height', 100) if component_data else 100,
+                json.dumps(component_data.get('properties', {})) if component_data else '{}',
+                json.dumps(component_data.get('styles', {})) if component_data else '{}',
+                component_data.get('parent_id') if component_data else None,
+                component_data.get('order_index', 0) if component_data else 0
+            ))
 
         return {
             'component_id': component_id,
@@ -539,53 +527,46 @@ if __name__ == '__main__':
 
     def update_component(self, project_id: str, component_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """컴포넌트 업데이트"""
-        conn = sqlite3.connect(self.sandbox_path / "sandbox.db")
-        cursor = conn.cursor()
-
-        # 업데이트할 필드들
-        update_fields = []
-        params = []
-
-        for field, value in updates.items() if updates is not None else []:
-            if field in ['position_x', 'position_y', 'width', 'height', 'order_index']:
-                update_fields.append(f"{field} = ?")
-                params.append(value)
-            elif field in ['properties', 'styles']:
-                update_fields.append(f"{field} = ?")
-                params.append(json.dumps(value))
-            elif field in ['type', 'name', 'parent_id']:
-                update_fields.append(f"{field} = ?")
-                params.append(value)
-
-        if update_fields:
-            params.extend([project_id, component_id])
-            query = f'''
-                UPDATE components 
-                SET {', '.join(update_fields)}
-                WHERE project_id = ? AND component_id = ?
-            '''
-            cursor.execute(query, params)
-
-            conn.commit()
-            conn.close()
+        with self.db.write() as conn:
+            cursor = conn.cursor()
 
-            return {'success': True}
+            # 업데이트할 필드들
+            update_fields = []
+            params = []
+
+            for field, value in updates.items() if updates is not None else []:
+                if field in ['position_x', 'position_y', 'width', 'height', 'order_index']:
+                    update_fields.append(f"{field} = ?")
+                    params.append(value)
+                elif field in ['properties', 'styles']:
+                    update_fields.append(f"{field} = ?")
+                    params.append(json.dumps(value))
+                elif field in ['type', 'name', 'parent_id']:
+                    update_fields.append(f"{field} = ?")
+                    params.append(value)
+
+            if update_fields:
+                params.extend([project_id, component_id])
+                query = f'''
+                    UPDATE components 
+                    SET {', '.join(update_fields)}
+                    WHERE project_id = ? AND component_id = ?
+                '''
+                cursor.execute(query, params)
+
+                return {'success': True}
 
-        conn.close()
         return {'success': False, 'error': '업데이트할 필드가 없습니다.'}
 
     def delete_component(self, project_id: str, component_id: str) -> Dict[str, Any]:
         """컴포넌트 삭제"""
-        conn = sqlite3.connect(self.sandbox_path / "sandbox.db")
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            DELETE FROM components 
-            WHERE project_id = ? AND component_id = ?
-        ''', (project_id, component_id))
+        with self.db.write() as conn:
+            cursor = conn.cursor()
 
-        conn.commit()
-        conn.close()
+            cursor.execute('''
+                DELETE FROM components 
+                WHERE project_id = ? AND component_id = ?
+            ''', (project_id, component_id))
 
         return {'success': True}
 
@@ -598,24 +579,21 @@ if __name__ == '__main__':
         if not project:
             return {'success': False, 'error': '프로젝트를 찾을 수 없습니다.'}
 
-        conn = sqlite3.connect(self.sandbox_path / "sandbox.db")
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO versions 
-            (project_id, version_id, version_name, description, snapshot_data, created_by)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            project_id,
-            version_id,
-            version_name,
-            description,
-            json.dumps(project),
-            created_by
-        ))
-
-        conn.commit()
-        conn.close()
+        with self.db.write() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                INSERT INTO versions 
+                (project_id, version_id, version_name, description, snapshot_data, created_by)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (
+                project_id,
+                version_id,
+                version_name,
+                description,
+                json.dumps(project),
+                created_by
+            ))
 
         return {
             'version_id': version_id,
@@ -624,74 +602,69 @@ if __name__ == '__main__':
 
     def get_versions(self, project_id: str) -> List[Dict[str, Any]]:
         """프로젝트 버전 목록 조회"""
-        conn = sqlite3.connect(self.sandbox_path / "sandbox.db")
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT version_id, version_name, description, created_at, created_by
-            FROM versions 
-            WHERE project_id = ?
-            ORDER BY created_at DESC
-        ''', (project_id,))
-
-        versions = []
-        for row in cursor.fetchall():
-            versions.append({
-                'version_id': row[0] if row is not None else None,
-                'version_name': row[1] if row is not None else None,
-                'description': row[2] if row is not None else None,
-                'created_at': row[3] if row is not None else None,
-                'created_by': row[4] if row is not None else None
-            })
-
-        conn.close()
-        return versions
-
-    def rollback_version(self,  project_id: str,  version_id: str) -> Dict[str, Any]:
-        """버전 롤백"""
-        conn = sqlite3.connect(self.sandbox_path / "sandbox.db")
-        cursor = conn.cursor()
+        with self.db.read() as conn:
+            cursor = conn.cursor()
 
-        # 버전 스냅샷 조회
-        cursor.execute('''
-            SELECT snapshot_data FROM versions 
-            WHERE project_id = ? AND version_id = ?
-        ''', (project_id, version_id))
+            cursor.execute('''
+                SELECT version_id, version_name, description, created_at, created_by
+                FROM versions 
+                WHERE project_id = ?
+                ORDER BY created_at DESC
+            ''', (project_id,))
 
-        row = cursor.fetchone()
-        if not row:
-            conn.close()
-            return {'success': False, 'error': '버전을 찾을 수 없습니다.'}
+            versions = []
+            for row in cursor.fetchall():
+                versions.append({
+                    'version_id': row[0] if row is not None else None,
+                    'version_name': row[1] if row is not None else None,
+                    'description': row[2] if row is not None else None,
+                    'created_at': row[3] if row is not None else None,
+                    'created_by': row[4] if row is not None else None
+                })
 
-        snapshot = json.loads(row[0] if row is not None and row[0] is not None else '{}')
+        return versions
 
-        # 현재 컴포넌트 삭제
-        cursor.execute('DELETE FROM components WHERE project_id = ?', (project_id,))
+    def rollback_version(self,  project_id: str,  version_id: str) -> Dict[str, Any]:
+        """버전 롤백"""
+        with self.db.write() as conn:
+            cursor = conn.cursor()
 
-        # 스냅샷에서 컴포넌트 복원
-        for component in snapshot.get('components', []) if snapshot else []:
+            # 버전 스냅샷 조회
             cursor.execute('''
-                INSERT INTO components 
-                (project_id, component_id, type, name, position_x, position_y, 
-                 width, height, properties, styles, parent_id, order_index)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                project_id,
-                component['component_id'] if component is not None else None,
-                component['type'] if component is not None else None,
-                component['name'] if component is not None else None,
-                component['position_x'] if component is not None else None,
-                component['position_y'] if component is not None else None,
-                component['width'] if component is not None else None,
-                component['height'] if component is not None else None,
-                json.dumps(component['properties'] if component is not None else {}),
-                json.dumps(component['styles'] if component is not None else {}),
-                component['parent_id'] if component is not None else None,
-                component['order_index'] if component is not None else None
-            ))
-
-        conn.commit()
-        conn.close()
+                SELECT snapshot_data FROM versions 
+                WHERE project_id = ? AND version_id = ?
+            ''', (project_id, version_id))
+
+            row = cursor.fetchone()
+            if not row:
+                return {'success': False, 'error': '버전을 찾을 수 없습니다.'}
+
+            snapshot = json.loads(row[0] if row is not None and row[0] is not None else '{}')
+
+            # 현재 컴포넌트 삭제
+            cursor.execute('DELETE FROM components WHERE project_id = ?', (project_id,))
+
+            # 스냅샷에서 컴포넌트 복원
+            for component in snapshot.get('components', []) if snapshot else []:
+                cursor.execute('''
+                    INSERT INTO components 
+                    (project_id, component_id, type, name, position_x, position_y, 
+                     width, height, properties, styles, parent_id, order_index)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    project_id,
+                    component['component_id'] if component is not None else None,
+                    component['type'] if component is not None else None,
+                    component['name'] if component is not None else None,
+                    component['position_x'] if component is not None else None,
+                    component['position_y'] if component is not None else None,
+                    component['width'] if component is not None else None,
+                    component['height'] if component is not None else None,
+                    json.dumps(component['properties'] if component is not None else {}),
+                    json.dumps(component['styles'] if component is not None else {}),
+                    component['parent_id'] if component is not None else None,
+                    component['order_index'] if component is not None else None
+                ))
 
         return {'success': True}
 
@@ -707,25 +680,22 @@ if __name__ == '__main__':
         # 배포 패키지 생성
         package_path = self.create_deployment_package(project_id, project)
 
-        conn = sqlite3.connect(self.sandbox_path / "sandbox.db")
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO deployments 
-            (project_id, deployment_id, version_id, environment, status, deployed_at, deployed_by)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            project_id,
-            deployment_id,
-            version_id,
-            environment,
-            'deployed',
-            datetime.now().isoformat(),
-            deployed_by
-        ))
-
-        conn.commit()
-        conn.close()
+        with self.db.write() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                INSERT INTO deployments 
+                (project_id, deployment_id, version_id, environment, status, deployed_at, deployed_by)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                project_id,
+                deployment_id,
+                version_id,
+                environment,
+                'deployed',
+                datetime.now().isoformat(),
+                deployed_by
+            ))
 
         return {
             'deployment_id': deployment_id,
@@ -767,21 +737,18 @@ if __name__ == '__main__':
         }
 
         if data_type in test_data:
-            conn = sqlite3.connect(self.sandbox_path / "sandbox.db")
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                INSERT INTO test_data (project_id, data_type, data_name, data_content)
-                VALUES (?, ?, ?, ?)
-            ''', (
-                project_id,
-                data_type,
-                f'{data_type}_sample',
-                json.dumps(test_data[data_type] if test_data is not None else None)
-            ))
-
-            conn.commit()
-            conn.close()
+            with self.db.write() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('''
+                    INSERT INTO test_data (project_id, data_type, data_name, data_content)
+                    VALUES (?, ?, ?, ?)
+                ''', (
+                    project_id,
+                    data_type,
+                    f'{data_type}_sample',
+                    json.dumps(test_data[data_type] if test_data is not None else None)
+                ))
 
             return {'success': True, 'data': test_data[data_type] if test_data is not None else None}
 
@@ -793,42 +760,40 @@ if __name__ == '__main__':
 
     def get_deployment_statistics(self, user_id: str) -> Dict[str, Any]:
         """배포 통계 조회"""
-        conn = sqlite3.connect(self.sandbox_path / "sandbox.db")
-        cursor = conn.cursor()
-
-        # 전체 프로젝트 수
-        cursor.execute('''
-            SELECT COUNT(*) FROM development_projects WHERE created_by = ?
-        ''', (user_id,))
-        total_projects = cursor.fetchone()[0]
-
-        # 상태별 프로젝트 수
-        cursor.execute('''
-            SELECT status, COUNT(*) FROM development_projects 
-            WHERE created_by = ? GROUP BY status
-        ''', (user_id,))
-        status_counts = dict(cursor.fetchall())
-
-        # 최근 배포
-        cursor.execute('''
-            SELECT d.deployment_id, p.name, d.environment, d.deployed_at
-            FROM deployments d
-            JOIN development_projects p ON d.project_id = p.project_id
-            WHERE p.created_by = ?
-            ORDER BY d.deployed_at DESC
-            LIMIT 5
-        ''', (user_id,))
-
-        recent_deployments = []
-        for row in cursor.fetchall():
-            recent_deployments.append({
-                'deployment_id': row[0] if row is not None else None,
-                'project_name': row[1] if row is not None else None,
-                'environment': row[2] if row is not None else None,
-                'deployed_at': row[3] if row is not None else None
-            })
-
-        conn.close()
+        with self.db.read() as conn:
+            cursor = conn.cursor()
+
+            # 전체 프로젝트 수
+            cursor.execute('''
+                SELECT COUNT(*) FROM development_projects WHERE created_by = ?
+            ''', (user_id,))
+            total_projects = cursor.fetchone()[0]
+
+            # 상태별 프로젝트 수
+            cursor.execute('''
+                SELECT status, COUNT(*) FROM development_projects 
+                WHERE created_by = ? GROUP BY status
+            ''', (user_id,))
+            status_counts = dict(cursor.fetchall())
+
+            # 최근 배포
+            cursor.execute('''
+                SELECT d.deployment_id, p.name, d.environment, d.deployed_at
+                FROM deployments d
+                JOIN development_projects p ON d.project_id = p.project_id
+                WHERE p.created_by = ?
+                ORDER BY d.deployed_at DESC
+                LIMIT 5
+            ''', (user_id,))
+
+            recent_deployments = []
+            for row in cursor.fetchall():
+                recent_deployments.append({
+                    'deployment_id': row[0] if row is not None else None,
+                    'project_name': row[1] if row is not None else None,
+                    'environment': row[2] if row is not None else None,
+                    'deployed_at': row[3] if row is not None else None
+                })
 
         return {
             'total_projects': total_projects,
@@ -1,7 +1,7 @@
 from core.backend.integrated_module_system import integrated_system, IntegrationEvent, IntegrationEventData  # pyright: ignore
 from core.backend.central_data_layer import central_data  # pyright: ignore
+from core.backend.sidecar_db import get_sidecar_db
 import threading
-import sqlite3
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
@@ -9,7 +9,6 @@ import shutil
 import os
 import logging
 import json
-from typing import Optional
 query = None  # pyright: ignore
 config = None  # pyright: ignore
 """
@@ -29,13 +28,14 @@ class ModuleInstallationSystem:
     def __init__(self):
         self.installations_db_path = Path("data/module_installations.db")
         self.installations_db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = get_sidecar_db(self.installations_db_path)
         self.lock = threading.RLock()
         self._init_installations_database()
 
     def _init_installations_database(self):
         """설치 데이터베이스 초기화"""
         try:
-            with sqlite3.connect(self.installations_db_path) as conn:
+            with self.db.write() as conn:
                 cursor = conn.cursor()
 
                 # 모듈 설치 테이블
@@ -99,7 +99,6 @@ class ModuleInstallationSystem:
                     )
                 ''')
 
-                conn.commit()
                 logger.info("모듈 설치 데이터베이스 초기화 완료")
 
         except Exception as e:
@@ -132,7 +131,7 @@ class ModuleInstallationSystem:
                         raise ValueError(f"의존 모듈 {dep}가 설치되지 않았거나 활성화되지 않았습니다.")
 
                 # 설치 정보 저장
-                with sqlite3.connect(self.installations_db_path) as conn:
+                with self.db.write() as conn:
                     cursor = conn.cursor()
 
                     cursor.execute("""
@@ -163,8 +162,6 @@ class ModuleInstallationSystem:
                             VALUES (?, ?, ?)
                         """, (installation_id, role, json.dumps(permissions)))
 
-                    conn.commit()
-
                 # 설치 완료 이벤트 발생
                 self._emit_installation_event(module_id,  'installed',  installed_by,  installed_for_type,  installed_for_id)
 
@@ -197,14 +194,13 @@ class ModuleInstallationSystem:
                     raise ValueError(f"모듈 {module_id}가 이미 활성화되어 있습니다.")
 
                 # 활성화 처리
-                with sqlite3.connect(self.installations_db_path) as conn:
+                with self.db.write() as conn:
                     cursor = conn.cursor()
                     cursor.execute("""
                         UPDATE module_installations 
                         SET status = 'activated', activated_at = CURRENT_TIMESTAMP
                         WHERE module_id = ? AND installed_for_type = ? AND installed_for_id = ?
                     """, (module_id, installed_for_type, installed_for_id))
-                    conn.commit()
 
                 # 중앙 데이터 레이어에 모듈 등록
                 self._register_module_to_central_data(module_id,  installed_for_type,  installed_for_id)
@@ -245,14 +241,13 @@ class ModuleInstallationSystem:
                     raise ValueError(f"모듈 {module_id}가 활성화되지 않았습니다.")
 
                 # 비활성화 처리
-                with sqlite3.connect(self.installations_db_path) as conn:
+                with self.db.write() as conn:
                     cursor = conn.cursor()
                     cursor.execute("""
                         UPDATE module_installations 
                         SET status = 'deactivated'
                         WHERE module_id = ? AND installed_for_type = ? AND installed_for_id = ?
                     """, (module_id, installed_for_type, installed_for_id))
-                    conn.commit()
 
                 # 비활성화 완료 이벤트 발생
                 self._emit_installation_event(module_id,  'deactivated',  deactivated_by,  installed_for_type,  installed_for_id)
@@ -289,7 +284,7 @@ class ModuleInstallationSystem:
                 self._remove_module_menus(module_id,  installed_for_type,  installed_for_id)
 
                 # 제거 처리
-                with sqlite3.connect(self.installations_db_path) as conn:
+                with self.db.write() as conn:
                     cursor = conn.cursor()
 
                     # 관련 데이터 삭제
@@ -298,8 +293,6 @@ class ModuleInstallationSystem:
                     cursor.execute("DELETE FROM module_permissions WHERE installation_id = ?", (installation['id'] if installation is not None else None,))
                     cursor.execute("DELETE FROM module_installations WHERE id = ?", (installation['id'] if installation is not None else None,))
 
-                    conn.commit()
-
                 # 제거 완료 이벤트 발생
                 self._emit_installation_event(module_id,  'uninstalled',  uninstalled_by,  installed_for_type,  installed_for_id)
 
@@ -321,8 +314,7 @@ class ModuleInstallationSystem:
                          installed_for_id: int) -> Optional[Dict[str, Any] if Optional is not None else None]:
         """설치 정보 조회"""
         try:
-            with sqlite3.connect(self.installations_db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.db.read() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -343,8 +335,7 @@ class ModuleInstallationSystem:
                           installed_for_id: int = None) -> List[Dict[str, Any] if List is not None else None]:
         """설치 목록 조회"""
         try:
-            with sqlite3.connect(self.installations_db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.db.read() as conn:
                 cursor = conn.cursor()
 
                 query = "SELECT * FROM module_installations WHERE 1=1"
@@ -370,8 +361,7 @@ class ModuleInstallationSystem:
     def get_activated_modules(self, installed_for_type: str, installed_for_id: int) -> List[Dict[str, Any] if List is not None else None]:
         """활성화된 모듈 목록 조회"""
         try:
-            with sqlite3.connect(self.installations_db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.db.read() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -395,7 +385,7 @@ class ModuleInstallationSystem:
                 if not installation:
                     raise ValueError(f"모듈 {module_id}가 설치되지 않았습니다.")
 
-                with sqlite3.connect(self.installations_db_path) as conn:
+                with self.db.write() as conn:
                     cursor = conn.cursor()
 
                     # 기존 설정 삭제
@@ -415,8 +405,6 @@ class ModuleInstallationSystem:
                         WHERE id = ?
                     """, (json.dumps(settings), installation['id'] if installation is not None else None))
 
-                    conn.commit()
-
                 logger.info(f"모듈 {module_id} 설정 업데이트 완료")
 
                 return {
@@ -439,7 +427,7 @@ class ModuleInstallationSystem:
             if not installation:
                 return {}
 
-            with sqlite3.connect(self.installations_db_path) as conn:
+            with self.db.read() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -502,7 +490,7 @@ class ModuleInstallationSystem:
                                     installed_for_id: Optional[int] = None) -> Dict[str, Any] if Dict is not None else None:
         """설치 통계 조회"""
         try:
-            with sqlite3.connect(self.installations_db_path) as conn:
+            with self.db.read() as conn:
                 cursor = conn.cursor()
 
                 query = "SELECT status, COUNT(*) as count FROM module_installations WHERE 1=1"
@@ -9,6 +9,9 @@ import shutil
 import json
 import os
 from typing import Optional
+
+from core.backend.catalog_index import get_catalog_index
+from core.backend.document_store import get_document_store
 config = None  # pyright: ignore
 form = None  # pyright: ignore
 """
@@ -57,6 +60,22 @@ class ModuleMarketplaceSystem:
         self.configs_file = os.path.join(marketplace_dir, "configs.json")
         self.reviews_file = os.path.join(marketplace_dir, "reviews.json")
         self.downloads_file = os.path.join(marketplace_dir, "downloads.json")
+
+        # 설치/설정/다운로드 데이터는 DocumentStore 컬렉션 ({키: 문서} 형식 스냅샷 = 기존 JSON 파일)
+        store = get_document_store(marketplace_dir)
+        self.modules = store.collection("modules.json", layout="dict",
+                                        indexes=("status", "category", "scope"))
+        self.installed = store.collection("installed.json", layout="dict", indexes=[
+            ("module_id", lambda modules: list(modules) if isinstance(modules, dict) else None)
+        ])
+        self.configs = store.collection("configs.json", layout="dict")
+        self.downloads = store.collection("downloads.json", layout="dict")
+
+        # 목록 조회용 카탈로그 인덱스 (모듈 컬렉션이 바뀔 때만 다시 구성)
+        self.catalog = get_catalog_index(self.modules, bucket_fields=(
+            "status", "category", "scope",
+            ("hierarchy_level", lambda module: list(module.get("hierarchy_levels") or {})),
+        ))
         
         # 초기화
         self._init_marketplace()
@@ -72,22 +91,14 @@ class ModuleMarketplaceSystem:
             if not os.path.exists(self.modules_file):
                 self._create_sample_modules()
             
-            if not os.path.exists(self.installed_file):
-                with open(self.installed_file, 'w', encoding='utf-8') as f:
-                    json.dump({}, f)
-            
-            if not os.path.exists(self.configs_file):
-                with open(self.configs_file, 'w', encoding='utf-8') as f:
-                    json.dump({}, f)
-            
+            self.installed.seed({})
+            self.configs.seed({})
+            self.downloads.seed({})
+
             if not os.path.exists(self.reviews_file):
                 with open(self.reviews_file, 'w', encoding='utf-8') as f:
                     json.dump({}, f)
-            
-            if not os.path.exists(self.downloads_file):
-                with open(self.downloads_file, 'w', encoding='utf-8') as f:
-                    json.dump({}, f)
-                    
+
         except Exception as e:
             logger.error(f"마켓플레이스 초기화 실패: {e}")
 
@@ -126,65 +137,66 @@ class ModuleMarketplaceSystem:
             }
         }
         
-        with open(self.modules_file, 'w', encoding='utf-8') as f:
-            json.dump(sample_modules, f, ensure_ascii=False, indent=2)
+        self.modules.seed(sample_modules)
 
     def get_available_modules(self, user_id: Optional[int] = None,
                               scope: ModuleScope = None,
                               category: str = None,
                               search: str = None) -> List[Dict[str, Any]]:
         """사용 가능한 모듈 목록 조회"""
+        return self.get_available_modules_page(user_id, scope, category, search)["modules"]
+
+    def get_available_modules_page(self, user_id: Optional[int] = None,
+                                   scope: ModuleScope = None,
+                                   category: str = None,
+                                   search: str = None,
+                                   sort_by: Optional[str] = None,
+                                   sort_order: str = "desc",
+                                   cursor: Optional[str] = None,
+                                   limit: Optional[int] = None,
+                                   scope_id: Optional[int] = None,
+                                   scope_type: ModuleScope = ModuleScope.USER) -> Dict[str, Any]:
+        """
+        사용 가능한 모듈 한 페이지 조회
+        반환: {"modules": [...], "next_cursor": 다음 페이지 커서 또는 None, "total": 전체 일치 수}
+        잘못된 커서는 ValueError
+        """
         try:
-            with open(self.modules_file, 'r', encoding='utf-8') as f:
-                modules = json.load(f)
-
-            # 필터링
-            filtered_modules = []
-            for module_id, module in modules.items():
-                # 상태 필터
-                if module.get('status') != 'active':
-                    continue
-
-                # 범위 필터
-                if scope and module.get('scope') != scope.value:
-                    continue
-
-                # 카테고리 필터
-                if category and module.get('category') != category:
-                    continue
-
-                # 검색 필터
-                if search:
-                    search_lower = search.lower()
-                    if not (search_lower in module.get('name', '').lower() or
-                            search_lower in module.get('description', '').lower() or
-                            any(search_lower in str(tag).lower() for tag in module.get('tags', []))):
-                        continue
-
-                # 사용자별 설치 상태 확인
-                if user_id:
-                    module['is_installed'] = self.is_module_installed(module_id, user_id)
-                    module['is_activated'] = self.is_module_activated(module_id, user_id)
+            # 상태/범위/카테고리 필터와 검색은 카탈로그 인덱스로 처리
+            filters = {'status': 'active', 'scope': scope.value if scope else None, 'category': category}
+            items, next_cursor, total = self.catalog.search(
+                filters, search, sort_by=sort_by, sort_order=sort_order, cursor=cursor, limit=limit
+            )
+
+            # 사용자별 설치 상태는 설치 정보 한 번 조회로 확인
+            installed = {}
+            if user_id:
+                install_key = f"{user_id}_{scope_type.value}_{scope_id}" if scope_id else f"{user_id}_{scope_type.value}"
+                installed = self.installed.get(install_key) or {}
 
-                filtered_modules.append(module)
+            modules = []
+            for module_id, module in items:
+                if user_id:
+                    install_info = installed.get(module_id)
+                    module['is_installed'] = install_info is not None
+                    module['is_activated'] = bool(install_info) and install_info.get('status') == ModuleStatus.ACTIVATED.value
+                modules.append(module)
 
-            return filtered_modules
+            return {"modules": modules, "next_cursor": next_cursor, "total": total}
 
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"사용 가능한 모듈 목록 조회 실패: {e}")
-            return []
+            return {"modules": [], "next_cursor": None, "total": 0}
 
     def get_module_detail(self, module_id: str) -> Optional[Dict[str, Any]]:
         """모듈 상세 정보 조회"""
         try:
-            with open(self.modules_file, 'r', encoding='utf-8') as f:
-                modules = json.load(f)
-
-            if module_id not in modules:
+            module = self.modules.get(module_id)
+            if module is None:
                 return None
 
-            module = modules[module_id]
-
             # 설치된 사용자 수 조회
             installed_users = self.get_installed_users(module_id)
             module['installed_users'] = len(installed_users)
@@ -222,22 +234,16 @@ class ModuleMarketplaceSystem:
                     return False
 
             # 설치 정보 저장
-            installed_data = self._load_installed_data()
-
             install_key = f"{user_id}_{scope_type.value}_{scope_id}" if scope_id else f"{user_id}_{scope_type.value}"
-
-            if install_key not in installed_data:
-                installed_data[install_key] = {}
-
-            installed_data[install_key][module_id] = {
+            install_info = {
                 "installed_at": datetime.now().isoformat(),
                 "status": ModuleStatus.INSTALLED.value,
                 "version": module.get('version', '1.0.0'),
                 "scope_type": scope_type.value,
                 "scope_id": scope_id
             }
-
-            self._save_installed_data(installed_data)
+            self.installed.mutate(install_key, lambda modules: dict(modules, **{module_id: install_info}),
+                                  default={})
 
             # 다운로드 수 증가
             self._increment_downloads(module_id)
@@ -262,15 +268,12 @@ class ModuleMarketplaceSystem:
                 return False
 
             # 활성화 상태 업데이트
-            installed_data = self._load_installed_data()
             install_key = f"{user_id}_{scope_type.value}_{scope_id}" if scope_id else f"{user_id}_{scope_type.value}"
 
-            if install_key in installed_data and module_id in installed_data[install_key]:
-                installed_data[install_key][module_id]["status"] = ModuleStatus.ACTIVATED.value
-                installed_data[install_key][module_id]["activated_at"] = datetime.now().isoformat()
-
-                self._save_installed_data(installed_data)
-
+            if self._update_install(install_key, module_id, {
+                "status": ModuleStatus.ACTIVATED.value,
+                "activated_at": datetime.now().isoformat(),
+            }):
                 # 모듈 초기화 및 연동 설정
                 self._initialize_module_integration(module_id, user_id, scope_id, scope_type)
 
@@ -293,15 +296,12 @@ class ModuleMarketplaceSystem:
                 return False
 
             # 비활성화 상태 업데이트
-            installed_data = self._load_installed_data()
             install_key = f"{user_id}_{scope_type.value}_{scope_id}" if scope_id else f"{user_id}_{scope_type.value}"
 
-            if install_key in installed_data and module_id in installed_data[install_key]:
-                installed_data[install_key][module_id]["status"] = ModuleStatus.DEACTIVATED.value
-                installed_data[install_key][module_id]["deactivated_at"] = datetime.now().isoformat()
-
-                self._save_installed_data(installed_data)
-
+            if self._update_install(install_key, module_id, {
+                "status": ModuleStatus.DEACTIVATED.value,
+                "deactivated_at": datetime.now().isoformat(),
+            }):
                 logger.info(f"모듈 비활성화 완료: {module_id} -> {install_key}")
                 return True
 
@@ -327,14 +327,9 @@ class ModuleMarketplaceSystem:
                 return False
 
             # 제거
-            installed_data = self._load_installed_data()
             install_key = f"{user_id}_{scope_type.value}_{scope_id}" if scope_id else f"{user_id}_{scope_type.value}"
 
-            if install_key in installed_data and module_id in installed_data[install_key]:
-                del installed_data[install_key][module_id]
-
-                self._save_installed_data(installed_data)
-
+            if self._update_install(install_key, module_id, None):
                 # 모듈 파일 정리
                 self._cleanup_module_files(module_id, user_id, scope_id, scope_type)
 
@@ -351,14 +346,10 @@ class ModuleMarketplaceSystem:
                               scope_id: Optional[int] = None, scope_type: ModuleScope = ModuleScope.USER) -> List[Dict[str, Any]]:
         """설치된 모듈 목록 조회"""
         try:
-            installed_data = self._load_installed_data()
             install_key = f"{user_id}_{scope_type.value}_{scope_id}" if scope_id else f"{user_id}_{scope_type.value}"
 
-            if install_key not in installed_data:
-                return []
-
             installed_modules = []
-            for module_id, install_info in installed_data[install_key].items():
+            for module_id, install_info in (self.installed.get(install_key) or {}).items():
                 module_detail = self.get_module_detail(module_id)
                 if module_detail:
                     module_detail.update(install_info)
@@ -380,14 +371,8 @@ class ModuleMarketplaceSystem:
                 return False
 
             # 설정 저장
-            configs_data = self._load_configs_data()
             config_key = f"{user_id}_{scope_type.value}_{scope_id}" if scope_id else f"{user_id}_{scope_type.value}"
-
-            if config_key not in configs_data:
-                configs_data[config_key] = {}
-
-            configs_data[config_key][module_id] = config
-            self._save_configs_data(configs_data)
+            self.configs.mutate(config_key, lambda configs: dict(configs, **{module_id: config}), default={})
 
             logger.info(f"모듈 설정 업데이트 완료: {module_id} -> {config_key}")
             return True
@@ -400,13 +385,8 @@ class ModuleMarketplaceSystem:
                           scope_id: Optional[int] = None, scope_type: ModuleScope = ModuleScope.USER) -> Optional[Dict[str, Any]]:
         """모듈 설정 조회"""
         try:
-            configs_data = self._load_configs_data()
             config_key = f"{user_id}_{scope_type.value}_{scope_id}" if scope_id else f"{user_id}_{scope_type.value}"
-
-            if config_key in configs_data and module_id in configs_data[config_key]:
-                return configs_data[config_key][module_id]
-
-            return None
+            return (self.configs.get(config_key) or {}).get(module_id)
 
         except Exception as e:
             logger.error(f"모듈 설정 조회 실패: {e}")
@@ -424,9 +404,7 @@ class ModuleMarketplaceSystem:
             }
 
             # 전체 모듈 수
-            with open(self.modules_file, 'r', encoding='utf-8') as f:
-                modules = json.load(f)
-                stats["total_modules"] = len(modules)
+            stats["total_modules"] = self.modules.count()
 
             # 사용자별 설치 통계
             if user_id:
@@ -435,10 +413,8 @@ class ModuleMarketplaceSystem:
                 stats["activated_modules"] = len([m for m in installed_modules if m.get('status') == ModuleStatus.ACTIVATED.value])
 
             # 인기 모듈 (다운로드 수 기준)
-            with open(self.downloads_file, 'r', encoding='utf-8') as f:
-                downloads = json.load(f)
-                popular_modules = sorted(downloads.items(), key=lambda x: x[1], reverse=True)[:5]
-                stats["popular_modules"] = [{"module_id": module_id, "downloads": count} for module_id, count in popular_modules]
+            popular_modules = sorted(self.downloads.items(), key=lambda x: x[1], reverse=True)[:5]
+            stats["popular_modules"] = [{"module_id": module_id, "downloads": count} for module_id, count in popular_modules]
 
             return stats
 
@@ -447,58 +423,42 @@ class ModuleMarketplaceSystem:
             return {}
 
     # 내부 헬퍼 메서드들
-    def _load_installed_data(self) -> Dict[str, Any]:
-        """설치 데이터 로드"""
-        try:
-            with open(self.installed_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return {}
-
-    def _save_installed_data(self, data: Dict[str, Any]):
-        """설치 데이터 저장"""
-        with open(self.installed_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-    def _load_configs_data(self) -> Dict[str, Any]:
-        """설정 데이터 로드"""
-        try:
-            with open(self.configs_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return {}
-
-    def _save_configs_data(self, data: Dict[str, Any]):
-        """설정 데이터 저장"""
-        with open(self.configs_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def _update_install(self, install_key: str, module_id: str,
+                        changes: Optional[Dict[str, Any]]) -> bool:
+        """설치 정보 변경 (changes가 None이면 제거). 설치돼 있지 않으면 False"""
+        found = []
+
+        def apply(modules):
+            if module_id in modules:
+                found.append(module_id)
+                if changes is None:
+                    del modules[module_id]
+                else:
+                    modules[module_id].update(changes)
+            return modules
+
+        self.installed.mutate(install_key, apply)
+        return bool(found)
 
     def is_module_installed(self, module_id: str, user_id: int,
                             scope_id: Optional[int] = None, scope_type: ModuleScope = ModuleScope.USER) -> bool:
         """모듈 설치 여부 확인"""
-        installed_data = self._load_installed_data()
         install_key = f"{user_id}_{scope_type.value}_{scope_id}" if scope_id else f"{user_id}_{scope_type.value}"
-        return install_key in installed_data and module_id in installed_data[install_key]
+        return module_id in (self.installed.get(install_key) or {})
 
     def is_module_activated(self, module_id: str, user_id: int,
                             scope_id: Optional[int] = None, scope_type: ModuleScope = ModuleScope.USER) -> bool:
         """모듈 활성화 여부 확인"""
-        installed_data = self._load_installed_data()
         install_key = f"{user_id}_{scope_type.value}_{scope_id}" if scope_id else f"{user_id}_{scope_type.value}"
-        if install_key in installed_data and module_id in installed_data[install_key]:
-            return installed_data[install_key][module_id].get('status') == ModuleStatus.ACTIVATED.value
-        return False
+        install_info = (self.installed.get(install_key) or {}).get(module_id)
+        return bool(install_info) and install_info.get('status') == ModuleStatus.ACTIVATED.value
 
     def get_installed_users(self, module_id: str) -> List[int]:
         """모듈을 설치한 사용자 목록"""
         try:
-            installed_data = self._load_installed_data()
-            users = []
-            for install_key in installed_data:
-                if module_id in installed_data[install_key]:
-                    user_id = int(install_key.split('_')[0])
-                    users.append(user_id)
-            return users
+            # 모듈 ID 인덱스로 해당 모듈이 설치된 키만 조회
+            return [int(install_key.split('_')[0])
+                    for install_key in self.installed.keys(module_id=module_id)]
         except Exception as e:
             logger.error(f"설치된 사용자 목록 조회 실패: {e}")
             return []
@@ -514,16 +474,7 @@ class ModuleMarketplaceSystem:
 
     def _increment_downloads(self, module_id: str):
         """다운로드 수 증가"""
-        try:
-            with open(self.downloads_file, 'r', encoding='utf-8') as f:
-                downloads = json.load(f)
-        except Exception:
-            downloads = {}
-
-        downloads[module_id] = downloads.get(module_id, 0) + 1
-
-        with open(self.downloads_file, 'w', encoding='utf-8') as f:
-            json.dump(downloads, f, ensure_ascii=False, indent=2)
+        self.downloads.mutate(module_id, lambda count: count + 1, default=0)
 
     def _copy_module_files(self, module_id: str, user_id: int, scope_id: int, scope_type: ModuleScope):
         """모듈 파일 복사 (실제 구현에서는 더 복잡한 로직 필요)"""
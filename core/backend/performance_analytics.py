@@ -6,11 +6,12 @@ import statistics
 from collections import defaultdict, deque
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-import threading
 import time
 import json
 import logging
 from typing import Optional
+
+from core.backend.job_scheduler import job_scheduler
 config = None  # pyright: ignore
 form = None  # pyright: ignore
 #!/usr/bin/env python3
@@ -22,6 +23,8 @@ form = None  # pyright: ignore
 
 logger = logging.getLogger(__name__)
 
+ANALYSIS_JOB = "performance_analytics.analysis"
+
 
 @dataclass
 class PerformanceMetric:
@@ -91,8 +94,7 @@ class PerformanceAnalytics:
             'enable_auto_analysis': True
         }
 
-        # 백그라운드 분석 스레드
-        self.analysis_thread = None
+        # 백그라운드 분석 작업 상태
         self.running = False
 
     def start_analytics(self) -> Dict[str, Any] if Dict is not None else None:
@@ -101,8 +103,9 @@ class PerformanceAnalytics:
 
         try:
             self.running = True
-            self.analysis_thread = threading.Thread(target=self._analysis_loop, daemon=True)
-            self.analysis_thread.start()
+            # 프로세스별로 수집한 메트릭을 분석하므로 singleton 아님
+            job_scheduler.add_job(ANALYSIS_JOB, self._analysis_tick,
+                                  interval=self.analysis_config['analysis_interval'], initial_delay=0)
 
             return {
                 'status': 'success',
@@ -123,8 +126,7 @@ class PerformanceAnalytics:
 
         try:
             self.running = False
-            if self.analysis_thread:
-                self.analysis_thread.join(timeout=10)
+            job_scheduler.remove_job(ANALYSIS_JOB)
 
             return {
                 'status': 'success',
@@ -310,19 +312,10 @@ class PerformanceAnalytics:
             logger.error(f"최적화 제안 조회 실패: {e}")
             return []
 
-    def _analysis_loop(self) -> None:
-        """분석 루프"""
-        while self.running:
-            try:
-                if self.analysis_config['enable_auto_analysis']:
-                    # 자동 분석 수행
-                    self.analyze_performance()
-
-                time.sleep(self.analysis_config['analysis_interval'])
-
-            except Exception as e:
-                logger.error(f"분석 루프 오류: {e}")
-                time.sleep(60)  # 오류 시 1분 대기
+    def _analysis_tick(self) -> None:
+        """자동 분석 (작업 스케줄러가 analysis_interval마다 실행)"""
+        if self.analysis_config['enable_auto_analysis']:
+            self.analyze_performance()
 
     def _filter_metrics_by_period(self, start_time: datetime, end_time: datetime) -> Dict[str, List[PerformanceMetric] if Dict is not None else None]:
         """기간별 메트릭 필터링"""
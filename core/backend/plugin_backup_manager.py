@@ -1,5 +1,3 @@
-import time
-import threading
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 from datetime import datetime
@@ -8,6 +6,8 @@ import json
 import shutil
 import logging
 from typing import Optional
+
+from core.backend.job_scheduler import job_scheduler
 config = None  # pyright: ignore
 form = None  # pyright: ignore
 #!/usr/bin/env python3
@@ -19,6 +19,10 @@ form = None  # pyright: ignore
 
 logger = logging.getLogger(__name__)
 
+AUTO_BACKUP_JOB = "plugin_backup.auto_backup"
+# 백업 주기 도래 여부 확인 간격 (초)
+BACKUP_CHECK_INTERVAL = 300
+
 
 class PluginBackupManager:
     """플러그인 백업 및 복구 관리자"""
@@ -46,8 +50,7 @@ class PluginBackupManager:
             'backup_errors': []
         }
 
-        # 백업 스레드
-        self.backup_thread = None
+        # 자동 백업 작업 상태
         self.backup_running = False
 
     def start_auto_backup(self):
@@ -56,8 +59,11 @@ class PluginBackupManager:
             return {"status": "already_running"}
 
         self.backup_running = True
-        self.backup_thread = threading.Thread(target=self._auto_backup_loop, daemon=True)
-        self.backup_thread.start()
+        # 백업 파일을 공유 디렉터리에 만들므로 여러 워커 중 한 프로세스에서만 실행.
+        # 백업 주기 도래 여부는 _should_create_backup이 판단하고 작업은 BACKUP_CHECK_INTERVAL마다 확인
+        job_scheduler.add_job(AUTO_BACKUP_JOB, self._auto_backup_tick,
+                              interval=min(BACKUP_CHECK_INTERVAL, self.backup_settings['backup_interval']),
+                              singleton=True, initial_delay=0)
 
         logger.info("플러그인 자동 백업 시스템 시작")
         return {"status": "started"}
@@ -65,51 +71,48 @@ class PluginBackupManager:
     def stop_auto_backup(self):
         """자동 백업 중지"""
         self.backup_running = False
-        if self.backup_thread:
-            self.backup_thread.join(timeout=5)
+        job_scheduler.remove_job(AUTO_BACKUP_JOB)
 
         logger.info("플러그인 자동 백업 시스템 중지")
         return {"status": "stopped"}
 
-    def _auto_backup_loop(self):
-        """자동 백업 루프"""
-        while self.backup_running:
-            try:
-                # 백업 실행
-                if self._should_create_backup():
-                    self.create_backup()
-
-                # 오래된 백업 정리
-                self._cleanup_old_backups()
+    def _auto_backup_tick(self):
+        """자동 백업 확인 (작업 스케줄러가 주기적으로 실행)"""
+        try:
+            # 백업 실행
+            created = False
+            if self._should_create_backup():
+                self.create_backup()
+                created = True
 
-                # 백업 검증
-                if self.backup_settings['verify_backups'] if self.backup_settings is not None else None:
-                    self._verify_recent_backups()
+            # 오래된 백업 정리
+            self._cleanup_old_backups()
 
-                time.sleep(self.backup_settings['backup_interval'] if self.backup_settings is not None else None)
+            # 새 백업 검증
+            if created and self.backup_settings['verify_backups']:
+                self._verify_recent_backups()
 
-            except Exception as e:
-                logger.error(f"자동 백업 루프 오류: {e}")
-                self.backup_status['backup_errors'] if self.backup_status is not None else None.append({
-                    'timestamp': datetime.now().isoformat(),
-                    'error': str(e)
-                })
-                time.sleep(300)  # 5분 후 재시도
+        except Exception as e:
+            self.backup_status['backup_errors'].append({
+                'timestamp': datetime.now().isoformat(),
+                'error': str(e)
+            })
+            raise
 
     def _should_create_backup(self) -> bool:
         """백업 생성 여부 결정"""
-        if not self.backup_settings['auto_backup_enabled'] if self.backup_settings is not None else None:
+        if not self.backup_settings['auto_backup_enabled']:
             return False
 
-        if self.backup_status['last_backup'] if self.backup_status is not None else None is None:
+        if self.backup_status['last_backup'] is None:
             return True
 
-        last_backup_time = datetime.fromisoformat(self.backup_status['last_backup'] if self.backup_status is not None else None)
+        last_backup_time = datetime.fromisoformat(self.backup_status['last_backup'])
         time_since_last_backup = datetime.now() - last_backup_time
 
-        return time_since_last_backup.total_seconds() >= self.backup_settings['backup_interval'] if self.backup_settings is not None else None
+        return time_since_last_backup.total_seconds() >= self.backup_settings['backup_interval']
 
-    def create_backup(self, backup_name: Optional[str] if Optional is not None else None = None) -> Dict[str, Any] if Dict is not None else None:
+    def create_backup(self, backup_name: Optional[str] = None) -> Dict[str, Any]:
         """플러그인 백업 생성"""
         try:
             if not self.plugins_dir.exists():
@@ -135,10 +138,10 @@ class PluginBackupManager:
             for plugin_dir in self.plugins_dir.iterdir():
                 if plugin_dir.is_dir():
                     plugin_info = self._get_plugin_info(plugin_dir)
-                    backup_metadata['plugins'] if backup_metadata is not None else None.append(plugin_info)
+                    backup_metadata['plugins'].append(plugin_info)
 
             # 백업 생성
-            if self.backup_settings['compress_backups'] if self.backup_settings is not None else None:
+            if self.backup_settings['compress_backups']:
                 backup_file = backup_path.with_suffix('.zip')
                 self._create_compressed_backup(backup_file,  backup_metadata)
             else:
@@ -146,7 +149,7 @@ class PluginBackupManager:
                 self._create_directory_backup(backup_file,  backup_metadata)
 
             # 백업 검증(운영 환경에서는 실패해도 경고만)
-            if self.backup_settings['verify_backups'] if self.backup_settings is not None else None:
+            if self.backup_settings['verify_backups']:
                 if not self._verify_backup(backup_file):
                     logger.warning("백업 검증 실패(운영 환경): 파일 누락 등 경고만 남기고 백업은 성공 처리")
             # 백업 상태 업데이트
@@ -160,12 +163,12 @@ class PluginBackupManager:
             return {
                 'success': True,
                 'backup_file': str(backup_file),
-                'backup_size': self.backup_status['last_backup_size'] if self.backup_status is not None else None,
-                'plugin_count': len(backup_metadata['plugins'] if backup_metadata is not None else None)
+                'backup_size': self.backup_status['last_backup_size'],
+                'plugin_count': len(backup_metadata['plugins'])
             }
         except Exception as e:
             logger.error(f"플러그인 백업 생성 실패: {e}")
-            self.backup_status['backup_errors'] if self.backup_status is not None else None.append({
+            self.backup_status['backup_errors'].append({
                 'timestamp': datetime.now().isoformat(),
                 'error': str(e)
             })
@@ -174,7 +177,7 @@ class PluginBackupManager:
                 'error': str(e)
             }
 
-    def _create_compressed_backup(self,  backup_file: Path,  metadata: Dict[str,  Any] if Dict is not None else None):
+    def _create_compressed_backup(self,  backup_file: Path,  metadata: Dict[str,  Any]):
         """압축 백업 생성"""
         with zipfile.ZipFile(backup_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
             # 메타데이터 추가
@@ -188,7 +191,7 @@ class PluginBackupManager:
                             arcname = file_path.relative_to(self.plugins_dir)
                             zipf.write(file_path, arcname)
 
-    def _create_directory_backup(self,  backup_path: Path,  metadata: Dict[str,  Any] if Dict is not None else None):
+    def _create_directory_backup(self,  backup_path: Path,  metadata: Dict[str,  Any]):
         """디렉토리 백업 생성"""
         # 메타데이터 저장
         metadata_file = backup_path / 'backup_metadata.json'
@@ -200,7 +203,7 @@ class PluginBackupManager:
         # 플러그인 디렉토리 복사
         shutil.copytree(self.plugins_dir, backup_path / 'plugins', dirs_exist_ok=True)
 
-    def _get_plugin_info(self,  plugin_dir: Path) -> Dict[str, Any] if Dict is not None else None:
+    def _get_plugin_info(self,  plugin_dir: Path) -> Dict[str, Any]:
         """플러그인 정보 수집"""
         plugin_info = {
             'name': plugin_dir.name,
@@ -255,9 +258,9 @@ class PluginBackupManager:
                     # 플러그인 파일 확인
                     missing_files = []
                     for plugin_info in metadata.get('plugins', []) if metadata else []:
-                        plugin_name = plugin_info['name'] if plugin_info is not None else None
+                        plugin_name = plugin_info['name']
                         for file_info in plugin_info.get('files', []) if plugin_info else []:
-                            file_path = f"plugins/{plugin_name}/{file_info['path'] if file_info is not None else None}"
+                            file_path = f"plugins/{plugin_name}/{file_info['path']}"
                             if file_path not in zipf.namelist():
                                 missing_files.append(file_path)
 
@@ -438,27 +441,27 @@ class PluginBackupManager:
                 if created_at:
                     backup_time = datetime.fromisoformat(created_at)
                     if (current_time - backup_time).days > self.backup_settings['backup_retention_days']:
-                        backup_path = Path(backup['path'] if backup is not None else None)
+                        backup_path = Path(backup['path'])
                         if backup_path.exists():
                             if backup_path.is_file():
                                 backup_path.unlink()
                             else:
                                 shutil.rmtree(backup_path)
-                            logger.info(f"오래된 백업 제거: {backup['name'] if backup is not None else None}")
+                            logger.info(f"오래된 백업 제거: {backup['name']}")
 
             # 최대 백업 개수 초과 시 오래된 것부터 제거
-            if len(backups) > self.backup_settings['max_backups'] if self.backup_settings is not None else None:
+            if len(backups) > self.backup_settings['max_backups']:
                 sorted_backups = sorted(backups, key=lambda x: x.get('created_at', '') if x else '', reverse=True)
-                remove_count = len(backups) - self.backup_settings['max_backups'] if self.backup_settings is not None else None
+                remove_count = len(backups) - self.backup_settings['max_backups']
 
                 for backup in sorted_backups[:remove_count]:
-                    backup_path = Path(backup['path'] if backup is not None else None)
+                    backup_path = Path(backup['path'])
                     if backup_path.exists():
                         if backup_path.is_file():
                             backup_path.unlink()
                         else:
                             shutil.rmtree(backup_path)
-                        logger.info(f"백업 개수 초과로 제거: {backup['name'] if backup is not None else None}")
+                        logger.info(f"백업 개수 초과로 제거: {backup['name']}")
 
         except Exception as e:
             logger.error(f"오래된 백업 정리 실패: {e}")
@@ -467,12 +470,12 @@ class PluginBackupManager:
         """최근 백업 검증"""
         try:
             backups = self.list_backups()
-            recent_backups = backups[:3] if backups is not None else None  # 최근 3개 백업만 검증
+            recent_backups = backups[:3]  # 최근 3개 백업만 검증
 
-            for backup in recent_backups if recent_backups is not None:
-                backup_path = Path(backup['path'] if backup is not None else None)
+            for backup in recent_backups:
+                backup_path = Path(backup['path'])
                 if not self._verify_backup(backup_path):
-                    logger.warning(f"백업 검증 실패: {backup['name'] if backup is not None else None}")
+                    logger.warning(f"백업 검증 실패: {backup['name']}")
 
         except Exception as e:
             logger.error(f"최근 백업 검증 실패: {e}")
@@ -480,12 +483,12 @@ class PluginBackupManager:
     def get_backup_status(self) -> Dict[str, Any]:
         """백업 상태 조회"""
         return {
-            'auto_backup_enabled': self.backup_settings['auto_backup_enabled'] if self.backup_settings is not None else None,
+            'auto_backup_enabled': self.backup_settings['auto_backup_enabled'],
             'backup_running': self.backup_running,
-            'last_backup': self.backup_status['last_backup'] if self.backup_status is not None else None,
-            'backup_count': self.backup_status['backup_count'] if self.backup_status is not None else None,
-            'last_backup_size': self.backup_status['last_backup_size'] if self.backup_status is not None else None,
-            'recent_errors': self.backup_status['backup_errors'][-5:] if self.backup_status is not None else None,  # 최근 5개 오류
+            'last_backup': self.backup_status['last_backup'],
+            'backup_count': self.backup_status['backup_count'],
+            'last_backup_size': self.backup_status['last_backup_size'],
+            'recent_errors': self.backup_status['backup_errors'][-5:],  # 최근 5개 오류
             'backup_settings': self.backup_settings
         }
 
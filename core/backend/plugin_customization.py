@@ -3,10 +3,11 @@ from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union  # pyright: ignore
-import json
 from typing import Optional
 from flask import request
 
+from core.backend.document_store import get_document_store
+
 config = None  # pyright: ignore
 form = None  # pyright: ignore
 
@@ -65,94 +66,45 @@ class PluginCustomizationManager:
         self.requests_file = self.base_dir / "requests.json"
         self.history_file = self.base_dir / "history.json"
 
-        # 메모리 캐시
-        self._rules_cache: List[CustomizationRule] = []
-        self._requests_cache: List[CustomizationRequest] = []
-        self._history_cache: List[Dict[str, Any]] = []
-
-        # 초기 로드
-        self._load_data()
-
-    def _load_data(self):
-        """데이터 로드"""
-        # 규칙 로드
-        if self.rules_file.exists():
-            try:
-                with open(self.rules_file, "r", encoding="utf-8") as f:
-                    rules_data = json.load(f)
-                    self._rules_cache = [
-                        CustomizationRule(**rule) for rule in rules_data
-                    ]
-            except Exception as e:
-                print(f"규칙 로드 실패: {e}")
-                self._rules_cache = []
-
-        # 요청 로드
-        if self.requests_file.exists():
-            try:
-                with open(self.requests_file, "r", encoding="utf-8") as f:
-                    requests_data = json.load(f)
-                    self._requests_cache = [
-                        CustomizationRequest(**req) for req in requests_data
-                    ]
-            except Exception as e:
-                print(f"요청 로드 실패: {e}")
-                self._requests_cache = []
-
-        # 히스토리 로드
-        if self.history_file.exists():
-            try:
-                with open(self.history_file, "r", encoding="utf-8") as f:
-                    self._history_cache = json.load(f)
-            except Exception as e:
-                print(f"히스토리 로드 실패: {e}")
-                self._history_cache = []
-
-    def _save_data(self):
-        """데이터 저장"""
-        # 규칙 저장
-        try:
-            with open(self.rules_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    [asdict(rule) for rule in self._rules_cache],
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
-                )
-        except Exception as e:
-            print(f"규칙 저장 실패: {e}")
+        # 규칙은 (플러그인, 대상 유형, 대상 경로)당 하나
+        store = get_document_store(self.base_dir)
+        self.rules = store.collection(
+            "rules.json",
+            key=lambda rule: f"{rule['plugin_name']}:{rule['target_type']}:{rule['target_path']}",
+            indexes=("plugin_name", "target_type", "approved"),
+        )
+        self.requests = store.collection("requests.json", indexes=("status", "plugin_name"))
+        self.history = store.collection("history.json", key=None, indexes=("action",))
+
+    @staticmethod
+    def _rule_to_dict(rule: CustomizationRule) -> Dict[str, Any]:
+        data = asdict(rule)
+        data["customization_type"] = rule.customization_type.value
+        return data
+
+    @staticmethod
+    def _rule_from_dict(data: Dict[str, Any]) -> CustomizationRule:
+        return CustomizationRule(
+            **dict(data, customization_type=CustomizationType(data["customization_type"]))
+        )
 
-        # 요청 저장
-        try:
-            with open(self.requests_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    [asdict(req) for req in self._requests_cache],
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
-                )
-        except Exception as e:
-            print(f"요청 저장 실패: {e}")
+    def _request_to_dict(self, req: CustomizationRequest) -> Dict[str, Any]:
+        return dict(asdict(req), rule=self._rule_to_dict(req.rule))
 
-        # 히스토리 저장
-        try:
-            with open(self.history_file, "w", encoding="utf-8") as f:
-                json.dump(self._history_cache, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"히스토리 저장 실패: {e}")
+    def _request_from_dict(self, data: Dict[str, Any]) -> CustomizationRequest:
+        return CustomizationRequest(**dict(data, rule=self._rule_from_dict(data["rule"])))
+
+    def _rule_key(self, rule: CustomizationRule) -> str:
+        return f"{rule.plugin_name}:{rule.target_type}:{rule.target_path}"
 
     def _add_to_history(self, action: str, data: Dict[str, Any]):
-        """히스토리에 추가"""
+        """히스토리에 추가 (최근 1000개만 유지)"""
         history_entry = {
             "action": action,
             "data": data,
             "timestamp": datetime.now().isoformat(),
         }
-        self._history_cache.append(history_entry)
-
-        # 히스토리 크기 제한 (최근 1000개)
-        if len(self._history_cache) > 1000:
-            self._history_cache = self._history_cache[-1000:]
+        self.history.append(history_entry, max_items=1000)
 
     def create_customization_rule(self, rule: CustomizationRule) -> bool:
         """커스터마이즈 규칙 생성"""
@@ -162,10 +114,9 @@ class PluginCustomizationManager:
             if existing_rule:
                 return self.update_customization_rule(existing_rule, rule)
 
-            self._rules_cache.append(rule)
-            self._save_data()
+            self.rules.put(self._rule_to_dict(rule))
 
-            self._add_to_history("create_rule", asdict(rule))
+            self._add_to_history("create_rule", self._rule_to_dict(rule))
             return True
 
         except Exception as e:
@@ -177,12 +128,16 @@ class PluginCustomizationManager:
     ) -> bool:
         """커스터마이즈 규칙 업데이트"""
         try:
-            index = self._rules_cache.index(old_rule)
-            self._rules_cache[index] = new_rule
-            self._save_data()
+            old_key = self._rule_key(old_rule)
+            if old_key not in self.rules:
+                return False
+            if old_key != self._rule_key(new_rule):
+                self.rules.delete(old_key)
+            self.rules.put(self._rule_to_dict(new_rule))
 
             self._add_to_history(
-                "update_rule", {"old": asdict(old_rule), "new": asdict(new_rule)}
+                "update_rule",
+                {"old": self._rule_to_dict(old_rule), "new": self._rule_to_dict(new_rule)},
             )
             return True
 
@@ -193,11 +148,8 @@ class PluginCustomizationManager:
     def delete_customization_rule(self, rule: CustomizationRule) -> bool:
         """커스터마이즈 규칙 삭제"""
         try:
-            if rule in self._rules_cache:
-                self._rules_cache.remove(rule)
-                self._save_data()
-
-                self._add_to_history("delete_rule", asdict(rule))
+            if self.rules.delete(self._rule_key(rule)):
+                self._add_to_history("delete_rule", self._rule_to_dict(rule))
                 return True
             return False
 
@@ -209,14 +161,8 @@ class PluginCustomizationManager:
         self, rule: CustomizationRule
     ) -> Optional[CustomizationRule]:
         """기존 규칙 찾기"""
-        for existing_rule in self._rules_cache:
-            if (
-                existing_rule.plugin_name == rule.plugin_name
-                and existing_rule.target_type == rule.target_type
-                and existing_rule.target_path == rule.target_path
-            ):
-                return existing_rule
-        return None
+        existing_rule = self.rules.get(self._rule_key(rule))
+        return self._rule_from_dict(existing_rule) if existing_rule else None
 
     def get_customization_rules(
         self,
@@ -225,14 +171,12 @@ class PluginCustomizationManager:
         conditions: Optional[Dict[str, Any]] = None,
     ) -> List[CustomizationRule]:
         """커스터마이즈 규칙 조회"""
-        rules = self._rules_cache.copy()
-
-        # 필터링
-        if plugin_name:
-            rules = [r for r in rules if r.plugin_name == plugin_name]
-
-        if target_type:
-            rules = [r for r in rules if r.target_type == target_type]
+        # 필터링 (인덱스 조회)
+        filters = {"plugin_name": plugin_name, "target_type": target_type}
+        rules = [
+            self._rule_from_dict(r)
+            for r in self.rules.find(**{k: v for k, v in filters.items() if v})
+        ]
 
         if conditions:
             rules = [
@@ -265,7 +209,7 @@ class PluginCustomizationManager:
         conditions = {"industry": industry, "brand": brand}
         if branch:
             conditions["branch"] = branch
-        approved_rules = [r for r in self._rules_cache if r.approved]
+        approved_rules = [self._rule_from_dict(r) for r in self.rules.find(approved=True)]
         for rule in approved_rules:
             if not self._check_conditions(rule.conditions, conditions):
                 continue
@@ -402,7 +346,7 @@ class PluginCustomizationManager:
         """커스터마이즈 요청 생성"""
         request_id = f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{plugin_name}"
 
-        request = CustomizationRequest(
+        req = CustomizationRequest(
             id=request_id,
             plugin_name=plugin_name,
             rule=rule,
@@ -413,34 +357,32 @@ class PluginCustomizationManager:
             updated_at=datetime.now().isoformat(),
         )
 
-        self._requests_cache.append(request)
-        self._save_data()
+        self.requests.put(self._request_to_dict(req))
 
-        self._add_to_history("create_request", asdict(request))
+        self._add_to_history("create_request", self._request_to_dict(req))
         return request_id
 
     def approve_customization_request(
         self, request_id: str, reviewer: str, comment: str = ""
     ) -> bool:
         """커스터마이즈 요청 승인"""
-        request = self._find_request_by_id(request_id)
-        if not request:
+        req = self._find_request_by_id(request_id)
+        if not req:
             return False
 
-        request.status = "approved"
-        request.reviewer = reviewer
-        request.review_comment = comment
-        request.updated_at = datetime.now().isoformat()
+        req.status = "approved"
+        req.reviewer = reviewer
+        req.review_comment = comment
+        req.updated_at = datetime.now().isoformat()
 
         # 규칙 승인
-        request.rule.approved = True
-        request.rule.approved_by = reviewer
-        request.rule.approved_at = datetime.now().isoformat()
+        req.rule.approved = True
+        req.rule.approved_by = reviewer
+        req.rule.approved_at = datetime.now().isoformat()
 
         # 규칙에 추가
-        self._rules_cache.append(request.rule)
-
-        self._save_data()
+        self.requests.put(self._request_to_dict(req))
+        self.rules.put(self._rule_to_dict(req.rule))
 
         self._add_to_history(
             "approve_request",
@@ -452,16 +394,16 @@ class PluginCustomizationManager:
         self, request_id: str, reviewer: str, comment: str = ""
     ) -> bool:
         """커스터마이즈 요청 거부"""
-        request = self._find_request_by_id(request_id)
-        if not request:
+        req = self._find_request_by_id(request_id)
+        if not req:
             return False
 
-        request.status = "rejected"
-        request.reviewer = reviewer
-        request.review_comment = comment
-        request.updated_at = datetime.now().isoformat()
+        req.status = "rejected"
+        req.reviewer = reviewer
+        req.review_comment = comment
+        req.updated_at = datetime.now().isoformat()
 
-        self._save_data()
+        self.requests.put(self._request_to_dict(req))
 
         self._add_to_history(
             "reject_request",
@@ -471,32 +413,23 @@ class PluginCustomizationManager:
 
     def _find_request_by_id(self, request_id: str) -> Optional[CustomizationRequest]:
         """요청 ID로 요청 찾기"""
-        for request in self._requests_cache:
-            if request.id == request_id:
-                return request
-        return None
+        data = self.requests.get(request_id)
+        return self._request_from_dict(data) if data else None
 
     def get_customization_requests(
         self, status: Optional[str] = None, plugin_name: Optional[str] = None
     ) -> List[CustomizationRequest]:
         """커스터마이즈 요청 조회"""
-        requests = self._requests_cache.copy()
-
-        if status:
-            requests = [r for r in requests if r.status == status]
-
-        if plugin_name:
-            requests = [r for r in requests if r.plugin_name == plugin_name]
-
-        return requests
+        filters = {"status": status, "plugin_name": plugin_name}
+        return [
+            self._request_from_dict(r)
+            for r in self.requests.find(**{k: v for k, v in filters.items() if v})
+        ]
 
     def get_customization_history(
         self, action: Optional[str] = None, limit: int = 100
     ) -> List[Dict[str, Any]]:
         """커스터마이즈 히스토리 조회"""
-        history = self._history_cache.copy()
-
-        if action:
-            history = [h for h in history if h.get("action") == action]
+        history = self.history.find(action=action) if action else self.history.all()
 
         return history[-limit:]
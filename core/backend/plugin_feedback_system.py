@@ -8,6 +8,8 @@ import json
 from typing import Optional
 from flask import request
 
+from core.backend.document_store import get_document_store
+
 form = None  # pyright: ignore
 
 
@@ -102,25 +104,22 @@ class PluginFeedbackSystem:
         self.workflows_file = self.feedback_dir / "workflows.json"
         self.templates_file = self.feedback_dir / "templates.json"
 
+        store = get_document_store(self.feedback_dir)
+        self.feedbacks = store.collection(
+            "feedback.json", indexes=("status", "type", "plugin_id", "user_id")
+        )
+        self.comments = store.collection("comments.json", indexes=("feedback_id",))
+        self.workflows = store.collection("workflows.json", indexes=("feedback_id",))
+
         # 초기화
         self._init_feedback_system()
 
     def _init_feedback_system(self):
         """피드백 시스템 초기화"""
-        # 피드백 목록 초기화
-        if not self.feedback_file.exists():
-            with open(self.feedback_file, "w", encoding="utf-8") as f:
-                json.dump([], f, indent=2, ensure_ascii=False)
-
-        # 댓글 목록 초기화
-        if not self.comments_file.exists():
-            with open(self.comments_file, "w", encoding="utf-8") as f:
-                json.dump([], f, indent=2, ensure_ascii=False)
-
-        # 워크플로우 목록 초기화
-        if not self.workflows_file.exists():
-            with open(self.workflows_file, "w", encoding="utf-8") as f:
-                json.dump([], f, indent=2, ensure_ascii=False)
+        # 피드백 / 댓글 / 워크플로우 목록 초기화
+        self.feedbacks.seed([])
+        self.comments.seed([])
+        self.workflows.seed([])
 
         # 템플릿 초기화
         if not self.templates_file.exists():
@@ -252,8 +251,6 @@ class PluginFeedbackSystem:
     def create_feedback(self, feedback_data: Dict[str, Any]) -> Optional[str]:
         """피드백 생성"""
         try:
-            feedbacks = self._load_feedback()
-
             feedback_id = str(uuid.uuid4())
             feedback = {
                 "id": feedback_id,
@@ -278,8 +275,7 @@ class PluginFeedbackSystem:
                 "followers": [feedback_data.get("user_id", "anonymous")],
             }
 
-            feedbacks.append(feedback)
-            self._save_feedback(feedbacks)
+            self.feedbacks.put(feedback)
 
             # 워크플로우 생성
             self._create_workflow(feedback_id, str(feedback["type"]))
@@ -293,9 +289,7 @@ class PluginFeedbackSystem:
     def get_feedback(self, feedback_id: str) -> Optional[Dict[str, Any]]:
         """피드백 조회"""
         try:
-            feedbacks = self._load_feedback()
-            feedback = next((f for f in feedbacks if f["id"] == feedback_id), None)
-            return feedback
+            return self.feedbacks.get(feedback_id)
         except Exception as e:
             print(f"피드백 조회 실패: {e}")
             return None
@@ -311,17 +305,16 @@ class PluginFeedbackSystem:
     ) -> List[Dict[str, Any]]:
         """피드백 목록 조회"""
         try:
-            feedbacks = self._load_feedback()
-
-            # 필터링
-            if status:
-                feedbacks = [f for f in feedbacks if f.get("status") == status]
-            if type:
-                feedbacks = [f for f in feedbacks if f.get("type") == type]
-            if plugin_id:
-                feedbacks = [f for f in feedbacks if f.get("plugin_id") == plugin_id]
-            if user_id:
-                feedbacks = [f for f in feedbacks if f.get("user_id") == user_id]
+            # 필터링 (인덱스 조회)
+            filters = {
+                "status": status,
+                "type": type,
+                "plugin_id": plugin_id,
+                "user_id": user_id,
+            }
+            feedbacks = self.feedbacks.find(
+                **{name: value for name, value in filters.items() if value}
+            )
 
             # 정렬
             reverse = sort_order == "desc"
@@ -349,16 +342,13 @@ class PluginFeedbackSystem:
     ) -> bool:
         """피드백 상태 업데이트"""
         try:
-            feedbacks = self._load_feedback()
-            feedback = next((f for f in feedbacks if f["id"] == feedback_id), None)
-
+            # 상태 업데이트
+            feedback = self.feedbacks.update(
+                feedback_id, {"status": status, "updated_at": datetime.now().isoformat()}
+            )
             if not feedback:
                 return False
 
-            # 상태 업데이트
-            feedback["status"] = status
-            feedback["updated_at"] = datetime.now().isoformat()
-
             # 댓글 추가
             if comment:
                 self.add_comment(
@@ -368,7 +358,6 @@ class PluginFeedbackSystem:
             # 워크플로우 업데이트
             self._update_workflow(feedback_id, status)
 
-            self._save_feedback(feedbacks)
             return True
 
         except Exception as e:
@@ -383,18 +372,15 @@ class PluginFeedbackSystem:
     ) -> bool:
         """피드백 할당"""
         try:
-            feedbacks = self._load_feedback()
-            feedback = next((f for f in feedbacks if f["id"] == feedback_id), None)
-
-            if not feedback:
-                return False
-
-            feedback["assigned_to"] = assigned_to
-            feedback["estimated_completion"] = estimated_completion
-            feedback["updated_at"] = datetime.now().isoformat()
-
-            self._save_feedback(feedbacks)
-            return True
+            feedback = self.feedbacks.update(
+                feedback_id,
+                {
+                    "assigned_to": assigned_to,
+                    "estimated_completion": estimated_completion,
+                    "updated_at": datetime.now().isoformat(),
+                },
+            )
+            return feedback is not None
 
         except Exception as e:
             print(f"피드백 할당 실패: {e}")
@@ -411,8 +397,6 @@ class PluginFeedbackSystem:
     ) -> Optional[str]:
         """댓글 추가"""
         try:
-            comments = self._load_comments()
-
             comment_id = str(uuid.uuid4())
             comment = {
                 "id": comment_id,
@@ -426,14 +410,11 @@ class PluginFeedbackSystem:
                 "is_internal": is_internal,
             }
 
-            comments.append(comment)
-            self._save_comments(comments)
+            self.comments.put(comment)
 
             # 피드백의 댓글 목록 업데이트
-            feedbacks = self._load_feedback()
-            feedback = next((f for f in feedbacks if f["id"] == feedback_id), None)
-            if feedback:
-                feedback["comments"].append(
+            def append_comment(feedback):
+                feedback.setdefault("comments", []).append(
                     {
                         "id": comment_id,
                         "user_name": user_name,
@@ -444,7 +425,9 @@ class PluginFeedbackSystem:
                     }
                 )
                 feedback["updated_at"] = datetime.now().isoformat()
-                self._save_feedback(feedbacks)
+                return feedback
+
+            self.feedbacks.mutate(feedback_id, append_comment)
 
             return comment_id
 
@@ -457,8 +440,7 @@ class PluginFeedbackSystem:
     ) -> List[Dict[str, Any]]:
         """댓글 목록 조회"""
         try:
-            comments = self._load_comments()
-            feedback_comments = [c for c in comments if c["feedback_id"] == feedback_id]
+            feedback_comments = self.comments.find(feedback_id=feedback_id)
 
             if not include_internal:
                 feedback_comments = [
@@ -477,20 +459,16 @@ class PluginFeedbackSystem:
     def vote_feedback(self, feedback_id: str, user_id: str, vote: bool = True) -> bool:
         """피드백 투표"""
         try:
-            feedbacks = self._load_feedback()
-            feedback = next((f for f in feedbacks if f["id"] == feedback_id), None)
 
-            if not feedback:
-                return False
-
-            if vote:
-                feedback["votes"] = feedback.get("votes", 0) + 1
-            else:
-                feedback["votes"] = max(0, feedback.get("votes", 0) - 1)
+            def apply_vote(feedback):
+                if vote:
+                    feedback["votes"] = feedback.get("votes", 0) + 1
+                else:
+                    feedback["votes"] = max(0, feedback.get("votes", 0) - 1)
+                feedback["updated_at"] = datetime.now().isoformat()
+                return feedback
 
-            feedback["updated_at"] = datetime.now().isoformat()
-            self._save_feedback(feedbacks)
-            return True
+            return self.feedbacks.mutate(feedback_id, apply_vote) is not None
 
         except Exception as e:
             print(f"피드백 투표 실패: {e}")
@@ -501,23 +479,18 @@ class PluginFeedbackSystem:
     ) -> bool:
         """피드백 팔로우"""
         try:
-            feedbacks = self._load_feedback()
-            feedback = next((f for f in feedbacks if f["id"] == feedback_id), None)
 
-            if not feedback:
-                return False
-
-            followers = feedback.get("followers", [])
-
-            if follow and user_id not in followers:
-                followers.append(user_id)
-            elif not follow and user_id in followers:
-                followers.remove(user_id)
+            def apply_follow(feedback):
+                followers = feedback.get("followers", [])
+                if follow and user_id not in followers:
+                    followers.append(user_id)
+                elif not follow and user_id in followers:
+                    followers.remove(user_id)
+                feedback["followers"] = followers
+                feedback["updated_at"] = datetime.now().isoformat()
+                return feedback
 
-            feedback["followers"] = followers
-            feedback["updated_at"] = datetime.now().isoformat()
-            self._save_feedback(feedbacks)
-            return True
+            return self.feedbacks.mutate(feedback_id, apply_follow) is not None
 
         except Exception as e:
             print(f"피드백 팔로우 실패: {e}")
@@ -534,11 +507,8 @@ class PluginFeedbackSystem:
     def get_workflow(self, feedback_id: str) -> Optional[Dict[str, Any]]:
         """워크플로우 조회"""
         try:
-            workflows = self._load_workflows()
-            workflow = next(
-                (w for w in workflows if w["feedback_id"] == feedback_id), None
-            )
-            return workflow
+            workflows = self.workflows.find(feedback_id=feedback_id, limit=1)
+            return workflows[0] if workflows else None
         except Exception as e:
             print(f"워크플로우 조회 실패: {e}")
             return None
@@ -546,8 +516,6 @@ class PluginFeedbackSystem:
     def _create_workflow(self, feedback_id: str, feedback_type: str):
         """워크플로우 생성"""
         try:
-            workflows = self._load_workflows()
-
             # 피드백 유형별 워크플로우 정의
             workflow_steps = {
                 "plugin_request": [
@@ -596,8 +564,7 @@ class PluginFeedbackSystem:
                 "completed_at": None,
             }
 
-            workflows.append(workflow)
-            self._save_workflows(workflows)
+            self.workflows.put(workflow)
 
         except Exception as e:
             print(f"워크플로우 생성 실패: {e}")
@@ -605,11 +572,7 @@ class PluginFeedbackSystem:
     def _update_workflow(self, feedback_id: str, status: str):
         """워크플로우 업데이트"""
         try:
-            workflows = self._load_workflows()
-            workflow = next(
-                (w for w in workflows if w["feedback_id"] == feedback_id), None
-            )
-
+            workflow = self.get_workflow(feedback_id)
             if not workflow:
                 return
 
@@ -640,46 +603,7 @@ class PluginFeedbackSystem:
             ]:
                 workflow["completed_at"] = datetime.now().isoformat()
 
-            self._save_workflows(workflows)
+            self.workflows.put(workflow)
 
         except Exception as e:
             print(f"워크플로우 업데이트 실패: {e}")
-
-    def _load_feedback(self) -> List[Dict[str, Any]]:
-        """피드백 목록 로드"""
-        try:
-            with open(self.feedback_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return []
-
-    def _save_feedback(self, feedbacks: List[Dict[str, Any]]):
-        """피드백 목록 저장"""
-        with open(self.feedback_file, "w", encoding="utf-8") as f:
-            json.dump(feedbacks, f, indent=2, ensure_ascii=False)
-
-    def _load_comments(self) -> List[Dict[str, Any]]:
-        """댓글 목록 로드"""
-        try:
-            with open(self.comments_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return []
-
-    def _save_comments(self, comments: List[Dict[str, Any]]):
-        """댓글 목록 저장"""
-        with open(self.comments_file, "w", encoding="utf-8") as f:
-            json.dump(comments, f, indent=2, ensure_ascii=False)
-
-    def _load_workflows(self) -> List[Dict[str, Any]]:
-        """워크플로우 목록 로드"""
-        try:
-            with open(self.workflows_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return []
-
-    def _save_workflows(self, workflows: List[Dict[str, Any]]):
-        """워크플로우 목록 저장"""
-        with open(self.workflows_file, "w", encoding="utf-8") as f:
-            json.dump(workflows, f, indent=2, ensure_ascii=False)
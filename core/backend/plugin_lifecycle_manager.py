@@ -1,5 +1,3 @@
-import time
-import threading
 from enum import Enum
 from typing import Dict, List, Optional, Any, Callable
 from pathlib import Path
@@ -8,6 +6,8 @@ import shutil
 import json
 import logging
 from typing import Optional
+
+from core.backend.job_scheduler import job_scheduler
 config = None  # pyright: ignore
 form = None  # pyright: ignore
 #!/usr/bin/env python3
@@ -19,6 +19,8 @@ form = None  # pyright: ignore
 
 logger = logging.getLogger(__name__)
 
+UPDATE_JOB = "plugin_lifecycle.updates"
+
 
 class PluginState(Enum):
     """플러그인 상태"""
@@ -48,21 +50,20 @@ class PluginLifecycleManager:
         self.plugins_dir.mkdir(exist_ok=True)
 
         # 플러그인 상태 관리
-        self.plugin_states: Dict[str, Dict[str, Any] if Dict is not None else None] = {}
-        self.plugin_metadata: Dict[str, Dict[str, Any] if Dict is not None else None] = {}
+        self.plugin_states: Dict[str, Dict[str, Any]] = {}
+        self.plugin_metadata: Dict[str, Dict[str, Any]] = {}
 
         # 생명주기 이벤트 리스너
-        self.event_listeners: Dict[PluginLifecycleEvent, List[Callable] if Dict is not None else None] = {
+        self.event_listeners: Dict[PluginLifecycleEvent, List[Callable]] = {
             event: [] for event in PluginLifecycleEvent
         }
 
         # 플러그인 의존성 관리
-        self.dependency_graph: Dict[str, List[str] if Dict is not None else None] = {}
+        self.dependency_graph: Dict[str, List[str]] = {}
 
         # 업데이트 관리
-        self.update_queue: List[Dict[str, Any] if List is not None else None] = []
+        self.update_queue: List[Dict[str, Any]] = []
         self.update_running = False
-        self.update_thread = None
 
         # 플러그인 검증
         self.validation_rules = {
@@ -75,28 +76,28 @@ class PluginLifecycleManager:
     def register_event_listener(self,  event: PluginLifecycleEvent,  callback: Callable):
         """이벤트 리스너 등록"""
         if event not in self.event_listeners:
-            self.event_listeners[event] if event_listeners is not None else None = []
-        self.event_listeners[event] if event_listeners is not None else None.append(callback)
+            self.event_listeners[event] = []
+        self.event_listeners[event].append(callback)
 
-    def _trigger_event(self,  event: PluginLifecycleEvent,  plugin_name: str,  data: Optional[Dict[str, Any] if Optional is not None else None]=None):
+    def _trigger_event(self,  event: PluginLifecycleEvent,  plugin_name: str,  data: Optional[Dict[str, Any]] = None):
         """이벤트 트리거"""
         event_data = {
-            'event': event.value if event is not None else None,
+            'event': event.value,
             'plugin_name': plugin_name,
             'timestamp': datetime.now().isoformat(),
             'data': data or {}
         }
 
-        logger.info(f"플러그인 생명주기 이벤트: {event.value if event is not None else None} - {plugin_name}")
+        logger.info(f"플러그인 생명주기 이벤트: {event.value} - {plugin_name}")
 
         # 이벤트 리스너 호출
-        for callback in self.event_listeners.get() if event_listeners else Noneevent, []) if event_listeners else None:
+        for callback in self.event_listeners.get(event, []):
             try:
                 callback(event_data)
             except Exception as e:
                 logger.error(f"이벤트 리스너 오류: {e}")
 
-    def install_plugin(self,  plugin_source: str, plugin_name=None) -> Dict[str, Any] if Dict is not None else None:
+    def install_plugin(self,  plugin_source: str, plugin_name=None) -> Dict[str, Any]:
         """플러그인 설치"""
         try:
             plugin_source_path = Path(plugin_source)
@@ -116,8 +117,8 @@ class PluginLifecycleManager:
 
             # 플러그인 검증
             validation_result = self._validate_plugin_source(plugin_source_path)
-            if not validation_result['valid'] if validation_result is not None else None:
-                raise ValueError(f"플러그인 검증 실패: {validation_result['errors'] if validation_result is not None else None}")
+            if not validation_result['valid']:
+                raise ValueError(f"플러그인 검증 실패: {validation_result['errors']}")
 
             # 플러그인 복사
             if plugin_source_path.is_dir():
@@ -132,19 +133,19 @@ class PluginLifecycleManager:
             metadata = self._load_plugin_metadata(plugin_dest_path)
 
             # 플러그인 상태 초기화
-            self.plugin_states[plugin_name] if plugin_states is not None else None = {
-                'state': PluginState.INSTALLED.value if INSTALLED is not None else None,
+            self.plugin_states[plugin_name] = {
+                'state': PluginState.INSTALLED.value,
                 'installed_at': datetime.now().isoformat(),
                 'last_updated': datetime.now().isoformat(),
-                'version': metadata.get() if metadata else None'version', '1.0.0') if metadata else None,
-                'dependencies': metadata.get() if metadata else None'dependencies', []) if metadata else None,
+                'version': metadata.get('version', '1.0.0'),
+                'dependencies': metadata.get('dependencies', []),
                 'errors': []
             }
 
-            self.plugin_metadata[plugin_name] if plugin_metadata is not None else None = metadata
+            self.plugin_metadata[plugin_name] = metadata
 
             # 의존성 그래프 업데이트
-            self._update_dependency_graph(plugin_name,  metadata.get() if metadata else None'dependencies', []) if metadata else None)
+            self._update_dependency_graph(plugin_name,  metadata.get('dependencies', []))
 
             # 이벤트 트리거
             self._trigger_event(PluginLifecycleEvent.INSTALLED, plugin_name, {
@@ -168,43 +169,43 @@ class PluginLifecycleManager:
                 'error': str(e)
             }
 
-    def activate_plugin(self,  plugin_name: str) -> Dict[str, Any] if Dict is not None else None:
+    def activate_plugin(self,  plugin_name: str) -> Dict[str, Any]:
         """플러그인 활성화"""
         try:
             if plugin_name not in self.plugin_states:
                 raise ValueError(f"플러그인 {plugin_name}이 설치되지 않았습니다")
 
-            plugin_state = self.plugin_states[plugin_name] if plugin_states is not None else None
+            plugin_state = self.plugin_states[plugin_name]
 
-            if plugin_state['state'] if plugin_state is not None else None == PluginState.ACTIVATED.value if ACTIVATED is not None else None:
+            if plugin_state['state'] == PluginState.ACTIVATED.value:
                 return {'success': True, 'message': '이미 활성화된 플러그인입니다'}
 
             # 의존성 검사
-            dependencies = plugin_state.get() if plugin_state else None'dependencies', []) if plugin_state else None
-            for dep in dependencies if dependencies is not None:
+            dependencies = plugin_state.get('dependencies', [])
+            for dep in dependencies:
                 if dep not in self.plugin_states:
                     raise ValueError(f"의존성 플러그인 {dep}이 설치되지 않았습니다")
-                if self.plugin_states[dep] if plugin_states is not None else None['state'] != PluginState.ACTIVATED.value if ACTIVATED is not None else None:
+                if self.plugin_states[dep]['state'] != PluginState.ACTIVATED.value:
                     raise ValueError(f"의존성 플러그인 {dep}이 활성화되지 않았습니다")
 
             # 플러그인 검증
             validation_result = self._validate_installed_plugin(plugin_name)
-            if not validation_result['valid'] if validation_result is not None else None:
-                plugin_state['errors'] if plugin_state is not None else None = validation_result['errors'] if validation_result is not None else None
-                plugin_state['state'] if plugin_state is not None else None = PluginState.ERROR.value if ERROR is not None else None
+            if not validation_result['valid']:
+                plugin_state['errors'] = validation_result['errors']
+                plugin_state['state'] = PluginState.ERROR.value
                 self._trigger_event(PluginLifecycleEvent.ERROR, plugin_name, {
-                    'errors': validation_result['errors'] if validation_result is not None else None
+                    'errors': validation_result['errors']
                 })
-                raise ValueError(f"플러그인 검증 실패: {validation_result['errors'] if validation_result is not None else None}")
+                raise ValueError(f"플러그인 검증 실패: {validation_result['errors']}")
 
             # 플러그인 활성화
-            plugin_state['state'] if plugin_state is not None else None = PluginState.ACTIVATED.value if ACTIVATED is not None else None
-            plugin_state['activated_at'] if plugin_state is not None else None = datetime.now().isoformat()
-            plugin_state['errors'] if plugin_state is not None else None = []
+            plugin_state['state'] = PluginState.ACTIVATED.value
+            plugin_state['activated_at'] = datetime.now().isoformat()
+            plugin_state['errors'] = []
 
             # 이벤트 트리거
             self._trigger_event(PluginLifecycleEvent.ACTIVATED, plugin_name, {
-                'metadata': self.plugin_metadata.get() if plugin_metadata else Noneplugin_name, {}) if plugin_metadata else None
+                'metadata': self.plugin_metadata.get(plugin_name, {})
             })
 
             logger.info(f"플러그인 활성화 완료: {plugin_name}")
@@ -212,7 +213,7 @@ class PluginLifecycleManager:
             return {
                 'success': True,
                 'plugin_name': plugin_name,
-                'state': PluginState.ACTIVATED.value if ACTIVATED is not None else None
+                'state': PluginState.ACTIVATED.value
             }
 
         except Exception as e:
@@ -222,15 +223,15 @@ class PluginLifecycleManager:
                 'error': str(e)
             }
 
-    def deactivate_plugin(self, plugin_name: str) -> Dict[str, Any] if Dict is not None else None:
+    def deactivate_plugin(self, plugin_name: str) -> Dict[str, Any]:
         """플러그인 비활성화"""
         try:
             if plugin_name not in self.plugin_states:
                 raise ValueError(f"플러그인 {plugin_name}이 설치되지 않았습니다")
 
-            plugin_state = self.plugin_states[plugin_name] if plugin_states is not None else None
+            plugin_state = self.plugin_states[plugin_name]
 
-            if plugin_state['state'] if plugin_state is not None else None != PluginState.ACTIVATED.value if ACTIVATED is not None else None:
+            if plugin_state['state'] != PluginState.ACTIVATED.value:
                 return {'success': True, 'message': '이미 비활성화된 플러그인입니다'}
 
             # 의존성 체크 (다른 플러그인이 이 플러그인에 의존하는지)
@@ -239,12 +240,12 @@ class PluginLifecycleManager:
                 raise ValueError(f"다음 플러그인들이 {plugin_name}에 의존하고 있습니다: {dependent_plugins}")
 
             # 플러그인 비활성화
-            plugin_state['state'] if plugin_state is not None else None = PluginState.DEACTIVATED.value if DEACTIVATED is not None else None
-            plugin_state['deactivated_at'] if plugin_state is not None else None = datetime.now().isoformat()
+            plugin_state['state'] = PluginState.DEACTIVATED.value
+            plugin_state['deactivated_at'] = datetime.now().isoformat()
 
             # 이벤트 트리거
             self._trigger_event(PluginLifecycleEvent.DEACTIVATED, plugin_name, {
-                'metadata': self.plugin_metadata.get() if plugin_metadata else Noneplugin_name, {}) if plugin_metadata else None
+                'metadata': self.plugin_metadata.get(plugin_name, {})
             })
 
             logger.info(f"플러그인 비활성화 완료: {plugin_name}")
@@ -252,7 +253,7 @@ class PluginLifecycleManager:
             return {
                 'success': True,
                 'plugin_name': plugin_name,
-                'state': PluginState.DEACTIVATED.value if DEACTIVATED is not None else None
+                'state': PluginState.DEACTIVATED.value
             }
 
         except Exception as e:
@@ -262,7 +263,7 @@ class PluginLifecycleManager:
                 'error': str(e)
             }
 
-    def update_plugin(self, plugin_name: str, update_source: str) -> Dict[str, Any] if Dict is not None else None:
+    def update_plugin(self, plugin_name: str, update_source: str) -> Dict[str, Any]:
         """플러그인 업데이트"""
         try:
             if plugin_name not in self.plugin_states:
@@ -278,9 +279,9 @@ class PluginLifecycleManager:
 
             self.update_queue.append(update_info)
 
-            # 업데이트 스레드 시작
+            # 업데이트 작업 시작
             if not self.update_running:
-                self._start_update_thread()
+                self._start_update_job()
 
             return {
                 'success': True,
@@ -295,16 +296,16 @@ class PluginLifecycleManager:
                 'error': str(e)
             }
 
-    def remove_plugin(self, plugin_name: str, force: bool = False) -> Dict[str, Any] if Dict is not None else None:
+    def remove_plugin(self, plugin_name: str, force: bool = False) -> Dict[str, Any]:
         """플러그인 제거"""
         try:
             if plugin_name not in self.plugin_states:
                 raise ValueError(f"플러그인 {plugin_name}이 설치되지 않았습니다")
 
-            plugin_state = self.plugin_states[plugin_name] if plugin_states is not None else None
+            plugin_state = self.plugin_states[plugin_name]
 
             # 활성화된 플러그인 체크
-            if plugin_state['state'] if plugin_state is not None else None == PluginState.ACTIVATED.value if ACTIVATED is not None else None and not force:
+            if plugin_state['state'] == PluginState.ACTIVATED.value and not force:
                 raise ValueError(f"활성화된 플러그인 {plugin_name}을 제거하려면 force=True를 사용하세요")
 
             # 의존성 체크
@@ -318,13 +319,13 @@ class PluginLifecycleManager:
                 shutil.rmtree(plugin_path)
 
             # 상태 정보 제거
-            del self.plugin_states[plugin_name] if plugin_states is not None else None
+            del self.plugin_states[plugin_name]
             if plugin_name in self.plugin_metadata:
-                del self.plugin_metadata[plugin_name] if plugin_metadata is not None else None
+                del self.plugin_metadata[plugin_name]
 
             # 의존성 그래프에서 제거
             if plugin_name in self.dependency_graph:
-                del self.dependency_graph[plugin_name] if dependency_graph is not None else None
+                del self.dependency_graph[plugin_name]
 
             # 이벤트 트리거
             self._trigger_event(PluginLifecycleEvent.REMOVED, plugin_name, {
@@ -346,23 +347,22 @@ class PluginLifecycleManager:
                 'error': str(e)
             }
 
-    def _start_update_thread(self):
-        """업데이트 스레드 시작"""
+    def _start_update_job(self):
+        """업데이트 작업 시작 (큐가 빌 때까지 작업 스케줄러에서 실행, 오류 시 5초 뒤 재시도)"""
         self.update_running = True
-        self.update_thread = threading.Thread(target=self._update_worker, daemon=True)
-        self.update_thread.start()
+        job_scheduler.add_job(UPDATE_JOB, self._update_worker, interval=5, initial_delay=0)
 
     def _update_worker(self):
-        """업데이트 워커 스레드"""
+        """업데이트 큐 처리"""
         while self.update_running and self.update_queue:
             try:
                 update_info = self.update_queue.pop(0)
-                plugin_name = update_info['plugin_name'] if update_info is not None else None
-                update_source = update_info['update_source'] if update_info is not None else None
+                plugin_name = update_info['plugin_name']
+                update_source = update_info['update_source']
 
                 # 플러그인 상태를 업데이트 중으로 변경
                 if plugin_name in self.plugin_states:
-                    self.plugin_states[plugin_name] if plugin_states is not None else None['state'] = PluginState.UPDATING.value if UPDATING is not None else None
+                    self.plugin_states[plugin_name]['state'] = PluginState.UPDATING.value
 
                 # 백업 생성
                 backup_result = self._create_plugin_backup(plugin_name)
@@ -371,39 +371,39 @@ class PluginLifecycleManager:
                     # 플러그인 업데이트
                     update_result = self._perform_plugin_update(plugin_name,  update_source)
 
-                    if update_result['success'] if update_result is not None else None:
+                    if update_result['success']:
                         # 업데이트 성공
                         if plugin_name in self.plugin_states:
-                            self.plugin_states[plugin_name] if plugin_states is not None else None['state'] = PluginState.INSTALLED.value if INSTALLED is not None else None
-                            self.plugin_states[plugin_name] if plugin_states is not None else None['last_updated'] = datetime.now().isoformat()
+                            self.plugin_states[plugin_name]['state'] = PluginState.INSTALLED.value
+                            self.plugin_states[plugin_name]['last_updated'] = datetime.now().isoformat()
 
                         self._trigger_event(PluginLifecycleEvent.UPDATED, plugin_name, {
-                            'backup_path': backup_result.get() if backup_result else None'backup_path') if backup_result else None,
-                            'new_version': update_result.get() if update_result else None'new_version') if update_result else None
+                            'backup_path': backup_result.get('backup_path'),
+                            'new_version': update_result.get('new_version')
                         })
 
                         logger.info(f"플러그인 업데이트 완료: {plugin_name}")
                     else:
                         # 업데이트 실패 시 백업에서 복구
-                        self._restore_plugin_backup(plugin_name,  backup_result.get() if backup_result else None'backup_path') if backup_result else None)
+                        self._restore_plugin_backup(plugin_name,  backup_result.get('backup_path'))
                         if plugin_name in self.plugin_states:
-                            self.plugin_states[plugin_name] if plugin_states is not None else None['state'] = PluginState.ERROR.value if ERROR is not None else None
-                            self.plugin_states[plugin_name] if plugin_states is not None else None['errors'].append(
-                                update_result.get() if update_result else None'error') if update_result else None)
+                            self.plugin_states[plugin_name]['state'] = PluginState.ERROR.value
+                            self.plugin_states[plugin_name]['errors'].append(
+                                update_result.get('error'))
 
                         self._trigger_event(PluginLifecycleEvent.ERROR, plugin_name, {
-                            'error': update_result.get() if update_result else None'error') if update_result else None,
+                            'error': update_result.get('error'),
                             'backup_restored': True
                         })
 
-                        logger.error(f"플러그인 업데이트 실패: {plugin_name} - {update_result.get() if update_result else None'error') if update_result else None}")
+                        logger.error(f"플러그인 업데이트 실패: {plugin_name} - {update_result.get('error')}")
 
                 except Exception as e:
                     # 예외 발생 시 백업에서 복구
-                    self._restore_plugin_backup(plugin_name,  backup_result.get() if backup_result else None'backup_path') if backup_result else None)
+                    self._restore_plugin_backup(plugin_name,  backup_result.get('backup_path'))
                     if plugin_name in self.plugin_states:
-                        self.plugin_states[plugin_name] if plugin_states is not None else None['state'] = PluginState.ERROR.value if ERROR is not None else None
-                        self.plugin_states[plugin_name] if plugin_states is not None else None['errors'].append(str(e))
+                        self.plugin_states[plugin_name]['state'] = PluginState.ERROR.value
+                        self.plugin_states[plugin_name]['errors'].append(str(e))
 
                     self._trigger_event(PluginLifecycleEvent.ERROR, plugin_name, {
                         'error': str(e),
@@ -414,11 +414,13 @@ class PluginLifecycleManager:
 
             except Exception as e:
                 logger.error(f"업데이트 워커 오류: {e}")
-                time.sleep(5)
+                return  # 다음 회차에 재시도
 
-        self.update_running = False
+        if not self.update_queue:
+            self.update_running = False
+            job_scheduler.remove_job(UPDATE_JOB)
 
-    def _create_plugin_backup(self,  plugin_name: str) -> Dict[str, Any] if Dict is not None else None:
+    def _create_plugin_backup(self,  plugin_name: str) -> Dict[str, Any]:
         """플러그인 백업 생성"""
         try:
             plugin_path = self.plugins_dir / plugin_name
@@ -444,7 +446,7 @@ class PluginLifecycleManager:
                 'error': str(e)
             }
 
-    def _restore_plugin_backup(self,  plugin_name: str,  backup_path: Optional[str] if Optional is not None else None):
+    def _restore_plugin_backup(self,  plugin_name: str,  backup_path: Optional[str]):
         """플러그인 백업에서 복구"""
         try:
             if not backup_path:
@@ -461,7 +463,7 @@ class PluginLifecycleManager:
         except Exception as e:
             logger.error(f"플러그인 백업 복구 실패: {e}")
 
-    def _perform_plugin_update(self,  plugin_name: str,  update_source: str) -> Dict[str, Any] if Dict is not None else None:
+    def _perform_plugin_update(self,  plugin_name: str,  update_source: str) -> Dict[str, Any]:
         """플러그인 업데이트 수행"""
         try:
             plugin_path = self.plugins_dir / plugin_name
@@ -500,7 +502,7 @@ class PluginLifecycleManager:
 
                 return {
                     'success': True,
-                    'new_version': new_metadata.get() if new_metadata else None'version') if new_metadata else None,
+                    'new_version': new_metadata.get('version'),
                     'metadata': new_metadata
                 }
 
@@ -518,12 +520,12 @@ class PluginLifecycleManager:
                 'error': str(e)
             }
 
-    def _validate_plugin_source(self,  source_path: Path) -> Dict[str, Any] if Dict is not None else None:
+    def _validate_plugin_source(self,  source_path: Path) -> Dict[str, Any]:
         """플러그인 소스 검증"""
         errors = []
 
         # 필수 파일 체크
-        for required_file in self.validation_rules['required_files'] if validation_rules is not None else None:
+        for required_file in self.validation_rules['required_files']:
             if not (source_path / required_file).exists():
                 errors.append(f"필수 파일이 없습니다: {required_file}")
 
@@ -534,7 +536,7 @@ class PluginLifecycleManager:
                 with open(config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
 
-                for field in self.validation_rules['required_config_fields'] if validation_rules is not None else None:
+                for field in self.validation_rules['required_config_fields']:
                     if field not in config:
                         errors.append(f"필수 설정 필드가 없습니다: {field}")
 
@@ -543,7 +545,7 @@ class PluginLifecycleManager:
 
         # 크기 체크
         total_size = sum(f.stat().st_size for f in source_path.rglob('*') if f.is_file())
-        if total_size > self.validation_rules['max_plugin_size'] if validation_rules is not None else None:
+        if total_size > self.validation_rules['max_plugin_size']:
             errors.append(f"플러그인 크기가 너무 큽니다: {total_size} bytes")
 
         return {
@@ -551,12 +553,12 @@ class PluginLifecycleManager:
             'errors': errors
         }
 
-    def _validate_installed_plugin(self,  plugin_name: str) -> Dict[str, Any] if Dict is not None else None:
+    def _validate_installed_plugin(self,  plugin_name: str) -> Dict[str, Any]:
         """설치된 플러그인 검증"""
         plugin_path = self.plugins_dir / plugin_name
         return self._validate_plugin_source(plugin_path)
 
-    def _load_plugin_metadata(self, plugin_path: Path) -> Dict[str, Any] if Dict is not None else None:
+    def _load_plugin_metadata(self, plugin_path: Path) -> Dict[str, Any]:
         """플러그인 메타데이터 로드"""
         config_file = plugin_path / 'config' / 'plugin.json'
         if config_file.exists():
@@ -568,33 +570,33 @@ class PluginLifecycleManager:
 
         return {}
 
-    def _update_dependency_graph(self,  plugin_name: str,  dependencies: List[str] if List is not None else None):
+    def _update_dependency_graph(self,  plugin_name: str,  dependencies: List[str]):
         """의존성 그래프 업데이트"""
-        self.dependency_graph[plugin_name] if dependency_graph is not None else None = dependencies
+        self.dependency_graph[plugin_name] = dependencies
 
-    def _get_dependent_plugins(self, plugin_name: str) -> List[str] if List is not None else None:
+    def _get_dependent_plugins(self, plugin_name: str) -> List[str]:
         """의존하는 플러그인 목록 조회"""
         dependent_plugins = []
 
-        for plugin, deps in self.dependency_graph.items() if dependency_graph is not None else []:
+        for plugin, deps in self.dependency_graph.items():
             if plugin_name in deps:
                 dependent_plugins.append(plugin)
 
         return dependent_plugins
 
-    def get_plugin_status(self, plugin_name: str) -> Dict[str, Any] if Dict is not None else None:
+    def get_plugin_status(self, plugin_name: str) -> Dict[str, Any]:
         """플러그인 상태 조회"""
         if plugin_name not in self.plugin_states:
             return {'error': '플러그인이 설치되지 않았습니다'}
 
         return {
             'plugin_name': plugin_name,
-            'state': self.plugin_states[plugin_name] if plugin_states is not None else None,
-            'metadata': self.plugin_metadata.get() if plugin_metadata else Noneplugin_name, {}) if plugin_metadata else None,
-            'dependencies': self.dependency_graph.get() if dependency_graph else Noneplugin_name, []) if dependency_graph else None
+            'state': self.plugin_states[plugin_name],
+            'metadata': self.plugin_metadata.get(plugin_name, {}),
+            'dependencies': self.dependency_graph.get(plugin_name, [])
         }
 
-    def get_all_plugins_status(self) -> Dict[str, Any] if Dict is not None else None:
+    def get_all_plugins_status(self) -> Dict[str, Any]:
         """모든 플러그인 상태 조회"""
         return {
             'plugins': {
@@ -9,6 +9,9 @@ from flask import jsonify
 from flask import Blueprint
 from flask import request
 
+from core.backend.catalog_index import get_catalog_index
+from core.backend.document_store import get_document_store
+
 config = None  # pyright: ignore
 form = None  # pyright: ignore
 
@@ -53,7 +56,7 @@ class PluginReview:
 
 
 class PluginMarketplace:
-    """플러그인 마켓플레이스 관리"""
+    """플러그인 마켓플레이스 관리 (데이터는 DocumentStore 컬렉션에 저장)"""
 
     def __init__(self, marketplace_dir="marketplace"):
         self.marketplace_dir = Path(marketplace_dir)
@@ -64,6 +67,13 @@ class PluginMarketplace:
         self.reviews_file = self.marketplace_dir / "reviews.json"
         self.categories_file = self.marketplace_dir / "categories.json"
 
+        store = get_document_store(self.marketplace_dir)
+        self.plugins = store.collection("plugins.json", indexes=("category", "status"))
+        self.reviews = store.collection("reviews.json", indexes=("plugin_id",))
+        self.categories = store.collection("categories.json")
+        # 목록 조회용 카탈로그 인덱스 (검색 역색인 + 정렬 필드별로 미리 정렬한 목록)
+        self.catalog = get_catalog_index(self.plugins, bucket_fields=("category", "status"))
+
         # 초기화
         self._init_marketplace()
 
@@ -86,33 +96,22 @@ class PluginMarketplace:
                 },
                 {"id": "general", "name": "일반", "description": "모든 업종 공통"},
             ]
-            with open(self.categories_file, "w", encoding="utf-8") as f:
-                json.dump(categories, f, indent=2, ensure_ascii=False)
+            self.categories.seed(categories)
 
-        # 플러그인 목록 초기화
-        if not self.plugins_file.exists():
-            with open(self.plugins_file, "w", encoding="utf-8") as f:
-                json.dump([], f, indent=2, ensure_ascii=False)
-
-        # 리뷰 목록 초기화
-        if not self.reviews_file.exists():
-            with open(self.reviews_file, "w", encoding="utf-8") as f:
-                json.dump([], f, indent=2, ensure_ascii=False)
+        # 플러그인 / 리뷰 목록 초기화
+        self.plugins.seed([])
+        self.reviews.seed([])
 
     def add_plugin_to_marketplace(self, plugin_data: Dict[str, Any]) -> bool:
         """마켓플레이스에 플러그인 추가"""
         try:
-            plugins = self._load_plugins()
 
-            # 중복 검사
-            existing_plugin = next(
-                (p for p in plugins if p["id"] == plugin_data["id"]), None
-            )
-            if existing_plugin:
-                # 기존 플러그인 업데이트
-                existing_plugin.update(plugin_data)
-                existing_plugin["updated_at"] = datetime.now().isoformat()
-            else:
+            def merge(existing_plugin):
+                if existing_plugin:
+                    # 기존 플러그인 업데이트
+                    existing_plugin.update(plugin_data)
+                    existing_plugin["updated_at"] = datetime.now().isoformat()
+                    return existing_plugin
                 # 새 플러그인 추가
                 plugin_data["created_at"] = datetime.now().isoformat()
                 plugin_data["updated_at"] = datetime.now().isoformat()
@@ -120,9 +119,9 @@ class PluginMarketplace:
                 plugin_data.setdefault("downloads", 0)
                 plugin_data.setdefault("reviews", [])
                 plugin_data.setdefault("status", "active")
-                plugins.append(plugin_data)
+                return plugin_data
 
-            self._save_plugins(plugins)
+            self.plugins.mutate(plugin_data["id"], merge, default=None)
             return True
 
         except Exception as e:
@@ -132,9 +131,7 @@ class PluginMarketplace:
     def remove_plugin_from_marketplace(self, plugin_id: str) -> bool:
         """마켓플레이스에서 플러그인 제거"""
         try:
-            plugins = self._load_plugins()
-            plugins = [p for p in plugins if p["id"] != plugin_id]
-            self._save_plugins(plugins)
+            self.plugins.delete(plugin_id)
             return True
 
         except Exception as e:
@@ -150,38 +147,40 @@ class PluginMarketplace:
     ) -> List[Dict[str, Any]]:
         """마켓플레이스 플러그인 목록 조회"""
         try:
-            plugins = self._load_plugins()
-            if category:
-                plugins = [p for p in plugins if p.get("category") == category]
-            if search:
-                search_lower = search.lower()
-                plugins = [
-                    p
-                    for p in plugins
-                    if search_lower in p.get("name", "").lower()
-                    or search_lower in p.get("description", "").lower()
-                    or any(search_lower in tag.lower() for tag in p.get("tags", []))
-                ]
-            reverse = sort_order == "desc"
-            if sort_by == "rating":
-                plugins.sort(key=lambda x: x.get("rating", 0), reverse=reverse)
-            elif sort_by == "downloads":
-                plugins.sort(key=lambda x: x.get("downloads", 0), reverse=reverse)
-            elif sort_by == "created_at":
-                plugins.sort(key=lambda x: x.get("created_at", ""), reverse=reverse)
-            elif sort_by == "price":
-                plugins.sort(key=lambda x: x.get("price", 0), reverse=reverse)
-            return plugins
+            return self.get_marketplace_plugins_page(
+                category=category, search=search, sort_by=sort_by, sort_order=sort_order
+            )["plugins"]
         except Exception as e:
             print(f"마켓플레이스 플러그인 목록 조회 실패: {e}")
             return []
 
+    def get_marketplace_plugins_page(
+        self,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        sort_by: str = "rating",
+        sort_order: str = "desc",
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        마켓플레이스 플러그인 한 페이지 조회 (잘못된 커서는 ValueError)
+        반환: {"plugins": [...], "next_cursor": 다음 페이지 커서 또는 None, "total": 전체 일치 수}
+        """
+        items, next_cursor, total = self.catalog.search(
+            {"category": category}, search,
+            sort_by=sort_by, sort_order=sort_order, cursor=cursor, limit=limit,
+        )
+        return {
+            "plugins": [plugin for _, plugin in items],
+            "next_cursor": next_cursor,
+            "total": total,
+        }
+
     def get_plugin_details(self, plugin_id: str) -> Optional[Dict[str, Any]]:
         """플러그인 상세 정보 조회"""
         try:
-            plugins = self._load_plugins()
-            plugin = next((p for p in plugins if p.get("id") == plugin_id), None)
-            return plugin
+            return self.plugins.get(plugin_id)
         except Exception as e:
             print(f"플러그인 상세 정보 조회 실패: {e}")
             return None
@@ -285,8 +284,6 @@ register_blueprint(bp)
     ) -> bool:
         """플러그인 리뷰 추가"""
         try:
-            reviews = self._load_reviews()
-
             review = {
                 "id": f"review_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{user_id}",
                 "plugin_id": plugin_id,
@@ -298,8 +295,7 @@ register_blueprint(bp)
                 "helpful_count": 0,
             }
 
-            reviews.append(review)
-            self._save_reviews(reviews)
+            self.reviews.put(review)
 
             # 플러그인 평점 업데이트
             self._update_plugin_rating(plugin_id)
@@ -315,9 +311,7 @@ register_blueprint(bp)
     ) -> List[Dict[str, Any]]:
         """플러그인 리뷰 목록 조회"""
         try:
-            reviews = self._load_reviews()
-            plugin_reviews = [r for r in reviews if r.get("plugin_id") == plugin_id]
-            return plugin_reviews[-limit:]
+            return self.reviews.find(plugin_id=plugin_id)[-limit:]
 
         except Exception as e:
             print(f"플러그인 리뷰 조회 실패: {e}")
@@ -326,62 +320,27 @@ register_blueprint(bp)
     def get_categories(self) -> List[Dict[str, Any]]:
         """카테고리 목록 조회"""
         try:
-            with open(self.categories_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return self.categories.all()
         except Exception:
             return []
 
-    def _load_plugins(self) -> List[Dict[str, Any]]:
-        """플러그인 목록 로드"""
-        try:
-            with open(self.plugins_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return []
-
-    def _save_plugins(self, plugins: List[Dict[str, Any]]):
-        """플러그인 목록 저장"""
-        with open(self.plugins_file, "w", encoding="utf-8") as f:
-            json.dump(plugins, f, indent=2, ensure_ascii=False)
-
-    def _load_reviews(self) -> List[Dict[str, Any]]:
-        """리뷰 목록 로드"""
-        try:
-            with open(self.reviews_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return []
-
-    def _save_reviews(self, reviews: List[Dict[str, Any]]):
-        """리뷰 목록 저장"""
-        with open(self.reviews_file, "w", encoding="utf-8") as f:
-            json.dump(reviews, f, indent=2, ensure_ascii=False)
-
     def _increment_downloads(self, plugin_id: str):
         """다운로드 수 증가"""
-        plugins = self._load_plugins()
-        for plugin in plugins:
-            if plugin["id"] == plugin_id:
-                plugin["downloads"] = plugin.get("downloads", 0) + 1
-                break
-        self._save_plugins(plugins)
+
+        def increment(plugin):
+            plugin["downloads"] = plugin.get("downloads", 0) + 1
+            return plugin
+
+        self.plugins.mutate(plugin_id, increment)
 
     def _update_plugin_rating(self, plugin_id: str):
         """플러그인 평점 업데이트"""
-        plugins = self._load_plugins()
-        reviews = self._load_reviews()
-
-        plugin_reviews = [r for r in reviews if r.get("plugin_id") == plugin_id]
+        plugin_reviews = self.reviews.find(plugin_id=plugin_id)
         if plugin_reviews:
             avg_rating = sum(r["rating"] for r in plugin_reviews) / len(plugin_reviews)
-
-            for plugin in plugins:
-                if plugin["id"] == plugin_id:
-                    plugin["rating"] = round(avg_rating, 1)
-                    plugin["reviews"] = [r for r in plugin_reviews]
-                    break
-
-        self._save_plugins(plugins)
+            self.plugins.update(
+                plugin_id, {"rating": round(avg_rating, 1), "reviews": plugin_reviews}
+            )
 
 
 # 플러그인 마켓플레이스 더미 구현
@@ -2,7 +2,6 @@ from urllib.parse import urljoin  # pyright: ignore
 import requests
 import psutil
 from concurrent.futures import ThreadPoolExecutor  # pyright: ignore
-import threading
 import yaml
 from dataclasses import dataclass, asdict
 import aiofiles
@@ -22,6 +21,8 @@ import json
 import asyncio
 from typing import Optional
 from flask import request
+
+from core.backend.job_scheduler import job_scheduler
 config = None  # pyright: ignore
 form = None  # pyright: ignore
 environ = None  # pyright: ignore
@@ -307,19 +308,15 @@ class PluginMicroserviceManager:
 
     def _start_health_monitoring(self):
         """헬스 체크 모니터링 시작"""
-        def health_monitor():
-            while True:
-                try:
-                    asyncio.run(self._check_all_services_health())
-                    time.sleep(self.health_check_interval)
-                except Exception as e:
-                    logger.error(f"헬스 체크 모니터링 오류: {e}")
-                    time.sleep(10)
-
-        monitor_thread = threading.Thread(target=health_monitor, daemon=True)
-        monitor_thread.start()
+        # 서비스 상태는 프로세스별로 갖고 있으므로 singleton 아님
+        job_scheduler.add_job("plugin_microservice.health", self._health_tick,
+                              interval=self.health_check_interval)
         logger.info("헬스 체크 모니터링 시작")
 
+    def _health_tick(self):
+        """모든 서비스 헬스 체크 (작업 스케줄러가 health_check_interval마다 실행)"""
+        asyncio.run(self._check_all_services_health())
+
     async def _check_all_services_health(self):
         """모든 서비스 헬스 체크"""
         for service_id, service in self.services.items():
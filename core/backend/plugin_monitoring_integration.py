@@ -4,11 +4,11 @@ from collections import defaultdict, deque
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-import time
 import threading
 import logging
 from typing import Optional
 from flask import request
+from core.backend.job_scheduler import job_scheduler
 args = None  # pyright: ignore
 config = None  # pyright: ignore
 form = None  # pyright: ignore
@@ -37,6 +37,9 @@ class PluginPerformanceData:
     timestamp: datetime
 
 
+INTEGRATION_JOB = "plugin_monitoring_integration.monitor"
+
+
 class PluginMonitoringIntegration:
     """플러그인 모니터링과 실시간 알림 통합 시스템"""
 
@@ -44,7 +47,6 @@ class PluginMonitoringIntegration:
         self.alert_system = EnhancedRealtimeAlertSystem()
         self.plugin_monitor = PluginMonitor()
         self.integration_active = False
-        self.integration_thread: Optional[threading.Thread] if Optional is not None else None = None
 
         # 플러그인 성능 데이터 캐시
         self.plugin_performance_cache: Dict[str, PluginPerformanceData] if Dict is not None else None = {}
@@ -89,9 +91,9 @@ class PluginMonitoringIntegration:
         self.alert_system.start_monitoring()
         self.plugin_monitor.start_monitoring()
 
-        # 통합 모니터링 스레드 시작
-        self.integration_thread = threading.Thread(target=self._integration_loop, daemon=True)
-        self.integration_thread.start()
+        # 통합 모니터링 작업 등록
+        job_scheduler.add_job(INTEGRATION_JOB, self._integration_tick,
+                              interval=self.integration_config['monitoring_interval'])
 
         logger.info("플러그인 모니터링과 실시간 알림 통합 시스템 시작")
 
@@ -103,8 +105,7 @@ class PluginMonitoringIntegration:
         self.alert_system.stop_monitoring()
         self.plugin_monitor.stop_monitoring()
 
-        if self.integration_thread:
-            self.integration_thread.join(timeout=5)
+        job_scheduler.remove_job(INTEGRATION_JOB)
 
         logger.info("플러그인 모니터링과 실시간 알림 통합 시스템 중지")
 
@@ -425,24 +426,16 @@ class PluginMonitoringIntegration:
         except Exception as e:
             logger.error(f"알림 자동 해결 실패: {e}")
 
-    def _integration_loop(self):
-        """통합 모니터링 루프"""
-        while self.integration_active:
-            try:
-                # 플러그인 상태 체크
-                self._check_plugin_health()
-
-                # 오래된 데이터 정리
-                self._cleanup_old_data()
-
-                # 통합 상태 로깅
-                self._log_integration_status()
+    def _integration_tick(self):
+        """통합 모니터링 (작업 스케줄러가 monitoring_interval마다 실행)"""
+        # 플러그인 상태 체크
+        self._check_plugin_health()
 
-                time.sleep(self.integration_config['monitoring_interval'] if self.integration_config is not None else None)
+        # 오래된 데이터 정리
+        self._cleanup_old_data()
 
-            except Exception as e:
-                logger.error(f"통합 모니터링 루프 오류: {e}")
-                time.sleep(60)  # 오류 시 1분 대기
+        # 통합 상태 로깅
+        self._log_integration_status()
 
     def _check_plugin_health(self):
         """플러그인 상태 체크"""
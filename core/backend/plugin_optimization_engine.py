@@ -1,12 +1,13 @@
 import math
 import random
 import time
-import threading
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import logging
 from typing import Optional
+
+from core.backend.job_scheduler import job_scheduler
 config = None  # pyright: ignore
 form = None  # pyright: ignore
 """
@@ -17,6 +18,8 @@ form = None  # pyright: ignore
 
 logger = logging.getLogger(__name__)
 
+OPTIMIZATION_JOB = "plugin_optimization_engine.analyze"
+
 
 @dataclass
 class OptimizationSuggestion:
@@ -45,7 +48,6 @@ class PluginOptimizationEngine:
         self.suggestions: List[OptimizationSuggestion] = []
         self.history: List[OptimizationHistory] = []
         self.running = False
-        self.thread = None
         self.analysis_interval = 60  # 1분마다 분석
         self.tuning_config = {
             'cpu_threshold': 80.0,  # %
@@ -58,25 +60,16 @@ class PluginOptimizationEngine:
         if self.running:
             return
         self.running = True
-        self.thread = threading.Thread(target=self._run, daemon=True)
-        self.thread.start()
+        # 프로세스별 모니터링 요약으로 제안을 만들므로 singleton 아님
+        job_scheduler.add_job(OPTIMIZATION_JOB, self.analyze_all_plugins,
+                              interval=self.analysis_interval, initial_delay=0)
         logger.info("플러그인 성능 최적화 엔진 시작")
 
     def stop(self):
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=5)
+        job_scheduler.remove_job(OPTIMIZATION_JOB)
         logger.info("플러그인 성능 최적화 엔진 중지")
 
-    def _run(self):
-        while self.running:
-            try:
-                self.analyze_all_plugins()
-                time.sleep(self.analysis_interval)
-            except Exception as e:
-                logger.error(f"최적화 엔진 루프 오류: {e}")
-                time.sleep(10)
-
     def analyze_all_plugins(self):
         """모든 플러그인 성능 분석 및 최적화 제안 생성"""
         try:
@@ -4,11 +4,12 @@ from collections import defaultdict, deque
 from functools import wraps
 from typing import Dict, Any, Optional
 from datetime import datetime
-import threading
 import time
 import logging
 from typing import Optional
 from flask import request
+
+from core.backend.job_scheduler import job_scheduler
 args = None  # pyright: ignore
 form = None  # pyright: ignore
 #!/usr/bin/env python3
@@ -22,6 +23,8 @@ form = None  # pyright: ignore
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+OPTIMIZATION_JOB = "plugin_optimizer.optimize"
+
 
 class PluginPerformanceOptimizer:
     """플러그인 성능 최적화 시스템"""
@@ -44,8 +47,7 @@ class PluginPerformanceOptimizer:
             'cpu_usage': []
         }
 
-        # 백그라운드 최적화 스레드
-        self.optimization_thread = None
+        # 백그라운드 최적화 (공용 작업 스케줄러에 등록)
         self.running = False
 
     def start_optimization(self):
@@ -54,40 +56,30 @@ class PluginPerformanceOptimizer:
             return
 
         self.running = True
-        self.optimization_thread = threading.Thread(target=self._optimization_loop, daemon=True)
-        self.optimization_thread.start()
+        job_scheduler.add_job(OPTIMIZATION_JOB, self._optimization_tick, interval=60)
         logger.info("플러그인 성능 최적화 시스템 시작")
 
     def stop_optimization(self):
         """성능 최적화 중지"""
         self.running = False
-        if self.optimization_thread:
-            self.optimization_thread.join(timeout=5)
+        job_scheduler.remove_job(OPTIMIZATION_JOB)
         logger.info("플러그인 성능 최적화 시스템 중지")
 
-    def _optimization_loop(self):
-        """백그라운드 최적화 루프"""
-        while self.running:
-            try:
-                # 메모리 사용량 체크 및 최적화
-                if self.optimization_settings['enable_memory_optimization']:
-                    self._optimize_memory_usage()
-
-                # 캐시 정리
-                self._cleanup_expired_cache()
-
-                # 성능 메트릭 수집
-                self._collect_performance_metrics()
+    def _optimization_tick(self):
+        """백그라운드 최적화 1회 (작업 스케줄러가 1분마다 실행)"""
+        # 메모리 사용량 체크 및 최적화
+        if self.optimization_settings['enable_memory_optimization']:
+            self._optimize_memory_usage()
 
-                # GC 실행
-                if self._should_run_gc():
-                    gc.collect()
+        # 캐시 정리
+        self._cleanup_expired_cache()
 
-                time.sleep(60)  # 1분마다 실행
+        # 성능 메트릭 수집
+        self._collect_performance_metrics()
 
-            except Exception as e:
-                logger.error(f"성능 최적화 루프 오류: {e}")
-                time.sleep(60)
+        # GC 실행
+        if self._should_run_gc():
+            gc.collect()
 
     def _optimize_memory_usage(self):
         """메모리 사용량 최적화"""
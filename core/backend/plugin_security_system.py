@@ -8,6 +8,11 @@ import uuid
 import secrets
 import hashlib
 import json
+import atexit
+import threading
+import time
+
+from core.backend.sidecar_db import get_sidecar_db
 from typing import Optional
 from flask import request
 query = None  # pyright: ignore
@@ -91,10 +96,26 @@ class VulnerabilityReport:
     status: str  # open, fixed, ignored
 
 
+# 감사 로그 보관 기간 / 보관 기간 정리 주기
+AUDIT_RETENTION_DAYS = 30
+AUDIT_PRUNE_INTERVAL = 3600
+# 검증된 API 키를 메모리에 두는 시간 (다른 프로세스에서 폐기한 키가 반영되는 최대 지연)
+API_KEY_CACHE_TTL = 60
+# get_api_keys가 돌려주는 컬럼 (key_hash 제외)
+API_KEY_PUBLIC_COLUMNS = ('key_id', 'plugin_id', 'name', 'permissions', 'expires_at',
+                          'last_used', 'created_at', 'is_active')
+
+
 class PluginSecuritySystem:
-    """플러그인 보안/인증/권한 관리 시스템"""
+    """플러그인 보안/인증/권한 관리 시스템
+
+    API 키와 감사 로그는 security.db(SQLite, key_hash/plugin_id/timestamp 인덱스)에 저장한다.
+    키 검증은 key_hash -> 키 정보 메모리 맵에서 처리하고(폐기 시 즉시 무효화),
+    last_used 갱신과 감사 로그는 모아 두었다가 flush_interval마다 한 번에 기록한다.
+    """
 
-    def __init__(self, security_dir="plugin_security"):
+    def __init__(self, security_dir="plugin_security", flush_interval: float = 2.0,
+                 flush_batch_size: int = 500):
         self.security_dir = Path(security_dir)
         self.security_dir.mkdir(exist_ok=True)
 
@@ -104,9 +125,27 @@ class PluginSecuritySystem:
         self.audit_logs_file = self.security_dir / "audit_logs.json"
         self.vulnerabilities_file = self.security_dir / "vulnerabilities.json"
         self.secret_key_file = self.security_dir / "secret.key"
+        self.db = get_sidecar_db(self.security_dir / "security.db")
+
+        # 키 검증 캐시 (key_hash -> (키 정보, 캐시 시각))
+        self._key_cache: Dict[str, tuple] = {}
+        self._key_cache_lock = threading.Lock()
+
+        # write-behind 버퍼
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        self._pending_last_used: Dict[str, str] = {}
+        self._pending_audit: List[tuple] = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._last_prune: Optional[float] = None  # 시작 후 첫 flush에서 정리
 
         # 초기화
         self._init_security_system()
+        atexit.register(self.close)
 
     def _init_security_system(self):
         """보안 시스템 초기화"""
@@ -115,15 +154,9 @@ class PluginSecuritySystem:
             with open(self.policies_file, 'w', encoding='utf-8') as f:
                 json.dump([], f, indent=2, ensure_ascii=False)
 
-        # API 키 초기화
-        if not self.api_keys_file.exists():
-            with open(self.api_keys_file, 'w', encoding='utf-8') as f:
-                json.dump([], f, indent=2, ensure_ascii=False)
-
-        # 감사 로그 초기화
-        if not self.audit_logs_file.exists():
-            with open(self.audit_logs_file, 'w', encoding='utf-8') as f:
-                json.dump([], f, indent=2, ensure_ascii=False)
+        # API 키 / 감사 로그 테이블 초기화 (예전 JSON 파일이 있으면 한 번 옮김)
+        self._init_tables()
+        self._migrate_json_stores()
 
         # 취약점 보고서 초기화
         if not self.vulnerabilities_file.exists():
@@ -226,8 +259,6 @@ class PluginSecuritySystem:
     def generate_api_key(self, plugin_id: str, name: str, permissions: List[str], expires_in_days: Optional[int] = None) -> Optional[str]:
         """API 키 생성"""
         try:
-            api_keys = self._load_api_keys()
-
             # API 키 생성
             key_value = secrets.token_urlsafe(32)
             key_hash = hashlib.sha256(key_value.encode()).hexdigest()
@@ -248,8 +279,7 @@ class PluginSecuritySystem:
                 is_active=True
             )
 
-            api_keys.append(self._api_key_to_dict(api_key))
-            self._save_api_keys(api_keys)
+            self._insert_api_keys([self._api_key_to_dict(api_key)])
 
             return key_value
 
@@ -260,10 +290,8 @@ class PluginSecuritySystem:
     def validate_api_key(self, key_value: str, plugin_id: str, required_permission: PermissionType) -> Optional[Dict]:
         """API 키 검증"""
         try:
-            api_keys = self._load_api_keys()
             key_hash = hashlib.sha256(key_value.encode()).hexdigest()
-
-            api_key = next((k for k in api_keys if k['key_hash'] == key_hash), None)
+            api_key = self._get_api_key_by_hash(key_hash)
 
             if not api_key:
                 return None
@@ -286,9 +314,10 @@ class PluginSecuritySystem:
             if required_permission not in [PermissionType(p) for p in api_key['permissions']]:
                 return None
 
-            # 마지막 사용 시간 업데이트
-            api_key['last_used'] = datetime.now().isoformat()
-            self._save_api_keys(api_keys)
+            # 마지막 사용 시간 업데이트 (write-behind)
+            with self._pending_lock:
+                self._pending_last_used[api_key['key_id']] = datetime.now().isoformat()
+            self._schedule_flush()
 
             return {
                 'key_id': api_key['key_id'],
@@ -304,14 +333,13 @@ class PluginSecuritySystem:
     def revoke_api_key(self, key_id: str) -> bool:
         """API 키 폐기"""
         try:
-            api_keys = self._load_api_keys()
-            api_key = next((k for k in api_keys if k['key_id'] == key_id), None)
-
-            if not api_key:
+            row = self.db.query_one("SELECT key_hash FROM api_keys WHERE key_id = ?", (key_id,))
+            if not row:
                 return False
 
-            api_key['is_active'] = False
-            self._save_api_keys(api_keys)
+            self.db.execute("UPDATE api_keys SET is_active = 0 WHERE key_id = ?", (key_id,))
+            with self._key_cache_lock:
+                self._key_cache.pop(row['key_hash'], None)
 
             return True
 
@@ -322,21 +350,20 @@ class PluginSecuritySystem:
     def get_api_keys(self, plugin_id: Optional[str] = None) -> List[Dict]:
         """API 키 목록 조회"""
         try:
-            api_keys = self._load_api_keys()
+            self.flush()
+            sql = f"SELECT {', '.join(API_KEY_PUBLIC_COLUMNS)} FROM api_keys"
+            params: tuple = ()
             if plugin_id:
-                api_keys = [k for k in api_keys if k['plugin_id'] == plugin_id]
-            for key in api_keys:
-                if 'key_hash' in key:
-                    del key['key_hash']
-            return api_keys
+                sql += " WHERE plugin_id = ?"
+                params = (plugin_id,)
+            return [self._api_key_from_row(row) for row in self.db.query(sql + " ORDER BY created_at", params)]
         except Exception as e:
             print(f"API 키 목록 조회 실패: {e}")
             return []
 
     def log_security_event(self, plugin_id: str, user_id: Optional[str] = None, action: str = "", resource: str = "", ip_address: str = "", user_agent: str = "", success: bool = False, details: Optional[Dict] = None) -> bool:
-        """보안 이벤트 로깅"""
+        """보안 이벤트 로깅 (버퍼에 쌓고 일괄 기록)"""
         try:
-            audit_logs = self._load_audit_logs()
             log_entry = SecurityAuditLog(
                 log_id=str(uuid.uuid4()),
                 plugin_id=plugin_id,
@@ -349,10 +376,10 @@ class PluginSecuritySystem:
                 details=details or {},
                 timestamp=datetime.now().isoformat()
             )
-            audit_logs.append(self._audit_log_to_dict(log_entry))
-            cutoff_time = datetime.now() - timedelta(days=30)
-            audit_logs = [log for log in audit_logs if datetime.fromisoformat(log['timestamp']) > cutoff_time]
-            self._save_audit_logs(audit_logs)
+            with self._pending_lock:
+                self._pending_audit.append(self._audit_log_to_row(self._audit_log_to_dict(log_entry)))
+                pending = len(self._pending_audit)
+            self._schedule_flush(immediate=pending >= self.flush_batch_size)
             return True
         except Exception as e:
             print(f"보안 이벤트 로깅 실패: {e}")
@@ -361,19 +388,26 @@ class PluginSecuritySystem:
     def get_audit_logs(self, plugin_id: Optional[str] = None, user_id: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, limit: int = 100) -> List[Dict]:
         """감사 로그 조회"""
         try:
-            audit_logs = self._load_audit_logs()
+            self.flush()
+            conditions, params = ["timestamp > ?"], [self._retention_cutoff()]
             if plugin_id:
-                audit_logs = [log for log in audit_logs if log['plugin_id'] == plugin_id]
+                conditions.append("plugin_id = ?")
+                params.append(plugin_id)
             if user_id:
-                audit_logs = [log for log in audit_logs if log.get('user_id') == user_id]
+                conditions.append("user_id = ?")
+                params.append(user_id)
             if start_date:
-                start_dt = datetime.fromisoformat(start_date)
-                audit_logs = [log for log in audit_logs if datetime.fromisoformat(log['timestamp']) >= start_dt]
+                conditions.append("timestamp >= ?")
+                params.append(datetime.fromisoformat(start_date).isoformat())
             if end_date:
-                end_dt = datetime.fromisoformat(end_date)
-                audit_logs = [log for log in audit_logs if datetime.fromisoformat(log['timestamp']) <= end_dt]
-            audit_logs.sort(key=lambda x: x['timestamp'], reverse=True)
-            return audit_logs[:limit]
+                conditions.append("timestamp <= ?")
+                params.append(datetime.fromisoformat(end_date).isoformat())
+            rows = self.db.query(
+                f"SELECT * FROM audit_logs WHERE {' AND '.join(conditions)} "
+                "ORDER BY timestamp DESC LIMIT ?",
+                tuple(params) + (limit,),
+            )
+            return [self._audit_log_from_row(row) for row in rows]
         except Exception as e:
             print(f"감사 로그 조회 실패: {e}")
             return []
@@ -638,37 +672,177 @@ class PluginSecuritySystem:
         except Exception as e:
             print(f"보안 정책 저장 실패: {e}")
 
-    def _load_api_keys(self) -> List[Dict]:
-        """API 키 로드"""
-        try:
-            with open(self.api_keys_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return []
-
-    def _save_api_keys(self, api_keys: List[Dict]):
-        """API 키 저장"""
-        try:
-            with open(self.api_keys_file, 'w', encoding='utf-8') as f:
-                json.dump(api_keys, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"API 키 저장 실패: {e}")
-
-    def _load_audit_logs(self) -> List[Dict]:
-        """감사 로그 로드"""
-        try:
-            with open(self.audit_logs_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return []
+    # ==================== API 키 / 감사 로그 저장소 ====================
+
+    def _init_tables(self):
+        """API 키 / 감사 로그 테이블과 인덱스 생성"""
+        with self.db.write() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS api_keys (
+                    key_id TEXT PRIMARY KEY,
+                    plugin_id TEXT NOT NULL,
+                    name TEXT,
+                    key_hash TEXT NOT NULL UNIQUE,
+                    permissions TEXT NOT NULL,
+                    expires_at TEXT,
+                    last_used TEXT,
+                    created_at TEXT NOT NULL,
+                    is_active INTEGER NOT NULL DEFAULT 1
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_api_keys_plugin ON api_keys(plugin_id)")
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS audit_logs (
+                    log_id TEXT PRIMARY KEY,
+                    plugin_id TEXT NOT NULL,
+                    user_id TEXT,
+                    action TEXT,
+                    resource TEXT,
+                    ip_address TEXT,
+                    user_agent TEXT,
+                    success INTEGER NOT NULL,
+                    details TEXT,
+                    timestamp TEXT NOT NULL
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_logs_timestamp ON audit_logs(timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_logs_plugin_time ON audit_logs(plugin_id, timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_logs_user_time ON audit_logs(user_id, timestamp)")
+
+    def _migrate_json_stores(self):
+        """예전 api_keys.json / audit_logs.json 내용을 테이블로 옮기고 파일은 .migrated로 변경"""
+        for path, migrate in ((self.api_keys_file, self._insert_api_keys),
+                              (self.audit_logs_file, self._insert_audit_logs)):
+            if not path.exists():
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    records = json.load(f)
+                if records:
+                    migrate(records)
+                path.rename(path.with_name(path.name + ".migrated"))
+            except Exception as e:
+                print(f"{path.name} 이전 실패: {e}")
+
+    def _insert_api_keys(self, api_keys: List[Dict]):
+        self.db.executemany(
+            "INSERT OR IGNORE INTO api_keys (key_id, plugin_id, name, key_hash, permissions, "
+            "expires_at, last_used, created_at, is_active) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(k['key_id'], k['plugin_id'], k.get('name'), k['key_hash'],
+              json.dumps(k.get('permissions', [])), k.get('expires_at'), k.get('last_used'),
+              k.get('created_at') or datetime.now().isoformat(), 1 if k.get('is_active', True) else 0)
+             for k in api_keys],
+        )
+
+    def _insert_audit_logs(self, audit_logs: List[Dict]):
+        self.db.executemany(
+            "INSERT OR IGNORE INTO audit_logs (log_id, plugin_id, user_id, action, resource, "
+            "ip_address, user_agent, success, details, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [self._audit_log_to_row(log) for log in audit_logs],
+        )
+
+    @staticmethod
+    def _audit_log_to_row(log: Dict) -> tuple:
+        return (log['log_id'], log['plugin_id'], log.get('user_id'), log.get('action'),
+                log.get('resource'), log.get('ip_address'), log.get('user_agent'),
+                1 if log.get('success') else 0, json.dumps(log.get('details') or {}, ensure_ascii=False),
+                log['timestamp'])
+
+    @staticmethod
+    def _audit_log_from_row(row: Dict) -> Dict:
+        row['success'] = bool(row['success'])
+        row['details'] = json.loads(row['details']) if row['details'] else {}
+        return row
+
+    @staticmethod
+    def _api_key_from_row(row: Dict) -> Dict:
+        row['permissions'] = json.loads(row['permissions'])
+        row['is_active'] = bool(row['is_active'])
+        return row
+
+    def _get_api_key_by_hash(self, key_hash: str) -> Optional[Dict]:
+        """key_hash로 키 조회 (메모리 맵 우선, 없거나 오래됐으면 인덱스 조회 후 캐시)"""
+        now = time.monotonic()
+        with self._key_cache_lock:
+            cached = self._key_cache.get(key_hash)
+        if cached and now - cached[1] < API_KEY_CACHE_TTL:
+            return cached[0]
+
+        row = self.db.query_one("SELECT * FROM api_keys WHERE key_hash = ?", (key_hash,))
+        if row is None:
+            return None
+        api_key = self._api_key_from_row(row)
+        with self._key_cache_lock:
+            self._key_cache[key_hash] = (api_key, now)
+        return api_key
+
+    def _retention_cutoff(self) -> str:
+        return (datetime.now() - timedelta(days=AUDIT_RETENTION_DAYS)).isoformat()
+
+    def _schedule_flush(self, immediate: bool = False):
+        """백그라운드 기록 스레드 시작/깨우기"""
+        if self._flusher is None or not self._flusher.is_alive():
+            with self._flush_lock:
+                if self._flusher is None or not self._flusher.is_alive():
+                    self._stop.clear()
+                    self._flusher = threading.Thread(target=self._flush_loop, daemon=True,
+                                                     name="plugin-security-flush")
+                    self._flusher.start()
+        if immediate:
+            self._flush_wakeup.set()
+
+    def _flush_loop(self):
+        while not self._stop.is_set():
+            self._flush_wakeup.wait(self.flush_interval)
+            self._flush_wakeup.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """버퍼에 쌓인 last_used 갱신과 감사 로그를 한 트랜잭션으로 기록하고 기록한 건수 반환"""
+        with self._pending_lock:
+            last_used, self._pending_last_used = self._pending_last_used, {}
+            audit_rows, self._pending_audit = self._pending_audit, []
+
+        prune = self._last_prune is None or time.monotonic() - self._last_prune >= AUDIT_PRUNE_INTERVAL
+        if not last_used and not audit_rows and not prune:
+            return 0
 
-    def _save_audit_logs(self, audit_logs: List[Dict]):
-        """감사 로그 저장"""
         try:
-            with open(self.audit_logs_file, 'w', encoding='utf-8') as f:
-                json.dump(audit_logs, f, indent=2, ensure_ascii=False)
+            with self.db.write() as conn:
+                if last_used:
+                    conn.executemany("UPDATE api_keys SET last_used = ? WHERE key_id = ?",
+                                     [(used, key_id) for key_id, used in last_used.items()])
+                if audit_rows:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO audit_logs (log_id, plugin_id, user_id, action, "
+                        "resource, ip_address, user_agent, success, details, timestamp) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        audit_rows,
+                    )
+                if prune:
+                    # 보관 기간이 지난 로그는 timestamp 인덱스 범위 삭제
+                    conn.execute("DELETE FROM audit_logs WHERE timestamp <= ?",
+                                 (self._retention_cutoff(),))
+            if prune:
+                self._last_prune = time.monotonic()
+            return len(last_used) + len(audit_rows)
         except Exception as e:
-            print(f"감사 로그 저장 실패: {e}")
+            print(f"보안 데이터 기록 실패: {e}")
+            # 기록하지 못한 항목은 다음 주기에 다시 시도
+            with self._pending_lock:
+                for key_id, used in last_used.items():
+                    self._pending_last_used.setdefault(key_id, used)
+                self._pending_audit[:0] = audit_rows
+            return 0
+
+    def close(self):
+        """백그라운드 기록 중지 후 남은 버퍼 기록"""
+        self._stop.set()
+        self._flush_wakeup.set()
+        flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join(timeout=5)
+        self.flush()
 
     def _load_vulnerabilities(self) -> List[Dict]:
         """취약점 보고서 로드"""
@@ -1,8 +1,8 @@
 from typing import Any, Dict
 from datetime import datetime
-import time
-import threading
 import logging
+
+from core.backend.job_scheduler import job_scheduler
 config = None  # pyright: ignore
 form = None  # pyright: ignore
 """
@@ -96,6 +96,8 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+HEALTH_CHECK_JOB = "plugin_system.health_check"
+
 
 class PluginSystemManager:
     """플러그인 시스템 통합 매니저"""
@@ -110,7 +112,7 @@ class PluginSystemManager:
             'total_plugins': 0
         }
 
-        self.components: Dict[str, Any] if Dict is not None else None = {
+        self.components: Dict[str, Any] = {
             'registry': None,
             'api': None,
             'config': None,
@@ -121,7 +123,6 @@ class PluginSystemManager:
             'optimizer': None
         }
 
-        self.health_check_thread = None
         self.health_check_interval = 60  # 1분
 
     def initialize_system(self) -> Any:
@@ -138,116 +139,116 @@ class PluginSystemManager:
         try:
             # 1. 플러그인 레지스트리 초기화
             try:
-                self.components['registry'] if components is not None else None = plugin_registry
-                init_results['components'] if init_results is not None else None['registry'] = 'success'
+                self.components['registry'] = plugin_registry
+                init_results['components']['registry'] = 'success'
                 logger.info("플러그인 레지스트리 초기화 완료")
             except Exception as e:
-                init_results['components'] if init_results is not None else None['registry'] = 'failed'
-                init_results['errors'] if init_results is not None else None.append(f"레지스트리 초기화 실패: {e}")
+                init_results['components']['registry'] = 'failed'
+                init_results['errors'].append(f"레지스트리 초기화 실패: {e}")
                 logger.error(f"레지스트리 초기화 실패: {e}")
 
             # 2. 플러그인 설정 초기화
             try:
-                self.components['config'] if components is not None else None = plugin_config
-                init_results['components'] if init_results is not None else None['config'] = 'success'
+                self.components['config'] = plugin_config
+                init_results['components']['config'] = 'success'
                 logger.info("플러그인 설정 초기화 완료")
             except Exception as e:
-                init_results['components'] if init_results is not None else None['config'] = 'failed'
-                init_results['errors'] if init_results is not None else None.append(f"설정 초기화 실패: {e}")
+                init_results['components']['config'] = 'failed'
+                init_results['errors'].append(f"설정 초기화 실패: {e}")
                 logger.error(f"설정 초기화 실패: {e}")
 
             # 3. 플러그인 이벤트 시스템 초기화
             try:
-                self.components['events'] if components is not None else None = plugin_events
-                init_results['components'] if init_results is not None else None['events'] = 'success'
+                self.components['events'] = plugin_events
+                init_results['components']['events'] = 'success'
                 logger.info("플러그인 이벤트 시스템 초기화 완료")
             except Exception as e:
-                init_results['components'] if init_results is not None else None['events'] = 'failed'
-                init_results['errors'] if init_results is not None else None.append(f"이벤트 시스템 초기화 실패: {e}")
+                init_results['components']['events'] = 'failed'
+                init_results['errors'].append(f"이벤트 시스템 초기화 실패: {e}")
                 logger.error(f"이벤트 시스템 초기화 실패: {e}")
 
             # 4. 플러그인 데이터베이스 초기화
             try:
-                self.components['database'] if components is not None else None = plugin_database
-                init_results['components'] if init_results is not None else None['database'] = 'success'
+                self.components['database'] = plugin_database
+                init_results['components']['database'] = 'success'
                 logger.info("플러그인 데이터베이스 초기화 완료")
             except Exception as e:
-                init_results['components'] if init_results is not None else None['database'] = 'failed'
-                init_results['errors'] if init_results is not None else None.append(f"데이터베이스 초기화 실패: {e}")
+                init_results['components']['database'] = 'failed'
+                init_results['errors'].append(f"데이터베이스 초기화 실패: {e}")
                 logger.error(f"데이터베이스 초기화 실패: {e}")
 
             # 5. 플러그인 보안 시스템 초기화
             try:
-                self.components['security'] if components is not None else None = plugin_security
-                init_results['components'] if init_results is not None else None['security'] = 'success'
+                self.components['security'] = plugin_security
+                init_results['components']['security'] = 'success'
                 logger.info("플러그인 보안 시스템 초기화 완료")
             except Exception as e:
-                init_results['components'] if init_results is not None else None['security'] = 'failed'
-                init_results['errors'] if init_results is not None else None.append(f"보안 시스템 초기화 실패: {e}")
+                init_results['components']['security'] = 'failed'
+                init_results['errors'].append(f"보안 시스템 초기화 실패: {e}")
                 logger.error(f"보안 시스템 초기화 실패: {e}")
 
             # 6. 플러그인 마켓플레이스 초기화
             try:
-                self.components['marketplace'] if components is not None else None = plugin_marketplace
-                init_results['components'] if init_results is not None else None['marketplace'] = 'success'
+                self.components['marketplace'] = plugin_marketplace
+                init_results['components']['marketplace'] = 'success'
                 logger.info("플러그인 마켓플레이스 초기화 완료")
             except Exception as e:
-                init_results['components'] if init_results is not None else None['marketplace'] = 'failed'
-                init_results['errors'] if init_results is not None else None.append(f"마켓플레이스 초기화 실패: {e}")
+                init_results['components']['marketplace'] = 'failed'
+                init_results['errors'].append(f"마켓플레이스 초기화 실패: {e}")
                 logger.error(f"마켓플레이스 초기화 실패: {e}")
 
             # 7. 플러그인 최적화 시스템 초기화
             try:
                 if system_optimizer is not None:
-                    self.components['optimizer'] if components is not None else None = system_optimizer
-                    init_results['components'] if init_results is not None else None['optimizer'] = 'success'
+                    self.components['optimizer'] = system_optimizer
+                    init_results['components']['optimizer'] = 'success'
                     logger.info("플러그인 최적화 시스템 초기화 완료")
                 else:
-                    init_results['components'] if init_results is not None else None['optimizer'] = 'failed'
-                    init_results['errors'] if init_results is not None else None.append("최적화 시스템 모듈을 찾을 수 없습니다")
+                    init_results['components']['optimizer'] = 'failed'
+                    init_results['errors'].append("최적화 시스템 모듈을 찾을 수 없습니다")
                     logger.error("최적화 시스템 모듈을 찾을 수 없습니다")
             except Exception as e:
-                init_results['components'] if init_results is not None else None['optimizer'] = 'failed'
-                init_results['errors'] if init_results is not None else None.append(f"최적화 시스템 초기화 실패: {e}")
+                init_results['components']['optimizer'] = 'failed'
+                init_results['errors'].append(f"최적화 시스템 초기화 실패: {e}")
                 logger.error(f"최적화 시스템 초기화 실패: {e}")
 
             # 8. 플러그인 API 초기화
             try:
-                self.components['api'] if components is not None else None = plugin_api
-                init_results['components'] if init_results is not None else None['api'] = 'success'
+                self.components['api'] = plugin_api
+                init_results['components']['api'] = 'success'
                 logger.info("플러그인 API 초기화 완료")
             except Exception as e:
-                init_results['components'] if init_results is not None else None['api'] = 'failed'
-                init_results['errors'] if init_results is not None else None.append(f"API 초기화 실패: {e}")
+                init_results['components']['api'] = 'failed'
+                init_results['errors'].append(f"API 초기화 실패: {e}")
                 logger.error(f"API 초기화 실패: {e}")
 
             # 초기화 상태 업데이트
-            success_count = sum(1 for status in init_results['components'] if init_results is not None else None.value if None is not None else Nones() if status == 'success')
-            total_count = len(init_results['components'] if init_results is not None else None)
+            success_count = sum(1 for status in init_results['components'].values() if status == 'success')
+            total_count = len(init_results['components'])
 
             if success_count == total_count:
-                self.system_status['initialized'] if system_status is not None else None = True
-                self.system_status['health_status'] if system_status is not None else None = 'healthy'
+                self.system_status['initialized'] = True
+                self.system_status['health_status'] = 'healthy'
                 logger.info("플러그인 시스템 초기화 완료")
             elif success_count > total_count // 2:
-                self.system_status['initialized'] if system_status is not None else None = True
-                self.system_status['health_status'] if system_status is not None else None = 'degraded'
+                self.system_status['initialized'] = True
+                self.system_status['health_status'] = 'degraded'
                 logger.warning("플러그인 시스템 초기화 완료 (일부 컴포넌트 실패)")
             else:
-                self.system_status['health_status'] if system_status is not None else None = 'unhealthy'
+                self.system_status['health_status'] = 'unhealthy'
                 logger.error("플러그인 시스템 초기화 실패")
 
-            self.system_status['last_check'] if system_status is not None else None = datetime.now()
+            self.system_status['last_check'] = datetime.now()
 
         except Exception as e:
-            init_results['errors'] if init_results is not None else None.append(f"시스템 초기화 중 오류: {e}")
+            init_results['errors'].append(f"시스템 초기화 중 오류: {e}")
             logger.error(f"시스템 초기화 중 오류: {e}")
 
         return init_results
 
     def start_system(self) -> Any:
         """플러그인 시스템 시작"""
-        if not self.system_status['initialized'] if system_status is not None else None:
+        if not self.system_status['initialized']:
             return {'error': '시스템이 초기화되지 않았습니다'}
 
         logger.info("플러그인 시스템 시작")
@@ -260,59 +261,59 @@ class PluginSystemManager:
 
         try:
             # 1. 플러그인 로드
-            if self.components['registry'] if components is not None else None:
+            if self.components['registry']:
                 try:
-                    self.components['registry'] if components is not None else None.load_all_plugins()
-                    start_results['components'] if start_results is not None else None['plugin_loading'] = 'success'
+                    self.components['registry'].load_all_plugins()
+                    start_results['components']['plugin_loading'] = 'success'
                     logger.info("플러그인 로드 완료")
                 except Exception as e:
-                    start_results['components'] if start_results is not None else None['plugin_loading'] = 'failed'
-                    start_results['errors'] if start_results is not None else None.append(f"플러그인 로드 실패: {e}")
+                    start_results['components']['plugin_loading'] = 'failed'
+                    start_results['errors'].append(f"플러그인 로드 실패: {e}")
                     logger.error(f"플러그인 로드 실패: {e}")
 
             # 2. 이벤트 시스템 시작
-            if self.components['events'] if components is not None else None:
+            if self.components['events']:
                 try:
-                    self.components['events'] if components is not None else None.start_event_system()
-                    start_results['components'] if start_results is not None else None['event_system'] = 'success'
+                    self.components['events'].start_event_system()
+                    start_results['components']['event_system'] = 'success'
                     logger.info("이벤트 시스템 시작 완료")
                 except Exception as e:
-                    start_results['components'] if start_results is not None else None['event_system'] = 'failed'
-                    start_results['errors'] if start_results is not None else None.append(f"이벤트 시스템 시작 실패: {e}")
+                    start_results['components']['event_system'] = 'failed'
+                    start_results['errors'].append(f"이벤트 시스템 시작 실패: {e}")
                     logger.error(f"이벤트 시스템 시작 실패: {e}")
 
             # 3. 최적화 시스템 시작
-            if self.components['optimizer'] if components is not None else None:
+            if self.components['optimizer']:
                 try:
-                    self.components['optimizer'] if components is not None else None.start_auto_optimization()
-                    start_results['components'] if start_results is not None else None['optimizer'] = 'success'
+                    self.components['optimizer'].start_auto_optimization()
+                    start_results['components']['optimizer'] = 'success'
                     logger.info("최적화 시스템 시작 완료")
                 except Exception as e:
-                    start_results['components'] if start_results is not None else None['optimizer'] = 'failed'
-                    start_results['errors'] if start_results is not None else None.append(f"최적화 시스템 시작 실패: {e}")
+                    start_results['components']['optimizer'] = 'failed'
+                    start_results['errors'].append(f"최적화 시스템 시작 실패: {e}")
                     logger.error(f"최적화 시스템 시작 실패: {e}")
 
             # 4. 헬스 체크 시작
             self._start_health_check()
-            start_results['components'] if start_results is not None else None['health_check'] = 'success'
+            start_results['components']['health_check'] = 'success'
             logger.info("헬스 체크 시작 완료")
 
             # 시스템 상태 업데이트
-            self.system_status['started'] if system_status is not None else None = True
-            self.system_status['last_check'] if system_status is not None else None = datetime.now()
+            self.system_status['started'] = True
+            self.system_status['last_check'] = datetime.now()
 
             # 활성 플러그인 수 업데이트
-            if self.components['registry'] if components is not None else None:
+            if self.components['registry']:
                 try:
-                    self.system_status['active_plugins'] if system_status is not None else None = len(self.components['registry'] if components is not None else None.get_active_plugins())
-                    self.system_status['total_plugins'] if system_status is not None else None = len(self.components['registry'] if components is not None else None.get_all_plugins())
+                    self.system_status['active_plugins'] = len(self.components['registry'].get_active_plugins())
+                    self.system_status['total_plugins'] = len(self.components['registry'].get_all_plugins())
                 except Exception:
                     pass
 
             logger.info("플러그인 시스템 시작 완료")
 
         except Exception as e:
-            start_results['errors'] if start_results is not None else None.append(f"시스템 시작 중 오류: {e}")
+            start_results['errors'].append(f"시스템 시작 중 오류: {e}")
             logger.error(f"시스템 시작 중 오류: {e}")
 
         return start_results
@@ -330,41 +331,41 @@ class PluginSystemManager:
         try:
             # 1. 헬스 체크 중지
             self._stop_health_check()
-            stop_results['components'] if stop_results is not None else None['health_check'] = 'stopped'
+            stop_results['components']['health_check'] = 'stopped'
 
             # 2. 최적화 시스템 중지
-            if self.components['optimizer'] if components is not None else None:
+            if self.components['optimizer']:
                 try:
-                    self.components['optimizer'] if components is not None else None.stop_auto_optimization()
-                    stop_results['components'] if stop_results is not None else None['optimizer'] = 'stopped'
+                    self.components['optimizer'].stop_auto_optimization()
+                    stop_results['components']['optimizer'] = 'stopped'
                 except Exception as e:
-                    stop_results['errors'] if stop_results is not None else None.append(f"최적화 시스템 중지 실패: {e}")
+                    stop_results['errors'].append(f"최적화 시스템 중지 실패: {e}")
 
             # 3. 이벤트 시스템 중지
-            if self.components['events'] if components is not None else None:
+            if self.components['events']:
                 try:
-                    self.components['events'] if components is not None else None.stop_event_system()
-                    stop_results['components'] if stop_results is not None else None['event_system'] = 'stopped'
+                    self.components['events'].stop_event_system()
+                    stop_results['components']['event_system'] = 'stopped'
                 except Exception as e:
-                    stop_results['errors'] if stop_results is not None else None.append(f"이벤트 시스템 중지 실패: {e}")
+                    stop_results['errors'].append(f"이벤트 시스템 중지 실패: {e}")
 
             # 4. 플러그인 언로드
-            if self.components['registry'] if components is not None else None:
+            if self.components['registry']:
                 try:
-                    self.components['registry'] if components is not None else None.unload_all_plugins()
-                    stop_results['components'] if stop_results is not None else None['plugin_unloading'] = 'success'
+                    self.components['registry'].unload_all_plugins()
+                    stop_results['components']['plugin_unloading'] = 'success'
                 except Exception as e:
-                    stop_results['errors'] if stop_results is not None else None.append(f"플러그인 언로드 실패: {e}")
+                    stop_results['errors'].append(f"플러그인 언로드 실패: {e}")
 
             # 시스템 상태 업데이트
-            self.system_status['started'] if system_status is not None else None = False
-            self.system_status['health_status'] if system_status is not None else None = 'stopped'
-            self.system_status['last_check'] if system_status is not None else None = datetime.now()
+            self.system_status['started'] = False
+            self.system_status['health_status'] = 'stopped'
+            self.system_status['last_check'] = datetime.now()
 
             logger.info("플러그인 시스템 중지 완료")
 
         except Exception as e:
-            stop_results['errors'] if stop_results is not None else None.append(f"시스템 중지 중 오류: {e}")
+            stop_results['errors'].append(f"시스템 중지 중 오류: {e}")
             logger.error(f"시스템 중지 중 오류: {e}")
 
         return stop_results
@@ -374,24 +375,24 @@ class PluginSystemManager:
         status = self.system_status.copy()
 
         # 컴포넌트별 상태 추가
-        status['components'] if status is not None else None = {}
-        for name, component in self.components.items() if components is not None else []:
+        status['components'] = {}
+        for name, component in self.components.items():
             if component:
                 try:
                     if hasattr(component, 'get_status'):
-                        status['components'] if status is not None else None[name] = component.get_status()
+                        status['components'][name] = component.get_status()
                     else:
-                        status['components'] if status is not None else None[name] = 'available'
+                        status['components'][name] = 'available'
                 except Exception:
-                    status['components'] if status is not None else None[name] = 'error'
+                    status['components'][name] = 'error'
             else:
-                status['components'] if status is not None else None[name] = 'unavailable'
+                status['components'][name] = 'unavailable'
 
         # 성능 정보 추가
-        if self.components['optimizer'] if components is not None else None:
+        if self.components['optimizer']:
             try:
-                performance_report = self.components['optimizer'] if components is not None else None.get_system_status()
-                status['performance'] if status is not None else None = performance_report
+                performance_report = self.components['optimizer'].get_system_status()
+                status['performance'] = performance_report
             except Exception:
                 pass
 
@@ -408,80 +409,65 @@ class PluginSystemManager:
 
         try:
             # 각 컴포넌트별 헬스 체크
-            for name, component in self.components.items() if components is not None else []:
+            for name, component in self.components.items():
                 if component:
                     try:
                         if hasattr(component, 'health_check'):
                             component_status = component.health_check()
                         else:
                             component_status = {'status': 'available'}
-                        health_result['components'] if health_result is not None else None[name] = component_status
+                        health_result['components'][name] = component_status
                     except Exception as e:
-                        health_result['components'] if health_result is not None else None[name] = {'status': 'error', 'error': str(e)}
-                        health_result['errors'] if health_result is not None else None.append(f"{name}: {e}")
+                        health_result['components'][name] = {'status': 'error', 'error': str(e)}
+                        health_result['errors'].append(f"{name}: {e}")
                 else:
-                    health_result['components'] if health_result is not None else None[name] = {'status': 'unavailable'}
+                    health_result['components'][name] = {'status': 'unavailable'}
 
             # 전체 상태 결정
-            error_count = sum(1 for comp in health_result['components'] if health_result is not None else None.value if None is not None else Nones()
-                              if comp.get() if comp else None'status') if comp else None == 'error')
-            unavailable_count = sum(1 for comp in health_result['components'] if health_result is not None else None.value if None is not None else Nones()
-                                    if comp.get() if comp else None'status') if comp else None == 'unavailable')
+            error_count = sum(1 for comp in health_result['components'].values()
+                              if comp.get('status') == 'error')
+            unavailable_count = sum(1 for comp in health_result['components'].values()
+                                    if comp.get('status') == 'unavailable')
 
             if error_count == 0 and unavailable_count == 0:
-                health_result['overall_status'] if health_result is not None else None = 'healthy'
-                self.system_status['health_status'] if system_status is not None else None = 'healthy'
+                health_result['overall_status'] = 'healthy'
+                self.system_status['health_status'] = 'healthy'
             elif error_count == 0:
-                health_result['overall_status'] if health_result is not None else None = 'degraded'
-                self.system_status['health_status'] if system_status is not None else None = 'degraded'
+                health_result['overall_status'] = 'degraded'
+                self.system_status['health_status'] = 'degraded'
             else:
-                health_result['overall_status'] if health_result is not None else None = 'unhealthy'
-                self.system_status['health_status'] if system_status is not None else None = 'unhealthy'
+                health_result['overall_status'] = 'unhealthy'
+                self.system_status['health_status'] = 'unhealthy'
 
-            self.system_status['last_check'] if system_status is not None else None = datetime.now()
+            self.system_status['last_check'] = datetime.now()
 
         except Exception as e:
-            health_result['overall_status'] if health_result is not None else None = 'error'
-            health_result['errors'] if health_result is not None else None.append(f"헬스 체크 실행 중 오류: {e}")
+            health_result['overall_status'] = 'error'
+            health_result['errors'].append(f"헬스 체크 실행 중 오류: {e}")
             logger.error(f"헬스 체크 실행 중 오류: {e}")
 
         return health_result
 
     def _start_health_check(self):
-        """헬스 체크 스레드 시작"""
-        if self.health_check_thread is None or not self.health_check_thread.is_alive():
-            self.health_check_thread = threading.Thread(
-                target=self._health_check_loop,
-                daemon=True
-            )
-            self.health_check_thread.start()
+        """헬스 체크 작업 등록 (컴포넌트는 프로세스별이라 singleton 아님)"""
+        job_scheduler.add_job(HEALTH_CHECK_JOB, self.run_health_check, interval=self.health_check_interval,
+                              initial_delay=0)
 
     def _stop_health_check(self):
-        """헬스 체크 스레드 중지"""
-        # 스레드 중지 로직 (간단한 구현)
-        pass
-
-    def _health_check_loop(self):
-        """헬스 체크 루프"""
-        while self.system_status['started'] if system_status is not None else None:
-            try:
-                self.run_health_check()
-                time.sleep(self.health_check_interval)
-            except Exception as e:
-                logger.error(f"헬스 체크 루프 오류: {e}")
-                time.sleep(self.health_check_interval)
+        """헬스 체크 작업 제거"""
+        job_scheduler.remove_job(HEALTH_CHECK_JOB)
 
     def get_system_info(self) -> Any:
         """시스템 정보 조회"""
         return {
             'version': '1.0.0',
             'components_count': len(self.components),
-            'initialized': self.system_status['initialized'] if system_status is not None else None,
-            'started': self.system_status['started'] if system_status is not None else None,
-            'health_status': self.system_status['health_status'] if system_status is not None else None,
-            'last_check': self.system_status['last_check'] if system_status is not None else None,
-            'active_plugins': self.system_status['active_plugins'] if system_status is not None else None,
-            'total_plugins': self.system_status['total_plugins'] if system_status is not None else None
+            'initialized': self.system_status['initialized'],
+            'started': self.system_status['started'],
+            'health_status': self.system_status['health_status'],
+            'last_check': self.system_status['last_check'],
+            'active_plugins': self.system_status['active_plugins'],
+            'total_plugins': self.system_status['total_plugins']
         }
 
 
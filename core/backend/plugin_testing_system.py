@@ -4,14 +4,19 @@ from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-import threading
 import subprocess
 import time
+import json
 from typing import Optional
+from functools import partial
+
+from core.backend.document_store import get_document_store
+from core.backend.job_scheduler import job_scheduler
 args = None  # pyright: ignore
 config = None  # pyright: ignore
 form = None  # pyright: ignore
-import json
+
+PERFORMANCE_MONITOR_JOB = "plugin_testing.performance_monitor"
 
 
 @dataclass
@@ -64,29 +69,25 @@ class PluginTestingSystem:
         self.documentation_file = self.test_dir / "documentation.json"
         self.test_config_file = self.test_dir / "test_config.json"
 
+        # 테스트 결과/성능 메트릭은 자동 키(추가 순서) 컬렉션, 문서는 플러그인 ID 키 컬렉션
+        store = get_document_store(self.test_dir)
+        self.test_results = store.collection("test_results.json", key=None,
+                                             indexes=("plugin_id", "test_type"))
+        self.performance = store.collection("performance.json", key=None, indexes=("plugin_id",))
+        self.documentation = store.collection("documentation.json", layout="dict")
+
         # 모니터링 상태
         self.monitoring_active = False
-        self.monitoring_thread = None
 
         # 초기화
         self._init_testing_system()
 
     def _init_testing_system(self):
         """테스트 시스템 초기화"""
-        # 테스트 결과 초기화
-        if not self.test_results_file.exists():
-            with open(self.test_results_file, 'w', encoding='utf-8') as f:
-                json.dump([], f, indent=2, ensure_ascii=False)
-
-        # 성능 데이터 초기화
-        if not self.performance_file.exists():
-            with open(self.performance_file, 'w', encoding='utf-8') as f:
-                json.dump([], f, indent=2, ensure_ascii=False)
-
-        # 문서화 데이터 초기화
-        if not self.documentation_file.exists():
-            with open(self.documentation_file, 'w', encoding='utf-8') as f:
-                json.dump({}, f, indent=2, ensure_ascii=False)
+        # 테스트 결과 / 성능 데이터 / 문서화 데이터 초기화
+        self.test_results.seed([])
+        self.performance.seed([])
+        self.documentation.seed({})
 
         # 테스트 설정 초기화
         if not self.test_config_file.exists():
@@ -238,45 +239,33 @@ class PluginTestingSystem:
         if self.monitoring_active:
             return False
 
+        config = self._load_test_config()
+        interval = config.get("monitoring_interval", 60) if config else 60
+        threshold = config.get("performance_threshold", {}) if config else {}
+
         self.monitoring_active = True
-        self.monitoring_thread = threading.Thread(
-            target=self._monitoring_worker,
-            args=(plugin_id,),
-            daemon=True
-        )
-        self.monitoring_thread.start()
+        # 메트릭을 공용 저장소에 쌓으므로 여러 워커 중 한 프로세스에서만 실행
+        job_scheduler.add_job(PERFORMANCE_MONITOR_JOB, partial(self._monitoring_tick, plugin_id, threshold),
+                              interval=interval, singleton=True, initial_delay=0)
         return True
 
     def stop_performance_monitoring(self):
         """성능 모니터링 중지"""
         self.monitoring_active = False
-        if self.monitoring_thread:
-            self.monitoring_thread.join(timeout=5)
-
-    def _monitoring_worker(self, plugin_id=None):
-        """모니터링 워커 스레드"""
-        config = self._load_test_config()
-        interval = config.get("monitoring_interval", 60) if config else 60
-        threshold = config.get("performance_threshold", {}) if config else {}
+        job_scheduler.remove_job(PERFORMANCE_MONITOR_JOB)
 
-        while self.monitoring_active:
-            try:
-                # 성능 메트릭 수집
-                metrics = self._collect_performance_metrics(plugin_id)
+    def _monitoring_tick(self, plugin_id, threshold):
+        """성능 메트릭 수집/알림/저장 (작업 스케줄러가 monitoring_interval마다 실행)"""
+        # 성능 메트릭 수집
+        metrics = self._collect_performance_metrics(plugin_id)
 
-                # 임계값 확인 및 알림
-                alerts = self._check_performance_thresholds(metrics, threshold)
-                if alerts:
-                    self._send_performance_alerts(alerts)
+        # 임계값 확인 및 알림
+        alerts = self._check_performance_thresholds(metrics, threshold)
+        if alerts:
+            self._send_performance_alerts(alerts)
 
-                # 메트릭 저장
-                self._save_performance_metrics(metrics)
-
-                time.sleep(interval)
-
-            except Exception as e:
-                print(f"모니터링 오류: {e}")
-                time.sleep(interval)
+        # 메트릭 저장
+        self._save_performance_metrics(metrics)
 
     def _collect_performance_metrics(self, plugin_id=None) -> Optional[List[Dict[str, Any]]]:
         """성능 메트릭 수집"""
@@ -568,13 +557,9 @@ class PluginTestingSystem:
     def get_test_results(self, plugin_id: Optional[str] if Optional is not None else None = None, test_type: Optional[str] if Optional is not None else None = None, limit: int = 50) -> List[Dict] if List is not None else None:
         """테스트 결과 조회"""
         try:
-            results = self._load_test_results()
-
-            # 필터링
-            if plugin_id:
-                results = [r for r in results if r.get("plugin_id") == plugin_id]
-            if test_type:
-                results = [r for r in results if r.get("test_type") == test_type]
+            # 필터링 (인덱스 조회)
+            filters = {"plugin_id": plugin_id, "test_type": test_type}
+            results = self.test_results.find(**{k: v for k, v in filters.items() if v})
 
             # 최신 순으로 정렬
             results.sort(key=lambda x: x.get("started_at", ""), reverse=True)
@@ -588,17 +573,10 @@ class PluginTestingSystem:
     def get_performance_metrics(self, plugin_id: Optional[str] if Optional is not None else None = None, hours: int = 24) -> List[Dict] if List is not None else None:
         """성능 메트릭 조회"""
         try:
-            metrics = self._load_performance_metrics()
-
-            # 시간 필터링
+            # 플러그인 필터링 (인덱스 조회) 후 시간 필터링
+            metrics = self.performance.find(plugin_id=plugin_id) if plugin_id else self.performance.all()
             cutoff_time = datetime.now() - timedelta(hours=hours)
-            metrics = [m for m in metrics if datetime.fromisoformat(m['timestamp'] if m is not None else None) > cutoff_time]
-
-            # 플러그인 필터링
-            if plugin_id:
-                metrics = [m for m in metrics if m.get("plugin_id") == plugin_id]
-
-            return metrics
+            return [m for m in metrics if datetime.fromisoformat(m['timestamp']) > cutoff_time]
 
         except Exception as e:
             print(f"성능 메트릭 조회 실패: {e}")
@@ -607,8 +585,7 @@ class PluginTestingSystem:
     def get_documentation(self, plugin_id: str) -> Optional[Dict] if Optional is not None else None:
         """문서 조회"""
         try:
-            docs = self._load_documentation()
-            return docs.get(plugin_id) if docs else None
+            return self.documentation.get(plugin_id)
         except Exception as e:
             print(f"문서 조회 실패: {e}")
             return None
@@ -621,63 +598,29 @@ class PluginTestingSystem:
         except Exception:
             return {}
 
-    def _load_test_results(self) -> List[Dict] if List is not None else None:
-        """테스트 결과 로드"""
-        try:
-            with open(self.test_results_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return []
-
     def _save_test_result(self, result: Dict):
         """테스트 결과 저장"""
         try:
-            results = self._load_test_results()
-            results.append(result)
-
-            with open(self.test_results_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            self.test_results.append(result)
         except Exception as e:
             print(f"테스트 결과 저장 실패: {e}")
 
-    def _load_performance_metrics(self) -> List[Dict] if List is not None else None:
-        """성능 메트릭 로드"""
-        try:
-            with open(self.performance_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return []
-
     def _save_performance_metrics(self, metrics: List[Dict] if List is not None else None):
         """성능 메트릭 저장"""
         try:
-            all_metrics = self._load_performance_metrics()
-            all_metrics.extend(metrics)
+            self.performance.put_many(metrics or [])
 
             # 최근 7일 데이터만 유지
             cutoff_time = datetime.now() - timedelta(days=7)
-            all_metrics = [m for m in all_metrics if datetime.fromisoformat(m['timestamp'] if m is not None else None) > cutoff_time]
-
-            with open(self.performance_file, 'w', encoding='utf-8') as f:
-                json.dump(all_metrics, f, indent=2, ensure_ascii=False)
+            self.performance.delete_where(
+                lambda m: datetime.fromisoformat(m['timestamp']) <= cutoff_time
+            )
         except Exception as e:
             print(f"성능 메트릭 저장 실패: {e}")
 
-    def _load_documentation(self) -> Dict:
-        """문서 로드"""
-        try:
-            with open(self.documentation_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return {}
-
     def _save_documentation(self, plugin_id: str, documentation: Dict):
         """문서 저장"""
         try:
-            docs = self._load_documentation()
-            if docs is not None:
-                docs[plugin_id] = documentation
-            with open(self.documentation_file, 'w', encoding='utf-8') as f:
-                json.dump(docs, f, indent=2, ensure_ascii=False)
+            self.documentation.put(documentation, key=plugin_id)
         except Exception as e:
             print(f"문서 저장 실패: {e}")
@@ -0,0 +1,225 @@
+"""
+요청 제한(rate limiting) 서비스
+워커마다 따로 세던 요청 제한을 한 곳에서 처리한다.
+
+- RedisRateLimiter: GCRA(Generic Cell Rate Algorithm)를 Lua 스크립트 하나로 원자적으로 처리.
+  키마다 "다음 요청 가능 시각(TAT)" 값 하나만 저장하므로 확인이 O(1)이고 메모리도 키당 고정.
+  시각은 Redis TIME을 써서 워커/호스트 시계 차이의 영향을 받지 않는다
+- LocalRateLimiter: 프로세스 내 토큰 버킷. O(1) 확인, 키 수 상한(LRU)으로 메모리 제한,
+  샤드별 락으로 경합 분산. Redis가 없거나 장애일 때 대체로 사용
+두 방식 모두 "period 동안 limit회"를 버스트 limit, 초당 limit/period 회복으로 해석한다.
+"""
+
+import abc
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_KEYS = 100000
+DEFAULT_SHARDS = 16
+FALLBACK_LOG_INTERVAL = 30.0  # Redis 장애 경고 로그 간격 (초)
+
+# KEYS[1]=키, ARGV=[요청 간격(µs), 버스트 허용치(µs), 비용] -> {허용, 남은 수, 재시도까지(µs), 초기화까지(µs)}
+_GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + cost * interval
+local allow_at = new_tat - burst
+if allow_at > now then
+  return {0, 0, allow_at - now, tat - now}
+end
+redis.call('SET', KEYS[1], string.format('%.0f', new_tat), 'PX', math.floor((new_tat - now) / 1000) + 1)
+return {1, math.floor((burst - (new_tat - now)) / interval), 0, new_tat - now}
+"""
+
+
+@dataclass
+class RateLimitResult:
+    """요청 제한 확인 결과"""
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # 다음 요청이 허용될 때까지 (초)
+    reset_after: float  # 버킷이 가득 찰 때까지 (초)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'allowed': self.allowed,
+            'limit': self.limit,
+            'remaining': self.remaining,
+            'retry_after': round(self.retry_after, 3),
+            'reset_after': round(self.reset_after, 3),
+        }
+
+
+class RateLimiter(abc.ABC):
+    """요청 제한 공통 인터페이스"""
+
+    @abc.abstractmethod
+    def hit(self, key: str, limit: int, period: float, cost: int = 1) -> RateLimitResult:
+        """key로 cost만큼 요청을 기록하고 허용 여부 반환 (period초 동안 limit회)"""
+
+    @abc.abstractmethod
+    def reset(self, key: str):
+        """key의 요청 기록 초기화"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class _Shard:
+    __slots__ = ('lock', 'buckets', 'allowed', 'denied', 'evicted')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets: "OrderedDict[str, List[float]]" = OrderedDict()  # key -> [남은 토큰, 마지막 갱신 시각]
+        self.allowed = 0
+        self.denied = 0
+        self.evicted = 0
+
+
+class LocalRateLimiter(RateLimiter):
+    """프로세스 내 토큰 버킷 (키 수 상한 LRU, 샤드별 락)"""
+
+    def __init__(self, max_keys: int = DEFAULT_MAX_KEYS, shards: int = DEFAULT_SHARDS, clock=time.monotonic):
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._per_shard = max(1, max_keys // len(self._shards))
+        self._clock = clock
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def hit(self, key: str, limit: int, period: float, cost: int = 1) -> RateLimitResult:
+        rate = limit / period
+        shard = self._shard(key)
+        now = self._clock()
+        with shard.lock:
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                bucket = shard.buckets[key] = [float(limit), now]
+                if len(shard.buckets) > self._per_shard:
+                    # 가장 오래 안 쓴 키를 버림 (다시 오면 가득 찬 버킷으로 시작)
+                    shard.buckets.popitem(last=False)
+                    shard.evicted += 1
+                tokens = float(limit)
+            else:
+                shard.buckets.move_to_end(key)
+                tokens = min(float(limit), bucket[0] + (now - bucket[1]) * rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+                shard.allowed += 1
+            else:
+                shard.denied += 1
+            bucket[0] = tokens
+            bucket[1] = now
+        return RateLimitResult(
+            allowed=allowed,
+            limit=limit,
+            remaining=int(tokens),
+            retry_after=0.0 if allowed else (cost - tokens) / rate,
+            reset_after=(limit - tokens) / rate,
+        )
+
+    def reset(self, key: str):
+        shard = self._shard(key)
+        with shard.lock:
+            shard.buckets.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'backend': 'memory',
+            'keys': sum(len(s.buckets) for s in self._shards),
+            'max_keys': self._per_shard * len(self._shards),
+            'allowed': sum(s.allowed for s in self._shards),
+            'denied': sum(s.denied for s in self._shards),
+            'evicted': sum(s.evicted for s in self._shards),
+        }
+
+
+class RedisRateLimiter(RateLimiter):
+    """여러 워커/호스트가 공유하는 Redis GCRA 제한 (장애 시 프로세스 내 토큰 버킷으로 대체)"""
+
+    def __init__(self, client, prefix: str = "ratelimit:", fallback: Optional[RateLimiter] = None):
+        self.client = client
+        self.prefix = prefix
+        self.fallback = fallback or LocalRateLimiter()
+        self._script = client.register_script(_GCRA_SCRIPT)  # EVALSHA (스크립트 캐시에 없으면 자동 재등록)
+        self._last_warning = 0.0
+        self.stats = {'allowed': 0, 'denied': 0, 'fallbacks': 0}
+
+    def hit(self, key: str, limit: int, period: float, cost: int = 1) -> RateLimitResult:
+        interval = max(1, int(period * 1000000 / limit))
+        try:
+            allowed, remaining, retry_after, reset_after = self._script(
+                keys=[self.prefix + key], args=[interval, interval * limit, cost])
+        except Exception as e:
+            self.stats['fallbacks'] += 1
+            now = time.monotonic()
+            if now - self._last_warning > FALLBACK_LOG_INTERVAL:
+                self._last_warning = now
+                logger.warning(f"Redis 요청 제한 실패, 프로세스 내 제한으로 대체: {e}")
+            return self.fallback.hit(key, limit, period, cost)
+        self.stats['allowed' if allowed else 'denied'] += 1
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=limit,
+            remaining=max(0, int(remaining)),
+            retry_after=int(retry_after) / 1000000,
+            reset_after=int(reset_after) / 1000000,
+        )
+
+    def reset(self, key: str):
+        try:
+            self.client.delete(self.prefix + key)
+        except Exception as e:
+            logger.warning(f"Redis 요청 제한 초기화 실패: {e}")
+        self.fallback.reset(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'backend': 'redis', 'fallback': self.fallback.get_stats()}
+
+
+def create_rate_limiter(backend: Optional[str] = None, redis_url: Optional[str] = None, **kwargs) -> RateLimiter:
+    """설정에 맞는 요청 제한기 생성
+
+    backend 가 없으면 RATE_LIMIT_BACKEND 환경 변수(memory/redis)를 따르고, redis 연결에
+    실패하면 프로세스 내 토큰 버킷을 사용한다.
+    """
+    backend = backend or os.environ.get('RATE_LIMIT_BACKEND', 'memory')
+    if backend == 'redis':
+        redis_url = redis_url or os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+        try:
+            import redis
+
+            client = redis.from_url(redis_url)
+            client.ping()
+            logger.info(f"Redis 요청 제한 연결 성공: {redis_url}")
+            return RedisRateLimiter(client, **kwargs)
+        except Exception as e:
+            logger.warning(f"Redis 요청 제한 연결 실패, 프로세스 내 제한 사용: {e}")
+    return LocalRateLimiter()
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """프로세스 공용 요청 제한기"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = create_rate_limiter()
+        return _rate_limiter
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Dict, List, Set, Any, Optional
 import logging
 from typing import Optional
+from core.backend.event_bus import NOTIFICATIONS_TOPIC, BusMessage, EventBus, get_event_bus
 form = None  # pyright: ignore
 """
 실시간 알림 시스템
@@ -108,12 +109,16 @@ class NotificationChannel:
 class RealtimeNotificationManager:
     """실시간 알림 관리자"""
 
-    def __init__(self):
+    def __init__(self, event_bus: Optional[EventBus] = None):
         self.channels: Dict[str, NotificationChannel] = {}
         self.user_connections: Dict[str, Set[str]] = {}  # user_id -> connection_ids
         self.connection_users: Dict[str, str] = {}  # connection_id -> user_id
         self.notification_handlers: Dict[str, Any] = {}
 
+        # 알림은 이벤트 버스로 한 번만 발행하고, 각 워커가 자기 연결에 전달
+        self.event_bus = event_bus or get_event_bus()
+        self.event_bus.subscribe(NOTIFICATIONS_TOPIC, self._on_bus_message)
+
         # 기본 채널 생성
         self._create_default_channels()
 
@@ -183,35 +188,38 @@ class RealtimeNotificationManager:
             return True
         return False
 
-    def send_notification(self, channel_id: str, notification: 'Notification', target_users: Optional[List[str]] = None) -> bool:
-        """알림 전송"""
+    def send_notification(self, channel_id: str, notification: 'Notification',
+                          target_users: Optional[List[str]] = None) -> bool:
+        """알림 전송
+
+        채널 구독자는 워커마다 따로 관리되므로 구독자 목록이 아니라 채널 ID(와 대상 사용자)를
+        발행하고, 각 워커가 자기 구독자 중에서 받을 사용자를 정한다.
+        """
         try:
             channel = self.get_channel(channel_id)
             if not channel:
                 logger.error(f"채널 {channel_id}를 찾을 수 없습니다")
                 return False
-            if target_users:
-                subscribers = [user_id for user_id in target_users if user_id in channel.subscribers]
-            else:
-                subscribers = channel.broadcast(notification)
-            self._send_to_subscribers(subscribers, notification)
-            logger.info(f"알림 전송 완료: {channel_id} -> {len(subscribers)}명")
+            if not target_users:
+                channel.broadcast(notification)
+            if not self._publish(notification, channel_id=channel_id,
+                                 target_users=list(target_users) if target_users else None):
+                return False
+            logger.info(f"알림 발행 완료: {channel_id}")
             return True
         except Exception as e:
             logger.error(f"알림 전송 실패: {e}")
             return False
 
     def send_direct_notification(self, user_id: str, notification: Notification) -> bool:
-        """개별 사용자에게 직접 알림 전송"""
+        """개별 사용자에게 직접 알림 전송
+
+        사용자의 연결이 다른 워커에 있을 수 있으므로 이 프로세스에 연결이 없어도 발행한다.
+        """
         try:
-            # 사용자 연결 확인
-            if user_id not in self.user_connections:
-                logger.warning(f"사용자 {user_id}의 활성 연결이 없습니다")
+            if not self._publish(notification, user_ids=[user_id]):
                 return False
 
-            # 직접 전송
-            self._send_to_subscribers([user_id], notification)
-
             logger.info(f"직접 알림 전송 완료: {user_id}")
             return True
 
@@ -219,21 +227,47 @@ class RealtimeNotificationManager:
             logger.error(f"직접 알림 전송 실패: {e}")
             return False
 
-    def _send_to_subscribers(self, user_ids: List[str], notification: 'Notification'):
-        """구독자들에게 알림 전송"""
+    def _publish(self, notification: 'Notification', **targets) -> bool:
+        """대상(user_ids 또는 channel_id/target_users)과 함께 알림을 이벤트 버스에 발행"""
+        event_id = self.event_bus.publish(NOTIFICATIONS_TOPIC, {
+            **targets,
+            'notification': notification.to_dict(),
+        })
+        return event_id is not None
+
+    def _recipients(self, payload: Dict[str, Any]) -> List[str]:
+        """발행된 알림의 대상 사용자 (채널 알림은 이 워커의 채널 구독자 중에서 결정)"""
+        channel_id = payload.get('channel_id')
+        if channel_id is None:
+            return payload.get('user_ids', [])
+        channel = self.get_channel(channel_id)
+        if channel is None:
+            return []
+        target_users = payload.get('target_users')
+        if target_users:
+            return [user_id for user_id in target_users if user_id in channel.subscribers]
+        return list(channel.subscribers)
+
+    def _on_bus_message(self, message: BusMessage):
+        """이벤트 버스에서 받은 알림을 이 프로세스에 연결된 대상 사용자에게 전달"""
+        payload = message.payload
+        self._send_to_subscribers(self._recipients(payload), payload.get('notification', {}), message.id)
+
+    def _send_to_subscribers(self, user_ids: List[str], notification, event_id: Optional[str] = None):
+        """구독자들에게 알림 전송 (이 프로세스의 연결만)"""
         for user_id in user_ids:
-            if user_id in self.user_connections:
-                for connection_id in self.user_connections[user_id]:
-                    self._send_to_connection(connection_id, notification)
+            for connection_id in list(self.user_connections.get(user_id, ())):
+                self._send_to_connection(connection_id, notification, event_id)
 
-    def _send_to_connection(self,  connection_id: str,  notification: Notification):
+    def _send_to_connection(self,  connection_id: str,  notification, event_id: Optional[str] = None):
         """연결에 알림 전송"""
         try:
             # WebSocket 또는 SSE를 통한 전송
             # 실제 구현에서는 WebSocket 라이브러리 사용
             message = {
                 'type': 'notification',
-                'data': notification.to_dict()
+                'event_id': event_id,
+                'data': notification.to_dict() if isinstance(notification, Notification) else notification
             }
 
             # 핸들러가 등록되어 있으면 호출
@@ -245,6 +279,21 @@ class RealtimeNotificationManager:
         except Exception as e:
             logger.error(f"연결 {connection_id}에 알림 전송 실패: {e}")
 
+    def get_missed_notifications(self, user_id: str, last_event_id: Optional[str] = None,
+                                 limit: int = 100) -> List[Dict[str, Any]]:
+        """재연결한 사용자가 놓친 알림 (last_event_id 이후, 이벤트 버스 스트림에서 재전송)"""
+        missed = []
+        for message in self.event_bus.replay(NOTIFICATIONS_TOPIC, last_event_id, limit=1000):
+            if user_id in self._recipients(message.payload):
+                missed.append({
+                    'type': 'notification',
+                    'event_id': message.id,
+                    'data': message.payload.get('notification'),
+                })
+                if len(missed) >= limit:
+                    break
+        return missed
+
     def register_notification_handler(self, connection_id: str, handler: Any):
         """알림 핸들러 등록"""
         self.notification_handlers[connection_id] = handler
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+지연 생성 서비스 레지스트리
+블루프린트 모듈이 import 시점에 만들던 전역 싱글톤(SQLite 사이드카 DB를 열고, 이벤트 버스를
+구독하고, 스레드를 띄우는 서비스)을 처음 쓰는 순간에 한 번만 만든다.
+모듈 전역 이름은 LazyService 프록시로 남겨 두므로 `alert_system.alerts` 같은 기존 호출부는 그대로 동작한다.
+
+- shared=True 로 등록한 서비스는 읽기 전용 상태(모델, 설정, 조회 테이블)만 가진다고 보고
+  --preload 모드에서 포크 전에 미리 만들어 워커들이 copy-on-write 로 공유한다.
+- 스레드/DB 연결을 가진 서비스는 shared=False(기본)로 두어 워커마다 첫 사용 시 만든다.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ServiceEntry:
+    """등록된 서비스와 생성 지표"""
+
+    name: str
+    factory: Callable[[], Any]
+    shared: bool = False
+    instance: Any = None
+    loaded: bool = False
+    init_time: float = 0.0
+    loaded_at: Optional[float] = None
+    error: Optional[str] = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "shared": self.shared,
+            "init_time": round(self.init_time, 6),
+            "loaded_at": self.loaded_at,
+            "error": self.error,
+        }
+
+
+class LazyService:
+    """레지스트리 서비스의 속성 접근을 실제 인스턴스로 넘기는 프록시"""
+
+    __slots__ = ("_registry", "_name")
+
+    def __init__(self, registry: "ServiceRegistry", name: str):
+        object.__setattr__(self, "_registry", registry)
+        object.__setattr__(self, "_name", name)
+
+    def _service(self) -> Any:
+        return self._registry.get(self._name)
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._service(), item)
+
+    def __setattr__(self, item: str, value: Any):
+        setattr(self._service(), item, value)
+
+    def __delattr__(self, item: str):
+        delattr(self._service(), item)
+
+    def __call__(self, *args, **kwargs):
+        return self._service()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._registry.is_loaded(self._name) else "lazy"
+        return f"<LazyService {self._name} ({state})>"
+
+
+class ServiceRegistry:
+    """이름으로 등록한 서비스 팩토리를 첫 사용 시 한 번만 실행하는 레지스트리"""
+
+    def __init__(self):
+        self._entries: Dict[str, ServiceEntry] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, factory: Callable[[], Any], shared: bool = False) -> LazyService:
+        """서비스 팩토리 등록 후 모듈 전역 이름으로 쓸 프록시 반환.
+        같은 이름을 다시 등록하면 아직 만들지 않은 경우에만 교체"""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry.loaded:
+                logger.warning(f"이미 생성된 서비스는 교체하지 않음: {name}")
+            else:
+                self._entries[name] = ServiceEntry(name=name, factory=factory, shared=shared)
+        return LazyService(self, name)
+
+    def _entry(self, name: str) -> ServiceEntry:
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"등록되지 않은 서비스: {name}")
+        return entry
+
+    def get(self, name: str) -> Any:
+        """서비스 인스턴스 반환. 처음 호출될 때 팩토리를 실행 (서비스별 락으로 한 번만)"""
+        entry = self._entry(name)
+        if entry.loaded:
+            return entry.instance
+        with entry.lock:
+            if not entry.loaded:
+                start = time.perf_counter()
+                try:
+                    entry.instance = entry.factory()
+                except Exception as e:
+                    entry.error = str(e)
+                    logger.error(f"서비스 생성 실패 ({name}): {e}")
+                    raise
+                finally:
+                    entry.init_time = time.perf_counter() - start
+                entry.error = None
+                entry.loaded_at = time.time()
+                entry.loaded = True
+                logger.info(f"서비스 생성: {name} ({entry.init_time * 1000:.1f}ms)")
+        return entry.instance
+
+    def has(self, name: str) -> bool:
+        return name in self._entries
+
+    def is_loaded(self, name: str) -> bool:
+        entry = self._entries.get(name)
+        return entry is not None and entry.loaded
+
+    def preload(self, names: Optional[List[str]] = None, shared_only: bool = True) -> Dict[str, float]:
+        """서비스를 미리 생성 (--preload 마스터에서 포크 전에 호출). 서비스별 생성 시간 반환"""
+        if names is None:
+            names = [name for name, entry in list(self._entries.items())
+                     if entry.shared or not shared_only]
+        timings = {}
+        for name in names:
+            try:
+                self.get(name)
+                timings[name] = self._entries[name].init_time
+            except Exception as e:
+                logger.error(f"서비스 미리 생성 실패 ({name}): {e}")
+        return timings
+
+    def reset(self, name: str) -> bool:
+        """생성된 인스턴스를 버려 다음 사용 시 다시 만들게 함 (테스트/설정 변경용)"""
+        entry = self._entries.get(name)
+        if entry is None:
+            return False
+        with entry.lock:
+            entry.instance = None
+            entry.loaded = False
+            entry.loaded_at = None
+        return True
+
+    def status(self) -> Dict[str, Any]:
+        """서비스별 생성 여부와 생성 시간"""
+        services = {name: entry.to_dict() for name, entry in sorted(self._entries.items())}
+        return {
+            "registered": len(services),
+            "loaded": sum(1 for s in services.values() if s["loaded"]),
+            "total_init_time": round(sum(s["init_time"] for s in services.values()), 6),
+            "services": services,
+        }
+
+
+# 전역 서비스 레지스트리
+service_registry = ServiceRegistry()
@@ -0,0 +1,222 @@
+"""
+사이드카 SQLite 접근 계층
+core/backend 모듈들이 쓰는 보조 SQLite DB(중앙 데이터, 알림, 보안 모니터 등)에 대한
+공용 연결 풀
+
+- 스레드마다 연결 하나를 재사용 (connect 비용 및 prepared statement 캐시 재사용)
+- 스레드가 끝나면 그 스레드의 연결을 닫고, 포크된 자식은 물려받은 연결을 쓰지 않고 새로 연다
+- WAL 저널 모드로 읽기와 쓰기가 서로 막지 않음
+- 읽기는 락 없이 동시에 실행하고, 쓰기만 DB 파일 단위 락으로 직렬화
+- executemany 일괄 저장
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+
+class _ThreadConnection:
+    """스레드별 연결 보관 (스레드가 끝나 thread-local이 정리되면 finalize가 연결을 닫음)"""
+
+    __slots__ = ("conn", "write_depth", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.write_depth = 0
+
+
+def _close_connection(conn: sqlite3.Connection, connections: List[sqlite3.Connection],
+                      lock: threading.RLock):
+    with lock:
+        if conn in connections:
+            connections.remove(conn)
+    try:
+        conn.close()
+    except Exception as e:
+        logger.warning(f"사이드카 DB 연결 종료 실패: {e}")
+
+
+# 포크 후 초기화할 인스턴스 (레지스트리 밖에서 직접 만든 것 포함)
+_instances: "weakref.WeakSet[SidecarDB]" = weakref.WeakSet()
+
+
+class SidecarDB:
+    """사이드카 SQLite DB (스레드별 연결 풀 + WAL)"""
+
+    def __init__(self, db_path: Union[str, Path], cached_statements: int = 256,
+                 busy_timeout: float = 5.0):
+        self.db_path = str(db_path)
+        self.cached_statements = cached_statements
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._connections: List[sqlite3.Connection] = []
+        self._finalizers: List[weakref.finalize] = []
+        # finalize는 아무 스레드의 GC 중에도 실행될 수 있으므로 재진입 가능한 락 사용
+        self._connections_lock = threading.RLock()
+        # 포크 전에 열린 연결 (자식에서는 쓰지도 닫지도 않고 참조만 유지)
+        self._inherited: List[sqlite3.Connection] = []
+        _instances.add(self)
+
+        parent = os.path.dirname(self.db_path)
+        if parent and self.db_path != ":memory:":
+            os.makedirs(parent, exist_ok=True)
+
+    def _holder(self) -> _ThreadConnection:
+        """현재 스레드의 연결 보관 객체 반환 (없으면 연결 생성)"""
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout,
+                isolation_level=None,  # 트랜잭션은 write()에서 명시적으로 시작
+                check_same_thread=False,
+                cached_statements=self.cached_statements,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            holder = _ThreadConnection(conn)
+            with self._connections_lock:
+                self._connections.append(conn)
+                self._finalizers.append(weakref.finalize(
+                    holder, _close_connection, conn, self._connections, self._connections_lock
+                ))
+                self._finalizers = [f for f in self._finalizers if f.alive]
+            self._local.holder = holder
+        return holder
+
+    def _connection(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 반환 (없으면 생성)"""
+        return self._holder().conn
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """읽기용 연결 (락 없음)"""
+        yield self._connection()
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 트랜잭션
+
+        같은 DB에 대한 쓰기는 프로세스 내에서 직렬화되고, 블록이 정상 종료되면
+        커밋, 예외가 나면 롤백 후 예외를 다시 던진다. 같은 스레드에서 중첩 호출하면
+        바깥 트랜잭션에 합쳐진다.
+        """
+        holder = self._holder()
+        conn = holder.conn
+        with self._write_lock:
+            if holder.write_depth > 0:
+                holder.write_depth += 1
+                try:
+                    yield conn
+                finally:
+                    holder.write_depth -= 1
+                return
+
+            conn.execute("BEGIN IMMEDIATE")
+            holder.write_depth = 1
+            try:
+                yield conn
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            else:
+                if conn.in_transaction:
+                    conn.execute("COMMIT")
+            finally:
+                holder.write_depth = 0
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """조회 결과를 dict 목록으로 반환"""
+        with self.read() as conn:
+            return [dict(row) for row in conn.execute(sql, params).fetchall()]
+
+    def query_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[Dict[str, Any]]:
+        """조회 결과 첫 행을 dict로 반환"""
+        with self.read() as conn:
+            row = conn.execute(sql, params).fetchone()
+            return dict(row) if row is not None else None
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        """단일 쓰기 문 실행"""
+        with self.write() as conn:
+            return conn.execute(sql, params)
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]], batch_size: int = 500) -> int:
+        """여러 행을 batch_size 단위 트랜잭션으로 일괄 저장하고 저장한 행 수 반환"""
+        total = 0
+        batch: List[Sequence[Any]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                with self.write() as conn:
+                    conn.executemany(sql, batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            with self.write() as conn:
+                conn.executemany(sql, batch)
+            total += len(batch)
+        return total
+
+    def close(self):
+        """열린 연결 모두 닫기"""
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+            finalizers, self._finalizers = self._finalizers, []
+        for finalizer in finalizers:
+            finalizer.detach()
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.warning(f"사이드카 DB 연결 종료 실패: {e}")
+        self._local = threading.local()
+
+    def after_fork(self):
+        """포크된 자식에서 호출: 부모의 연결/락을 버리고 이후 연결을 새로 열게 함"""
+        for finalizer in self._finalizers:
+            finalizer.detach()
+        self._inherited.extend(self._connections)
+        self._connections = []
+        self._finalizers = []
+        self._connections_lock = threading.RLock()
+        self._write_lock = threading.RLock()
+        self._local = threading.local()
+
+
+_registry: Dict[str, SidecarDB] = {}
+_registry_lock = threading.Lock()
+
+
+def get_sidecar_db(db_path: Union[str, Path]) -> SidecarDB:
+    """DB 파일별 공용 SidecarDB 반환 (같은 파일은 같은 쓰기 락을 공유)"""
+    key = os.path.abspath(str(db_path)) if str(db_path) != ":memory:" else ":memory:"
+    with _registry_lock:
+        db = _registry.get(key)
+        if db is None:
+            db = SidecarDB(db_path)
+            _registry[key] = db
+        return db
+
+
+def _reset_after_fork():
+    """포크된 자식 프로세스에서 모든 사이드카 DB의 연결 풀 초기화"""
+    global _registry_lock
+    _registry_lock = threading.Lock()
+    for db in list(_instances):
+        db.after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,222 @@
+"""
+SSE 브로드캐스트 허브
+모든 SSE 클라이언트가 큐 하나에서 get()을 나눠 가지던 방식(업데이트 하나가 클라이언트 하나에만
+전달됨) 대신, 이벤트를 한 번 직렬화해 구독자마다 가진 크기 제한 링 버퍼로 나눠 준다.
+
+- 발행은 이벤트 버스(토픽)로 하므로 어느 워커에서 발행해도 모든 워커의 구독자에게 전달되고,
+  버스 메시지 ID('ms-seq')를 SSE id로 써서 워커가 달라도 Last-Event-ID 이어 받기가 맞는다
+- 구독자 버퍼가 가득 차면(느린 클라이언트) 가장 오래된 이벤트를 버리고, 클라이언트에 resync
+  이벤트를 한 번 보내 전체 데이터를 다시 받게 한다
+- 재연결 시 Last-Event-ID 이후 이벤트를 허브 최근 이력(부족하면 버스 replay)에서 재전송
+- 클라이언트별 스레드/큐 소비 스레드 없음: 대기는 구독자 Event 하나뿐이라 gevent 워커에서는
+  유휴 연결 수천 개가 그린렛으로만 유지된다. 대기 시간 동안 이벤트가 없으면 주석 heartbeat 전송
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.backend.event_bus import BusMessage, EventBus, _id_key, get_event_bus
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_SIZE = 1000  # 이어 받기용 최근 이벤트 수
+DEFAULT_SUBSCRIBER_BUFFER = 256  # 구독자별 링 버퍼 크기
+DEFAULT_HEARTBEAT = 15.0  # 이벤트가 없을 때 heartbeat 간격 (초)
+RETRY_MS = 3000  # 끊겼을 때 브라우저 재연결 대기 (EventSource retry)
+
+
+def format_event(data: Any, event_id: Optional[str] = None, event: Optional[str] = None) -> str:
+    """SSE 프레임 (data는 JSON 한 줄, 문자열이면 그대로)"""
+    body = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False, default=str)
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in body.split("\n"))
+    return "\n".join(lines) + "\n\n"
+
+
+class Subscriber:
+    """SSE 연결 하나의 링 버퍼"""
+
+    def __init__(self, buffer_size: int):
+        self.frames: Deque[str] = deque(maxlen=buffer_size)
+        self.ready = threading.Event()
+        self.dropped = 0
+        self.delivered = 0
+        self.connected_at = time.time()
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def push(self, frame: str):
+        with self._lock:
+            if len(self.frames) == self.frames.maxlen:
+                self.dropped += 1
+            self.frames.append(frame)
+        self.ready.set()
+
+    def drain(self) -> Tuple[List[str], int]:
+        """쌓인 프레임과 그동안 버려진 수를 꺼냄"""
+        with self._lock:
+            frames = list(self.frames)
+            self.frames.clear()
+            dropped, self.dropped = self.dropped, 0
+        self.delivered += len(frames)
+        return frames, dropped
+
+
+class SSEHub:
+    """토픽 하나의 SSE 구독자들에게 이벤트를 나눠 주는 허브"""
+
+    def __init__(self, topic: str, event_bus: Optional[EventBus] = None,
+                 history_size: int = DEFAULT_HISTORY_SIZE,
+                 subscriber_buffer: int = DEFAULT_SUBSCRIBER_BUFFER,
+                 heartbeat: float = DEFAULT_HEARTBEAT):
+        self.topic = topic
+        self.history_size = history_size
+        self.subscriber_buffer = subscriber_buffer
+        self.heartbeat = heartbeat
+        self._event_bus = event_bus
+        self._subscription: Optional[str] = None
+        self._subscribers: Dict[int, Subscriber] = {}
+        self._history: Deque[Tuple[str, str]] = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+        self.stats = {'published': 0, 'fanned_out': 0, 'dropped': 0, 'resyncs': 0, 'replayed': 0}
+
+    @property
+    def event_bus(self) -> EventBus:
+        if self._event_bus is None:
+            self._event_bus = get_event_bus()
+        return self._event_bus
+
+    def _ensure_subscribed(self):
+        # 버스 구독은 처음 쓸 때 (import 시점에 디스패처 스레드를 띄우지 않도록)
+        if self._subscription is None:
+            with self._lock:
+                if self._subscription is None:
+                    self._subscription = self.event_bus.subscribe(self.topic, self._on_message)
+
+    # ==================== 발행 ====================
+
+    def publish(self, payload: Dict[str, Any]) -> Optional[str]:
+        """이벤트 발행 (모든 워커의 구독자에게 전달). 버스 메시지 ID 반환"""
+        self._ensure_subscribed()
+        return self.event_bus.publish(self.topic, payload)
+
+    def _on_message(self, message: BusMessage):
+        """버스 디스패처 스레드에서 호출: 한 번 직렬화해 모든 구독자 버퍼에 넣음"""
+        frame = format_event(message.payload, event_id=message.id)
+        with self._lock:
+            self._history.append((message.id, frame))
+            subscribers = list(self._subscribers.values())
+        for subscriber in subscribers:
+            subscriber.push(frame)
+        self.stats['published'] += 1
+        self.stats['fanned_out'] += len(subscribers)
+
+    # ==================== 구독 ====================
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Subscriber:
+        """구독자 등록. last_event_id가 있으면 그 이후 이벤트를 먼저 버퍼에 넣음"""
+        self._ensure_subscribed()
+        subscriber = Subscriber(self.subscriber_buffer)
+        after = None
+        if last_event_id:
+            try:
+                after = _id_key(last_event_id)
+            except ValueError:
+                after = None
+
+        replayed: List[Tuple[str, str]] = []
+        with self._lock:
+            covered = after is None or (bool(self._history) and _id_key(self._history[0][0]) <= after)
+            if covered:
+                # 이력과 등록을 같은 락 안에서 처리해 재전송과 새 이벤트 사이에 빠짐/중복이 없음
+                replayed = [(i, frame) for i, frame in self._history if after is not None and _id_key(i) > after]
+                self._register_locked(subscriber, replayed)
+        if not covered:
+            # 허브 이력이 그 시점까지 닿지 않으면(워커 시작 전 이벤트 등) 버스 이력에서 재전송
+            messages = self.event_bus.replay(self.topic, last_event_id, limit=self.history_size)
+            replayed = [(m.id, format_event(m.payload, event_id=m.id)) for m in messages]
+            with self._lock:
+                last = _id_key(replayed[-1][0]) if replayed else after
+                replayed += [(i, frame) for i, frame in self._history if _id_key(i) > last]
+                self._register_locked(subscriber, replayed)
+        self.stats['replayed'] += len(replayed)
+        return subscriber
+
+    def _register_locked(self, subscriber: Subscriber, replayed: List[Tuple[str, str]]):
+        for _, frame in replayed:
+            subscriber.push(frame)
+        self._subscribers[id(subscriber)] = subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        subscriber.closed = True
+        subscriber.ready.set()
+        with self._lock:
+            self._subscribers.pop(id(subscriber), None)
+
+    def stream(self, subscriber: Subscriber, initial: Iterable[str] = (),
+               heartbeat: Optional[float] = None) -> Iterator[str]:
+        """SSE 응답 본문 제너레이터. 연결이 끊기면(GeneratorExit) 구독 해제"""
+        heartbeat = self.heartbeat if heartbeat is None else heartbeat
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            for frame in initial:
+                yield frame
+            while not subscriber.closed:
+                if not subscriber.ready.wait(heartbeat):
+                    yield ": heartbeat\n\n"
+                    continue
+                subscriber.ready.clear()
+                frames, dropped = subscriber.drain()
+                if dropped:
+                    # 놓친 이벤트가 있으므로 클라이언트가 전체 데이터를 다시 받게 함
+                    self.stats['dropped'] += dropped
+                    self.stats['resyncs'] += 1
+                    yield format_event({'type': 'resync', 'dropped': dropped})
+                if frames:
+                    yield "".join(frames)
+        finally:
+            self.unsubscribe(subscriber)
+
+    def connect(self, last_event_id: Optional[str] = None,
+                initial: Optional[Callable[[Subscriber], Iterable[str]]] = None,
+                heartbeat: Optional[float] = None) -> Iterator[str]:
+        """구독부터 해제까지 맡는 SSE 응답 본문 제너레이터
+        구독은 첫 next()에서 하므로 응답이 시작 전에 닫혀도 구독자가 남지 않는다.
+        initial은 구독 직후 호출되어 처음 보낼 프레임을 돌려준다 (구독 후 만든 스냅샷이라 사이 이벤트가 빠지지 않음)"""
+        subscriber = self.subscribe(last_event_id)
+        try:
+            frames = list(initial(subscriber)) if initial else []
+        except BaseException:
+            self.unsubscribe(subscriber)
+            raise
+        yield from self.stream(subscriber, frames, heartbeat)
+
+    def close_all(self):
+        """모든 구독 종료 (서버 종료/테스트용)"""
+        with self._lock:
+            subscribers = list(self._subscribers.values())
+        for subscriber in subscribers:
+            self.unsubscribe(subscriber)
+
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            subscribers = list(self._subscribers.values())
+            history = len(self._history)
+        return {
+            **self.stats,
+            'topic': self.topic,
+            'subscribers': len(subscribers),
+            'buffered': sum(len(s.frames) for s in subscribers),
+            'history': history,
+        }
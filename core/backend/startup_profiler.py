@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+시작 프로파일러
+app.py import(워커 부팅)에 드는 시간을 모듈 import 단위와 초기화 단계 단위로 기록한다.
+
+- import 타이머: sys.meta_path 맨 앞에서 로더의 exec_module을 감싸 모듈별 누적/자체 시간과
+  RSS 증가량을 잰다 (누적 = 하위 import 포함, 자체 = 하위 import 제외)
+- 단계: checkpoint(name)는 직전 checkpoint 이후 걸린 시간, section(name)은 블록 시간을 기록
+- 서비스: 서비스 레지스트리의 지연 생성 시간도 보고서에 함께 포함
+
+STARTUP_PROFILE=1 로 켜거나 `python -m core.backend.startup_profiler --top 30` 으로 app을 import하며 측정한다.
+"""
+
+import argparse
+import importlib
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil
+    _process = psutil.Process()
+except Exception:  # psutil이 없으면 메모리 없이 시간만 기록
+    _process = None
+
+
+def _rss() -> int:
+    try:
+        return _process.memory_info().rss if _process is not None else 0
+    except Exception:
+        return 0
+
+
+class _TimedLoader:
+    """원래 로더를 감싸 exec_module 시간을 기록 (나머지 속성은 원래 로더로 넘김)"""
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, item):
+        return getattr(self._loader, item)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # 측정이 끝나면 원래 로더로 되돌려 importlib.resources 등이 실제 로더를 보게 함
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        with self._profiler._timed_import(module.__name__):
+            self._loader.exec_module(module)
+
+
+class _ImportTimingFinder:
+    """다른 finder가 찾은 spec의 로더를 _TimedLoader로 바꾸는 meta path finder"""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "busy", False):
+            return None
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.busy = False
+        if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _TimedLoader(spec.loader, self._profiler)
+        return spec
+
+
+class StartupProfiler:
+    """모듈 import와 초기화 단계의 시간/메모리 기록"""
+
+    def __init__(self):
+        self.enabled = False
+        self.started_at = time.perf_counter()
+        self.imports: Dict[str, Dict[str, float]] = {}
+        self.sections: List[Dict[str, Any]] = []
+        self._finder: Optional[_ImportTimingFinder] = None
+        self._stack = threading.local()
+        self._last_checkpoint = self.started_at
+        self._last_rss = _rss()
+        self._lock = threading.Lock()
+
+    # ==================== import 타이머 ====================
+
+    def install(self):
+        """import 타이머 설치 (이후 처음 import되는 모듈부터 기록)"""
+        if self._finder is not None:
+            return
+        self.enabled = True
+        self.started_at = self._last_checkpoint = time.perf_counter()
+        self._last_rss = _rss()
+        self._finder = _ImportTimingFinder(self)
+        sys.meta_path.insert(0, self._finder)
+        logger.info("시작 프로파일러 설치")
+
+    def uninstall(self):
+        if self._finder is not None and self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    @contextmanager
+    def _timed_import(self, name: str):
+        stack = getattr(self._stack, "frames", None)
+        if stack is None:
+            stack = self._stack.frames = []
+        frame = {"children": 0.0}
+        stack.append(frame)
+        rss_before = _rss()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1]["children"] += elapsed
+            with self._lock:
+                self.imports[name] = {
+                    "cumulative": elapsed,
+                    "self": max(0.0, elapsed - frame["children"]),
+                    "rss_delta": _rss() - rss_before,
+                    "depth": len(stack),
+                }
+
+    # ==================== 초기화 단계 ====================
+
+    def checkpoint(self, name: str):
+        """직전 checkpoint(또는 설치 시점) 이후 걸린 시간을 name 단계로 기록"""
+        if not self.enabled:
+            return
+        now, rss = time.perf_counter(), _rss()
+        self._add_section(name, now - self._last_checkpoint, rss - self._last_rss)
+        self._last_checkpoint, self._last_rss = now, rss
+
+    @contextmanager
+    def section(self, name: str):
+        """with 블록 시간을 name 단계로 기록"""
+        if not self.enabled:
+            yield
+            return
+        rss_before = _rss()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add_section(name, time.perf_counter() - start, _rss() - rss_before)
+
+    def _add_section(self, name: str, elapsed: float, rss_delta: int):
+        with self._lock:
+            self.sections.append({"name": name, "time": elapsed, "rss_delta": rss_delta})
+
+    # ==================== 보고서 ====================
+
+    def report(self, top: int = 20) -> Dict[str, Any]:
+        """단계별 시간, 자체 시간 기준 상위 모듈, 서비스 생성 시간"""
+        from core.backend.service_registry import service_registry
+
+        with self._lock:
+            imports = sorted(self.imports.items(), key=lambda item: item[1]["self"], reverse=True)
+            sections = list(self.sections)
+        roots = [stats for stats in self.imports.values() if stats["depth"] == 0]
+        return {
+            "enabled": self.enabled,
+            "elapsed": time.perf_counter() - self.started_at,
+            "rss": _rss(),
+            "modules": len(imports),
+            "import_time": sum(stats["cumulative"] for stats in roots),
+            "sections": sections,
+            "imports": [{"module": name, **stats} for name, stats in imports[:top]],
+            "services": service_registry.status(),
+        }
+
+    def format_report(self, top: int = 20) -> str:
+        report = self.report(top)
+        lines = [
+            f"시작 시간 {report['elapsed'] * 1000:.0f}ms | 모듈 {report['modules']}개 import "
+            f"{report['import_time'] * 1000:.0f}ms | RSS {report['rss'] / 1048576:.1f}MB",
+            "[단계]",
+        ]
+        for section in report["sections"]:
+            lines.append(f"  {section['name']:<40} {section['time'] * 1000:9.1f}ms "
+                         f"{section['rss_delta'] / 1048576:+8.1f}MB")
+        lines.append(f"[import 상위 {top}개 (자체 시간 기준)]")
+        for item in report["imports"]:
+            lines.append(f"  {item['module']:<50} 자체 {item['self'] * 1000:8.1f}ms "
+                         f"누적 {item['cumulative'] * 1000:8.1f}ms {item['rss_delta'] / 1048576:+7.1f}MB")
+        services = report["services"]
+        lines.append(f"[서비스] 등록 {services['registered']}개, 생성 {services['loaded']}개")
+        for name, service in services["services"].items():
+            state = f"{service['init_time'] * 1000:.1f}ms" if service["loaded"] else "미생성"
+            lines.append(f"  {name:<40} {state}")
+        return "\n".join(lines)
+
+    def log_report(self, top: int = 20):
+        if self.enabled:
+            logger.info("시작 프로파일\n" + self.format_report(top))
+
+
+# 전역 시작 프로파일러
+startup_profiler = StartupProfiler()
+
+if os.environ.get("STARTUP_PROFILE") == "1":
+    startup_profiler.install()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="앱 import(워커 부팅) 비용 측정")
+    parser.add_argument("--module", default="app", help="측정할 모듈 (기본: app)")
+    parser.add_argument("--top", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    # -m 으로 실행하면 이 파일은 __main__ 이므로, app.py가 쓰는 것과 같은 모듈의 인스턴스를 사용
+    profiler = importlib.import_module("core.backend.startup_profiler").startup_profiler
+    profiler.install()
+    importlib.import_module(args.module)
+    profiler.checkpoint("마무리")
+    print(profiler.format_report(args.top))
+
+
+if __name__ == "__main__":
+    main()
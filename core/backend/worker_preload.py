@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+gunicorn --preload 모드 지원
+마스터가 app을 한 번만 import(테이블 생성, 시드, 블루프린트 등록, 읽기 전용 서비스 생성)하고
+워커는 포크로 그 메모리를 copy-on-write로 공유한다.
+
+- 스레드는 포크 후 자식에 남지 않으므로 IoT 시뮬레이터, 작업 스케줄러, 쿼리 최적화기 같은
+  백그라운드 서비스는 마스터에서 띄우지 않고 워커마다 post_fork에서 시작한다 (APP_PRELOAD=1)
+- 포크 직전 gc.freeze()로 마스터 객체를 GC 대상에서 빼서, 워커의 GC가 참조 카운트/GC 헤더를
+  건드려 공유 페이지를 복사하는 일을 줄인다
+- app import 중 작업을 등록하면 마스터에서 작업 스케줄러가 이미 시작되므로, 포크 전에 멈추고 리더 락을
+  놓는다 (등록된 작업은 그대로 두고 워커의 after_fork에서 다시 시작)
+- DB 연결 풀은 소켓을 공유하면 안 되므로 포크 전후로 버린다
+- 공용 이벤트 버스는 os.register_at_fork 훅으로 자식에서 전달 큐/락을 새로 만들고 디스패처를 다시 띄운다
+
+gunicorn.conf.py 예:
+    preload_app = True
+    raw_env = ["APP_PRELOAD=1"]
+    from core.backend.worker_preload import when_ready, post_fork
+"""
+
+import gc
+import logging
+import os
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+PRELOAD_ENV = "APP_PRELOAD"
+
+
+def is_preload() -> bool:
+    """마스터가 app을 미리 import하고 워커를 포크하는 모드인지"""
+    return os.environ.get(PRELOAD_ENV) == "1"
+
+
+def _dispose_engine():
+    try:
+        from app import app
+        from extensions import db
+
+        with app.app_context():
+            db.engine.dispose()
+    except Exception as e:
+        logger.warning(f"DB 연결 풀 정리 실패: {e}")
+
+
+def _stop_scheduler():
+    """마스터의 작업 스케줄러를 멈추고 리더 락을 놓음 (마스터가 singleton 작업을 가져가지 않도록)"""
+    from core.backend.job_scheduler import job_scheduler
+
+    job_scheduler.stop(wait=False)
+    if job_scheduler.leader_lock is not None:
+        job_scheduler.leader_lock.release()
+
+
+def prepare_for_fork() -> Dict[str, Any]:
+    """마스터에서 워커를 포크하기 전에 호출: 공유 서비스 생성, 스케줄러 정지, 연결 정리, GC freeze"""
+    from core.backend.service_registry import service_registry
+
+    timings = service_registry.preload(shared_only=True)
+    # 작업 스레드가 연결을 다시 열지 않도록 연결 정리 전에 멈춤
+    _stop_scheduler()
+    _dispose_engine()
+    gc.collect()
+    frozen = 0
+    if hasattr(gc, "freeze"):  # Python 3.7+
+        gc.freeze()
+        frozen = gc.get_freeze_count()
+    logger.info(f"preload 완료: 공유 서비스 {len(timings)}개, GC freeze 객체 {frozen}개")
+    return {"services": timings, "frozen_objects": frozen}
+
+
+def after_fork():
+    """워커 프로세스에서 포크 직후 호출: 물려받은 상태 정리 후 백그라운드 서비스 시작"""
+    from core.backend.job_scheduler import job_scheduler
+
+    _dispose_engine()
+    job_scheduler.after_fork()
+    try:
+        from app import start_background_services
+
+        start_background_services()
+    except Exception as e:
+        logger.error(f"워커 백그라운드 서비스 시작 실패: {e}")
+
+
+# ==================== gunicorn 훅 ====================
+
+def when_ready(server):
+    """마스터 준비 완료 (preload_app이면 app import가 끝난 뒤, 워커 포크 전)"""
+    if server.cfg.preload_app:
+        prepare_for_fork()
+
+
+def post_fork(server, worker):
+    if server.cfg.preload_app:
+        after_fork()
@@ -1,3 +1,5 @@
+import os
+
 from flask_caching import Cache
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -14,11 +16,20 @@ migrate = Migrate()
 # 로그인 매니저
 login_manager = LoginManager()
 
-# 요청 제한 (메모리 저장소 명시적 설정)
+# 요청 제한 저장소: RATE_LIMIT_BACKEND=redis 이면 워커 간 공유 (core.backend.rate_limiter와 같은 설정)
+RATE_LIMIT_STORAGE_URI = (
+    os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+    if os.environ.get("RATE_LIMIT_BACKEND", "memory") == "redis"
+    else "memory://"
+)
+
+# 요청 제한 (슬라이딩 윈도 카운터: 키마다 카운터 2개로 O(1), Redis 장애 시 메모리로 대체)
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://",  # 메모리 저장소 명시적 설정
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy="sliding-window-counter",
+    in_memory_fallback_enabled=True,
 )
 
 # 캐싱
@@ -1,123 +1,147 @@
-from app import Attendance, AttendanceReport, User, db
+from datetime import datetime, timedelta
+
+from flask import Blueprint, abort, flash, redirect, request, send_file, url_for
 from flask_login import current_user, login_required
-from flask import (Blueprint, flash, jsonify, redirect, render_template,
-                   request, send_file, url_for)
-import pdfkit
-import pandas as pd
-from datetime import datetime
-import io
-args = None  # pyright: ignore
-query = None  # pyright: ignore
+from sqlalchemy import case, func
+from sqlalchemy.orm import joinedload
 
+from core.backend.export_engine import (ExportColumn, ExportSheet, ExportSpec, export_jobs,
+                                        export_response, job_response, stream_query)
+from models_main import Attendance, Team, User
 
 admin_dashboard_export_bp = Blueprint("admin_dashboard_export", __name__)
 
+# 근태 내보내기 열 (직원/팀은 joinedload로 함께 읽음)
+ATTENDANCE_COLUMNS = [
+    ExportColumn("일자", lambda r: r.clock_in.strftime("%Y-%m-%d") if r.clock_in else "", 12),
+    ExportColumn("직원", lambda r: r.user.name or r.user.username, 14),
+    ExportColumn("팀", lambda r: r.user.team.name if r.user.team else "", 10),
+    ExportColumn("사유", lambda r: r.reason or "", 24),
+    ExportColumn("출근시간", lambda r: r.clock_in.strftime("%H:%M") if r.clock_in else "", 10),
+    ExportColumn("퇴근시간", lambda r: r.clock_out.strftime("%H:%M") if r.clock_out else "", 10),
+    ExportColumn("상태", lambda r: r.status or "", 10),
+]
+
+
+def _can_export():
+    return current_user.is_admin() or current_user.is_manager()
 
-@admin_dashboard_export_bp.route("/admin_dashboard/export_excel")
-@login_required
-def export_admin_dashboard_excel():
-    if not current_user.is_admin() and not current_user.is_teamlead():
-        flash("관리자/팀장 권한이 필요합니다.", "error")
-        return redirect(url_for("dashboard"))
 
-    # 기존 필터 파라미터 재사용
-    team = request.args.get("team")
-    user_id = request.args.get("user_id")
-    date_from = request.args.get("from")
-    date_to = request.args.get("to")
+def _attendance_filters():
+    # 대시보드 필터 파라미터 재사용
+    return {
+        "team": request.args.get("team"),
+        "user_id": request.args.get("user_id"),
+        "date_from": request.args.get("from"),
+        "date_to": request.args.get("to"),
+    }
 
+
+def _attendance_query(team=None, user_id=None, date_from=None, date_to=None):
     q = Attendance.query
     if team:
-        q = q.join(User).filter(User.team == team)
+        q = q.join(User, Attendance.user_id == User.id).join(Team, User.team_id == Team.id).filter(Team.name == team)
     if user_id:
-        q = q.filter_by(user_id=int(user_id))
+        q = q.filter(Attendance.user_id == int(user_id))
     if date_from:
-        q = q.filter(Attendance.date >= date_from)
+        q = q.filter(Attendance.clock_in >= datetime.strptime(date_from, "%Y-%m-%d"))
     if date_to:
-        q = q.filter(Attendance.date <= date_to)
-    records = q.order_by(Attendance.date.desc()).limit(100).all()
-
-    data = [
-        {
-            "일자": r.date,
-            "직원": r.user.name or r.user.username,
-            "팀": r.user.team or "",
-            "사유": r.reason or "",
-            "출근시간": r.clock_in.strftime("%H:%M") if r.clock_in else "",
-            "퇴근시간": r.clock_out.strftime("%H:%M") if r.clock_out else "",
-            "상태": r.status or "",
-        }
-        for r in records
-    ]
-
-    df = pd.DataFrame(data)
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-        df.to_excel(writer, index=False, sheet_name="근태데이터")
-
-        # 통계 시트 추가
-        stats_data = []
-        if records:
-            total_records = len(records)
-            late_count = len([r for r in records if "지각" in (r.reason or "")])
-            absent_count = len([r for r in records if "결근" in (r.reason or "")])
-
-            stats_data = [
-                {"구분": "총 기록수", "수량": total_records},
-                {"구분": "지각", "수량": late_count},
-                {"구분": "결근", "수량": absent_count},
-                {"구분": "정상출근", "수량": total_records - late_count - absent_count},
-            ]
-
-        stats_df = pd.DataFrame(stats_data)
-        stats_df.to_excel(writer, index=False, sheet_name="통계")
-
-    output.seek(0)
-    return send_file(output, download_name="dashboard_export.xlsx", as_attachment=True)
+        q = q.filter(Attendance.clock_in < datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1))
+    return q
+
+
+def _attendance_stats(filters):
+    """총 기록/지각/결근 수를 집계 쿼리 한 번으로"""
+    total, late, absent = _attendance_query(**filters).with_entities(
+        func.count(Attendance.id),
+        func.sum(case((Attendance.reason.like("%지각%"), 1), else_=0)),
+        func.sum(case((Attendance.reason.like("%결근%"), 1), else_=0)),
+    ).one()
+    late, absent = late or 0, absent or 0
+    return {
+        "total_records": total,
+        "late_count": late,
+        "absent_count": absent,
+        "normal_count": total - late - absent,
+    }
+
+
+def attendance_export_spec(filters):
+    """근태 내보내기 정의 (행은 yield_per로 스트리밍)"""
+    def rows():
+        q = _attendance_query(**filters).options(joinedload(Attendance.user).joinedload(User.team))
+        return stream_query(q.order_by(Attendance.clock_in.desc(), Attendance.id.desc()))
+
+    def stats_rows():
+        stats = _attendance_stats(filters)
+        return [("총 기록수", stats["total_records"]), ("지각", stats["late_count"]),
+                ("결근", stats["absent_count"]), ("정상출근", stats["normal_count"])]
+
+    def count():
+        return _attendance_query(**filters).order_by(None).count()
+
+    summary = [f"기간: {filters['date_from'] or '-'} ~ {filters['date_to'] or '-'}"]
+    if filters["team"]:
+        summary.append(f"팀: {filters['team']}")
+    return ExportSpec(
+        filename="dashboard_export",
+        title="근태 데이터",
+        sheets=[
+            ExportSheet("근태데이터", ATTENDANCE_COLUMNS, rows),
+            ExportSheet("통계", [ExportColumn("구분", lambda r: r[0]), ExportColumn("수량", lambda r: r[1])],
+                        stats_rows),
+        ],
+        count=count,
+        summary=summary,
+    )
+
+
+def _export(fmt):
+    if not _can_export():
+        flash("관리자/팀장 권한이 필요합니다.", "error")
+        return redirect(url_for("dashboard"))
+    filters = _attendance_filters()
+    background = request.args.get("background") == "1" or None
+    return export_response(attendance_export_spec(filters), fmt, owner_id=current_user.id, background=background)
+
+
+@admin_dashboard_export_bp.route("/admin_dashboard/export_excel")
+@login_required
+def export_admin_dashboard_excel():
+    return _export("xlsx")
+
+
+@admin_dashboard_export_bp.route("/admin_dashboard/export_csv")
+@login_required
+def export_admin_dashboard_csv():
+    return _export("csv")
 
 
 @admin_dashboard_export_bp.route("/admin_dashboard/export_pdf")
 @login_required
 def export_admin_dashboard_pdf():
-    if not current_user.is_admin() and not current_user.is_teamlead():
-        flash("관리자/팀장 권한이 필요합니다.", "error")
-        return redirect(url_for("dashboard"))
+    return _export("pdf")
 
-    # 기존 필터 파라미터 재사용
-    team = request.args.get("team")
-    user_id = request.args.get("user_id")
-    date_from = request.args.get("from")
-    date_to = request.args.get("to")
 
-    q = Attendance.query
-    if team:
-        q = q.join(User).filter(User.team == team)
-    if user_id:
-        q = q.filter_by(user_id=int(user_id))
-    if date_from:
-        q = q.filter(Attendance.date >= date_from)
-    if date_to:
-        q = q.filter(Attendance.date <= date_to)
-    records = q.order_by(Attendance.date.desc()).limit(100).all()
-
-    # 통계 계산
-    stats = {}
-    if records:
-        stats["total_records"] = len(records)
-        stats["late_count"] = len([r for r in records if "지각" in (r.reason or "")])
-        stats["absent_count"] = len([r for r in records if "결근" in (r.reason or "")])
-        stats["normal_count"] = stats["total_records"] - stats["late_count"] - stats["absent_count"]
-
-    html = render_template(
-        "admin_dashboard_pdf.html",
-        records=records,
-        stats=stats,
-        team=team,
-        user_id=user_id,
-        date_from=date_from,
-        date_to=date_to,
-    )
-    pdf = pdfkit.from_string(html, False)
-    return send_file(
-        io.BytesIO(pdf), download_name="dashboard_export.pdf", as_attachment=True
-    )
+# 백그라운드 내보내기 상태/다운로드 (큰 기간의 Excel 내보내기)
+
+def _own_job(job_id):
+    job = export_jobs.get(job_id)
+    if job is None or (job.owner_id is not None and job.owner_id != current_user.id and not current_user.is_admin()):
+        abort(404)
+    return job
+
+
+@admin_dashboard_export_bp.route("/admin_dashboard/exports/<job_id>")
+@login_required
+def export_job_status(job_id):
+    return job_response(_own_job(job_id))
+
+
+@admin_dashboard_export_bp.route("/admin_dashboard/exports/<job_id>/download")
+@login_required
+def export_job_download(job_id):
+    job = _own_job(job_id)
+    if job.status != "done":
+        return job_response(job)
+    return send_file(export_jobs.file_path(job), as_attachment=True, download_name=job.filename)
@@ -5,6 +5,8 @@ from models_main import (Attendance, AttendanceReport, Notification, Order,
                          SystemLog, User)
 from extensions import db
 from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import joinedload
+from core.backend.export_engine import ExportColumn, ExportSheet, ExportSpec, export_response, stream_query
 from reportlab.pdfgen import canvas  # pyright: ignore
 from reportlab.lib.units import inch  # pyright: ignore
 from reportlab.lib.pagesizes import A4  # pyright: ignore
@@ -437,198 +439,94 @@ def admin_report_reply(report_id):
         return redirect(url_for("admin_reports.admin_reports"))
 
 
-@admin_reports_bp.route("/admin_dashboard/reports/export_excel")
-@login_required
-@admin_required
-def export_reports_excel():
-    """신고/이의제기 엑셀 내보내기"""
-    try:
-        # 필터 파라미터 (목록과 동일)
-        status = request.args.get() if args else None"status", "") if args else None
-        user_id = request.args.get() if args else None"user_id", "") if args else None
-        dispute_type = request.args.get() if args else None"dispute_type", "") if args else None
-        date_from = request.args.get() if args else None"date_from", "") if args else None
-        date_to = request.args.get() if args else None"date_to", "") if args else None
-
-        # 쿼리 구성
-        query = AttendanceReport.query
-
-        if status:
-            query = query.filter(AttendanceReport.status == status)
-        if user_id:
-            query = query.filter(AttendanceReport.user_id == int(user_id))
-        if dispute_type:
-            query = query.filter(AttendanceReport.dispute_type == dispute_type)
-        if date_from:
-            query = query.filter(
-                AttendanceReport.created_at >= datetime.strptime(date_from, "%Y-%m-%d")
-            )
-        if date_to:
-            query = query.filter(
-                AttendanceReport.created_at
-                <= datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1)
-            )
-
-        reports = query.order_by(AttendanceReport.created_at.desc()).all()
-
-        # 엑셀 데이터 구성
-        data = []
-        for r in reports if reports is not None:
-            data.append(
-                {
-                    "신고일시": r.created_at.strftime("%Y-%m-%d %H:%M"),
-                    "직원명": r.user.name or r.user.username,
-                    "출결일": (
-                        r.attendance.clock_in.strftime("%Y-%m-%d")
-                        if r.attendance
-                        else ""
-                    ),
-                    "신고유형": "신고" if r.dispute_type == "report" else "이의제기",
-                    "신고내용": r.reason,
-                    "상태": r.status,
-                    "관리자답변": r.admin_reply or "",
-                    "답변일시": (
-                        r.updated_at.strftime("%Y-%m-%d %H:%M") if r.admin_reply else ""
-                    ),
-                    "처리관리자": r.admin.name if r.admin else "",
-                }
-            )
-
-        # DataFrame 생성 및 엑셀 저장
-        df = pd.DataFrame(data)
-        output = io.BytesIO()
-
-        with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-            df.to_excel(writer, sheet_name="신고이의제기", index=False)
-
-            # 워크시트 가져오기
-            worksheet = writer.sheets["신고이의제기"] if sheets is not None else None
-
-            # 열 너비 자동 조정
-            for i, col in enumerate(df.columns):
-                max_len = max(df[col] if df is not None else None.astype(str).apply(len).max(), len(col))
-                worksheet.set_column(i, i, max_len + 2)
-
-        output.seek(0)
+# 신고/이의제기 내보내기 열 (직원/처리 관리자는 joinedload로 함께 읽음)
+REPORT_EXPORT_COLUMNS = [
+    ExportColumn("신고일시", lambda r: r.created_at.strftime("%Y-%m-%d %H:%M") if r.created_at else "", 16),
+    ExportColumn("직원명", lambda r: (r.user.name or r.user.username) if r.user else "", 12),
+    ExportColumn("대상기간", lambda r: f"{r.period_from} ~ {r.period_to}", 22),
+    ExportColumn("신고유형", lambda r: "신고" if r.dispute_type == "report" else "이의제기", 10),
+    ExportColumn("신고내용", lambda r: r.comment or "", 40),
+    ExportColumn("상태", lambda r: r.status or "", 10),
+    ExportColumn("관리자답변", lambda r: r.admin_reply or "", 40),
+    ExportColumn("답변일시", lambda r: r.updated_at.strftime("%Y-%m-%d %H:%M") if r.admin_reply and r.updated_at else "", 16),
+    ExportColumn("처리관리자", lambda r: r.admin.name if r.admin else "", 12),
+]
+
+
+def _report_export_filters():
+    """목록과 같은 필터 파라미터"""
+    return {key: request.args.get(key, "") for key in ("status", "user_id", "dispute_type", "date_from", "date_to")}
+
+
+def _report_export_query(status="", user_id="", dispute_type="", date_from="", date_to=""):
+    query = AttendanceReport.query
+    if status:
+        query = query.filter(AttendanceReport.status == status)
+    if user_id:
+        query = query.filter(AttendanceReport.user_id == int(user_id))
+    if dispute_type:
+        query = query.filter(AttendanceReport.dispute_type == dispute_type)
+    if date_from:
+        query = query.filter(AttendanceReport.created_at >= datetime.strptime(date_from, "%Y-%m-%d"))
+    if date_to:
+        query = query.filter(
+            AttendanceReport.created_at <= datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1)
+        )
+    return query
 
-        # 파일명 생성
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"신고이의제기_내보내기_{timestamp}.xlsx"
 
-        return send_file(
-            output,
-            download_name=filename,
-            as_attachment=True,
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+def report_export_spec(filters):
+    """신고/이의제기 내보내기 정의 (행은 yield_per로 스트리밍)"""
+    def rows():
+        query = _report_export_query(**filters).options(
+            joinedload(AttendanceReport.user), joinedload(AttendanceReport.admin)
         )
+        return stream_query(query.order_by(AttendanceReport.created_at.desc(), AttendanceReport.id.desc()))
+
+    total = _report_export_query(**filters).order_by(None).count()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return ExportSpec(
+        filename=f"신고이의제기_내보내기_{timestamp}",
+        title="신고/이의제기 관리 리포트",
+        sheets=[ExportSheet("신고이의제기", REPORT_EXPORT_COLUMNS, rows)],
+        count=lambda: total,
+        summary=[f"총 건수: {total:,}건"],
+    )
+
 
+def _export_reports(fmt, label):
+    try:
+        background = request.args.get("background") == "1" or None
+        return export_response(report_export_spec(_report_export_filters()), fmt,
+                               owner_id=current_user.id, background=background)
     except Exception as e:
         log_error(e, current_user.id)
-        flash("엑셀 내보내기 중 오류가 발생했습니다.", "error")
+        flash(f"{label} 내보내기 중 오류가 발생했습니다.", "error")
         return redirect(url_for("admin_reports.admin_reports"))
 
 
-@admin_reports_bp.route("/admin_dashboard/reports/export_pdf")
+@admin_reports_bp.route("/admin_dashboard/reports/export_excel")
 @login_required
 @admin_required
-def export_reports_pdf():
-    """신고/이의제기 PDF 내보내기"""
-    try:
-        # 필터 파라미터 (목록과 동일)
-        status = request.args.get() if args else None"status", "") if args else None
-        user_id = request.args.get() if args else None"user_id", "") if args else None
-        dispute_type = request.args.get() if args else None"dispute_type", "") if args else None
-        date_from = request.args.get() if args else None"date_from", "") if args else None
-        date_to = request.args.get() if args else None"date_to", "") if args else None
-
-        # 쿼리 구성
-        query = AttendanceReport.query
-
-        if status:
-            query = query.filter(AttendanceReport.status == status)
-        if user_id:
-            query = query.filter(AttendanceReport.user_id == int(user_id))
-        if dispute_type:
-            query = query.filter(AttendanceReport.dispute_type == dispute_type)
-        if date_from:
-            query = query.filter(
-                AttendanceReport.created_at >= datetime.strptime(date_from, "%Y-%m-%d")
-            )
-        if date_to:
-            query = query.filter(
-                AttendanceReport.created_at
-                <= datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1)
-            )
-
-        reports = query.order_by(AttendanceReport.created_at.desc()).all()
-
-        # PDF 생성
-        output = io.BytesIO()
-        c = canvas.Canvas(output, pagesize=A4)
-
-        # 제목
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(50, 800, "신고/이의제기 관리 리포트")
-
-        # 생성 정보
-        c.setFont("Helvetica", 10)
-        c.drawString(50, 780, f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-        c.drawString(50, 760, f"총 건수: {len(reports)}건")
-
-        # 테이블 헤더
-        y_position = 720
-        headers = ["신고일시", "직원명", "신고유형", "상태", "신고내용"]
-        x_positions = [50, 120, 200, 280, 350]
-
-        c.setFont("Helvetica-Bold", 9)
-        for i, header in enumerate(headers):
-            c.drawString(x_positions[i] if x_positions is not None else None, y_position, header)
-
-        # 데이터 행
-        y_position -= 20
-        c.setFont("Helvetica", 8)
-
-        for report in reports if reports is not None:
-            if y_position < 50:  # 페이지 끝 도달 시 새 페이지
-                c.showPage()
-                y_position = 750
-                c.setFont("Helvetica", 8)
-
-            row_data = [
-                report.created_at.strftime("%m-%d %H:%M"),
-                report.user.name or report.user.username,
-                "신고" if report.dispute_type == "report" else "이의제기",
-                report.status,
-                (
-                    report.reason[:30] if reason is not None else None + "..."
-                    if len(report.reason) > 30
-                    else report.reason
-                ),
-            ]
-
-            for i, data in enumerate(row_data):
-                c.drawString(x_positions[i] if x_positions is not None else None, y_position, str(data))
-
-            y_position -= 15
+def export_reports_excel():
+    """신고/이의제기 엑셀 내보내기"""
+    return _export_reports("xlsx", "엑셀")
 
-        c.save()
-        output.seek(0)
 
-        # 파일명 생성
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"신고이의제기_리포트_{timestamp}.pdf"
+@admin_reports_bp.route("/admin_dashboard/reports/export_csv")
+@login_required
+@admin_required
+def export_reports_csv():
+    """신고/이의제기 CSV 내보내기"""
+    return _export_reports("csv", "CSV")
 
-        return send_file(
-            output,
-            download_name=filename,
-            as_attachment=True,
-            mimetype="application/pdf",
-        )
 
-    except Exception as e:
-        log_error(e, current_user.id)
-        flash("PDF 내보내기 중 오류가 발생했습니다.", "error")
-        return redirect(url_for("admin_reports.admin_reports"))
+@admin_reports_bp.route("/admin_dashboard/reports/export_pdf")
+@login_required
+@admin_required
+def export_reports_pdf():
+    """신고/이의제기 PDF 내보내기"""
+    return _export_reports("pdf", "PDF")
 
 
 @admin_reports_bp.route("/admin_dashboard/reports/stats")
@@ -1,6 +1,5 @@
 import random
 from datetime import datetime, timedelta
-import json
 from flask import Blueprint, render_template, jsonify, request
 form = None  # pyright: ignore
 
@@ -11,11 +10,9 @@ marketplace_demo_bp = Blueprint('marketplace_demo', __name__)
 def demo_module(module_id):
     """모듈 데모 페이지"""
     try:
-        # 플러그인 정보 로드
-        with open('marketplace/plugins.json', 'r', encoding='utf-8') as f:
-            plugins = json.load(f)
-
-        plugin = next((p for p in plugins if (p is not None and p.get('id') == module_id)), None)
+        # 플러그인 정보 로드 (스냅샷 파일에 아직 합쳐지지 않은 변경 로그까지 반영)
+        from core.backend.plugin_marketplace import PluginMarketplace
+        plugin = PluginMarketplace('marketplace').get_plugin_details(module_id)
         if not plugin:
             return render_template('errors/404.html'), 404
 
@@ -6,63 +6,40 @@ from datetime import date, datetime, timedelta
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
-from sqlalchemy import and_, extract, func
+from sqlalchemy import and_, case, func
+from sqlalchemy.orm import joinedload
 
+from core.backend.job_scheduler import job_scheduler
 from models_main import Attendance, AttendanceReport, SystemLog, User, db, Notification
 from models_main import Staff, Contract, HealthCertificate
 from utils.auto_processor import auto_processor
 
 # from utils.backup_manager import backup_manager  # 삭제된 파일
 from utils.email_utils import email_service
-from utils.notify import send_notification_enhanced
-import schedule
+from utils.notify import bulk_create_notifications, send_notification_enhanced
 
 logger = logging.getLogger(__name__)
 
 
 class AttendanceScheduler:
-    def __init__(self):
-        self.scheduler = BackgroundScheduler()
-        self.setup_jobs()
+    # (작업 이름, 메서드, 시각, 조건) - 알림/리포트 발송이라 여러 워커 중 한 프로세스에서만 실행
+    JOBS = (
+        ("attendance.weekly_report", "send_weekly_report", "08:00", {"weekday": 0}),  # 매주 월요일
+        ("attendance.monthly_report", "send_monthly_report", "09:00", {"monthday": 1}),  # 매월 1일
+        ("attendance.attendance_alerts", "check_attendance_alerts", "07:00", {}),  # 매일 출근 알림 체크
+        ("attendance.leave_alerts", "check_leave_alerts", "18:00", {}),  # 매일 퇴근 알림 체크
+    )
+
+    def __init__(self, scheduler=None):
+        self.scheduler = scheduler or job_scheduler
+        self.running = False
 
     def setup_jobs(self):
-        """스케줄 작업 설정"""
+        """스케줄 작업 등록"""
         try:
-            # 매주 월요일 오전 8시에 주간 리포트 발송
-            self.scheduler.add_job(
-                self.send_weekly_report,
-                CronTrigger(day_of_week="mon", hour=8),
-                id="weekly_report",
-                name="주간 근태 리포트 발송",
-                replace_existing=True,
-            )
-
-            # 매월 1일 오전 9시에 월간 리포트 발송
-            self.scheduler.add_job(
-                self.send_monthly_report,
-                CronTrigger(day=1, hour=9),
-                id="monthly_report",
-                name="월간 근태 리포트 발송",
-                replace_existing=True,
-            )
-
-            # 매일 오전 7시에 출근 알림 체크
-            self.scheduler.add_job(
-                self.check_attendance_alerts,
-                CronTrigger(hour=7),
-                id="attendance_alerts",
-                name="출근 알림 체크",
-                replace_existing=True,
-            )
-
-            # 매일 오후 6시에 퇴근 알림 체크
-            self.scheduler.add_job(
-                self.check_leave_alerts,
-                CronTrigger(hour=18),
-                id="leave_alerts",
-                name="퇴근 알림 체크",
-                replace_existing=True,
-            )
+            for name, method, at, conditions in self.JOBS:
+                self.scheduler.add_job(name, getattr(self, method), daily_at=at, singleton=True,
+                                       app_context=True, **conditions)
 
             logger.info("스케줄러 작업이 설정되었습니다.")
 
@@ -72,8 +49,9 @@ class AttendanceScheduler:
     def start(self):
         """스케줄러 시작"""
         try:
-            if not self.scheduler.running:
-                self.scheduler.start()
+            if not self.running:
+                self.setup_jobs()
+                self.running = True
                 logger.info("스케줄러가 시작되었습니다.")
         except Exception as e:
             logger.error(f"스케줄러 시작 중 오류: {str(e)}")
@@ -81,8 +59,10 @@ class AttendanceScheduler:
     def stop(self):
         """스케줄러 중지"""
         try:
-            if self.scheduler.running:
-                self.scheduler.shutdown()
+            if self.running:
+                for name, *_ in self.JOBS:
+                    self.scheduler.remove_job(name)
+                self.running = False
                 logger.info("스케줄러가 중지되었습니다.")
         except Exception as e:
             logger.error(f"스케줄러 중지 중 오류: {str(e)}")
@@ -147,60 +127,7 @@ class AttendanceScheduler:
             # 지난 주 데이터
             end_date = date.today()
             start_date = end_date - timedelta(days=7)
-
-            # 근태 데이터 조회
-            records = Attendance.query.filter(
-                and_(Attendance.clock_in >= start_date, Attendance.clock_in <= end_date)
-            ).all()
-
-            # 통계 계산
-            stats = {
-                "period": f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}",
-                "total_records": len(records),
-                "total_hours": 0,
-                "late_count": 0,
-                "early_leave_count": 0,
-                "absent_count": 0,
-                "users": {},
-            }
-
-            for record in records:
-                user_id = record.user_id
-                if user_id not in stats["users"]:
-                    stats["users"][user_id] = {
-                        "name": record.user.name or record.user.username,
-                        "days": 0,
-                        "hours": 0,
-                        "late": 0,
-                        "early_leave": 0,
-                    }
-
-                user_stats = stats["users"][user_id]
-                user_stats["days"] += 1
-
-                if record.clock_in and record.clock_out:
-                    work_seconds = (record.clock_out - record.clock_in).total_seconds()
-                    work_hours = work_seconds / 3600
-                    stats["total_hours"] += work_hours
-                    user_stats["hours"] += work_hours
-
-                    # 지각/조퇴 판정
-                    if (
-                        record.clock_in.time()
-                        > datetime.strptime("09:00", "%H:%M").time()
-                    ):
-                        stats["late_count"] += 1
-                        user_stats["late"] += 1
-                    if (
-                        record.clock_out.time()
-                        < datetime.strptime("18:00", "%H:%M").time()
-                    ):
-                        stats["early_leave_count"] += 1
-                        user_stats["early_leave"] += 1
-                else:
-                    stats["absent_count"] += 1
-
-            return stats
+            return self._build_report_data(start_date, end_date)
 
         except Exception as e:
             logger.error(f"주간 리포트 데이터 생성 중 오류: {str(e)}")
@@ -212,65 +139,73 @@ class AttendanceScheduler:
             # 이번 달 데이터
             start_date = date.today().replace(day=1)
             end_date = date.today()
-
-            # 근태 데이터 조회
-            records = Attendance.query.filter(
-                and_(Attendance.clock_in >= start_date, Attendance.clock_in <= end_date)
-            ).all()
-
-            # 통계 계산 (주간과 동일한 로직)
-            stats = {
-                "period": f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}",
-                "total_records": len(records),
-                "total_hours": 0,
-                "late_count": 0,
-                "early_leave_count": 0,
-                "absent_count": 0,
-                "users": {},
-            }
-
-            for record in records:
-                user_id = record.user_id
-                if user_id not in stats["users"]:
-                    stats["users"][user_id] = {
-                        "name": record.user.name or record.user.username,
-                        "days": 0,
-                        "hours": 0,
-                        "late": 0,
-                        "early_leave": 0,
-                    }
-
-                user_stats = stats["users"][user_id]
-                user_stats["days"] += 1
-
-                if record.clock_in and record.clock_out:
-                    work_seconds = (record.clock_out - record.clock_in).total_seconds()
-                    work_hours = work_seconds / 3600
-                    stats["total_hours"] += work_hours
-                    user_stats["hours"] += work_hours
-
-                    # 지각/조퇴 판정
-                    if (
-                        record.clock_in.time()
-                        > datetime.strptime("09:00", "%H:%M").time()
-                    ):
-                        stats["late_count"] += 1
-                        user_stats["late"] += 1
-                    if (
-                        record.clock_out.time()
-                        < datetime.strptime("18:00", "%H:%M").time()
-                    ):
-                        stats["early_leave_count"] += 1
-                        user_stats["early_leave"] += 1
-                else:
-                    stats["absent_count"] += 1
-
-            return stats
+            return self._build_report_data(start_date, end_date)
 
         except Exception as e:
             logger.error(f"월간 리포트 데이터 생성 중 오류: {str(e)}")
             return {}
 
+    def _build_report_data(self, start_date, end_date):
+        """기간 내 근태 통계를 사용자별 GROUP BY 한 번으로 계산
+
+        완료된 기록(출퇴근 모두 있음)만 근무시간/지각(09:00 초과 출근)/조퇴(18:00 이전 퇴근)에
+        포함하고, 퇴근 기록이 없으면 결근으로 센다. 전체 합계는 사용자별 집계를 더해서 만든다.
+        """
+        completed = Attendance.clock_out.isnot(None)
+        work_seconds = func.strftime("%s", Attendance.clock_out) - func.strftime(
+            "%s", Attendance.clock_in
+        )
+        late = and_(completed, func.strftime("%H:%M:%S", Attendance.clock_in) > "09:00:00")
+        early_leave = and_(
+            completed, func.strftime("%H:%M:%S", Attendance.clock_out) < "18:00:00"
+        )
+
+        rows = (
+            db.session.query(
+                Attendance.user_id,
+                func.coalesce(func.nullif(User.name, ""), User.username).label("name"),
+                func.count(Attendance.id).label("days"),
+                func.coalesce(func.sum(case((completed, work_seconds), else_=0)), 0).label("seconds"),
+                func.sum(case((late, 1), else_=0)).label("late"),
+                func.sum(case((early_leave, 1), else_=0)).label("early_leave"),
+                func.sum(case((completed, 0), else_=1)).label("absent"),
+            )
+            .join(User, User.id == Attendance.user_id)
+            .filter(
+                Attendance.clock_in >= start_date,
+                Attendance.clock_in <= end_date,
+            )
+            .group_by(Attendance.user_id, User.name, User.username)
+            .all()
+        )
+
+        stats = {
+            "period": f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}",
+            "total_records": 0,
+            "total_hours": 0,
+            "late_count": 0,
+            "early_leave_count": 0,
+            "absent_count": 0,
+            "users": {},
+        }
+
+        for row in rows:
+            hours = (row.seconds or 0) / 3600
+            stats["users"][row.user_id] = {
+                "name": row.name,
+                "days": row.days,
+                "hours": hours,
+                "late": row.late or 0,
+                "early_leave": row.early_leave or 0,
+            }
+            stats["total_records"] += row.days
+            stats["total_hours"] += hours
+            stats["late_count"] += row.late or 0
+            stats["early_leave_count"] += row.early_leave or 0
+            stats["absent_count"] += row.absent or 0
+
+        return stats
+
     def send_email_report(self, to_email, subject, report_data, period):
         """이메일 리포트 발송 (테스트용)"""
         try:
@@ -308,68 +243,90 @@ class AttendanceScheduler:
         except Exception as e:
             logger.error(f"이메일 리포트 발송 중 오류: {str(e)}")
 
-    def check_attendance_alerts(self):
-        """출근 알림 체크"""
+    def check_attendance_alerts(self, now=None):
+        """출근 알림 체크
+
+        오늘 출근 기록이 없는 직원을 NOT EXISTS 한 번으로 조회한다.
+        (clock_in 범위 조건이라 idx_attendance_user_date 인덱스를 탄다)
+        """
         try:
             logger.info("출근 알림 체크 시작")
 
-            today = date.today()
-            current_time = datetime.now().time()
-
-            # 아직 출근하지 않은 직원 체크
-            users = User.query.filter(
-                and_(User.role == "employee", User.deleted_at == None)
-            ).all()
-
-            for user in users:
-                # 오늘 출근 기록 확인
-                today_attendance = Attendance.query.filter(
-                    and_(
-                        Attendance.user_id == user.id,
-                        extract("date", Attendance.clock_in) == today,
-                    )
-                ).first()
+            now = now or datetime.now()
+            day_start = datetime.combine(now.date(), datetime.min.time())
+            day_end = day_start + timedelta(days=1)
+
+            # 출근 시간이 지나지 않았으면 조회할 필요 없음
+            if now.time() <= datetime.strptime("09:30", "%H:%M").time():
+                logger.info("출근 알림 체크 완료")
+                return []
+
+            clocked_in = (
+                db.session.query(Attendance.id)
+                .filter(
+                    Attendance.user_id == User.id,
+                    Attendance.clock_in >= day_start,
+                    Attendance.clock_in < day_end,
+                )
+                .exists()
+            )
+            absent_users = (
+                db.session.query(User.id, User.name, User.username)
+                .filter(
+                    User.role == "employee",
+                    User.deleted_at.is_(None),
+                    ~clocked_in,
+                )
+                .all()
+            )
 
-                # 출근하지 않았고, 출근 시간이 지났으면 알림
-                if (
-                    not today_attendance
-                    and current_time > datetime.strptime("09:30", "%H:%M").time()
-                ):
-                    logger.info(f"출근 알림: {user.name or user.username}")
-                    # 실제 알림 발송 로직 추가 가능
+            for user in absent_users:
+                logger.info(f"출근 알림: {user.name or user.username}")
+                # 실제 알림 발송 로직 추가 가능
 
             logger.info("출근 알림 체크 완료")
+            return [user.id for user in absent_users]
 
         except Exception as e:
             logger.error(f"출근 알림 체크 중 오류: {str(e)}")
+            return []
 
-    def check_leave_alerts(self):
+    def check_leave_alerts(self, now=None):
         """퇴근 알림 체크"""
         try:
             logger.info("퇴근 알림 체크 시작")
 
-            today = date.today()
-            current_time = datetime.now().time()
-
-            # 아직 퇴근하지 않은 직원 체크
-            attendances = Attendance.query.filter(
-                and_(
-                    extract("date", Attendance.clock_in) == today,
-                    Attendance.clock_out == None,
+            now = now or datetime.now()
+            day_start = datetime.combine(now.date(), datetime.min.time())
+            day_end = day_start + timedelta(days=1)
+
+            # 퇴근 시간이 지나지 않았으면 조회할 필요 없음
+            if now.time() <= datetime.strptime("18:30", "%H:%M").time():
+                logger.info("퇴근 알림 체크 완료")
+                return []
+
+            # 아직 퇴근하지 않은 직원 체크 (사용자는 함께 로딩)
+            attendances = (
+                Attendance.query.options(joinedload(Attendance.user))
+                .filter(
+                    Attendance.clock_in >= day_start,
+                    Attendance.clock_in < day_end,
+                    Attendance.clock_out.is_(None),
                 )
-            ).all()
+                .all()
+            )
 
             for attendance in attendances:
-                # 퇴근 시간이 지났으면 알림
-                if current_time > datetime.strptime("18:30", "%H:%M").time():
-                    user = attendance.user
-                    logger.info(f"퇴근 알림: {user.name or user.username}")
-                    # 실제 알림 발송 로직 추가 가능
+                user = attendance.user
+                logger.info(f"퇴근 알림: {user.name or user.username}")
+                # 실제 알림 발송 로직 추가 가능
 
             logger.info("퇴근 알림 체크 완료")
+            return [attendance.user_id for attendance in attendances]
 
         except Exception as e:
             logger.error(f"퇴근 알림 체크 중 오류: {str(e)}")
+            return []
 
 
 def schedule_auto_processing_rules():
@@ -691,131 +648,117 @@ class BackupScheduler:
 backup_scheduler = BackupScheduler()
 
 
+def _managers_by_branch(branch_ids):
+    """매장별 매니저 ID 목록을 한 번의 쿼리로 조회"""
+    managers = {}
+    if not branch_ids:
+        return managers
+    rows = (
+        db.session.query(User.id, User.branch_id)
+        .filter(
+            User.role == "manager",
+            User.branch_id.in_(list(branch_ids)),
+            User.deleted_at.is_(None),
+        )
+        .all()
+    )
+    for user_id, branch_id in rows:
+        managers.setdefault(branch_id, []).append(user_id)
+    return managers
+
+
 def check_document_expiry():
     """계약서와 보건증 만료일을 확인하고 알림을 발송합니다."""
     try:
         today = datetime.now().date()
         thirty_days_later = today + timedelta(days=30)
 
-        # 계약서 만료 임박 확인
-        expiring_contracts = Contract.query.filter(
-            and_(
-                Contract.expiry_date <= thirty_days_later,
-                Contract.expiry_date > today,
-                Contract.notification_sent == False,
+        # 문서 종류별 (모델, 조회 조건, 발송 플래그, 알림 제목/분류/우선순위, 내용 생성)
+        checks = [
+            (
+                Contract,
+                and_(
+                    Contract.expiry_date <= thirty_days_later,
+                    Contract.expiry_date > today,
+                    Contract.notification_sent == False,
+                ),
+                "notification_sent",
+                "계약서 만료 임박 알림", "document_expiry", "중요",
+                lambda staff, doc: f"{staff.name} 직원의 계약서가 {doc.expiry_date.strftime('%Y년 %m월 %d일')}에 만료됩니다. 갱신을 확인해주세요.",
+            ),
+            (
+                HealthCertificate,
+                and_(
+                    HealthCertificate.expiry_date <= thirty_days_later,
+                    HealthCertificate.expiry_date > today,
+                    HealthCertificate.notification_sent == False,
+                ),
+                "notification_sent",
+                "보건증 만료 임박 알림", "document_expiry", "중요",
+                lambda staff, doc: f"{staff.name} 직원의 보건증이 {doc.expiry_date.strftime('%Y년 %m월 %d일')}에 만료됩니다. 갱신을 확인해주세요.",
+            ),
+            (
+                Contract,
+                and_(
+                    Contract.expiry_date == today,
+                    Contract.expired_notification_sent == False,
+                ),
+                "expired_notification_sent",
+                "계약서 만료 알림", "document_expired", "긴급",
+                lambda staff, doc: f"{staff.name} 직원의 계약서가 오늘 만료되었습니다. 즉시 갱신이 필요합니다.",
+            ),
+            (
+                HealthCertificate,
+                and_(
+                    HealthCertificate.expiry_date == today,
+                    HealthCertificate.expired_notification_sent == False,
+                ),
+                "expired_notification_sent",
+                "보건증 만료 알림", "document_expired", "긴급",
+                lambda staff, doc: f"{staff.name} 직원의 보건증이 오늘 만료되었습니다. 즉시 갱신이 필요합니다.",
+            ),
+        ]
+
+        # 직원은 문서와 함께 로딩하고, 매니저는 관련 매장 전체를 한 번에 조회
+        documents = []
+        for check in checks:
+            model, condition = check[0], check[1]
+            documents.append(
+                (check, model.query.options(joinedload(model.staff)).filter(condition).all())
             )
-        ).all()
-
-        for contract in expiring_contracts:
-            staff = Staff.query.get(contract.staff_id)
-            if staff:
-                # 관리자에게 알림 발송
-                managers = User.query.filter_by(
-                    role="manager", your_program_id=staff.your_program_id
-                ).all()
-                for manager in managers:
-                    notification = Notification()
-                    notification.user_id = manager.id
-                    notification.title = "계약서 만료 임박 알림"
-                    notification.content = f"{staff.name} 직원의 계약서가 {contract.expiry_date.strftime('%Y년 %m월 %d일')}에 만료됩니다. 갱신을 확인해주세요."
-                    notification.category = "document_expiry"
-                    notification.priority = "중요"
-                    db.session.add(notification)
-
-                # 알림 발송 상태 업데이트
-                contract.notification_sent = True
-                logger.info(
-                    f"계약서 만료 알림 발송: {staff.name} (만료일: {contract.expiry_date})"
+        branch_ids = {
+            doc.staff.your_program_id
+            for _, docs in documents
+            for doc in docs
+            if doc.staff
+        }
+        managers = _managers_by_branch(branch_ids)
+
+        notifications = []
+        for (model, _, flag, title, category, priority, make_content), docs in documents:
+            for doc in docs:
+                staff = doc.staff
+                if not staff:
+                    continue
+                content = make_content(staff, doc)
+                notifications.extend(
+                    {
+                        "user_id": manager_id,
+                        "title": title,
+                        "content": content,
+                        "category": category,
+                        "priority": priority,
+                    }
+                    for manager_id in managers.get(staff.your_program_id, [])
                 )
 
-        # 보건증 만료 임박 확인
-        expiring_health_certs = HealthCertificate.query.filter(
-            and_(
-                HealthCertificate.expiry_date <= thirty_days_later,
-                HealthCertificate.expiry_date > today,
-                HealthCertificate.notification_sent == False,
-            )
-        ).all()
-
-        for health_cert in expiring_health_certs:
-            staff = Staff.query.get(health_cert.staff_id)
-            if staff:
-                # 관리자에게 알림 발송
-                managers = User.query.filter_by(
-                    role="manager", your_program_id=staff.your_program_id
-                ).all()
-                for manager in managers:
-                    notification = Notification()
-                    notification.user_id = manager.id
-                    notification.title = "보건증 만료 임박 알림"
-                    notification.content = f"{staff.name} 직원의 보건증이 {health_cert.expiry_date.strftime('%Y년 %m월 %d일')}에 만료됩니다. 갱신을 확인해주세요."
-                    notification.category = "document_expiry"
-                    notification.priority = "중요"
-                    db.session.add(notification)
-
                 # 알림 발송 상태 업데이트
-                health_cert.notification_sent = True
-                logger.info(
-                    f"보건증 만료 알림 발송: {staff.name} (만료일: {health_cert.expiry_date})"
-                )
-
-        # 만료된 문서 확인 (당일)
-        expired_contracts = Contract.query.filter(
-            and_(
-                Contract.expiry_date == today,
-                Contract.expired_notification_sent == False,
-            )
-        ).all()
-
-        for contract in expired_contracts:
-            staff = Staff.query.get(contract.staff_id)
-            if staff:
-                managers = User.query.filter_by(
-                    role="manager", your_program_id=staff.your_program_id
-                ).all()
-                for manager in managers:
-                    notification = Notification()
-                    notification.user_id = manager.id
-                    notification.title = "계약서 만료 알림"
-                    notification.content = f"{staff.name} 직원의 계약서가 오늘 만료되었습니다. 즉시 갱신이 필요합니다."
-                    notification.category = "document_expired"
-                    notification.priority = "긴급"
-                    db.session.add(notification)
-
-                contract.expired_notification_sent = True
-                logger.info(
-                    f"계약서 만료 알림 발송: {staff.name} (만료일: {contract.expiry_date})"
-                )
-
-        expired_health_certs = HealthCertificate.query.filter(
-            and_(
-                HealthCertificate.expiry_date == today,
-                HealthCertificate.expired_notification_sent == False,
-            )
-        ).all()
-
-        for health_cert in expired_health_certs:
-            staff = Staff.query.get(health_cert.staff_id)
-            if staff:
-                managers = User.query.filter_by(
-                    role="manager", your_program_id=staff.your_program_id
-                ).all()
-                for manager in managers:
-                    notification = Notification()
-                    notification.user_id = manager.id
-                    notification.title = "보건증 만료 알림"
-                    notification.content = f"{staff.name} 직원의 보건증이 오늘 만료되었습니다. 즉시 갱신이 필요합니다."
-                    notification.category = "document_expired"
-                    notification.priority = "긴급"
-                    db.session.add(notification)
-
-                health_cert.expired_notification_sent = True
-                logger.info(
-                    f"보건증 만료 알림 발송: {staff.name} (만료일: {health_cert.expiry_date})"
-                )
+                setattr(doc, flag, True)
+                logger.info(f"{title} 발송: {staff.name} (만료일: {doc.expiry_date})")
 
+        bulk_create_notifications(notifications, commit=False)
         db.session.commit()
-        logger.info("문서 만료 확인 완료")
+        logger.info(f"문서 만료 확인 완료: 알림 {len(notifications)}건")
 
     except Exception as e:
         logger.error(f"문서 만료 확인 중 오류 발생: {str(e)}")
@@ -903,19 +846,24 @@ def check_contract_expiry():
 def setup_scheduler():
     """스케줄러 설정"""
     # 매일 오전 9시에 보건증 만료 체크
-    schedule.every().day.at("09:00").do(check_health_certificate_expiry)
+    job_scheduler.add_job("documents.health_certificate_expiry", check_health_certificate_expiry,
+                          daily_at="09:00", singleton=True, app_context=True)
 
     # 매일 오전 9시에 계약서 만료 체크
-    schedule.every().day.at("09:00").do(check_contract_expiry)
+    job_scheduler.add_job("documents.contract_expiry", check_contract_expiry,
+                          daily_at="09:00", singleton=True, app_context=True)
 
     logger.info("스케줄러 설정 완료")
 
 
 def run_scheduler():
-    """스케줄러 실행"""
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # 1분마다 체크
+    """스케줄러 실행 (단독 프로세스로 띄울 때)"""
+    setup_scheduler()
+    try:
+        while True:
+            time.sleep(60)
+    except KeyboardInterrupt:
+        job_scheduler.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+중앙 데이터 집계 테이블 백필
+기존 출퇴근/매출/급여 데이터로 매장별 일간 집계 테이블을 다시 계산한다.
+집계 테이블이 없던 DB는 CentralDataLayer 초기화 시 자동으로 채워지므로,
+이 스크립트는 트리거 밖에서 데이터를 고친 경우 등의 복구용이다.
+
+사용법:
+python scripts/backfill_analytics_rollups.py
+python scripts/backfill_analytics_rollups.py --db data/central_data.db --branch-id 1
+"""
+import argparse
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.backend.central_data_layer import CentralDataLayer  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='중앙 데이터 집계 테이블 백필')
+    parser.add_argument('--db', default='data/central_data.db', help='중앙 데이터 DB 경로')
+    parser.add_argument('--branch-id', type=int, default=None, help='특정 매장만 다시 계산')
+    args = parser.parse_args()
+
+    layer = CentralDataLayer(args.db)
+    counts = layer.rebuild_rollups(branch_id=args.branch_id)
+    if not counts:
+        print("집계 테이블 재계산 실패 (로그 확인)")
+        sys.exit(1)
+    for table, rows in counts.items():
+        print(f"{table}: {rows}행")
+
+
+if __name__ == '__main__':
+    main()
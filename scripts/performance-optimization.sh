@@ -479,7 +479,12 @@ worker_class = "gevent"
 worker_connections = 1000
 max_requests = 1000
 max_requests_jitter = 50
+
+# 마스터가 app을 한 번 import하고 워커는 포크로 메모리를 copy-on-write 공유
+# (백그라운드 스레드 서비스는 워커마다 post_fork에서 시작)
 preload_app = True
+raw_env = ["APP_PRELOAD=1"]
+from core.backend.worker_preload import when_ready, post_fork  # noqa: E402,F401
 
 # 로깅
 accesslog = "logs/gunicorn_access.log"
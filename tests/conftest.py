@@ -6,6 +6,9 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 import pytest
 import types
+from contextlib import contextmanager
+
+from sqlalchemy import event
 
 from app import app as flask_app
 from config.config import TestConfig
@@ -124,6 +127,25 @@ def session(app):
         db.session.remove()
 
 
+@pytest.fixture
+def count_queries(app):
+    """실행된 SQL 문을 모으는 컨텍스트 매니저 (with count_queries() as statements: ...)"""
+    @contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+    return counter
+
+
 @pytest.fixture()
 def admin_user(session):
     """Fixture for a test admin user."""
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+주소 중복 체크 벤치마크
+가상의 주소 N건(기본 10만)에 대해 트라이그램 색인 후보 검색 + 상위 후보 정밀 비교와,
+예전 방식(전체 주소에 SequenceMatcher)의 중복 체크 시간을 비교한다.
+
+사용법: python tests/performance/address_index_benchmark.py --addresses 100000 --queries 200
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from api.address_validation import (  # noqa: E402
+    DUPLICATE_CANDIDATE_LIMIT,
+    calculate_address_similarity,
+    extract_address_keywords,
+    normalize_address,
+)
+from utils.address_index import AddressTrigramIndex  # noqa: E402
+
+CITIES = {
+    "서울특별시": ["강남구", "서초구", "송파구", "마포구", "종로구", "용산구", "성동구", "관악구"],
+    "부산광역시": ["해운대구", "수영구", "부산진구", "동래구", "남구"],
+    "대구광역시": ["중구", "수성구", "달서구", "북구"],
+    "경기도": ["성남시 분당구", "수원시 영통구", "고양시 일산동구", "용인시 수지구", "부천시"],
+    "인천광역시": ["연수구", "남동구", "부평구", "서구"],
+}
+ROADS = ["테헤란로", "강남대로", "중앙로", "해운대로", "동성로", "판교역로", "광교중앙로",
+         "올림픽로", "월드컵로", "세종대로", "신촌로", "반포대로", "백범로", "경인로"]
+
+
+def make_addresses(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    addresses = []
+    for _ in range(count):
+        city = rng.choice(list(CITIES))
+        district = rng.choice(CITIES[city])
+        road = rng.choice(ROADS) + (f"{rng.randint(1, 60)}길" if rng.random() < 0.5 else "")
+        number = f"{rng.randint(1, 999)}" + (f"-{rng.randint(1, 30)}" if rng.random() < 0.3 else "")
+        building = f" {rng.randint(1, 20)}층" if rng.random() < 0.3 else ""
+        addresses.append(f"{city} {district} {road} {number}{building}")
+    return addresses
+
+
+def index_check(index: AddressTrigramIndex, address: str, threshold: float, top: int):
+    matches = []
+    for entity_id, existing, _ in index.search(address, "store", DUPLICATE_CANDIDATE_LIMIT, 0.5):
+        similarity = calculate_address_similarity(address, existing)
+        if similarity >= threshold:
+            matches.append((similarity, entity_id))
+    return sorted(matches, reverse=True)[:top]
+
+
+def linear_check(addresses: List[str], address: str, threshold: float, top: int):
+    matches = []
+    for entity_id, existing in enumerate(addresses, 1):
+        similarity = calculate_address_similarity(address, existing)
+        if similarity >= threshold:
+            matches.append((similarity, entity_id))
+    return sorted(matches, reverse=True)[:top]
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="주소 중복 체크 벤치마크")
+    parser.add_argument("--addresses", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--linear-queries", type=int, default=5,
+                        help="전체 스캔 방식으로 측정할 질의 수 (느림)")
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--top", type=int, default=10, help="재현율을 볼 상위 결과 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    addresses = make_addresses(args.addresses, args.seed)
+    rng = random.Random(args.seed + 1)
+    # 기존 주소를 조금 바꾼 질의 (띄어쓰기/층 정보 차이)
+    queries = [rng.choice(addresses).replace(" ", "  ", 1) + rng.choice(["", " 1층", ""])
+               for _ in range(args.queries)]
+
+    index = AddressTrigramIndex(normalize_address, extract_address_keywords)
+    start = time.perf_counter()
+    index.load("store", enumerate(addresses, 1))
+    print(f"색인 구성: {len(addresses)}건 {time.perf_counter() - start:.2f}초")
+
+    start = time.perf_counter()
+    indexed_results = [index_check(index, q, args.threshold, args.top) for q in queries]
+    indexed_ms = (time.perf_counter() - start) * 1000 / len(queries)
+    print(f"[색인] 질의당 {indexed_ms:.2f}ms ({len(queries)}건)")
+
+    linear_queries = queries[:args.linear_queries]
+    start = time.perf_counter()
+    linear_results = [linear_check(addresses, q, args.threshold, args.top) for q in linear_queries]
+    linear_ms = (time.perf_counter() - start) * 1000 / max(1, len(linear_queries))
+    print(f"[전체 스캔] 질의당 {linear_ms:.0f}ms ({len(linear_queries)}건)")
+
+    # 가장 유사한 주소(실제 중복)를 같이 찾았는지, 상위 결과 중 전체 스캔과 같은 유사도인 건수
+    best = sum(1 for i, lin in zip(indexed_results, linear_results) if not lin or (i and i[0][0] == lin[0][0]))
+    same = sum(sum(1 for a, b in zip(i, lin) if a[0] == b[0]) for i, lin in zip(indexed_results, linear_results))
+    expected = sum(len(lin) for lin in linear_results)
+    print(f"최고 유사 주소 일치 {best}/{len(linear_results)}, 상위 {args.top}건 유사도 일치 "
+          f"{same}/{expected}, 속도 {linear_ms / indexed_ms:.0f}배")
+
+
+if __name__ == "__main__":
+    main()
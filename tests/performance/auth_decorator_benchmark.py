@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+인증 데코레이터 오버헤드 벤치마크
+같은 토큰으로 반복 호출할 때 요청 하나당 데코레이터 비용(토큰 디코딩 + 사용자 확인)과 실행 SQL 수를
+예전 방식(매번 User.query.get으로 permissions JSON까지 담긴 행 전체 조회)과
+principal_cache(불변 스냅샷, 첫 요청만 필요한 컬럼 조회)로 비교한다.
+
+사용법: python tests/performance/auth_decorator_benchmark.py --requests 5000
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import tempfile
+import time
+from functools import wraps
+from typing import List, Optional
+
+import jwt
+from flask import Flask, jsonify, request
+from sqlalchemy import event
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from models_main import User, db  # noqa: E402
+from utils.auth_decorators import permission_required  # noqa: E402
+from utils.principal_cache import principal_cache  # noqa: E402
+
+SECRET = "benchmark-secret"
+
+
+def legacy_permission_required(module, action="view"):
+    """예전 방식: 요청마다 토큰 디코딩 + User 행 전체 조회"""
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            token = request.headers.get('Authorization', '').split(" ")[1]
+            payload = jwt.decode(token, SECRET, algorithms=['HS256'])
+            current_user = User.query.get(payload.get('user_id'))
+            if not current_user:
+                return jsonify({'message': '유효하지 않은 사용자입니다.'}), 401
+            if not current_user.has_permission(module, action):
+                return jsonify({'message': f'{module}의 {action} 권한이 없습니다.'}), 403
+            setattr(request, 'current_user', current_user)
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
+
+def view():
+    return request.current_user.role
+
+
+def run(app, decorated, token: str, requests: int):
+    """요청 컨텍스트를 매번 새로 열어(세션도 요청마다 정리) 데코레이터 호출, (요청당 µs, 요청당 SQL 수)"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    headers = {"Authorization": f"Bearer {token}"}
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        start = time.perf_counter()
+        for _ in range(requests):
+            with app.test_request_context("/", headers=headers):
+                assert decorated() == "manager"
+                db.session.remove()
+        elapsed = time.perf_counter() - start
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+    return elapsed / requests * 1e6, len(statements) / requests
+
+
+def baseline(app, requests: int):
+    """데코레이터 없이 요청 컨텍스트만 여닫는 비용"""
+    start = time.perf_counter()
+    for _ in range(requests):
+        with app.test_request_context("/", headers={"Authorization": "Bearer x"}):
+            db.session.remove()
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="인증 데코레이터 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = Flask(__name__)
+        app.config.update(SQLALCHEMY_DATABASE_URI=f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+                          JWT_SECRET_KEY=SECRET)
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            user = User(username="bench", email="bench@example.com", password_hash="x",
+                        role="manager", status="approved")
+            db.session.add(user)
+            db.session.commit()
+            token = jwt.encode({"user_id": user.id, "exp": datetime.datetime.utcnow() + datetime.timedelta(hours=1)},
+                               SECRET, algorithm="HS256")
+
+            base = baseline(app, args.requests)
+            print(f"요청 컨텍스트만      {base:8.1f}µs/요청")
+            for label, decorator in (("예전 방식 (User 조회)", legacy_permission_required),
+                                     ("principal_cache", permission_required)):
+                principal_cache.clear()
+                cost, queries = run(app, decorator("dashboard")(view), token, args.requests)
+                print(f"{label:18s}  {cost:8.1f}µs/요청 | 데코레이터 {cost - base:8.1f}µs | SQL {queries:.3f}개/요청")
+            print(f"캐시 통계: {principal_cache.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+AdvancedCache 멀티스레드 처리량 벤치마크
+스레드 수를 늘려가며 초당 처리량을 측정하고, 예전 전역 락 방식과 비교한다.
+
+사용법: python tests/performance/cache_benchmark.py --threads 1 2 4 8 16
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from utils.advanced_caching import AdvancedCache, CacheLevel  # noqa: E402
+
+logging.getLogger("utils.advanced_caching").setLevel(logging.ERROR)
+
+
+class SlowRedis:
+    """네트워크 지연을 흉내내는 L2 백엔드 (벤치마크 전용)"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.data: Dict[str, Any] = {}
+
+    def get(self, key):
+        time.sleep(self.latency)
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        time.sleep(self.latency)
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class GlobalLockCache(AdvancedCache):
+    """예전 구현처럼 조회/저장 전체를 하나의 락으로 직렬화하는 비교용 캐시"""
+
+    def get(self, *args, **kwargs):
+        with self.lock:
+            return super().get(*args, **kwargs)
+
+    def set(self, *args, **kwargs):
+        with self.lock:
+            return super().set(*args, **kwargs)
+
+
+def build_cache(cache_cls, latency: float, cache_dir: str) -> AdvancedCache:
+    cache = cache_cls({"file_cache_dir": cache_dir, "l1_maxsize": 100000, "redis": {"port": 1}})
+    cache.l2_cache = SlowRedis(latency)
+    return cache
+
+
+def run_workload(cache: AdvancedCache, threads: int, ops_per_thread: int,
+                 hot_keys: int, miss_ratio: float) -> float:
+    """스레드별로 조회를 수행하고 초당 처리량 반환"""
+    levels = [CacheLevel.L1_MEMORY, CacheLevel.L2_REDIS]
+    for i in range(hot_keys):
+        cache.set(f"hot:{i}", {"value": i}, levels=[CacheLevel.L1_MEMORY])
+
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed: int):
+        rng = random.Random(seed)
+        barrier.wait()
+        for n in range(ops_per_thread):
+            if rng.random() < miss_ratio:
+                # L1 미스 -> L2 왕복
+                cache.get(f"cold:{seed}:{n}", levels=levels)
+            else:
+                cache.get(f"hot:{rng.randrange(hot_keys)}", levels=levels)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in workers:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return threads * ops_per_thread / elapsed
+
+
+def run_coalescing(cache: AdvancedCache, threads: int, loader_delay: float) -> int:
+    """동일 키 동시 미스 시 로더 실행 횟수 반환"""
+    calls = []
+    barrier = threading.Barrier(threads)
+
+    def loader():
+        calls.append(1)
+        time.sleep(loader_delay)
+        return {"loaded": True}
+
+    def worker():
+        barrier.wait()
+        cache.get_or_load("coalesce:key", loader, levels=[CacheLevel.L1_MEMORY])
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return len(calls)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="AdvancedCache 처리량 벤치마크")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--ops", type=int, default=2000, help="스레드당 조회 수")
+    parser.add_argument("--hot-keys", type=int, default=1000)
+    parser.add_argument("--miss-ratio", type=float, default=0.05)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="L2 왕복 지연")
+    args = parser.parse_args(argv)
+
+    latency = args.latency_ms / 1000.0
+    print(f"L2 지연 {args.latency_ms}ms, 미스 비율 {args.miss_ratio:.0%}, 스레드당 {args.ops}회")
+    print(f"{'threads':>8} {'global-lock ops/s':>20} {'sharded ops/s':>16} {'speedup':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for threads in args.threads:
+            baseline = run_workload(
+                build_cache(GlobalLockCache, latency, os.path.join(tmp, f"g{threads}")),
+                threads, args.ops, args.hot_keys, args.miss_ratio,
+            )
+            sharded = run_workload(
+                build_cache(AdvancedCache, latency, os.path.join(tmp, f"s{threads}")),
+                threads, args.ops, args.hot_keys, args.miss_ratio,
+            )
+            print(f"{threads:>8} {baseline:>20,.0f} {sharded:>16,.0f} {sharded / baseline:>7.1f}x")
+
+        threads = max(args.threads)
+        cache = build_cache(AdvancedCache, latency, os.path.join(tmp, "coalesce"))
+        loads = run_coalescing(cache, threads, loader_delay=0.05)
+        print(f"동일 키 동시 미스 {threads}건 -> 로더 실행 {loads}회")
+
+
+if __name__ == "__main__":
+    main()
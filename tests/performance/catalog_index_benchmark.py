@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+카탈로그 인덱스 벤치마크
+카탈로그 크기를 키워 가며 예전 방식(전체 목록 부분 문자열 검사 후 정렬)과
+CatalogIndex(역색인 + 미리 정렬한 목록 + 커서 페이지)의 조회 지연 시간을 비교한다.
+
+사용법: python tests/performance/catalog_index_benchmark.py --sizes 1000 10000 50000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from core.backend.catalog_index import CatalogIndex  # noqa: E402
+from core.backend.document_store import DocumentCollection  # noqa: E402
+
+CATEGORIES = ["restaurant", "retail", "service", "manufacturing", "general"]
+WORDS = ["출퇴근", "재고", "매출", "주문", "급여", "예약", "배달", "회계", "리뷰", "쿠폰"]
+
+
+def make_plugins(count: int, seed: int) -> List[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"plugin_{i}",
+            "name": f"{rng.choice(WORDS)} 플러그인 {i}",
+            "description": f"{rng.choice(WORDS)} {rng.choice(WORDS)} 관리 기능",
+            "category": rng.choice(CATEGORIES),
+            "tags": rng.sample(WORDS, 2),
+            "downloads": rng.randint(0, 10000),
+            "rating": round(rng.uniform(1, 5), 1),
+            "price": rng.randint(0, 10) * 1000,
+            "created_at": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_query(plugins: List[dict], category: Optional[str], search: Optional[str], sort_by: str):
+    result = [p for p in plugins if not category or p.get("category") == category]
+    if search:
+        q = search.lower()
+        result = [p for p in result if q in p.get("name", "").lower()
+                  or q in p.get("description", "").lower()
+                  or any(q in tag.lower() for tag in p.get("tags", []))]
+    result.sort(key=lambda p: p.get(sort_by, 0), reverse=True)
+    return result[:20]
+
+
+def measure(func, repeat: int) -> float:
+    """1회 평균 ms"""
+    start = time.perf_counter()
+    for i in range(repeat):
+        func(i)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def run(size: int, repeat: int, seed: int, workdir: Path):
+    plugins = make_plugins(size, seed)
+    collection = DocumentCollection(workdir / f"plugins_{size}.json")
+    collection.put_many(plugins)
+    index = CatalogIndex(collection)
+    start = time.perf_counter()
+    index.search()
+    build_ms = (time.perf_counter() - start) * 1000
+
+    cases = {
+        "sort": lambda i: (None, None, "downloads"),
+        "category": lambda i: (CATEGORIES[i % 5], None, "rating"),
+        "search": lambda i: (None, WORDS[i % 10], "rating"),
+    }
+    print(f"{size:>7}건 인덱스 구성 {build_ms:.1f}ms")
+    for name, case in cases.items():
+        legacy_ms = measure(lambda i: legacy_query(plugins, *case(i)), repeat)
+        index_ms = measure(lambda i: index.search({"category": case(i)[0]}, case(i)[1],
+                                                  sort_by=case(i)[2], limit=20), repeat)
+        print(f"{size:>7}건 {name:<8} 전체 검사 {legacy_ms:9.2f}ms | "
+              f"카탈로그 인덱스 {index_ms:8.3f}ms | {legacy_ms / max(index_ms, 1e-6):7.1f}배")
+
+    # 문서 한 건 변경 후 첫 조회 (바뀐 문서만 다시 색인)
+    update_ms = measure(lambda i: (
+        collection.update(f"plugin_{i}", {"downloads": i}),
+        index.search(sort_by="downloads", limit=20),
+    ), repeat)
+    print(f"{size:>7}건 변경 후 조회 {update_ms:8.3f}ms (부분 갱신 {index.stats['updates']}회)")
+    collection.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="카탈로그 인덱스 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            run(size, args.repeat, args.seed, Path(workdir))
+
+
+if __name__ == "__main__":
+    main()
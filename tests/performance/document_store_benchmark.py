@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+JSON 문서 저장소 벤치마크
+컬렉션 크기를 키워 가며 예전 방식(JSON 파일 전체 읽기 후 전체 다시 쓰기)과
+DocumentStore(변경 로그 추가 + 인덱스)의 목록/필터/수정 지연 시간을 비교한다.
+
+사용법: python tests/performance/document_store_benchmark.py --sizes 1000 10000 50000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from core.backend.document_store import DocumentCollection  # noqa: E402
+
+CATEGORIES = ["restaurant", "retail", "service", "manufacturing", "general"]
+STATUSES = ["active", "pending", "inactive"]
+
+
+def make_plugins(count: int, seed: int) -> List[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"plugin_{i}",
+            "name": f"플러그인 {i}",
+            "description": "마켓플레이스 플러그인 설명 " * 4,
+            "category": rng.choice(CATEGORIES),
+            "status": rng.choice(STATUSES),
+            "tags": rng.sample(["pos", "order", "staff", "stock", "report"], 2),
+            "downloads": rng.randint(0, 10000),
+            "rating": round(rng.uniform(1, 5), 1),
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_list(path: Path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def legacy_filter(path: Path, category: str):
+    return [p for p in legacy_list(path) if p.get("category") == category]
+
+
+def legacy_update(path: Path, plugin_id: str):
+    plugins = legacy_list(path)
+    for plugin in plugins:
+        if plugin["id"] == plugin_id:
+            plugin["downloads"] = plugin.get("downloads", 0) + 1
+            break
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(plugins, f, indent=2, ensure_ascii=False)
+
+
+def measure(func, repeat: int) -> float:
+    """1회 평균 ms"""
+    start = time.perf_counter()
+    for i in range(repeat):
+        func(i)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def run(size: int, repeat: int, seed: int, workdir: Path):
+    plugins = make_plugins(size, seed)
+    rng = random.Random(seed + 1)
+    ids = [rng.choice(plugins)["id"] for _ in range(repeat)]
+
+    legacy_path = workdir / f"legacy_{size}.json"
+    legacy_path.write_text(json.dumps(plugins, indent=2, ensure_ascii=False), encoding="utf-8")
+    store_path = workdir / f"store_{size}.json"
+    store_path.write_text(json.dumps(plugins, indent=2, ensure_ascii=False), encoding="utf-8")
+    collection = DocumentCollection(store_path, indexes=("category", "status"))
+    collection.count()
+
+    results = {
+        "list": (measure(lambda i: legacy_list(legacy_path), repeat),
+                 measure(lambda i: collection.all(), repeat)),
+        "filter": (measure(lambda i: legacy_filter(legacy_path, CATEGORIES[i % 5]), repeat),
+                   measure(lambda i: collection.find(category=CATEGORIES[i % 5]), repeat)),
+        "update": (measure(lambda i: legacy_update(legacy_path, ids[i]), repeat),
+                   measure(lambda i: collection.mutate(
+                       ids[i], lambda p: dict(p, downloads=p.get("downloads", 0) + 1)), repeat)),
+        "get": (measure(lambda i: next(p for p in legacy_list(legacy_path) if p["id"] == ids[i]), repeat),
+                measure(lambda i: collection.get(ids[i]), repeat)),
+    }
+    for operation, (legacy_ms, store_ms) in results.items():
+        print(f"{size:>7}건 {operation:<7} 전체 파일 {legacy_ms:9.2f}ms | "
+              f"문서 저장소 {store_ms:8.3f}ms | {legacy_ms / max(store_ms, 1e-6):7.1f}배")
+    collection.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="JSON 문서 저장소 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            run(size, args.repeat, args.seed, Path(workdir))
+
+
+if __name__ == "__main__":
+    main()
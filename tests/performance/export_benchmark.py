@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+관리자 보고서 내보내기 메모리 벤치마크
+근태 N행을 내보낼 때 형식별 최대 RSS, 걸린 시간, 파일 크기를 비교한다. 측정마다 새 프로세스를 띄워 최대 RSS가 섞이지 않게 한다.
+- 예전 방식: .all()로 전부 읽고 (직원/팀은 지연 로딩) dict 리스트 -> pandas DataFrame -> BytesIO 안의 xlsxwriter
+- 스트리밍: joinedload + yield_per 로 읽어 CSV 청크 / xlsxwriter constant_memory / 페이지 압축 PDF(행 상한)
+
+사용법: python tests/performance/export_benchmark.py --rows 1000000
+"""
+
+import argparse
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from flask import Flask
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from core.backend.export_engine import PDF_MAX_ROWS, iter_csv, write_pdf, write_xlsx  # noqa: E402
+from models_main import Attendance, Team, User, db  # noqa: E402
+
+MODES = ["baseline", "legacy-xlsx", "stream-csv", "stream-xlsx", "stream-pdf"]
+FILTERS = {"team": None, "user_id": None, "date_from": None, "date_to": None}
+
+
+def make_app(db_path: str) -> Flask:
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI=f"sqlite:///{db_path}")
+    db.init_app(app)
+    return app
+
+
+def seed(app: Flask, rows: int, users: int = 200, batch: int = 50000):
+    """팀 10개, 직원 users명, 근태 rows건 생성"""
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([Team(name=f"팀{n}") for n in range(10)])
+        db.session.flush()
+        team_ids = [t.id for t in Team.query.all()]
+        db.session.add_all([User(username=f"emp{n}", email=f"emp{n}@example.com", password_hash="x",
+                                 name=f"직원{n}", team_id=team_ids[n % 10], role="employee") for n in range(users)])
+        db.session.flush()
+        user_ids = [u.id for u in User.query.all()]
+        start = datetime(2020, 1, 1, 9, 0)
+        for offset in range(0, rows, batch):
+            values = []
+            for n in range(offset, min(offset + batch, rows)):
+                clock_in = start + timedelta(minutes=n)
+                values.append({"user_id": user_ids[n % users], "clock_in": clock_in,
+                               "clock_out": clock_in + timedelta(hours=9),
+                               "reason": "지각, 교통 체증" if n % 7 == 0 else None})
+            db.session.execute(Attendance.__table__.insert(), values)
+        db.session.commit()
+
+
+def legacy_xlsx(path: str) -> int:
+    """예전 export_admin_dashboard_excel 방식 (limit 없이 전체 범위)"""
+    import pandas as pd
+
+    records = Attendance.query.order_by(Attendance.clock_in.desc()).all()
+    data = [
+        {
+            "일자": r.date,
+            "직원": r.user.name or r.user.username,
+            "팀": r.user.team.name if r.user.team else "",
+            "사유": r.reason or "",
+            "출근시간": r.clock_in.strftime("%H:%M") if r.clock_in else "",
+            "퇴근시간": r.clock_out.strftime("%H:%M") if r.clock_out else "",
+            "상태": r.status or "",
+        }
+        for r in records
+    ]
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
+        pd.DataFrame(data).to_excel(writer, index=False, sheet_name="근태데이터")
+    with open(path, "wb") as f:
+        f.write(output.getvalue())
+    return len(records)
+
+
+def peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB)
+    Linux의 ru_maxrss는 fork/exec 후에도 부모 값을 이어받으므로 /proc의 VmHWM을 먼저 사용"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_mode(mode: str, db_path: str, out_path: str) -> dict:
+    """자식 프로세스에서 한 형식만 내보내고 결과 반환"""
+    from routes.admin_dashboard_export import attendance_export_spec
+
+    app = make_app(db_path)
+    rows = 0
+    start = time.perf_counter()
+    with app.test_request_context("/"):
+        if mode == "legacy-xlsx":
+            rows = legacy_xlsx(out_path)
+        elif mode == "stream-csv":
+            with open(out_path, "wb") as f:
+                for chunk in iter_csv(attendance_export_spec(FILTERS)):
+                    f.write(chunk)
+        elif mode == "stream-xlsx":
+            rows = write_xlsx(attendance_export_spec(FILTERS), out_path)
+        elif mode == "stream-pdf":
+            rows = write_pdf(attendance_export_spec(FILTERS), out_path)
+    elapsed = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "seconds": elapsed,
+        "peak_rss_mb": peak_rss_mb(),
+        "size_mb": os.path.getsize(out_path) / 1e6 if os.path.exists(out_path) else 0,
+    }
+
+
+def measure(mode: str, db_path: str, tmp: str) -> Optional[dict]:
+    out_path = os.path.join(tmp, f"export-{mode}")
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), "--mode", mode, "--db", db_path,
+                             "--out", out_path], capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"{mode:12s} 실패 (종료 코드 {result.returncode}): {result.stderr.strip().splitlines()[-1:]}")
+        return None
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="관리자 보고서 내보내기 메모리 벤치마크")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.db, args.out)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        start = time.perf_counter()
+        seed(make_app(db_path), args.rows)
+        print(f"근태 {args.rows}건 생성 {time.perf_counter() - start:.1f}초 (PDF 행 상한 {PDF_MAX_ROWS})")
+        for mode in args.modes:
+            result = measure(mode, db_path, tmp)
+            if result:
+                print(f"{mode:12s} 최대 RSS {result['peak_rss_mb']:8.1f}MB | {result['seconds']:7.1f}초 | "
+                      f"파일 {result['size_mb']:7.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
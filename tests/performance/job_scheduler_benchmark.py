@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+작업 스케줄러 벤치마크
+주기 작업 수를 키워 가며 예전 방식(작업마다 threading.Thread + time.sleep 루프)과
+JobScheduler(타이머 스레드 하나 + 작업 풀)의 스레드 수, 실행 횟수, 실행 지연(lag)을 비교한다.
+gunicorn 워커가 여럿이면 예전 방식의 스레드 수는 워커 수만큼 곱해진다.
+
+사용법: python tests/performance/job_scheduler_benchmark.py --jobs 10 50 200 --seconds 3
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from core.backend.job_scheduler import JobScheduler, LocalLeaderLock  # noqa: E402
+
+
+def work(duration: float):
+    """짧은 점검 작업 흉내 (I/O 대기)"""
+    time.sleep(duration)
+
+
+def legacy(jobs: int, interval: float, seconds: float, duration: float):
+    """예전 방식: 작업마다 전용 스레드 루프"""
+    running = True
+    runs = [0] * jobs
+    lags: List[float] = []
+
+    def loop(index: int):
+        due = time.time()
+        while running:
+            lags.append(max(0.0, time.time() - due))
+            work(duration)
+            runs[index] += 1
+            time.sleep(interval)
+            due += interval + duration
+
+    before = threading.active_count()
+    threads = [threading.Thread(target=loop, args=(i,), daemon=True) for i in range(jobs)]
+    for thread in threads:
+        thread.start()
+    peak = threading.active_count() - before
+    time.sleep(seconds)
+    running = False
+    for thread in threads:
+        thread.join()
+    return peak, sum(runs), max(lags) if lags else 0.0
+
+
+def scheduled(jobs: int, interval: float, seconds: float, duration: float, workers: int):
+    """JobScheduler: 타이머 스레드 하나 + 작업 풀"""
+    scheduler = JobScheduler(max_workers=workers, leader_lock=LocalLeaderLock())
+    before = threading.active_count()
+    for i in range(jobs):
+        scheduler.add_job(f"job{i}", lambda: work(duration), interval=interval, initial_delay=i * interval / jobs)
+    time.sleep(seconds)
+    peak = threading.active_count() - before
+    status = scheduler.status()["jobs"]
+    scheduler.stop()
+    runs = sum(job["runs"] for job in status.values())
+    lag = max(job["max_lag"] for job in status.values())
+    return peak, runs, lag
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="작업 스케줄러 벤치마크")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--interval", type=float, default=0.5)
+    parser.add_argument("--duration", type=float, default=0.005, help="작업 한 회차 실행 시간(초)")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--workers", type=int, default=4, help="JobScheduler 작업 풀 크기")
+    args = parser.parse_args(argv)
+
+    for jobs in args.jobs:
+        for name, result in (
+            ("스레드 루프", legacy(jobs, args.interval, args.seconds, args.duration)),
+            ("작업 스케줄러", scheduled(jobs, args.interval, args.seconds, args.duration, args.workers)),
+        ):
+            threads, runs, lag = result
+            print(f"{jobs:>5}개 작업 {name:<8} 스레드 {threads:>5}개 | 실행 {runs:>6}회 | 최대 지연 {lag * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+L3 파일 캐시 벤치마크
+키마다 pickle 파일을 쓰는 이전 구현(PickleFileCache)과 SQLite 기반 FileCache의
+저장/조회/삭제/만료 정리 시간을 항목 수별로 비교한다.
+
+사용법: python tests/performance/l3_cache_benchmark.py --sizes 1000 5000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from utils.advanced_caching import FileCache, PickleFileCache  # noqa: E402
+
+logging.getLogger("utils.advanced_caching").setLevel(logging.ERROR)
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def bench(cache_cls, size: int, cache_dir: str) -> dict:
+    """항목 수 size에 대한 연산별 소요 시간(ms/op) 측정"""
+    cache = cache_cls(cache_dir)
+    payload = {"rows": list(range(20)), "label": "x" * 200}
+    keys = [f"bench:{i}" for i in range(size)]
+
+    def do_set():
+        for i, key in enumerate(keys):
+            # 절반은 즉시 만료되도록 저장
+            cache.set(key, payload, -1 if i % 2 else 3600)
+
+    def do_get():
+        for key in keys[::2]:
+            cache.get(key)
+
+    def do_cleanup():
+        cache.cleanup_expired()
+
+    def do_delete():
+        for key in keys[::2]:
+            cache.delete(key)
+
+    set_time = timed(do_set)
+    get_time = timed(do_get)
+    cleanup_time = timed(do_cleanup)
+    delete_time = timed(do_delete)
+    half = max(1, size // 2)
+    return {
+        "set": set_time / size * 1000,
+        "get": get_time / half * 1000,
+        "cleanup": cleanup_time * 1000,
+        "delete": delete_time / half * 1000,
+        "files": len(os.listdir(cache_dir)),
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="L3 파일 캐시 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000])
+    args = parser.parse_args(argv)
+
+    print(f"{'backend':>10} {'items':>7} {'set ms/op':>10} {'get ms/op':>10} "
+          f"{'delete ms/op':>13} {'cleanup ms':>11} {'files':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            for name, cache_cls in (("pickle", PickleFileCache), ("sqlite", FileCache)):
+                cache_dir = os.path.join(tmp, f"{name}-{size}")
+                os.makedirs(cache_dir)
+                r = bench(cache_cls, size, cache_dir)
+                print(f"{name:>10} {size:>7} {r['set']:>10.3f} {r['get']:>10.3f} "
+                      f"{r['delete']:>13.3f} {r['cleanup']:>11.1f} {r['files']:>6}")
+
+
+if __name__ == "__main__":
+    main()
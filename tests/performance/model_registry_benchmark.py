@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+모델 레지스트리 벤치마크
+예전 방식(예측마다 joblib.load 후 한 건 예측)과 메모리에 상주한 모델의 한 건 예측,
+predict_many 일괄 예측의 입력 한 건당 지연 시간을 비교한다.
+
+사용법: python tests/performance/model_registry_benchmark.py --batch-sizes 1 10 100 1000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import joblib
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from sklearn.ensemble import RandomForestRegressor  # noqa: E402
+from sklearn.preprocessing import StandardScaler  # noqa: E402
+
+from utils.model_registry import ModelRegistry  # noqa: E402
+
+
+def measure(func, count: int) -> float:
+    """입력 한 건당 평균 ms"""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000 / count
+
+
+def run(batch_sizes: List[int], trees: int, seed: int, workdir: Path):
+    rng = np.random.RandomState(seed)
+    X = rng.rand(2000, 8)
+    y = X @ rng.rand(8) * 100000
+    scaler = StandardScaler().fit(X)
+    model = RandomForestRegressor(n_estimators=trees, random_state=seed).fit(scaler.transform(X), y)
+
+    # 예전 방식: 파일로 저장해 두고 예측 요청마다 다시 읽음
+    legacy_path = workdir / "sales_prediction.joblib"
+    joblib.dump(model, legacy_path)
+    joblib.dump(scaler, workdir / "sales_prediction_scaler.joblib")
+
+    registry = ModelRegistry(workdir / "registry")
+    registry.publish("sales_prediction", model, scaler)
+    registry.evict("sales_prediction")
+    start = time.perf_counter()
+    registry.get("sales_prediction")
+    print(f"모델 첫 로드 {(time.perf_counter() - start) * 1000:.1f}ms (트리 {trees}개)")
+
+    def legacy(rows):
+        for row in rows:
+            loaded_model = joblib.load(legacy_path)
+            loaded_scaler = joblib.load(workdir / "sales_prediction_scaler.joblib")
+            loaded_model.predict(loaded_scaler.transform([row]))
+
+    def warm_single(rows):
+        for row in rows:
+            registry.get("sales_prediction").predict([row])
+
+    for size in batch_sizes:
+        rows = rng.rand(size, 8)
+        legacy_ms = measure(lambda: legacy(rows[:min(size, 20)]), min(size, 20))
+        single_ms = measure(lambda: warm_single(rows), size)
+        batch_ms = measure(lambda: registry.predict_many("sales_prediction", rows), size)
+        print(f"{size:>6}건 예측마다 로드 {legacy_ms:8.2f}ms | 상주 한 건씩 {single_ms:7.3f}ms | "
+              f"predict_many {batch_ms:7.4f}ms (건당) | {legacy_ms / max(batch_ms, 1e-6):8.1f}배")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="모델 레지스트리 벤치마크")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--trees", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        run(args.batch_sizes, args.trees, args.seed, Path(workdir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+온라인 이상 탐지 벤치마크
+시계열(브랜드/지점) 수를 키워 가며 예전 방식(호출마다 시계열 이력 전체로 Isolation Forest 학습 후 채점)과
+OnlineAnomalyDetector 한 번의 일괄 갱신으로 하루치 새 값을 채점하는 시간을 비교한다.
+
+사용법: python tests/performance/online_anomaly_benchmark.py --series 10 100 1000 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from sklearn.ensemble import IsolationForest  # noqa: E402
+
+from utils.online_anomaly import OnlineAnomalyDetector  # noqa: E402
+
+
+def legacy_detect(history: np.ndarray) -> bool:
+    """예전 방식: 시계열 하나의 30일 이력으로 매번 학습"""
+    model = IsolationForest(contamination=0.1, random_state=42)
+    model.fit(history.reshape(-1, 1))
+    scores = model.score_samples(history.reshape(-1, 1))
+    return bool(scores[-1] < scores.mean() - 2 * scores.std())
+
+
+def run(series: int, days: int, legacy_limit: int, seed: int):
+    rng = np.random.RandomState(seed)
+    values = rng.normal(1000, 50, size=(days, series)).clip(min=1)
+    keys = [("branch", i) for i in range(series)]
+
+    detector = OnlineAnomalyDetector(direction="drop", refit_interval=0)
+    for row in values[:-1]:
+        detector.update(keys, row)
+    detector.refit()
+
+    # 하루치 새 값 채점
+    start = time.perf_counter()
+    detector.update(keys, values[-1])
+    online_ms = (time.perf_counter() - start) * 1000
+
+    sample = min(series, legacy_limit)
+    start = time.perf_counter()
+    for i in range(sample):
+        legacy_detect(values[:, i])
+    legacy_ms = (time.perf_counter() - start) * 1000 * series / sample
+
+    print(f"{series:>7}개 시계열 예전 방식 {legacy_ms:10.1f}ms{'(추정)' if sample < series else '      '} | "
+          f"온라인 일괄 {online_ms:8.2f}ms | 시계열당 {online_ms * 1000 / series:7.2f}µs | "
+          f"{legacy_ms / max(online_ms, 1e-6):8.0f}배")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="온라인 이상 탐지 벤치마크")
+    parser.add_argument("--series", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--legacy-limit", type=int, default=20,
+                        help="예전 방식은 이 개수만 실제로 실행하고 나머지는 비례 추정")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    for series in args.series:
+        run(series, args.days, args.legacy_limit, args.seed)
+
+
+if __name__ == "__main__":
+    main()
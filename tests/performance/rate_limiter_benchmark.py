@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+요청 제한 벤치마크
+스레드 N개가 동시에 요청 제한을 확인할 때 초당 확인 수와 키별 메모리를 비교한다.
+- 예전 방식: 키마다 타임스탬프 리스트를 두고 확인 때마다 리스트 컴프리헨션으로 다시 만듦 (윈도 안 요청 수에 비례)
+- LocalRateLimiter: 샤드별 락 토큰 버킷 (O(1))
+- RedisRateLimiter: GCRA Lua 스크립트 (--redis-url 이 있으면 실제 서버, 없으면 fakeredis)
+
+사용법: python tests/performance/rate_limiter_benchmark.py --threads 1 8 32 --checks 20000
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.backend.rate_limiter import LocalRateLimiter, RateLimiter, RateLimitResult, RedisRateLimiter  # noqa: E402
+
+
+class LegacyListLimiter(RateLimiter):
+    """예전 SecurityManager.check_api_rate_limit 방식 (락 없이 dict + 리스트)"""
+
+    def __init__(self):
+        self.api_requests = {}
+
+    def hit(self, key: str, limit: int, period: float, cost: int = 1) -> RateLimitResult:
+        current_time = time.time()
+        if key not in self.api_requests:
+            self.api_requests[key] = []
+        self.api_requests[key] = [t for t in self.api_requests[key] if current_time - t < period]
+        allowed = len(self.api_requests[key]) < limit
+        if allowed:
+            self.api_requests[key].append(current_time)
+        return RateLimitResult(allowed, limit, limit - len(self.api_requests[key]), 0.0, 0.0)
+
+
+def contention(limiter: RateLimiter, threads: int, checks: int, keys: int, limit: int) -> float:
+    """스레드 threads개가 합쳐 checks번 확인 (키 keys개를 돌아가며), 초당 확인 수"""
+    per_thread = checks // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index):
+        barrier.wait()
+        for n in range(per_thread):
+            limiter.hit(f"user:{(index * per_thread + n) % keys}", limit, 60)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def memory_per_key(factory, keys: int, hits_per_key: int, limit: int) -> float:
+    """키마다 hits_per_key번 요청한 뒤 키당 메모리 (bytes)"""
+    tracemalloc.start()
+    limiter = factory()
+    before = tracemalloc.get_traced_memory()[0]
+    for n in range(keys):
+        for _ in range(hits_per_key):
+            limiter.hit(f"user:{n}", limit, 60)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / keys
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="요청 제한 벤치마크")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--checks", type=int, default=20000)
+    parser.add_argument("--keys", type=int, default=100, help="동시에 쓰는 키 수 (적을수록 경합 큼)")
+    parser.add_argument("--limit", type=int, default=1000, help="키당 60초 허용 수 (예전 방식 리스트 길이 상한)")
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args(argv)
+
+    if args.redis_url:
+        import redis
+        make_redis = lambda: RedisRateLimiter(redis.from_url(args.redis_url), prefix="ratelimit-bench:")  # noqa: E731
+    else:
+        try:
+            import fakeredis
+            server = fakeredis.FakeServer()
+            make_redis = lambda: RedisRateLimiter(fakeredis.FakeRedis(server=server))  # noqa: E731
+        except ImportError:
+            make_redis = None
+
+    backends = [("예전 리스트", LegacyListLimiter), ("로컬 토큰버킷", LocalRateLimiter)]
+    if make_redis:
+        backends.append(("Redis GCRA" + ("" if args.redis_url else " (fakeredis)"), make_redis))
+
+    for label, factory in backends:
+        for threads in args.threads:
+            rate = contention(factory(), threads, args.checks, args.keys, args.limit)
+            print(f"{label:22s} 스레드 {threads:3d} | {rate:10.0f} 확인/초")
+        if factory is not make_redis:
+            memory = memory_per_key(factory, 1000, min(args.limit, 200), args.limit)
+            print(f"{label:22s} 키당 메모리 (키당 요청 {min(args.limit, 200)}회) {memory:8.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+사이드카 SQLite 접근 계층 벤치마크
+CentralDataLayer.get_attendance_data / get_sales_data 를 여러 스레드에서 동시에 호출해
+예전 방식(호출마다 sqlite3.connect + 전역 RLock)과 SidecarDB(스레드별 연결 + WAL)의
+초당 처리량을 비교한다.
+
+사용법: python tests/performance/sidecar_db_benchmark.py --threads 1 4 8 16
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from core.backend.central_data_layer import CentralDataLayer  # noqa: E402
+
+logging.getLogger("core.backend.central_data_layer").setLevel(logging.ERROR)
+
+
+class LegacyDB:
+    """예전 구현처럼 매 호출마다 연결을 열고 읽기/쓰기 모두 하나의 락으로 직렬화 (비교용)"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.lock = threading.RLock()
+
+    @contextmanager
+    def _connect(self):
+        with self.lock:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            try:
+                yield conn
+                conn.commit()
+            finally:
+                conn.close()
+
+    read = _connect
+    write = _connect
+
+
+def seed(layer: CentralDataLayer, days: int):
+    """벤치마크용 근태/매출 데이터 추가"""
+    rows = []
+    for day in range(days):
+        date = f"2024-{1 + day // 28:02d}-{1 + day % 28:02d}"
+        for employee_id in range(1, 6):
+            rows.append((employee_id, 1, date, f"{date} 09:00:00", f"{date} 18:00:00",
+                         8.0, "checked_out"))
+    layer.db.executemany(
+        "INSERT INTO attendance (employee_id, branch_id, date, clock_in, clock_out, "
+        "work_hours, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    layer.db.executemany(
+        "INSERT INTO sales (branch_id, employee_id, date, amount, items_count, "
+        "payment_method) VALUES (?, ?, ?, ?, ?, ?)",
+        [(1, r[0], r[2], 150000.0, 12, "card") for r in rows],
+    )
+
+
+def run_workload(layer: CentralDataLayer, threads: int, calls_per_thread: int) -> float:
+    """스레드별로 근태/매출 조회를 번갈아 수행하고 초당 호출 수 반환"""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        for n in range(calls_per_thread):
+            # 직원 한 명의 한 주 데이터 (대시보드 위젯 수준의 작은 조회)
+            employee_id = 1 + n % 5
+            start = 1 + 7 * (n % 4)
+            date_from, date_to = f"2024-01-{start:02d}", f"2024-01-{start + 6:02d}"
+            if n % 2:
+                layer.get_sales_data(employee_id=employee_id, date_from=date_from, date_to=date_to)
+            else:
+                layer.get_attendance_data(employee_id=employee_id, date_from=date_from,
+                                          date_to=date_to)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in workers:
+        t.join()
+    return threads * calls_per_thread / (time.perf_counter() - start)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="사이드카 SQLite 접근 계층 벤치마크")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--calls", type=int, default=200, help="스레드당 조회 수")
+    parser.add_argument("--days", type=int, default=90, help="추가할 근태/매출 일수")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "central_data.db")
+        layer = CentralDataLayer(db_path)
+        seed(layer, args.days)
+        pooled = layer.db
+        legacy = LegacyDB(db_path)
+
+        print(f"스레드당 {args.calls}회 조회")
+        print(f"{'threads':>8} {'legacy calls/s':>16} {'sidecar calls/s':>17} {'speedup':>8}")
+        for threads in args.threads:
+            layer.db = legacy
+            baseline = run_workload(layer, threads, args.calls)
+            layer.db = pooled
+            current = run_workload(layer, threads, args.calls)
+            print(f"{threads:>8} {baseline:>16,.0f} {current:>17,.0f} {current / baseline:>7.1f}x")
+        pooled.close()
+
+
+if __name__ == "__main__":
+    main()
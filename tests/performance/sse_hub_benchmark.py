@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+대시보드 SSE 브로드캐스트 벤치마크
+예전 방식(모든 클라이언트가 queue.Queue 하나에서 get)과 SSEHub(한 번 직렬화 후 구독자별 링 버퍼)로
+구독자 N명에게 이벤트 M개를 보낼 때, 이벤트가 전달된 구독자 비율과 발행→전원 수신 시간,
+구독자당 메모리를 비교한다.
+
+사용법: python tests/performance/sse_hub_benchmark.py --subscribers 2000 --events 200
+"""
+
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import tracemalloc
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.backend.event_bus import InProcessEventBus  # noqa: E402
+from core.backend.sse_hub import SSEHub  # noqa: E402
+
+
+def payload(n: int):
+    return {"type": "dashboard_update", "n": n, "data": {"sales": n * 1000, "orders": n, "alerts": []}}
+
+
+def legacy(subscribers: int, events: int):
+    """예전 방식: 공유 큐 하나를 클라이언트 스레드들이 나눠 get (이벤트 하나는 한 명에게만 감)"""
+    shared = queue.Queue()
+    received = [0] * subscribers
+    stop = threading.Event()
+
+    def client(index):
+        while not stop.is_set():
+            try:
+                shared.get(timeout=0.05)
+                received[index] += 1
+            except queue.Empty:
+                pass
+
+    threads = [threading.Thread(target=client, args=(i,), daemon=True) for i in range(subscribers)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    for n in range(events):
+        shared.put(json.dumps(payload(n)))
+    while not shared.empty():
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return elapsed, sum(received) / (subscribers * events)
+
+
+def hub(subscribers: int, events: int):
+    """SSEHub: 이벤트마다 한 번 직렬화해 모든 구독자 버퍼에 넣음 (구독자별 스레드 없음)"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    sse = SSEHub("bench", event_bus=InProcessEventBus(), subscriber_buffer=events)
+    subs = [sse.subscribe() for _ in range(subscribers)]
+    per_subscriber = sum(s.size_diff for s in tracemalloc.take_snapshot().compare_to(before, "filename")) / subscribers
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for n in range(events):
+        sse.publish(payload(n))
+    sse.event_bus.flush()
+    elapsed = time.perf_counter() - start
+    delivered = sum(len(s.drain()[0]) for s in subs)
+    sse.close_all()
+    return elapsed, delivered / (subscribers * events), per_subscriber
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="대시보드 SSE 브로드캐스트 벤치마크")
+    parser.add_argument("--subscribers", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--legacy-subscribers", type=int, default=200,
+                        help="예전 방식은 클라이언트마다 스레드라 적은 수로 측정")
+    args = parser.parse_args(argv)
+
+    elapsed, coverage = legacy(args.legacy_subscribers, args.events)
+    print(f"공유 큐   구독자 {args.legacy_subscribers:6d} | 이벤트 {args.events:5d} | "
+          f"{elapsed:7.3f}s | 전달률 {coverage * 100:6.2f}% | 스레드 {args.legacy_subscribers}")
+
+    elapsed, coverage, memory = hub(args.subscribers, args.events)
+    print(f"SSEHub   구독자 {args.subscribers:6d} | 이벤트 {args.events:5d} | "
+          f"{elapsed:7.3f}s | 전달률 {coverage * 100:6.2f}% | 구독자당 {memory / 1024:5.1f}KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+워커 부팅 벤치마크
+워커 N개를 예전 방식(워커마다 app을 따로 import)과 --preload 방식(마스터가 한 번 import하고
+gc.freeze 후 포크)으로 띄워, 워커가 요청을 받을 준비가 될 때까지의 시간과 워커별 고유 메모리(USS)를 비교한다.
+단계/모듈별 시작 비용은 `python -m core.backend.startup_profiler` 로 본다.
+
+사용법: python tests/performance/startup_benchmark.py --workers 4
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+# 프로젝트 루트 (워커 프로세스의 Python 경로에 추가)
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WORKER = """
+import json, os, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+import app
+import psutil
+print(json.dumps({{"boot": time.perf_counter() - start, "uss": psutil.Process().memory_full_info().uss}}), flush=True)
+"""
+
+PRELOAD = """
+import json, os, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+import app
+from core.backend.worker_preload import prepare_for_fork, after_fork
+import psutil
+prepare_for_fork()
+master_boot = time.perf_counter() - start
+results = []
+for _ in range({workers}):
+    read, write = os.pipe()
+    forked = time.perf_counter()
+    if os.fork() == 0:
+        os.close(read)
+        after_fork()
+        info = {{"boot": time.perf_counter() - forked, "uss": psutil.Process().memory_full_info().uss}}
+        os.write(write, json.dumps(info).encode())
+        os._exit(0)
+    os.close(write)
+    results.append(read)
+workers = []
+for read in results:
+    with os.fdopen(read) as f:
+        workers.append(json.loads(f.read()))
+os.wait()
+print(json.dumps({{"master_boot": master_boot, "workers": workers}}), flush=True)
+"""
+
+
+def _env(db_dir: str, preload: bool):
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(db_dir, 'bench.db')}")
+    env["APP_PRELOAD"] = "1" if preload else "0"
+    return env
+
+
+def _last_json(output: str):
+    for line in reversed(output.strip().splitlines()):
+        if line.startswith("{"):
+            return json.loads(line)
+    raise RuntimeError("벤치마크 결과를 찾지 못했습니다")
+
+
+def legacy(workers: int, db_dir: str):
+    """예전 방식: 워커마다 app import (동시에 부팅)"""
+    start = time.perf_counter()
+    procs = [subprocess.Popen([sys.executable, "-c", WORKER.format(root=ROOT)], cwd=ROOT,
+                              env=_env(db_dir, False), stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, text=True)
+             for _ in range(workers)]
+    results = [_last_json(proc.communicate()[0]) for proc in procs]
+    return time.perf_counter() - start, results
+
+
+def preload(workers: int, db_dir: str):
+    """--preload 방식: 마스터 import 한 번 + 포크"""
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", PRELOAD.format(root=ROOT, workers=workers)], cwd=ROOT,
+                            env=_env(db_dir, True), capture_output=True, text=True).stdout
+    result = _last_json(output)
+    return time.perf_counter() - start, result["workers"], result["master_boot"]
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="워커 부팅 벤치마크")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        # 테이블 생성/시드는 한 번 해 두고 비교
+        subprocess.run([sys.executable, "-c", WORKER.format(root=ROOT)], cwd=ROOT,
+                       env=_env(db_dir, True), capture_output=True)
+        total, results = legacy(args.workers, db_dir)
+        boot = max(r["boot"] for r in results)
+        uss = sum(r["uss"] for r in results) / 1048576
+        print(f"예전 방식   워커 {args.workers}개 준비 {total:6.2f}s | 워커 부팅 최대 {boot:6.2f}s | "
+              f"워커 고유 메모리 합 {uss:8.1f}MB")
+
+        total, results, master = preload(args.workers, db_dir)
+        boot = max(r["boot"] for r in results)
+        uss = sum(r["uss"] for r in results) / 1048576
+        print(f"preload    워커 {args.workers}개 준비 {total:6.2f}s | 마스터 {master:6.2f}s + 포크 후 최대 {boot:6.2f}s | "
+              f"워커 고유 메모리 합 {uss:8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+재훈련 학습 데이터 수집 벤치마크
+주문 건수를 키워 가며 예전 방식(1년치 주문 행을 모두 읽어 행마다 dict를 만든 뒤 pandas로 집계)과
+SQL 일별 집계 + 일별 특성 테이블(첫 실행 전체, 이후 새 날짜만)의 소요 시간과 최대 메모리를 비교한다.
+
+사용법: python tests/performance/training_data_benchmark.py --orders 100000 1000000
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from utils.training_data import DailySalesFeatureStore, track_resources  # noqa: E402
+
+
+def make_orders(path: Path, count: int, end: date, seed: int):
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE orders (id INTEGER PRIMARY KEY, created_at TEXT, total_cost INTEGER)")
+    conn.execute("CREATE INDEX idx_order_created_at ON orders (created_at)")
+    start = datetime.combine(end - timedelta(days=365), datetime.min.time())
+    conn.executemany(
+        "INSERT INTO orders (created_at, total_cost) VALUES (?, ?)",
+        ((str(start + timedelta(seconds=rng.randrange(365 * 86400))), rng.randint(1, 100) * 1000)
+         for _ in range(count)),
+    )
+    conn.commit()
+    return conn
+
+
+def legacy_collect(conn, start: date):
+    """예전 방식: 모든 주문 행 -> dict 목록 -> pandas 집계"""
+    data = []
+    for created_at, amount in conn.execute("SELECT created_at, total_cost FROM orders WHERE created_at >= ?",
+                                           (str(start),)):
+        created = datetime.fromisoformat(created_at)
+        data.append({"date": created.date(), "sales_amount": amount, "order_count": 1,
+                     "day_of_week": created.weekday(), "month": created.month})
+    df = pd.DataFrame(data)
+    daily = df.groupby("date").agg({"sales_amount": "sum", "order_count": "sum",
+                                    "day_of_week": "first", "month": "first"}).reset_index()
+    daily["previous_sales"] = daily["sales_amount"].shift(1)
+    daily["sales_7d_avg"] = daily["sales_amount"].rolling(7).mean()
+    daily["sales_30d_avg"] = daily["sales_amount"].rolling(30).mean()
+    return daily.dropna()
+
+
+def pipeline_collect(conn, store: DailySalesFeatureStore, start: date, end: date):
+    """SQL 일별 집계 후 일별 특성 테이블에서 읽기"""
+    refresh_from = store.refresh_start(start)
+    rows = conn.execute(
+        "SELECT date(created_at), SUM(COALESCE(total_cost, 0)), COUNT(id) FROM orders "
+        "WHERE created_at >= ? GROUP BY date(created_at)", (str(refresh_from),)
+    ).fetchall()
+    store.replace_range(refresh_from, end, rows)
+    return store.frame(start, end)
+
+
+def run(count: int, seed: int, workdir: Path):
+    end = date.today()
+    start = end - timedelta(days=365)
+    conn = make_orders(workdir / f"orders_{count}.db", count, end, seed)
+    store = DailySalesFeatureStore(workdir / f"features_{count}.db")
+
+    cases = [
+        ("예전 방식", lambda: legacy_collect(conn, start)),
+        ("SQL 집계 첫 실행", lambda: pipeline_collect(conn, store, start, end)),
+        ("SQL 집계 증분", lambda: pipeline_collect(conn, store, start, end)),
+    ]
+    # 방식별로 비교해야 하므로 프로세스 최대 RSS 대신 tracemalloc 할당량을 쓴다
+    for name, func in cases:
+        with track_resources(trace_allocations=True) as resources:
+            rows = len(func())
+        print(f"{count:>8}건 {name:<12} {resources['wall_time'] * 1000:9.1f}ms | "
+              f"최대 할당 {resources['traced_peak_mb']:8.2f}MB | {rows}일")
+    conn.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="재훈련 학습 데이터 수집 벤치마크")
+    parser.add_argument("--orders", type=int, nargs="+", default=[10000, 100000, 500000])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for count in args.orders:
+            run(count, args.seed, Path(workdir))
+
+
+if __name__ == "__main__":
+    main()
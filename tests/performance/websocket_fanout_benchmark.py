@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+WebSocket 브로드캐스트 부하 테스트
+같은 프로세스 안에 WebSocket 서버와 수천 개의 클라이언트를 띄우고, 전송이 느린
+클라이언트가 섞여 있을 때 브로드캐스트가 모든 정상 클라이언트에 도달하는 시간을 잰다.
+--legacy 를 주면 예전처럼 클라이언트마다 순서대로 await send 하는 방식도 같이 측정한다.
+
+사용법: python tests/performance/websocket_fanout_benchmark.py --clients 2000 --slow 20
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from typing import List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+import jwt  # noqa: E402
+import websockets  # noqa: E402
+
+from api import websocket_server  # noqa: E402
+from api.websocket_server import WebSocketManager, websocket_handler  # noqa: E402
+
+logging.getLogger().setLevel(logging.ERROR)
+
+SECRET = "benchmark-secret"
+
+
+def resolve_identity(token: str):
+    """벤치마크용 신원 확인: DB 없이 서명된 토큰의 클레임을 그대로 사용"""
+    payload = jwt.decode(token, SECRET, algorithms=["HS256"])
+    return {"user_id": payload["user_id"], "role": "employee", "brand_id": 1, "branch_id": payload["branch_id"]}
+
+
+async def open_client(uri: str, user_id: int, branch_id: int):
+    client = await websockets.connect(uri, max_queue=None, ping_interval=None)
+    token = jwt.encode({"user_id": user_id, "branch_id": branch_id}, SECRET, algorithm="HS256")
+    await client.send(json.dumps({"type": "auth", "token": token}))
+    assert json.loads(await client.recv())["type"] == "auth_success"
+    return client
+
+
+async def receive(client, count: int, kind: str) -> float:
+    """kind 타입 메시지를 count개 받을 때까지 대기하고 완료 시각 반환"""
+    received = 0
+    while received < count:
+        if json.loads(await client.recv())["type"] == kind:
+            received += 1
+    return time.perf_counter()
+
+
+async def legacy_broadcast(manager: WebSocketManager, message):
+    """예전 구현: 클라이언트마다 순서대로 await send"""
+    message_str = json.dumps(message)
+    for client in list(manager.clients):
+        await client.send(message_str)
+
+
+def slow_down(websocket, delay: float):
+    """서버 쪽 연결의 send마다 지연을 넣어 느린 네트워크의 클라이언트를 흉내냄
+
+    루프백 소켓은 커널 버퍼가 커서 읽지 않는 클라이언트만으로는 전송이 잘 막히지 않는다.
+    """
+    original = websocket.send
+
+    async def send(message, *args, **kwargs):
+        await asyncio.sleep(delay)
+        return await original(message, *args, **kwargs)
+
+    websocket.send = send
+
+
+async def measure(label: str, fast, broadcast, messages: int, payload: str, timeout: float):
+    """정상 클라이언트 전원이 messages건을 모두 받을 때까지 걸린 시간 출력"""
+    kind = f"{label}_tick"
+    waiters = [asyncio.create_task(receive(c, messages, kind)) for c in fast]
+    start = time.perf_counter()
+    try:
+        async def send_all():
+            for n in range(messages):
+                await broadcast({"type": kind, "seq": n, "payload": payload})
+                # 실제 서버처럼 메시지 사이에 이벤트 루프가 한 번은 돌도록
+                await asyncio.sleep(0)
+            return await asyncio.gather(*waiters)
+
+        done = await asyncio.wait_for(send_all(), timeout)
+        print(f"[{label}] {messages}건 x {len(fast)}명 도달: 최대 {(max(done) - start) * 1000:.0f}ms, "
+              f"p50 {(sorted(done)[len(done) // 2] - start) * 1000:.0f}ms")
+    except asyncio.TimeoutError:
+        reached = sum(1 for w in waiters if w.done())
+        print(f"[{label}] {timeout:.0f}초 안에 완료 못함 (전부 받은 클라이언트 {reached}/{len(fast)})")
+    for waiter in waiters:
+        waiter.cancel()
+
+
+async def run(args):
+    manager = WebSocketManager(send_queue_size=args.queue_size,
+                               slow_consumer_policy=args.policy,
+                               send_timeout=args.send_timeout,
+                               identity_resolver=resolve_identity)
+    websocket_server.ws_manager = manager
+
+    server = await websockets.serve(websocket_handler, "127.0.0.1", 0, ping_interval=None,
+                                    max_queue=None)
+    port = server.sockets[0].getsockname()[1]
+    uri = f"ws://127.0.0.1:{port}"
+
+    start = time.perf_counter()
+    fast = []
+    for offset in range(0, args.clients, 200):
+        batch = range(offset, min(offset + 200, args.clients))
+        fast += await asyncio.gather(*(open_client(uri, i, i % args.branches) for i in batch))
+    # 느린 클라이언트: 서버에서 이 연결로의 전송이 건마다 --slow-delay 초씩 걸림
+    slow = [await open_client(uri, -i - 1, 0) for i in range(args.slow)]
+    for websocket, data in manager.client_data.items():
+        if data.get("user_id", 0) < 0:
+            slow_down(websocket, args.slow_delay)
+    print(f"연결 {len(fast)}개 + 느린 클라이언트 {len(slow)}개: {time.perf_counter() - start:.1f}초")
+
+    payload = "x" * args.payload
+    await measure("fanout", fast, manager.broadcast, args.messages, payload, args.timeout)
+
+    waiters = [asyncio.create_task(receive(c, 1, "branch_notice"))
+               for i, c in enumerate(fast) if i % args.branches == 0]
+    await manager.publish("branch:0", {"type": "branch_notice"})
+    await asyncio.wait_for(asyncio.gather(*waiters), 10)
+    await manager.send_to_user(1, {"type": "direct"})
+    await asyncio.wait_for(receive(fast[1], 1, "direct"), 10)
+    print(f"토픽/사용자 전송 확인, 통계: {manager.get_stats()}")
+
+    if args.legacy:
+        await measure("legacy", fast, lambda m: legacy_broadcast(manager, m),
+                      args.messages, payload, args.timeout)
+
+    for client in fast + slow:
+        client.transport.abort()
+    server.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="WebSocket 브로드캐스트 부하 테스트")
+    parser.add_argument("--clients", type=int, default=2000)
+    parser.add_argument("--slow", type=int, default=20, help="느린 클라이언트 수")
+    parser.add_argument("--slow-delay", type=float, default=0.2, help="느린 클라이언트 전송 지연(초)")
+    parser.add_argument("--branches", type=int, default=50)
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--payload", type=int, default=4096, help="메시지 크기(바이트)")
+    parser.add_argument("--queue-size", type=int, default=64)
+    parser.add_argument("--policy", default="drop_oldest",
+                        choices=["drop_oldest", "drop_new", "disconnect"])
+    parser.add_argument("--send-timeout", type=float, default=5.0)
+    parser.add_argument("--legacy", action="store_true", help="예전 순차 전송 방식도 측정")
+    parser.add_argument("--timeout", type=float, default=60.0, help="측정별 제한 시간(초)")
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
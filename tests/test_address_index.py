@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+주소 트라이그램 색인 테스트
+후보 검색 결과와, 모델 이벤트로 커밋된 주소 변경만 색인에 반영되는지 확인
+"""
+
+from api.address_validation import (
+    address_index,
+    check_duplicate_address,
+    extract_address_keywords,
+    get_similar_addresses,
+    normalize_address,
+)
+from models_main import Branch
+from utils.address_index import AddressTrigramIndex
+
+
+def make_index():
+    index = AddressTrigramIndex(normalize_address, extract_address_keywords)
+    index.load("store", [
+        (1, "서울특별시 강남구 테헤란로 123"),
+        (2, "서울특별시 강남구 테헤란로 125"),
+        (3, "부산광역시 해운대구 해운대로 77"),
+        (4, None),
+    ])
+    return index
+
+
+def test_trigram_search_ranks_near_duplicates():
+    """가까운 주소가 먼저 나오고, 제외 ID와 관련 없는 주소는 빠지는지 테스트"""
+    index = make_index()
+    results = index.search("서울 강남구 테헤란로 123", "store", limit=5)
+
+    assert [entity_id for entity_id, _, _ in results] == [1, 2]
+    assert results[0][2] > results[1][2]
+    assert [r[0] for r in index.search("서울 강남구 테헤란로 123", "store", exclude_id=1)] == [2]
+    assert index.size("store") == 3
+
+    index.remove("store", 1)
+    index.add("store", 2, None)
+    assert index.search("서울 강남구 테헤란로 123", "store") == []
+
+
+def test_committed_changes_update_index(session):
+    """커밋된 추가/수정/삭제만 색인에 반영되고 롤백은 무시되는지 테스트"""
+    address_index.invalidate()
+    store = Branch(name="강남점", address="서울특별시 강남구 테헤란로 123")
+    session.add(store)
+    session.commit()
+
+    result = check_duplicate_address("서울특별시 강남구 테헤란로 123", entity_type="store")
+    assert result["duplicate"] is True
+    assert address_index.index.size("store") == 1
+
+    # 롤백된 변경은 반영되지 않음
+    session.add(Branch(name="임시점", address="부산광역시 해운대구 해운대로 77"))
+    session.flush()
+    session.rollback()
+    assert address_index.index.size("store") == 1
+
+    store = session.get(Branch, store.id)
+    store.address = "대전광역시 서구 둔산로 100"
+    session.commit()
+    assert get_similar_addresses("대전 서구 둔산로", entity_type="store") == ["대전광역시 서구 둔산로 100"]
+    assert get_similar_addresses("테헤란로 123", entity_type="store") == []
+
+    session.delete(store)
+    session.commit()
+    assert address_index.index.size("store") == 0
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+고급 캐싱 시스템 테스트
+샤드 L1 캐시와 동일 키 동시 미스 병합 동작 확인
+"""
+
+import threading
+import time
+
+import pytest
+
+from utils.advanced_caching import AdvancedCache, CacheLevel
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Redis 없이 L1/L3만 사용하는 캐시"""
+    cache = AdvancedCache({"file_cache_dir": str(tmp_path), "redis": {"port": 1}})
+    cache.l2_cache = None
+    return cache
+
+
+def test_set_get_delete_across_shards(cache):
+    """여러 샤드에 걸친 저장/조회/삭제 테스트"""
+    for i in range(100):
+        assert cache.set(f"key{i}", i)
+    assert all(cache.get(f"key{i}") == i for i in range(100))
+
+    cache.delete("key7")
+    assert cache.get("key7") is None
+
+    stats = cache.get_stats()
+    assert stats["hits"]["l1"] == 100
+    assert stats["writes"]["l1"] == 100
+
+
+def test_l3_hit_promotes_to_l1(cache):
+    """L3 히트 시 L1으로 승격되는지 테스트"""
+    cache.set("file-only", {"v": 1}, levels=[CacheLevel.L3_FILE])
+    assert cache.get("file-only") == {"v": 1}
+    assert cache.get("file-only", levels=[CacheLevel.L1_MEMORY]) == {"v": 1}
+
+
+def test_clear_namespace(cache):
+    """네임스페이스 단위 삭제 테스트"""
+    cache.set("a", 1, namespace="ns1")
+    cache.set("a", 2, namespace="ns2")
+    cache.clear("ns1")
+    assert cache.get("a", namespace="ns1") is None
+    assert cache.get("a", namespace="ns2") == 2
+
+
+def test_concurrent_misses_are_coalesced(cache):
+    """동일 키 동시 미스 시 로더가 한 번만 실행되는지 테스트"""
+    calls = []
+    barrier = threading.Barrier(8)
+    results = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return "loaded"
+
+    def worker():
+        barrier.wait()
+        results.append(cache.get_or_load("hot", loader))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == ["loaded"] * 8
+
+
+def test_loader_error_propagates_to_waiters(cache):
+    """로더 예외가 대기 중인 호출자에게도 전달되는지 테스트"""
+    def loader():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        cache.get_or_load("broken", loader)
+    assert cache.get("broken") is None
+
+
+def test_stale_value_served_while_revalidating(cache):
+    """신선 기한 경과 후 이전 값을 반환하고 한 번만 재계산하는지 테스트"""
+    values = iter(["v1", "v2"])
+
+    def loader():
+        return next(values)
+
+    assert cache.get_or_load("dash", loader, ttl=0, stale_ttl=60) == "v1"
+    # ttl=0 이므로 바로 stale 상태 - 호출자 하나가 재계산
+    assert cache.get_or_load("dash", loader, ttl=60, stale_ttl=60) == "v2"
+    assert cache.get_or_load("dash", loader, ttl=60, stale_ttl=60) == "v2"
+
+    read_through = cache.get_stats()["read_through"]
+    assert read_through["loads"] == 2
+    assert read_through["stale_served"] == 1
+    assert read_through["hits"] == 1
+
+
+def test_background_refresh_returns_stale_value(cache):
+    """백그라운드 재계산 중 다른 호출자는 이전 값을 받는지 테스트"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    release = threading.Event()
+    values = iter(["old", "new"])
+
+    def loader():
+        value = next(values)
+        if value == "new":
+            release.wait(5)
+        return value
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        cache.get_or_load("bg", loader, ttl=0, stale_ttl=60, executor=executor)
+        for _ in range(5):
+            assert cache.get_or_load("bg", loader, ttl=60, stale_ttl=60,
+                                     executor=executor) == "old"
+        release.set()
+
+    assert cache.get_or_load("bg", loader, ttl=60, stale_ttl=60) == "new"
+    assert cache.get_stats()["read_through"]["stale_served"] == 5
+
+
+def test_coalesced_waiters_counted(cache):
+    """병합된 대기 호출자 수가 통계에 반영되는지 테스트"""
+    barrier = threading.Barrier(4)
+
+    def loader():
+        time.sleep(0.05)
+        return 1
+
+    def worker():
+        barrier.wait()
+        cache.get_or_load("c", loader)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    read_through = cache.get_stats()["read_through"]
+    assert read_through["loads"] == 1
+    assert read_through["coalesced_waiters"] == 3
+
+
+def test_invalidate_tags_drops_only_tagged_entries(cache):
+    """태그가 붙은 항목만 모든 레벨에서 삭제되는지 테스트"""
+    cache.set("brand12:dashboard", "d12", tags=["brand:12"])
+    cache.set("branch40:staff", "s40", tags=["brand:12", "branch:40"])
+    cache.set("brand13:dashboard", "d13", tags=["brand:13"])
+
+    assert cache.invalidate_tags(["branch:40"]) == 1
+    assert cache.get("branch40:staff") is None
+    assert cache.get("brand12:dashboard") == "d12"
+
+    assert cache.invalidate_tags(["brand:12"]) == 1
+    assert cache.get("brand12:dashboard") is None
+    assert cache.get("brand12:dashboard", levels=[CacheLevel.L3_FILE]) is None
+    assert cache.get("brand13:dashboard") == "d13"
+
+
+def test_cached_decorator_tags(cache):
+    """데코레이터 태그 함수로 인자별 태그가 붙는지 테스트"""
+    from utils.advanced_caching import cached, invalidate_cache_tags
+
+    calls = []
+
+    @cached(ttl=60, cache=cache, tags=lambda user_id: [f"user:{user_id}"])
+    def load_profile(user_id):
+        calls.append(user_id)
+        return {"id": user_id}
+
+    load_profile(7)
+    load_profile(7)
+    load_profile(8)
+    assert calls == [7, 8]
+
+    invalidate_cache_tags(["user:7"])
+    load_profile(7)
+    load_profile(8)
+    assert calls == [7, 8, 7]
+
+
+def test_model_commit_invalidates_tags(cache):
+    """Branch 커밋 시 branch 태그 항목이 무효화되는지 테스트"""
+    from flask import Flask
+    from flask_sqlalchemy import SQLAlchemy
+
+    from utils import advanced_caching
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    db = SQLAlchemy(app)
+
+    class Branch(db.Model):
+        id = db.Column(db.Integer, primary_key=True)
+        name = db.Column(db.String(50))
+
+    previous = advanced_caching._hooks_registered
+    advanced_caching._hooks_registered = False
+    try:
+        advanced_caching.register_model_invalidation_hooks(db)
+        with app.app_context():
+            db.create_all()
+            branch = Branch(name="gangnam")
+            db.session.add(branch)
+            db.session.commit()
+
+            cache.set("staff", ["a"], tags=[f"branch:{branch.id}"])
+            branch.name = "seocho"
+            db.session.rollback()
+            assert cache.get("staff") == ["a"]
+
+            branch = db.session.get(Branch, branch.id)
+            branch.name = "seocho"
+            db.session.commit()
+            assert cache.get("staff") is None
+    finally:
+        advanced_caching._hooks_registered = previous
+
+
+def test_sqlite_file_cache_expiry_and_namespace(tmp_path):
+    """SQLite L3 캐시의 만료 정리와 네임스페이스 삭제 테스트"""
+    from utils.advanced_caching import FileCache
+
+    l3 = FileCache(str(tmp_path))
+    l3.set("ns1:a", {"v": 1}, 3600)
+    l3.set("ns1:b", {"v": 2}, -1)
+    l3.set("ns10:a", {"v": 3}, 3600)
+
+    assert l3.get("ns1:a") == {"v": 1}
+    assert l3.get("ns1:b") is None
+
+    l3.clear("ns1")
+    assert l3.get("ns1:a") is None
+    assert l3.get("ns10:a") == {"v": 3}
+
+    # 다시 열어도 값 유지
+    assert FileCache(str(tmp_path)).get("ns10:a") == {"v": 3}
+
+
+def test_invalidate_tags_reaches_other_workers_l3(tmp_path):
+    """Redis 없이 L3 파일을 공유하는 두 워커에서, 한쪽의 태그 무효화가 다른 쪽이 저장한 L3 항목도 지우는지 테스트
+
+    다른 워커의 L1에 이미 올라간 값은 l1_ttl까지 남는 것이 알려진 한계
+    """
+    def worker():
+        cache = AdvancedCache({"file_cache_dir": str(tmp_path), "redis": {"port": 1}})
+        cache.l2_cache = None
+        return cache
+
+    writer, invalidator, reader = worker(), worker(), worker()
+    writer.set("brand12:dashboard", "d12", tags=["brand:12"])
+    writer.set("brand13:dashboard", "d13", tags=["brand:13"])
+    assert reader.get("brand12:dashboard") == "d12"  # reader L1으로 승격
+
+    assert invalidator.invalidate_tags(["brand:12"]) == 1
+    assert worker().get("brand12:dashboard") is None
+    assert writer.get("brand12:dashboard", levels=[CacheLevel.L3_FILE]) is None
+    assert worker().get("brand13:dashboard") == "d13"
+
+    # 알려진 한계: 다른 워커의 L1은 l1_ttl이 지날 때까지 남음
+    assert reader.get("brand12:dashboard", levels=[CacheLevel.L1_MEMORY]) == "d12"
+    assert reader.get("brand12:dashboard", levels=[CacheLevel.L3_FILE]) is None
+
+    # 무효화된 키의 역색인도 지워져 다시 세지 않음
+    assert invalidator.invalidate_tags(["brand:12"]) == 0
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+대량 알림 발송 테스트
+수신자 조회/알림 저장이 수신자 수와 관계없이 같은 수의 SQL 문으로 끝나고,
+외부 채널 전송 결과가 채널별로 집계되는지 확인
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from models_main import Contract, Notification, Staff, User, db
+from utils.notify import BulkNotificationSender, send_notification_to_multiple_users
+
+
+class RecordingService:
+    """채널별 전송 호출을 기록하는 테스트용 알림 서비스 (SMS는 항상 실패)"""
+
+    def __init__(self):
+        self.calls = []
+
+    def send_email(self, to_email, subject, message, html_content=None):
+        self.calls.append(("email", to_email))
+        return True, "ok"
+
+    def send_kakao_message(self, user_id, message):
+        self.calls.append(("kakao", user_id))
+        return True, "ok"
+
+    def send_sms(self, phone_number, message):
+        self.calls.append(("sms", phone_number))
+        return False, "fail"
+
+
+def add_users(session, count, role="employee", branch_id=1, offset=0):
+    users = []
+    for n in range(offset, offset + count):
+        user = User(username=f"{role}{n}", email=f"{role}{n}@example.com", password_hash="x",
+                    role=role, status="approved", branch_id=branch_id,
+                    phone="010-0000-0000" if n % 2 == 0 else None)
+        session.add(user)
+        users.append(user)
+    session.commit()
+    return users
+
+
+def test_bulk_send_collects_channel_stats(session):
+    """역할 대상 대량 발송 시 알림 저장 수와 채널별 결과 테스트"""
+    add_users(session, 6)
+    add_users(session, 2, role="admin")
+    service = RecordingService()
+    sender = BulkNotificationSender(service=service, max_workers=2, chunk_size=4,
+                                    delivery_batch_size=2)
+
+    stats = sender.send("전체 공지", roles=["employee"], category="공지",
+                        channels=("email", "kakao", "sms"))
+    sender.shutdown()
+
+    assert stats["recipients"] == 6 and stats["created"] == 6
+    assert Notification.query.filter_by(content="전체 공지").count() == 6
+    assert stats["channels"]["email"] == {"queued": 6, "sent": 6, "failed": 0, "skipped": 0}
+    assert stats["channels"]["kakao"]["sent"] == 6
+    # 전화번호 없는 3명은 건너뛰고, 나머지는 전송 실패로 집계
+    assert stats["channels"]["sms"] == {"queued": 3, "sent": 0, "failed": 3, "skipped": 3}
+    assert len(service.calls) == 15
+
+
+def test_bulk_send_uses_constant_queries(session, count_queries):
+    """수신자 수가 늘어도 실행되는 SQL 문 수가 같은지 테스트"""
+    sender = BulkNotificationSender(service=RecordingService(), chunk_size=1000)
+
+    add_users(session, 5)
+    with count_queries() as small:
+        sender.send("공지 1", status="approved")
+    add_users(session, 200, offset=5)
+    with count_queries() as large:
+        stats = sender.send("공지 2", status="approved")
+    sender.shutdown()
+
+    assert stats["created"] == 205
+    assert len(small) == len(large)
+
+
+def test_send_to_multiple_users(session):
+    """ID 목록 대상 발송이 중복 없이 저장되는지 테스트"""
+    users = add_users(session, 3)
+    ids = [user.id for user in users]
+
+    assert send_notification_to_multiple_users(ids + ids[:1], "근무 변경", "근무") == (3, 4)
+    assert Notification.query.filter_by(category="근무").count() == 3
+    assert send_notification_to_multiple_users([], "없음") == (0, 0)
+
+
+def test_send_by_ids_skips_missing_and_deleted_users(session):
+    """ID만 주어진 발송도 없는/삭제된/상태가 다른 사용자에게는 알림을 저장하지 않는지 테스트"""
+    active, deleted, pending = add_users(session, 3)
+    deleted.deleted_at = datetime.utcnow()
+    pending.status = "pending"
+    session.commit()
+    sender = BulkNotificationSender(service=RecordingService())
+
+    stats = sender.send("근무 변경", user_ids=[active.id, deleted.id, pending.id, 99999])
+    assert stats["recipients"] == 2 and stats["created"] == 2
+    assert {n.user_id for n in Notification.query.filter_by(content="근무 변경")} == {active.id, pending.id}
+
+    stats = sender.send("승인자 공지", user_ids=[active.id, pending.id], status="approved")
+    sender.shutdown()
+    assert stats["created"] == 1
+    assert Notification.query.filter_by(content="승인자 공지").one().user_id == active.id
+
+
+def test_document_expiry_notifies_branch_managers(session):
+    """만료 임박 계약서에 대해 해당 매장 매니저에게만 알림이 가는지 테스트"""
+    pytest.importorskip("schedule")
+    from scheduler import check_document_expiry
+
+    managers = add_users(session, 2, role="manager", branch_id=1)
+    add_users(session, 1, role="manager", branch_id=2, offset=2)
+    staff = Staff(name="홍길동", position="주방", join_date=date.today(), your_program_id=1)
+    session.add(staff)
+    session.flush()
+    contract = Contract(staff_id=staff.id, contract_number="C-1", start_date=date.today(),
+                        expiry_date=date.today() + timedelta(days=10),
+                        renewal_date=date.today() + timedelta(days=10))
+    session.add(contract)
+    session.commit()
+
+    check_document_expiry()
+
+    notified = Notification.query.filter_by(category="document_expiry").all()
+    assert sorted(n.user_id for n in notified) == sorted(m.id for m in managers)
+    assert db.session.get(Contract, contract.id).notification_sent is True
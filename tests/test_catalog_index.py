@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+카탈로그 인덱스 테스트
+역색인 검색/묶음 필터/미리 정렬한 목록이 전체 검사 결과와 같은지, 커서 페이지,
+컬렉션 변경 시 재구성, 마켓플레이스 관리자 연동을 확인
+"""
+
+import random
+
+import pytest
+
+from core.backend.catalog_index import CatalogIndex
+from core.backend.document_store import DocumentCollection
+from core.backend.module_marketplace_system import ModuleMarketplaceSystem, ModuleScope
+from core.backend.plugin_marketplace import PluginMarketplace
+
+CATEGORIES = ["restaurant", "retail", "service"]
+WORDS = ["출퇴근", "재고", "매출", "POS", "주문", "급여"]
+
+
+def make_plugins(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"p{i}",
+            "name": f"{rng.choice(WORDS)} 플러그인 {i}",
+            "description": f"{rng.choice(WORDS)} 관리",
+            "category": rng.choice(CATEGORIES),
+            "tags": rng.sample(WORDS, 2),
+            "rating": rng.choice([3.5, 4.0, 4.5]),
+            "downloads": rng.randint(0, 20),
+            "created_at": f"2026-01-{rng.randint(1, 28):02d}",
+            **({"price": rng.randint(0, 3) * 1000} if i % 4 else {}),
+        }
+        for i in range(count)
+    ]
+
+
+def scan(plugins, category=None, search=None, sort_by=None, sort_order="desc"):
+    """기존 get_marketplace_plugins와 같은 전체 검사"""
+    result = [p for p in plugins if not category or p["category"] == category]
+    if search:
+        q = search.lower()
+        result = [p for p in result if q in p["name"].lower() or q in p["description"].lower()
+                  or any(q in t.lower() for t in p["tags"])]
+    defaults = {"rating": 0, "downloads": 0, "created_at": "", "price": 0}
+    if sort_by in defaults:
+        result.sort(key=lambda p: p.get(sort_by, defaults[sort_by]), reverse=sort_order == "desc")
+    return [p["id"] for p in result]
+
+
+def test_search_filter_and_sort_match_full_scan(tmp_path):
+    """검색/카테고리/정렬 결과와 순서가 전체 검사와 같은지 테스트"""
+    plugins = make_plugins(300)
+    collection = DocumentCollection(tmp_path / "plugins.json")
+    collection.put_many(plugins)
+    index = CatalogIndex(collection)
+
+    for category in [None, "retail"]:
+        for search in [None, "출퇴근", "pos", "퇴", "플러그인 1", "없는말"]:
+            for sort_by in [None, "rating", "downloads", "created_at", "price", "name"]:
+                for order in ["desc", "asc"]:
+                    items, next_cursor, total = index.search(
+                        {"category": category}, search, sort_by=sort_by, sort_order=order
+                    )
+                    expected = scan(plugins, category, search, sort_by, order)
+                    assert [key for key, _ in items] == expected
+                    assert total == len(expected) and next_cursor is None
+    assert index.stats["rebuilds"] == 1
+
+
+def test_cursor_pages_and_rebuild_on_change(tmp_path):
+    """커서로 이어 읽은 페이지가 전체 목록과 같고, 변경 후에는 다시 구성되는지 테스트"""
+    plugins = make_plugins(57)
+    collection = DocumentCollection(tmp_path / "plugins.json")
+    collection.put_many(plugins)
+    index = CatalogIndex(collection)
+
+    for sort_by, order in [("rating", "desc"), ("price", "asc"), (None, "desc")]:
+        pages, cursor = [], None
+        while True:
+            items, cursor, total = index.search({}, None, sort_by=sort_by, sort_order=order,
+                                                cursor=cursor, limit=10)
+            pages.append([key for key, _ in items])
+            if cursor is None:
+                break
+        assert [len(page) for page in pages] == [10, 10, 10, 10, 10, 7]
+        assert sum(pages, []) == scan(plugins, sort_by=sort_by, sort_order=order)
+
+    with pytest.raises(ValueError):
+        index.search({}, None, cursor="잘못된 커서")
+
+    # 다른 인스턴스(프로세스)에서 바뀐 내용도 다음 조회에서 반영
+    DocumentCollection(tmp_path / "plugins.json").update("p3", {"rating": 5.0, "tags": ["신규"]})
+    items, _, _ = index.search({}, "신규", sort_by="rating", limit=1)
+    assert [key for key, _ in items] == ["p3"] and items[0][1]["rating"] == 5.0
+    assert index.stats["rebuilds"] == 1 and index.stats["updates"] == 1
+
+    # 반환 문서를 수정해도 인덱스에는 영향 없음
+    items[0][1]["name"] = "변경"
+    assert index.search({}, "신규")[0][0][1]["name"] != "변경"
+
+    # 부분 갱신을 여러 번 거친 인덱스가 새로 만든 인덱스와 같은 결과를 내는지
+    rng = random.Random(3)
+    for i in range(10):
+        collection.update(f"p{rng.randrange(57)}", {"downloads": rng.randint(0, 20), "category": "retail"})
+        collection.delete(f"p{rng.randrange(57)}")
+        collection.put(dict(make_plugins(1, seed=i)[0], id=f"new{i}"))
+        index.search()
+    fresh = CatalogIndex(collection)
+    for sort_by in ["downloads", "price", None]:
+        for query in [None, "출퇴근"]:
+            assert index.search({"category": "retail"}, query, sort_by=sort_by) == \
+                fresh.search({"category": "retail"}, query, sort_by=sort_by)
+    assert index.stats["rebuilds"] == 1 and index.stats["updates"] == 11
+
+
+def test_marketplaces_use_catalog_index(tmp_path):
+    """모듈 마켓플레이스 설치 상태 표시와 페이지, 플러그인 마켓플레이스 페이지 테스트"""
+    modules = ModuleMarketplaceSystem(str(tmp_path / "modules"), str(tmp_path / "plugins"))
+    assert modules.install_module("inventory_management", 7)
+    assert modules.activate_module("inventory_management", 7)
+
+    listed = {m["id"]: m for m in modules.get_available_modules(user_id=7)}
+    assert listed["inventory_management"]["is_activated"] is True
+    assert listed["attendance_management"]["is_installed"] is False
+    assert [m["id"] for m in modules.get_available_modules(search="재고")] == ["inventory_management"]
+    assert modules.get_available_modules(scope=ModuleScope.SYSTEM) == []
+
+    page = modules.get_available_modules_page(sort_by="rating", limit=1)
+    assert [m["id"] for m in page["modules"]] == ["attendance_management"] and page["total"] == 2
+    page = modules.get_available_modules_page(sort_by="rating", limit=1, cursor=page["next_cursor"])
+    assert [m["id"] for m in page["modules"]] == ["inventory_management"] and page["next_cursor"] is None
+
+    marketplace = PluginMarketplace(str(tmp_path / "marketplace"))
+    for plugin in make_plugins(5):
+        marketplace.add_plugin_to_marketplace(plugin)
+    page = marketplace.get_marketplace_plugins_page(sort_by="downloads", limit=3)
+    rest = marketplace.get_marketplace_plugins_page(sort_by="downloads", limit=3, cursor=page["next_cursor"])
+    assert [p["id"] for p in page["plugins"] + rest["plugins"]] == [
+        p["id"] for p in marketplace.get_marketplace_plugins(sort_by="downloads")
+    ]
+    assert rest["next_cursor"] is None and rest["total"] == 5
+
+
+def test_marketplace_plugins_route_cursor_pages(client, tmp_path, monkeypatch):
+    """/api/marketplace/plugins 가 cursor/limit 없이는 전체 목록을, 있으면 커서 페이지를 반환하는지 테스트"""
+    import app as app_module
+
+    marketplace = PluginMarketplace(str(tmp_path / "marketplace"))
+    for plugin in make_plugins(5):
+        marketplace.add_plugin_to_marketplace(plugin)
+    monkeypatch.setattr(app_module, "plugin_marketplace", marketplace)
+
+    full = client.get("/api/marketplace/plugins?sort_by=downloads")
+    assert full.status_code == 200 and len(full.get_json()["data"]) == 5
+
+    first = client.get("/api/marketplace/plugins?sort_by=downloads&limit=3").get_json()
+    assert len(first["data"]) == 3 and first["total"] == 5 and first["next_cursor"]
+    rest = client.get(f"/api/marketplace/plugins?sort_by=downloads&limit=3&cursor={first['next_cursor']}").get_json()
+    assert [p["id"] for p in first["data"] + rest["data"]] == [p["id"] for p in full.get_json()["data"]]
+    assert rest["next_cursor"] is None
+
+    assert client.get("/api/marketplace/plugins?cursor=broken").status_code == 400
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+중앙 데이터 레이어 집계 테이블 테스트
+원본 행 변경 시 일간 집계가 갱신되고, 통합 분석이 원본 집계와 같은 값을 내는지 확인
+"""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from core.backend.central_data_layer import CentralDataLayer
+
+
+@pytest.fixture
+def layer(tmp_path):
+    return CentralDataLayer(str(tmp_path / "central.db"))
+
+
+def raw_sales(layer, branch_id):
+    with layer.db.read() as conn:
+        row = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(amount), 0) FROM sales "
+            "WHERE branch_id = ? AND status = 'completed'", (branch_id,)
+        ).fetchone()
+    return tuple(row)
+
+
+def rollup_sales(layer, branch_id):
+    with layer.db.read() as conn:
+        row = conn.execute(
+            "SELECT COALESCE(SUM(sales_count), 0), COALESCE(SUM(amount_sum), 0) "
+            "FROM sales_daily_rollup WHERE branch_id = ?", (branch_id,)
+        ).fetchone()
+    return tuple(row)
+
+
+def test_rollups_follow_insert_update_delete(layer):
+    """삽입/상태 변경/매장 이동/삭제가 집계에 반영되는지 테스트"""
+    today = datetime.now().strftime('%Y-%m-%d')
+    assert rollup_sales(layer, 1) == raw_sales(layer, 1)
+
+    with layer.db.write() as conn:
+        cur = conn.execute(
+            "INSERT INTO sales (branch_id, employee_id, date, amount) VALUES (1, 1, ?, 5000)", (today,)
+        )
+        sale_id = cur.lastrowid
+    assert rollup_sales(layer, 1) == raw_sales(layer, 1)
+
+    layer.db.execute("UPDATE sales SET status = 'refunded' WHERE id = ?", (sale_id,))
+    assert rollup_sales(layer, 1) == raw_sales(layer, 1)
+
+    layer.db.execute("UPDATE sales SET status = 'completed', branch_id = 2 WHERE id = ?", (sale_id,))
+    assert rollup_sales(layer, 1) == raw_sales(layer, 1)
+    assert rollup_sales(layer, 2) == raw_sales(layer, 2)
+
+    layer.db.execute("DELETE FROM sales WHERE branch_id = 2")
+    assert rollup_sales(layer, 2) == (0, 0)
+
+
+def test_integrated_analytics_matches_raw_aggregates(layer):
+    """통합 분석 결과가 원본 테이블 집계와 같은지 테스트"""
+    result = layer.get_integrated_analytics(1, "month")
+    date_from, date_to = result["date_range"]["from"], result["date_range"]["to"]
+
+    with layer.db.read() as conn:
+        attendance = conn.execute("""
+            SELECT COUNT(*), SUM(CASE WHEN is_late = 1 THEN 1 ELSE 0 END),
+                   AVG(work_hours), COUNT(DISTINCT employee_id)
+            FROM attendance WHERE branch_id = 1 AND date BETWEEN ? AND ?
+        """, (date_from, date_to)).fetchone()
+        sales = conn.execute("""
+            SELECT COUNT(*), SUM(amount), AVG(amount) FROM sales
+            WHERE branch_id = 1 AND date BETWEEN ? AND ? AND status = 'completed'
+        """, (date_from, date_to)).fetchone()
+
+    assert result["attendance"]["total_records"] == attendance[0]
+    assert result["attendance"]["late_count"] == attendance[1]
+    assert result["attendance"]["avg_work_hours"] == pytest.approx(attendance[2])
+    assert result["attendance"]["active_employees"] == attendance[3]
+    assert result["sales"]["total_sales"] == sales[0]
+    assert result["sales"]["total_amount"] == pytest.approx(sales[1])
+    assert result["sales"]["avg_amount"] == pytest.approx(sales[2])
+
+
+def test_existing_database_is_backfilled(tmp_path):
+    """집계 테이블이 없던 기존 DB가 초기화 시 채워지는지 테스트"""
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE sales (id INTEGER PRIMARY KEY, branch_id INTEGER, employee_id INTEGER,
+                            date DATE NOT NULL, amount REAL NOT NULL, items_count INTEGER DEFAULT 1,
+                            category TEXT, payment_method TEXT, status TEXT DEFAULT 'completed',
+                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)
+    """)
+    conn.executemany(
+        "INSERT INTO sales (branch_id, employee_id, date, amount) VALUES (?, ?, ?, ?)",
+        [(7, 1, "2024-01-01", 1000), (7, 2, "2024-01-01", 2000), (7, 1, "2024-01-02", 500)],
+    )
+    conn.commit()
+    conn.close()
+
+    layer = CentralDataLayer(str(path))
+    assert rollup_sales(layer, 7) == (3, 3500)
+    assert layer.rebuild_rollups(branch_id=7)["sales_daily_rollup"] == 3
+    assert rollup_sales(layer, 7) == (3, 3500)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+JSON 문서 저장소 테스트
+인덱스 조회, 변경 로그 반영/압축, 다른 인스턴스(프로세스)와의 동기화,
+이 저장소로 옮긴 관리자들의 동작을 확인
+"""
+
+import json
+import multiprocessing
+
+import pytest
+
+from core.backend.document_store import DocumentCollection
+from core.backend.module_marketplace_system import ModuleMarketplaceSystem
+from core.backend.plugin_feedback_system import PluginFeedbackSystem
+from core.backend.plugin_marketplace import PluginMarketplace
+
+
+def make_collection(path, **kwargs):
+    return DocumentCollection(path, indexes=("category", "tags"), **kwargs)
+
+
+def test_indexed_find_and_write_ahead_log(tmp_path):
+    """인덱스 조회 결과, 변경은 로그에만 추가되고 새 인스턴스가 로그를 반영하는지 테스트"""
+    path = tmp_path / "plugins.json"
+    path.write_text(json.dumps([
+        {"id": "a", "category": "retail", "tags": ["pos"]},
+        {"id": "b", "category": "restaurant", "tags": ["pos", "order"]},
+    ]), encoding="utf-8")
+    plugins = make_collection(path)
+
+    assert [p["id"] for p in plugins.find(tags="pos")] == ["a", "b"]
+    assert [p["id"] for p in plugins.find(category="restaurant", tags="pos")] == ["b"]
+
+    plugins.put({"id": "c", "category": "retail", "tags": []})
+    plugins.update("a", {"category": "service"})
+    plugins.mutate("b", lambda p: dict(p, downloads=p.get("downloads", 0) + 1))
+    plugins.delete("c")
+    assert plugins.update("없음", {"x": 1}) is None
+
+    # 스냅샷은 그대로이고 변경은 로그에만 기록됨
+    assert len(json.loads(path.read_text(encoding="utf-8"))) == 2
+    assert len(plugins.log_path.read_text(encoding="utf-8").splitlines()) == 4
+
+    other = make_collection(path)
+    assert [p["id"] for p in other.find(category="service")] == ["a"]
+    assert other.get("b")["downloads"] == 1
+    assert "c" not in other
+
+    # 다른 인스턴스의 변경은 다음 조회 때 이어서 반영
+    other.put({"id": "d", "category": "retail"})
+    assert [p["id"] for p in plugins.find(category="retail")] == ["d"]
+
+
+def test_compaction_and_torn_log_tail(tmp_path):
+    """압축 후 스냅샷 형식과 자동 키, 중간에 끊긴 로그 줄 처리 테스트"""
+    path = tmp_path / "history.json"
+    history = DocumentCollection(path, key=None, indexes=("action",), compact_threshold=5)
+    for i in range(7):
+        history.append({"action": "create" if i % 2 else "delete", "n": i}, max_items=4)
+
+    assert [h["n"] for h in history.all()] == [3, 4, 5, 6]
+    assert history.stats["compactions"] >= 1
+    assert DocumentCollection(path, key=None).all() == history.all()
+
+    history.compact()
+    assert json.loads(path.read_text(encoding="utf-8")) == history.all()
+    assert history.log_path.stat().st_size == 0
+
+    # 쓰다가 끊긴 줄은 무시하고, 다음 쓰기에서 잘라냄
+    with open(history.log_path, "ab") as f:
+        f.write(b'{"op": "put", "k": "99", "d": {"act')
+    reader = DocumentCollection(path, key=None)
+    assert reader.count() == 4
+    history.append({"action": "create", "n": 7})
+    reader = DocumentCollection(path, key=None)
+    assert [h["n"] for h in reader.all()] == [3, 4, 5, 6, 7]
+
+
+def _increment(path, times):
+    counters = DocumentCollection(path, layout="dict")
+    for _ in range(times):
+        counters.mutate("hits", lambda n: n + 1, default=0)
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="fork 필요")
+def test_cross_process_increments_are_atomic(tmp_path):
+    """여러 프로세스가 동시에 같은 문서를 수정해도 갱신이 사라지지 않는지 테스트"""
+    path = tmp_path / "downloads.json"
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_increment, args=(path, 50)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+
+    assert DocumentCollection(path, layout="dict").get("hits") == 150
+
+
+def test_managers_use_document_store(tmp_path):
+    """마켓플레이스/모듈 마켓플레이스/피드백 관리자가 저장소를 통해 읽고 쓰는지 테스트"""
+    marketplace = PluginMarketplace(str(tmp_path / "marketplace"))
+    assert marketplace.add_plugin_to_marketplace(
+        {"id": "pos", "name": "POS", "description": "", "category": "retail", "price": 0}
+    )
+    assert marketplace.add_review("pos", "u1", "사용자", 4, "좋아요")
+    assert marketplace.add_review("pos", "u2", "사용자", 5, "최고")
+    plugin = PluginMarketplace(str(tmp_path / "marketplace")).get_plugin_details("pos")
+    assert plugin["rating"] == 4.5 and len(plugin["reviews"]) == 2
+    assert [p["id"] for p in marketplace.get_marketplace_plugins(category="retail")] == ["pos"]
+
+    modules = ModuleMarketplaceSystem(str(tmp_path / "modules"), str(tmp_path / "plugins"))
+    assert modules.install_module("attendance_management", 7)
+    assert modules.activate_module("attendance_management", 7)
+    assert modules.is_module_activated("attendance_management", 7)
+    assert modules.get_installed_users("attendance_management") == [7]
+    assert modules.uninstall_module("attendance_management", 7)
+    assert modules.get_installed_users("attendance_management") == []
+    assert modules.get_module_statistics()["popular_modules"] == [
+        {"module_id": "attendance_management", "downloads": 1}
+    ]
+
+    feedback = PluginFeedbackSystem(str(tmp_path / "feedback"))
+    feedback_id = feedback.create_feedback({"type": "bug_report", "plugin_id": "pos"})
+    assert feedback.update_feedback_status(feedback_id, "in_review", "admin", "확인 중")
+    stored = feedback.get_feedback(feedback_id)
+    assert stored["status"] == "in_review" and len(stored["comments"]) == 1
+    assert feedback.get_workflow(feedback_id)["current_step"] == 2
+    assert [f["id"] for f in feedback.get_feedback_list(plugin_id="pos", status="in_review")] == [feedback_id]
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+이벤트 버스 테스트
+프로세스 내 버스의 전달/재전송/백프레셔와, Redis Streams 버스를 통한 워커 간 전달 확인
+(Redis 버스는 fakeredis 로 두 워커를 흉내냄)
+"""
+
+import threading
+
+import pytest
+
+from core.backend.event_bus import InProcessEventBus, RedisEventBus
+
+
+def collect(bus, topic):
+    received = []
+    bus.subscribe(topic, received.append)
+    return received
+
+
+def test_in_process_delivery_and_replay():
+    """일괄 발행 순서대로 전달되고 오프셋 이후만 재전송되는지 테스트"""
+    bus = InProcessEventBus(history_size=10)
+    received = collect(bus, "alerts")
+
+    ids = bus.publish_many("alerts", [{"n": i} for i in range(5)])
+    assert bus.flush()
+    assert [m.payload["n"] for m in received] == list(range(5))
+    assert ids == sorted(ids, key=lambda i: tuple(map(int, i.split("-"))))
+
+    replayed = bus.replay("alerts", after_id=ids[2])
+    assert [m.payload["n"] for m in replayed] == [3, 4]
+    assert bus.replay("alerts", after_id=ids[-1]) == []
+    bus.close()
+
+
+def test_backpressure_drops_after_timeout():
+    """전달 큐가 가득 차면 publish_timeout 후 메시지를 버리는지 테스트"""
+    release = threading.Event()
+    bus = InProcessEventBus(queue_size=2, batch_size=1, publish_timeout=0.05)
+    bus.subscribe("slow", lambda message: release.wait(5))
+
+    for i in range(6):
+        bus.publish("slow", {"n": i})
+    stats = bus.get_stats()
+    release.set()
+    assert bus.flush()
+    # 핸들러가 1건을 잡고 있고 큐에 2건 -> 나머지는 버려짐
+    assert stats["dropped"] >= 2
+    assert stats["published"] == 6
+    bus.close()
+
+
+@pytest.fixture
+def redis_server():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeServer(), fakeredis
+
+
+def make_redis_bus(redis_server, **kwargs):
+    server, fakeredis = redis_server
+    return RedisEventBus(fakeredis.FakeRedis(server=server), block_ms=50, **kwargs)
+
+
+def test_redis_bus_delivers_across_workers(redis_server):
+    """한 워커에서 발행한 메시지를 다른 워커 구독자도 받는지 테스트"""
+    worker_a, worker_b = make_redis_bus(redis_server), make_redis_bus(redis_server)
+    received_a, received_b = collect(worker_a, "alerts"), collect(worker_b, "alerts")
+
+    ids = worker_a.publish_many("alerts", [{"n": 1}, {"n": 2}])
+    worker_b.publish("alerts", {"n": 3})
+
+    def wait_for(received, count):
+        for _ in range(100):
+            if len(received) >= count:
+                return
+            threading.Event().wait(0.02)
+
+    wait_for(received_a, 3)
+    wait_for(received_b, 3)
+    assert [m.payload["n"] for m in received_a] == [1, 2, 3]
+    assert [m.payload["n"] for m in received_b] == [1, 2, 3]
+    assert [m.payload["n"] for m in worker_b.replay("alerts", after_id=ids[0])] == [2, 3]
+
+    worker_a.close()
+    worker_b.close()
+
+
+def test_notification_reaches_connection_on_other_worker(redis_server):
+    """다른 워커에 연결된 사용자에게 알림이 전달되고 재연결 시 재전송되는지 테스트"""
+    from core.backend.realtime_notifications import (
+        Notification, NotificationPriority, NotificationType, RealtimeNotificationManager,
+    )
+
+    manager_a = RealtimeNotificationManager(event_bus=make_redis_bus(redis_server))
+    manager_b = RealtimeNotificationManager(event_bus=make_redis_bus(redis_server))
+
+    delivered = []
+    manager_b.register_connection("conn-1", "user-7")
+    manager_b.register_notification_handler("conn-1", delivered.append)
+
+    notification = Notification(id="n1", type=NotificationType.INFO, title="재고 부족",
+                                message="우유 재고 부족", priority=NotificationPriority.HIGH)
+    assert manager_a.send_direct_notification("user-7", notification)
+
+    for _ in range(100):
+        if delivered:
+            break
+        threading.Event().wait(0.02)
+    assert delivered and delivered[0]["data"]["title"] == "재고 부족"
+    assert delivered[0]["data"]["type"] == "info"
+
+    missed = manager_a.get_missed_notifications("user-7", last_event_id="0-0")
+    assert [m["event_id"] for m in missed] == [delivered[0]["event_id"]]
+    assert manager_a.get_missed_notifications("user-8", last_event_id="0-0") == []
+
+    manager_a.event_bus.close()
+    manager_b.event_bus.close()
+
+
+def test_channel_notification_reaches_subscribers_on_other_worker(redis_server):
+    """다른 워커에서 채널을 구독한 사용자에게 채널 알림이 전달되는지 테스트 (대상 사용자 지정 포함)"""
+    from core.backend.realtime_notifications import (
+        Notification, NotificationPriority, NotificationType, RealtimeNotificationManager,
+    )
+
+    manager_a = RealtimeNotificationManager(event_bus=make_redis_bus(redis_server))
+    manager_b = RealtimeNotificationManager(event_bus=make_redis_bus(redis_server))
+
+    delivered = {"c1": [], "c2": []}
+    manager_b.subscribe_user("u7", "system")
+    for connection_id, user_id in (("c1", "u7"), ("c2", "u8")):
+        manager_b.register_connection(connection_id, user_id)
+        manager_b.register_notification_handler(connection_id, delivered[connection_id].append)
+
+    def notification(n):
+        return Notification(id=f"n{n}", type=NotificationType.INFO, title=f"공지 {n}",
+                            message="점검 예정", priority=NotificationPriority.NORMAL)
+
+    # 보낸 워커에는 채널 구독자가 없어도 발행됨
+    assert not manager_a.get_channel("system").subscribers
+    assert manager_a.send_notification("system", notification(1))
+    assert manager_a.send_notification("system", notification(2), target_users=["u8"])
+    assert manager_a.send_notification("system", notification(3), target_users=["u7", "u8"])
+
+    for _ in range(100):
+        if len(delivered["c1"]) >= 2:
+            break
+        threading.Event().wait(0.02)
+    threading.Event().wait(0.1)
+    assert [m["data"]["title"] for m in delivered["c1"]] == ["공지 1", "공지 3"]
+    assert delivered["c2"] == []  # 구독하지 않은 사용자는 받지 않음
+
+    missed = manager_b.get_missed_notifications("u7", last_event_id="0-0")
+    assert [m["event_id"] for m in missed] == [m["event_id"] for m in delivered["c1"]]
+
+    manager_a.event_bus.close()
+    manager_b.event_bus.close()
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+스트리밍 내보내기 엔진 테스트
+근태 내보내기가 행 수와 관계없이 같은 수의 SQL 문(joinedload + yield_per)으로 CSV/Excel/PDF를 만드는지,
+PDF 행 상한, 큰 내보내기의 백그라운드 작업(전용 풀, 동시 실행 상한)과 다운로드를 확인
+"""
+
+import csv
+import io
+import threading
+import time
+import zipfile
+from datetime import datetime, timedelta
+
+import pytest
+from flask_login import login_user
+
+from core.backend import export_engine
+from core.backend.export_engine import ExportJobManager, iter_csv, write_pdf, write_xlsx
+from models_main import Attendance, Team, User, db
+from routes import admin_dashboard_export
+from routes.admin_dashboard_export import attendance_export_spec
+
+
+def add_attendance(session, count, offset=0):
+    """직원 5명(주방/홀 팀)의 근태 count건 생성, 3의 배수는 지각"""
+    if Team.query.first() is None:
+        session.add_all([Team(name="주방"), Team(name="홀")])
+        session.flush()
+        teams = Team.query.order_by(Team.id).all()
+        for n in range(5):
+            session.add(User(username=f"emp{n}", email=f"emp{n}@example.com", password_hash="x",
+                             name=f"직원{n}", team_id=teams[n % 2].id, role="employee"))
+        session.flush()
+    users = User.query.order_by(User.id).all()
+    start = datetime(2026, 3, 1, 9, 0)
+    for n in range(offset, offset + count):
+        clock_in = start + timedelta(hours=n)
+        session.add(Attendance(user_id=users[n % 5].id, clock_in=clock_in, clock_out=clock_in + timedelta(hours=8),
+                               reason="지각, 교통" if n % 3 == 0 else None))
+    session.commit()
+
+
+def filters(**kwargs):
+    return {"team": None, "user_id": None, "date_from": None, "date_to": None, **kwargs}
+
+
+def read_csv(spec):
+    data = b"".join(iter_csv(spec, chunk_size=256))
+    assert data.startswith(b"\xef\xbb\xbf")
+    return list(csv.reader(io.StringIO(data.decode("utf-8-sig"))))
+
+
+def test_csv_export_streams_with_constant_queries(app, session, count_queries):
+    """행 수가 늘어도 SQL 문 수가 같고, 직원/팀 이름이 함께 나오는지 테스트"""
+    add_attendance(session, 10)
+    with count_queries() as small_statements:
+        small = read_csv(attendance_export_spec(filters()))
+    add_attendance(session, 290, offset=10)
+    db.session.expunge_all()
+    with count_queries() as large_statements:
+        large = read_csv(attendance_export_spec(filters()))
+
+    assert small[0] == ["일자", "직원", "팀", "사유", "출근시간", "퇴근시간", "상태"]
+    assert len(small) == 11 and len(large) == 301
+    assert len(small_statements) == len(large_statements) <= 2
+    newest = large[1]
+    assert newest[0] == "2026-03-13" and newest[1] == "직원4" and newest[2] == "주방" and newest[4] == "20:00"
+
+    hall = read_csv(attendance_export_spec(filters(team="홀", date_from="2026-03-01", date_to="2026-03-01")))
+    assert {row[2] for row in hall[1:]} == {"홀"} and len(hall) == 1 + 6  # 첫날 15건 중 홀 팀
+
+
+def test_xlsx_and_pdf_writers(app, session, tmp_path):
+    """Excel은 데이터/통계 시트를 constant_memory로, PDF는 행 상한까지만 기록하는지 테스트"""
+    pytest.importorskip("xlsxwriter")
+    add_attendance(session, 30)
+    spec = attendance_export_spec(filters())
+
+    path = tmp_path / "export.xlsx"
+    assert write_xlsx(spec, str(path)) == 30
+    with zipfile.ZipFile(path) as xlsx:
+        workbook = xlsx.read("xl/workbook.xml").decode("utf-8")
+        strings = xlsx.read("xl/sharedStrings.xml").decode("utf-8") if "xl/sharedStrings.xml" in xlsx.namelist() else ""
+        sheet1 = xlsx.read("xl/worksheets/sheet1.xml").decode("utf-8")
+        stats = xlsx.read("xl/worksheets/sheet2.xml").decode("utf-8")
+    assert "근태데이터" in workbook and "통계" in workbook
+    assert sheet1.count("<row ") == 31
+    assert "직원0" in sheet1 + strings
+    assert "<v>10</v>" in stats  # 지각 10건 (constant_memory는 인라인 문자열, 숫자는 값으로)
+
+    pdf = tmp_path / "export.pdf"
+    assert write_pdf(spec, str(pdf), max_rows=20) == 20
+    assert pdf.read_bytes().startswith(b"%PDF")
+
+
+def test_background_export_job_and_routes(app, session, tmp_path):
+    """큰 내보내기는 작업 풀에서 파일로 만들고 상태/다운로드로 받는지, 라우트 응답 형식을 테스트"""
+    pytest.importorskip("xlsxwriter")
+    add_attendance(session, 25)
+    admin = User(username="boss", email="boss@example.com", password_hash="x", role="admin")
+    session.add(admin)
+    session.commit()
+
+    manager = ExportJobManager(directory=str(tmp_path), max_workers=1)
+    try:
+        with app.test_request_context("/"):
+            job = manager.submit(attendance_export_spec(filters()), "csv", owner_id=admin.id)
+        deadline = time.time() + 10
+        while manager.get(job.id).status in ("pending", "running") and time.time() < deadline:
+            time.sleep(0.05)
+    finally:
+        manager.shutdown()
+    done = manager.get(job.id)
+    assert done.status == "done" and done.rows == 25 and done.filename == "dashboard_export.csv"
+    assert manager.file_path(done).endswith(".csv")
+    with open(manager.file_path(done), encoding="utf-8-sig") as f:
+        assert len(list(csv.reader(f))) == 26
+    assert manager.get("../../etc/passwd") is None
+
+    # 라우트: CSV는 청크 스트리밍, Excel은 파일 응답, background=1이면 202 + 상태 URL
+    with app.test_request_context("/admin_dashboard/export_csv?from=2026-03-01&to=2026-03-01"):
+        login_user(admin)
+        response = admin_dashboard_export.export_admin_dashboard_csv()
+        assert response.is_streamed and response.mimetype == "text/csv"
+        assert b"".join(response.response).decode("utf-8-sig").count("\n") == 16
+    with app.test_request_context("/admin_dashboard/export_excel"):
+        login_user(admin)
+        response = admin_dashboard_export.export_admin_dashboard_excel()
+        assert response.status_code == 200 and "dashboard_export.xlsx" in response.headers["Content-Disposition"]
+        response.close()
+    original = admin_dashboard_export.export_jobs
+    admin_dashboard_export.export_jobs = manager
+    try:
+        with app.test_request_context("/admin_dashboard/export_excel?background=1"):
+            login_user(admin)
+            body, status = admin_dashboard_export.export_admin_dashboard_excel()
+        assert status in (200, 202) and len(body.get_json()["id"]) == 32
+    finally:
+        admin_dashboard_export.export_jobs = original
+        manager.shutdown()
+
+
+def test_background_exports_use_bounded_dedicated_pool(app, tmp_path, monkeypatch):
+    """백그라운드 내보내기가 작업 스케줄러 공용 풀이 아닌 전용 풀에서 max_workers개까지만 동시에 실행되는지 테스트"""
+    active, peak, threads = [0], [0], set()
+    lock, release = threading.Lock(), threading.Event()
+
+    def slow_export(spec, fmt, path):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            threads.add(threading.current_thread().name)
+        release.wait(5)
+        with open(path, "w") as f:
+            f.write("x")
+        with lock:
+            active[0] -= 1
+        return 1
+
+    monkeypatch.setattr(export_engine, "write_export", slow_export)
+    manager = ExportJobManager(directory=str(tmp_path), max_workers=2)
+    spec = attendance_export_spec(filters())
+    try:
+        with app.test_request_context("/"):
+            jobs = [manager.submit(spec, "csv") for _ in range(5)]
+        time.sleep(0.2)
+        assert [manager.get(job.id).status for job in jobs].count("running") == 2  # 나머지는 대기
+        release.set()
+        deadline = time.time() + 10
+        while any(manager.get(job.id).status != "done" for job in jobs) and time.time() < deadline:
+            time.sleep(0.05)
+    finally:
+        release.set()
+        manager.shutdown()
+    assert all(manager.get(job.id).status == "done" for job in jobs)
+    assert peak[0] == 2 and all(name.startswith("export") for name in threads)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+지오코딩 캐시 테스트
+로컬 HTTP 스텁을 카카오 API 대신 띄워 중복 제거, 캐시/negative 캐시, 재시작 후 재사용,
+일괄 변환 API 응답을 확인
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import api.address_validation as address_validation
+from api.address_validation import fetch_coordinates_from_kakao, normalize_address
+from utils.advanced_caching import AdvancedCache
+from utils.geocode_cache import GeocodeService, RateLimiter
+
+
+class KakaoStub(BaseHTTPRequestHandler):
+    """'강남'이 들어간 주소만 좌표를 돌려주고, '오류'가 들어가면 500을 돌려주는 스텁"""
+
+    requests = []
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)["query"][0]
+        KakaoStub.requests.append(query)
+        if "오류" in query:
+            self.send_response(500)
+            self.end_headers()
+            return
+        documents = []
+        if "강남" in query:
+            documents = [{"x": "127.02", "y": "37.50", "address_name": query}]
+        body = json.dumps({"documents": documents}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def kakao_stub(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KakaoStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    KakaoStub.requests = []
+    monkeypatch.setenv("KAKAO_API_KEY", "test-key")
+    monkeypatch.setenv("KAKAO_LOCAL_API_URL", f"http://127.0.0.1:{server.server_port}/geocode")
+    yield KakaoStub.requests
+    server.shutdown()
+
+
+def make_service(cache_dir):
+    cache = AdvancedCache({"file_cache_dir": str(cache_dir), "redis": {"port": 1}})
+    return GeocodeService(fetch_coordinates_from_kakao, normalize_address, cache=cache,
+                          max_workers=4, rate_per_second=100)
+
+
+def test_batch_dedupes_and_caches(kakao_stub, tmp_path):
+    """중복 주소는 한 번만 조회하고, 결과와 '주소 없음'은 재시작 후에도 캐시에서 읽는지 테스트"""
+    service = make_service(tmp_path)
+    addresses = ["서울 강남구 테헤란로 1", "서울  강남구 테헤란로 1", "없는 주소 1", "오류 주소 1"]
+
+    results = service.geocode_many(addresses)
+    assert sorted(kakao_stub) == sorted(["서울 강남구 테헤란로 1", "없는 주소 1", "오류 주소 1"])
+    assert results["서울  강남구 테헤란로 1"]["coordinates"]["latitude"] == 37.50
+    assert results["없는 주소 1"]["status"] == "not_found"
+    assert results["오류 주소 1"]["status"] == "error"
+    service.shutdown()
+
+    # 새 프로세스처럼 새 캐시 인스턴스로 같은 파일 캐시를 열어도 API를 다시 부르지 않음 (오류는 재시도)
+    kakao_stub.clear()
+    restarted = make_service(tmp_path)
+    results = restarted.geocode_many(addresses)
+    assert kakao_stub == ["오류 주소 1"]
+    assert results["서울 강남구 테헤란로 1"] == {
+        "status": "ok", "cached": True,
+        "coordinates": {"latitude": 37.50, "longitude": 127.02,
+                        "formatted_address": "서울 강남구 테헤란로 1"},
+    }
+    assert results["없는 주소 1"]["cached"] is True
+    assert restarted.stats["negative_hits"] == 1
+    restarted.shutdown()
+
+
+def test_rate_limiter_spaces_requests():
+    """버스트를 넘는 요청은 초당 제한에 맞춰 대기하는지 테스트"""
+    limiter = RateLimiter(20, burst=1)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.18
+
+
+def test_batch_geocode_endpoint(client, kakao_stub, tmp_path, monkeypatch):
+    """일괄 좌표 변환 API 응답과 요약 테스트"""
+    monkeypatch.setattr(address_validation, "geocode_service", make_service(tmp_path))
+
+    response = client.post("/api/admin/geocode-addresses", json={
+        "addresses": ["서울 강남구 역삼로 2", "서울 강남구 역삼로 2", "없는 주소 2"],
+    })
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["summary"] == {"ok": 1, "not_found": 1, "error": 0, "cached": 0}
+    assert len(kakao_stub) == 2
+
+    assert client.post("/api/admin/geocode-addresses", json={"addresses": []}).status_code == 400
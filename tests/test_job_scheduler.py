@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+작업 스케줄러 테스트
+주기 실행/실패 지표, 실행 중인 회차 건너뛰기, 매일/요일/날짜 일정 계산,
+제거/교체된 작업 무시, 리더 락으로 singleton 작업이 한 곳에서만 실행되는지 확인
+"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from flask import Flask, current_app
+
+from core.backend.job_scheduler import (FileLeaderLock, Job, JobScheduler, LeaderLock, LocalLeaderLock,
+                                        RedisLeaderLock)
+
+
+def wait_until(predicate, timeout=3.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture
+def scheduler():
+    job_scheduler = JobScheduler(max_workers=2, leader_lock=LocalLeaderLock())
+    yield job_scheduler
+    job_scheduler.stop()
+
+
+def test_interval_jobs_record_metrics(scheduler):
+    """주기 작업의 실행 횟수/실패/지연 지표와 app_context 실행을 테스트"""
+    calls = []
+    app = Flask("job_scheduler_test")
+    scheduler.init_app(app)
+
+    def failing():
+        raise RuntimeError("실패 테스트")
+
+    scheduler.add_job("ok", lambda: calls.append(current_app.name), interval=0.02,
+                      app_context=True, initial_delay=0)
+    scheduler.add_job("fail", failing, interval=0.02, initial_delay=0)
+
+    assert wait_until(lambda: len(calls) >= 3 and scheduler.status()["jobs"]["fail"]["runs"] >= 2)
+    status = scheduler.status()
+    assert status["running"] and status["max_workers"] == 2
+    assert set(calls) == {"job_scheduler_test"}
+    assert status["jobs"]["ok"]["failures"] == 0 and status["jobs"]["ok"]["last_error"] is None
+    assert status["jobs"]["fail"]["failures"] == status["jobs"]["fail"]["runs"]
+    assert status["jobs"]["fail"]["last_error"] == "실패 테스트"
+    assert status["jobs"]["ok"]["max_lag"] >= 0
+
+    assert scheduler.remove_job("ok") and not scheduler.has_job("ok")
+    runs = len(calls)
+    time.sleep(0.1)
+    assert len(calls) <= runs + 1  # 제거 직전에 넘겨진 회차 하나까지만
+
+
+def test_overlapping_run_is_skipped(scheduler):
+    """이전 회차가 끝나지 않았으면 겹쳐 실행하지 않고 건너뛰는지 테스트"""
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def slow():
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.15)
+        with lock:
+            active[0] -= 1
+
+    scheduler.add_job("slow", slow, interval=0.02, initial_delay=0)
+    assert wait_until(lambda: scheduler.status()["jobs"]["slow"]["runs"] >= 2)
+    stats = scheduler.status()["jobs"]["slow"]
+    assert peak[0] == 1
+    assert stats["skipped"] > 0
+    assert stats["max_duration"] >= 0.1
+
+
+def test_daily_schedule_and_validation():
+    """매일/요일/날짜 다음 실행 시각 계산과 잘못된 등록 거부를 테스트"""
+    now = datetime(2026, 3, 4, 10, 30).timestamp()  # 수요일
+    assert datetime.fromtimestamp(Job("a", print, daily_at="12:00").next_after(now)) == datetime(2026, 3, 4, 12, 0)
+    assert datetime.fromtimestamp(Job("b", print, daily_at="09:00").next_after(now)) == datetime(2026, 3, 5, 9, 0)
+    assert datetime.fromtimestamp(
+        Job("c", print, daily_at="08:00", weekday=0).next_after(now)) == datetime(2026, 3, 9, 8, 0)
+    assert datetime.fromtimestamp(
+        Job("d", print, daily_at="09:00", monthday=1).next_after(now)) == datetime(2026, 4, 1, 9, 0)
+    assert Job("e", print, interval=30).next_after(now) == now + 30
+
+    scheduler = JobScheduler(leader_lock=LocalLeaderLock())
+    with pytest.raises(ValueError):
+        scheduler.add_job("x", print, start=False)
+    with pytest.raises(ValueError):
+        scheduler.add_job("x", print, interval=10, daily_at="09:00", start=False)
+    with pytest.raises(ValueError):
+        scheduler.add_job("x", print, interval=10, weekday=1, start=False)
+    with pytest.raises(ValueError):
+        scheduler.add_job("x", print, daily_at="09:00", monthday=32, start=False)
+    assert not scheduler.status()["running"]
+
+
+def test_heap_skips_removed_and_replaced_jobs():
+    """가짜 시계로 힙에서 꺼낼 때 제거/교체된 작업의 예전 항목을 무시하는지 테스트"""
+    clock = [1000.0]
+    scheduler = JobScheduler(leader_lock=LocalLeaderLock(), clock=lambda: clock[0])
+    scheduler.add_job("keep", print, interval=10, start=False)
+    scheduler.add_job("gone", print, interval=10, start=False)
+    first = scheduler.add_job("replace", print, interval=10, start=False)
+    first.stats.runs = 7
+    second = scheduler.add_job("replace", print, interval=30, start=False)
+    assert second.stats.runs == 7 and second.generation == first.generation + 1
+    scheduler.remove_job("gone")
+
+    clock[0] = 1010.0
+    due = scheduler._pop_due()
+    assert [job.name for job, _ in due] == ["keep"]
+    assert due[0][1] == 1010.0 and due[0][0].next_run == 1020.0
+
+    clock[0] = 1030.0
+    assert sorted(job.name for job, _ in scheduler._pop_due()) == ["keep", "replace"]
+    assert scheduler._pop_due() == []
+
+
+def test_singleton_job_runs_on_leader_only(tmp_path):
+    """같은 락 파일을 쓰는 두 스케줄러(워커) 중 리더 한 곳에서만 singleton 작업이 도는지 테스트"""
+    lock_path = str(tmp_path / "leader.lock")
+    calls = {"a": 0, "b": 0}
+    first = JobScheduler(max_workers=1, leader_lock=FileLeaderLock(lock_path))
+    second = JobScheduler(max_workers=1, leader_lock=FileLeaderLock(lock_path))
+    try:
+        first.add_job("report", lambda: calls.__setitem__("a", calls["a"] + 1), interval=0.02,
+                      singleton=True, initial_delay=0)
+        assert wait_until(lambda: calls["a"] >= 2)
+        second.add_job("report", lambda: calls.__setitem__("b", calls["b"] + 1), interval=0.02,
+                       singleton=True, initial_delay=0)
+        time.sleep(0.1)
+        assert calls["b"] == 0
+        assert first.status()["leader"] and not second.status()["leader"]
+
+        # 리더가 내려가면 다른 워커가 이어받음
+        first.stop()
+        assert wait_until(lambda: calls["b"] >= 1)
+        assert second.status()["leader"]
+    finally:
+        first.stop()
+        second.stop()
+
+
+def test_redis_leader_lock_is_renewed_between_long_interval_runs():
+    """작업 주기가 락 TTL보다 길어도 타이머가 락을 갱신해 다른 워커가 자기 주기에 리더가 되지 않는지 테스트"""
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    calls = {"a": 0, "b": 0}
+    first = JobScheduler(max_workers=1, leader_lock=RedisLeaderLock(fakeredis.FakeRedis(server=server), ttl=0.15))
+    second = JobScheduler(max_workers=1, leader_lock=RedisLeaderLock(fakeredis.FakeRedis(server=server), ttl=0.15))
+    try:
+        first.add_job("daily", lambda: calls.__setitem__("a", calls["a"] + 1), interval=0.5,
+                      singleton=True, initial_delay=0)
+        assert wait_until(lambda: calls["a"] == 1)
+        # 두 번째 워커는 첫 워커의 실행 사이(락 TTL이 지난 시점)에 실행 시각이 옴
+        second.add_job("daily", lambda: calls.__setitem__("b", calls["b"] + 1), interval=0.5,
+                       singleton=True, initial_delay=0.25)
+        time.sleep(1.1)
+        assert calls["b"] == 0 and calls["a"] >= 2
+        assert first.status()["leader"] and not second.status()["leader"]
+
+        # 리더가 내려가면 TTL 안에 다른 워커가 이어받음
+        first.stop()
+        assert wait_until(lambda: second.status()["leader"], timeout=1.0)
+    finally:
+        first.stop()
+        second.stop()
+
+    with pytest.raises(TypeError):
+        LeaderLock()
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+모델 레지스트리 테스트
+버전 게시/메모리 상주(한 번만 로드), 다른 인스턴스(워커)의 새 버전 교체와 롤백,
+일괄 예측, MLManager/고급 분석 예측기 연동을 확인
+"""
+
+from datetime import date, timedelta
+
+import joblib
+import numpy as np
+from sklearn.ensemble import IsolationForest, RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+
+from utils.ml_manager import MLManager
+from utils.model_registry import ModelRegistry
+
+
+def fit_linear(slope):
+    X = np.arange(20, dtype=float).reshape(-1, 2)
+    return LinearRegression().fit(X, X.sum(axis=1) * slope)
+
+
+def test_publish_loads_once_and_swaps_across_instances(tmp_path):
+    """게시한 모델을 다시 읽지 않고 쓰며, 다른 인스턴스의 게시/롤백을 따라가는지 테스트"""
+    writer = ModelRegistry(tmp_path, check_interval=0)
+    reader = ModelRegistry(tmp_path, check_interval=0)
+    assert reader.get("demo") is None
+
+    v1 = writer.publish("demo", fit_linear(1), metadata={"note": "첫 버전"})
+    first = reader.get("demo")
+    assert first.version == v1 and first.metadata["note"] == "첫 버전"
+    for _ in range(5):
+        assert reader.get("demo") is first
+    assert reader.stats["loads"] == 1 and writer.stats["loads"] == 0
+
+    v2 = writer.publish("demo", fit_linear(2))
+    assert writer.get("demo").version == v2
+    second = reader.get("demo")
+    assert second.version == v2 and reader.stats["swaps"] == 1
+    assert np.allclose(second.predict([[1, 2]]), [6.0])
+    # 교체 전에 받은 항목은 이전 버전 그대로
+    assert np.allclose(first.predict([[1, 2]]), [3.0])
+
+    assert writer.activate("demo", v1) and reader.get("demo").version == v1
+    assert writer.versions("demo") == [v1, v2]
+    assert not writer.activate("demo", "없는 버전")
+
+    assert writer.remove("demo") and reader.get("demo") is None
+
+
+def test_throttled_check_and_pruning(tmp_path):
+    """확인 주기 안에서는 파일을 보지 않고, 오래된 버전은 정리되는지 테스트"""
+    writer = ModelRegistry(tmp_path, keep_versions=2)
+    reader = ModelRegistry(tmp_path, check_interval=3600)
+    writer.publish("demo", fit_linear(1))
+    cached = reader.get("demo")
+    writer.publish("demo", fit_linear(2))
+    writer.publish("demo", fit_linear(3))
+    assert reader.get("demo") is cached
+    assert len(writer.versions("demo")) == 2
+
+    reader.evict("demo")
+    assert reader.get("demo").version == writer.current_version("demo")
+
+
+def test_predict_many_matches_single_predictions(tmp_path):
+    """일괄 예측이 한 건씩 예측한 결과와 같은지 테스트 (스케일러 포함)"""
+    rng = np.random.RandomState(0)
+    X = rng.rand(200, 4)
+    y = X @ [3, -1, 2, 0.5]
+    scaler = StandardScaler().fit(X)
+    model = RandomForestRegressor(n_estimators=10, random_state=0).fit(scaler.transform(X), y)
+
+    registry = ModelRegistry(tmp_path)
+    registry.publish("forest", model, scaler)
+    registry.evict("forest")
+
+    rows = rng.rand(50, 4)
+    batch = registry.predict_many("forest", rows)
+    single = [registry.get("forest").predict(row)[0] for row in rows]
+    assert np.allclose(batch, single)
+    assert np.allclose(batch, model.predict(scaler.transform(rows)))
+    assert registry.stats["predictions"] == 50 and registry.stats["loads"] == 1
+
+
+def test_ml_manager_imports_legacy_files_and_predicts_in_batch(tmp_path):
+    """예전 방식으로 저장된 모델을 옮겨 쓰고, 일괄 예측과 단건 예측이 같은지 테스트"""
+    legacy_dir = tmp_path / "ml_models"
+    legacy_dir.mkdir()
+    X = np.random.RandomState(1).rand(40, 8)
+    joblib.dump(LinearRegression().fit(X, X[:, 5] * 2), legacy_dir / "sales_prediction.joblib")
+
+    registry = ModelRegistry(tmp_path / "registry", check_interval=0)
+    manager = MLManager(str(legacy_dir), registry=registry)
+    assert registry.current_version("sales_prediction")
+
+    inputs = [{"previous_sales": value, "day_of_week": value % 7} for value in range(10)]
+    batch = manager.predict_many("sales_prediction", inputs)
+    assert np.allclose([r["predicted_sales"] for r in batch],
+                       [manager.predict_sales(f)["predicted_sales"] for f in inputs])
+    assert abs(batch[3]["predicted_sales"] - 6.0) < 1e-6
+
+    # 다시 만들어도 중복 게시하지 않음
+    MLManager(str(legacy_dir), registry=registry)
+    assert len(registry.versions("sales_prediction")) == 1
+
+    assert "error" in manager.predict_staff_needs({})
+    assert manager.delete_model("sales_prediction")
+    assert "error" in manager.predict_sales({})
+
+
+def test_advanced_analytics_uses_published_models(tmp_path):
+    """고급 분석 예측기가 요청 중 학습 없이 게시된 모델로 예측/탐지하는지 테스트"""
+    from api.ai_advanced_analytics import (SALES_ANOMALY_MODEL, SALES_TREND_FEATURES, SALES_TREND_MODEL,
+                                           AdvancedAnomalyDetector, SalesTrendPredictor,
+                                           build_sales_trend_frame, sales_anomaly_features)
+
+    registry = ModelRegistry(tmp_path, check_interval=0)
+    start = date(2026, 1, 1)
+    sales = [{"date": start + timedelta(days=i), "amount": 1000 + 300 * (i % 7 >= 5) + i}
+             for i in range(60)]
+
+    predictor = SalesTrendPredictor(registry)
+    assert "error" in predictor.predict_sales_trend(sales)
+
+    df = build_sales_trend_frame(sales)
+    scaler = StandardScaler().fit(df[SALES_TREND_FEATURES].values)
+    model = LinearRegression().fit(scaler.transform(df[SALES_TREND_FEATURES].values), df["amount"].values)
+    version = registry.publish(SALES_TREND_MODEL, model, scaler)
+
+    result = predictor.predict_sales_trend(sales, days_ahead=5)
+    assert len(result["predictions"]) == 5
+    assert result["model_performance"]["model_version"] == version
+    assert result["model_performance"]["r2_score"] > 0.9
+    # 예측 요청이 모델을 바꾸지 않음
+    assert registry.versions(SALES_TREND_MODEL) == [version]
+
+    detector = AdvancedAnomalyDetector(registry)
+    detector._create_sales_alert = lambda *args: None
+    steady = [{"amount": 1000 + (i % 3) * 10} for i in range(30)]
+    dropped = steady[:-1] + [{"amount": 200}]
+    assert detector.detect_sales_anomaly(dropped)["anomaly"] is True  # 모델 없이 통계 점수
+    assert detector.detect_sales_anomaly(steady)["anomaly"] is False
+
+    history = np.random.RandomState(0).normal(1000, 50, 365)
+    forest = IsolationForest(random_state=0).fit(sales_anomaly_features(history))
+    registry.publish(SALES_ANOMALY_MODEL, forest)
+    result = detector.detect_sales_anomaly(dropped)
+    assert result["anomaly"] is True and result["type"] == "sales_drop"
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+온라인 이상 탐지 테스트
+여러 시계열을 한 번에 채점한 결과가 하나씩 넣은 결과와 같은지, 급감/급증 탐지와
+Isolation Forest 재학습, 고급 분석기의 일괄 탐지/알림 연동, 일 단위 멱등 처리와
+사이드카 DB 상태 공유, 일일 탐지 작업 등록을 확인
+"""
+
+from datetime import date, datetime, time, timedelta
+
+import numpy as np
+
+from api import ai_advanced_analytics
+from api.ai_advanced_analytics import AdvancedAnomalyDetector, RealTimeAnalyzer
+from core.backend.job_scheduler import JobScheduler, LocalLeaderLock
+from models_main import Attendance, Branch, Brand, InventoryItem, Order, User
+from utils.online_anomaly import OnlineAnomalyDetector, OnlineAnomalyStateStore
+
+
+def history(series=50, days=30, seed=0):
+    rng = np.random.RandomState(seed)
+    return rng.normal(1000, 30, size=(days, series)).clip(min=1)
+
+
+def test_batch_scoring_matches_sequential_updates():
+    """한 번에 넣은 결과와 시계열마다 하나씩 넣은 결과가 같은지 테스트"""
+    values = history(series=20)
+    values[-1, 3] = 300  # 급감
+    values[-1, 7] = 2000  # 급증
+    batch = OnlineAnomalyDetector(direction="both", refit_interval=0)
+    single = OnlineAnomalyDetector(direction="both", refit_interval=0)
+    keys = [("branch", i) for i in range(20)]
+
+    for row in values:
+        result = batch.update(keys, row)
+        expected = [single.update([key], [value]) for key, value in zip(keys, row)]
+        assert result["anomaly"].tolist() == [r["anomaly"][0] for r in expected]
+        assert np.allclose(result["z_score"], [r["z_score"][0] for r in expected])
+    assert np.nonzero(result["anomaly"])[0].tolist() == [3, 7]
+    assert batch.state(("branch", 0)) == single.state(("branch", 0))
+
+    # 같은 시계열 값이 한 묶음에 여러 번 있으면 들어온 순서대로 처리
+    dup = OnlineAnomalyDetector(refit_interval=0)
+    seq = OnlineAnomalyDetector(refit_interval=0)
+    dup.update(["a", "b", "a", "a"], [1.0, 5.0, 2.0, 3.0])
+    for key, value in [("a", 1.0), ("b", 5.0), ("a", 2.0), ("a", 3.0)]:
+        seq.update([key], [value])
+    assert dup.state("a") == seq.state("a") and dup.state("a")["count"] == 3
+
+
+def test_direction_warmup_and_refit():
+    """방향/최소 데이터 조건과 백그라운드 재학습 모델 사용을 테스트"""
+    detector = OnlineAnomalyDetector(direction="drop", min_points=14, refit_interval=0,
+                                     refit_min_samples=100)
+    keys = list(range(50))
+    values = history(series=50, days=20)
+    for day, row in enumerate(values):
+        if day == 5:
+            row = row.copy()
+            row[0] = 10  # 최소 데이터 전에는 판정하지 않음
+        assert not detector.update(keys, row)["anomaly"].any()
+
+    spike = values[-1].copy()
+    spike[1] = 5000  # 급증은 drop 탐지기에서 무시
+    spike[2] = 100
+    result = detector.update(keys, spike)
+    assert np.nonzero(result["anomaly"])[0].tolist() == [2]
+    assert np.isnan(result["forest_score"]).all()
+
+    assert detector.refit() and detector.status()["forest"]
+    row = history(series=50, days=1, seed=5)[0]
+    row[0] *= 0.2
+    result = detector.update(keys, row)
+    assert not np.isnan(result["forest_score"]).any()
+    assert detector.stats["refits"] == 1
+
+
+def test_detector_alerts_per_brand_and_branch():
+    """지점 값과 브랜드 합계를 함께 채점하고, 이상은 기존 알림 함수로 보내는지 테스트"""
+    detector = AdvancedAnomalyDetector()
+    for online in detector.online.values():
+        online.refit_interval = 0
+    alerts = []
+    detector._create_sales_alert = lambda *args: alerts.append(("sales",) + args)
+    detector._create_cost_alert = lambda *args: alerts.append(("cost",) + args)
+    detector._create_inventory_alert = lambda *args: alerts.append(("inventory",) + args)
+
+    values = history(series=6, days=20)
+    for row in values[:-1]:
+        points = [{"brand_id": i // 3, "branch_id": i, "amount": v} for i, v in enumerate(row)]
+        assert detector.observe_sales(points) == []
+    last = values[-1].copy()
+    last[0:3] = 100  # 브랜드 0의 모든 지점 급감
+    anomalies = detector.observe_sales([{"brand_id": i // 3, "branch_id": i, "amount": v}
+                                        for i, v in enumerate(last)])
+    assert sorted((a["scope"], a["id"]) for a in anomalies) == [
+        ("branch", 0), ("branch", 1), ("branch", 2), ("brand", 0)
+    ]
+    assert {a[1] for a in alerts} == {0} and len(alerts) == 4
+
+    by_brand = detector.detect_inventory_batch([
+        {"brand_id": 1, "name": "우유", "current_stock": 2, "min_stock": 5, "daily_consumption": 1},
+        {"brand_id": 1, "name": "원두", "current_stock": 100, "min_stock": 5, "daily_consumption": 1},
+        {"brand_id": 2, "name": "시럽", "current_stock": 10, "min_stock": 1, "daily_consumption": 5},
+    ])
+    assert {k: [a["type"] for a in v] for k, v in by_brand.items()} == {
+        1: ["low_stock", "stockout_prediction"], 2: ["stockout_prediction"]
+    }
+    assert detector.detect_inventory_anomaly([])["anomaly"] is False
+
+
+def test_same_day_is_applied_once_per_series():
+    """같은 날(또는 지난 날) 값을 다시 넣으면 시계열마다 건너뛰고 상태가 바뀌지 않는지 테스트"""
+    detector = OnlineAnomalyDetector(refit_interval=0)
+    day = date(2026, 3, 1).toordinal()
+    detector.update(["a", "b"], [10.0, 20.0], day=day)
+    before = detector.state("a")
+
+    result = detector.update(["a", "b", "c"], [99.0, 20.0, 5.0], day=day)
+    assert result["skipped"].tolist() == [True, True, False]
+    assert detector.state("a") == before and detector.state("c")["count"] == 1
+    assert detector.update(["a"], [1.0], day=day - 1)["skipped"].tolist() == [True]
+    assert detector.update(["a"], [12.0], day=day + 1)["skipped"].tolist() == [False]
+    assert detector.state("a")["count"] == 2 and detector.stats["points"] == 4
+
+    # day 없이 넣으면 예전처럼 매번 반영
+    assert not detector.update(["a"], [12.0])["skipped"].any()
+    assert detector.state("a")["count"] == 3
+
+
+def test_state_store_shares_state_between_workers(tmp_path):
+    """두 워커(탐지기)가 같은 사이드카 DB를 쓰면 상태를 이어받고, 같은 날은 한 번만 반영되는지 테스트"""
+    db_path = tmp_path / "online_anomaly.db"
+    store = OnlineAnomalyStateStore(db_path)
+    first = OnlineAnomalyDetector(direction="drop", min_points=14, refit_interval=0)
+    second = OnlineAnomalyDetector(direction="drop", min_points=14, refit_interval=0)
+    keys = [("branch", 1), ("brand", 1)]
+    start = date(2026, 3, 1).toordinal()
+
+    values = history(series=2, days=20)
+    values[-1] = 100  # 마지막 날 급감
+    for offset, row in enumerate(values[:-1]):
+        worker = first if offset % 2 == 0 else second  # 날마다 다른 워커가 처리
+        store.update("sales", worker, keys, row, day=start + offset)
+    assert first.state(("branch", 1))["count"] == 19
+
+    last = start + 19
+    result = store.update("sales", first, keys, values[-1], day=last)
+    assert result["anomaly"].tolist() == [True, True]
+    # 다른 워커가 같은 날을 다시 처리하면 건너뛰고 알림 대상도 없음
+    repeat = store.update("sales", second, keys, values[-1], day=last)
+    assert repeat["skipped"].all() and not repeat["anomaly"].any()
+    assert second.state(("branch", 1)) == first.state(("branch", 1))
+    assert second.state(("branch", 1))["count"] == 20
+
+    # 재시작한 워커도 저장된 상태를 이어받음
+    restarted = OnlineAnomalyDetector(direction="drop", min_points=14, refit_interval=0)
+    OnlineAnomalyStateStore(db_path).update("sales", restarted, keys, [1000.0, 1000.0], day=last + 1)
+    assert restarted.state(("brand", 1))["count"] == 21
+
+
+def test_scan_daily_metrics_uses_aggregates(session):
+    """하루 단위 일괄 탐지가 지점별 집계로 급감을 찾는지 테스트"""
+    brand = Brand(name="테스트 브랜드", code="TB")
+    session.add(brand)
+    session.flush()
+    branch = Branch(name="강남점", brand_id=brand.id)
+    session.add(branch)
+    session.flush()
+    user = User(username="clerk", email="clerk@example.com", password_hash="x", role="employee",
+                branch_id=branch.id)
+    session.add(user)
+    session.flush()
+
+    start = date(2026, 3, 1)
+    for offset in range(20):
+        day = start + timedelta(days=offset)
+        amount = 100 if offset == 19 else 1000 + (offset % 4) * 20
+        session.add(Order(item="원두", quantity=1, ordered_by=user.id, store_id=branch.id,
+                          status="completed", total_cost=amount, created_at=datetime.combine(day, time(12))))
+        session.add(Attendance(user_id=user.id, clock_in=datetime.combine(day, time(9)),
+                               clock_out=datetime.combine(day, time(18))))
+    session.add(InventoryItem(name="우유", category="유제품", branch_id=branch.id, current_stock=1, min_stock=5))
+    session.commit()
+
+    analyzer = RealTimeAnalyzer()
+    for online in analyzer.anomaly_detector.online.values():
+        online.refit_interval = 0
+    analyzer.anomaly_detector._create_sales_alert = lambda *args: None
+    analyzer.anomaly_detector._create_inventory_alert = lambda *args: None
+
+    results = [analyzer.scan_daily_metrics(start + timedelta(days=offset)) for offset in range(20)]
+    assert all("error" not in r for r in results)
+    assert [r["date"] for r in results if r["sales_anomalies"]] == ["2026-03-20"]
+    assert {a["scope"] for a in results[-1]["sales_anomalies"]} == {"branch", "brand"}
+    assert all(r["cost_anomalies"] == [] for r in results)
+    assert results[-1]["scanned"] == {"sales_branches": 1, "cost_branches": 1, "inventory_items": 1}
+    assert [a["type"] for a in results[-1]["inventory_anomalies"][str(brand.id)]] == ["low_stock"]
+
+
+def test_repeated_scan_is_idempotent_and_daily_job_registered(session, tmp_path, monkeypatch):
+    """같은 날을 여러 워커가 다시 스캔해도 한 번만 반영되고, 일일 탐지가 singleton 작업으로 등록되는지 테스트"""
+    brand = Brand(name="테스트 브랜드", code="TB")
+    session.add(brand)
+    session.flush()
+    branch = Branch(name="강남점", brand_id=brand.id)
+    session.add(branch)
+    session.flush()
+    user = User(username="clerk", email="clerk@example.com", password_hash="x", role="employee",
+                branch_id=branch.id)
+    session.add(user)
+    session.flush()
+    start = date(2026, 3, 1)
+    for offset in range(20):
+        day = start + timedelta(days=offset)
+        amount = 100 if offset == 19 else 1000 + (offset % 4) * 20
+        session.add(Order(item="원두", quantity=1, ordered_by=user.id, store_id=branch.id,
+                          status="completed", total_cost=amount, created_at=datetime.combine(day, time(12))))
+    session.commit()
+
+    store = OnlineAnomalyStateStore(tmp_path / "online_anomaly.db")
+    workers = [RealTimeAnalyzer(state_store=store) for _ in range(2)]
+    alerts = []
+    for analyzer in workers:
+        for online in analyzer.anomaly_detector.online.values():
+            online.refit_interval = 0
+        analyzer.anomaly_detector._create_sales_alert = lambda *args: alerts.append(args)
+
+    for offset in range(20):
+        day = start + timedelta(days=offset)
+        results = [workers[0].scan_daily_metrics(day), workers[1].scan_daily_metrics(day),
+                   workers[offset % 2].scan_daily_metrics(day)]
+        assert all("error" not in r for r in results)
+        assert results[1]["sales_anomalies"] == [] and results[2]["sales_anomalies"] == []
+    assert len(alerts) == 2  # 마지막 날 지점 + 브랜드, 한 번씩
+    assert workers[1].anomaly_detector.online["sales"].state(("branch", branch.id))["count"] == 20
+
+    scheduler = JobScheduler(max_workers=1, leader_lock=LocalLeaderLock())
+    monkeypatch.setattr(ai_advanced_analytics, "job_scheduler", scheduler)
+    try:
+        workers[0].start_daily_scan(at="01:30")
+        job = scheduler._jobs[RealTimeAnalyzer.DAILY_SCAN_JOB]
+        assert job.singleton and job.app_context and job.daily_at == "01:30"
+        workers[0].stop_daily_scan()
+        assert not scheduler.has_job(RealTimeAnalyzer.DAILY_SCAN_JOB)
+    finally:
+        scheduler.stop()
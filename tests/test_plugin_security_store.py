@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+플러그인 보안 저장소 테스트
+API 키 검증 캐시/폐기 무효화, last_used와 감사 로그 일괄 기록, 보관 기간 정리,
+예전 JSON 파일 이전을 확인
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+
+from core.backend.plugin_security_system import PermissionType, PluginSecuritySystem
+
+
+def make_system(tmp_path, **kwargs):
+    kwargs.setdefault("flush_interval", 60)
+    return PluginSecuritySystem(security_dir=str(tmp_path / "security"), **kwargs)
+
+
+def test_validate_uses_cache_and_revoke_invalidates(tmp_path):
+    """검증은 메모리 맵에서 처리하고 last_used는 flush 때 기록, 폐기하면 바로 거부되는지 테스트"""
+    system = make_system(tmp_path)
+    key = system.generate_api_key("plugin-a", "테스트 키", [PermissionType.READ])
+
+    assert system.validate_api_key(key, "plugin-a", PermissionType.READ)["name"] == "테스트 키"
+    assert system.validate_api_key(key, "plugin-a", PermissionType.WRITE) is None
+    assert system.validate_api_key(key, "plugin-b", PermissionType.READ) is None
+    assert system.validate_api_key("없는 키", "plugin-a", PermissionType.READ) is None
+
+    row = system.db.query_one("SELECT last_used FROM api_keys")
+    assert row["last_used"] is None
+    assert system.flush() == 1
+    keys = system.get_api_keys("plugin-a")
+    assert keys[0]["last_used"] is not None
+    assert "key_hash" not in keys[0]
+
+    assert system.revoke_api_key(keys[0]["key_id"]) is True
+    assert system.validate_api_key(key, "plugin-a", PermissionType.READ) is None
+    assert system.revoke_api_key("없는 ID") is False
+    system.close()
+
+
+def test_audit_logs_are_batched_and_pruned(tmp_path):
+    """감사 로그는 모아서 기록하고, 조회 시 필터/정렬, 보관 기간이 지난 로그는 범위 삭제되는지 테스트"""
+    system = make_system(tmp_path, flush_batch_size=1000)
+    for i in range(5):
+        system.log_security_event("plugin-a", user_id=str(i % 2), action=f"action-{i}", success=True)
+    system.log_security_event("plugin-b", action="other", details={"reason": "테스트"})
+
+    assert system.db.query_one("SELECT COUNT(*) AS n FROM audit_logs")["n"] == 0
+    logs = system.get_audit_logs(plugin_id="plugin-a", user_id="1")
+    assert [log["action"] for log in logs] == ["action-3", "action-1"]
+    assert logs[0]["success"] is True
+    assert system.get_audit_logs(plugin_id="plugin-b")[0]["details"] == {"reason": "테스트"}
+
+    old = (datetime.now() - timedelta(days=31)).isoformat()
+    system.db.execute(
+        "INSERT INTO audit_logs (log_id, plugin_id, success, timestamp) VALUES ('old', 'plugin-a', 0, ?)",
+        (old,),
+    )
+    assert len(system.get_audit_logs(limit=100)) == 6
+    system._last_prune = None
+    system.flush()
+    assert system.db.query_one("SELECT COUNT(*) AS n FROM audit_logs")["n"] == 6
+    system.close()
+
+    # 재시작 직후(monotonic 값이 정리 주기보다 작아도) 첫 flush에서 정리
+    system.db.execute(
+        "INSERT INTO audit_logs (log_id, plugin_id, success, timestamp) VALUES ('old2', 'plugin-a', 0, ?)",
+        (old,),
+    )
+    restarted = make_system(tmp_path)
+    restarted.flush()
+    assert restarted.db.query_one("SELECT COUNT(*) AS n FROM audit_logs")["n"] == 6
+    restarted.close()
+
+
+def test_migrates_json_stores(tmp_path):
+    """예전 api_keys.json / audit_logs.json 내용이 테이블로 옮겨지는지 테스트"""
+    security_dir = tmp_path / "security"
+    security_dir.mkdir()
+    key = "legacy-key"
+    record = {
+        "key_id": "k1", "plugin_id": "plugin-a", "name": "이전 키",
+        "key_hash": hashlib.sha256(key.encode()).hexdigest(), "permissions": ["admin"],
+        "expires_at": None, "last_used": None, "created_at": datetime.now().isoformat(),
+        "is_active": True,
+    }
+    (security_dir / "api_keys.json").write_text(json.dumps([record]), encoding="utf-8")
+    (security_dir / "audit_logs.json").write_text(json.dumps([{
+        "log_id": "l1", "plugin_id": "plugin-a", "user_id": "", "action": "login",
+        "resource": "", "ip_address": "", "user_agent": "", "success": True,
+        "details": {}, "timestamp": datetime.now().isoformat(),
+    }]), encoding="utf-8")
+
+    system = make_system(tmp_path)
+    assert system.validate_api_key(key, "plugin-a", PermissionType.ADMIN)["name"] == "이전 키"
+    assert [log["log_id"] for log in system.get_audit_logs()] == ["l1"]
+    assert (security_dir / "api_keys.json.migrated").exists()
+    system.close()
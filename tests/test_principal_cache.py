@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+인증 주체 캐시 테스트
+반복된 인증 요청이 권한 확인에 DB를 쓰지 않는지, 사용자 행이 바뀌어 커밋되면 무효화되는지,
+데코레이터의 기존 응답(메시지/상태 코드)이 그대로인지 확인
+"""
+
+import datetime
+
+import jwt
+import pytest
+from flask import g, request
+
+from core.backend.event_bus import BusMessage
+from models_main import User, db
+from utils.auth_decorators import (admin_required, jwt_required, login_required, manager_required,
+                                   permission_required, role_required)
+from utils.principal_cache import principal_cache
+
+
+def make_user(session, username, role="employee", status="approved"):
+    user = User(username=username, email=f"{username}@example.com", password_hash="x",
+                role=role, status=status, branch_id=3, brand_id=2)
+    session.add(user)
+    session.commit()
+    return user
+
+
+def token_for(app, user_id, **claims):
+    payload = {"user_id": user_id, "exp": datetime.datetime.utcnow() + datetime.timedelta(hours=1), **claims}
+    return jwt.encode(payload, app.config["JWT_SECRET_KEY"], algorithm="HS256")
+
+
+@pytest.fixture
+def call(app, count_queries):
+    """데코레이터를 씌운 뷰를 요청 컨텍스트에서 호출해 (응답, 상태 코드, 실행 SQL 수) 반환"""
+    def call(view, token=None, header=None):
+        headers = {"Authorization": header if header is not None else f"Bearer {token}"} if token or header else {}
+        with app.test_request_context("/", headers=headers):
+            db.session.expunge_all()  # 요청마다 새 세션처럼 (identity map 재사용 방지)
+            with count_queries() as statements:
+                result = view()
+        if isinstance(result, tuple):
+            return result[0].get_json()["message"], result[1], len(statements)
+        return result, 200, len(statements)
+
+    return call
+
+
+def current():
+    return {"id": request.current_user.id, "role": request.current_user.role, "same": g.current_user is request.current_user}
+
+
+def test_repeated_requests_authorize_without_db(app, session, call):
+    """처음 한 번만 필요한 컬럼을 읽고, 이후 요청은 역할/권한 확인에 SQL을 실행하지 않는지 테스트"""
+    principal_cache.clear()
+    manager = make_user(session, "mgr", role="manager")
+    token = token_for(app, manager.id)
+
+    data, status, queries = call(jwt_required(current), token)
+    assert status == 200 and data == {"id": manager.id, "role": "manager", "same": True}
+    assert queries == 1
+
+    for view in (jwt_required(current), login_required(current), manager_required(current),
+                 role_required(["manager"])(current), permission_required("dashboard")(current)):
+        assert call(view, token)[1:] == (200, 0)
+
+    assert call(admin_required(current), token)[:2] == ("관리자 권한이 필요합니다.", 403)
+    assert call(role_required(["admin"])(current), token)[:2] == ("접근 권한이 없습니다.", 403)
+    assert call(permission_required("brand_management", "delete")(current), token)[:2] == \
+        ("brand_management의 delete 권한이 없습니다.", 403)
+
+    # 스냅샷에 없는 속성은 User 행에서 읽음
+    with app.test_request_context("/", headers={"Authorization": f"Bearer {token}"}):
+        assert jwt_required(lambda: request.current_user.email)() == "mgr@example.com"
+        assert request.current_user.has_permission("dashboard", "view")
+    stats = principal_cache.get_stats()
+    assert stats["loads"] == 1 and stats["hits"] >= 9
+
+
+def test_user_change_invalidates_snapshot(app, session, call):
+    """사용자 행 변경 커밋/삭제 시 무효화, 롤백은 유지, 다른 워커 알림으로도 무효화되는지 테스트"""
+    principal_cache.clear()
+    user_id = make_user(session, "emp").id
+    token = token_for(app, user_id)
+    admin_view = admin_required(current)
+    assert call(admin_view, token)[1] == 403
+
+    user = db.session.get(User, user_id)
+    user.role = "admin"
+    db.session.commit()
+    assert call(admin_view, token)[1:] == (200, 1)
+
+    # 롤백된 변경은 무효화하지 않음
+    user = db.session.get(User, user_id)
+    user.status = "suspended"
+    db.session.flush()
+    db.session.rollback()
+    assert call(jwt_required(current), token)[1:] == (200, 0)
+
+    # 다른 워커가 보낸 무효화 (자기 프로세스 메시지는 무시)
+    version = principal_cache.get(user_id).version
+    principal_cache._on_bus_message(BusMessage("auth.principal", {"user_ids": [user_id], "origin": "other:1"}))
+    principal_cache._on_bus_message(BusMessage("auth.principal",
+                                               {"user_ids": [user_id], "origin": principal_cache._origin()}))
+    assert principal_cache._version(user_id) == version + 1
+
+    user = db.session.get(User, user_id)
+    user.status = "pending"
+    db.session.commit()
+    assert call(jwt_required(current), token)[:2] == ("승인되지 않은 계정입니다.", 401)
+
+    db.session.delete(db.session.get(User, user_id))
+    db.session.commit()
+    assert call(admin_view, token)[:2] == ("유효하지 않은 사용자입니다.", 401)
+
+
+def test_token_errors_keep_existing_responses(app, session, call):
+    """토큰 누락/형식 오류/만료/위조 응답이 기존과 같은지 테스트"""
+    principal_cache.clear()
+    user_id = make_user(session, "tok").id
+    view = jwt_required(current)
+    assert call(view)[:2] == ("토큰이 필요합니다.", 401)
+    assert call(login_required(current))[:2] == ("로그인이 필요합니다.", 401)
+    assert call(view, header="Bearer")[:2] == ("유효하지 않은 토큰 형식입니다.", 401)
+    expired = token_for(app, user_id, exp=datetime.datetime.utcnow() - datetime.timedelta(minutes=1))
+    assert call(view, expired)[:2] == ("토큰이 만료되었습니다.", 401)
+    forged = jwt.encode({"user_id": user_id}, "wrong-key", algorithm="HS256")
+    assert call(view, forged)[:2] == ("유효하지 않은 토큰입니다.", 401)
+    assert call(view, token_for(app, "abc"))[:2] == ("유효하지 않은 사용자입니다.", 401)
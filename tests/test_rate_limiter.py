@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+요청 제한 서비스 테스트
+프로세스 내 토큰 버킷(버스트/회복, 키 수 상한, 경합 시 정확한 허용 수)과
+Redis GCRA 제한(여러 워커 공유, TTL, 장애 시 대체)을 확인 (Redis는 fakeredis 로 흉내냄)
+"""
+
+import threading
+
+import pytest
+
+from core.backend.rate_limiter import LocalRateLimiter, RateLimiter, RedisRateLimiter, create_rate_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def hammer(limiters, key, limit, period, threads=8, per_thread=50):
+    """여러 스레드(워커)가 동시에 같은 키로 요청, 허용된 수 반환"""
+    allowed = []
+
+    def worker(index):
+        limiter = limiters[index % len(limiters)]
+        allowed.append(sum(limiter.hit(key, limit, period).allowed for _ in range(per_thread)))
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return sum(allowed)
+
+
+def test_local_token_bucket_burst_refill_and_bounded_keys():
+    """버스트 limit회 후 거부, 시간이 지나면 비율대로 회복, 키 수는 상한을 넘지 않는지 테스트"""
+    clock = FakeClock()
+    limiter = LocalRateLimiter(max_keys=8, shards=2, clock=clock)
+    results = [limiter.hit("user:1", 10, 60) for _ in range(11)]
+    assert [r.allowed for r in results] == [True] * 10 + [False]
+    assert results[0].remaining == 9 and results[9].remaining == 0
+    assert results[10].retry_after == pytest.approx(6.0)  # 60초에 10회 -> 6초마다 1회
+
+    clock.now += 12
+    assert [limiter.hit("user:1", 10, 60).allowed for _ in range(3)] == [True, True, False]
+    assert limiter.hit("user:2", 10, 60).allowed  # 키별로 독립
+
+    for n in range(100):
+        limiter.hit(f"ip:{n}", 10, 60)
+    stats = limiter.get_stats()
+    assert stats["keys"] <= 8 and stats["evicted"] >= 92
+
+    limiter.reset("ip:99")
+    assert limiter.hit("ip:99", 1, 60).allowed
+
+    # 여러 스레드가 동시에 같은 키를 써도 정확히 limit회만 허용
+    assert hammer([LocalRateLimiter()], "shared", 100, 3600) == 100
+
+
+def test_rate_limiter_interface_is_abstract():
+    """hit/reset을 구현하지 않은 제한기는 생성 시점에 실패하는지 테스트"""
+    with pytest.raises(TypeError):
+        RateLimiter()
+
+    class HitOnly(RateLimiter):
+        def hit(self, key, limit, period, cost=1):
+            return None
+
+    with pytest.raises(TypeError):
+        HitOnly()
+
+
+@pytest.fixture
+def redis_server():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeServer(), fakeredis
+
+
+def test_redis_gcra_shared_across_workers(redis_server):
+    """Redis GCRA 제한을 두 워커가 공유해 합계가 limit을 넘지 않고, 키에 TTL이 붙는지 테스트"""
+    server, fakeredis = redis_server
+    worker_a = RedisRateLimiter(fakeredis.FakeRedis(server=server))
+    worker_b = RedisRateLimiter(fakeredis.FakeRedis(server=server))
+
+    results = [worker.hit("user:1", 5, 60) for worker in (worker_a, worker_b) * 3]
+    assert [r.allowed for r in results] == [True] * 5 + [False]
+    assert [r.remaining for r in results[:5]] == [4, 3, 2, 1, 0]
+    assert 11.0 < results[5].retry_after <= 12.0  # 60초에 5회 -> 12초마다 1회
+    assert 0 < worker_a.client.pttl("ratelimit:user:1") <= 60000
+
+    assert hammer([worker_a, worker_b], "shared", 50, 3600) == 50
+    stats = worker_a.get_stats()
+    assert stats["backend"] == "redis" and stats["fallbacks"] == 0
+
+    worker_a.reset("user:1")
+    assert worker_b.hit("user:1", 5, 60).allowed
+
+
+def test_redis_failure_falls_back_to_local():
+    """Redis 장애 시 프로세스 내 토큰 버킷으로 계속 제한하고, 연결 실패 시 로컬 제한기를 만드는지 테스트"""
+    class BrokenRedis:
+        def register_script(self, script):
+            def call(keys, args):
+                raise ConnectionError("redis down")
+            return call
+
+    limiter = RedisRateLimiter(BrokenRedis())
+    assert [limiter.hit("user:1", 2, 60).allowed for _ in range(3)] == [True, True, False]
+    assert limiter.get_stats()["fallbacks"] == 3
+
+    assert isinstance(create_rate_limiter("redis", "redis://localhost:1/0"), LocalRateLimiter)
+
+
+def test_security_manager_api_rate_limit_uses_shared_limiter():
+    """SecurityManager.check_api_rate_limit가 공유 요청 제한기로 사용자/엔드포인트별 제한하고 초과 시 보안 이벤트를 남기는지 테스트"""
+    pytest.importorskip("cryptography")
+    from utils.security_manager import SecurityManager
+
+    manager = SecurityManager(secret_key="test-secret")
+    manager.rate_limiter = LocalRateLimiter(clock=FakeClock())
+    manager.max_api_requests = 3
+
+    assert [manager.check_api_rate_limit(1, "/api/orders") for _ in range(4)] == [True, True, True, False]
+    assert manager.check_api_rate_limit(1, "/api/staff") and manager.check_api_rate_limit(2, "/api/orders")
+    events = [e for e in manager.security_events if e["event_type"] == "rate_limit_exceeded"]
+    assert len(events) == 1 and events[0]["user_id"] == 1 and "/api/orders" in events[0]["details"]
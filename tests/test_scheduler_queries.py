@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+근태 스케줄러 쿼리 테스트
+직원 수와 관계없이 알림/리포트 작업이 같은 수의 SQL 문만 실행하는지 확인
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+pytest.importorskip("apscheduler")
+pytest.importorskip("schedule")
+
+from models_main import Attendance, User  # noqa: E402
+from scheduler import AttendanceScheduler  # noqa: E402
+
+
+def add_employees(session, count, offset=0):
+    """직원을 만들고, 짝수 번째 직원만 어제 출근(09:10~17:30)과 오늘 출근(퇴근 전) 기록 생성"""
+    today = datetime.combine(date.today(), datetime.min.time())
+    yesterday = today - timedelta(days=1)
+    for n in range(offset, offset + count):
+        user = User(username=f"emp{n}", email=f"emp{n}@example.com", password_hash="x",
+                    role="employee", name=f"직원{n}")
+        session.add(user)
+        session.flush()
+        if n % 2 == 0:
+            session.add(Attendance(user_id=user.id, clock_in=yesterday.replace(hour=9, minute=10),
+                                   clock_out=yesterday.replace(hour=17, minute=30)))
+            session.add(Attendance(user_id=user.id, clock_in=today.replace(hour=8, minute=50)))
+    session.commit()
+
+
+def run_jobs(job_scheduler, count_queries):
+    evening = datetime.combine(date.today(), datetime.min.time()).replace(hour=19)
+    with count_queries() as statements:
+        absent = job_scheduler.check_attendance_alerts(now=evening)
+        not_left = job_scheduler.check_leave_alerts(now=evening)
+        report = job_scheduler.generate_weekly_report_data()
+    return len(statements), absent, not_left, report
+
+
+def test_scheduler_jobs_use_constant_queries(session, count_queries):
+    """직원 수가 늘어도 실행되는 SQL 문 수가 같은지 테스트"""
+    job_scheduler = AttendanceScheduler()
+
+    add_employees(session, 4)
+    small_count, absent, not_left, report = run_jobs(job_scheduler, count_queries)
+
+    add_employees(session, 40, offset=4)
+    large_count, absent_large, not_left_large, report_large = run_jobs(job_scheduler, count_queries)
+
+    assert small_count == large_count == 3
+    assert len(absent) == 2 and len(absent_large) == 22
+    assert len(not_left) == 2 and len(not_left_large) == 22
+    assert len(report_large["users"]) == 22
+
+
+def test_report_aggregates(session):
+    """GROUP BY 리포트가 기록별 계산 결과와 같은지 테스트"""
+    add_employees(session, 2)
+    report = AttendanceScheduler().generate_weekly_report_data()
+
+    # 오늘 기록은 기간(~오늘 0시) 밖이고, 어제 기록 1건만 집계됨
+    assert report["total_records"] == 1
+    assert report["total_hours"] == pytest.approx(8 + 20 / 60)
+    assert report["late_count"] == 1
+    assert report["early_leave_count"] == 1
+    assert report["absent_count"] == 0
+    (user_stats,) = report["users"].values()
+    assert user_stats["name"] == "직원0"
+    assert user_stats["days"] == 1
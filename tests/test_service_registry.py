@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+서비스 레지스트리/시작 프로파일러/preload 테스트
+전역 싱글톤 지연 생성(한 번만, 프록시로 기존 호출부 유지), 공유 서비스 미리 생성,
+모듈 import 자체/누적 시간 기록, 포크 후 작업 스케줄러와 리더 락 정리를 확인
+"""
+
+import importlib
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from core.backend import event_bus as event_bus_module
+from core.backend.event_bus import InProcessEventBus, RedisEventBus
+from core.backend.job_scheduler import FileLeaderLock, JobScheduler, LocalLeaderLock
+from core.backend.service_registry import ServiceRegistry
+from core.backend.startup_profiler import StartupProfiler
+
+
+class Heavy:
+    created = 0
+
+    def __init__(self):
+        Heavy.created += 1
+        time.sleep(0.02)
+        self.value = 1
+
+    def double(self):
+        return self.value * 2
+
+
+def test_lazy_service_created_once_on_first_use():
+    """여러 스레드가 동시에 처음 써도 한 번만 만들고, 프록시가 속성/메서드를 넘기는지 테스트"""
+    Heavy.created = 0
+    registry = ServiceRegistry()
+    service = registry.register("heavy", Heavy)
+    assert Heavy.created == 0 and not registry.is_loaded("heavy")
+    assert "lazy" in repr(service)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(service.double())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [2] * 8 and Heavy.created == 1
+
+    service.value = 5
+    assert registry.get("heavy").value == 5 and service.double() == 10
+    status = registry.status()
+    assert status["registered"] == 1 and status["loaded"] == 1
+    assert status["services"]["heavy"]["init_time"] >= 0.02
+
+    # 생성된 서비스는 다시 등록해도 교체되지 않음
+    registry.register("heavy", lambda: None)
+    assert registry.get("heavy").value == 5
+
+
+def test_failed_factory_retries_and_preload_shared_only():
+    """생성 실패는 다음 사용 때 다시 시도하고, preload는 shared 서비스만 미리 만드는지 테스트"""
+    registry = ServiceRegistry()
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("DB 잠김")
+        return {"ok": True}
+
+    service = registry.register("flaky", flaky)
+    try:
+        service.get("ok")
+        assert False, "첫 생성은 실패해야 함"
+    except RuntimeError:
+        pass
+    assert registry.status()["services"]["flaky"]["error"] == "DB 잠김"
+    assert service.get("ok") is True and len(attempts) == 2
+    assert registry.status()["services"]["flaky"]["error"] is None
+
+    registry.register("models", lambda: "읽기 전용", shared=True)
+    registry.register("threads", lambda: "워커별")
+    assert set(registry.preload()) == {"models"}
+    assert registry.is_loaded("models") and not registry.is_loaded("threads")
+
+    assert registry.reset("models") and not registry.is_loaded("models")
+    assert not registry.reset("없음")
+
+
+def test_startup_profiler_records_import_self_and_cumulative_time(tmp_path):
+    """중첩 import의 자체/누적 시간과 단계 시간이 기록되는지 테스트"""
+    (tmp_path / "sp_child_mod.py").write_text("import time\ntime.sleep(0.05)\n", encoding="utf-8")
+    (tmp_path / "sp_parent_mod.py").write_text(
+        "import time\nimport sp_child_mod\ntime.sleep(0.02)\n", encoding="utf-8")
+    profiler = StartupProfiler()
+    sys.path.insert(0, str(tmp_path))
+    try:
+        profiler.install()
+        with profiler.section("블록"):
+            importlib.import_module("sp_parent_mod")
+        profiler.checkpoint("전체")
+    finally:
+        profiler.uninstall()
+        sys.path.remove(str(tmp_path))
+        sys.modules.pop("sp_parent_mod", None)
+        sys.modules.pop("sp_child_mod", None)
+
+    parent, child = profiler.imports["sp_parent_mod"], profiler.imports["sp_child_mod"]
+    assert child["self"] >= 0.05 and child["depth"] == 1
+    assert parent["cumulative"] >= parent["self"] + child["cumulative"] - 0.001
+    assert 0.02 <= parent["self"] < 0.05
+    # 측정 후 원래 로더로 되돌림
+    assert type(sys.modules.get("os").__loader__).__name__ != "_TimedLoader"
+
+    report = profiler.report(top=5)
+    assert [s["name"] for s in report["sections"]] == ["블록", "전체"]
+    assert report["sections"][0]["time"] >= 0.07
+    assert report["imports"][0]["module"] == "sp_child_mod"
+    assert "services" in report and "시작 시간" in profiler.format_report()
+
+
+def test_scheduler_and_leader_lock_after_fork(tmp_path):
+    """포크 후 물려받은 스케줄러 상태를 버리고 다시 시작하며, 자식은 부모의 리더 락을 갖지 않는지 테스트"""
+    calls = []
+    scheduler = JobScheduler(max_workers=1, leader_lock=LocalLeaderLock())
+    scheduler.add_job("tick", lambda: calls.append(1), interval=0.02, initial_delay=0, start=False)
+    # 포크된 자식: 실행 중 표시는 남았지만 타이머 스레드는 없는 상태
+    scheduler._running = True
+    scheduler._jobs["tick"].running = True
+    time.sleep(0.05)
+    assert calls == []
+    try:
+        scheduler.after_fork()
+        deadline = time.time() + 3
+        while not calls and time.time() < deadline:
+            time.sleep(0.01)
+        assert calls and scheduler.status()["running"]
+    finally:
+        scheduler.stop()
+
+    if not hasattr(os, "fork"):
+        return
+    lock = FileLeaderLock(str(tmp_path / "leader.lock"))
+    assert lock.try_acquire()
+    try:
+        pid = os.fork()
+        if pid == 0:  # 자식: 물려받은 핸들을 버리면 부모가 잡은 락은 얻지 못함
+            lock.after_fork()
+            os._exit(0 if lock._file is None and not lock.try_acquire() else 1)
+        _, code = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(code) == 0
+    finally:
+        lock.release()
+
+
+def test_event_bus_delivers_after_fork(monkeypatch):
+    """포크된 워커에서 공용 이벤트 버스가 새 전달 큐/디스패처로 물려받은 구독자에게 계속 전달하는지 테스트"""
+    if not hasattr(os, "fork"):
+        pytest.skip("fork 미지원")
+    fakeredis = pytest.importorskip("fakeredis")
+    bus = InProcessEventBus()
+    redis_bus = RedisEventBus(fakeredis.FakeRedis(), block_ms=50)
+    monkeypatch.setattr(event_bus_module, "_event_bus", bus)
+    received = []
+    bus.subscribe("alerts", received.append)
+    redis_bus.subscribe("alerts", received.append)
+    try:
+        pid = os.fork()
+        if pid == 0:  # 자식: 공용 버스는 register_at_fork 훅이, 그 밖의 버스는 after_fork로 정리
+            code = 1
+            try:
+                redis_bus.after_fork()
+                bus.publish("alerts", {"n": 1})
+                redis_bus.publish("alerts", {"n": 2})
+                deadline = time.time() + 3
+                while len(received) < 2 and time.time() < deadline:
+                    time.sleep(0.01)
+                alive = bus._dispatcher.is_alive() and redis_bus._reader.is_alive()
+                code = 0 if alive and sorted(m.payload["n"] for m in received) == [1, 2] else 2
+            finally:
+                os._exit(code)
+        _, status = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(status) == 0
+        # 부모의 버스는 그대로 동작
+        bus.publish("alerts", {"n": 3})
+        assert bus.flush() and [m.payload["n"] for m in received] == [3]
+    finally:
+        bus.close()
+        redis_bus.close()
+
+
+def test_prepare_for_fork_stops_master_scheduler(tmp_path, monkeypatch):
+    """preload 마스터에서 import 중 시작된 스케줄러를 포크 전에 멈추고 리더 락을 놓는지 테스트"""
+    import gc
+
+    from core.backend import job_scheduler as job_scheduler_module
+    from core.backend import worker_preload
+    from core.backend.service_registry import service_registry
+
+    lock_path = str(tmp_path / "leader.lock")
+    scheduler = JobScheduler(max_workers=1, leader_lock=FileLeaderLock(lock_path))
+    events = []
+    monkeypatch.setattr(job_scheduler_module, "job_scheduler", scheduler)
+    monkeypatch.setattr(service_registry, "preload", lambda shared_only=False: {})
+    monkeypatch.setattr(worker_preload, "_dispose_engine",
+                        lambda: events.append(("dispose", scheduler._running)))
+    monkeypatch.setattr(gc, "freeze", lambda: None, raising=False)
+
+    scheduler.add_job("daily.scan", lambda: None, daily_at="01:00", singleton=True)
+    assert scheduler.leader_lock.try_acquire()  # 마스터가 리더가 된 상태
+    timer = scheduler._thread
+    try:
+        worker_preload.prepare_for_fork()
+        assert events == [("dispose", False)]  # 연결 정리 전에 멈춤
+        assert not scheduler._running and not timer.is_alive()
+        assert scheduler.has_job("daily.scan")
+        other = FileLeaderLock(lock_path)
+        assert other.try_acquire()  # 워커가 리더 락을 잡을 수 있음
+        other.release()
+
+        scheduler.after_fork()  # 워커에서는 등록된 작업으로 다시 시작
+        assert scheduler._running
+    finally:
+        scheduler.stop()
+
+
+def test_app_background_services_and_startup_profile(client):
+    """app의 백그라운드 서비스 시작이 프로세스당 한 번이고, 시작 비용 API가 응답하는지 테스트"""
+    import app as app_module
+    from core.backend.service_registry import service_registry
+
+    assert app_module._background_services_pid == os.getpid()
+    app_module.start_background_services()  # 같은 프로세스에서는 다시 시작하지 않음
+
+    # import 시점에 만들던 싱글톤이 등록만 되어 있음
+    assert service_registry.has("ai.retrain_service")
+    response = client.get("/api/admin/startup-profile?top=5")
+    assert response.status_code == 200
+    data = response.get_json()
+    assert "sections" in data and "services" in data
+    assert "ai.retrain_service" in data["services"]["services"]
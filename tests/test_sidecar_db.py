@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+사이드카 SQLite 접근 계층 테스트
+스레드별 연결 재사용, 쓰기 트랜잭션, 일괄 저장, 읽기/쓰기 동시 실행,
+스레드 종료/포크 시 연결 정리 확인
+"""
+
+import gc
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from core.backend.sidecar_db import SidecarDB, get_sidecar_db
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SidecarDB(tmp_path / "sidecar.db")
+    db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    yield db
+    db.close()
+
+
+def test_connection_reused_per_thread(db):
+    """같은 스레드는 같은 연결을, 다른 스레드는 다른 연결을 쓰는지 테스트"""
+    with db.read() as first, db.read() as second:
+        assert first is second
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(db._connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not first
+    assert db.query_one("PRAGMA journal_mode")["journal_mode"] == "wal"
+
+
+def test_write_rolls_back_on_error(db):
+    """쓰기 블록 예외 시 롤백되는지 테스트"""
+    with pytest.raises(ValueError):
+        with db.write() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+            raise ValueError("boom")
+    assert db.query("SELECT * FROM items") == []
+
+    with db.write() as conn:
+        conn.execute("INSERT INTO items (name) VALUES ('b')")
+        with db.write() as inner:
+            inner.execute("INSERT INTO items (name) VALUES ('c')")
+    assert [r["name"] for r in db.query("SELECT name FROM items ORDER BY id")] == ["b", "c"]
+
+
+def test_executemany_batches(db):
+    """executemany 일괄 저장 테스트"""
+    saved = db.executemany("INSERT INTO items (name) VALUES (?)",
+                           ((f"n{i}",) for i in range(1234)), batch_size=500)
+    assert saved == 1234
+    assert db.query_one("SELECT COUNT(*) AS cnt FROM items")["cnt"] == 1234
+
+
+def test_reads_not_blocked_by_open_write(db):
+    """쓰기 트랜잭션이 열려 있어도 다른 스레드의 읽기가 진행되는지 테스트"""
+    db.execute("INSERT INTO items (name) VALUES ('committed')")
+    write_open = threading.Event()
+    release = threading.Event()
+
+    def writer():
+        with db.write() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('pending')")
+            write_open.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        assert write_open.wait(5)
+        rows = db.query("SELECT name FROM items")
+        assert [r["name"] for r in rows] == ["committed"]
+    finally:
+        release.set()
+        thread.join()
+    assert db.query_one("SELECT COUNT(*) AS cnt FROM items")["cnt"] == 2
+
+
+def test_registry_shares_instance_per_file(tmp_path):
+    """같은 파일 경로는 같은 SidecarDB를 반환하는지 테스트"""
+    path = tmp_path / "shared.db"
+    assert get_sidecar_db(path) is get_sidecar_db(str(path))
+    assert get_sidecar_db(path) is not get_sidecar_db(tmp_path / "other.db")
+
+
+def test_connection_closed_when_thread_exits(db):
+    """요청/작업 스레드가 끝나면 그 스레드의 연결이 닫히고 풀에서 빠지는지 테스트"""
+    db.query("SELECT 1")
+    opened = []
+
+    def work():
+        db.execute("INSERT INTO items (name) VALUES ('a')")
+        opened.append(db._connection())
+
+    threads = [threading.Thread(target=work) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+        thread.join()
+    gc.collect()
+
+    assert len(db._connections) == 1  # 살아 있는 현재 스레드 연결만 남음
+    with pytest.raises(sqlite3.ProgrammingError):
+        opened[0].execute("SELECT 1")
+    assert db.query_one("SELECT COUNT(*) AS n FROM items")["n"] == 20
+
+
+def test_forked_child_opens_new_connection(db):
+    """포크된 자식은 물려받은 연결을 쓰지 않고 새로 열어 쓰는지 테스트"""
+    if not hasattr(os, "fork"):
+        pytest.skip("fork 미지원")
+    parent_conn = db._connection()
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            fresh = db._connection() is not parent_conn and db._connections == [db._connection()]
+            db.execute("INSERT INTO items (name) VALUES ('child')")
+            code = 0 if fresh else 2
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+    assert db._connection() is parent_conn
+    assert [row["name"] for row in db.query("SELECT name FROM items")] == ["child"]
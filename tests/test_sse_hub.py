@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+SSE 브로드캐스트 허브 테스트
+동시에 열린 많은 SSE 리더가 모든 이벤트를 순서대로 받는지, Last-Event-ID 이어 받기,
+느린 구독자 링 버퍼 제한과 resync, heartbeat/연결 해제를 확인
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from core.backend.event_bus import InProcessEventBus
+from core.backend.sse_hub import SSEHub, format_event
+
+
+def parse(chunk):
+    """SSE 청크에서 (id, data) 목록 추출"""
+    events = []
+    for frame in chunk.split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in frame.split("\n") if ": " in line and not line.startswith(":"))
+        if "data" in fields:
+            events.append((fields.get("id"), json.loads(fields["data"])))
+    return events
+
+
+def make_hub(**kwargs):
+    return SSEHub("test", event_bus=InProcessEventBus(), **kwargs)
+
+
+def test_every_concurrent_reader_gets_every_event():
+    """동시에 열린 SSE 리더 모두가 모든 이벤트를 순서대로 받는지 테스트"""
+    hub = make_hub(subscriber_buffer=1000)
+    readers, events = 200, 300
+    received = [[] for _ in range(readers)]
+    streams = [hub.stream(hub.subscribe(), heartbeat=0.05) for _ in range(readers)]
+    assert hub.subscriber_count() == readers
+
+    def read(index):
+        stream = streams[index]
+        for chunk in stream:
+            received[index].extend(data["n"] for _, data in parse(chunk) if "n" in data)
+            if len(received[index]) >= events:
+                break
+        stream.close()
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    for n in range(events):
+        hub.publish({"type": "dashboard_update", "n": n})
+    hub.event_bus.flush()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert all(r == list(range(events)) for r in received)
+    stats = hub.get_stats()
+    assert stats["published"] == events and stats["fanned_out"] == readers * events
+    assert stats["dropped"] == 0 and stats["subscribers"] == 0  # 닫힌 스트림은 구독 해제
+
+
+def test_last_event_id_resume_from_history_and_bus():
+    """Last-Event-ID 이후 이벤트를 허브 이력에서, 이력이 모자라면 버스 이력에서 재전송하는지 테스트"""
+    hub = make_hub(history_size=3)
+    hub.subscribe()  # 버스 구독 시작
+    ids = [hub.publish({"n": n}) for n in range(6)]
+    hub.event_bus.flush()
+
+    # 허브 이력(최근 3개) 안의 시점부터 이어 받기
+    subscriber = hub.subscribe(last_event_id=ids[3])
+    assert [data["n"] for _, data in parse("".join(subscriber.drain()[0]))] == [4, 5]
+
+    # 이력보다 오래된 시점이면 버스 replay 사용, 이후 새 이벤트도 이어서 받음
+    subscriber = hub.subscribe(last_event_id=ids[0])
+    hub.publish({"n": 6})
+    hub.event_bus.flush()
+    replayed = parse("".join(subscriber.drain()[0]))
+    assert [data["n"] for _, data in replayed] == [1, 2, 3, 4, 5, 6]
+    assert replayed[0][0] == ids[1]
+
+    # 잘못된 ID는 재전송 없이 새 구독
+    assert hub.subscribe(last_event_id="abc").drain() == ([], 0)
+
+
+def test_slow_subscriber_ring_buffer_and_resync():
+    """느린 구독자는 버퍼 크기만큼만 보관하고, 버려진 이벤트가 있으면 resync를 받는지 테스트"""
+    hub = make_hub(subscriber_buffer=5)
+    slow = hub.subscribe()
+    fast = hub.subscribe()
+    stream = hub.stream(slow, heartbeat=0.05)
+    assert next(stream).startswith("retry:")
+
+    for n in range(20):
+        hub.publish({"n": n})
+    hub.event_bus.flush()
+    assert len(slow.frames) == 5
+
+    resync = parse(next(stream))
+    assert resync == [(None, {"type": "resync", "dropped": 15})]
+    assert [data["n"] for _, data in parse(next(stream))] == list(range(15, 20))
+    assert hub.get_stats()["resyncs"] == 1
+    assert len(fast.frames) == 5  # 다른 구독자와 독립
+    stream.close()
+    assert hub.subscriber_count() == 1
+
+
+def test_heartbeat_initial_frames_and_close():
+    """이벤트가 없으면 heartbeat, 초기 프레임 먼저 전송, close_all로 스트림 종료를 테스트"""
+    hub = make_hub()
+    initial = [format_event({"type": "connected"})]
+    stream = hub.stream(hub.subscribe(), initial, heartbeat=0.02)
+    assert next(stream).startswith("retry:")
+    assert parse(next(stream)) == [(None, {"type": "connected"})]
+    start = time.time()
+    assert next(stream) == ": heartbeat\n\n" and time.time() - start >= 0.02
+
+    hub.close_all()
+    assert list(stream) == [] and hub.subscriber_count() == 0
+    assert format_event("a\nb", event_id="1-0") == "id: 1-0\ndata: a\ndata: b\n\n"
+
+
+def test_connect_subscribes_lazily_and_always_cleans_up():
+    """connect는 첫 next에서 구독하므로 시작 전에 닫힌 응답이나 초기 데이터 오류에도 구독자가 남지 않는지 테스트"""
+    hub = make_hub()
+    unstarted = hub.connect()
+    unstarted.close()
+    assert hub.subscriber_count() == 0
+
+    seen = []
+
+    def initial(subscriber):
+        seen.append(subscriber)
+        return [format_event({"type": "connected"})]
+
+    stream = hub.connect(initial=initial, heartbeat=0.02)
+    assert next(stream).startswith("retry:") and hub.subscriber_count() == 1
+    assert parse(next(stream)) == [(None, {"type": "connected"})] and len(seen) == 1
+    stream.close()
+    assert hub.subscriber_count() == 0
+
+    def broken(subscriber):
+        raise RuntimeError("초기 데이터 실패")
+
+    with pytest.raises(RuntimeError):
+        next(hub.connect(initial=broken))
+    assert hub.subscriber_count() == 0
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+직원 목록 API 테스트
+직원 수와 관계없이 같은 수의 SQL 문으로 조회하는지, (이름, id) 키셋 페이지네이션이
+빠짐/중복 없이 이어지는지, 검색/상태 필터와 통계가 DB에서 계산되는지 확인
+"""
+
+from datetime import date
+
+import pytest
+
+from api.staff import get_staff_list
+from models_main import Branch, Brand, Contract, HealthCertificate, Staff, User
+
+
+def add_staff(session, count, offset=0):
+    """직원 생성. 짝수 번째는 Staff 프로필 + 계약서 2건 + 보건증 1건, 5의 배수는 대기 상태"""
+    brand = Brand.query.first()
+    if brand is None:
+        brand = Brand(name="테스트 브랜드", code="TB")
+        session.add(brand)
+        session.flush()
+        session.add(Branch(name="강남점", brand_id=brand.id))
+        session.flush()
+    branch = Branch.query.first()
+    for n in range(offset, offset + count):
+        user = User(username=f"staff{n}", email=f"staff{n}@example.com", password_hash="x",
+                    role="employee", name=f"직원{n % 7}", branch_id=branch.id,
+                    status="pending" if n % 5 == 0 else "approved", department="홀")
+        session.add(user)
+        session.flush()
+        if n % 2 == 0:
+            staff = Staff(name=f"직원{n % 7}", position="매니저", join_date=date(2026, 1, 1),
+                          department="주방", your_program_id=branch.id, user_id=user.id)
+            session.add(staff)
+            session.flush()
+            for year in (2025, 2026):
+                session.add(Contract(staff_id=staff.id, contract_number=f"C{n}-{year}",
+                                     start_date=date(year, 1, 1), expiry_date=date(year, 12, 31),
+                                     renewal_date=date(year, 12, 1)))
+            session.add(HealthCertificate(staff_id=staff.id, certificate_number=f"H{n}",
+                                          issue_date=date(2026, 1, 1), expiry_date=date(2027, 1, 1),
+                                          renewal_date=date(2026, 12, 1)))
+    session.commit()
+
+
+@pytest.fixture
+def fetch(app, count_queries):
+    """직원 목록 API를 요청 컨텍스트에서 호출해 (응답 JSON, 실행 SQL 수) 반환"""
+    def fetch(query=""):
+        with app.test_request_context(f"/staff?{query}"):
+            with count_queries() as statements:
+                response = get_staff_list()
+        return response.get_json(), len(statements)
+
+    return fetch
+
+
+def test_staff_list_uses_constant_queries(app, session, fetch):
+    """직원 수가 늘어도 실행되는 SQL 문 수가 같은지 테스트"""
+    add_staff(session, 6)
+    small, small_count = fetch("page_type=management&limit=200")
+    add_staff(session, 60, offset=6)
+    large, large_count = fetch("page_type=management&limit=200")
+
+    assert len(small["staff"]) == 6 and len(large["staff"]) == 66
+    assert small_count == large_count <= 5
+
+    row = next(s for s in large["staff"] if s["username"] == "staff2")
+    assert row["department"] == "주방" and row["branch_name"] == "강남점"
+    assert [c["contract_number"] for c in row["contracts"]] == ["C2-2025", "C2-2026"]
+    assert row["latest_contract"]["contract_number"] == "C2-2026"
+    assert row["latest_health_certificate"]["certificate_number"] == "H2"
+    plain = next(s for s in large["staff"] if s["username"] == "staff1")
+    assert plain["contracts"] == [] and plain["latest_contract"] is None and plain["department"] == "홀"
+
+
+def test_staff_list_keyset_pagination_and_filters(app, session, fetch):
+    """커서로 이어 받은 페이지가 빠짐/중복 없이 (이름, id) 순서인지, 필터와 통계를 테스트"""
+    add_staff(session, 23)
+    pages, cursor = [], None
+    while True:
+        data, _ = fetch("page_type=management&limit=5" + (f"&cursor={cursor}" if cursor else ""))
+        pages.append(data)
+        cursor = data["pagination"]["next_cursor"]
+        if not data["pagination"]["has_more"]:
+            break
+    rows = [s for page in pages for s in page["staff"]]
+    assert len(pages) == 5 and len(rows) == 23
+    names = {u.id: u.name for u in User.query.filter(User.role == "employee")}
+    assert [(names[s["id"]], s["id"]) for s in rows] == sorted((name, uid) for uid, name in names.items())
+    assert "stats" in pages[0] and "stats" not in pages[1]
+
+    stats = pages[0]["stats"]
+    assert stats["total"] == 23 and stats["pending"] == 5 and stats["active"] == 18
+    assert stats["departments"] == {"주방": 12, "홀": 11}
+
+    # 기본(승인된 직원만), 상태, 검색 필터
+    approved, _ = fetch("limit=200")
+    assert len(approved["staff"]) == 18 and approved["stats"]["pending"] == 0
+    pending, _ = fetch("status=pending")
+    assert {s["username"] for s in pending["staff"]} == {"staff0", "staff5", "staff10", "staff15", "staff20"}
+    found, _ = fetch("search=staff17@")
+    assert [s["username"] for s in found["staff"]] == ["staff17"]
+
+    with app.test_request_context("/staff?cursor=not-a-cursor"):
+        response = get_staff_list()
+    assert response[1] == 400
+
+
+def test_staff_list_without_limit_or_cursor_returns_everyone(app, session, fetch):
+    """limit/cursor 없이 호출하는 기존 화면(일정/직원 페이지)은 50명이 넘어도 전체 목록을 받는지 테스트"""
+    add_staff(session, 66)
+    data, count = fetch("page_type=management")
+    assert len(data["staff"]) == 66 and count <= 5
+    assert data["pagination"]["next_cursor"] is None and data["pagination"]["has_more"] is False
+
+    paged, _ = fetch("page_type=management&limit=50")
+    assert len(paged["staff"]) == 50 and paged["pagination"]["has_more"] is True
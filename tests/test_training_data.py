@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+재훈련 학습 데이터 파이프라인 테스트
+일별 특성 테이블의 증분 갱신이 전체 재계산과 같은지, 재훈련 서비스가 SQL 집계로
+학습 데이터를 만들고 다음 실행에서는 새 날짜만 다시 집계하는지 확인
+"""
+
+import tracemalloc
+from datetime import date, datetime, time, timedelta
+
+import pandas as pd
+from sqlalchemy import event
+
+from api.ai_auto_retrain import AIAutoRetrainService
+from models_main import Order, Schedule, User, db
+from utils.training_data import DailySalesFeatureStore, track_resources
+
+
+def full_rolling(amounts):
+    series = pd.Series(amounts, dtype=float)
+    return series.shift(1), series.rolling(7).mean(), series.rolling(30).mean()
+
+
+def test_incremental_refresh_matches_full_recompute(tmp_path):
+    """구간별로 나눠 넣은 결과가 한 번에 계산한 이동평균과 같은지 테스트"""
+    start = date(2026, 1, 1)
+    days = [start + timedelta(days=i) for i in range(90)]
+    amounts = [1000 + (i * 37) % 400 for i in range(90)]
+
+    store = DailySalesFeatureStore(tmp_path / "features.db")
+    assert store.refresh_start(start) == start
+    store.replace_range(days[0], days[59], [(d, a, 3) for d, a in zip(days[:60], amounts[:60])])
+    assert store.last_day() == days[59]
+
+    # 마지막 며칠은 다시 집계 (수정된 값 반영)
+    refresh_from = store.refresh_start(start)
+    assert refresh_from == days[57]
+    amounts[58] = 5000
+    store.replace_range(refresh_from, days[89], [(d.isoformat(), a, 3) for d, a in zip(days[57:], amounts[57:])])
+
+    df = store.frame(days[0], days[89], complete=False)
+    previous, avg7, avg30 = full_rolling(amounts)
+    assert list(df["date"]) == days
+    assert df["sales_amount"].tolist() == amounts
+    assert df["previous_sales"].iloc[1:].tolist() == previous.iloc[1:].tolist()
+    assert (df["sales_7d_avg"].iloc[6:] - avg7.iloc[6:]).abs().max() < 1e-9
+    assert (df["sales_30d_avg"].iloc[29:] - avg30.iloc[29:]).abs().max() < 1e-9
+    assert len(store.frame(days[0], days[89])) == 61
+
+
+def test_retrain_collects_with_sql_aggregation(session, tmp_path):
+    """주문을 SQL로 일별 집계하고, 다음 실행에서는 새 날짜 부근만 다시 읽는지 테스트"""
+    owner = User(username="owner", email="owner@example.com", password_hash="x", role="customer")
+    staff = User(username="staff", email="staff@example.com", password_hash="x", role="employee")
+    session.add_all([owner, staff])
+    session.flush()
+
+    today = datetime.now().date()
+    expected = {}
+    for offset in range(1, 41):
+        day = today - timedelta(days=offset)
+        for n in range(offset % 3 + 1):
+            session.add(Order(item="원두", quantity=1, ordered_by=owner.id, total_cost=1000 * (n + 1),
+                              created_at=datetime.combine(day, time(10 + n))))
+        expected[day] = sum(1000 * (n + 1) for n in range(offset % 3 + 1))
+        session.add(Schedule(user_id=staff.id, date=day, start_time=time(9), end_time=time(18)))
+    session.commit()
+
+    service = AIAutoRetrainService()
+    service.feature_store = DailySalesFeatureStore(tmp_path / "features.db")
+    sales = service._collect_sales_data()
+    assert len(sales) == 40 - 29
+    assert {row.date: row.sales_amount for row in sales.itertuples()} == {
+        d: v for d, v in expected.items() if d in set(sales["date"])
+    }
+    assert list(sales.columns) == ["date", "sales_amount", "order_count", "day_of_week", "month", "season",
+                                   "holiday", "weather", "previous_sales", "sales_7d_avg", "sales_30d_avg"]
+
+    # 다음 실행은 마지막 저장일 앞 며칠부터만 집계
+    session.add(Order(item="우유", quantity=1, ordered_by=owner.id, total_cost=700,
+                      created_at=datetime.combine(today, time(12))))
+    session.commit()
+    bounds = []
+
+    def capture(conn, cursor, statement, parameters, *args):
+        if "orders" in statement and "GROUP BY" in statement:
+            bounds.append(parameters)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        sales = service._collect_sales_data()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+    assert sales["date"].iloc[-1] == today and sales["sales_amount"].iloc[-1] == 700
+    assert any(str(today - timedelta(days=3)) in str(p) for p in bounds)
+
+    customers = service._collect_customer_data()
+    assert customers["total_orders"].tolist() == [sum(d % 3 + 1 for d in range(1, 41)) + 1]
+
+    staff_data = service._collect_staff_data()
+    assert len(staff_data) == 40
+    assert set(staff_data["required_staff"]) == {1}
+    assert staff_data["historical_demand"].sum() == sum(d % 3 + 1 for d in range(1, 41))
+
+    with track_resources() as resources:
+        service._collect_sales_data()
+    assert resources["wall_time"] >= 0 and resources["peak_memory_mb"] >= 0
+
+
+def test_track_resources_traces_allocations_only_on_request():
+    """기본은 tracemalloc 없이 RSS로 측정하고, 요청할 때만 할당 추적을 켜는지 테스트"""
+    assert not tracemalloc.is_tracing()
+    with track_resources() as resources:
+        assert not tracemalloc.is_tracing()
+        data = bytearray(8 * 1024 * 1024)
+    assert resources["max_rss_mb"] > 0 and resources["peak_memory_mb"] >= 0
+    assert "traced_peak_mb" not in resources
+
+    with track_resources(trace_allocations=True) as resources:
+        assert tracemalloc.is_tracing()
+        data = bytearray(8 * 1024 * 1024)
+    del data
+    assert not tracemalloc.is_tracing()
+    assert resources["traced_peak_mb"] >= 8
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+WebSocket 브로드캐스터 테스트
+사용자/토픽 인덱스, 클라이언트별 전송 큐, 느린 클라이언트 처리 정책,
+토큰으로 확인한 신원으로만 brand/branch/role/user 토픽에 들어가는지 확인
+"""
+
+import asyncio
+import datetime
+import json
+
+import pytest
+
+pytest.importorskip("websockets")
+
+import jwt  # noqa: E402
+
+from api import websocket_server  # noqa: E402
+from api.websocket_server import (  # noqa: E402
+    SLOW_CONSUMER_DISCONNECT,
+    SLOW_CONSUMER_DROP_OLDEST,
+    WebSocketManager,
+    handle_message,
+)
+from models_main import User  # noqa: E402
+from utils.principal_cache import principal_cache  # noqa: E402
+
+
+class FakeSocket:
+    """전송된 메시지를 기록하는 테스트용 연결 (block=True면 send가 풀어줄 때까지 대기)"""
+
+    def __init__(self, block: bool = False):
+        self.sent = []
+        self.closed = None
+        self.release = asyncio.Event()
+        if not block:
+            self.release.set()
+
+    async def send(self, message):
+        await self.release.wait()
+        self.sent.append(json.loads(message))
+
+    async def close(self, code=1000, reason=""):
+        self.closed = code
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_user_and_topic_routing():
+    """사용자 인덱스와 brand/branch/role 토픽으로만 전달되는지 테스트"""
+    async def scenario():
+        manager = WebSocketManager()
+        a, b, c = FakeSocket(), FakeSocket(), FakeSocket()
+        for ws in (a, b, c):
+            await manager.register(ws)
+        manager.authenticate(a, user_id="u1", role="admin", brand_id=1, branch_id=10)
+        manager.authenticate(b, user_id="u1", role="staff", brand_id=1, branch_id=11)
+        manager.authenticate(c, user_id="u2", role="staff", brand_id=2, branch_id=20)
+
+        assert await manager.send_to_user("u1", {"type": "direct"}) == 2
+        assert await manager.publish("branch:11", {"type": "branch"}) == 1
+        assert await manager.publish("role:staff", {"type": "role"}) == 2
+        assert await manager.publish("brand:9", {"type": "none"}) == 0
+        await settle()
+
+        assert [m["type"] for m in a.sent] == ["direct"]
+        assert [m["type"] for m in b.sent] == ["direct", "branch", "role"]
+        assert [m["type"] for m in c.sent] == ["role"]
+
+        # 재인증 시 이전 매장 토픽에서 빠짐
+        manager.authenticate(b, user_id="u1", role="staff", brand_id=1, branch_id=12)
+        assert "branch:11" not in manager.topic_index
+
+        await manager.unregister(a)
+        await manager.unregister(b)
+        assert "u1" not in manager.user_index
+        assert manager.get_stats()["active_connections"] == 1
+        await manager.unregister(c)
+
+    asyncio.run(scenario())
+
+
+def test_blocked_client_does_not_delay_others():
+    """한 클라이언트 전송이 막혀도 다른 클라이언트는 메시지를 받는지 테스트"""
+    async def scenario():
+        manager = WebSocketManager(send_queue_size=3, slow_consumer_policy=SLOW_CONSUMER_DROP_OLDEST)
+        stuck, ok = FakeSocket(block=True), FakeSocket()
+        await manager.register(stuck)
+        await manager.register(ok)
+
+        for n in range(6):
+            await manager.broadcast({"type": "tick", "seq": n})
+            await settle()
+
+        assert [m["seq"] for m in ok.sent] == list(range(6))
+        # 막힌 클라이언트: 전송 중 1건 + 큐에는 최신 3건만 유지
+        stuck.release.set()
+        await settle()
+        assert [m["seq"] for m in stuck.sent] == [0, 3, 4, 5]
+        assert manager.get_stats()["messages_dropped"] == 2
+
+        await manager.unregister(stuck)
+        await manager.unregister(ok)
+
+    asyncio.run(scenario())
+
+
+def test_disconnect_policy_and_stalled_sender():
+    """큐 초과 시 연결 종료 정책과 전송 시간 초과 연결 정리 테스트"""
+    async def scenario():
+        manager = WebSocketManager(send_queue_size=1, slow_consumer_policy=SLOW_CONSUMER_DISCONNECT,
+                                   send_timeout=0.05)
+        overflow, stalled = FakeSocket(block=True), FakeSocket(block=True)
+        await manager.register(overflow)
+        await manager.broadcast({"type": "tick"})
+        await settle()
+        await manager.broadcast({"type": "tick"})
+        await manager.broadcast({"type": "tick"})
+        await settle()
+        assert overflow.closed == 1013
+        assert overflow not in manager.clients
+
+        await manager.register(stalled)
+        await manager.send(stalled, {"type": "tick"})
+        await asyncio.sleep(0.2)
+        assert stalled.closed == 1013
+        assert manager.get_stats()["slow_disconnects"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_auth_uses_verified_identity_and_guards_reserved_topics(app, session, monkeypatch):
+    """auth는 토큰으로 확인한 DB 신원으로만 토픽을 붙이고, 예약 토픽은 자기 것만 구독할 수 있는지 테스트"""
+    principal_cache.clear()
+    manager_user = User(username="ws_mgr", email="ws_mgr@example.com", password_hash="x",
+                        role="manager", status="approved", brand_id=2, branch_id=3)
+    pending = User(username="ws_new", email="ws_new@example.com", password_hash="x",
+                   role="employee", status="pending", brand_id=2, branch_id=3)
+    session.add_all([manager_user, pending])
+    session.commit()
+
+    def token_for(user_id, secret=None):
+        payload = {"user_id": user_id, "exp": datetime.datetime.utcnow() + datetime.timedelta(hours=1)}
+        return jwt.encode(payload, secret or app.config["JWT_SECRET_KEY"], algorithm="HS256")
+
+    async def scenario():
+        manager = WebSocketManager()
+        monkeypatch.setattr(websocket_server, "ws_manager", manager)
+        ws = FakeSocket()
+        await manager.register(ws)
+
+        async def request(message):
+            await handle_message(ws, message)
+            await settle()
+            return ws.sent[-1]
+
+        # 토큰 없이 보낸 role/brand/branch는 무시, 예약 토픽 구독도 거부
+        reply = await request({"type": "auth", "user_id": 1, "role": "admin", "brand_id": 9, "branch_id": 9})
+        assert reply["type"] == "auth_failed" and manager.topic_index == {}
+        for topic in ("role:admin", "brand:9", "branch:9", "user:1"):
+            assert (await request({"type": "subscribe", "topic": topic}))["type"] == "error"
+        assert (await request({"type": "subscribe", "topic": "notices"}))["type"] == "subscribe_success"
+        assert (await request({"type": "auth", "token": token_for(manager_user.id, "wrong")}))["type"] == "auth_failed"
+        assert (await request({"type": "auth", "token": token_for(pending.id)}))["type"] == "auth_failed"
+
+        # 검증된 토큰: 클라이언트가 보낸 값이 아니라 DB의 역할/브랜드/매장으로 토픽 구독
+        reply = await request({"type": "auth", "token": token_for(manager_user.id), "role": "admin", "branch_id": 9})
+        assert reply == {"type": "auth_success", "message": "인증 성공", "user_id": manager_user.id}
+        assert set(manager.connections[ws].topics) == {"notices", "brand:2", "branch:3", "role:manager"}
+        assert (await request({"type": "subscribe", "topic": "branch:4"}))["type"] == "error"
+        assert (await request({"type": "subscribe", "topic": "role:admin"}))["type"] == "error"
+        assert (await request({"type": "subscribe", "topic": f"user:{manager_user.id}"}))["type"] == "subscribe_success"
+        assert await manager.send_to_user(manager_user.id, {"type": "direct"}) == 1
+
+        # 잘못된 토큰으로 다시 인증하면 이전 신원과 예약 토픽이 해제됨
+        assert (await request({"type": "auth", "token": "garbage"}))["type"] == "auth_failed"
+        assert manager.connections[ws].topics == {"notices"} and manager.user_index == {}
+        await manager.unregister(ws)
+
+    asyncio.run(scenario())
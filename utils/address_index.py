@@ -0,0 +1,275 @@
+"""
+주소 트라이그램 색인
+주소 중복 체크/자동완성에서 후보 주소를 전체 스캔 없이 찾기 위한 색인.
+PostgreSQL에 pg_trgm 확장이 있으면 GIN 트라이그램 인덱스로 후보를 뽑고,
+그 외(SQLite 등)에는 프로세스 안의 트라이그램 역색인을 사용한다.
+후보 점수는 트라이그램 겹침으로만 매기고, 정확한 유사도는 호출하는 쪽에서 상위 후보에만 계산한다.
+"""
+
+import heapq
+import logging
+import math
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, func, inspect, text
+from sqlalchemy.orm import Session, object_session
+
+logger = logging.getLogger(__name__)
+
+# 세션에 쌓아 두었다가 커밋 후 색인에 반영할 변경 목록 키
+PENDING_CHANGES_KEY = "address_index_changes"
+
+
+class AddressTrigramIndex:
+    """
+    프로세스 내 트라이그램 역색인 (엔티티 종류별)
+    트라이그램 -> 엔티티 ID 집합을 유지하고, 검색 시 가장 드문 트라이그램부터 훑어
+    (prefix filtering) 최소 겹침 조건을 만족할 수 있는 후보만 모은다.
+    """
+
+    def __init__(self, normalizer: Callable[[str], str],
+                 keyword_extractor: Callable[[str], List[str]]):
+        self.normalizer = normalizer
+        self.keyword_extractor = keyword_extractor
+        self._postings: Dict[str, Dict[str, set]] = defaultdict(lambda: defaultdict(set))
+        self._documents: Dict[str, Dict[int, Tuple[str, frozenset]]] = defaultdict(dict)
+        self._lock = threading.RLock()
+
+    def trigrams(self, address: str) -> frozenset:
+        """정규화된 주소의 키워드별 트라이그램 (pg_trgm처럼 단어 앞 2칸/뒤 1칸 패딩)"""
+        normalized = self.normalizer(address or "").lower()
+        words = self.keyword_extractor(normalized) or normalized.split()
+        grams = set()
+        for word in words:
+            padded = f"  {word} "
+            grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+        return frozenset(grams)
+
+    def add(self, kind: str, entity_id: int, address: Optional[str]):
+        """주소 추가/갱신 (주소가 비면 제거)"""
+        with self._lock:
+            self.remove(kind, entity_id)
+            if not address:
+                return
+            grams = self.trigrams(address)
+            self._documents[kind][entity_id] = (address, grams)
+            postings = self._postings[kind]
+            for gram in grams:
+                postings[gram].add(entity_id)
+
+    def remove(self, kind: str, entity_id: int):
+        with self._lock:
+            document = self._documents[kind].pop(entity_id, None)
+            if document is None:
+                return
+            postings = self._postings[kind]
+            for gram in document[1]:
+                ids = postings.get(gram)
+                if ids is not None:
+                    ids.discard(entity_id)
+                    if not ids:
+                        del postings[gram]
+
+    def load(self, kind: str, rows: Iterable[Tuple[int, Optional[str]]]):
+        """(id, 주소) 목록으로 해당 종류 색인을 새로 구성"""
+        documents = {}
+        postings = defaultdict(set)
+        for entity_id, address in rows:
+            if not address:
+                continue
+            grams = self.trigrams(address)
+            documents[entity_id] = (address, grams)
+            for gram in grams:
+                postings[gram].add(entity_id)
+        with self._lock:
+            self._documents[kind] = documents
+            self._postings[kind] = postings
+
+    def size(self, kind: str) -> int:
+        return len(self._documents.get(kind, {}))
+
+    def search(self, query: str, kind: str, limit: int = 50, min_coverage: float = 0.5,
+               exclude_id: Optional[int] = None) -> List[Tuple[int, str, float]]:
+        """
+        질의 트라이그램의 min_coverage 이상을 포함하는 주소 중 겹침이 큰 상위 limit개
+        Returns:
+            [(엔티티 ID, 주소, 겹침 점수)] - 점수는 Dice 계수
+        """
+        query_grams = self.trigrams(query)
+        if not query_grams:
+            return []
+
+        with self._lock:
+            postings = self._postings.get(kind, {})
+            documents = self._documents.get(kind, {})
+
+            # 겹침이 required 이상인 문서는 드문 순으로 고른 (n - required + 1)개 중 하나는 반드시 포함
+            required = max(1, math.ceil(min_coverage * len(query_grams)))
+            ordered = sorted(query_grams, key=lambda gram: len(postings.get(gram, ())))
+            candidates = set()
+            for gram in ordered[:len(ordered) - required + 1]:
+                candidates.update(postings.get(gram, ()))
+            candidates.discard(exclude_id)
+
+            scored = []
+            for entity_id in candidates:
+                address, grams = documents[entity_id]
+                overlap = len(query_grams & grams)
+                if overlap >= required:
+                    scored.append((2 * overlap / (len(query_grams) + len(grams)), entity_id, address))
+
+        return [(entity_id, address, score)
+                for score, entity_id, address in heapq.nlargest(limit, scored)]
+
+
+class AddressIndexService:
+    """
+    엔티티 종류별 주소 후보 검색 서비스
+    - PostgreSQL + pg_trgm: `address % :query` (GIN 트라이그램 인덱스) 로 후보 조회
+    - 그 외: 종류별로 처음 쓸 때 주소 컬럼을 한 번 읽어 AddressTrigramIndex 구성,
+      이후에는 모델 이벤트로 커밋된 변경만 반영 (다른 프로세스 변경은 refresh_interval마다 재적재)
+    """
+
+    def __init__(self, db, entities: Dict[str, type], normalizer: Callable[[str], str],
+                 keyword_extractor: Callable[[str], List[str]], refresh_interval: float = 600.0):
+        self.db = db
+        self.entities = dict(entities)
+        self.index = AddressTrigramIndex(normalizer, keyword_extractor)
+        self.refresh_interval = refresh_interval
+        self._loaded_at: Dict[str, float] = {}
+        self._load_lock = threading.Lock()
+        self._pg_trgm: Optional[bool] = None
+        self._events_registered = False
+
+    # ==================== 모델 이벤트 ====================
+
+    def register_events(self):
+        """주소 컬럼 변경을 세션에 기록하고 커밋 후 색인에 반영하도록 이벤트 등록"""
+        if self._events_registered:
+            return
+        for kind, model in self.entities.items():
+            event.listen(model, "after_insert", self._make_listener(kind, "upsert"))
+            event.listen(model, "after_update", self._make_listener(kind, "update"))
+            event.listen(model, "after_delete", self._make_listener(kind, "delete"))
+        event.listen(Session, "after_commit", self._apply_pending)
+        event.listen(Session, "after_rollback", self._discard_pending)
+        self._events_registered = True
+
+    def _make_listener(self, kind: str, operation: str):
+        def listener(mapper, connection, target):
+            if operation == "update" and not inspect(target).attrs.address.history.has_changes():
+                return
+            session = object_session(target)
+            if session is None:
+                return
+            address = None if operation == "delete" else target.address
+            session.info.setdefault(PENDING_CHANGES_KEY, []).append((kind, target.id, address))
+        return listener
+
+    def _apply_pending(self, session):
+        changes = session.info.pop(PENDING_CHANGES_KEY, None)
+        if not changes:
+            return
+        for kind, entity_id, address in changes:
+            # 아직 적재하지 않은 종류는 처음 검색할 때 DB에서 읽으므로 건너뜀
+            if kind in self._loaded_at:
+                self.index.add(kind, entity_id, address)
+
+    def _discard_pending(self, session):
+        session.info.pop(PENDING_CHANGES_KEY, None)
+
+    # ==================== 검색 ====================
+
+    def candidates(self, query: str, kinds: Iterable[str], limit: int = 50,
+                   min_coverage: float = 0.5, exclude_id: Optional[int] = None
+                   ) -> List[Tuple[str, int, str]]:
+        """
+        종류별 상위 limit개 후보 [(종류, 엔티티 ID, 주소)]
+        exclude_id는 단일 종류 검색(중복 체크)에서 자기 자신을 빼기 위한 값
+        """
+        results = []
+        for kind in kinds:
+            if kind not in self.entities:
+                continue
+            if self._use_pg_trgm():
+                rows = self._pg_candidates(kind, query, limit, min_coverage, exclude_id)
+            else:
+                self.ensure_loaded(kind)
+                rows = self.index.search(query, kind, limit, min_coverage, exclude_id)
+            results.extend((kind, entity_id, address) for entity_id, address, _ in rows)
+        return results
+
+    def ensure_loaded(self, kind: str, force: bool = False):
+        """종류별 인메모리 색인 적재 (없거나 오래됐으면 주소 컬럼 한 번 조회)"""
+        loaded_at = self._loaded_at.get(kind)
+        if not force and loaded_at and time.time() - loaded_at < self.refresh_interval:
+            return
+        with self._load_lock:
+            loaded_at = self._loaded_at.get(kind)
+            if not force and loaded_at and time.time() - loaded_at < self.refresh_interval:
+                return
+            model = self.entities[kind]
+            started = time.time()
+            rows = (
+                self.db.session.query(model.id, model.address)
+                .filter(model.address.isnot(None))
+                .all()
+            )
+            self.index.load(kind, rows)
+            self._loaded_at[kind] = time.time()
+            logger.info(f"주소 색인 적재: {kind} {len(rows)}건 ({time.time() - started:.2f}초)")
+
+    def invalidate(self, kind: Optional[str] = None):
+        """다음 검색 때 다시 적재하도록 표시"""
+        if kind is None:
+            self._loaded_at.clear()
+        else:
+            self._loaded_at.pop(kind, None)
+
+    # ==================== PostgreSQL pg_trgm ====================
+
+    def _use_pg_trgm(self) -> bool:
+        if self._pg_trgm is None:
+            try:
+                engine = self.db.engine
+                self._pg_trgm = engine.dialect.name == "postgresql" and bool(
+                    self.db.session.execute(
+                        text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                    ).scalar()
+                )
+            except Exception as e:
+                logger.warning(f"pg_trgm 확인 실패, 인메모리 색인 사용: {e}")
+                self._pg_trgm = False
+        return self._pg_trgm
+
+    def ensure_pg_indexes(self) -> bool:
+        """pg_trgm 확장과 주소 컬럼 GIN 트라이그램 인덱스 생성 (PostgreSQL 전용)"""
+        if self.db.engine.dialect.name != "postgresql":
+            return False
+        self.db.session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for model in self.entities.values():
+            table = model.__table__.name
+            self.db.session.execute(text(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_address_trgm "
+                f"ON {table} USING gin (address gin_trgm_ops)"
+            ))
+        self.db.session.commit()
+        self._pg_trgm = None
+        return True
+
+    def _pg_candidates(self, kind: str, query: str, limit: int, min_coverage: float,
+                       exclude_id: Optional[int]) -> List[Tuple[int, str, float]]:
+        model = self.entities[kind]
+        # % 연산자의 임계값 (pg_trgm similarity는 합집합 기준이라 coverage보다 낮게 잡음)
+        self.db.session.execute(text("SELECT set_limit(:threshold)"),
+                                {"threshold": min_coverage / 2})
+        similarity = func.similarity(model.address, query)
+        q = self.db.session.query(model.id, model.address, similarity).filter(
+            model.address.op("%")(query)
+        )
+        if exclude_id:
+            q = q.filter(model.id != exclude_id)
+        return [tuple(row) for row in q.order_by(similarity.desc()).limit(limit).all()]
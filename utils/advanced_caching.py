@@ -1,14 +1,18 @@
 import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from functools import wraps
-from typing import Any, Optional, Dict, List, Callable
+from typing import Any, Optional, Dict, List, Callable, Iterable, Set, Union
 from datetime import datetime
 import logging
 import hashlib
 import pickle
 import json
+import sqlite3
 import os
+import weakref
 from typing import Optional
-from flask import request
+from flask import request, current_app, has_app_context
 args = None  # pyright: ignore
 config = None  # pyright: ignore
 #!/usr/bin/env python3
@@ -49,32 +53,114 @@ class CacheStrategy:
     READ_THROUGH = "read_through"       # 캐시 미스 시 자동 로드
 
 
+def _new_stats() -> Dict[str, Dict[str, int]]:
+    """레벨별 통계 카운터 생성"""
+    return {
+        'hits': {'l1': 0, 'l2': 0, 'l3': 0},
+        'misses': {'l1': 0, 'l2': 0, 'l3': 0},
+        'writes': {'l1': 0, 'l2': 0, 'l3': 0},
+        'evictions': {'l1': 0, 'l2': 0, 'l3': 0},
+        # get_or_load 경로 통계
+        'read_through': {'hits': 0, 'stale_served': 0, 'coalesced_waiters': 0, 'loads': 0}
+    }
+
+
+class _CacheShard:
+    """L1 메모리 캐시 샤드
+
+    샤드마다 자체 락과 통계를 가지므로 서로 다른 키의 조회가 경합하지 않는다.
+    """
+
+    __slots__ = ('lock', 'data', 'stats')
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.lock = threading.Lock()
+        self.data = TTLCache(maxsize=maxsize, ttl=ttl) if CACHETOOLS_AVAILABLE else None
+        self.stats = _new_stats()
+
+
+class _InFlightLoad:
+    """진행 중인 캐시 미스 로드 (동일 키 동시 미스 병합용)"""
+
+    __slots__ = ('event', 'value', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class _StaleEntry:
+    """stale-while-revalidate 모드로 저장되는 값 (신선 기한 포함)"""
+
+    __slots__ = ('value', 'fresh_until')
+
+    def __init__(self, value: Any, fresh_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+
+    def __getstate__(self):
+        return (self.value, self.fresh_until)
+
+    def __setstate__(self, state):
+        self.value, self.fresh_until = state
+
+
+# 태그 무효화 대상이 되는 살아있는 캐시 인스턴스
+_cache_instances: "weakref.WeakSet[AdvancedCache]" = weakref.WeakSet()
+
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+_refresh_executor_lock = threading.Lock()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    """백그라운드 재계산용 공용 실행기"""
+    global _refresh_executor
+    if _refresh_executor is None:
+        with _refresh_executor_lock:
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="cache-refresh"
+                )
+    return _refresh_executor
+
+
 class AdvancedCache:
-    """고급 캐싱 시스템"""
+    """고급 캐싱 시스템
+
+    L1 조회는 키 해시로 선택한 샤드 락만 잡고, L2(Redis)/L3(파일) I/O는
+    어떤 락도 잡지 않은 상태에서 수행한다.
+    """
 
     def __init__(self,  config: Optional[Dict[str,  Any]] = None):
         self.config = config or {}
         self.l1_cache = None
         self.l2_cache = None
         self.l3_cache = None
-        self.stats = {
-            'hits': {'l1': 0, 'l2': 0, 'l3': 0},
-            'misses': {'l1': 0, 'l2': 0, 'l3': 0},
-            'writes': {'l1': 0, 'l2': 0, 'l3': 0},
-            'evictions': {'l1': 0, 'l2': 0, 'l3': 0}
-        }
+        # 구조 변경(clear, 통계 초기화)에만 사용하는 락 - 조회/저장 경로에서는 사용하지 않음
         self.lock = threading.RLock()
+        self._shards: List[_CacheShard] = []
+        self._inflight: Dict[str, _InFlightLoad] = {}
+        self._inflight_lock = threading.Lock()
+        # 태그 역색인 (태그 -> 캐시 키, 캐시 키 -> (태그, 만료 시각))
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, tuple] = {}
+        self._tag_lock = threading.Lock()
 
         self._initialize_caches()
+        _cache_instances.add(self)
 
     def _initialize_caches(self):
         """캐시 초기화"""
-        # L1 캐시 (메모리)
+        # L1 캐시 (메모리, 샤드 분할)
+        shard_count = max(1, int(self.config.get('l1_shards', 16)))
+        maxsize = self.config.get('l1_maxsize', 1000)
+        ttl = self.config.get('l1_ttl', 300)  # 5분
+        shard_maxsize = max(1, maxsize // shard_count)
+        self._shards = [_CacheShard(shard_maxsize, ttl) for _ in range(shard_count)]
         if CACHETOOLS_AVAILABLE and 'TTLCache' in globals():
-            maxsize = self.config.get('l1_maxsize', 1000)
-            ttl = self.config.get('l1_ttl', 300)  # 5분
-            self.l1_cache = TTLCache(maxsize=maxsize, ttl=ttl)
-            logger.info(f"L1 캐시 초기화: maxsize={maxsize}, ttl={ttl}s")
+            self.l1_cache = self._shards
+            logger.info(f"L1 캐시 초기화: maxsize={maxsize}, ttl={ttl}s, shards={shard_count}")
 
         # L2 캐시 (Redis)
         if REDIS_AVAILABLE and 'redis' in globals():
@@ -102,7 +188,10 @@ class AdvancedCache:
         cache_dir = self.config.get('file_cache_dir', 'cache')
         if not os.path.exists(cache_dir):
             os.makedirs(cache_dir, exist_ok=True)
-        self.l3_cache = FileCache(cache_dir)
+        if self.config.get('l3_backend', 'sqlite') == 'pickle':
+            self.l3_cache = PickleFileCache(cache_dir)
+        else:
+            self.l3_cache = FileCache(cache_dir)
         logger.info(f"L3 캐시 (파일) 초기화: {cache_dir}")
 
     def _generate_key(self,  key: str, namespace="default") -> str:
@@ -117,6 +206,38 @@ class AdvancedCache:
 
         return key
 
+    def _shard_for(self, cache_key: str) -> _CacheShard:
+        """키에 해당하는 L1 샤드 선택"""
+        return self._shards[hash(cache_key) % len(self._shards)]
+
+    def _count(self, shard: _CacheShard, kind: str, level: str):
+        """샤드 통계 증가"""
+        with shard.lock:
+            shard.stats[kind][level] += 1
+
+    def _l1_get(self, shard: _CacheShard, cache_key: str) -> Optional[Any]:
+        """L1 샤드 조회 (샤드 락만 사용)"""
+        with shard.lock:
+            if shard.data is None:
+                return None
+            value = shard.data.get(cache_key)
+            if value is not None:
+                shard.stats['hits']['l1'] += 1
+            else:
+                shard.stats['misses']['l1'] += 1
+            return value
+
+    def _l1_put(self, shard: _CacheShard, cache_key: str, value: Any, count: bool = False):
+        """L1 샤드 저장"""
+        with shard.lock:
+            if shard.data is None:
+                return
+            if cache_key not in shard.data and len(shard.data) >= shard.data.maxsize:
+                shard.stats['evictions']['l1'] += 1
+            shard.data[cache_key] = value
+            if count:
+                shard.stats['writes']['l1'] += 1
+
     def get(self, key: str, namespace: str = "default",
             levels: Optional[List[str]] = None) -> Optional[Any]:
         """캐시에서 값 조회"""
@@ -124,126 +245,247 @@ class AdvancedCache:
             levels = [CacheLevel.L1_MEMORY, CacheLevel.L2_REDIS, CacheLevel.L3_FILE]
 
         cache_key = self._generate_key(key,  namespace)
+        shard = self._shard_for(cache_key)
 
-        with self.lock:
-            # L1 캐시 조회
-            if CacheLevel.L1_MEMORY in levels and self.l1_cache:
-                try:
-                    value = self.l1_cache.get(cache_key)
-                    if value is not None:
-                        self.stats['hits']['l1'] += 1
-                        logger.debug(f"L1 캐시 히트: {cache_key}")
-                        return value
-                    else:
-                        self.stats['misses']['l1'] += 1
-                except Exception as e:
-                    logger.warning(f"L1 캐시 조회 오류: {e}")
+        # L1 캐시 조회
+        if CacheLevel.L1_MEMORY in levels and self.l1_cache is not None:
+            try:
+                value = self._l1_get(shard, cache_key)
+                if value is not None:
+                    logger.debug(f"L1 캐시 히트: {cache_key}")
+                    return value
+            except Exception as e:
+                logger.warning(f"L1 캐시 조회 오류: {e}")
 
-            # L2 캐시 조회
-            if CacheLevel.L2_REDIS in levels and self.l2_cache:
-                try:
-                    value = self.l2_cache.get(cache_key)
-                    if value is not None:
-                        # L1 캐시에 저장
-                        if self.l1_cache:
+        # L2 캐시 조회 (락 없이 I/O)
+        l2 = self.l2_cache
+        if CacheLevel.L2_REDIS in levels and l2 is not None:
+            try:
+                raw = l2.get(cache_key)
+                if raw is not None:
+                    value = pickle.loads(raw) if isinstance(raw, bytes) else raw  # type: ignore
+                    # L1 캐시에 저장
+                    if self.l1_cache is not None:
+                        self._l1_put(shard, cache_key, value)
+
+                    self._count(shard, 'hits', 'l2')
+                    logger.debug(f"L2 캐시 히트: {cache_key}")
+                    return value
+                else:
+                    self._count(shard, 'misses', 'l2')
+            except Exception as e:
+                logger.warning(f"L2 캐시 조회 오류: {e}")
+                # Redis 연결 실패 시 L2 캐시 비활성화
+                self.l2_cache = None
+
+        # L3 캐시 조회 (락 없이 I/O)
+        if CacheLevel.L3_FILE in levels and self.l3_cache is not None:
+            try:
+                value = self.l3_cache.get(cache_key)
+                if value is not None:
+                    # 상위 캐시에 저장
+                    if self.l1_cache is not None:
+                        self._l1_put(shard, cache_key, value)
+                    l2 = self.l2_cache
+                    if l2 is not None:
+                        l2_ttl = self.config.get('l2_ttl', 3600)
+                        if l2_ttl is not None:
                             try:
-                                if isinstance(value, bytes):
-                                    self.l1_cache[cache_key] = pickle.loads(value)  # type: ignore
-                                else:
-                                    self.l1_cache[cache_key] = value
+                                l2.setex(
+                                    cache_key,
+                                    l2_ttl,
+                                    pickle.dumps(value)
+                                )
                             except Exception:
-                                self.l1_cache[cache_key] = value
-
-                        self.stats['hits']['l2'] += 1
-                        logger.debug(f"L2 캐시 히트: {cache_key}")
-                        return pickle.loads(value)  # type: ignore
-                    else:
-                        self.stats['misses']['l2'] += 1
-                except Exception as e:
-                    logger.warning(f"L2 캐시 조회 오류: {e}")
-                    # Redis 연결 실패 시 L2 캐시 비활성화
-                    self.l2_cache = None
+                                pass
 
-            # L3 캐시 조회
-            if CacheLevel.L3_FILE in levels and self.l3_cache:
-                try:
-                    value = self.l3_cache.get(cache_key)
-                    if value is not None:
-                        # 상위 캐시에 저장
-                        if self.l1_cache:
-                            self.l1_cache[cache_key] = value
-                        if self.l2_cache:
-                            l2_ttl = self.config.get('l2_ttl', 3600)
-                            if l2_ttl is not None:
-                                try:
-                                    self.l2_cache.setex(
-                                        cache_key,
-                                        l2_ttl,
-                                        pickle.dumps(value)
-                                    )
-                                except Exception:
-                                    pass
-
-                        self.stats['hits']['l3'] += 1
-                        logger.debug(f"L3 캐시 히트: {cache_key}")
-                        return value
-                    else:
-                        self.stats['misses']['l3'] += 1
-                except Exception as e:
-                    logger.warning(f"L3 캐시 조회 오류: {e}")
+                    self._count(shard, 'hits', 'l3')
+                    logger.debug(f"L3 캐시 히트: {cache_key}")
+                    return value
+                else:
+                    self._count(shard, 'misses', 'l3')
+            except Exception as e:
+                logger.warning(f"L3 캐시 조회 오류: {e}")
 
         logger.debug(f"캐시 미스: {cache_key}")
         return None
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None,
             namespace: str = "default", levels: Optional[List[str]] = None,
-            strategy: str = CacheStrategy.WRITE_THROUGH) -> bool:
-        """캐시에 값 저장"""
+            strategy: str = CacheStrategy.WRITE_THROUGH,
+            tags: Optional[Iterable[str]] = None) -> bool:
+        """캐시에 값 저장
+
+        tags: 이 항목이 의존하는 엔티티 태그 (예: "brand:12", "user:7").
+        invalidate_tags()로 해당 태그가 붙은 항목만 모든 레벨에서 삭제할 수 있다.
+        """
         if levels is None:
             levels = [CacheLevel.L1_MEMORY, CacheLevel.L2_REDIS, CacheLevel.L3_FILE]
 
         cache_key = self._generate_key(key,  namespace)
+        shard = self._shard_for(cache_key)
         success = True
 
-        with self.lock:
-            # L1 캐시 저장
-            if CacheLevel.L1_MEMORY in levels and self.l1_cache:
-                try:
-                    self.l1_cache[cache_key] = value
-                    self.stats['writes']['l1'] += 1
-                    logger.debug(f"L1 캐시 저장: {cache_key}")
-                except Exception as e:
-                    logger.warning(f"L1 캐시 저장 오류: {e}")
-                    success = False
+        # L1 캐시 저장
+        if CacheLevel.L1_MEMORY in levels and self.l1_cache is not None:
+            try:
+                self._l1_put(shard, cache_key, value, count=True)
+                logger.debug(f"L1 캐시 저장: {cache_key}")
+            except Exception as e:
+                logger.warning(f"L1 캐시 저장 오류: {e}")
+                success = False
 
-            # L2 캐시 저장
-            if CacheLevel.L2_REDIS in levels and self.l2_cache:
-                try:
-                    redis_ttl = ttl if ttl is not None else self.config.get('l2_ttl', 3600)
-                    self.l2_cache.setex(
-                        cache_key,
-                        redis_ttl,
-                        pickle.dumps(value)
-                    )
-                    self.stats['writes']['l2'] += 1
-                    logger.debug(f"L2 캐시 저장: {cache_key}")
-                except Exception as e:
-                    logger.warning(f"L2 캐시 저장 오류: {e}")
-                    success = False
+        # L2 캐시 저장
+        l2 = self.l2_cache
+        if CacheLevel.L2_REDIS in levels and l2 is not None:
+            try:
+                redis_ttl = ttl if ttl is not None else self.config.get('l2_ttl', 3600)
+                l2.setex(
+                    cache_key,
+                    redis_ttl,
+                    pickle.dumps(value)
+                )
+                self._count(shard, 'writes', 'l2')
+                logger.debug(f"L2 캐시 저장: {cache_key}")
+            except Exception as e:
+                logger.warning(f"L2 캐시 저장 오류: {e}")
+                success = False
 
-            # L3 캐시 저장
-            if CacheLevel.L3_FILE in levels and self.l3_cache:
-                try:
-                    file_ttl = ttl or self.config.get('l3_ttl', 86400)
-                    self.l3_cache.set(cache_key,  value,  file_ttl)
-                    self.stats['writes']['l3'] += 1
-                    logger.debug(f"L3 캐시 저장: {cache_key}")
-                except Exception as e:
-                    logger.warning(f"L3 캐시 저장 오류: {e}")
-                    success = False
+        # L3 캐시 저장
+        if CacheLevel.L3_FILE in levels and self.l3_cache is not None:
+            try:
+                file_ttl = ttl or self.config.get('l3_ttl', 86400)
+                self.l3_cache.set(cache_key,  value,  file_ttl)
+                self._count(shard, 'writes', 'l3')
+                logger.debug(f"L3 캐시 저장: {cache_key}")
+            except Exception as e:
+                logger.warning(f"L3 캐시 저장 오류: {e}")
+                success = False
+
+        if tags:
+            self._index_tags(cache_key, tags, ttl)
 
         return success
 
+    def get_or_load(self, key: str, loader: Callable[[], Any], ttl: Optional[int] = None,
+                    namespace: str = "default", levels: Optional[List[str]] = None,
+                    stale_ttl: int = 0, coalesce: bool = True,
+                    executor: Optional[Executor] = None,
+                    tags: Optional[Iterable[str]] = None) -> Any:
+        """캐시 조회 후 미스 시 loader로 로드
+
+        coalesce가 켜져 있으면 동일 키 동시 미스는 한 번만 로드한다.
+        stale_ttl > 0이면 ttl이 지난 뒤에도 stale_ttl 동안 이전 값을 반환하고,
+        한 호출자만 재계산한다 (executor가 주어지면 백그라운드에서 재계산).
+        """
+        cache_key = self._generate_key(key, namespace)
+        shard = self._shard_for(cache_key)
+
+        def store(value: Any) -> Any:
+            return self._store_loaded(key, value, ttl, namespace, levels, stale_ttl, tags, shard)
+
+        entry = self.get(key, namespace, levels)
+        if entry is not None:
+            if not isinstance(entry, _StaleEntry):
+                self._count(shard, 'read_through', 'hits')
+                return entry
+            if time.time() < entry.fresh_until:
+                self._count(shard, 'read_through', 'hits')
+                return entry.value
+
+            # 신선 기한 경과 - 이전 값 반환, 재계산은 한 호출자만 수행
+            self._count(shard, 'read_through', 'stale_served')
+            flight = self._claim_flight(cache_key)
+            if flight is not None:
+                if executor is not None:
+                    executor.submit(self._refresh, flight, cache_key,
+                                    self._with_app_context(loader), store)
+                else:
+                    value = self._refresh(flight, cache_key, loader, store)
+                    if value is not None:
+                        return value
+            return entry.value
+
+        if not coalesce:
+            return store(loader())
+
+        flight = self._claim_flight(cache_key)
+        if flight is None:
+            # 다른 스레드의 로드 결과 대기
+            with self._inflight_lock:
+                flight = self._inflight.get(cache_key)
+            if flight is not None:
+                self._count(shard, 'read_through', 'coalesced_waiters')
+                flight.event.wait()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+            # 대기 직전에 로드가 끝난 경우
+            return self.get_or_load(key, loader, ttl, namespace, levels,
+                                    stale_ttl, coalesce, executor, tags)
+
+        return self._run_load(flight, cache_key, loader, store)
+
+    def _claim_flight(self, cache_key: str) -> Optional[_InFlightLoad]:
+        """키의 로드 권한 획득 (이미 로드 중이면 None)"""
+        with self._inflight_lock:
+            if cache_key in self._inflight:
+                return None
+            flight = _InFlightLoad()
+            self._inflight[cache_key] = flight
+            return flight
+
+    def _run_load(self, flight: _InFlightLoad, cache_key: str,
+                  loader: Callable[[], Any], store: Callable[[Any], Any]) -> Any:
+        """로더 실행 후 저장하고 대기 중인 호출자에게 결과 전달"""
+        try:
+            value = store(loader())
+            flight.value = value
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+            flight.event.set()
+
+    def _refresh(self, flight: _InFlightLoad, cache_key: str,
+                 loader: Callable[[], Any], store: Callable[[Any], Any]) -> Optional[Any]:
+        """stale 값 재계산 (실패 시 이전 값을 계속 사용하도록 None 반환)"""
+        try:
+            return self._run_load(flight, cache_key, loader, store)
+        except Exception as e:
+            logger.warning(f"캐시 재계산 실패, 이전 값 사용: {cache_key}: {e}")
+            return None
+
+    def _store_loaded(self, key: str, value: Any, ttl: Optional[int], namespace: str,
+                      levels: Optional[List[str]], stale_ttl: int,
+                      tags: Optional[Iterable[str]], shard: _CacheShard) -> Any:
+        """로드한 값 저장"""
+        self._count(shard, 'read_through', 'loads')
+        if value is None:
+            return None
+        if stale_ttl > 0:
+            fresh_ttl = ttl if ttl is not None else self.config.get('l2_ttl', 3600)
+            self.set(key, _StaleEntry(value, time.time() + fresh_ttl),
+                     fresh_ttl + stale_ttl, namespace, levels, tags=tags)
+        else:
+            self.set(key, value, ttl, namespace, levels, tags=tags)
+        return value
+
+    @staticmethod
+    def _with_app_context(loader: Callable[[], Any]) -> Callable[[], Any]:
+        """백그라운드 스레드에서도 현재 Flask 앱 컨텍스트로 실행되도록 감쌈"""
+        if not has_app_context():
+            return loader
+        app = current_app._get_current_object()  # type: ignore
+
+        def run():
+            with app.app_context():
+                return loader()
+        return run
+
     def delete(self, key: str, namespace: str = "default",
                levels: Optional[List[str]] = None) -> bool:
         """캐시에서 값 삭제"""
@@ -253,37 +495,152 @@ class AdvancedCache:
         cache_key = self._generate_key(key,  namespace)
         success = True
 
-        with self.lock:
-            # L1 캐시 삭제
-            if CacheLevel.L1_MEMORY in levels and self.l1_cache:
-                try:
-                    if cache_key in self.l1_cache:
-                        del self.l1_cache[cache_key]
-                        logger.debug(f"L1 캐시 삭제: {cache_key}")
-                except Exception as e:
-                    logger.warning(f"L1 캐시 삭제 오류: {e}")
-                    success = False
+        # L1 캐시 삭제
+        if CacheLevel.L1_MEMORY in levels and self.l1_cache is not None:
+            try:
+                self._l1_delete(cache_key)
+            except Exception as e:
+                logger.warning(f"L1 캐시 삭제 오류: {e}")
+                success = False
 
-            # L2 캐시 삭제
-            if CacheLevel.L2_REDIS in levels and self.l2_cache:
-                try:
-                    self.l2_cache.delete(cache_key)
-                    logger.debug(f"L2 캐시 삭제: {cache_key}")
-                except Exception as e:
-                    logger.warning(f"L2 캐시 삭제 오류: {e}")
-                    success = False
+        # L2 캐시 삭제
+        l2 = self.l2_cache
+        if CacheLevel.L2_REDIS in levels and l2 is not None:
+            try:
+                l2.delete(cache_key)
+                logger.debug(f"L2 캐시 삭제: {cache_key}")
+            except Exception as e:
+                logger.warning(f"L2 캐시 삭제 오류: {e}")
+                success = False
 
-            # L3 캐시 삭제
-            if CacheLevel.L3_FILE in levels and self.l3_cache:
-                try:
-                    self.l3_cache.delete(cache_key)
-                    logger.debug(f"L3 캐시 삭제: {cache_key}")
-                except Exception as e:
-                    logger.warning(f"L3 캐시 삭제 오류: {e}")
-                    success = False
+        # L3 캐시 삭제
+        if CacheLevel.L3_FILE in levels and self.l3_cache is not None:
+            try:
+                self.l3_cache.delete(cache_key)
+                logger.debug(f"L3 캐시 삭제: {cache_key}")
+            except Exception as e:
+                logger.warning(f"L3 캐시 삭제 오류: {e}")
+                success = False
+
+        with self._tag_lock:
+            self._unindex_key(cache_key)
 
         return success
 
+    def _l1_delete(self, cache_key: str):
+        """L1 샤드에서 키 삭제"""
+        shard = self._shard_for(cache_key)
+        with shard.lock:
+            if shard.data is not None and cache_key in shard.data:
+                del shard.data[cache_key]
+                logger.debug(f"L1 캐시 삭제: {cache_key}")
+
+    @staticmethod
+    def _tag_set_key(tag: str) -> str:
+        """태그 역색인의 Redis 집합 키"""
+        return f"cache:tag:{tag}"
+
+    def _index_tags(self, cache_key: str, tags: Iterable[str], ttl: Optional[int]):
+        """캐시 키를 태그 역색인에 등록 (메모리 + Redis 집합)"""
+        tags = set(tags)
+        index_ttl = max(ttl or 0, self.config.get('l2_ttl', 3600), self.config.get('l3_ttl', 86400))
+        with self._tag_lock:
+            self._unindex_key(cache_key)
+            self._key_tags[cache_key] = (tags, time.time() + index_ttl)
+            for tag in tags:
+                self._tag_index.setdefault(tag, set()).add(cache_key)
+            if len(self._key_tags) > self.config.get('tag_index_max', 10000):
+                self._prune_tag_index()
+
+        # L3 역색인 (Redis 없이 여러 워커가 같은 L3 파일을 쓸 때 다른 워커도 찾을 수 있게)
+        l3_tag = getattr(self.l3_cache, 'tag', None)
+        if l3_tag is not None:
+            l3_tag(cache_key, tags)
+
+        l2 = self.l2_cache
+        if l2 is not None:
+            try:
+                pipe = l2.pipeline(transaction=False)
+                for tag in tags:
+                    pipe.sadd(self._tag_set_key(tag), cache_key)
+                    pipe.expire(self._tag_set_key(tag), index_ttl)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"L2 태그 색인 저장 오류: {e}")
+
+    def _unindex_key(self, cache_key: str):
+        """역색인에서 캐시 키 제거 (호출자가 self._tag_lock 보유)"""
+        entry = self._key_tags.pop(cache_key, None)
+        if entry is None:
+            return
+        for tag in entry[0]:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(cache_key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def _prune_tag_index(self):
+        """만료된 항목을 역색인에서 정리 (호출자가 self._tag_lock 보유)"""
+        now = time.time()
+        expired = [k for k, (_, expires_at) in self._key_tags.items() if expires_at <= now]
+        for cache_key in expired:
+            self._unindex_key(cache_key)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """태그가 붙은 캐시 항목을 L1/L2/L3에서 삭제하고 삭제한 키 수 반환
+
+        메모리 역색인, Redis 집합, L3(SQLite) 역색인을 함께 조회하므로 다른 프로세스가
+        저장한 L2/L3 항목도 삭제된다. 비용은 해당 태그가 붙은 항목 수에 비례한다.
+
+        한계: 다른 프로세스의 L1(메모리)에는 닿지 않으므로, 그 프로세스가 이미 읽어 둔
+        값은 l1_ttl(기본 5분)이 지날 때까지 남을 수 있다. 즉시 반영이 필요한 값은
+        L1을 빼고(levels) 저장하거나 l1_ttl을 짧게 설정한다.
+        """
+        tags = set(tags)
+        if not tags:
+            return 0
+
+        keys: Set[str] = set()
+        with self._tag_lock:
+            for tag in tags:
+                keys |= self._tag_index.get(tag, set())
+            for cache_key in keys:
+                self._unindex_key(cache_key)
+
+        l2 = self.l2_cache
+        if l2 is not None:
+            try:
+                pipe = l2.pipeline(transaction=False)
+                for tag in tags:
+                    pipe.smembers(self._tag_set_key(tag))
+                for members in pipe.execute():
+                    keys |= {m.decode() if isinstance(m, bytes) else m for m in members}
+                pipe = l2.pipeline(transaction=False)
+                if keys:
+                    pipe.delete(*keys)
+                pipe.delete(*[self._tag_set_key(tag) for tag in tags])
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"L2 태그 무효화 오류: {e}")
+
+        l3_invalidate = getattr(self.l3_cache, 'invalidate_tags', None)
+        if l3_invalidate is not None:
+            keys |= l3_invalidate(tags)
+
+        for cache_key in keys:
+            try:
+                if self.l1_cache is not None:
+                    self._l1_delete(cache_key)
+                if self.l3_cache is not None:
+                    self.l3_cache.delete(cache_key)
+            except Exception as e:
+                logger.warning(f"태그 무효화 삭제 오류: {cache_key}: {e}")
+
+        if keys:
+            logger.info(f"태그 {sorted(tags)} 캐시 {len(keys)}개 무효화")
+        return len(keys)
+
     def clear(self, namespace=None,  levels: Optional[List[str]] = None) -> bool:
         """캐시 전체 삭제"""
         if levels is None:
@@ -292,41 +649,55 @@ class AdvancedCache:
         success = True
 
         with self.lock:
-            # L1 캐시 전체 삭제
-            if CacheLevel.L1_MEMORY in levels and self.l1_cache:
+            # L1 캐시 전체 삭제 (샤드 단위)
+            if CacheLevel.L1_MEMORY in levels and self.l1_cache is not None:
                 try:
-                    if namespace:
-                        # 네임스페이스별 삭제
-                        keys_to_delete = [
-                            key for key in self.l1_cache.keys()
-                            if key.startswith(f"{namespace}:")
-                        ]
-                        for key in keys_to_delete:
-                            del self.l1_cache[key]
-                    else:
-                        self.l1_cache.clear()
+                    for shard in self._shards:
+                        with shard.lock:
+                            if shard.data is None:
+                                continue
+                            if namespace:
+                                # 네임스페이스별 삭제
+                                keys_to_delete = [
+                                    key for key in shard.data.keys()
+                                    if key.startswith(f"{namespace}:")
+                                ]
+                                for key in keys_to_delete:
+                                    del shard.data[key]
+                            else:
+                                shard.data.clear()
                     logger.info(f"L1 캐시 전체 삭제: {namespace or 'all'}")
                 except Exception as e:
                     logger.warning(f"L1 캐시 전체 삭제 오류: {e}")
                     success = False
 
             # L2 캐시 전체 삭제
-            if CacheLevel.L2_REDIS in levels and self.l2_cache:
+            l2 = self.l2_cache
+            if CacheLevel.L2_REDIS in levels and l2 is not None:
                 try:
                     if namespace:
                         pattern = f"{namespace}:*"
-                        keys = self.l2_cache.keys(pattern)  # type: ignore
+                        keys = l2.keys(pattern)  # type: ignore
                         if keys and len(keys) > 0:  # type: ignore
-                            self.l2_cache.delete(*keys)  # type: ignore
+                            l2.delete(*keys)  # type: ignore
                     else:
-                        self.l2_cache.flushdb()
+                        l2.flushdb()
                     logger.info(f"L2 캐시 전체 삭제: {namespace or 'all'}")
                 except Exception as e:
                     logger.warning(f"L2 캐시 전체 삭제 오류: {e}")
                     success = False
 
+            # 태그 역색인 정리
+            with self._tag_lock:
+                if namespace:
+                    for cache_key in [k for k in self._key_tags if k.startswith(f"{namespace}:")]:
+                        self._unindex_key(cache_key)
+                else:
+                    self._tag_index.clear()
+                    self._key_tags.clear()
+
             # L3 캐시 전체 삭제
-            if CacheLevel.L3_FILE in levels and self.l3_cache:
+            if CacheLevel.L3_FILE in levels and self.l3_cache is not None:
                 try:
                     self.l3_cache.clear(namespace)
                     logger.info(f"L3 캐시 전체 삭제: {namespace or 'all'}")
@@ -336,66 +707,79 @@ class AdvancedCache:
 
         return success
 
+    @property
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """샤드별 통계 합산"""
+        totals = _new_stats()
+        for shard in self._shards:
+            with shard.lock:
+                for kind, per_level in shard.stats.items():
+                    for level, count in per_level.items():
+                        totals[kind][level] += count
+        return totals
+
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계 조회"""
-        with self.lock:
-            stats = self.stats.copy()
-
-            # 히트율 계산
-            total_hits = sum(v for v in stats['hits'].values() if isinstance(v, int))
-            total_misses = sum(v for v in stats['misses'].values() if isinstance(v, int))
-            total_requests = total_hits + total_misses
-
-            if total_requests > 0:
-                hit_rate = (total_hits / total_requests) * 100
+        stats = self.stats
+
+        # 히트율 계산
+        total_hits = sum(v for v in stats['hits'].values() if isinstance(v, int))
+        total_misses = sum(v for v in stats['misses'].values() if isinstance(v, int))
+        total_requests = total_hits + total_misses
+
+        if total_requests > 0:
+            hit_rate = (total_hits / total_requests) * 100
+        else:
+            hit_rate = 0
+
+        # 레벨별 히트율
+        level_hit_rates = {}
+        for level in ['l1', 'l2', 'l3']:
+            level_hits = stats['hits'][level] if isinstance(stats['hits'][level], int) else 0
+            level_misses = stats['misses'][level] if isinstance(stats['misses'][level], int) else 0
+            level_total = level_hits + level_misses
+
+            if level_total > 0:
+                level_hit_rates[level] = (level_hits / level_total) * 100
             else:
-                hit_rate = 0
-
-            # 레벨별 히트율
-            level_hit_rates = {}
-            for level in ['l1', 'l2', 'l3']:
-                level_hits = stats['hits'][level] if isinstance(stats['hits'][level], int) else 0
-                level_misses = stats['misses'][level] if isinstance(stats['misses'][level], int) else 0
-                level_total = level_hits + level_misses
-
-                if level_total > 0:
-                    level_hit_rates[level] = (level_hits / level_total) * 100
-                else:
-                    level_hit_rates[level] = 0
-
-            return {
-                'hits': stats['hits'],
-                'misses': stats['misses'],
-                'writes': stats['writes'],
-                'evictions': stats['evictions'],
-                'total_requests': total_requests,
-                'overall_hit_rate': hit_rate,
-                'level_hit_rates': level_hit_rates,
-                'cache_status': {
-                    'l1_enabled': self.l1_cache is not None,
-                    'l2_enabled': self.l2_cache is not None,
-                    'l3_enabled': self.l3_cache is not None
-                }
+                level_hit_rates[level] = 0
+
+        return {
+            'hits': stats['hits'],
+            'misses': stats['misses'],
+            'writes': stats['writes'],
+            'evictions': stats['evictions'],
+            'read_through': stats['read_through'],
+            'total_requests': total_requests,
+            'overall_hit_rate': hit_rate,
+            'level_hit_rates': level_hit_rates,
+            'cache_status': {
+                'l1_enabled': self.l1_cache is not None,
+                'l2_enabled': self.l2_cache is not None,
+                'l3_enabled': self.l3_cache is not None,
+                'l1_shards': len(self._shards)
             }
+        }
 
     def reset_stats(self):
         """통계 초기화"""
         with self.lock:
-            self.stats = {
-                'hits': {'l1': 0, 'l2': 0, 'l3': 0},
-                'misses': {'l1': 0, 'l2': 0, 'l3': 0},
-                'writes': {'l1': 0, 'l2': 0, 'l3': 0},
-                'evictions': {'l1': 0, 'l2': 0, 'l3': 0}
-            }
+            for shard in self._shards:
+                with shard.lock:
+                    shard.stats = _new_stats()
 
 
-class FileCache:
-    """파일 기반 캐시"""
+class PickleFileCache:
+    """키마다 pickle 파일 하나를 쓰는 파일 캐시 (이전 L3 구현, l3_backend='pickle')
+
+    메타데이터 변경만 내부 락으로 보호하고, 캐시 파일 읽기는 락 없이 수행한다.
+    """
 
     def __init__(self,  cache_dir: str):
         self.cache_dir = cache_dir
         self.metadata_file = os.path.join(cache_dir, 'metadata.json')
         self.metadata = self._load_metadata()
+        self._lock = threading.Lock()
 
     def _load_metadata(self) -> Dict[str, Any]:
         """메타데이터 로드"""
@@ -408,7 +792,7 @@ class FileCache:
         return {}
 
     def _save_metadata(self):
-        """메타데이터 저장"""
+        """메타데이터 저장 (호출자가 self._lock 보유)"""
         try:
             with open(self.metadata_file, 'w', encoding='utf-8') as f:
                 json.dump(self.metadata, f, indent=2, ensure_ascii=False)
@@ -424,10 +808,10 @@ class FileCache:
     def get(self, key: str) -> Optional[Any]:
         """캐시에서 값 조회"""
         try:
-            if key not in self.metadata:
+            metadata = self.metadata.get(key)
+            if metadata is None:
                 return None
 
-            metadata = self.metadata[key]
             file_path = self._get_file_path(key)
 
             # 만료 확인
@@ -452,19 +836,23 @@ class FileCache:
             file_path = self._get_file_path(key)
             expires_at = datetime.now().timestamp() + ttl
 
-            # 값 저장
-            with open(file_path, 'wb') as f:
+            # 값 저장 (임시 파일에 쓴 뒤 교체하여 동시 읽기에 부분 파일이 보이지 않도록 함)
+            tmp_path = f"{file_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
                 pickle.dump(value, f)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, file_path)
 
             # 메타데이터 업데이트
-            self.metadata[key] = {
-                'file_path': file_path,
-                'expires_at': expires_at,
-                'created_at': datetime.now().timestamp(),
-                'size': os.path.getsize(file_path)
-            }
+            with self._lock:
+                self.metadata[key] = {
+                    'file_path': file_path,
+                    'expires_at': expires_at,
+                    'created_at': datetime.now().timestamp(),
+                    'size': size
+                }
 
-            self._save_metadata()
+                self._save_metadata()
 
         except Exception as e:
             logger.warning(f"파일 캐시 저장 실패: {e}")
@@ -472,34 +860,36 @@ class FileCache:
     def delete(self,  key: str):
         """캐시에서 값 삭제"""
         try:
-            if key in self.metadata:
-                file_path = self.metadata[key]['file_path']
-
-                # 파일 삭제
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-
-                # 메타데이터에서 제거
-                del self.metadata[key]
+            with self._lock:
+                metadata = self.metadata.pop(key, None)
+                if metadata is None:
+                    return
                 self._save_metadata()
 
+            # 파일 삭제
+            file_path = metadata['file_path']
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
         except Exception as e:
             logger.warning(f"파일 캐시 삭제 실패: {e}")
 
     def clear(self,namespace=None):
         """캐시 전체 삭제"""
         try:
+            with self._lock:
+                keys = list(self.metadata.keys())
             if namespace:
                 # 네임스페이스별 삭제
                 keys_to_delete = [
-                    key for key in list(self.metadata.keys())
+                    key for key in keys
                     if key.startswith(f"{namespace}:")
                 ]
                 for key in keys_to_delete:
                     self.delete(key)
             else:
                 # 전체 삭제
-                for key in list(self.metadata.keys()):
+                for key in keys:
                     self.delete(key)
 
         except Exception as e:
@@ -509,10 +899,11 @@ class FileCache:
         """만료된 캐시 정리"""
         try:
             current_time = datetime.now().timestamp()
-            expired_keys = [
-                key for key, metadata in self.metadata.items()
-                if current_time > metadata['expires_at']
-            ]
+            with self._lock:
+                expired_keys = [
+                    key for key, metadata in self.metadata.items()
+                    if current_time > metadata['expires_at']
+                ]
 
             for key in expired_keys:
                 self.delete(key)
@@ -523,9 +914,205 @@ class FileCache:
             logger.warning(f"만료된 캐시 정리 실패: {e}")
 
 
+class FileCache:
+    """SQLite(WAL) 단일 파일 기반 L3 캐시
+
+    키를 기본키로 색인하고 만료 시각에도 색인을 두어, 조회/저장/삭제가 O(log n)이고
+    만료 정리는 만료된 행만 범위 삭제한다. 스레드마다 연결을 따로 열어 읽기가
+    서로 막히지 않는다. 태그 -> 키 역색인도 같은 파일(cache_tags)에 두어, 어느
+    워커가 저장한 항목이든 태그로 찾아 지울 수 있다.
+    """
+
+    SWEEP_INTERVAL = 1000  # 저장 N회마다 만료 항목 정리
+
+    def __init__(self,  cache_dir: str):
+        self.cache_dir = cache_dir
+        self.db_path = os.path.join(cache_dir, 'l3_cache.sqlite3')
+        self._local = threading.local()
+        self._writes = 0
+        self._init_db()
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결 반환"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None,
+                                   check_same_thread=False)
+            # auto_vacuum은 새 DB에서 WAL 전환 전에 설정해야 적용됨
+            conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        """테이블 및 색인 생성"""
+        conn = self._conn()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                created_at REAL NOT NULL
+            )
+        ''')
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_cache_entries_expires ON cache_entries(expires_at)'
+        )
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS cache_tags (
+                tag TEXT NOT NULL,
+                key TEXT NOT NULL,
+                PRIMARY KEY (tag, key)
+            ) WITHOUT ROWID
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_cache_tags_key ON cache_tags(key)')
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시에서 값 조회"""
+        try:
+            row = self._conn().execute(
+                'SELECT value, expires_at FROM cache_entries WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            # 만료 확인
+            if time.time() > row[1]:
+                self.delete(key)
+                return None
+
+            return pickle.loads(row[0])
+
+        except Exception as e:
+            logger.warning(f"파일 캐시 조회 실패: {e}")
+            return None
+
+    def set(self,  key: str,  value: Any, ttl=3600):
+        """캐시에 값 저장"""
+        try:
+            now = time.time()
+            self._conn().execute(
+                'INSERT OR REPLACE INTO cache_entries (key, value, expires_at, created_at) '
+                'VALUES (?, ?, ?, ?)',
+                (key, sqlite3.Binary(pickle.dumps(value)), now + ttl, now)
+            )
+
+            self._writes += 1
+            if self._writes % self.SWEEP_INTERVAL == 0:
+                self.cleanup_expired()
+
+        except Exception as e:
+            logger.warning(f"파일 캐시 저장 실패: {e}")
+
+    def delete(self,  key: str):
+        """캐시에서 값 삭제"""
+        try:
+            conn = self._conn()
+            conn.execute('DELETE FROM cache_entries WHERE key = ?', (key,))
+            conn.execute('DELETE FROM cache_tags WHERE key = ?', (key,))
+        except Exception as e:
+            logger.warning(f"파일 캐시 삭제 실패: {e}")
+
+    def tag(self, key: str, tags: Iterable[str]):
+        """키의 태그를 역색인에 기록 (기존 태그는 교체)"""
+        try:
+            conn = self._conn()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.execute('DELETE FROM cache_tags WHERE key = ?', (key,))
+                conn.executemany('INSERT OR IGNORE INTO cache_tags (tag, key) VALUES (?, ?)',
+                                 [(tag, key) for tag in set(tags)])
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+        except Exception as e:
+            logger.warning(f"파일 캐시 태그 색인 실패: {e}")
+
+    def invalidate_tags(self, tags: Iterable[str]) -> Set[str]:
+        """태그가 붙은 항목과 그 역색인을 한 트랜잭션으로 삭제하고 삭제한 키 반환"""
+        tags = list(set(tags))
+        if not tags:
+            return set()
+        placeholders = ','.join('?' * len(tags))
+        try:
+            conn = self._conn()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                keys = {row[0] for row in conn.execute(
+                    f'SELECT DISTINCT key FROM cache_tags WHERE tag IN ({placeholders})', tags
+                )}
+                key_list = list(keys)
+                for start in range(0, len(key_list), 500):
+                    chunk = key_list[start:start + 500]
+                    chunk_placeholders = ','.join('?' * len(chunk))
+                    conn.execute(f'DELETE FROM cache_entries WHERE key IN ({chunk_placeholders})', chunk)
+                    conn.execute(f'DELETE FROM cache_tags WHERE key IN ({chunk_placeholders})', chunk)
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+            return keys
+        except Exception as e:
+            logger.warning(f"파일 캐시 태그 무효화 실패: {e}")
+            return set()
+
+    def clear(self, namespace=None):
+        """캐시 전체 삭제"""
+        try:
+            if namespace:
+                # 네임스페이스별 삭제 - "ns:" 접두사 키 범위만 삭제 (';'는 ':' 다음 문자)
+                conn = self._conn()
+                for table in ('cache_entries', 'cache_tags'):
+                    conn.execute(
+                        f'DELETE FROM {table} WHERE key >= ? AND key < ?',
+                        (f"{namespace}:", f"{namespace};")
+                    )
+            else:
+                self._conn().execute('DELETE FROM cache_entries')
+                self._conn().execute('DELETE FROM cache_tags')
+
+        except Exception as e:
+            logger.warning(f"파일 캐시 전체 삭제 실패: {e}")
+
+    def cleanup_expired(self):
+        """만료된 캐시 정리 (만료 시각 색인 범위 삭제)"""
+        try:
+            conn = self._conn()
+            cursor = conn.execute(
+                'DELETE FROM cache_entries WHERE expires_at < ?', (time.time(),)
+            )
+            # 항목이 사라진 키의 태그 색인도 정리
+            conn.execute('DELETE FROM cache_tags WHERE key NOT IN (SELECT key FROM cache_entries)')
+            logger.info(f"만료된 캐시 {cursor.rowcount}개 정리 완료")
+
+        except Exception as e:
+            logger.warning(f"만료된 캐시 정리 실패: {e}")
+
+    def compact(self):
+        """WAL 체크포인트 및 빈 페이지 반환"""
+        try:
+            conn = self._conn()
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            conn.execute('PRAGMA incremental_vacuum')
+        except Exception as e:
+            logger.warning(f"파일 캐시 압축 실패: {e}")
+
+
 def cached(ttl: int = 300, namespace: str = "default",
-           levels: Optional[List[str]] = None, key_func: Optional[Callable[..., str]] = None):
-    """캐시 데코레이터"""
+           levels: Optional[List[str]] = None, key_func: Optional[Callable[..., str]] = None,
+           stale_ttl: int = 0, coalesce: bool = True, background_refresh: bool = False,
+           cache: Optional[AdvancedCache] = None,
+           tags: Optional[Union[Iterable[str], Callable[..., Iterable[str]]]] = None):
+    """캐시 데코레이터
+
+    stale_ttl: ttl 경과 후 이전 값을 계속 반환할 시간(초). 그동안 한 호출자만 재계산한다.
+    coalesce: 동일 키 동시 미스를 한 번의 함수 실행으로 병합
+    background_refresh: 재계산을 호출 스레드 대신 백그라운드 실행기에서 수행
+    cache: 사용할 캐시 인스턴스 (기본값: 함수별 인스턴스)
+    tags: 의존 태그 목록 또는 함수 인자를 받아 태그 목록을 반환하는 함수
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args,  **kwargs):
@@ -543,22 +1130,17 @@ def cached(ttl: int = 300, namespace: str = "default",
                 cache_key = ":".join(key_parts)
 
             # 캐시에서 조회
-            cache_instance = getattr(func, '_cache_instance', None)
+            cache_instance = cache or getattr(func, '_cache_instance', None)
             if cache_instance is None:
                 cache_instance = AdvancedCache()
                 func._cache_instance = cache_instance
 
-            cached_value = cache_instance.get(cache_key, namespace, levels)
-            if cached_value is not None:
-                return cached_value
-
-            # 함수 실행
-            result = func(*args, **kwargs)
-
-            # 캐시에 저장
-            cache_instance.set(cache_key,  result,  ttl,  namespace,  levels)
-
-            return result
+            return cache_instance.get_or_load(
+                cache_key, lambda: func(*args, **kwargs), ttl, namespace, levels,
+                stale_ttl=stale_ttl, coalesce=coalesce,
+                executor=_get_refresh_executor() if background_refresh else None,
+                tags=tags(*args, **kwargs) if callable(tags) else tags
+            )
         return wrapper
     return decorator
 
@@ -570,3 +1152,64 @@ advanced_cache = AdvancedCache()
 def get_cache() -> AdvancedCache:
     """전역 캐시 인스턴스 반환"""
     return advanced_cache
+
+
+def invalidate_cache_tags(tags: Iterable[str]) -> int:
+    """모든 캐시 인스턴스에서 태그가 붙은 항목 삭제"""
+    tags = list(tags)
+    return sum(cache.invalidate_tags(tags) for cache in list(_cache_instances))
+
+
+# 모델 변경 시 발행할 캐시 태그 (모델 클래스명 -> 태그 접두사)
+MODEL_CACHE_TAGS = {
+    'Brand': 'brand',
+    'Branch': 'branch',
+    'User': 'user',
+}
+
+_SESSION_TAGS_KEY = 'cache_invalidation_tags'
+_hooks_registered = False
+
+
+def model_cache_tags(obj: Any) -> List[str]:
+    """모델 인스턴스의 캐시 태그 (예: Branch(id=40) -> ["branch:40"])"""
+    prefix = MODEL_CACHE_TAGS.get(type(obj).__name__)
+    ident = getattr(obj, 'id', None)
+    if prefix is None or ident is None:
+        return []
+    return [f"{prefix}:{ident}"]
+
+
+def register_model_invalidation_hooks(db) -> None:
+    """SQLAlchemy 세션 이벤트로 Brand/Branch/User 변경 시 태그 무효화
+
+    flush 시점에 변경된 모델의 태그를 세션에 모아 두었다가, 커밋이 성공한 뒤에만
+    invalidate_cache_tags()를 호출한다. 롤백되면 모은 태그를 버린다.
+    """
+    global _hooks_registered
+    if _hooks_registered:
+        return
+
+    from sqlalchemy import event
+
+    def collect_tags(session, flush_context):
+        pending = session.info.setdefault(_SESSION_TAGS_KEY, set())
+        for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+            pending.update(model_cache_tags(obj))
+
+    def invalidate_after_commit(session):
+        pending = session.info.pop(_SESSION_TAGS_KEY, None)
+        if pending:
+            try:
+                invalidate_cache_tags(pending)
+            except Exception as e:
+                logger.warning(f"커밋 후 캐시 무효화 실패: {e}")
+
+    def discard_tags(session):
+        session.info.pop(_SESSION_TAGS_KEY, None)
+
+    event.listen(db.session, 'after_flush', collect_tags)
+    event.listen(db.session, 'after_commit', invalidate_after_commit)
+    event.listen(db.session, 'after_rollback', discard_tags)
+    _hooks_registered = True
+    logger.info("캐시 태그 무효화 훅 등록 완료")
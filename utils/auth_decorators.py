@@ -1,9 +1,8 @@
 import logging
-from datetime import datetime, timedelta
-from models_main import User, db
 from flask import request, jsonify, current_app, g
 from functools import wraps
 import jwt
+from utils.principal_cache import principal_cache
 args = None  # pyright: ignore
 query = None  # pyright: ignore
 config = None  # pyright: ignore
@@ -11,313 +10,130 @@ config = None  # pyright: ignore
 logger = logging.getLogger(__name__)
 
 
-def jwt_required(f):
-    """JWT 토큰 검증 데코레이터"""
+def _extract_token():
+    """Authorization 헤더에서 토큰 추출 ("Bearer <token>"). (토큰, 오류 응답)"""
+    if 'Authorization' not in request.headers:
+        return None, None
+    auth_header = request.headers.get('Authorization')
+    if not auth_header:
+        return None, (jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401)
+    try:
+        return auth_header.split(" ")[1], None
+    except IndexError:
+        return None, (jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401)
+
+
+def _authenticate(check, log_message, missing_message='토큰이 필요합니다.',
+                  failure_message='권한 확인에 실패했습니다.'):
+    """
+    토큰 검증 + 권한 확인 공통 처리. 통과하면 None, 아니면 오류 응답
+    사용자는 DB 대신 principal_cache의 스냅샷으로 확인 (사용자 행이 바뀌면 커밋 후 무효화)
+    """
+    token, error = _extract_token()
+    if error:
+        return error
+    if not token:
+        return jsonify({'message': missing_message}), 401
+
+    try:
+        # 토큰 디코딩 (만료 시 ExpiredSignatureError)
+        secret_key = current_app.config.get('JWT_SECRET_KEY', 'your-secret-key')
+        payload = jwt.decode(token, secret_key, algorithms=['HS256'])
+
+        # 사용자 조회
+        user_id = payload.get('user_id') if payload else None
+        current_user = principal_cache.get(user_id) if user_id else None
+        if not current_user:
+            return jsonify({'message': '유효하지 않은 사용자입니다.'}), 401
+
+        # 역할/권한 확인
+        error = check(current_user)
+        if error:
+            return error
+
+        # 요청 객체에 현재 사용자 추가
+        setattr(request, 'current_user', current_user)
+        g.current_user = current_user
+
+    except jwt.ExpiredSignatureError:
+        return jsonify({'message': '토큰이 만료되었습니다.'}), 401
+    except jwt.InvalidTokenError:
+        return jsonify({'message': '유효하지 않은 토큰입니다.'}), 401
+    except Exception as e:
+        logger.error(f"{log_message}: {e}")
+        return jsonify({'message': failure_message}), 401
+    return None
+
+
+def _require_approved(user):
+    if user.status != 'approved':
+        return jsonify({'message': '승인되지 않은 계정입니다.'}), 401
+    return None
+
+
+def _require_roles(roles, message):
+    def check(user):
+        if user.role not in roles:
+            return jsonify({'message': message}), 403
+        return None
+    return check
+
+
+def _auth_required(f, check, log_message, **options):
     @wraps(f)
     def decorated_function(*args,  **kwargs):
-        token = None
-
-        # Authorization 헤더에서 토큰 추출
-        if 'Authorization' in request.headers:
-            auth_header = request.headers.get('Authorization')
-            if auth_header:
-                try:
-                    token = auth_header.split(" ")[1]  # "Bearer <token>"
-                except IndexError:
-                    return jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401
-            else:
-                return jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401
-
-        if not token:
-            return jsonify({'message': '토큰이 필요합니다.'}), 401
-
-        try:
-            # 토큰 디코딩
-            secret_key = current_app.config.get('JWT_SECRET_KEY', 'your-secret-key')
-            payload = jwt.decode(token, secret_key, algorithms=['HS256'])
-
-            # 토큰 만료 확인
-            if 'exp' in payload:
-                exp_timestamp = payload['exp'] if payload is not None else None
-                if exp_timestamp is not None and datetime.utcnow().timestamp() > exp_timestamp:
-                    return jsonify({'message': '토큰이 만료되었습니다.'}), 401
-
-            # 사용자 조회
-            user_id = payload.get('user_id') if payload else None
-            current_user = User.query.get(user_id) if user_id else None
-            if not current_user:
-                return jsonify({'message': '유효하지 않은 사용자입니다.'}), 401
-
-            # 사용자 상태 확인
-            if current_user.status != 'approved':
-                return jsonify({'message': '승인되지 않은 계정입니다.'}), 401
-
-            # 요청 객체에 현재 사용자 추가
-            setattr(request, 'current_user', current_user)
-            g.current_user = current_user
-
-        except jwt.ExpiredSignatureError:
-            return jsonify({'message': '토큰이 만료되었습니다.'}), 401
-        except jwt.InvalidTokenError:
-            return jsonify({'message': '유효하지 않은 토큰입니다.'}), 401
-        except Exception as e:
-            logger.error(f"JWT 토큰 검증 실패: {e}")
-            return jsonify({'message': '토큰 검증에 실패했습니다.'}), 401
-
+        error = _authenticate(check, log_message, **options)
+        if error:
+            return error
         return f(*args, **kwargs)
-
     return decorated_function
 
 
-def admin_required(f):
-    """관리자 권한 확인 데코레이터"""
-    @wraps(f)
-    def decorated_function(*args,  **kwargs):
-        # JWT 토큰 검증
-        token = None
-        if 'Authorization' in request.headers:
-            auth_header = request.headers.get('Authorization')
-            if auth_header:
-                try:
-                    token = auth_header.split(" ")[1]
-                except IndexError:
-                    return jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401
-            else:
-                return jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401
-
-        if not token:
-            return jsonify({'message': '토큰이 필요합니다.'}), 401
-
-        try:
-            # 토큰 디코딩
-            secret_key = current_app.config.get('JWT_SECRET_KEY', 'your-secret-key')
-            payload = jwt.decode(token, secret_key, algorithms=['HS256'])
-
-            # 사용자 조회
-            user_id = payload.get('user_id') if payload else None
-            current_user = User.query.get(user_id) if user_id else None
-            if not current_user:
-                return jsonify({'message': '유효하지 않은 사용자입니다.'}), 401
-
-            # 관리자 권한 확인
-            if current_user.role not in ['admin', 'brand_admin']:
-                return jsonify({'message': '관리자 권한이 필요합니다.'}), 403
-
-            # 요청 객체에 현재 사용자 추가
-            setattr(request, 'current_user', current_user)
-            g.current_user = current_user
+def jwt_required(f):
+    """JWT 토큰 검증 데코레이터"""
+    return _auth_required(f, _require_approved, "JWT 토큰 검증 실패",
+                          failure_message='토큰 검증에 실패했습니다.')
 
-        except jwt.ExpiredSignatureError:
-            return jsonify({'message': '토큰이 만료되었습니다.'}), 401
-        except jwt.InvalidTokenError:
-            return jsonify({'message': '유효하지 않은 토큰입니다.'}), 401
-        except Exception as e:
-            logger.error(f"관리자 권한 확인 실패: {e}")
-            return jsonify({'message': '권한 확인에 실패했습니다.'}), 401
 
-        return f(*args, **kwargs)
-    return decorated_function
+def admin_required(f):
+    """관리자 권한 확인 데코레이터"""
+    return _auth_required(f, _require_roles(['admin', 'brand_admin'], '관리자 권한이 필요합니다.'),
+                          "관리자 권한 확인 실패")
 
 
 def login_required(f):
     """로그인 필요 데코레이터"""
-    @wraps(f)
-    def decorated_function(*args,  **kwargs):
-        # JWT 토큰 검증
-        token = None
-        if 'Authorization' in request.headers:
-            auth_header = request.headers.get('Authorization')
-            if auth_header:
-                try:
-                    token = auth_header.split(" ")[1]
-                except IndexError:
-                    return jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401
-            else:
-                return jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401
-
-        if not token:
-            return jsonify({'message': '로그인이 필요합니다.'}), 401
-
-        try:
-            # 토큰 디코딩
-            secret_key = current_app.config.get('JWT_SECRET_KEY', 'your-secret-key')
-            payload = jwt.decode(token, secret_key, algorithms=['HS256'])
-
-            # 사용자 조회
-            user_id = payload.get('user_id') if payload else None
-            current_user = User.query.get(user_id) if user_id else None
-            if not current_user:
-                return jsonify({'message': '유효하지 않은 사용자입니다.'}), 401
-
-            # 사용자 상태 확인
-            if current_user.status != 'approved':
-                return jsonify({'message': '승인되지 않은 계정입니다.'}), 401
-
-            # 요청 객체에 현재 사용자 추가
-            setattr(request, 'current_user', current_user)
-            g.current_user = current_user
-
-        except jwt.ExpiredSignatureError:
-            return jsonify({'message': '토큰이 만료되었습니다.'}), 401
-        except jwt.InvalidTokenError:
-            return jsonify({'message': '유효하지 않은 토큰입니다.'}), 401
-        except Exception as e:
-            logger.error(f"로그인 확인 실패: {e}")
-            return jsonify({'message': '로그인 확인에 실패했습니다.'}), 401
-
-        return f(*args, **kwargs)
-    return decorated_function
+    return _auth_required(f, _require_approved, "로그인 확인 실패",
+                          missing_message='로그인이 필요합니다.',
+                          failure_message='로그인 확인에 실패했습니다.')
 
 
 def role_required(allowed_roles):
     """특정 역할 권한 확인 데코레이터"""
     def decorator(f):
-        @wraps(f)
-        def decorated_function(*args,  **kwargs):
-            # JWT 토큰 검증
-            token = None
-            if 'Authorization' in request.headers:
-                auth_header = request.headers.get('Authorization')
-                if auth_header:
-                    try:
-                        token = auth_header.split(" ")[1]
-                    except IndexError:
-                        return jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401
-                else:
-                    return jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401
-
-            if not token:
-                return jsonify({'message': '토큰이 필요합니다.'}), 401
-
-            try:
-                # 토큰 디코딩
-                secret_key = current_app.config.get('JWT_SECRET_KEY', 'your-secret-key')
-                payload = jwt.decode(token, secret_key, algorithms=['HS256'])
-
-                # 사용자 조회
-                user_id = payload.get('user_id') if payload else None
-                current_user = User.query.get(user_id) if user_id else None
-                if not current_user:
-                    return jsonify({'message': '유효하지 않은 사용자입니다.'}), 401
-
-                # 역할 확인
-                if current_user.role not in allowed_roles:
-                    return jsonify({'message': '접근 권한이 없습니다.'}), 403
-
-                # 요청 객체에 현재 사용자 추가
-                setattr(request, 'current_user', current_user)
-                g.current_user = current_user
-
-            except jwt.ExpiredSignatureError:
-                return jsonify({'message': '토큰이 만료되었습니다.'}), 401
-            except jwt.InvalidTokenError:
-                return jsonify({'message': '유효하지 않은 토큰입니다.'}), 401
-            except Exception as e:
-                logger.error(f"역할 권한 확인 실패: {e}")
-                return jsonify({'message': '권한 확인에 실패했습니다.'}), 401
-
-            return f(*args, **kwargs)
-        return decorated_function
+        return _auth_required(f, _require_roles(allowed_roles, '접근 권한이 없습니다.'),
+                              "역할 권한 확인 실패")
     return decorator
 
 
 def permission_required(module, action="view"):
     """특정 권한 확인 데코레이터"""
-    def decorator(f):
-        @wraps(f)
-        def decorated_function(*args,  **kwargs):
-            # JWT 토큰 검증
-            token = None
-            if 'Authorization' in request.headers:
-                auth_header = request.headers.get('Authorization')
-                if auth_header:
-                    try:
-                        token = auth_header.split(" ")[1]
-                    except IndexError:
-                        return jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401
-                else:
-                    return jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401
-
-            if not token:
-                return jsonify({'message': '토큰이 필요합니다.'}), 401
+    def check(user):
+        if not user.has_permission(module, action):
+            return jsonify({'message': f'{module}의 {action} 권한이 없습니다.'}), 403
+        return None
 
-            try:
-                # 토큰 디코딩
-                secret_key = current_app.config.get('JWT_SECRET_KEY', 'your-secret-key')
-                payload = jwt.decode(token, secret_key, algorithms=['HS256'])
-
-                # 사용자 조회
-                user_id = payload.get('user_id') if payload else None
-                current_user = User.query.get(user_id) if user_id else None
-                if not current_user:
-                    return jsonify({'message': '유효하지 않은 사용자입니다.'}), 401
-
-                # 권한 확인
-                if not current_user.has_permission(module, action):
-                    return jsonify({'message': f'{module}의 {action} 권한이 없습니다.'}), 403
-
-                # 요청 객체에 현재 사용자 추가
-                setattr(request, 'current_user', current_user)
-                g.current_user = current_user
-
-            except jwt.ExpiredSignatureError:
-                return jsonify({'message': '토큰이 만료되었습니다.'}), 401
-            except jwt.InvalidTokenError:
-                return jsonify({'message': '유효하지 않은 토큰입니다.'}), 401
-            except Exception as e:
-                logger.error(f"권한 확인 실패: {e}")
-                return jsonify({'message': '권한 확인에 실패했습니다.'}), 401
-
-            return f(*args, **kwargs)
-        return decorated_function
+    def decorator(f):
+        return _auth_required(f, check, "권한 확인 실패")
     return decorator
 
 
 def manager_required(f):
     """매니저 권한 확인 데코레이터"""
-    @wraps(f)
-    def decorated_function(*args,  **kwargs):
-        # JWT 토큰 검증
-        token = None
-        if 'Authorization' in request.headers:
-            auth_header = request.headers.get('Authorization')
-            if auth_header:
-                try:
-                    token = auth_header.split(" ")[1]
-                except IndexError:
-                    return jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401
-            else:
-                return jsonify({'message': '유효하지 않은 토큰 형식입니다.'}), 401
+    return _auth_required(f, _require_roles(['admin', 'brand_admin', 'store_admin', 'manager'],
+                                            '매니저 권한이 필요합니다.'),
+                          "매니저 권한 확인 실패")
 
-        if not token:
-            return jsonify({'message': '토큰이 필요합니다.'}), 401
 
-        try:
-            # 토큰 디코딩
-            secret_key = current_app.config.get('JWT_SECRET_KEY', 'your-secret-key')
-            payload = jwt.decode(token, secret_key, algorithms=['HS256'])
-
-            # 사용자 조회
-            user_id = payload.get('user_id') if payload else None
-            current_user = User.query.get(user_id) if user_id else None
-            if not current_user:
-                return jsonify({'message': '유효하지 않은 사용자입니다.'}), 401
-
-            # 매니저 권한 확인
-            if current_user.role not in ['admin', 'brand_admin', 'store_admin', 'manager']:
-                return jsonify({'message': '매니저 권한이 필요합니다.'}), 403
-
-            # 요청 객체에 현재 사용자 추가
-            setattr(request, 'current_user', current_user)
-            g.current_user = current_user
-
-        except jwt.ExpiredSignatureError:
-            return jsonify({'message': '토큰이 만료되었습니다.'}), 401
-        except jwt.InvalidTokenError:
-            return jsonify({'message': '유효하지 않은 토큰입니다.'}), 401
-        except Exception as e:
-            logger.error(f"매니저 권한 확인 실패: {e}")
-            return jsonify({'message': '권한 확인에 실패했습니다.'}), 401
-
-        return f(*args, **kwargs)
-    return decorated_function
+# 사용자 행이 바뀌면 커밋 후 캐시된 스냅샷 무효화
+principal_cache.register_events()
@@ -0,0 +1,184 @@
+"""
+지오코딩 결과 캐시
+정규화한 주소를 키로 좌표를 AdvancedCache(L1 메모리 / L2 Redis / L3 SQLite 파일)에 오래 보관해
+재시작 후에도, 다른 워커와도 결과를 공유한다.
+'주소 없음' 응답도 짧은 TTL로 캐시(negative caching)하고, 일시적인 오류는 캐시하지 않는다.
+여러 주소는 중복을 제거한 뒤 캐시에 없는 것만 속도 제한 하에 동시에 조회한다.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+GEOCODE_NAMESPACE = "geocode"
+GEOCODE_TTL = 30 * 86400  # 좌표는 거의 바뀌지 않으므로 30일
+GEOCODE_NEGATIVE_TTL = 86400  # 찾지 못한 주소는 1일 뒤 다시 조회
+
+
+class GeocodeError(Exception):
+    """지오코딩 API 일시 오류 (시간 초과, 5xx, API 키 없음 등) - 캐시하지 않음"""
+
+
+class RateLimiter:
+    """초당 요청 수 제한 (토큰 버킷, 스레드 안전)"""
+
+    def __init__(self, rate_per_second: float, burst: Optional[int] = None):
+        self.rate = float(rate_per_second)
+        self.capacity = float(burst or max(1, int(rate_per_second)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰을 얻을 때까지 대기"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class GeocodeService:
+    """
+    캐시를 거치는 지오코딩 서비스
+    fetcher(주소)는 좌표 dict 또는 None(주소 없음)을 반환하고, 일시 오류면 GeocodeError를 던진다.
+    """
+
+    def __init__(self, fetcher: Callable[[str], Optional[Dict[str, Any]]],
+                 normalizer: Callable[[str], str], cache=None,
+                 ttl: int = GEOCODE_TTL, negative_ttl: int = GEOCODE_NEGATIVE_TTL,
+                 max_workers: int = 4, rate_per_second: float = 10.0):
+        self.fetcher = fetcher
+        self.normalizer = normalizer
+        self._cache = cache
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate_per_second)
+        self._executor = None
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "negative_hits": 0, "fetched": 0, "not_found": 0, "errors": 0}
+
+    @property
+    def cache(self):
+        if self._cache is None:
+            from utils.advanced_caching import advanced_cache
+            self._cache = advanced_cache
+        return self._cache
+
+    @property
+    def executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="geocode"
+                )
+            return self._executor
+
+    def cache_key(self, address: str) -> str:
+        """캐시 키 (정규화 + 소문자)"""
+        return self.normalizer(address or "").lower()
+
+    def _count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def lookup(self, address: str):
+        """캐시 조회 - (찾음 여부, 좌표 또는 None)"""
+        entry = self.cache.get(self.cache_key(address), namespace=GEOCODE_NAMESPACE)
+        if entry is None:
+            return False, None
+        if entry.get("found"):
+            self._count("hits")
+            return True, entry["coordinates"]
+        self._count("negative_hits")
+        return True, None
+
+    def geocode(self, address: str) -> Optional[Dict[str, Any]]:
+        """주소 하나 지오코딩 (캐시 미스일 때만 API 호출)"""
+        cached, coordinates = self.lookup(address)
+        if cached:
+            return coordinates
+        return self._fetch(address)
+
+    def _fetch(self, address: str) -> Optional[Dict[str, Any]]:
+        normalized = self.normalizer(address)
+        self.rate_limiter.acquire()
+        try:
+            coordinates = self.fetcher(normalized)
+        except GeocodeError:
+            self._count("errors")
+            raise
+
+        self._count("fetched")
+        if coordinates:
+            entry, ttl = {"found": True, "coordinates": coordinates}, self.ttl
+        else:
+            self._count("not_found")
+            entry, ttl = {"found": False}, self.negative_ttl
+        self.cache.set(self.cache_key(address), entry, ttl=ttl, namespace=GEOCODE_NAMESPACE)
+        return coordinates
+
+    def geocode_many(self, addresses: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 주소 지오코딩
+        Returns:
+            {입력 주소: {'status': 'ok'|'not_found'|'error', 'coordinates': ..., 'cached': bool}}
+        """
+        addresses = [a for a in dict.fromkeys(addresses) if a and a.strip()]
+        by_key: Dict[str, List[str]] = {}
+        for address in addresses:
+            by_key.setdefault(self.cache_key(address), []).append(address)
+
+        results: Dict[str, Dict[str, Any]] = {}
+
+        def record(key: str, result: Dict[str, Any]):
+            for address in by_key[key]:
+                results[address] = result
+
+        misses = []
+        for key, originals in by_key.items():
+            cached, coordinates = self.lookup(originals[0])
+            if cached:
+                record(key, self._result(coordinates, cached=True))
+            else:
+                misses.append(key)
+
+        futures = {key: self.executor.submit(self._fetch, by_key[key][0]) for key in misses}
+        for key, future in futures.items():
+            try:
+                record(key, self._result(future.result(), cached=False))
+            except GeocodeError as e:
+                record(key, {"status": "error", "coordinates": None, "cached": False,
+                             "error": str(e)})
+            except Exception as e:
+                logger.error(f"지오코딩 오류 ({key}): {e}")
+                record(key, {"status": "error", "coordinates": None, "cached": False,
+                             "error": str(e)})
+        return results
+
+    @staticmethod
+    def _result(coordinates: Optional[Dict[str, Any]], cached: bool) -> Dict[str, Any]:
+        return {
+            "status": "ok" if coordinates else "not_found",
+            "coordinates": coordinates,
+            "cached": cached,
+        }
+
+    def shutdown(self, wait: bool = True):
+        """워커 풀 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
@@ -3,12 +3,13 @@ from enum import Enum
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime, timedelta
-import threading
 import time
 import random
 import json
 import asyncio
 from typing import Optional
+
+from core.backend.job_scheduler import job_scheduler
 form = None  # pyright: ignore
 """
 IoT 기기 시뮬레이터
@@ -70,37 +71,35 @@ class IoTDevice:
         self.status = DeviceStatus.ONLINE
         self.last_update = datetime.now()
         self.is_running = False
-        self.thread = None
         self.callback = None
 
+    @property
+    def job_name(self) -> str:
+        return f"iot_device.{self.device_id}"
+
     def start(self, callback=None):
         """기기 시작"""
         if not self.is_running:
             self.is_running = True
             self.callback = callback
-            self.thread = threading.Thread(target=self._run, daemon=True)
-            self.thread.start()
+            job_scheduler.add_job(self.job_name, self._tick, interval=self._get_interval(), initial_delay=0)
             logger.info(f"기기 {self.device_id} 시작됨")
 
     def stop(self):
         """기기 중지"""
         self.is_running = False
-        if self.thread:
-            self.thread.join()
+        job_scheduler.remove_job(self.job_name)
         logger.info(f"기기 {self.device_id} 중지됨")
 
-    def _run(self):
-        """기기 실행 루프"""
-        while self.is_running:
-            try:
-                data = self._generate_data()
-                if self.callback:
-                    self.callback(data)
-                time.sleep(self._get_interval())
-            except Exception as e:
-                logger.error(f"기기 {self.device_id} 오류: {e}")
-                self.status = DeviceStatus.ERROR
-                time.sleep(5)
+    def _tick(self):
+        """데이터 한 번 생성 (작업 스케줄러가 _get_interval()마다 실행)"""
+        try:
+            data = self._generate_data()
+            if self.callback:
+                self.callback(data)
+        except Exception:
+            self.status = DeviceStatus.ERROR
+            raise
 
     def _generate_data(self) -> SensorData:
         """데이터 생성 (하위 클래스에서 구현)"""
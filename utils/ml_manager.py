@@ -1,14 +1,14 @@
-from sklearn.preprocessing import StandardScaler  # pyright: ignore
 from sklearn.metrics import mean_squared_error  # pyright: ignore
 from sklearn.ensemble import RandomForestRegressor  # pyright: ignore
 import pandas as pd
-import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import os
 import logging
 import joblib
 import json
+
+from utils.model_registry import LoadedModel, ModelRegistry, model_registry
 form = None  # pyright: ignore
 """
 머신러닝 모델 관리 시스템
@@ -21,8 +21,17 @@ logger = logging.getLogger(__name__)
 class MLManager:
     """머신러닝 모델 관리자"""
 
-    def __init__(self, models_dir="ml_models"):
+    # 예측 종류별 (특성 벡터 생성 메서드, 결과 키, 결과 타입, 신뢰도)
+    PREDICTORS = {
+        "sales_prediction": ("_create_sales_features", "predicted_sales", float, 0.85),
+        "staff_prediction": ("_create_staff_features", "predicted_staff_count", int, 0.80),
+        "inventory_prediction": ("_create_inventory_features", "predicted_quantity", float, 0.82),
+    }
+
+    def __init__(self, models_dir="ml_models", registry: Optional[ModelRegistry] = None):
         self.models_dir = models_dir
+        # 학습된 모델은 버전별로 레지스트리에 저장하고, 예측 때는 메모리에 올라간 것을 사용
+        self.registry = registry or model_registry
         self.models = {}
         self.scalers = {}
         self.model_metadata = {}
@@ -34,43 +43,38 @@ class MLManager:
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
 
-        # 기존 모델 로드
-        self._load_existing_models()
-
-    def _load_existing_models(self):
-        """기존 저장된 모델들을 로드"""
-        if os.path.exists(self.models_dir):
-            for filename in os.listdir(self.models_dir):
-                if filename.endswith('.joblib'):
-                    model_name = filename.replace('.joblib', '')
-                    model_path = os.path.join(self.models_dir, filename)
-                    try:
-                        self.models[model_name] if models is not None else None = joblib.load(model_path)
-                        self.logger.info(f"모델 로드됨: {model_name}")
-                    except Exception as e:
-                        self.logger.error(f"모델 로드 실패 {model_name}: {e}")
-
-    def save_model(self,  model_name: str,  model, scaler=None, metadata={}):
-        """모델 저장"""
-        try:
-            # 모델 저장
-            model_path = os.path.join(self.models_dir, f"{model_name}.joblib")
-            joblib.dump(model, model_path)
-
-            # 스케일러 저장
-            if scaler:
+        # 예전 방식(models_dir/<이름>.joblib)으로 저장된 모델을 레지스트리로 옮김
+        self._import_legacy_models()
+
+    def _import_legacy_models(self):
+        """레지스트리에 없는 예전 모델 파일을 한 번 게시 (파일은 그대로 둠)"""
+        if not os.path.exists(self.models_dir):
+            return
+        for filename in os.listdir(self.models_dir):
+            if not filename.endswith('.joblib') or filename.endswith('_scaler.joblib'):
+                continue
+            model_name = filename.replace('.joblib', '')
+            if self.registry.current_version(model_name):
+                continue
+            try:
+                model = joblib.load(os.path.join(self.models_dir, filename))
                 scaler_path = os.path.join(self.models_dir, f"{model_name}_scaler.joblib")
-                joblib.dump(scaler, scaler_path)
-                self.scalers[model_name] if scalers is not None else None = scaler
-
-            # 메타데이터 저장
-            if metadata:
+                scaler = joblib.load(scaler_path) if os.path.exists(scaler_path) else None
                 metadata_path = os.path.join(self.models_dir, f"{model_name}_metadata.json")
-                with open(metadata_path, 'w', encoding='utf-8') as f:
-                    json.dump(metadata, f, ensure_ascii=False, indent=2)
-                self.model_metadata[model_name] if model_metadata is not None else None = metadata
+                metadata = {}
+                if os.path.exists(metadata_path):
+                    with open(metadata_path, 'r', encoding='utf-8') as f:
+                        metadata = json.load(f)
+                self.registry.publish(model_name, model, scaler, metadata)
+                self.logger.info(f"예전 모델 파일을 레지스트리로 옮김: {model_name}")
+            except Exception as e:
+                self.logger.error(f"모델 로드 실패 {model_name}: {e}")
 
-            self.models[model_name] if models is not None else None = model
+    def save_model(self,  model_name: str,  model, scaler=None, metadata=None):
+        """모델을 새 버전으로 게시 (이 프로세스의 예측은 즉시, 다른 워커는 다음 확인 때 교체)"""
+        try:
+            self.registry.publish(model_name, model, scaler, metadata)
+            self._remember(self.registry.get(model_name))
             self.logger.info(f"모델 저장됨: {model_name}")
             return True
 
@@ -78,92 +82,73 @@ class MLManager:
             self.logger.error(f"모델 저장 실패 {model_name}: {e}")
             return False
 
-    def load_model(self,  model_name: str):
-        """모델 로드"""
-        if model_name in self.models:
-            return self.models[model_name] if models is not None else None
-
-        model_path = os.path.join(self.models_dir, f"{model_name}.joblib")
-        if os.path.exists(model_path):
-            try:
-                model = joblib.load(model_path)
-                self.models[model_name] if models is not None else None = model
-                return model
-            except Exception as e:
-                self.logger.error(f"모델 로드 실패 {model_name}: {e}")
-
-        return None
+    def _remember(self, loaded: Optional[LoadedModel]):
+        """상태 조회용 모델/스케일러/메타데이터 맵 갱신"""
+        if loaded is None:
+            return
+        self.models[loaded.name] = loaded.model
+        if loaded.scaler is not None:
+            self.scalers[loaded.name] = loaded.scaler
+        self.model_metadata[loaded.name] = loaded.metadata
 
-    def predict_sales(self, features: Dict) -> Dict:
-        """매출 예측"""
-        model_name = "sales_prediction"
-        model = self.load_model(model_name)
-
-        if not model:
-            return {"error": "모델이 없습니다. 먼저 모델을 훈련하세요."}
+    def load_model(self,  model_name: str):
+        """현재 버전 모델 (파일은 버전마다 한 번만 읽음)"""
+        loaded = self.registry.get(model_name)
+        self._remember(loaded)
+        return loaded.model if loaded is not None else None
+
+    def delete_model(self, model_name: str) -> bool:
+        """모델의 모든 버전과 예전 파일 삭제"""
+        found = self.registry.remove(model_name)
+        for suffix in ('.joblib', '_scaler.joblib', '_metadata.json'):
+            path = os.path.join(self.models_dir, f"{model_name}{suffix}")
+            if os.path.exists(path):
+                os.remove(path)
+                found = True
+        self.models.pop(model_name, None)
+        self.scalers.pop(model_name, None)
+        self.model_metadata.pop(model_name, None)
+        return found
+
+    def predict_many(self, model_name: str, features_list: List[Dict]) -> List[Dict]:
+        """여러 입력을 모델 호출 한 번으로 예측 (입력 순서대로 결과 반환)"""
+        builder, result_key, cast, confidence = self.PREDICTORS[model_name]
+        loaded = self.registry.get(model_name)
+        if loaded is None:
+            return [{"error": "모델이 없습니다. 먼저 모델을 훈련하세요."} for _ in features_list]
+        self._remember(loaded)
 
         try:
-            # 특성 벡터 생성
-            feature_vector = self._create_sales_features(features)
-
-            # 예측
-            prediction = model.predict([feature_vector])[0]
-
-            return {
-                "predicted_sales": float(prediction),
-                "confidence": 0.85,  # 실제로는 모델의 신뢰도 계산
-                "features_used": list(features.keys())
+            # 특성 행렬 생성 후 한 번에 예측
+            rows = [getattr(self, builder)(features) for features in features_list]
+            predictions = loaded.predict(rows) if rows else []
+        except Exception as e:
+            self.logger.error(f"{model_name} 예측 실패: {e}")
+            return [{"error": f"예측 실패: {str(e)}"} for _ in features_list]
+
+        return [
+            {
+                result_key: cast(prediction),
+                "confidence": confidence,  # 실제로는 모델의 신뢰도 계산
+                "features_used": list(features.keys()),
+                "model_version": loaded.version,
             }
+            for features, prediction in zip(features_list, predictions)
+        ]
 
-        except Exception as e:
-            self.logger.error(f"매출 예측 실패: {e}")
-            return {"error": f"예측 실패: {str(e)}"}
+    def predict_sales(self, features: Dict) -> Dict:
+        """매출 예측"""
+        return self.predict_many("sales_prediction", [features])[0]
 
     def predict_staff_needs(self, features: Dict) -> Dict:
         """직원 필요 인원 예측"""
-        model_name = "staff_prediction"
-        model = self.load_model(model_name)
-
-        if not model:
-            return {"error": "모델이 없습니다. 먼저 모델을 훈련하세요."}
-
-        try:
-            feature_vector = self._create_staff_features(features)
-            prediction = model.predict([feature_vector])[0]
-
-            return {
-                "predicted_staff_count": int(prediction),
-                "confidence": 0.80,
-                "features_used": list(features.keys())
-            }
-
-        except Exception as e:
-            self.logger.error(f"직원 예측 실패: {e}")
-            return {"error": f"예측 실패: {str(e)}"}
+        return self.predict_many("staff_prediction", [features])[0]
 
     def predict_inventory_needs(self, features: Dict) -> Dict:
         """재고 필요량 예측"""
-        model_name = "inventory_prediction"
-        model = self.load_model(model_name)
-
-        if not model:
-            return {"error": "모델이 없습니다. 먼저 모델을 훈련하세요."}
-
-        try:
-            feature_vector = self._create_inventory_features(features)
-            prediction = model.predict([feature_vector])[0]
-
-            return {
-                "predicted_quantity": float(prediction),
-                "confidence": 0.82,
-                "features_used": list(features.keys())
-            }
-
-        except Exception as e:
-            self.logger.error(f"재고 예측 실패: {e}")
-            return {"error": f"예측 실패: {str(e)}"}
+        return self.predict_many("inventory_prediction", [features])[0]
 
-    def train_sales_model(self, data: List[Dict] if List is not None else None) -> Dict:
+    def train_sales_model(self, data: List[Dict]) -> Dict:
         """매출 예측 모델 훈련"""
         try:
             # 데이터 전처리
@@ -175,8 +160,8 @@ class MLManager:
 
             # 모델 평가
             y_pred = model.predict(X)
-            mse = mean_squared_error(y, y_pred)
-            r2 = model.score(X, y)
+            mse = float(mean_squared_error(y, y_pred))
+            r2 = float(model.score(X, y))
 
             # 모델 저장
             metadata = {
@@ -184,23 +169,23 @@ class MLManager:
                 "training_date": datetime.now().isoformat(),
                 "mse": mse,
                 "r2_score": r2,
-                "feature_importance": dict(zip(X.columns, model.feature_importances_))
+                "feature_importance": dict(zip(X.columns, map(float, model.feature_importances_)))
             }
 
-            self.save_model("sales_prediction",  model, model=metadata)
+            self.save_model("sales_prediction", model, metadata=metadata)
 
             return {
                 "success": True,
                 "mse": mse,
                 "r2_score": r2,
-                "feature_importance": metadata["feature_importance"] if metadata is not None else None
+                "feature_importance": metadata["feature_importance"]
             }
 
         except Exception as e:
             self.logger.error(f"매출 모델 훈련 실패: {e}")
             return {"error": f"훈련 실패: {str(e)}"}
 
-    def train_staff_model(self, data: List[Dict] if List is not None else None) -> Dict:
+    def train_staff_model(self, data: List[Dict]) -> Dict:
         """직원 필요 인원 예측 모델 훈련"""
         try:
             X, y = self._prepare_staff_data(data)
@@ -209,69 +194,69 @@ class MLManager:
             model.fit(X, y)
 
             y_pred = model.predict(X)
-            mse = mean_squared_error(y, y_pred)
-            r2 = model.score(X, y)
+            mse = float(mean_squared_error(y, y_pred))
+            r2 = float(model.score(X, y))
 
             metadata = {
                 "model_type": "RandomForestRegressor",
                 "training_date": datetime.now().isoformat(),
                 "mse": mse,
                 "r2_score": r2,
-                "feature_importance": dict(zip(X.columns, model.feature_importances_))
+                "feature_importance": dict(zip(X.columns, map(float, model.feature_importances_)))
             }
 
-            self.save_model("staff_prediction",  model, model=metadata)
+            self.save_model("staff_prediction", model, metadata=metadata)
 
             return {
                 "success": True,
                 "mse": mse,
                 "r2_score": r2,
-                "feature_importance": metadata["feature_importance"] if metadata is not None else None
+                "feature_importance": metadata["feature_importance"]
             }
 
         except Exception as e:
             self.logger.error(f"직원 모델 훈련 실패: {e}")
             return {"error": f"훈련 실패: {str(e)}"}
 
-    def _create_sales_features(self, features: Dict) -> List[float] if List is not None else None:
+    def _create_sales_features(self, features: Dict) -> List[float]:
         """매출 예측용 특성 벡터 생성"""
         # 기본 특성들
         feature_vector = [
-            features.get() if features else None'day_of_week', 0) if features else None,
-            features.get() if features else None'month', 0) if features else None,
-            features.get() if features else None'is_holiday', 0) if features else None,
-            features.get() if features else None'temperature', 20) if features else None,
-            features.get() if features else None'precipitation', 0) if features else None,
-            features.get() if features else None'previous_sales', 0) if features else None,
-            features.get() if features else None'staff_count', 0) if features else None,
-            features.get() if features else None'special_event', 0) if features else None
+            features.get('day_of_week', 0),
+            features.get('month', 0),
+            features.get('is_holiday', 0),
+            features.get('temperature', 20),
+            features.get('precipitation', 0),
+            features.get('previous_sales', 0),
+            features.get('staff_count', 0),
+            features.get('special_event', 0)
         ]
         return feature_vector
 
-    def _create_staff_features(self, features: Dict) -> List[float] if List is not None else None:
+    def _create_staff_features(self, features: Dict) -> List[float]:
         """직원 예측용 특성 벡터 생성"""
         feature_vector = [
-            features.get() if features else None'expected_sales', 0) if features else None,
-            features.get() if features else None'day_of_week', 0) if features else None,
-            features.get() if features else None'is_holiday', 0) if features else None,
-            features.get() if features else None'special_event', 0) if features else None,
-            features.get() if features else None'current_staff', 0) if features else None,
-            features.get() if features else None'avg_order_time', 0) if features else None
+            features.get('expected_sales', 0),
+            features.get('day_of_week', 0),
+            features.get('is_holiday', 0),
+            features.get('special_event', 0),
+            features.get('current_staff', 0),
+            features.get('avg_order_time', 0)
         ]
         return feature_vector
 
-    def _create_inventory_features(self, features: Dict) -> List[float] if List is not None else None:
+    def _create_inventory_features(self, features: Dict) -> List[float]:
         """재고 예측용 특성 벡터 생성"""
         feature_vector = [
-            features.get() if features else None'current_stock', 0) if features else None,
-            features.get() if features else None'daily_usage', 0) if features else None,
-            features.get() if features else None'lead_time', 0) if features else None,
-            features.get() if features else None'safety_stock', 0) if features else None,
-            features.get() if features else None'seasonal_factor', 1.0) if features else None
+            features.get('current_stock', 0),
+            features.get('daily_usage', 0),
+            features.get('lead_time', 0),
+            features.get('safety_stock', 0),
+            features.get('seasonal_factor', 1.0)
         ]
         return feature_vector
 
-    def _prepare_sales_data(self, data: List[Dict] if List is not None else None) -> Tuple[pd.DataFrame, pd.Series] if Tuple is not None else None:
+    def _prepare_sales_data(self, data: List[Dict]) -> Tuple[pd.DataFrame, pd.Series]:
         """매출 데이터 전처리"""
         df = pd.DataFrame(data)
 
@@ -279,29 +264,32 @@ class MLManager:
         features = ['day_of_week', 'month', 'is_holiday', 'temperature',
                     'precipitation', 'previous_sales', 'staff_count', 'special_event']
 
-        X = df[features] if df is not None else None.fillna(0)
-        y = df['sales'] if df is not None else None
+        X = df[features].fillna(0)
+        y = df['sales']
 
         return X, y
 
-    def _prepare_staff_data(self, data: List[Dict] if List is not None else None) -> Tuple[pd.DataFrame, pd.Series] if Tuple is not None else None:
+    def _prepare_staff_data(self, data: List[Dict]) -> Tuple[pd.DataFrame, pd.Series]:
         """직원 데이터 전처리"""
         df = pd.DataFrame(data)
 
         features = ['expected_sales', 'day_of_week', 'is_holiday',
                     'special_event', 'current_staff', 'avg_order_time']
 
-        X = df[features] if df is not None else None.fillna(0)
-        y = df['required_staff'] if df is not None else None
+        X = df[features].fillna(0)
+        y = df['required_staff']
 
         return X, y
 
     def get_model_status(self) -> Dict:
         """모델 상태 정보 반환"""
+        for model_name in self.registry.model_names():
+            self.load_model(model_name)
         status = {
             "total_models": len(self.models),
             "available_models": list(self.models.keys()),
-            "model_metadata": self.model_metadata
+            "model_metadata": self.model_metadata,
+            "registry": self.registry.status()
         }
         return status
 
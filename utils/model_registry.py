@@ -0,0 +1,270 @@
+"""
+학습된 모델 레지스트리
+학습(재훈련 파이프라인)과 추론을 분리해, 추론 쪽은 버전별 모델 파일을 한 번만 읽어 메모리에 유지한다.
+
+- 저장 구조: <root>/<모델 이름>/versions/<버전>/{model.joblib, scaler.joblib, metadata.json}
+  + <root>/<모델 이름>/CURRENT (현재 버전 이름)
+- publish()는 새 버전 디렉토리를 다 쓴 뒤 CURRENT를 os.replace로 교체하므로
+  읽는 쪽은 항상 완성된 버전만 본다. 같은 프로세스에서는 즉시, 다른 프로세스(워커)는
+  CURRENT 변경을 check_interval마다 확인해 새 버전으로 교체한다.
+- 모델은 압축 없이 저장하고 joblib.load(mmap_mode="r")로 읽어 큰 배열은 메모리 맵으로 공유
+- 메모리의 모델 항목은 불변 객체로 통째로 바꿔 끼우므로 예측 중인 요청은 이전 버전을 끝까지 사용
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import joblib
+import numpy as np
+
+from core.backend.service_registry import service_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY_DIR = os.environ.get("MODEL_REGISTRY_DIR", "data/ai_models")
+# 다른 프로세스의 새 버전 확인 주기 (초)
+DEFAULT_CHECK_INTERVAL = 1.0
+# 모델별로 남겨 둘 버전 수 (롤백용)
+DEFAULT_KEEP_VERSIONS = 5
+
+
+@dataclass(frozen=True)
+class LoadedModel:
+    """메모리에 올라간 모델 한 버전 (교체 시 통째로 바뀜)"""
+
+    name: str
+    version: str
+    model: Any
+    scaler: Any = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    loaded_at: float = field(default_factory=time.time)
+
+    def transform(self, rows: Union[Sequence[Sequence[float]], np.ndarray]) -> np.ndarray:
+        """입력 행렬 (스케일러가 있으면 적용)"""
+        X = np.asarray(rows, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        return self.scaler.transform(X) if self.scaler is not None else X
+
+    def predict(self, rows: Union[Sequence[Sequence[float]], np.ndarray]) -> np.ndarray:
+        return self.model.predict(self.transform(rows))
+
+
+class ModelRegistry:
+    """버전별 모델 저장소 + 메모리 상주 추론용 캐시"""
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_REGISTRY_DIR,
+                 check_interval: float = DEFAULT_CHECK_INTERVAL,
+                 keep_versions: int = DEFAULT_KEEP_VERSIONS, mmap: bool = True):
+        self.root = Path(root)
+        self.check_interval = check_interval
+        self.keep_versions = keep_versions
+        self.mmap = mmap
+        self._models: Dict[str, LoadedModel] = {}
+        self._checked: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self.stats = {"loads": 0, "swaps": 0, "publishes": 0, "predictions": 0}
+
+    # ==================== 경로 ====================
+
+    def _model_dir(self, name: str) -> Path:
+        return self.root / name
+
+    def _version_dir(self, name: str, version: str) -> Path:
+        return self._model_dir(name) / "versions" / version
+
+    def current_version(self, name: str) -> Optional[str]:
+        """CURRENT 파일의 버전 (없으면 None)"""
+        try:
+            return (self._model_dir(name) / "CURRENT").read_text(encoding="utf-8").strip() or None
+        except FileNotFoundError:
+            return None
+
+    def versions(self, name: str) -> List[str]:
+        """저장된 버전 목록 (오래된 순)"""
+        versions_dir = self._model_dir(name) / "versions"
+        if not versions_dir.exists():
+            return []
+        return sorted(p.name for p in versions_dir.iterdir() if p.is_dir() and not p.name.startswith("."))
+
+    def model_names(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if (p / "CURRENT").exists())
+
+    # ==================== 게시 (학습 파이프라인) ====================
+
+    def publish(self, name: str, model: Any, scaler: Any = None,
+                metadata: Optional[Dict[str, Any]] = None) -> str:
+        """새 버전을 저장하고 현재 버전으로 지정. 같은 프로세스의 추론은 바로 새 버전을 사용"""
+        version = f"{datetime.now().strftime('%Y%m%d%H%M%S%f')}_{os.getpid()}"
+        metadata = dict(metadata or {}, model_name=name, version=version,
+                        published_at=datetime.now().isoformat())
+
+        # 임시 디렉토리에 다 쓴 뒤 이름을 바꿔, 반쯤 쓰인 버전이 보이지 않게 함
+        final_dir = self._version_dir(name, version)
+        tmp_dir = final_dir.with_name(f".{version}.tmp")
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        joblib.dump(model, tmp_dir / "model.joblib")
+        if scaler is not None:
+            joblib.dump(scaler, tmp_dir / "scaler.joblib")
+        with open(tmp_dir / "metadata.json", "w", encoding="utf-8") as f:
+            json.dump(metadata, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp_dir, final_dir)
+
+        self._set_current(name, version)
+        with self._lock:
+            self._swap(LoadedModel(name, version, model, scaler, metadata))
+        self.stats["publishes"] += 1
+        self._prune(name)
+        logger.info(f"모델 게시: {name} {version}")
+        return version
+
+    def activate(self, name: str, version: str) -> bool:
+        """저장된 버전으로 되돌리기 (롤백)"""
+        if not self._version_dir(name, version).exists():
+            return False
+        self._set_current(name, version)
+        with self._lock:
+            self._checked.pop(name, None)
+        return self.get(name) is not None
+
+    def _set_current(self, name: str, version: str):
+        pointer = self._model_dir(name) / "CURRENT"
+        tmp = pointer.with_name(f".CURRENT.{os.getpid()}.{threading.get_ident()}")
+        tmp.write_text(version, encoding="utf-8")
+        os.replace(tmp, pointer)
+
+    def _prune(self, name: str):
+        current = self.current_version(name)
+        for version in self.versions(name)[:-self.keep_versions or None]:
+            if version != current:
+                shutil.rmtree(self._version_dir(name, version), ignore_errors=True)
+
+    # ==================== 조회 (추론) ====================
+
+    def _load_file(self, path: Path) -> Any:
+        if self.mmap:
+            try:
+                return joblib.load(path, mmap_mode="r")
+            except Exception:
+                pass
+        return joblib.load(path)
+
+    def _load(self, name: str, version: str) -> Optional[LoadedModel]:
+        version_dir = self._version_dir(name, version)
+        try:
+            model = self._load_file(version_dir / "model.joblib")
+            scaler_path = version_dir / "scaler.joblib"
+            scaler = self._load_file(scaler_path) if scaler_path.exists() else None
+            metadata_path = version_dir / "metadata.json"
+            metadata = {}
+            if metadata_path.exists():
+                with open(metadata_path, "r", encoding="utf-8") as f:
+                    metadata = json.load(f)
+        except Exception as e:
+            logger.error(f"모델 로드 실패 {name} {version}: {e}")
+            return None
+        self.stats["loads"] += 1
+        return LoadedModel(name, version, model, scaler, metadata)
+
+    def _swap(self, loaded: LoadedModel):
+        previous = self._models.get(loaded.name)
+        self._models[loaded.name] = loaded
+        self._checked[loaded.name] = time.monotonic()
+        if previous is not None and previous.version != loaded.version:
+            self.stats["swaps"] += 1
+
+    def get(self, name: str) -> Optional[LoadedModel]:
+        """현재 버전 모델 (처음 한 번만 파일에서 읽고, 이후에는 메모리의 것을 반환)"""
+        loaded = self._models.get(name)
+        now = time.monotonic()
+        if name in self._checked and now - self._checked[name] < self.check_interval:
+            return loaded
+
+        with self._lock:
+            self._checked[name] = now
+            version = self.current_version(name)
+            if version is None:
+                # 게시된 적 없거나 다른 프로세스에서 삭제됨
+                self._models.pop(name, None)
+                return None
+            loaded = self._models.get(name)
+            if loaded is not None and loaded.version == version:
+                return loaded
+            fresh = self._load(name, version)
+            if fresh is None:
+                return loaded
+            self._swap(fresh)
+            return fresh
+
+    def warm(self) -> Dict[str, str]:
+        """게시된 모든 모델의 현재 버전을 메모리에 올림 (--preload 마스터에서 포크 전에 호출)"""
+        loaded = {}
+        for name in self.model_names():
+            model = self.get(name)
+            if model is not None:
+                loaded[name] = model.version
+        return loaded
+
+    def predict_many(self, name: str, rows: Union[Sequence[Sequence[float]], np.ndarray]) -> np.ndarray:
+        """여러 입력을 모델 호출 한 번으로 예측. 모델이 없으면 LookupError"""
+        loaded = self.get(name)
+        if loaded is None:
+            raise LookupError(f"게시된 모델이 없습니다: {name}")
+        self.stats["predictions"] += len(rows)
+        return loaded.predict(rows)
+
+    def remove(self, name: str) -> bool:
+        """모델의 모든 버전 삭제"""
+        model_dir = self._model_dir(name)
+        with self._lock:
+            self._models.pop(name, None)
+            self._checked.pop(name, None)
+            if not model_dir.exists():
+                return False
+            shutil.rmtree(model_dir, ignore_errors=True)
+            return True
+
+    def evict(self, name: str):
+        """메모리에서 제거 (다음 조회 때 다시 읽음)"""
+        with self._lock:
+            self._models.pop(name, None)
+            self._checked.pop(name, None)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "root": str(self.root),
+            "loaded": {name: loaded.version for name, loaded in self._models.items()},
+            "stats": dict(self.stats),
+        }
+
+
+_registries: Dict[str, ModelRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_model_registry(root: Union[str, Path] = DEFAULT_REGISTRY_DIR) -> ModelRegistry:
+    """경로별 레지스트리 (같은 경로면 같은 인스턴스)"""
+    key = os.path.abspath(root)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = ModelRegistry(root)
+            _registries[key] = registry
+        return registry
+
+
+# 전역 모델 레지스트리 (재훈련 파이프라인이 게시하고, 예측 코드가 읽음)
+model_registry = get_model_registry()
+
+# 읽기 전용 상태라 --preload 마스터에서 미리 올려 두면 워커들이 copy-on-write로 공유
+service_registry.register("ml.model_registry.warm", model_registry.warm, shared=True)
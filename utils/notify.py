@@ -7,6 +7,8 @@ import requests
 import smtplib
 import logging
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 query = None  # pyright: ignore
 config = None  # pyright: ignore
 """
@@ -364,16 +366,17 @@ def send_notification_to_user(user,  content, category="공지", link=None):
 
 def send_notification_to_multiple_users(user_ids,  content, category="공지", link=None):
     """
-    여러 사용자에게 동일한 알림 발송
+    여러 사용자에게 동일한 알림 발송 (청크 단위 일괄 저장)
     """
-    success_count = 0
-    if user_ids is not None:
-        for user_id in user_ids:
-            success, _ = send_notification_enhanced(user_id,  content,  category,  link)
-            if success:
-                success_count += 1
+    if not user_ids:
+        return 0, 0
 
-    return success_count, len(user_ids) if user_ids is not None else 0
+    try:
+        stats = send_bulk_notification(content, user_ids=user_ids, category=category, link=link)
+        return stats["created"], len(user_ids)
+    except Exception as e:
+        logger.error(f"다중 사용자 알림 발송 실패: {e}")
+        return 0, len(user_ids)
 
 
 # 특정 상황별 알림 함수들
@@ -429,14 +432,10 @@ def notify_new_notice(notice, target_users=None):
     link = f"/notice_view/{notice.id}"
 
     if target_users:
-        if target_users is not None:
-            for user in target_users:
-                send_notification_enhanced(user.id,  content,  "공지",  link)
-    else:
-        users = User.query.filter_by(status="approved").all()  # pyright: ignore
-        if users is not None:
-            for user in users:
-                send_notification_enhanced(user.id,  content,  "공지",  link)
+        return send_bulk_notification(
+            content, user_ids=[user.id for user in target_users], category="공지", link=link
+        )
+    return send_bulk_notification(content, status="approved", category="공지", link=link)
 
 
 def notify_attendance_reminder(user,  date):
@@ -449,20 +448,248 @@ def notify_attendance_reminder(user,  date):
 def notify_system_announcement(message, category="공지", target_users=None):
     """시스템 공지 알림"""
     if target_users:
-        if target_users is not None:
-            for user in target_users:
-                send_notification_enhanced(user.id,  message,  category,  None)
-    else:
-        users = User.query.filter_by(status="approved").all()  # pyright: ignore
-        if users is not None:
-            for user in users:
-                send_notification_enhanced(user.id,  message,  category,  None)
+        return send_bulk_notification(
+            message, user_ids=[user.id for user in target_users], category=category
+        )
+    return send_bulk_notification(message, status="approved", category=category)
 
 
 # 글로벌 알림 서비스 인스턴스
 notification_service = NotificationService()
 
 
+# 대량 알림 설정
+BULK_INSERT_CHUNK_SIZE = 1000  # bulk_insert_mappings 한 번에 넣을 행 수
+RECIPIENT_ID_CHUNK_SIZE = 900  # IN 조건 한 번에 넣을 ID 수 (SQLite 바인드 변수 제한)
+DELIVERY_BATCH_SIZE = 100  # 워커 작업 하나가 처리할 수신자 수
+DELIVERY_CHANNELS = ("email", "kakao", "sms")
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def bulk_create_notifications(mappings, chunk_size=BULK_INSERT_CHUNK_SIZE, commit=True):
+    """
+    Notification 행을 청크 단위 다중 행 INSERT로 저장
+    Args:
+        mappings: Notification 컬럼 딕셔너리 목록 (user_id, content 필수)
+        commit: False면 호출한 쪽 트랜잭션에 포함시키고 커밋하지 않음
+    Returns:
+        int: 저장한 행 수
+    """
+    from models_main import db, Notification  # pyright: ignore
+
+    if not mappings:
+        return 0
+
+    now = datetime.utcnow()
+    try:
+        for chunk in _chunks(list(mappings), chunk_size):
+            for mapping in chunk:
+                mapping.setdefault("created_at", now)
+            db.session.bulk_insert_mappings(Notification, chunk)
+        if commit:
+            db.session.commit()
+        return len(mappings)
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+class BulkNotificationSender:
+    """
+    대량 알림 발송기
+    수신자를 한 번의 쿼리로 조회하고, 알림 행은 청크 단위로 일괄 저장하며,
+    이메일/카카오톡/SMS 전송은 워커 풀에 맡긴 뒤 채널별 결과를 집계한다.
+    """
+
+    def __init__(self, service=None, max_workers=8, chunk_size=BULK_INSERT_CHUNK_SIZE,
+                 delivery_batch_size=DELIVERY_BATCH_SIZE):
+        self.service = service or notification_service
+        self.chunk_size = chunk_size
+        self.delivery_batch_size = delivery_batch_size
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="notify-delivery"
+                )
+            return self._executor
+
+    def resolve_recipients(self, user_ids=None, roles=None, branch_ids=None, status=None,
+                           exclude_user_ids=None):
+        """
+        조건에 맞는 수신자(id, 이름, 이메일, 전화번호) 조회
+        user_ids가 주어지면 IN 조건을 RECIPIENT_ID_CHUNK_SIZE 단위로 나눠 조회한다.
+        """
+        from models_main import db, User  # pyright: ignore
+
+        query = db.session.query(
+            User.id, User.name, User.username, User.email, User.phone
+        ).filter(User.deleted_at.is_(None))
+        if roles:
+            query = query.filter(User.role.in_(list(roles)))
+        if branch_ids:
+            query = query.filter(User.branch_id.in_(list(branch_ids)))
+        if status:
+            query = query.filter(User.status == status)
+
+        if user_ids is None:
+            recipients = query.order_by(User.id).all()
+        else:
+            recipients = []
+            for chunk in _chunks(sorted(set(user_ids)), RECIPIENT_ID_CHUNK_SIZE):
+                recipients.extend(query.filter(User.id.in_(chunk)).order_by(User.id).all())
+
+        if exclude_user_ids:
+            excluded = set(exclude_user_ids)
+            recipients = [r for r in recipients if r.id not in excluded]
+        return recipients
+
+    def existing_user_ids(self, user_ids, status=None):
+        """주어진 ID 중 삭제되지 않은(status가 주어지면 그 상태인) 사용자 ID 집합 (ID 컬럼만 조회)"""
+        from models_main import db, User  # pyright: ignore
+
+        query = db.session.query(User.id).filter(User.deleted_at.is_(None))
+        if status:
+            query = query.filter(User.status == status)
+        existing = set()
+        for chunk in _chunks(sorted(set(user_ids)), RECIPIENT_ID_CHUNK_SIZE):
+            existing.update(row.id for row in query.filter(User.id.in_(chunk)))
+        return existing
+
+    def send(self, content, user_ids=None, roles=None, branch_ids=None, status=None,
+             exclude_user_ids=None, category="공지", link=None, title=None, priority="일반",
+             is_admin_only=False, channels=(), wait=True):
+        """
+        대량 알림 발송
+        Args:
+            user_ids/roles/branch_ids/status: 수신자 조건 (모두 비우면 전체 사용자)
+            channels: DELIVERY_CHANNELS 중 함께 보낼 외부 채널
+            wait: True면 외부 채널 전송이 끝날 때까지 기다린 뒤 결과 반환
+        Returns:
+            dict: recipients, created, channels(채널별 queued/sent/failed/skipped)
+        """
+        unknown = set(channels) - set(DELIVERY_CHANNELS)
+        if unknown:
+            raise ValueError(f"지원하지 않는 알림 채널: {', '.join(sorted(unknown))}")
+
+        stats = {
+            "recipients": 0,
+            "created": 0,
+            "channels": {
+                channel: {"queued": 0, "sent": 0, "failed": 0, "skipped": 0}
+                for channel in channels
+            },
+        }
+
+        if user_ids is not None and not (roles or branch_ids or channels):
+            # ID만 주어진 내부 알림은 ID 컬럼만 조회해 없는/삭제된 사용자를 거른 뒤 저장
+            excluded = set(exclude_user_ids or ())
+            candidates = [uid for uid in dict.fromkeys(user_ids) if uid not in excluded]
+            existing = self.existing_user_ids(candidates, status) if candidates else set()
+            recipients = [uid for uid in candidates if uid in existing]
+            recipient_ids = recipients
+        else:
+            recipients = self.resolve_recipients(
+                user_ids, roles, branch_ids, status, exclude_user_ids
+            )
+            recipient_ids = [r.id for r in recipients]
+        stats["recipients"] = len(recipient_ids)
+
+        mappings = [
+            {
+                "user_id": user_id,
+                "content": content,
+                "title": title,
+                "category": category,
+                "link": link,
+                "priority": priority,
+                "is_admin_only": is_admin_only,
+            }
+            for user_id in recipient_ids
+        ]
+        stats["created"] = bulk_create_notifications(mappings, self.chunk_size)
+
+        futures = []
+        for channel in channels:
+            futures.extend(self._enqueue_channel(channel, recipients, title or category,
+                                                 content, stats["channels"][channel]))
+        if wait:
+            for future in futures:
+                future.result()
+
+        logger.info(
+            f"대량 알림 발송: 수신자 {stats['recipients']}명, 저장 {stats['created']}건, "
+            f"채널 {stats['channels']}"
+        )
+        return stats
+
+    def _enqueue_channel(self, channel, recipients, subject, content, channel_stats):
+        targets = []
+        for recipient in recipients:
+            if channel == "email" and not recipient.email:
+                channel_stats["skipped"] += 1
+            elif channel == "sms" and not recipient.phone:
+                channel_stats["skipped"] += 1
+            else:
+                targets.append(recipient)
+        channel_stats["queued"] = len(targets)
+
+        return [
+            self.executor.submit(self._deliver_batch, channel, batch, subject, content,
+                                 channel_stats)
+            for batch in _chunks(targets, self.delivery_batch_size)
+        ]
+
+    def _deliver_batch(self, channel, recipients, subject, content, channel_stats):
+        sent = failed = 0
+        for recipient in recipients:
+            try:
+                if channel == "email":
+                    success, _ = self.service.send_email(recipient.email, subject, content)
+                elif channel == "kakao":
+                    success, _ = self.service.send_kakao_message(recipient.id, content)
+                else:
+                    success, _ = self.service.send_sms(recipient.phone, content)
+            except Exception as e:
+                logger.warning(f"{channel} 알림 전송 실패 (user={recipient.id}): {e}")
+                success = False
+            if success:
+                sent += 1
+            else:
+                failed += 1
+
+        with self._lock:
+            channel_stats["sent"] += sent
+            channel_stats["failed"] += failed
+
+    def shutdown(self, wait=True):
+        """워커 풀 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# 글로벌 대량 알림 발송기
+bulk_notification_sender = BulkNotificationSender()
+
+
+def send_bulk_notification(content, **kwargs):
+    """
+    대량 알림 발송 (BulkNotificationSender.send 참고)
+    """
+    return bulk_notification_sender.send(content, **kwargs)
+
+
 def send_order_approval_notification(order):
     """발주 승인 시 담당 매니저와 발주자 모두에게 알림"""
     try:
@@ -495,22 +722,12 @@ def send_order_approval_notification(order):
 def send_admin_only_notification(content, category="공지", link=None):
     """관리자만 볼 수 있는 시스템 알림"""
     try:
-        admins = User.query.filter_by(role="admin").all()  # pyright: ignore
-        if admins is not None:
-            for admin in admins:
-                notification = Notification()  # pyright: ignore
-                notification.user_id = admin.id
-                notification.content = content
-                notification.category = category
-                notification.link = link
-                notification.is_admin_only = True
-                db.session.add(notification)  # pyright: ignore
-
-        db.session.commit()  # pyright: ignore
+        send_bulk_notification(
+            content, roles=["admin"], category=category, link=link, is_admin_only=True
+        )
         return True
     except Exception as e:
         logger.error(f"관리자 전용 알림 발송 실패: {e}")
-        db.session.rollback()  # pyright: ignore
         return False
 
 
@@ -519,22 +736,12 @@ def send_notification_to_role(
 ):
     """특정 역할의 사용자들에게 알림 발송"""
     try:
-        users = User.query.filter_by(role=role).all()  # pyright: ignore
-        if users is not None:
-            for user in users:
-                notification = Notification()  # pyright: ignore
-                notification.user_id = user.id
-                notification.content = content
-                notification.category = category
-                notification.link = link
-                notification.is_admin_only = is_admin_only
-                db.session.add(notification)  # pyright: ignore
-
-        db.session.commit()  # pyright: ignore
+        send_bulk_notification(
+            content, roles=[role], category=category, link=link, is_admin_only=is_admin_only
+        )
         return True
     except Exception as e:
         logger.error(f"역할별 알림 발송 실패: {e}")
-        db.session.rollback()  # pyright: ignore
         return False
 
 
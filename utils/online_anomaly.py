@@ -0,0 +1,369 @@
+"""
+온라인(증분) 이상 탐지 엔진
+브랜드/지점 같은 시계열마다 고정 크기 상태만 유지하고, 새 값이 들어오면 과거 이력 없이
+O(1)로 점수를 계산한다. 여러 시계열의 값을 한 번에 넘기면 numpy로 묶어서 처리한다.
+
+- 상태: 지수이동평균(EWMA), 스트리밍 중앙값/MAD 근사(robust z-score), 최근 비율 버퍼
+- 판정: 평균 대비 변화율 조건 + (robust z-score 또는 Isolation Forest 이상치)
+- Isolation Forest는 요청 경로가 아닌 작업 스케줄러에서 주기적으로 다시 학습하고 통째로 교체
+- 일 단위 값은 day를 함께 넘기면 시계열마다 같은 날(또는 지난 날) 값을 다시 반영하지 않음
+- OnlineAnomalyStateStore로 상태를 사이드카 SQLite에 저장해 여러 워커/재시작 사이에 공유
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from core.backend.job_scheduler import job_scheduler
+from core.backend.sidecar_db import get_sidecar_db
+
+logger = logging.getLogger(__name__)
+
+# 이동평균 가중치 (span 7일 ≈ 2 / (7 + 1))
+DEFAULT_ALPHA = 0.25
+# 스트리밍 중앙값 이동 폭 (현재 척도 대비)
+DEFAULT_MEDIAN_RATE = 0.1
+# MAD가 0에 가까울 때 쓰는 최소 척도 (중앙값 대비)
+MIN_RELATIVE_SCALE = 0.01
+# 아직 일 단위 값을 받은 적 없는 시계열의 마지막 날짜
+NO_DAY = -1
+
+
+class OnlineAnomalyDetector:
+    """시계열별 고정 크기 상태로 새 값을 O(1)에 채점하는 탐지기"""
+
+    def __init__(self, direction: str = "both", change_threshold: float = 0.3,
+                 z_threshold: float = 3.0, min_points: int = 7,
+                 alpha: float = DEFAULT_ALPHA, median_rate: float = DEFAULT_MEDIAN_RATE,
+                 window: int = 60, capacity: int = 64,
+                 refit_interval: float = 3600.0, refit_min_samples: int = 200,
+                 contamination: float = 0.05):
+        if direction not in ("drop", "rise", "both"):
+            raise ValueError(f"알 수 없는 방향: {direction}")
+        self.direction = direction
+        self.change_threshold = change_threshold
+        self.z_threshold = z_threshold
+        self.min_points = min_points
+        self.alpha = alpha
+        self.median_rate = median_rate
+        self.window = window
+        self.refit_interval = refit_interval
+        self.refit_min_samples = refit_min_samples
+        self.contamination = contamination
+
+        self._index: Dict[Hashable, int] = {}
+        self._keys: List[Hashable] = []
+        self._count = np.zeros(capacity, dtype=np.int64)
+        self._mean = np.zeros(capacity)
+        self._median = np.zeros(capacity)
+        self._mad = np.zeros(capacity)
+        self._last = np.zeros(capacity)
+        # 시계열별 마지막으로 반영한 날짜 (date.toordinal(), 일 단위 멱등 처리용)
+        self._day = np.full(capacity, NO_DAY, dtype=np.int64)
+        # 시계열별 최근 (값 / 직전 평균) 비율 (Isolation Forest 학습용 링 버퍼)
+        self._ratios = np.full((capacity, window), np.nan)
+
+        self._lock = threading.Lock()
+        self._forest = None
+        # 탐지기마다 재학습 작업 하나 (프로세스별 상태라 singleton 아님)
+        self._refit_job = f"online_anomaly.refit.{id(self):x}"
+        self._refit_started = False
+        self.stats = {"points": 0, "batches": 0, "anomalies": 0, "refits": 0}
+
+    # ==================== 상태 관리 ====================
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _grow(self, size: int):
+        capacity = len(self._count)
+        while capacity < size:
+            capacity *= 2
+        extra = capacity - len(self._count)
+        self._count = np.concatenate([self._count, np.zeros(extra, dtype=np.int64)])
+        self._mean = np.concatenate([self._mean, np.zeros(extra)])
+        self._median = np.concatenate([self._median, np.zeros(extra)])
+        self._mad = np.concatenate([self._mad, np.zeros(extra)])
+        self._last = np.concatenate([self._last, np.zeros(extra)])
+        self._day = np.concatenate([self._day, np.full(extra, NO_DAY, dtype=np.int64)])
+        self._ratios = np.vstack([self._ratios, np.full((extra, self.window), np.nan)])
+
+    def _slots(self, keys: Sequence[Hashable]) -> np.ndarray:
+        """키 -> 상태 배열 위치 (처음 보는 키는 새 칸 할당)"""
+        slots = np.empty(len(keys), dtype=np.int64)
+        for i, key in enumerate(keys):
+            slot = self._index.get(key)
+            if slot is None:
+                slot = len(self._keys)
+                self._index[key] = slot
+                self._keys.append(key)
+            slots[i] = slot
+        if len(self._keys) > len(self._count):
+            self._grow(len(self._keys))
+        return slots
+
+    def state(self, key: Hashable) -> Optional[Dict[str, float]]:
+        """시계열 하나의 현재 상태"""
+        slot = self._index.get(key)
+        if slot is None:
+            return None
+        return {
+            "count": int(self._count[slot]),
+            "average": float(self._mean[slot]),
+            "median": float(self._median[slot]),
+            "mad": float(self._mad[slot]),
+            "last": float(self._last[slot]),
+        }
+
+    def reset(self, key: Hashable) -> bool:
+        """시계열 하나의 상태 초기화 (자리는 유지)"""
+        with self._lock:
+            slot = self._index.get(key)
+            if slot is None:
+                return False
+            self._count[slot] = 0
+            self._mean[slot] = self._median[slot] = self._mad[slot] = self._last[slot] = 0.0
+            self._day[slot] = NO_DAY
+            self._ratios[slot] = np.nan
+            return True
+
+    def export_state(self, keys: Sequence[Hashable]) -> List[Dict[str, Any]]:
+        """시계열들의 전체 상태 (비율 버퍼 포함, 저장용)"""
+        rows = []
+        with self._lock:
+            for key in keys:
+                slot = self._index.get(key)
+                if slot is None:
+                    continue
+                rows.append({
+                    "key": key,
+                    "count": int(self._count[slot]),
+                    "mean": float(self._mean[slot]),
+                    "median": float(self._median[slot]),
+                    "mad": float(self._mad[slot]),
+                    "last": float(self._last[slot]),
+                    "day": int(self._day[slot]),
+                    "ratios": self._ratios[slot].tobytes(),
+                })
+        return rows
+
+    def load_state(self, rows: Sequence[Dict[str, Any]]):
+        """export_state()로 저장한 상태를 덮어쓰기 (창 크기가 다르면 비율 버퍼는 비움)"""
+        with self._lock:
+            slots = self._slots([row["key"] for row in rows])
+            for slot, row in zip(slots, rows):
+                self._count[slot] = row["count"]
+                self._mean[slot] = row["mean"]
+                self._median[slot] = row["median"]
+                self._mad[slot] = row["mad"]
+                self._last[slot] = row["last"]
+                self._day[slot] = row["day"]
+                ratios = np.frombuffer(row["ratios"] or b"", dtype=float)
+                self._ratios[slot] = ratios if len(ratios) == self.window else np.nan
+
+    # ==================== 채점 ====================
+
+    def update(self, keys: Sequence[Hashable], values: Sequence[float],
+               day: Optional[int] = None) -> Dict[str, Any]:
+        """
+        여러 시계열의 새 값을 한 번에 채점한 뒤 상태에 반영
+        반환값은 입력 순서와 같은 배열들: anomaly, z_score, change, average, forest_score, skipped
+        day(date.toordinal())를 넘기면 그날 이후 값이 이미 반영된 시계열은 건너뛰고 skipped로 표시
+        """
+        values = np.asarray(values, dtype=float)
+        if len(keys) != len(values):
+            raise ValueError("키와 값의 개수가 다릅니다.")
+        result = {
+            "keys": list(keys),
+            "anomaly": np.zeros(len(values), dtype=bool),
+            "z_score": np.zeros(len(values)),
+            "change": np.zeros(len(values)),
+            "average": np.zeros(len(values)),
+            "forest_score": np.full(len(values), np.nan),
+            "skipped": np.zeros(len(values), dtype=bool),
+        }
+        if not len(values):
+            return result
+
+        with self._lock:
+            slots = self._slots(keys)
+            active = np.arange(len(values))
+            if day is not None:
+                result["skipped"] = self._day[slots] >= day
+                active = np.nonzero(~result["skipped"])[0]
+            if len(active):
+                # 한 묶음에 같은 시계열 값이 여러 번 있으면 들어온 순서대로 나눠 처리
+                active_slots = slots[active]
+                order = np.argsort(active_slots, kind="stable")
+                sorted_slots = active_slots[order]
+                first = np.r_[True, sorted_slots[1:] != sorted_slots[:-1]]
+                group_start = np.maximum.accumulate(np.where(first, np.arange(len(order)), 0))
+                rank = np.empty(len(order), dtype=np.int64)
+                rank[order] = np.arange(len(order)) - group_start
+                for r in range(int(rank.max()) + 1):
+                    positions = active[rank == r]
+                    self._score(slots[positions], values[positions], positions, result)
+                if day is not None:
+                    self._day[active_slots] = day
+
+            self.stats["points"] += len(active)
+            self.stats["batches"] += 1
+            self.stats["anomalies"] += int(result["anomaly"].sum())
+
+        if self.refit_interval > 0 and not self._refit_started:
+            self.start_background_refit()
+        return result
+
+    def _score(self, slots: np.ndarray, x: np.ndarray, positions: np.ndarray, result: Dict[str, Any]):
+        count = self._count[slots]
+        mean = self._mean[slots]
+        median = self._median[slots]
+        mad = self._mad[slots]
+
+        # 점수 (상태 반영 전 값 기준)
+        scale = np.maximum(1.4826 * mad, MIN_RELATIVE_SCALE * np.abs(median)) + 1e-9
+        z = (x - median) / scale
+        ratio = np.where(mean > 0, x / np.where(mean > 0, mean, 1.0), 1.0)
+        change = ratio - 1.0
+        warm = count >= self.min_points
+
+        if self.direction == "drop":
+            rule, unusual = change <= -self.change_threshold, z <= -self.z_threshold
+        elif self.direction == "rise":
+            rule, unusual = change >= self.change_threshold, z >= self.z_threshold
+        else:
+            rule, unusual = np.abs(change) >= self.change_threshold, np.abs(z) >= self.z_threshold
+
+        forest = self._forest
+        if forest is not None and warm.any():
+            scores = np.full(len(x), np.nan)
+            scores[warm] = forest.score_samples(ratio[warm].reshape(-1, 1))
+            unusual = unusual | (warm & (scores < forest.offset_))
+            result["forest_score"][positions] = scores
+
+        result["anomaly"][positions] = warm & rule & unusual
+        result["z_score"][positions] = z
+        result["change"][positions] = np.where(count > 0, change, 0.0)
+        result["average"][positions] = mean
+
+        # 상태 반영: EWMA, 스트리밍 중앙값(척도 비례 이동), MAD(EWMA)
+        new = count == 0
+        self._mean[slots] = np.where(new, x, mean + self.alpha * (x - mean))
+        self._median[slots] = np.where(new, x, median + self.median_rate * scale * np.sign(x - median))
+        self._mad[slots] = np.where(new, 0.0, mad + self.alpha * (np.abs(x - median) - mad))
+        self._last[slots] = x
+        self._count[slots] = count + 1
+        has_ratio = mean > 0
+        if has_ratio.any():
+            self._ratios[slots[has_ratio], count[has_ratio] % self.window] = ratio[has_ratio]
+
+    # ==================== Isolation Forest 주기 재학습 ====================
+
+    def refit(self) -> bool:
+        """쌓인 비율로 Isolation Forest를 다시 학습하고 교체 (표본이 부족하면 False)"""
+        with self._lock:
+            ratios = self._ratios[:len(self._keys)]
+            samples = ratios[~np.isnan(ratios)].reshape(-1, 1)
+        if len(samples) < self.refit_min_samples:
+            return False
+        try:
+            from sklearn.ensemble import IsolationForest
+            forest = IsolationForest(contamination=self.contamination, random_state=42)
+            forest.fit(samples)
+        except Exception as e:
+            logger.error(f"온라인 이상 탐지 모델 재학습 실패: {e}")
+            return False
+        self._forest = forest
+        self.stats["refits"] += 1
+        return True
+
+    def start_background_refit(self):
+        """refit_interval마다 작업 스케줄러에서 재학습"""
+        with self._lock:
+            if self._refit_started:
+                return
+            self._refit_started = True
+        job_scheduler.add_job(self._refit_job, self.refit, interval=self.refit_interval)
+
+    def stop(self):
+        self._refit_started = False
+        job_scheduler.remove_job(self._refit_job)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "series": len(self._keys),
+            "forest": self._forest is not None,
+            "stats": dict(self.stats),
+        }
+
+
+# ==================== 상태 저장소 ====================
+
+DEFAULT_STATE_DB = "data/online_anomaly.db"
+
+
+class OnlineAnomalyStateStore:
+    """
+    탐지기 상태를 사이드카 SQLite에 두고 워커/재시작 사이에 공유하는 저장소
+    update()는 쓰기 트랜잭션(BEGIN IMMEDIATE) 하나 안에서 저장된 상태를 탐지기에 덮어쓰고, 채점 후
+    바뀐 상태를 다시 저장한다. 여러 워커가 같은 날을 동시에 처리해도 시계열마다 한 번만 반영된다.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_STATE_DB, chunk_size: int = 500):
+        self.db = get_sidecar_db(db_path)
+        self.chunk_size = chunk_size
+        self._init_database()
+
+    def _init_database(self):
+        with self.db.write() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS online_anomaly_state (
+                    detector TEXT NOT NULL,
+                    series TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    mean REAL NOT NULL,
+                    median REAL NOT NULL,
+                    mad REAL NOT NULL,
+                    last REAL NOT NULL,
+                    day INTEGER NOT NULL,
+                    ratios BLOB,
+                    PRIMARY KEY (detector, series)
+                )
+            ''')
+
+    @staticmethod
+    def _series(key: Hashable) -> str:
+        return json.dumps(key, default=str)
+
+    def update(self, name: str, detector: OnlineAnomalyDetector, keys: Sequence[Hashable],
+               values: Sequence[float], day: Optional[int] = None) -> Dict[str, Any]:
+        """저장된 상태로 탐지기를 맞춘 뒤 채점하고, 반영된 시계열 상태만 다시 저장"""
+        by_series = {self._series(key): key for key in keys}
+        series = list(by_series)
+        with self.db.write() as conn:
+            stored = []
+            for start in range(0, len(series), self.chunk_size):
+                chunk = series[start:start + self.chunk_size]
+                placeholders = ",".join("?" * len(chunk))
+                stored.extend(conn.execute(
+                    f"SELECT * FROM online_anomaly_state WHERE detector = ? AND series IN ({placeholders})",
+                    [name, *chunk]
+                ).fetchall())
+            # 다른 워커의 기록이 기준이므로, 저장소에 없는 시계열은 이 워커의 메모리 상태도 버림
+            for missing in set(series) - {row["series"] for row in stored}:
+                detector.reset(by_series[missing])
+            detector.load_state([{**dict(row), "key": by_series[row["series"]]} for row in stored])
+
+            result = detector.update(keys, values, day=day)
+            applied = [keys[i] for i in np.nonzero(~result["skipped"])[0]]
+            conn.executemany(
+                "INSERT OR REPLACE INTO online_anomaly_state "
+                "(detector, series, count, mean, median, mad, last, day, ratios) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(name, self._series(row["key"]), row["count"], row["mean"], row["median"], row["mad"],
+                  row["last"], row["day"], row["ratios"]) for row in detector.export_state(applied)]
+            )
+        return result
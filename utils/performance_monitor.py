@@ -1,4 +1,3 @@
-import threading
 from functools import wraps
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
@@ -8,12 +7,16 @@ import time
 import platform
 import sys
 from flask import request
+
+from core.backend.job_scheduler import job_scheduler
 args = None  # pyright: ignore
 query = None  # pyright: ignore
 form = None  # pyright: ignore
 
 logger = logging.getLogger(__name__)
 
+MONITOR_JOB = "performance_monitor.system_metrics"
+
 
 class PerformanceMonitor:
     """시스템 성능 모니터링 클래스"""
@@ -30,7 +33,6 @@ class PerformanceMonitor:
         }
         self.max_history = 1000  # 최대 기록 수
         self.monitoring_active = False
-        self.monitor_thread = None
 
     def start_monitoring(self, interval=60):
         """성능 모니터링 시작"""
@@ -38,31 +40,15 @@ class PerformanceMonitor:
             return
 
         self.monitoring_active = True
-        self.monitor_thread = threading.Thread(
-            target=self._monitor_loop,
-            args=(interval,),
-            daemon=True
-        )
-        self.monitor_thread.start()
+        job_scheduler.add_job(MONITOR_JOB, self._collect_system_metrics, interval=interval, initial_delay=0)
         logger.info("성능 모니터링이 시작되었습니다.")
 
     def stop_monitoring(self):
         """성능 모니터링 중지"""
         self.monitoring_active = False
-        if self.monitor_thread:
-            self.monitor_thread.join()
+        job_scheduler.remove_job(MONITOR_JOB)
         logger.info("성능 모니터링이 중지되었습니다.")
 
-    def _monitor_loop(self,  interval: int):
-        """모니터링 루프"""
-        while self.monitoring_active:
-            try:
-                self._collect_system_metrics()
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"모니터링 오류: {str(e)}")
-                time.sleep(interval)
-
     def _collect_system_metrics(self):
         """시스템 메트릭 수집"""
         timestamp = datetime.now()
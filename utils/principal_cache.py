@@ -0,0 +1,260 @@
+"""
+인증 주체(principal) 캐시
+JWT/역할/권한 데코레이터가 API 호출마다 `User.query.get()`으로 큰 permissions JSON까지
+담긴 사용자 행 전체를 읽던 것을, 권한 확인에 필요한 값만 담은 불변 스냅샷으로 대신한다.
+
+- 스냅샷: id, 역할, 상태, 매장/브랜드 ID와 미리 풀어 둔 (모듈, 액션) 권한 집합
+- 키: (사용자 ID, 권한 버전). 사용자 행이 바뀌어 커밋되면 버전을 올려 이전 스냅샷을 버리고,
+  이벤트 버스로 다른 워커에도 알린다. ORM을 거치지 않은 변경에 대비해 TTL도 둔다
+- 스냅샷에 없는 속성(예: phone)을 쓰는 핸들러는 처음 접근할 때 User 행을 읽어 넘겨 준다
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_TOPIC = "auth.principal"  # 다른 워커 캐시 무효화용 이벤트 버스 토픽
+PENDING_INVALIDATIONS_KEY = "principal_cache_invalidations"
+DEFAULT_TTL = 300.0  # ORM 밖의 변경(직접 SQL 등)이 반영되기까지 최대 지연 (초)
+DEFAULT_MAX_SIZE = 10000
+
+
+def compile_permissions(permissions: Any) -> Tuple[FrozenSet[Tuple[str, str]], FrozenSet[str]]:
+    """permissions JSON -> (허용된 (모듈, 액션) 집합, admin_only 모듈 집합)"""
+    if not isinstance(permissions, dict):
+        return frozenset(), frozenset()
+    granted = set()
+    admin_only = set()
+    for module, actions in permissions.items():
+        if not isinstance(actions, dict):
+            continue
+        for action, allowed in actions.items():
+            if allowed:
+                granted.add((module, action))
+        if actions.get("admin_only", False):
+            admin_only.add(module)
+    return frozenset(granted), frozenset(admin_only)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """권한 확인용 사용자 스냅샷 (요청 간 공유되므로 변경 불가)"""
+    id: int
+    username: str
+    name: Optional[str]
+    role: Optional[str]
+    grade: Optional[str]
+    status: Optional[str]
+    branch_id: Optional[int]
+    brand_id: Optional[int]
+    granted: FrozenSet[Tuple[str, str]] = field(default_factory=frozenset, repr=False)
+    admin_only: FrozenSet[str] = field(default_factory=frozenset, repr=False)
+    version: int = 0
+    loaded_at: float = field(default_factory=time.time, compare=False)
+
+    @property
+    def is_authenticated(self) -> bool:
+        return True
+
+    def has_permission(self, module: str, action: str = "view") -> bool:
+        """User.has_permission과 같은 규칙 (admin_only 모듈은 admin만)"""
+        if module in self.admin_only and self.role != "admin":
+            return False
+        return (module, action) in self.granted
+
+    @property
+    def user(self):
+        """User 모델 (현재 세션의 identity map에 있으면 추가 조회 없음)"""
+        from models_main import User, db
+        return db.session.get(User, self.id)
+
+    def __getattr__(self, name: str):
+        # 스냅샷에 없는 속성은 User 모델에서 (기존 핸들러 호환)
+        if name.startswith("_"):
+            raise AttributeError(name)
+        user = self.user
+        if user is None:
+            raise AttributeError(name)
+        return getattr(user, name)
+
+
+class PrincipalCache:
+    """사용자 ID별 Principal LRU 캐시"""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_size: int = DEFAULT_MAX_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[int, int], Principal]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._events_registered = False
+        self._event_bus = None
+        self._bus_subscription: Optional[str] = None
+        self.stats = {'hits': 0, 'misses': 0, 'loads': 0, 'invalidations': 0}
+
+    def _version(self, user_id: int) -> int:
+        return self._versions.get(user_id, 0)
+
+    # ==================== 조회 ====================
+
+    def get(self, user_id) -> Optional[Principal]:
+        """캐시된 Principal, 없거나 만료됐으면 DB에서 필요한 컬럼만 읽어 채움"""
+        try:
+            user_id = int(user_id)
+        except (TypeError, ValueError):
+            return None
+        if self._events_registered and self._bus_subscription is None:
+            self._subscribe_bus()
+        now = time.time()
+        with self._lock:
+            version = self._version(user_id)
+            principal = self._entries.get((user_id, version))
+            if principal is not None and now - principal.loaded_at < self.ttl:
+                self._entries.move_to_end((user_id, version))
+                self.stats['hits'] += 1
+                return principal
+            self.stats['misses'] += 1
+
+        principal = self._load(user_id, version)
+        if principal is None:
+            return None
+        with self._lock:
+            # 읽는 동안 무효화됐으면 오래된 스냅샷을 저장하지 않음
+            if self._version(user_id) == version:
+                self._entries[(user_id, version)] = principal
+                self._entries.move_to_end((user_id, version))
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return principal
+
+    def _load(self, user_id: int, version: int) -> Optional[Principal]:
+        from models_main import User, db
+        row = (
+            db.session.query(User.id, User.username, User.name, User.role, User.grade,
+                             User.status, User.branch_id, User.brand_id, User.permissions)
+            .filter(User.id == user_id)
+            .first()
+        )
+        self.stats['loads'] += 1
+        if row is None:
+            return None
+        granted, admin_only = compile_permissions(row.permissions)
+        return Principal(
+            id=row.id, username=row.username, name=row.name, role=row.role, grade=row.grade,
+            status=row.status, branch_id=row.branch_id, brand_id=row.brand_id,
+            granted=granted, admin_only=admin_only, version=version,
+        )
+
+    # ==================== 무효화 ====================
+
+    def invalidate(self, user_id, broadcast: bool = False):
+        """사용자 권한 버전을 올려 캐시된 스냅샷을 버림"""
+        try:
+            user_id = int(user_id)
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            old = self._version(user_id)
+            self._versions[user_id] = old + 1
+            self._entries.pop((user_id, old), None)
+            self.stats['invalidations'] += 1
+        if broadcast:
+            self._publish([user_id])
+
+    def clear(self):
+        """전체 무효화 (역할별 기본 권한 변경 등)"""
+        with self._lock:
+            for user_id, _ in self._entries:
+                self._versions[user_id] = self._version(user_id) + 1
+            self._entries.clear()
+
+    @staticmethod
+    def _origin() -> str:
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    def _get_event_bus(self):
+        if self._event_bus is None:
+            from core.backend.event_bus import get_event_bus
+            self._event_bus = get_event_bus()
+        return self._event_bus
+
+    def _subscribe_bus(self):
+        # 첫 조회 때 구독 (import/preload 시점에 디스패처 스레드를 띄우지 않도록)
+        with self._lock:
+            if self._bus_subscription is not None:
+                return
+            self._bus_subscription = ""
+        try:
+            self._bus_subscription = self._get_event_bus().subscribe(PRINCIPAL_TOPIC, self._on_bus_message)
+        except Exception as e:
+            logger.warning(f"권한 캐시 무효화 구독 실패 (TTL로만 갱신): {e}")
+
+    def _publish(self, user_ids):
+        try:
+            self._get_event_bus().publish(PRINCIPAL_TOPIC, {'user_ids': list(user_ids), 'origin': self._origin()})
+        except Exception as e:
+            logger.warning(f"권한 캐시 무효화 전파 실패: {e}")
+
+    def _on_bus_message(self, message):
+        if message.payload.get('origin') == self._origin():
+            return  # 자기 프로세스에서 이미 무효화함
+        for user_id in message.payload.get('user_ids') or []:
+            self.invalidate(user_id)
+
+    # ==================== 모델 이벤트 ====================
+
+    def register_events(self, event_bus=None):
+        """User 행 변경을 세션에 기록하고 커밋 후 무효화하도록 이벤트 등록 (버스 구독은 첫 조회 때)"""
+        if self._events_registered:
+            return
+        from models_main import User
+        if event_bus is not None:
+            self._event_bus = event_bus
+        event.listen(User, "after_update", self._record_change)
+        event.listen(User, "after_delete", self._record_change)
+        event.listen(Session, "after_commit", self._apply_pending)
+        event.listen(Session, "after_rollback", self._discard_pending)
+        self._events_registered = True
+
+    def _record_change(self, mapper, connection, target):
+        session = object_session(target)
+        if session is None:
+            self.invalidate(target.id)
+            return
+        session.info.setdefault(PENDING_INVALIDATIONS_KEY, set()).add(target.id)
+
+    def _apply_pending(self, session):
+        user_ids = session.info.pop(PENDING_INVALIDATIONS_KEY, None)
+        if not user_ids:
+            return
+        for user_id in user_ids:
+            self.invalidate(user_id)
+        self._publish(user_ids)
+
+    def _discard_pending(self, session):
+        session.info.pop(PENDING_INVALIDATIONS_KEY, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            size = len(self._entries)
+        total = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'size': size,
+            'hit_rate': self.stats['hits'] / total if total else 0.0,
+            'ttl': self.ttl,
+        }
+
+
+# 전역 인스턴스
+principal_cache = PrincipalCache()
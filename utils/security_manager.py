@@ -12,8 +12,9 @@ import secrets
 import hmac
 from typing import Optional
 from flask import request
+from core.backend.rate_limiter import get_rate_limiter
 environ = None  # pyright: ignore
-﻿import hashlib
+import hashlib
 
 
 class SecurityManager:
@@ -40,8 +41,8 @@ class SecurityManager:
         self.max_login_attempts = 5
         self.lockout_duration = 900  # 15분
 
-        # API 요청 제한
-        self.api_requests = {}
+        # API 요청 제한 (워커 간 공유 요청 제한기 사용)
+        self.rate_limiter = get_rate_limiter()
         self.max_api_requests = 100  # 1분당
         self.api_window = 60  # 1분
 
@@ -171,25 +172,10 @@ class SecurityManager:
 
     def check_api_rate_limit(self,  user_id: int,  endpoint: str) -> bool:
         """API 요청 제한 확인"""
-        current_time = time.time()
-        key = f"{user_id}:{endpoint}"
-
-        if key not in self.api_requests:
-            self.api_requests[key] = []
-
-        # 오래된 요청 제거
-        self.api_requests[key] = [
-            req_time for req_time in self.api_requests[key]
-            if current_time - req_time < self.api_window
-        ]
-
-        # 요청 수 확인
-        if len(self.api_requests[key]) >= self.max_api_requests:
+        result = self.rate_limiter.hit(f"api:{user_id}:{endpoint}", self.max_api_requests, self.api_window)
+        if not result.allowed:
             self._log_security_event('rate_limit_exceeded', user_id, f'Endpoint: {endpoint}')
             return False
-
-        # 새 요청 추가
-        self.api_requests[key].append(current_time)
         return True
 
     def generate_secure_token(self, length: int = 32) -> str:
@@ -209,7 +195,7 @@ class SecurityManager:
         ]
 
         data_lower = data.lower() if data is not None else ''
-        for pattern in dangerous_patterns if dangerous_patterns is not None:
+        for pattern in dangerous_patterns:
             if pattern in data_lower:
                 self._log_security_event('suspicious_input', None, f'Pattern detected: {pattern}')
                 return False
@@ -220,7 +206,7 @@ class SecurityManager:
         """파일명 정리"""
         # 위험한 문자 제거
         dangerous_chars = ['<', '>', ':', '"', '|', '?', '*', '\\', '/']
-        for char in dangerous_chars if dangerous_chars is not None:
+        for char in dangerous_chars:
             filename = filename.replace(char, '_')
 
         # 경로 조작 방지
@@ -261,7 +247,7 @@ class SecurityManager:
             if (current_time - session['last_activity']).total_seconds() > self.session_timeout:
                 expired_sessions.append(session_id)
 
-        for session_id in expired_sessions if expired_sessions is not None:
+        for session_id in expired_sessions:
             del self.active_sessions[session_id]
             self._log_security_event('session_expired', None, f'Session: {session_id}')
 
@@ -273,7 +259,7 @@ class SecurityManager:
             'active_sessions': len(self.active_sessions),
             'locked_accounts': len([acc for acc in self.login_attempts.values() if acc.get('locked_until', 0) > time.time()]),
             'recent_security_events': len(self.security_events),
-            'api_rate_limits': len(self.api_requests)
+            'api_rate_limits': self.rate_limiter.get_stats()
         }
 
 
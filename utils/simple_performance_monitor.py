@@ -3,11 +3,12 @@ import psutil
 from collections import defaultdict, deque
 from typing import Dict, Any, Optional
 from functools import wraps
-import threading
 import logging
 import time
 from typing import Optional
 from flask import request
+
+from core.backend.job_scheduler import job_scheduler
 args = None  # pyright: ignore
 form = None  # pyright: ignore
 
@@ -20,6 +21,8 @@ Redis 없이도 작동하는 성능 모니터링
 
 logger = logging.getLogger(__name__)
 
+MONITOR_JOB = "simple_performance_monitor.system_stats"
+
 
 class SimplePerformanceMonitor:
     """간단한 성능 모니터링 클래스"""
@@ -31,7 +34,6 @@ class SimplePerformanceMonitor:
         self.request_counts = defaultdict(int)
         self.slow_queries = deque(maxlen=100)
         self.monitoring_active = False
-        self.monitor_thread = None
 
     def start_monitoring(self, interval=60):
         """모니터링 시작"""
@@ -39,31 +41,15 @@ class SimplePerformanceMonitor:
             return
 
         self.monitoring_active = True
-        self.monitor_thread = threading.Thread(
-            target=self._monitor_loop,
-            args=(interval,),
-            daemon=True
-        )
-        self.monitor_thread.start()
+        job_scheduler.add_job(MONITOR_JOB, self._log_system_stats, interval=interval, initial_delay=0)
         logger.info("성능 모니터링 시작됨")
 
     def stop_monitoring(self):
         """모니터링 중지"""
         self.monitoring_active = False
-        if self.monitor_thread:
-            self.monitor_thread.join()
+        job_scheduler.remove_job(MONITOR_JOB)
         logger.info("성능 모니터링 중지됨")
 
-    def _monitor_loop(self,  interval: int):
-        """모니터링 루프"""
-        while self.monitoring_active:
-            try:
-                self._log_system_stats()
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"모니터링 오류: {e}")
-                time.sleep(interval)
-
     def _log_system_stats(self):
         """
         시스템 통계 로그
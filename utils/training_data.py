@@ -0,0 +1,215 @@
+"""
+재훈련 학습 데이터 파이프라인
+주문 원본을 매번 ORM 객체로 1년치 읽어 파이썬에서 집계하던 방식 대신,
+SQL에서 일별로 집계한 결과를 일별 특성 테이블(사이드카 SQLite)에 쌓아 두고
+재훈련 때는 마지막 저장일 이후(+ 수정 반영용 며칠)만 다시 집계한다.
+
+- 일별 특성: 매출 합계, 주문 수, 전일 매출, 7일/30일 이동평균
+- 이동평균은 새로 들어온 날짜와 그 앞 30일만 읽어 다시 계산
+- track_resources()로 실행별 소요 시간/최대 메모리(RSS)를 측정
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+import pandas as pd
+
+from core.backend.sidecar_db import get_sidecar_db
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # pyright: ignore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FEATURE_DB = os.environ.get("TRAINING_FEATURE_DB", "data/ai_models/training_features.db")
+# 늦게 들어오거나 수정된 주문을 반영하기 위해 마지막 저장일 앞 며칠은 다시 집계
+DEFAULT_OVERLAP_DAYS = 2
+# 일별 특성 보관 기간 (일)
+DEFAULT_RETENTION_DAYS = 730
+# 이동평균 최대 기간 (일)
+ROLLING_WINDOW = 30
+# 1이면 track_resources()가 tracemalloc으로 파이썬 할당량까지 측정 (모든 할당을 추적하므로 느림, 디버그용)
+TRACE_ALLOCATIONS = os.environ.get("TRAINING_TRACE_ALLOCATIONS", "0") == "1"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_sales (
+    day TEXT PRIMARY KEY,
+    sales_amount REAL NOT NULL,
+    order_count INTEGER NOT NULL,
+    previous_sales REAL,
+    sales_7d_avg REAL,
+    sales_30d_avg REAL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+
+def _day(value: Union[str, date, datetime]) -> str:
+    """DB마다 다른 날짜 표현(문자열/date/datetime)을 'YYYY-MM-DD'로 통일"""
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m-%d")
+    return str(value)[:10]
+
+
+class DailySalesFeatureStore:
+    """일별 매출 특성 테이블 (증분 갱신)"""
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_FEATURE_DB,
+                 overlap_days: int = DEFAULT_OVERLAP_DAYS,
+                 retention_days: int = DEFAULT_RETENTION_DAYS):
+        self.db = get_sidecar_db(db_path)
+        self.overlap_days = overlap_days
+        self.retention_days = retention_days
+        with self.db.write() as conn:
+            conn.execute(_SCHEMA)
+
+    def last_day(self) -> Optional[date]:
+        """저장된 마지막 날짜"""
+        row = self.db.query_one("SELECT MAX(day) AS day FROM daily_sales")
+        return date.fromisoformat(row["day"]) if row and row["day"] else None
+
+    def refresh_start(self, default_start: date) -> date:
+        """다시 집계해야 할 시작일 (처음이면 default_start부터 전부)"""
+        last = self.last_day()
+        if last is None or last < default_start:
+            return default_start
+        return last - timedelta(days=self.overlap_days)
+
+    def replace_range(self, start: date, end: date,
+                      rows: Iterable[Tuple[Any, float, int]]) -> int:
+        """[start, end] 구간의 일별 집계 (날짜, 매출 합계, 주문 수)를 교체하고 이동평균 재계산"""
+        now = datetime.now().isoformat()
+        records = [(_day(day), float(amount or 0), int(count or 0), now) for day, amount, count in rows]
+        cutoff = (end - timedelta(days=self.retention_days)).isoformat()
+        with self.db.write() as conn:
+            conn.execute("DELETE FROM daily_sales WHERE day >= ? AND day <= ?",
+                         (start.isoformat(), end.isoformat()))
+            conn.executemany(
+                "INSERT OR REPLACE INTO daily_sales (day, sales_amount, order_count, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                records,
+            )
+            conn.execute("DELETE FROM daily_sales WHERE day < ?", (cutoff,))
+            self._update_rolling(conn, start.isoformat())
+        return len(records)
+
+    def _update_rolling(self, conn, first_day: str):
+        """first_day 이후 행의 전일 매출/이동평균을 앞 30개 행과 함께 다시 계산"""
+        history = conn.execute(
+            "SELECT day, sales_amount FROM daily_sales WHERE day < ? ORDER BY day DESC LIMIT ?",
+            (first_day, ROLLING_WINDOW),
+        ).fetchall()[::-1]
+        changed = conn.execute(
+            "SELECT day, sales_amount FROM daily_sales WHERE day >= ? ORDER BY day", (first_day,)
+        ).fetchall()
+        if not changed:
+            return
+        amounts = pd.Series([row["sales_amount"] for row in history + changed], dtype=float)
+        previous = amounts.shift(1)
+        avg7 = amounts.rolling(7).mean()
+        avg30 = amounts.rolling(ROLLING_WINDOW).mean()
+        offset = len(history)
+
+        def value(series, i):
+            v = series.iloc[offset + i]
+            return None if pd.isna(v) else float(v)
+
+        conn.executemany(
+            "UPDATE daily_sales SET previous_sales = ?, sales_7d_avg = ?, sales_30d_avg = ? WHERE day = ?",
+            [(value(previous, i), value(avg7, i), value(avg30, i), row["day"]) for i, row in enumerate(changed)],
+        )
+
+    def frame(self, start: date, end: date, complete: bool = True) -> pd.DataFrame:
+        """[start, end] 구간의 일별 특성 (complete=True면 이동평균이 다 채워진 날만)"""
+        sql = ("SELECT day, sales_amount, order_count, previous_sales, sales_7d_avg, sales_30d_avg "
+               "FROM daily_sales WHERE day >= ? AND day <= ?")
+        if complete:
+            sql += " AND sales_30d_avg IS NOT NULL"
+        rows = self.db.query(sql + " ORDER BY day", (start.isoformat(), end.isoformat()))
+        df = pd.DataFrame(rows, columns=["day", "sales_amount", "order_count", "previous_sales",
+                                         "sales_7d_avg", "sales_30d_avg"])
+        df.insert(0, "date", pd.to_datetime(df.pop("day")).dt.date)
+        return df
+
+    def order_counts(self, start: date, end: date) -> Dict[str, int]:
+        """날짜별 주문 수"""
+        rows = self.db.query("SELECT day, order_count FROM daily_sales WHERE day >= ? AND day <= ?",
+                             (start.isoformat(), end.isoformat()))
+        return {row["day"]: row["order_count"] for row in rows}
+
+
+def _max_rss_bytes() -> int:
+    """프로세스 최대 RSS (resource가 없으면 psutil로 현재 RSS, 둘 다 없으면 0)"""
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 바이트 단위
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return 0
+
+
+@contextmanager
+def track_resources(trace_allocations: Optional[bool] = None) -> Iterator[Dict[str, float]]:
+    """
+    블록 실행 시간과 최대 메모리 측정 (종료 후 yield한 dict에 채워짐)
+
+    - peak_memory_mb: 블록 동안 늘어난 프로세스 최대 RSS. 커널이 세는 값이라 측정 비용이
+      없지만 프로세스 전체 기준이므로, 이전에 더 큰 최대치가 있었다면 0으로 나온다
+    - max_rss_mb: 블록 종료 시점의 프로세스 최대 RSS
+    - traced_peak_mb: trace_allocations(기본값 TRACE_ALLOCATIONS)일 때만, tracemalloc 기준
+      블록 동안의 파이썬 최대 할당량
+    """
+    if trace_allocations is None:
+        trace_allocations = TRACE_ALLOCATIONS
+    stats: Dict[str, float] = {}
+    started = False
+    traced_baseline = 0
+    if trace_allocations:
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+        traced_baseline = tracemalloc.get_traced_memory()[0]
+    rss_baseline = _max_rss_bytes()
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats["wall_time"] = round(time.perf_counter() - start, 3)
+        if trace_allocations:
+            traced_peak = tracemalloc.get_traced_memory()[1]
+            if started:
+                tracemalloc.stop()
+            stats["traced_peak_mb"] = round(max(0, traced_peak - traced_baseline) / (1024 * 1024), 2)
+        max_rss = _max_rss_bytes()
+        stats["peak_memory_mb"] = round(max(0, max_rss - rss_baseline) / (1024 * 1024), 2)
+        stats["max_rss_mb"] = round(max_rss / (1024 * 1024), 2)
+
+
+_stores: Dict[str, DailySalesFeatureStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_daily_sales_store(db_path: Union[str, Path] = DEFAULT_FEATURE_DB) -> DailySalesFeatureStore:
+    """DB 파일별 공용 일별 매출 특성 테이블"""
+    key = os.path.abspath(str(db_path))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = DailySalesFeatureStore(db_path)
+            _stores[key] = store
+        return store